@@ -10,6 +10,7 @@ from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 import scriptcontext
 import math
+from array import array
 import copy
 import ast
 
@@ -771,8 +772,8 @@ class MyComponent(component):
                         border_pts = crv_to_pts(border)
                         for pt in border_pts:
                             pts.append(pt)
-                    for pt in geodesic_cloud:
-                        pt = rs.AddPoint(pt)
+                    for k in range(0, len(geodesic_cloud), 3):
+                        pt = rs.AddPoint(geodesic_cloud[k], geodesic_cloud[k+1], geodesic_cloud[k+2])
                         srf_pt = rs.BrepClosestPoint(srf,pt)[0]
                         if rs.Distance(srf_pt,pt) < tol:
                             t =rs.CurveClosestPoint(border,pt)
@@ -3319,5120 +3320,42 @@ class MyComponent(component):
                     intersect = rs.LinePlaneIntersection(line, plane)
                     return intersect
 
+                GEODESIC = {} # icosphere vertices cached by subdivision level
+
                 @staticmethod
-                def geodesic_sphere_points():
-                    points = [[-0.850650787354,-0.525731086731,0.0],
-                        [0.850650787354,-0.525731086731,0.0],
-                        [-0.850650787354,0.525731086731,0.0],
-                        [0.850650787354,0.525731086731,0.0],
-                        [0.0,-0.850650787354,-0.525731086731],
-                        [0.0,0.850650787354,-0.525731086731],
-                        [0.0,-0.850650787354,0.525731086731],
-                        [0.0,0.850650787354,0.525731086731],
-                        [-0.525731086731,0.0,-0.850650787354],
-                        [-0.525731086731,0.0,0.850650787354],
-                        [0.525731086731,0.0,-0.850650787354],
-                        [0.525731086731,0.0,0.850650787354],
-                        [-0.5,-0.809017002583,0.309017002583],
-                        [0.0,-1.0,0.0],
-                        [-0.5,-0.809017002583,-0.309017002583],
-                        [-0.309017002583,-0.5,0.809017002583],
-                        [-0.5,-0.809017002583,0.309017002583],
-                        [-0.809017002583,-0.309017002583,0.5],
-                        [-0.309017002583,-0.5,0.809017002583],
-                        [0.0,0.0,1.0],
-                        [0.309017002583,-0.5,0.809017002583],
-                        [0.309017002583,-0.5,0.809017002583],
-                        [0.809017002583,-0.309017002583,0.5],
-                        [0.5,-0.809017002583,0.309017002583],
-                        [0.5,-0.809017002583,-0.309017002583],
-                        [0.0,-1.0,0.0],
-                        [0.5,-0.809017002583,0.309017002583],
-                        [-0.5,-0.809017002583,-0.309017002583],
-                        [-0.309017002583,-0.5,-0.809017002583],
-                        [-0.809017002583,-0.309017002583,-0.5],
-                        [0.5,-0.809017002583,-0.309017002583],
-                        [0.809017002583,-0.309017002583,-0.5],
-                        [0.309017002583,-0.5,-0.809017002583],
-                        [0.0,0.0,-1.0],
-                        [-0.309017002583,-0.5,-0.809017002583],
-                        [0.309017002583,-0.5,-0.809017002583],
-                        [-1.0,0.0,0.0],
-                        [-0.809017002583,0.309017002583,-0.5],
-                        [-0.809017002583,-0.309017002583,-0.5],
-                        [-0.5,0.809017002583,-0.309017002583],
-                        [-0.309017002583,0.5,-0.809017002583],
-                        [-0.809017002583,0.309017002583,-0.5],
-                        [0.0,0.0,-1.0],
-                        [-0.309017002583,0.5,-0.809017002583],
-                        [0.309017002583,0.5,-0.809017002583],
-                        [0.309017002583,0.5,-0.809017002583],
-                        [0.5,0.809017002583,-0.309017002583],
-                        [0.809017002583,0.309017002583,-0.5],
-                        [0.5,0.809017002583,-0.309017002583],
-                        [0.0,1.0,0.0],
-                        [0.5,0.809017002583,0.309017002583],
-                        [0.5,0.809017002583,0.309017002583],
-                        [0.309017002583,0.5,0.809017002583],
-                        [0.809017002583,0.309017002583,0.5],
-                        [1.0,0.0,0.0],
-                        [0.809017002583,0.309017002583,0.5],
-                        [0.809017002583,-0.309017002583,0.5],
-                        [-0.809017002583,0.309017002583,0.5],
-                        [-1.0,0.0,0.0],
-                        [-0.809017002583,-0.309017002583,0.5],
-                        [-0.309017002583,0.5,0.809017002583],
-                        [-0.5,0.809017002583,0.309017002583],
-                        [-0.809017002583,0.309017002583,0.5],
-                        [-0.309017002583,0.5,0.809017002583],
-                        [0.0,0.0,1.0],
-                        [0.309017002583,0.5,0.809017002583],
-                        [-0.5,0.809017002583,-0.309017002583],
-                        [-0.5,0.809017002583,0.309017002583],
-                        [0.0,1.0,0.0],
-                        [0.809017002583,0.309017002583,-0.5],
-                        [1.0,0.0,0.0],
-                        [0.809017002583,-0.309017002583,-0.5],
-                        [-0.71656692028,-0.681718349457,0.147620901465],
-                        [-0.525731086731,-0.850650787354,0.0],
-                        [-0.71656692028,-0.681718349457,-0.147620901465],
-                        [-0.238855645061,-0.864187836647,0.442862719297],
-                        [0.0,-0.955422580242,0.295241802931],
-                        [-0.262865543365,-0.951056540012,0.162459850311],
-                        [-0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.0,-0.955422580242,-0.295241802931],
-                        [-0.238855645061,-0.864187836647,-0.442862719297],
-                        [-0.262865543365,-0.951056540012,0.162459850311],
-                        [-0.262865543365,-0.951056540012,-0.162459850311],
-                        [-0.525731086731,-0.850650787354,0.0],
-                        [-0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.587785243988,-0.425325393677,0.688190937042],
-                        [-0.681718349457,-0.147620901465,0.71656692028],
-                        [-0.147620901465,-0.71656692028,0.681718349457],
-                        [-0.238855645061,-0.864187836647,0.442862719297],
-                        [-0.425325393677,-0.688190937042,0.587785243988],
-                        [-0.688190937042,-0.587785243988,0.425325393677],
-                        [-0.71656692028,-0.681718349457,0.147620901465],
-                        [-0.864187836647,-0.442862719297,0.238855645061],
-                        [-0.425325393677,-0.688190937042,0.587785243988],
-                        [-0.688190937042,-0.587785243988,0.425325393677],
-                        [-0.587785243988,-0.425325393677,0.688190937042],
-                        [-0.147620901465,-0.71656692028,0.681718349457],
-                        [0.0,-0.525731086731,0.850650787354],
-                        [0.147620901465,-0.71656692028,0.681718349457],
-                        [-0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.295241802931,0.0,0.955422580242],
-                        [-0.162459850311,-0.262865543365,0.951056540012],
-                        [0.162459850311,-0.262865543365,0.951056540012],
-                        [0.295241802931,0.0,0.955422580242],
-                        [0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.162459850311,-0.262865543365,0.951056540012],
-                        [0.162459850311,-0.262865543365,0.951056540012],
-                        [0.0,-0.525731086731,0.850650787354],
-                        [0.147620901465,-0.71656692028,0.681718349457],
-                        [0.425325393677,-0.688190937042,0.587785243988],
-                        [0.238855645061,-0.864187836647,0.442862719297],
-                        [0.442862719297,-0.238855645061,0.864187836647],
-                        [0.681718349457,-0.147620901465,0.71656692028],
-                        [0.587785243988,-0.425325393677,0.688190937042],
-                        [0.688190937042,-0.587785243988,0.425325393677],
-                        [0.864187836647,-0.442862719297,0.238855645061],
-                        [0.71656692028,-0.681718349457,0.147620901465],
-                        [0.587785243988,-0.425325393677,0.688190937042],
-                        [0.688190937042,-0.587785243988,0.425325393677],
-                        [0.425325393677,-0.688190937042,0.587785243988],
-                        [0.71656692028,-0.681718349457,-0.147620901465],
-                        [0.525731086731,-0.850650787354,0.0],
-                        [0.71656692028,-0.681718349457,0.147620901465],
-                        [0.238855645061,-0.864187836647,-0.442862719297],
-                        [0.0,-0.955422580242,-0.295241802931],
-                        [0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.262865543365,-0.951056540012,0.162459850311],
-                        [0.0,-0.955422580242,0.295241802931],
-                        [0.238855645061,-0.864187836647,0.442862719297],
-                        [0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.262865543365,-0.951056540012,0.162459850311],
-                        [0.525731086731,-0.850650787354,0.0],
-                        [-0.71656692028,-0.681718349457,-0.147620901465],
-                        [-0.688190937042,-0.587785243988,-0.425325393677],
-                        [-0.864187836647,-0.442862719297,-0.238855645061],
-                        [-0.238855645061,-0.864187836647,-0.442862719297],
-                        [-0.147620901465,-0.71656692028,-0.681718349457],
-                        [-0.425325393677,-0.688190937042,-0.587785243988],
-                        [-0.587785243988,-0.425325393677,-0.688190937042],
-                        [-0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.681718349457,-0.147620901465,-0.71656692028],
-                        [-0.425325393677,-0.688190937042,-0.587785243988],
-                        [-0.587785243988,-0.425325393677,-0.688190937042],
-                        [-0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.238855645061,-0.864187836647,-0.442862719297],
-                        [0.425325393677,-0.688190937042,-0.587785243988],
-                        [0.147620901465,-0.71656692028,-0.681718349457],
-                        [0.71656692028,-0.681718349457,-0.147620901465],
-                        [0.864187836647,-0.442862719297,-0.238855645061],
-                        [0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.587785243988,-0.425325393677,-0.688190937042],
-                        [0.681718349457,-0.147620901465,-0.71656692028],
-                        [0.442862719297,-0.238855645061,-0.864187836647],
-                        [0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.587785243988,-0.425325393677,-0.688190937042],
-                        [0.425325393677,-0.688190937042,-0.587785243988],
-                        [0.295241802931,0.0,-0.955422580242],
-                        [0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.295241802931,0.0,-0.955422580242],
-                        [-0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.0,-0.525731086731,-0.850650787354],
-                        [-0.147620901465,-0.71656692028,-0.681718349457],
-                        [0.147620901465,-0.71656692028,-0.681718349457],
-                        [-0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.0,-0.525731086731,-0.850650787354],
-                        [0.162459850311,-0.262865543365,-0.951056540012],
-                        [-0.955422580242,-0.295241802931,0.0],
-                        [-0.951056540012,-0.162459850311,-0.262865543365],
-                        [-0.864187836647,-0.442862719297,-0.238855645061],
-                        [-0.955422580242,0.295241802931,0.0],
-                        [-0.864187836647,0.442862719297,-0.238855645061],
-                        [-0.951056540012,0.162459850311,-0.262865543365],
-                        [-0.850650787354,0.0,-0.525731086731],
-                        [-0.681718349457,0.147620901465,-0.71656692028],
-                        [-0.681718349457,-0.147620901465,-0.71656692028],
-                        [-0.951056540012,0.162459850311,-0.262865543365],
-                        [-0.850650787354,0.0,-0.525731086731],
-                        [-0.951056540012,-0.162459850311,-0.262865543365],
-                        [-0.71656692028,0.681718349457,-0.147620901465],
-                        [-0.688190937042,0.587785243988,-0.425325393677],
-                        [-0.864187836647,0.442862719297,-0.238855645061],
-                        [-0.238855645061,0.864187836647,-0.442862719297],
-                        [-0.147620901465,0.71656692028,-0.681718349457],
-                        [-0.425325393677,0.688190937042,-0.587785243988],
-                        [-0.587785243988,0.425325393677,-0.688190937042],
-                        [-0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.681718349457,0.147620901465,-0.71656692028],
-                        [-0.425325393677,0.688190937042,-0.587785243988],
-                        [-0.587785243988,0.425325393677,-0.688190937042],
-                        [-0.688190937042,0.587785243988,-0.425325393677],
-                        [0.295241802931,0.0,-0.955422580242],
-                        [0.162459850311,0.262865543365,-0.951056540012],
-                        [0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.295241802931,0.0,-0.955422580242],
-                        [-0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.162459850311,0.262865543365,-0.951056540012],
-                        [0.0,0.525731086731,-0.850650787354],
-                        [-0.147620901465,0.71656692028,-0.681718349457],
-                        [0.147620901465,0.71656692028,-0.681718349457],
-                        [-0.162459850311,0.262865543365,-0.951056540012],
-                        [0.0,0.525731086731,-0.850650787354],
-                        [0.162459850311,0.262865543365,-0.951056540012],
-                        [0.442862719297,0.238855645061,-0.864187836647],
-                        [0.587785243988,0.425325393677,-0.688190937042],
-                        [0.681718349457,0.147620901465,-0.71656692028],
-                        [0.147620901465,0.71656692028,-0.681718349457],
-                        [0.238855645061,0.864187836647,-0.442862719297],
-                        [0.425325393677,0.688190937042,-0.587785243988],
-                        [0.688190937042,0.587785243988,-0.425325393677],
-                        [0.71656692028,0.681718349457,-0.147620901465],
-                        [0.864187836647,0.442862719297,-0.238855645061],
-                        [0.425325393677,0.688190937042,-0.587785243988],
-                        [0.688190937042,0.587785243988,-0.425325393677],
-                        [0.587785243988,0.425325393677,-0.688190937042],
-                        [0.71656692028,0.681718349457,-0.147620901465],
-                        [0.525731086731,0.850650787354,0.0],
-                        [0.71656692028,0.681718349457,0.147620901465],
-                        [0.238855645061,0.864187836647,-0.442862719297],
-                        [0.0,0.955422580242,-0.295241802931],
-                        [0.262865543365,0.951056540012,-0.162459850311],
-                        [0.262865543365,0.951056540012,0.162459850311],
-                        [0.0,0.955422580242,0.295241802931],
-                        [0.238855645061,0.864187836647,0.442862719297],
-                        [0.262865543365,0.951056540012,-0.162459850311],
-                        [0.262865543365,0.951056540012,0.162459850311],
-                        [0.525731086731,0.850650787354,0.0],
-                        [0.71656692028,0.681718349457,0.147620901465],
-                        [0.688190937042,0.587785243988,0.425325393677],
-                        [0.864187836647,0.442862719297,0.238855645061],
-                        [0.238855645061,0.864187836647,0.442862719297],
-                        [0.147620901465,0.71656692028,0.681718349457],
-                        [0.425325393677,0.688190937042,0.587785243988],
-                        [0.587785243988,0.425325393677,0.688190937042],
-                        [0.442862719297,0.238855645061,0.864187836647],
-                        [0.681718349457,0.147620901465,0.71656692028],
-                        [0.425325393677,0.688190937042,0.587785243988],
-                        [0.587785243988,0.425325393677,0.688190937042],
-                        [0.688190937042,0.587785243988,0.425325393677],
-                        [0.955422580242,-0.295241802931,0.0],
-                        [0.951056540012,-0.162459850311,0.262865543365],
-                        [0.864187836647,-0.442862719297,0.238855645061],
-                        [0.955422580242,0.295241802931,0.0],
-                        [0.864187836647,0.442862719297,0.238855645061],
-                        [0.951056540012,0.162459850311,0.262865543365],
-                        [0.850650787354,0.0,0.525731086731],
-                        [0.681718349457,0.147620901465,0.71656692028],
-                        [0.681718349457,-0.147620901465,0.71656692028],
-                        [0.951056540012,0.162459850311,0.262865543365],
-                        [0.850650787354,0.0,0.525731086731],
-                        [0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.681718349457,0.147620901465,0.71656692028],
-                        [-0.850650787354,0.0,0.525731086731],
-                        [-0.681718349457,-0.147620901465,0.71656692028],
-                        [-0.864187836647,0.442862719297,0.238855645061],
-                        [-0.955422580242,0.295241802931,0.0],
-                        [-0.951056540012,0.162459850311,0.262865543365],
-                        [-0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.955422580242,-0.295241802931,0.0],
-                        [-0.864187836647,-0.442862719297,0.238855645061],
-                        [-0.951056540012,0.162459850311,0.262865543365],
-                        [-0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.850650787354,0.0,0.525731086731],
-                        [-0.442862719297,0.238855645061,0.864187836647],
-                        [-0.587785243988,0.425325393677,0.688190937042],
-                        [-0.681718349457,0.147620901465,0.71656692028],
-                        [-0.147620901465,0.71656692028,0.681718349457],
-                        [-0.238855645061,0.864187836647,0.442862719297],
-                        [-0.425325393677,0.688190937042,0.587785243988],
-                        [-0.688190937042,0.587785243988,0.425325393677],
-                        [-0.71656692028,0.681718349457,0.147620901465],
-                        [-0.864187836647,0.442862719297,0.238855645061],
-                        [-0.425325393677,0.688190937042,0.587785243988],
-                        [-0.688190937042,0.587785243988,0.425325393677],
-                        [-0.587785243988,0.425325393677,0.688190937042],
-                        [-0.147620901465,0.71656692028,0.681718349457],
-                        [0.0,0.525731086731,0.850650787354],
-                        [0.147620901465,0.71656692028,0.681718349457],
-                        [-0.442862719297,0.238855645061,0.864187836647],
-                        [-0.295241802931,0.0,0.955422580242],
-                        [-0.162459850311,0.262865543365,0.951056540012],
-                        [0.162459850311,0.262865543365,0.951056540012],
-                        [0.295241802931,0.0,0.955422580242],
-                        [0.442862719297,0.238855645061,0.864187836647],
-                        [-0.162459850311,0.262865543365,0.951056540012],
-                        [0.162459850311,0.262865543365,0.951056540012],
-                        [0.0,0.525731086731,0.850650787354],
-                        [-0.238855645061,0.864187836647,-0.442862719297],
-                        [-0.262865543365,0.951056540012,-0.162459850311],
-                        [0.0,0.955422580242,-0.295241802931],
-                        [-0.71656692028,0.681718349457,-0.147620901465],
-                        [-0.71656692028,0.681718349457,0.147620901465],
-                        [-0.525731086731,0.850650787354,0.0],
-                        [-0.262865543365,0.951056540012,0.162459850311],
-                        [-0.238855645061,0.864187836647,0.442862719297],
-                        [0.0,0.955422580242,0.295241802931],
-                        [-0.525731086731,0.850650787354,0.0],
-                        [-0.262865543365,0.951056540012,0.162459850311],
-                        [-0.262865543365,0.951056540012,-0.162459850311],
-                        [0.681718349457,0.147620901465,-0.71656692028],
-                        [0.850650787354,0.0,-0.525731086731],
-                        [0.681718349457,-0.147620901465,-0.71656692028],
-                        [0.864187836647,0.442862719297,-0.238855645061],
-                        [0.955422580242,0.295241802931,0.0],
-                        [0.951056540012,0.162459850311,-0.262865543365],
-                        [0.951056540012,-0.162459850311,-0.262865543365],
-                        [0.955422580242,-0.295241802931,0.0],
-                        [0.864187836647,-0.442862719297,-0.238855645061],
-                        [0.951056540012,0.162459850311,-0.262865543365],
-                        [0.951056540012,-0.162459850311,-0.262865543365],
-                        [0.850650787354,0.0,-0.525731086731],
-                        [-0.793863236904,-0.604043483734,0.070090636611],
-                        [-0.724504590034,-0.689269959927,0.0],
-                        [-0.793863236904,-0.604043483734,-0.070090636611],
-                        [-0.617670714855,-0.752343893051,0.229044884443],
-                        [-0.518927633762,-0.839642524719,0.16035746038],
-                        [-0.632596552372,-0.770524084568,0.0781932324171],
-                        [-0.632596552372,-0.770524084568,-0.0781932324171],
-                        [-0.518927633762,-0.839642524719,-0.16035746038],
-                        [-0.617670714855,-0.752343893051,-0.229044884443],
-                        [-0.632596552372,-0.770524084568,0.0781932324171],
-                        [-0.632596552372,-0.770524084568,-0.0781932324171],
-                        [-0.724504590034,-0.689269959927,0.0],
-                        [-0.370602428913,-0.846715569496,0.381741464138],
-                        [-0.253038614988,-0.915502369404,0.312772929668],
-                        [-0.389195710421,-0.889195740223,0.240536183119],
-                        [-0.113409027457,-0.863953828812,0.490634441376],
-                        [0.0,-0.907272219658,0.420543789864],
-                        [-0.120750762522,-0.919883430004,0.373140364885],
-                        [-0.126519307494,-0.963828444481,0.234579697251],
-                        [0.0,-0.988273143768,0.152696594596],
-                        [-0.129731908441,-0.988302052021,0.0801787301898],
-                        [-0.120750762522,-0.919883430004,0.373140364885],
-                        [-0.126519307494,-0.963828444481,0.234579697251],
-                        [-0.253038614988,-0.915502369404,0.312772929668],
-                        [-0.389195710421,-0.889195740223,-0.240536183119],
-                        [-0.253038614988,-0.915502369404,-0.312772929668],
-                        [-0.370602428913,-0.846715569496,-0.381741464138],
-                        [-0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.0,-0.988273143768,-0.152696594596],
-                        [-0.126519307494,-0.963828444481,-0.234579697251],
-                        [-0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.0,-0.907272219658,-0.420543789864],
-                        [-0.113409027457,-0.863953828812,-0.490634441376],
-                        [-0.126519307494,-0.963828444481,-0.234579697251],
-                        [-0.120750762522,-0.919883430004,-0.373140364885],
-                        [-0.253038614988,-0.915502369404,-0.312772929668],
-                        [-0.389195710421,-0.889195740223,0.240536183119],
-                        [-0.39960706234,-0.912982463837,0.0823235809803],
-                        [-0.518927633762,-0.839642524719,0.16035746038],
-                        [-0.129731908441,-0.988302052021,0.0801787301898],
-                        [-0.129731908441,-0.988302052021,-0.0801787301898],
-                        [-0.266404688358,-0.96386128664,0.0],
-                        [-0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.389195710421,-0.889195740223,-0.240536183119],
-                        [-0.518927633762,-0.839642524719,-0.16035746038],
-                        [-0.266404688358,-0.96386128664,0.0],
-                        [-0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.39960706234,-0.912982463837,0.0823235809803],
-                        [-0.490634441376,-0.113409027457,0.863953828812],
-                        [-0.568519234657,-0.19537883997,0.79913264513],
-                        [-0.604043483734,-0.070090636611,0.793863236904],
-                        [-0.381741464138,-0.370602428913,0.846715569496],
-                        [-0.450446814299,-0.469374448061,0.759463787079],
-                        [-0.517485499382,-0.331231862307,0.788983047009],
-                        [-0.644004821777,-0.28290578723,0.71078979969],
-                        [-0.70991063118,-0.370268076658,0.599106371403],
-                        [-0.752343893051,-0.229044884443,0.617670714855],
-                        [-0.517485499382,-0.331231862307,0.788983047009],
-                        [-0.644004821777,-0.28290578723,0.71078979969],
-                        [-0.568519234657,-0.19537883997,0.79913264513],
-                        [-0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.28290578723,-0.71078979969,0.644004821777],
-                        [-0.370268076658,-0.599106371403,0.70991063118],
-                        [-0.070090636611,-0.793863236904,0.604043483734],
-                        [-0.113409027457,-0.863953828812,0.490634441376],
-                        [-0.19537883997,-0.79913264513,0.568519234657],
-                        [-0.331231862307,-0.788983047009,0.517485499382],
-                        [-0.370602428913,-0.846715569496,0.381741464138],
-                        [-0.469374448061,-0.759463787079,0.450446814299],
-                        [-0.19537883997,-0.79913264513,0.568519234657],
-                        [-0.331231862307,-0.788983047009,0.517485499382],
-                        [-0.28290578723,-0.71078979969,0.644004821777],
-                        [-0.759463787079,-0.450446814299,0.469374448061],
-                        [-0.788983047009,-0.517485499382,0.331231862307],
-                        [-0.846715569496,-0.381741464138,0.370602428913],
-                        [-0.599106371403,-0.70991063118,0.370268076658],
-                        [-0.617670714855,-0.752343893051,0.229044884443],
-                        [-0.71078979969,-0.644004821777,0.28290578723],
-                        [-0.79913264513,-0.568519234657,0.19537883997],
-                        [-0.793863236904,-0.604043483734,0.070090636611],
-                        [-0.863953828812,-0.490634441376,0.113409027457],
-                        [-0.71078979969,-0.644004821777,0.28290578723],
-                        [-0.79913264513,-0.568519234657,0.19537883997],
-                        [-0.788983047009,-0.517485499382,0.331231862307],
-                        [-0.370268076658,-0.599106371403,0.70991063118],
-                        [-0.513375461102,-0.5642542243,0.646577775478],
-                        [-0.450446814299,-0.469374448061,0.759463787079],
-                        [-0.469374448061,-0.759463787079,0.450446814299],
-                        [-0.599106371403,-0.70991063118,0.370268076658],
-                        [-0.5642542243,-0.646577775478,0.513375461102],
-                        [-0.646577775478,-0.513375461102,0.5642542243],
-                        [-0.759463787079,-0.450446814299,0.469374448061],
-                        [-0.70991063118,-0.370268076658,0.599106371403],
-                        [-0.5642542243,-0.646577775478,0.513375461102],
-                        [-0.646577775478,-0.513375461102,0.5642542243],
-                        [-0.513375461102,-0.5642542243,0.646577775478],
-                        [-0.070090636611,-0.793863236904,0.604043483734],
-                        [0.0,-0.724504590034,0.689269959927],
-                        [0.070090636611,-0.793863236904,0.604043483734],
-                        [-0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.16035746038,-0.518927633762,0.839642524719],
-                        [-0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.16035746038,-0.518927633762,0.839642524719],
-                        [0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0,-0.724504590034,0.689269959927],
-                        [-0.381741464138,-0.370602428913,0.846715569496],
-                        [-0.312772929668,-0.253038614988,0.915502369404],
-                        [-0.240536183119,-0.389195710421,0.889195740223],
-                        [-0.490634441376,-0.113409027457,0.863953828812],
-                        [-0.420543789864,0.0,0.907272219658],
-                        [-0.373140364885,-0.120750762522,0.919883430004],
-                        [-0.234579697251,-0.126519307494,0.963828444481],
-                        [-0.152696594596,0.0,0.988273143768],
-                        [-0.0801787301898,-0.129731908441,0.988302052021],
-                        [-0.373140364885,-0.120750762522,0.919883430004],
-                        [-0.234579697251,-0.126519307494,0.963828444481],
-                        [-0.312772929668,-0.253038614988,0.915502369404],
-                        [0.240536183119,-0.389195710421,0.889195740223],
-                        [0.312772929668,-0.253038614988,0.915502369404],
-                        [0.381741464138,-0.370602428913,0.846715569496],
-                        [0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.152696594596,0.0,0.988273143768],
-                        [0.234579697251,-0.126519307494,0.963828444481],
-                        [0.373140364885,-0.120750762522,0.919883430004],
-                        [0.420543789864,0.0,0.907272219658],
-                        [0.490634441376,-0.113409027457,0.863953828812],
-                        [0.234579697251,-0.126519307494,0.963828444481],
-                        [0.373140364885,-0.120750762522,0.919883430004],
-                        [0.312772929668,-0.253038614988,0.915502369404],
-                        [-0.240536183119,-0.389195710421,0.889195740223],
-                        [-0.0823235809803,-0.39960706234,0.912982463837],
-                        [-0.16035746038,-0.518927633762,0.839642524719],
-                        [-0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.0,-0.266404688358,0.96386128664],
-                        [0.0823235809803,-0.39960706234,0.912982463837],
-                        [0.240536183119,-0.389195710421,0.889195740223],
-                        [0.16035746038,-0.518927633762,0.839642524719],
-                        [0.0,-0.266404688358,0.96386128664],
-                        [0.0823235809803,-0.39960706234,0.912982463837],
-                        [-0.0823235809803,-0.39960706234,0.912982463837],
-                        [0.070090636611,-0.793863236904,0.604043483734],
-                        [0.19537883997,-0.79913264513,0.568519234657],
-                        [0.113409027457,-0.863953828812,0.490634441376],
-                        [0.229044884443,-0.617670714855,0.752343893051],
-                        [0.370268076658,-0.599106371403,0.70991063118],
-                        [0.28290578723,-0.71078979969,0.644004821777],
-                        [0.331231862307,-0.788983047009,0.517485499382],
-                        [0.469374448061,-0.759463787079,0.450446814299],
-                        [0.370602428913,-0.846715569496,0.381741464138],
-                        [0.28290578723,-0.71078979969,0.644004821777],
-                        [0.331231862307,-0.788983047009,0.517485499382],
-                        [0.19537883997,-0.79913264513,0.568519234657],
-                        [0.381741464138,-0.370602428913,0.846715569496],
-                        [0.517485499382,-0.331231862307,0.788983047009],
-                        [0.450446814299,-0.469374448061,0.759463787079],
-                        [0.490634441376,-0.113409027457,0.863953828812],
-                        [0.604043483734,-0.070090636611,0.793863236904],
-                        [0.568519234657,-0.19537883997,0.79913264513],
-                        [0.644004821777,-0.28290578723,0.71078979969],
-                        [0.752343893051,-0.229044884443,0.617670714855],
-                        [0.70991063118,-0.370268076658,0.599106371403],
-                        [0.568519234657,-0.19537883997,0.79913264513],
-                        [0.644004821777,-0.28290578723,0.71078979969],
-                        [0.517485499382,-0.331231862307,0.788983047009],
-                        [0.599106371403,-0.70991063118,0.370268076658],
-                        [0.71078979969,-0.644004821777,0.28290578723],
-                        [0.617670714855,-0.752343893051,0.229044884443],
-                        [0.759463787079,-0.450446814299,0.469374448061],
-                        [0.846715569496,-0.381741464138,0.370602428913],
-                        [0.788983047009,-0.517485499382,0.331231862307],
-                        [0.79913264513,-0.568519234657,0.19537883997],
-                        [0.863953828812,-0.490634441376,0.113409027457],
-                        [0.793863236904,-0.604043483734,0.070090636611],
-                        [0.788983047009,-0.517485499382,0.331231862307],
-                        [0.79913264513,-0.568519234657,0.19537883997],
-                        [0.71078979969,-0.644004821777,0.28290578723],
-                        [0.450446814299,-0.469374448061,0.759463787079],
-                        [0.513375461102,-0.5642542243,0.646577775478],
-                        [0.370268076658,-0.599106371403,0.70991063118],
-                        [0.70991063118,-0.370268076658,0.599106371403],
-                        [0.759463787079,-0.450446814299,0.469374448061],
-                        [0.646577775478,-0.513375461102,0.5642542243],
-                        [0.5642542243,-0.646577775478,0.513375461102],
-                        [0.599106371403,-0.70991063118,0.370268076658],
-                        [0.469374448061,-0.759463787079,0.450446814299],
-                        [0.646577775478,-0.513375461102,0.5642542243],
-                        [0.5642542243,-0.646577775478,0.513375461102],
-                        [0.513375461102,-0.5642542243,0.646577775478],
-                        [0.793863236904,-0.604043483734,-0.070090636611],
-                        [0.724504590034,-0.689269959927,0.0],
-                        [0.793863236904,-0.604043483734,0.070090636611],
-                        [0.617670714855,-0.752343893051,-0.229044884443],
-                        [0.518927633762,-0.839642524719,-0.16035746038],
-                        [0.632596552372,-0.770524084568,-0.0781932324171],
-                        [0.632596552372,-0.770524084568,0.0781932324171],
-                        [0.518927633762,-0.839642524719,0.16035746038],
-                        [0.617670714855,-0.752343893051,0.229044884443],
-                        [0.632596552372,-0.770524084568,-0.0781932324171],
-                        [0.632596552372,-0.770524084568,0.0781932324171],
-                        [0.724504590034,-0.689269959927,0.0],
-                        [0.370602428913,-0.846715569496,-0.381741464138],
-                        [0.253038614988,-0.915502369404,-0.312772929668],
-                        [0.389195710421,-0.889195740223,-0.240536183119],
-                        [0.113409027457,-0.863953828812,-0.490634441376],
-                        [0.0,-0.907272219658,-0.420543789864],
-                        [0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.126519307494,-0.963828444481,-0.234579697251],
-                        [0.0,-0.988273143768,-0.152696594596],
-                        [0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.126519307494,-0.963828444481,-0.234579697251],
-                        [0.253038614988,-0.915502369404,-0.312772929668],
-                        [0.389195710421,-0.889195740223,0.240536183119],
-                        [0.253038614988,-0.915502369404,0.312772929668],
-                        [0.370602428913,-0.846715569496,0.381741464138],
-                        [0.129731908441,-0.988302052021,0.0801787301898],
-                        [0.0,-0.988273143768,0.152696594596],
-                        [0.126519307494,-0.963828444481,0.234579697251],
-                        [0.120750762522,-0.919883430004,0.373140364885],
-                        [0.0,-0.907272219658,0.420543789864],
-                        [0.113409027457,-0.863953828812,0.490634441376],
-                        [0.126519307494,-0.963828444481,0.234579697251],
-                        [0.120750762522,-0.919883430004,0.373140364885],
-                        [0.253038614988,-0.915502369404,0.312772929668],
-                        [0.389195710421,-0.889195740223,-0.240536183119],
-                        [0.39960706234,-0.912982463837,-0.0823235809803],
-                        [0.518927633762,-0.839642524719,-0.16035746038],
-                        [0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.129731908441,-0.988302052021,0.0801787301898],
-                        [0.266404688358,-0.96386128664,0.0],
-                        [0.39960706234,-0.912982463837,0.0823235809803],
-                        [0.389195710421,-0.889195740223,0.240536183119],
-                        [0.518927633762,-0.839642524719,0.16035746038],
-                        [0.266404688358,-0.96386128664,0.0],
-                        [0.39960706234,-0.912982463837,0.0823235809803],
-                        [0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.793863236904,-0.604043483734,-0.070090636611],
-                        [-0.79913264513,-0.568519234657,-0.19537883997],
-                        [-0.863953828812,-0.490634441376,-0.113409027457],
-                        [-0.617670714855,-0.752343893051,-0.229044884443],
-                        [-0.599106371403,-0.70991063118,-0.370268076658],
-                        [-0.71078979969,-0.644004821777,-0.28290578723],
-                        [-0.788983047009,-0.517485499382,-0.331231862307],
-                        [-0.759463787079,-0.450446814299,-0.469374448061],
-                        [-0.846715569496,-0.381741464138,-0.370602428913],
-                        [-0.71078979969,-0.644004821777,-0.28290578723],
-                        [-0.788983047009,-0.517485499382,-0.331231862307],
-                        [-0.79913264513,-0.568519234657,-0.19537883997],
-                        [-0.370602428913,-0.846715569496,-0.381741464138],
-                        [-0.331231862307,-0.788983047009,-0.517485499382],
-                        [-0.469374448061,-0.759463787079,-0.450446814299],
-                        [-0.113409027457,-0.863953828812,-0.490634441376],
-                        [-0.070090636611,-0.793863236904,-0.604043483734],
-                        [-0.19537883997,-0.79913264513,-0.568519234657],
-                        [-0.28290578723,-0.71078979969,-0.644004821777],
-                        [-0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.370268076658,-0.599106371403,-0.70991063118],
-                        [-0.19537883997,-0.79913264513,-0.568519234657],
-                        [-0.28290578723,-0.71078979969,-0.644004821777],
-                        [-0.331231862307,-0.788983047009,-0.517485499382],
-                        [-0.70991063118,-0.370268076658,-0.599106371403],
-                        [-0.644004821777,-0.28290578723,-0.71078979969],
-                        [-0.752343893051,-0.229044884443,-0.617670714855],
-                        [-0.450446814299,-0.469374448061,-0.759463787079],
-                        [-0.381741464138,-0.370602428913,-0.846715569496],
-                        [-0.517485499382,-0.331231862307,-0.788983047009],
-                        [-0.568519234657,-0.19537883997,-0.79913264513],
-                        [-0.490634441376,-0.113409027457,-0.863953828812],
-                        [-0.604043483734,-0.070090636611,-0.793863236904],
-                        [-0.517485499382,-0.331231862307,-0.788983047009],
-                        [-0.568519234657,-0.19537883997,-0.79913264513],
-                        [-0.644004821777,-0.28290578723,-0.71078979969],
-                        [-0.469374448061,-0.759463787079,-0.450446814299],
-                        [-0.5642542243,-0.646577775478,-0.513375461102],
-                        [-0.599106371403,-0.70991063118,-0.370268076658],
-                        [-0.370268076658,-0.599106371403,-0.70991063118],
-                        [-0.450446814299,-0.469374448061,-0.759463787079],
-                        [-0.513375461102,-0.5642542243,-0.646577775478],
-                        [-0.646577775478,-0.513375461102,-0.5642542243],
-                        [-0.70991063118,-0.370268076658,-0.599106371403],
-                        [-0.759463787079,-0.450446814299,-0.469374448061],
-                        [-0.513375461102,-0.5642542243,-0.646577775478],
-                        [-0.646577775478,-0.513375461102,-0.5642542243],
-                        [-0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.113409027457,-0.863953828812,-0.490634441376],
-                        [0.19537883997,-0.79913264513,-0.568519234657],
-                        [0.070090636611,-0.793863236904,-0.604043483734],
-                        [0.370602428913,-0.846715569496,-0.381741464138],
-                        [0.469374448061,-0.759463787079,-0.450446814299],
-                        [0.331231862307,-0.788983047009,-0.517485499382],
-                        [0.28290578723,-0.71078979969,-0.644004821777],
-                        [0.370268076658,-0.599106371403,-0.70991063118],
-                        [0.229044884443,-0.617670714855,-0.752343893051],
-                        [0.331231862307,-0.788983047009,-0.517485499382],
-                        [0.28290578723,-0.71078979969,-0.644004821777],
-                        [0.19537883997,-0.79913264513,-0.568519234657],
-                        [0.617670714855,-0.752343893051,-0.229044884443],
-                        [0.71078979969,-0.644004821777,-0.28290578723],
-                        [0.599106371403,-0.70991063118,-0.370268076658],
-                        [0.793863236904,-0.604043483734,-0.070090636611],
-                        [0.863953828812,-0.490634441376,-0.113409027457],
-                        [0.79913264513,-0.568519234657,-0.19537883997],
-                        [0.788983047009,-0.517485499382,-0.331231862307],
-                        [0.846715569496,-0.381741464138,-0.370602428913],
-                        [0.759463787079,-0.450446814299,-0.469374448061],
-                        [0.79913264513,-0.568519234657,-0.19537883997],
-                        [0.788983047009,-0.517485499382,-0.331231862307],
-                        [0.71078979969,-0.644004821777,-0.28290578723],
-                        [0.450446814299,-0.469374448061,-0.759463787079],
-                        [0.517485499382,-0.331231862307,-0.788983047009],
-                        [0.381741464138,-0.370602428913,-0.846715569496],
-                        [0.70991063118,-0.370268076658,-0.599106371403],
-                        [0.752343893051,-0.229044884443,-0.617670714855],
-                        [0.644004821777,-0.28290578723,-0.71078979969],
-                        [0.568519234657,-0.19537883997,-0.79913264513],
-                        [0.604043483734,-0.070090636611,-0.793863236904],
-                        [0.490634441376,-0.113409027457,-0.863953828812],
-                        [0.644004821777,-0.28290578723,-0.71078979969],
-                        [0.568519234657,-0.19537883997,-0.79913264513],
-                        [0.517485499382,-0.331231862307,-0.788983047009],
-                        [0.599106371403,-0.70991063118,-0.370268076658],
-                        [0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.469374448061,-0.759463787079,-0.450446814299],
-                        [0.759463787079,-0.450446814299,-0.469374448061],
-                        [0.70991063118,-0.370268076658,-0.599106371403],
-                        [0.646577775478,-0.513375461102,-0.5642542243],
-                        [0.513375461102,-0.5642542243,-0.646577775478],
-                        [0.450446814299,-0.469374448061,-0.759463787079],
-                        [0.370268076658,-0.599106371403,-0.70991063118],
-                        [0.646577775478,-0.513375461102,-0.5642542243],
-                        [0.513375461102,-0.5642542243,-0.646577775478],
-                        [0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.420543789864,0.0,-0.907272219658],
-                        [0.373140364885,-0.120750762522,-0.919883430004],
-                        [0.490634441376,-0.113409027457,-0.863953828812],
-                        [0.152696594596,0.0,-0.988273143768],
-                        [0.0801787301898,-0.129731908441,-0.988302052021],
-                        [0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.312772929668,-0.253038614988,-0.915502369404],
-                        [0.240536183119,-0.389195710421,-0.889195740223],
-                        [0.381741464138,-0.370602428913,-0.846715569496],
-                        [0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.312772929668,-0.253038614988,-0.915502369404],
-                        [0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.152696594596,0.0,-0.988273143768],
-                        [-0.234579697251,-0.126519307494,-0.963828444481],
-                        [-0.0801787301898,-0.129731908441,-0.988302052021],
-                        [-0.420543789864,0.0,-0.907272219658],
-                        [-0.490634441376,-0.113409027457,-0.863953828812],
-                        [-0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.312772929668,-0.253038614988,-0.915502369404],
-                        [-0.381741464138,-0.370602428913,-0.846715569496],
-                        [-0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.312772929668,-0.253038614988,-0.915502369404],
-                        [-0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.16035746038,-0.518927633762,-0.839642524719],
-                        [0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.16035746038,-0.518927633762,-0.839642524719],
-                        [-0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.0,-0.724504590034,-0.689269959927],
-                        [-0.070090636611,-0.793863236904,-0.604043483734],
-                        [0.070090636611,-0.793863236904,-0.604043483734],
-                        [-0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.0,-0.724504590034,-0.689269959927],
-                        [0.0781932324171,-0.632596552372,-0.770524084568],
-                        [-0.0801787301898,-0.129731908441,-0.988302052021],
-                        [0.0,-0.266404688358,-0.96386128664],
-                        [0.0801787301898,-0.129731908441,-0.988302052021],
-                        [-0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.16035746038,-0.518927633762,-0.839642524719],
-                        [-0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.16035746038,-0.518927633762,-0.839642524719],
-                        [0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0,-0.266404688358,-0.96386128664],
-                        [-0.907272219658,-0.420543789864,0.0],
-                        [-0.919883430004,-0.373140364885,-0.120750762522],
-                        [-0.863953828812,-0.490634441376,-0.113409027457],
-                        [-0.988273143768,-0.152696594596,0.0],
-                        [-0.988302052021,-0.0801787301898,-0.129731908441],
-                        [-0.963828444481,-0.234579697251,-0.126519307494],
-                        [-0.915502369404,-0.312772929668,-0.253038614988],
-                        [-0.889195740223,-0.240536183119,-0.389195710421],
-                        [-0.846715569496,-0.381741464138,-0.370602428913],
-                        [-0.963828444481,-0.234579697251,-0.126519307494],
-                        [-0.915502369404,-0.312772929668,-0.253038614988],
-                        [-0.919883430004,-0.373140364885,-0.120750762522],
-                        [-0.988273143768,0.152696594596,0.0],
-                        [-0.963828444481,0.234579697251,-0.126519307494],
-                        [-0.988302052021,0.0801787301898,-0.129731908441],
-                        [-0.907272219658,0.420543789864,0.0],
-                        [-0.863953828812,0.490634441376,-0.113409027457],
-                        [-0.919883430004,0.373140364885,-0.120750762522],
-                        [-0.915502369404,0.312772929668,-0.253038614988],
-                        [-0.846715569496,0.381741464138,-0.370602428913],
-                        [-0.889195740223,0.240536183119,-0.389195710421],
-                        [-0.919883430004,0.373140364885,-0.120750762522],
-                        [-0.915502369404,0.312772929668,-0.253038614988],
-                        [-0.963828444481,0.234579697251,-0.126519307494],
-                        [-0.839642524719,-0.16035746038,-0.518927633762],
-                        [-0.770524084568,-0.0781932324171,-0.632596552372],
-                        [-0.752343893051,-0.229044884443,-0.617670714855],
-                        [-0.839642524719,0.16035746038,-0.518927633762],
-                        [-0.752343893051,0.229044884443,-0.617670714855],
-                        [-0.770524084568,0.0781932324171,-0.632596552372],
-                        [-0.689269959927,0.0,-0.724504590034],
-                        [-0.604043483734,0.070090636611,-0.793863236904],
-                        [-0.604043483734,-0.070090636611,-0.793863236904],
-                        [-0.770524084568,0.0781932324171,-0.632596552372],
-                        [-0.689269959927,0.0,-0.724504590034],
-                        [-0.770524084568,-0.0781932324171,-0.632596552372],
-                        [-0.988302052021,0.0801787301898,-0.129731908441],
-                        [-0.96386128664,0.0,-0.266404688358],
-                        [-0.988302052021,-0.0801787301898,-0.129731908441],
-                        [-0.889195740223,0.240536183119,-0.389195710421],
-                        [-0.839642524719,0.16035746038,-0.518927633762],
-                        [-0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.912982463837,-0.0823235809803,-0.39960706234],
-                        [-0.839642524719,-0.16035746038,-0.518927633762],
-                        [-0.889195740223,-0.240536183119,-0.389195710421],
-                        [-0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.912982463837,-0.0823235809803,-0.39960706234],
-                        [-0.96386128664,0.0,-0.266404688358],
-                        [-0.793863236904,0.604043483734,-0.070090636611],
-                        [-0.79913264513,0.568519234657,-0.19537883997],
-                        [-0.863953828812,0.490634441376,-0.113409027457],
-                        [-0.617670714855,0.752343893051,-0.229044884443],
-                        [-0.599106371403,0.70991063118,-0.370268076658],
-                        [-0.71078979969,0.644004821777,-0.28290578723],
-                        [-0.788983047009,0.517485499382,-0.331231862307],
-                        [-0.759463787079,0.450446814299,-0.469374448061],
-                        [-0.846715569496,0.381741464138,-0.370602428913],
-                        [-0.71078979969,0.644004821777,-0.28290578723],
-                        [-0.788983047009,0.517485499382,-0.331231862307],
-                        [-0.79913264513,0.568519234657,-0.19537883997],
-                        [-0.370602428913,0.846715569496,-0.381741464138],
-                        [-0.331231862307,0.788983047009,-0.517485499382],
-                        [-0.469374448061,0.759463787079,-0.450446814299],
-                        [-0.113409027457,0.863953828812,-0.490634441376],
-                        [-0.070090636611,0.793863236904,-0.604043483734],
-                        [-0.19537883997,0.79913264513,-0.568519234657],
-                        [-0.28290578723,0.71078979969,-0.644004821777],
-                        [-0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.370268076658,0.599106371403,-0.70991063118],
-                        [-0.19537883997,0.79913264513,-0.568519234657],
-                        [-0.28290578723,0.71078979969,-0.644004821777],
-                        [-0.331231862307,0.788983047009,-0.517485499382],
-                        [-0.70991063118,0.370268076658,-0.599106371403],
-                        [-0.644004821777,0.28290578723,-0.71078979969],
-                        [-0.752343893051,0.229044884443,-0.617670714855],
-                        [-0.450446814299,0.469374448061,-0.759463787079],
-                        [-0.381741464138,0.370602428913,-0.846715569496],
-                        [-0.517485499382,0.331231862307,-0.788983047009],
-                        [-0.568519234657,0.19537883997,-0.79913264513],
-                        [-0.490634441376,0.113409027457,-0.863953828812],
-                        [-0.604043483734,0.070090636611,-0.793863236904],
-                        [-0.517485499382,0.331231862307,-0.788983047009],
-                        [-0.568519234657,0.19537883997,-0.79913264513],
-                        [-0.644004821777,0.28290578723,-0.71078979969],
-                        [-0.469374448061,0.759463787079,-0.450446814299],
-                        [-0.5642542243,0.646577775478,-0.513375461102],
-                        [-0.599106371403,0.70991063118,-0.370268076658],
-                        [-0.370268076658,0.599106371403,-0.70991063118],
-                        [-0.450446814299,0.469374448061,-0.759463787079],
-                        [-0.513375461102,0.5642542243,-0.646577775478],
-                        [-0.646577775478,0.513375461102,-0.5642542243],
-                        [-0.70991063118,0.370268076658,-0.599106371403],
-                        [-0.759463787079,0.450446814299,-0.469374448061],
-                        [-0.513375461102,0.5642542243,-0.646577775478],
-                        [-0.646577775478,0.513375461102,-0.5642542243],
-                        [-0.5642542243,0.646577775478,-0.513375461102],
-                        [0.420543789864,0.0,-0.907272219658],
-                        [0.373140364885,0.120750762522,-0.919883430004],
-                        [0.490634441376,0.113409027457,-0.863953828812],
-                        [0.152696594596,0.0,-0.988273143768],
-                        [0.0801787301898,0.129731908441,-0.988302052021],
-                        [0.234579697251,0.126519307494,-0.963828444481],
-                        [0.312772929668,0.253038614988,-0.915502369404],
-                        [0.240536183119,0.389195710421,-0.889195740223],
-                        [0.381741464138,0.370602428913,-0.846715569496],
-                        [0.234579697251,0.126519307494,-0.963828444481],
-                        [0.312772929668,0.253038614988,-0.915502369404],
-                        [0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.152696594596,0.0,-0.988273143768],
-                        [-0.234579697251,0.126519307494,-0.963828444481],
-                        [-0.0801787301898,0.129731908441,-0.988302052021],
-                        [-0.420543789864,0.0,-0.907272219658],
-                        [-0.490634441376,0.113409027457,-0.863953828812],
-                        [-0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.312772929668,0.253038614988,-0.915502369404],
-                        [-0.381741464138,0.370602428913,-0.846715569496],
-                        [-0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.312772929668,0.253038614988,-0.915502369404],
-                        [-0.234579697251,0.126519307494,-0.963828444481],
-                        [0.16035746038,0.518927633762,-0.839642524719],
-                        [0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.16035746038,0.518927633762,-0.839642524719],
-                        [-0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.0,0.724504590034,-0.689269959927],
-                        [-0.070090636611,0.793863236904,-0.604043483734],
-                        [0.070090636611,0.793863236904,-0.604043483734],
-                        [-0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.0,0.724504590034,-0.689269959927],
-                        [0.0781932324171,0.632596552372,-0.770524084568],
-                        [-0.0801787301898,0.129731908441,-0.988302052021],
-                        [0.0,0.266404688358,-0.96386128664],
-                        [0.0801787301898,0.129731908441,-0.988302052021],
-                        [-0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.16035746038,0.518927633762,-0.839642524719],
-                        [-0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.16035746038,0.518927633762,-0.839642524719],
-                        [0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0,0.266404688358,-0.96386128664],
-                        [0.490634441376,0.113409027457,-0.863953828812],
-                        [0.568519234657,0.19537883997,-0.79913264513],
-                        [0.604043483734,0.070090636611,-0.793863236904],
-                        [0.381741464138,0.370602428913,-0.846715569496],
-                        [0.450446814299,0.469374448061,-0.759463787079],
-                        [0.517485499382,0.331231862307,-0.788983047009],
-                        [0.644004821777,0.28290578723,-0.71078979969],
-                        [0.70991063118,0.370268076658,-0.599106371403],
-                        [0.752343893051,0.229044884443,-0.617670714855],
-                        [0.517485499382,0.331231862307,-0.788983047009],
-                        [0.644004821777,0.28290578723,-0.71078979969],
-                        [0.568519234657,0.19537883997,-0.79913264513],
-                        [0.229044884443,0.617670714855,-0.752343893051],
-                        [0.28290578723,0.71078979969,-0.644004821777],
-                        [0.370268076658,0.599106371403,-0.70991063118],
-                        [0.070090636611,0.793863236904,-0.604043483734],
-                        [0.113409027457,0.863953828812,-0.490634441376],
-                        [0.19537883997,0.79913264513,-0.568519234657],
-                        [0.331231862307,0.788983047009,-0.517485499382],
-                        [0.370602428913,0.846715569496,-0.381741464138],
-                        [0.469374448061,0.759463787079,-0.450446814299],
-                        [0.19537883997,0.79913264513,-0.568519234657],
-                        [0.331231862307,0.788983047009,-0.517485499382],
-                        [0.28290578723,0.71078979969,-0.644004821777],
-                        [0.759463787079,0.450446814299,-0.469374448061],
-                        [0.788983047009,0.517485499382,-0.331231862307],
-                        [0.846715569496,0.381741464138,-0.370602428913],
-                        [0.599106371403,0.70991063118,-0.370268076658],
-                        [0.617670714855,0.752343893051,-0.229044884443],
-                        [0.71078979969,0.644004821777,-0.28290578723],
-                        [0.79913264513,0.568519234657,-0.19537883997],
-                        [0.793863236904,0.604043483734,-0.070090636611],
-                        [0.863953828812,0.490634441376,-0.113409027457],
-                        [0.71078979969,0.644004821777,-0.28290578723],
-                        [0.79913264513,0.568519234657,-0.19537883997],
-                        [0.788983047009,0.517485499382,-0.331231862307],
-                        [0.370268076658,0.599106371403,-0.70991063118],
-                        [0.513375461102,0.5642542243,-0.646577775478],
-                        [0.450446814299,0.469374448061,-0.759463787079],
-                        [0.469374448061,0.759463787079,-0.450446814299],
-                        [0.599106371403,0.70991063118,-0.370268076658],
-                        [0.5642542243,0.646577775478,-0.513375461102],
-                        [0.646577775478,0.513375461102,-0.5642542243],
-                        [0.759463787079,0.450446814299,-0.469374448061],
-                        [0.70991063118,0.370268076658,-0.599106371403],
-                        [0.5642542243,0.646577775478,-0.513375461102],
-                        [0.646577775478,0.513375461102,-0.5642542243],
-                        [0.513375461102,0.5642542243,-0.646577775478],
-                        [0.793863236904,0.604043483734,-0.070090636611],
-                        [0.724504590034,0.689269959927,0.0],
-                        [0.793863236904,0.604043483734,0.070090636611],
-                        [0.617670714855,0.752343893051,-0.229044884443],
-                        [0.518927633762,0.839642524719,-0.16035746038],
-                        [0.632596552372,0.770524084568,-0.0781932324171],
-                        [0.632596552372,0.770524084568,0.0781932324171],
-                        [0.518927633762,0.839642524719,0.16035746038],
-                        [0.617670714855,0.752343893051,0.229044884443],
-                        [0.632596552372,0.770524084568,-0.0781932324171],
-                        [0.632596552372,0.770524084568,0.0781932324171],
-                        [0.724504590034,0.689269959927,0.0],
-                        [0.370602428913,0.846715569496,-0.381741464138],
-                        [0.253038614988,0.915502369404,-0.312772929668],
-                        [0.389195710421,0.889195740223,-0.240536183119],
-                        [0.113409027457,0.863953828812,-0.490634441376],
-                        [0.0,0.907272219658,-0.420543789864],
-                        [0.120750762522,0.919883430004,-0.373140364885],
-                        [0.126519307494,0.963828444481,-0.234579697251],
-                        [0.0,0.988273143768,-0.152696594596],
-                        [0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.120750762522,0.919883430004,-0.373140364885],
-                        [0.126519307494,0.963828444481,-0.234579697251],
-                        [0.253038614988,0.915502369404,-0.312772929668],
-                        [0.389195710421,0.889195740223,0.240536183119],
-                        [0.253038614988,0.915502369404,0.312772929668],
-                        [0.370602428913,0.846715569496,0.381741464138],
-                        [0.129731908441,0.988302052021,0.0801787301898],
-                        [0.0,0.988273143768,0.152696594596],
-                        [0.126519307494,0.963828444481,0.234579697251],
-                        [0.120750762522,0.919883430004,0.373140364885],
-                        [0.0,0.907272219658,0.420543789864],
-                        [0.113409027457,0.863953828812,0.490634441376],
-                        [0.126519307494,0.963828444481,0.234579697251],
-                        [0.120750762522,0.919883430004,0.373140364885],
-                        [0.253038614988,0.915502369404,0.312772929668],
-                        [0.389195710421,0.889195740223,-0.240536183119],
-                        [0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.518927633762,0.839642524719,-0.16035746038],
-                        [0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.129731908441,0.988302052021,0.0801787301898],
-                        [0.266404688358,0.96386128664,0.0],
-                        [0.39960706234,0.912982463837,0.0823235809803],
-                        [0.389195710421,0.889195740223,0.240536183119],
-                        [0.518927633762,0.839642524719,0.16035746038],
-                        [0.266404688358,0.96386128664,0.0],
-                        [0.39960706234,0.912982463837,0.0823235809803],
-                        [0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.793863236904,0.604043483734,0.070090636611],
-                        [0.79913264513,0.568519234657,0.19537883997],
-                        [0.863953828812,0.490634441376,0.113409027457],
-                        [0.617670714855,0.752343893051,0.229044884443],
-                        [0.599106371403,0.70991063118,0.370268076658],
-                        [0.71078979969,0.644004821777,0.28290578723],
-                        [0.788983047009,0.517485499382,0.331231862307],
-                        [0.759463787079,0.450446814299,0.469374448061],
-                        [0.846715569496,0.381741464138,0.370602428913],
-                        [0.71078979969,0.644004821777,0.28290578723],
-                        [0.788983047009,0.517485499382,0.331231862307],
-                        [0.79913264513,0.568519234657,0.19537883997],
-                        [0.370602428913,0.846715569496,0.381741464138],
-                        [0.331231862307,0.788983047009,0.517485499382],
-                        [0.469374448061,0.759463787079,0.450446814299],
-                        [0.113409027457,0.863953828812,0.490634441376],
-                        [0.070090636611,0.793863236904,0.604043483734],
-                        [0.19537883997,0.79913264513,0.568519234657],
-                        [0.28290578723,0.71078979969,0.644004821777],
-                        [0.229044884443,0.617670714855,0.752343893051],
-                        [0.370268076658,0.599106371403,0.70991063118],
-                        [0.19537883997,0.79913264513,0.568519234657],
-                        [0.28290578723,0.71078979969,0.644004821777],
-                        [0.331231862307,0.788983047009,0.517485499382],
-                        [0.70991063118,0.370268076658,0.599106371403],
-                        [0.644004821777,0.28290578723,0.71078979969],
-                        [0.752343893051,0.229044884443,0.617670714855],
-                        [0.450446814299,0.469374448061,0.759463787079],
-                        [0.381741464138,0.370602428913,0.846715569496],
-                        [0.517485499382,0.331231862307,0.788983047009],
-                        [0.568519234657,0.19537883997,0.79913264513],
-                        [0.490634441376,0.113409027457,0.863953828812],
-                        [0.604043483734,0.070090636611,0.793863236904],
-                        [0.517485499382,0.331231862307,0.788983047009],
-                        [0.568519234657,0.19537883997,0.79913264513],
-                        [0.644004821777,0.28290578723,0.71078979969],
-                        [0.469374448061,0.759463787079,0.450446814299],
-                        [0.5642542243,0.646577775478,0.513375461102],
-                        [0.599106371403,0.70991063118,0.370268076658],
-                        [0.370268076658,0.599106371403,0.70991063118],
-                        [0.450446814299,0.469374448061,0.759463787079],
-                        [0.513375461102,0.5642542243,0.646577775478],
-                        [0.646577775478,0.513375461102,0.5642542243],
-                        [0.70991063118,0.370268076658,0.599106371403],
-                        [0.759463787079,0.450446814299,0.469374448061],
-                        [0.513375461102,0.5642542243,0.646577775478],
-                        [0.646577775478,0.513375461102,0.5642542243],
-                        [0.5642542243,0.646577775478,0.513375461102],
-                        [0.907272219658,-0.420543789864,0.0],
-                        [0.919883430004,-0.373140364885,0.120750762522],
-                        [0.863953828812,-0.490634441376,0.113409027457],
-                        [0.988273143768,-0.152696594596,0.0],
-                        [0.988302052021,-0.0801787301898,0.129731908441],
-                        [0.963828444481,-0.234579697251,0.126519307494],
-                        [0.915502369404,-0.312772929668,0.253038614988],
-                        [0.889195740223,-0.240536183119,0.389195710421],
-                        [0.846715569496,-0.381741464138,0.370602428913],
-                        [0.963828444481,-0.234579697251,0.126519307494],
-                        [0.915502369404,-0.312772929668,0.253038614988],
-                        [0.919883430004,-0.373140364885,0.120750762522],
-                        [0.988273143768,0.152696594596,0.0],
-                        [0.963828444481,0.234579697251,0.126519307494],
-                        [0.988302052021,0.0801787301898,0.129731908441],
-                        [0.907272219658,0.420543789864,0.0],
-                        [0.863953828812,0.490634441376,0.113409027457],
-                        [0.919883430004,0.373140364885,0.120750762522],
-                        [0.915502369404,0.312772929668,0.253038614988],
-                        [0.846715569496,0.381741464138,0.370602428913],
-                        [0.889195740223,0.240536183119,0.389195710421],
-                        [0.919883430004,0.373140364885,0.120750762522],
-                        [0.915502369404,0.312772929668,0.253038614988],
-                        [0.963828444481,0.234579697251,0.126519307494],
-                        [0.839642524719,-0.16035746038,0.518927633762],
-                        [0.770524084568,-0.0781932324171,0.632596552372],
-                        [0.752343893051,-0.229044884443,0.617670714855],
-                        [0.839642524719,0.16035746038,0.518927633762],
-                        [0.752343893051,0.229044884443,0.617670714855],
-                        [0.770524084568,0.0781932324171,0.632596552372],
-                        [0.689269959927,0.0,0.724504590034],
-                        [0.604043483734,0.070090636611,0.793863236904],
-                        [0.604043483734,-0.070090636611,0.793863236904],
-                        [0.770524084568,0.0781932324171,0.632596552372],
-                        [0.689269959927,0.0,0.724504590034],
-                        [0.770524084568,-0.0781932324171,0.632596552372],
-                        [0.988302052021,0.0801787301898,0.129731908441],
-                        [0.96386128664,0.0,0.266404688358],
-                        [0.988302052021,-0.0801787301898,0.129731908441],
-                        [0.889195740223,0.240536183119,0.389195710421],
-                        [0.839642524719,0.16035746038,0.518927633762],
-                        [0.912982463837,0.0823235809803,0.39960706234],
-                        [0.912982463837,-0.0823235809803,0.39960706234],
-                        [0.839642524719,-0.16035746038,0.518927633762],
-                        [0.889195740223,-0.240536183119,0.389195710421],
-                        [0.912982463837,0.0823235809803,0.39960706234],
-                        [0.912982463837,-0.0823235809803,0.39960706234],
-                        [0.96386128664,0.0,0.266404688358],
-                        [-0.604043483734,0.070090636611,0.793863236904],
-                        [-0.689269959927,0.0,0.724504590034],
-                        [-0.604043483734,-0.070090636611,0.793863236904],
-                        [-0.752343893051,0.229044884443,0.617670714855],
-                        [-0.839642524719,0.16035746038,0.518927633762],
-                        [-0.770524084568,0.0781932324171,0.632596552372],
-                        [-0.770524084568,-0.0781932324171,0.632596552372],
-                        [-0.839642524719,-0.16035746038,0.518927633762],
-                        [-0.752343893051,-0.229044884443,0.617670714855],
-                        [-0.770524084568,0.0781932324171,0.632596552372],
-                        [-0.770524084568,-0.0781932324171,0.632596552372],
-                        [-0.689269959927,0.0,0.724504590034],
-                        [-0.846715569496,0.381741464138,0.370602428913],
-                        [-0.915502369404,0.312772929668,0.253038614988],
-                        [-0.889195740223,0.240536183119,0.389195710421],
-                        [-0.863953828812,0.490634441376,0.113409027457],
-                        [-0.907272219658,0.420543789864,0.0],
-                        [-0.919883430004,0.373140364885,0.120750762522],
-                        [-0.963828444481,0.234579697251,0.126519307494],
-                        [-0.988273143768,0.152696594596,0.0],
-                        [-0.988302052021,0.0801787301898,0.129731908441],
-                        [-0.919883430004,0.373140364885,0.120750762522],
-                        [-0.963828444481,0.234579697251,0.126519307494],
-                        [-0.915502369404,0.312772929668,0.253038614988],
-                        [-0.889195740223,-0.240536183119,0.389195710421],
-                        [-0.915502369404,-0.312772929668,0.253038614988],
-                        [-0.846715569496,-0.381741464138,0.370602428913],
-                        [-0.988302052021,-0.0801787301898,0.129731908441],
-                        [-0.988273143768,-0.152696594596,0.0],
-                        [-0.963828444481,-0.234579697251,0.126519307494],
-                        [-0.919883430004,-0.373140364885,0.120750762522],
-                        [-0.907272219658,-0.420543789864,0.0],
-                        [-0.863953828812,-0.490634441376,0.113409027457],
-                        [-0.963828444481,-0.234579697251,0.126519307494],
-                        [-0.919883430004,-0.373140364885,0.120750762522],
-                        [-0.915502369404,-0.312772929668,0.253038614988],
-                        [-0.889195740223,0.240536183119,0.389195710421],
-                        [-0.912982463837,0.0823235809803,0.39960706234],
-                        [-0.839642524719,0.16035746038,0.518927633762],
-                        [-0.988302052021,0.0801787301898,0.129731908441],
-                        [-0.988302052021,-0.0801787301898,0.129731908441],
-                        [-0.96386128664,0.0,0.266404688358],
-                        [-0.912982463837,-0.0823235809803,0.39960706234],
-                        [-0.889195740223,-0.240536183119,0.389195710421],
-                        [-0.839642524719,-0.16035746038,0.518927633762],
-                        [-0.96386128664,0.0,0.266404688358],
-                        [-0.912982463837,-0.0823235809803,0.39960706234],
-                        [-0.912982463837,0.0823235809803,0.39960706234],
-                        [-0.490634441376,0.113409027457,0.863953828812],
-                        [-0.568519234657,0.19537883997,0.79913264513],
-                        [-0.604043483734,0.070090636611,0.793863236904],
-                        [-0.381741464138,0.370602428913,0.846715569496],
-                        [-0.450446814299,0.469374448061,0.759463787079],
-                        [-0.517485499382,0.331231862307,0.788983047009],
-                        [-0.644004821777,0.28290578723,0.71078979969],
-                        [-0.70991063118,0.370268076658,0.599106371403],
-                        [-0.752343893051,0.229044884443,0.617670714855],
-                        [-0.517485499382,0.331231862307,0.788983047009],
-                        [-0.644004821777,0.28290578723,0.71078979969],
-                        [-0.568519234657,0.19537883997,0.79913264513],
-                        [-0.229044884443,0.617670714855,0.752343893051],
-                        [-0.28290578723,0.71078979969,0.644004821777],
-                        [-0.370268076658,0.599106371403,0.70991063118],
-                        [-0.070090636611,0.793863236904,0.604043483734],
-                        [-0.113409027457,0.863953828812,0.490634441376],
-                        [-0.19537883997,0.79913264513,0.568519234657],
-                        [-0.331231862307,0.788983047009,0.517485499382],
-                        [-0.370602428913,0.846715569496,0.381741464138],
-                        [-0.469374448061,0.759463787079,0.450446814299],
-                        [-0.19537883997,0.79913264513,0.568519234657],
-                        [-0.331231862307,0.788983047009,0.517485499382],
-                        [-0.28290578723,0.71078979969,0.644004821777],
-                        [-0.759463787079,0.450446814299,0.469374448061],
-                        [-0.788983047009,0.517485499382,0.331231862307],
-                        [-0.846715569496,0.381741464138,0.370602428913],
-                        [-0.599106371403,0.70991063118,0.370268076658],
-                        [-0.617670714855,0.752343893051,0.229044884443],
-                        [-0.71078979969,0.644004821777,0.28290578723],
-                        [-0.79913264513,0.568519234657,0.19537883997],
-                        [-0.793863236904,0.604043483734,0.070090636611],
-                        [-0.863953828812,0.490634441376,0.113409027457],
-                        [-0.71078979969,0.644004821777,0.28290578723],
-                        [-0.79913264513,0.568519234657,0.19537883997],
-                        [-0.788983047009,0.517485499382,0.331231862307],
-                        [-0.370268076658,0.599106371403,0.70991063118],
-                        [-0.513375461102,0.5642542243,0.646577775478],
-                        [-0.450446814299,0.469374448061,0.759463787079],
-                        [-0.469374448061,0.759463787079,0.450446814299],
-                        [-0.599106371403,0.70991063118,0.370268076658],
-                        [-0.5642542243,0.646577775478,0.513375461102],
-                        [-0.646577775478,0.513375461102,0.5642542243],
-                        [-0.759463787079,0.450446814299,0.469374448061],
-                        [-0.70991063118,0.370268076658,0.599106371403],
-                        [-0.5642542243,0.646577775478,0.513375461102],
-                        [-0.646577775478,0.513375461102,0.5642542243],
-                        [-0.513375461102,0.5642542243,0.646577775478],
-                        [-0.070090636611,0.793863236904,0.604043483734],
-                        [0.0,0.724504590034,0.689269959927],
-                        [0.070090636611,0.793863236904,0.604043483734],
-                        [-0.229044884443,0.617670714855,0.752343893051],
-                        [-0.16035746038,0.518927633762,0.839642524719],
-                        [-0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0781932324171,0.632596552372,0.770524084568],
-                        [0.16035746038,0.518927633762,0.839642524719],
-                        [0.229044884443,0.617670714855,0.752343893051],
-                        [-0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0,0.724504590034,0.689269959927],
-                        [-0.381741464138,0.370602428913,0.846715569496],
-                        [-0.312772929668,0.253038614988,0.915502369404],
-                        [-0.240536183119,0.389195710421,0.889195740223],
-                        [-0.490634441376,0.113409027457,0.863953828812],
-                        [-0.420543789864,0.0,0.907272219658],
-                        [-0.373140364885,0.120750762522,0.919883430004],
-                        [-0.234579697251,0.126519307494,0.963828444481],
-                        [-0.152696594596,0.0,0.988273143768],
-                        [-0.0801787301898,0.129731908441,0.988302052021],
-                        [-0.373140364885,0.120750762522,0.919883430004],
-                        [-0.234579697251,0.126519307494,0.963828444481],
-                        [-0.312772929668,0.253038614988,0.915502369404],
-                        [0.240536183119,0.389195710421,0.889195740223],
-                        [0.312772929668,0.253038614988,0.915502369404],
-                        [0.381741464138,0.370602428913,0.846715569496],
-                        [0.0801787301898,0.129731908441,0.988302052021],
-                        [0.152696594596,0.0,0.988273143768],
-                        [0.234579697251,0.126519307494,0.963828444481],
-                        [0.373140364885,0.120750762522,0.919883430004],
-                        [0.420543789864,0.0,0.907272219658],
-                        [0.490634441376,0.113409027457,0.863953828812],
-                        [0.234579697251,0.126519307494,0.963828444481],
-                        [0.373140364885,0.120750762522,0.919883430004],
-                        [0.312772929668,0.253038614988,0.915502369404],
-                        [-0.240536183119,0.389195710421,0.889195740223],
-                        [-0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.16035746038,0.518927633762,0.839642524719],
-                        [-0.0801787301898,0.129731908441,0.988302052021],
-                        [0.0801787301898,0.129731908441,0.988302052021],
-                        [0.0,0.266404688358,0.96386128664],
-                        [0.0823235809803,0.39960706234,0.912982463837],
-                        [0.240536183119,0.389195710421,0.889195740223],
-                        [0.16035746038,0.518927633762,0.839642524719],
-                        [0.0,0.266404688358,0.96386128664],
-                        [0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.113409027457,0.863953828812,-0.490634441376],
-                        [-0.120750762522,0.919883430004,-0.373140364885],
-                        [0.0,0.907272219658,-0.420543789864],
-                        [-0.370602428913,0.846715569496,-0.381741464138],
-                        [-0.389195710421,0.889195740223,-0.240536183119],
-                        [-0.253038614988,0.915502369404,-0.312772929668],
-                        [-0.126519307494,0.963828444481,-0.234579697251],
-                        [-0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.0,0.988273143768,-0.152696594596],
-                        [-0.253038614988,0.915502369404,-0.312772929668],
-                        [-0.126519307494,0.963828444481,-0.234579697251],
-                        [-0.120750762522,0.919883430004,-0.373140364885],
-                        [-0.617670714855,0.752343893051,-0.229044884443],
-                        [-0.632596552372,0.770524084568,-0.0781932324171],
-                        [-0.518927633762,0.839642524719,-0.16035746038],
-                        [-0.793863236904,0.604043483734,-0.070090636611],
-                        [-0.793863236904,0.604043483734,0.070090636611],
-                        [-0.724504590034,0.689269959927,0.0],
-                        [-0.632596552372,0.770524084568,0.0781932324171],
-                        [-0.617670714855,0.752343893051,0.229044884443],
-                        [-0.518927633762,0.839642524719,0.16035746038],
-                        [-0.724504590034,0.689269959927,0.0],
-                        [-0.632596552372,0.770524084568,0.0781932324171],
-                        [-0.632596552372,0.770524084568,-0.0781932324171],
-                        [-0.129731908441,0.988302052021,0.0801787301898],
-                        [-0.126519307494,0.963828444481,0.234579697251],
-                        [0.0,0.988273143768,0.152696594596],
-                        [-0.389195710421,0.889195740223,0.240536183119],
-                        [-0.370602428913,0.846715569496,0.381741464138],
-                        [-0.253038614988,0.915502369404,0.312772929668],
-                        [-0.120750762522,0.919883430004,0.373140364885],
-                        [-0.113409027457,0.863953828812,0.490634441376],
-                        [0.0,0.907272219658,0.420543789864],
-                        [-0.253038614988,0.915502369404,0.312772929668],
-                        [-0.120750762522,0.919883430004,0.373140364885],
-                        [-0.126519307494,0.963828444481,0.234579697251],
-                        [-0.518927633762,0.839642524719,-0.16035746038],
-                        [-0.39960706234,0.912982463837,-0.0823235809803],
-                        [-0.389195710421,0.889195740223,-0.240536183119],
-                        [-0.518927633762,0.839642524719,0.16035746038],
-                        [-0.389195710421,0.889195740223,0.240536183119],
-                        [-0.39960706234,0.912982463837,0.0823235809803],
-                        [-0.266404688358,0.96386128664,0.0],
-                        [-0.129731908441,0.988302052021,0.0801787301898],
-                        [-0.129731908441,0.988302052021,-0.0801787301898],
-                        [-0.39960706234,0.912982463837,0.0823235809803],
-                        [-0.266404688358,0.96386128664,0.0],
-                        [-0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.604043483734,0.070090636611,-0.793863236904],
-                        [0.689269959927,0.0,-0.724504590034],
-                        [0.604043483734,-0.070090636611,-0.793863236904],
-                        [0.752343893051,0.229044884443,-0.617670714855],
-                        [0.839642524719,0.16035746038,-0.518927633762],
-                        [0.770524084568,0.0781932324171,-0.632596552372],
-                        [0.770524084568,-0.0781932324171,-0.632596552372],
-                        [0.839642524719,-0.16035746038,-0.518927633762],
-                        [0.752343893051,-0.229044884443,-0.617670714855],
-                        [0.770524084568,0.0781932324171,-0.632596552372],
-                        [0.770524084568,-0.0781932324171,-0.632596552372],
-                        [0.689269959927,0.0,-0.724504590034],
-                        [0.846715569496,0.381741464138,-0.370602428913],
-                        [0.915502369404,0.312772929668,-0.253038614988],
-                        [0.889195740223,0.240536183119,-0.389195710421],
-                        [0.863953828812,0.490634441376,-0.113409027457],
-                        [0.907272219658,0.420543789864,0.0],
-                        [0.919883430004,0.373140364885,-0.120750762522],
-                        [0.963828444481,0.234579697251,-0.126519307494],
-                        [0.988273143768,0.152696594596,0.0],
-                        [0.988302052021,0.0801787301898,-0.129731908441],
-                        [0.919883430004,0.373140364885,-0.120750762522],
-                        [0.963828444481,0.234579697251,-0.126519307494],
-                        [0.915502369404,0.312772929668,-0.253038614988],
-                        [0.889195740223,-0.240536183119,-0.389195710421],
-                        [0.915502369404,-0.312772929668,-0.253038614988],
-                        [0.846715569496,-0.381741464138,-0.370602428913],
-                        [0.988302052021,-0.0801787301898,-0.129731908441],
-                        [0.988273143768,-0.152696594596,0.0],
-                        [0.963828444481,-0.234579697251,-0.126519307494],
-                        [0.919883430004,-0.373140364885,-0.120750762522],
-                        [0.907272219658,-0.420543789864,0.0],
-                        [0.863953828812,-0.490634441376,-0.113409027457],
-                        [0.963828444481,-0.234579697251,-0.126519307494],
-                        [0.919883430004,-0.373140364885,-0.120750762522],
-                        [0.915502369404,-0.312772929668,-0.253038614988],
-                        [0.889195740223,0.240536183119,-0.389195710421],
-                        [0.912982463837,0.0823235809803,-0.39960706234],
-                        [0.839642524719,0.16035746038,-0.518927633762],
-                        [0.988302052021,0.0801787301898,-0.129731908441],
-                        [0.988302052021,-0.0801787301898,-0.129731908441],
-                        [0.96386128664,0.0,-0.266404688358],
-                        [0.912982463837,-0.0823235809803,-0.39960706234],
-                        [0.889195740223,-0.240536183119,-0.389195710421],
-                        [0.839642524719,-0.16035746038,-0.518927633762],
-                        [0.96386128664,0.0,-0.266404688358],
-                        [0.912982463837,-0.0823235809803,-0.39960706234],
-                        [0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.82464236021,-0.564633131027,0.0339771322906],
-                        [-0.79582041502,-0.605532705784,0.0],
-                        [-0.82464236021,-0.564633131027,-0.0339771322906],
-                        [-0.757922053337,-0.643326640129,0.108097285032],
-                        [-0.722495436668,-0.687358558178,0.0744211226702],
-                        [-0.761889100075,-0.646693944931,0.0362210273743],
-                        [-0.761889100075,-0.646693944931,-0.0362210273743],
-                        [-0.722495436668,-0.687358558178,-0.0744211226702],
-                        [-0.757922053337,-0.643326640129,-0.108097285032],
-                        [-0.761889100075,-0.646693944931,0.0362210273743],
-                        [-0.761889100075,-0.646693944931,-0.0362210273743],
-                        [-0.79582041502,-0.605532705784,0.0],
-                        [-0.669747889042,-0.718357801437,0.188148602843],
-                        [-0.62687343359,-0.763553202152,0.154971644282],
-                        [-0.677466154099,-0.726636230946,0.114190116525],
-                        [-0.560828924179,-0.782811582088,0.269586592913],
-                        [-0.510783493519,-0.826465010643,0.236761152744],
-                        [-0.571085453033,-0.797127783298,0.196083456278],
-                        [-0.578244268894,-0.807120084763,0.119124859571],
-                        [-0.524005174637,-0.847858190536,0.0809632539749],
-                        [-0.581926107407,-0.81225925684,0.0399611219764],
-                        [-0.571085453033,-0.797127783298,0.196083456278],
-                        [-0.578244268894,-0.807120084763,0.119124859571],
-                        [-0.62687343359,-0.763553202152,0.154971644282],
-                        [-0.677466154099,-0.726636230946,-0.114190116525],
-                        [-0.62687343359,-0.763553202152,-0.154971644282],
-                        [-0.669747889042,-0.718357801437,-0.188148602843],
-                        [-0.581926107407,-0.81225925684,-0.0399611219764],
-                        [-0.524005174637,-0.847858190536,-0.0809632539749],
-                        [-0.578244268894,-0.807120084763,-0.119124859571],
-                        [-0.571085453033,-0.797127783298,-0.196083456278],
-                        [-0.510783493519,-0.826465010643,-0.236761152744],
-                        [-0.560828924179,-0.782811582088,-0.269586592913],
-                        [-0.578244268894,-0.807120084763,-0.119124859571],
-                        [-0.571085453033,-0.797127783298,-0.196083456278],
-                        [-0.62687343359,-0.763553202152,-0.154971644282],
-                        [-0.677466154099,-0.726636230946,0.114190116525],
-                        [-0.68142670393,-0.730884253979,0.0382858961821],
-                        [-0.722495436668,-0.687358558178,0.0744211226702],
-                        [-0.581926107407,-0.81225925684,0.0399611219764],
-                        [-0.581926107407,-0.81225925684,-0.0399611219764],
-                        [-0.634539365768,-0.772890508175,0.0],
-                        [-0.68142670393,-0.730884253979,-0.0382858961821],
-                        [-0.677466154099,-0.726636230946,-0.114190116525],
-                        [-0.722495436668,-0.687358558178,-0.0744211226702],
-                        [-0.634539365768,-0.772890508175,0.0],
-                        [-0.68142670393,-0.730884253979,-0.0382858961821],
-                        [-0.68142670393,-0.730884253979,0.0382858961821],
-                        [-0.436200261116,-0.830415487289,0.346611320972],
-                        [-0.380723625422,-0.869839549065,0.313733518124],
-                        [-0.446935534477,-0.85085272789,0.276221334934],
-                        [-0.3044308424,-0.857896447182,0.413926929235],
-                        [-0.246351331472,-0.891307473183,0.380633711815],
-                        [-0.313436716795,-0.883275330067,0.348686188459],
-                        [-0.321246802807,-0.905284404755,0.277958005667],
-                        [-0.258633822203,-0.935745954514,0.239766731858],
-                        [-0.327503234148,-0.922915279865,0.202408134937],
-                        [-0.313436716795,-0.883275330067,0.348686188459],
-                        [-0.321246802807,-0.905284404755,0.277958005667],
-                        [-0.380723625422,-0.869839549065,0.313733518124],
-                        [-0.174905076623,-0.866019308567,0.468421578407],
-                        [-0.117213711143,-0.892938017845,0.434652328491],
-                        [-0.180623859167,-0.894335091114,0.409316182137],
-                        [-0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.0,-0.8796184659,0.475679844618],
-                        [-0.0568443164229,-0.887796461582,0.456712335348],
-                        [-0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0,-0.932827115059,0.360324263573],
-                        [-0.0602079555392,-0.940329909325,0.334895044565],
-                        [-0.0568443164229,-0.887796461582,0.456712335348],
-                        [-0.0586068555713,-0.915323853493,0.398431301117],
-                        [-0.117213711143,-0.892938017845,0.434652328491],
-                        [-0.193975359201,-0.960443258286,0.199805602431],
-                        [-0.128498718143,-0.978907585144,0.158833146095],
-                        [-0.196501940489,-0.97295331955,0.121444880962],
-                        [-0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0,-0.974178731441,0.225778326392],
-                        [-0.0626873448491,-0.979053080082,0.193714544177],
-                        [-0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0,-0.997029185295,0.0770247355103],
-                        [-0.0638479366899,-0.997179210186,0.0394601933658],
-                        [-0.0626873448491,-0.979053080082,0.193714544177],
-                        [-0.0634539350867,-0.991025745869,0.117650069296],
-                        [-0.128498718143,-0.978907585144,0.158833146095],
-                        [-0.180623859167,-0.894335091114,0.409316182137],
-                        [-0.185843646526,-0.920180141926,0.34457308054],
-                        [-0.246351331472,-0.891307473183,0.380633711815],
-                        [-0.0602079555392,-0.940329909325,0.334895044565],
-                        [-0.0615878328681,-0.961880862713,0.266443610191],
-                        [-0.123895764351,-0.943842172623,0.306287169456],
-                        [-0.190361812711,-0.942551255226,0.274516820908],
-                        [-0.193975359201,-0.960443258286,0.199805602431],
-                        [-0.258633822203,-0.935745954514,0.239766731858],
-                        [-0.123895764351,-0.943842172623,0.306287169456],
-                        [-0.190361812711,-0.942551255226,0.274516820908],
-                        [-0.185843646526,-0.920180141926,0.34457308054],
-                        [-0.446935534477,-0.85085272789,-0.276221334934],
-                        [-0.380723625422,-0.869839549065,-0.313733518124],
-                        [-0.436200261116,-0.830415487289,-0.346611320972],
-                        [-0.327503234148,-0.922915279865,-0.202408134937],
-                        [-0.258633822203,-0.935745954514,-0.239766731858],
-                        [-0.321246802807,-0.905284404755,-0.277958005667],
-                        [-0.313436716795,-0.883275330067,-0.348686188459],
-                        [-0.246351331472,-0.891307473183,-0.380633711815],
-                        [-0.3044308424,-0.857896447182,-0.413926929235],
-                        [-0.321246802807,-0.905284404755,-0.277958005667],
-                        [-0.313436716795,-0.883275330067,-0.348686188459],
-                        [-0.380723625422,-0.869839549065,-0.313733518124],
-                        [-0.196501940489,-0.97295331955,-0.121444880962],
-                        [-0.128498718143,-0.978907585144,-0.158833146095],
-                        [-0.193975359201,-0.960443258286,-0.199805602431],
-                        [-0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0,-0.997029185295,-0.0770247355103],
-                        [-0.0634539350867,-0.991025745869,-0.117650069296],
-                        [-0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0,-0.974178731441,-0.225778326392],
-                        [-0.0615878328681,-0.961880862713,-0.266443610191],
-                        [-0.0634539350867,-0.991025745869,-0.117650069296],
-                        [-0.0626873448491,-0.979053080082,-0.193714544177],
-                        [-0.128498718143,-0.978907585144,-0.158833146095],
-                        [-0.180623859167,-0.894335091114,-0.409316182137],
-                        [-0.117213711143,-0.892938017845,-0.434652328491],
-                        [-0.174905076623,-0.866019308567,-0.468421578407],
-                        [-0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0,-0.932827115059,-0.360324263573],
-                        [-0.0586068555713,-0.915323853493,-0.398431301117],
-                        [-0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0,-0.8796184659,-0.475679844618],
-                        [-0.0549761541188,-0.858619451523,-0.509656965733],
-                        [-0.0586068555713,-0.915323853493,-0.398431301117],
-                        [-0.0568443164229,-0.887796461582,-0.456712335348],
-                        [-0.117213711143,-0.892938017845,-0.434652328491],
-                        [-0.193975359201,-0.960443258286,-0.199805602431],
-                        [-0.190361812711,-0.942551255226,-0.274516820908],
-                        [-0.258633822203,-0.935745954514,-0.239766731858],
-                        [-0.0615878328681,-0.961880862713,-0.266443610191],
-                        [-0.0602079555392,-0.940329909325,-0.334895044565],
-                        [-0.123895764351,-0.943842172623,-0.306287169456],
-                        [-0.185843646526,-0.920180141926,-0.34457308054],
-                        [-0.180623859167,-0.894335091114,-0.409316182137],
-                        [-0.246351331472,-0.891307473183,-0.380633711815],
-                        [-0.123895764351,-0.943842172623,-0.306287169456],
-                        [-0.185843646526,-0.920180141926,-0.34457308054],
-                        [-0.190361812711,-0.942551255226,-0.274516820908],
-                        [-0.446935534477,-0.85085272789,0.276221334934],
-                        [-0.455528259277,-0.867211103439,0.20109423995],
-                        [-0.510783493519,-0.826465010643,0.236761152744],
-                        [-0.327503234148,-0.922915279865,0.202408134937],
-                        [-0.33188316226,-0.935258030891,0.123069040477],
-                        [-0.395605653524,-0.903840482235,0.162998497486],
-                        [-0.461539924145,-0.878655850887,0.122248865664],
-                        [-0.464636415243,-0.88455080986,0.0410230122507],
-                        [-0.524005174637,-0.847858190536,0.0809632539749],
-                        [-0.395605653524,-0.903840482235,0.162998497486],
-                        [-0.461539924145,-0.878655850887,0.122248865664],
-                        [-0.455528259277,-0.867211103439,0.20109423995],
-                        [-0.196501940489,-0.97295331955,0.121444880962],
-                        [-0.197802826762,-0.979394435883,0.0407496243715],
-                        [-0.265506535769,-0.960611641407,0.0820460245013],
-                        [-0.0638479366899,-0.997179210186,0.0394601933658],
-                        [-0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [-0.130150929093,-0.991494178772,0.0],
-                        [-0.197802826762,-0.979394435883,-0.0407496243715],
-                        [-0.196501940489,-0.97295331955,-0.121444880962],
-                        [-0.265506535769,-0.960611641407,-0.0820460245013],
-                        [-0.130150929093,-0.991494178772,0.0],
-                        [-0.197802826762,-0.979394435883,-0.0407496243715],
-                        [-0.197802826762,-0.979394435883,0.0407496243715],
-                        [-0.464636415243,-0.88455080986,-0.0410230122507],
-                        [-0.461539924145,-0.878655850887,-0.122248865664],
-                        [-0.524005174637,-0.847858190536,-0.0809632539749],
-                        [-0.33188316226,-0.935258030891,-0.123069040477],
-                        [-0.327503234148,-0.922915279865,-0.202408134937],
-                        [-0.395605653524,-0.903840482235,-0.162998497486],
-                        [-0.455528259277,-0.867211103439,-0.20109423995],
-                        [-0.446935534477,-0.85085272789,-0.276221334934],
-                        [-0.510783493519,-0.826465010643,-0.236761152744],
-                        [-0.395605653524,-0.903840482235,-0.162998497486],
-                        [-0.455528259277,-0.867211103439,-0.20109423995],
-                        [-0.461539924145,-0.878655850887,-0.122248865664],
-                        [-0.265506535769,-0.960611641407,0.0820460245013],
-                        [-0.334140062332,-0.941618084908,0.04130198434],
-                        [-0.33188316226,-0.935258030891,0.123069040477],
-                        [-0.265506535769,-0.960611641407,-0.0820460245013],
-                        [-0.33188316226,-0.935258030891,-0.123069040477],
-                        [-0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.400968074799,-0.916092038155,0.0],
-                        [-0.464636415243,-0.88455080986,-0.0410230122507],
-                        [-0.464636415243,-0.88455080986,0.0410230122507],
-                        [-0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.400968074799,-0.916092038155,0.0],
-                        [-0.334140062332,-0.941618084908,0.04130198434],
-                        [-0.509656965733,-0.0549761541188,0.858619451523],
-                        [-0.548688352108,-0.091976031661,0.830952167511],
-                        [-0.564633131027,-0.0339771322906,0.82464236021],
-                        [-0.468421578407,-0.174905076623,0.866019308567],
-                        [-0.506734728813,-0.217834427953,0.834127128124],
-                        [-0.529480218887,-0.153434738517,0.834331154823],
-                        [-0.588087081909,-0.131048902869,0.798110127449],
-                        [-0.627150595188,-0.171839639544,0.759706020355],
-                        [-0.643326640129,-0.108097285032,0.757922053337],
-                        [-0.529480218887,-0.153434738517,0.834331154823],
-                        [-0.588087081909,-0.131048902869,0.798110127449],
-                        [-0.548688352108,-0.091976031661,0.830952167511],
-                        [-0.413926929235,-0.3044308424,0.857896447182],
-                        [-0.450116455555,-0.352179646492,0.820587992668],
-                        [-0.480284929276,-0.284414708614,0.829719662666],
-                        [-0.346611320972,-0.436200261116,0.830415487289],
-                        [-0.379529476166,-0.486395716667,0.787004828453],
-                        [-0.416404157877,-0.419940322638,0.806385576725],
-                        [-0.485873311758,-0.400663375854,0.776785671711],
-                        [-0.520354926586,-0.44894811511,0.726413309574],
-                        [-0.553625464439,-0.378517180681,0.74177056551],
-                        [-0.416404157877,-0.419940322638,0.806385576725],
-                        [-0.485873311758,-0.400663375854,0.776785671711],
-                        [-0.450116455555,-0.352179646492,0.820587992668],
-                        [-0.665048420429,-0.213841319084,0.715529501438],
-                        [-0.700865805149,-0.256401896477,0.665616393089],
-                        [-0.718357801437,-0.188148602843,0.669747889042],
-                        [-0.618283927441,-0.353819847107,0.701809465885],
-                        [-0.65135627985,-0.398910075426,0.645450055599],
-                        [-0.678621411324,-0.327040165663,0.657660841942],
-                        [-0.733673810959,-0.298754066229,0.610302150249],
-                        [-0.762617051601,-0.340069264174,0.550243675709],
-                        [-0.782811582088,-0.269586592913,0.560828924179],
-                        [-0.678621411324,-0.327040165663,0.657660841942],
-                        [-0.733673810959,-0.298754066229,0.610302150249],
-                        [-0.700865805149,-0.256401896477,0.665616393089],
-                        [-0.480284929276,-0.284414708614,0.829719662666],
-                        [-0.545040607452,-0.26241543889,0.796284377575],
-                        [-0.506734728813,-0.217834427953,0.834127128124],
-                        [-0.553625464439,-0.378517180681,0.74177056551],
-                        [-0.618283927441,-0.353819847107,0.701809465885],
-                        [-0.582528710365,-0.308011889458,0.752189457417],
-                        [-0.606988489628,-0.238753452897,0.757998526096],
-                        [-0.665048420429,-0.213841319084,0.715529501438],
-                        [-0.627150595188,-0.171839639544,0.759706020355],
-                        [-0.582528710365,-0.308011889458,0.752189457417],
-                        [-0.606988489628,-0.238753452897,0.757998526096],
-                        [-0.545040607452,-0.26241543889,0.796284377575],
-                        [-0.269586592913,-0.560828924179,0.782811582088],
-                        [-0.298754066229,-0.610302150249,0.733673810959],
-                        [-0.340069264174,-0.550243675709,0.762617051601],
-                        [-0.188148602843,-0.669747889042,0.718357801437],
-                        [-0.213841319084,-0.715529501438,0.665048420429],
-                        [-0.256401896477,-0.665616393089,0.700865805149],
-                        [-0.327040165663,-0.657660841942,0.678621411324],
-                        [-0.353819847107,-0.701809465885,0.618283927441],
-                        [-0.398910075426,-0.645450055599,0.65135627985],
-                        [-0.256401896477,-0.665616393089,0.700865805149],
-                        [-0.327040165663,-0.657660841942,0.678621411324],
-                        [-0.298754066229,-0.610302150249,0.733673810959],
-                        [-0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.131048902869,-0.798110127449,0.588087081909],
-                        [-0.171839639544,-0.759706020355,0.627150595188],
-                        [-0.0339771322906,-0.82464236021,0.564633131027],
-                        [-0.0549761541188,-0.858619451523,0.509656965733],
-                        [-0.091976031661,-0.830952167511,0.548688352108],
-                        [-0.153434738517,-0.834331154823,0.529480218887],
-                        [-0.174905076623,-0.866019308567,0.468421578407],
-                        [-0.217834427953,-0.834127128124,0.506734728813],
-                        [-0.091976031661,-0.830952167511,0.548688352108],
-                        [-0.153434738517,-0.834331154823,0.529480218887],
-                        [-0.131048902869,-0.798110127449,0.588087081909],
-                        [-0.378517180681,-0.74177056551,0.553625464439],
-                        [-0.400663375854,-0.776785671711,0.485873311758],
-                        [-0.44894811511,-0.726413309574,0.520354926586],
-                        [-0.284414708614,-0.829719662666,0.480284929276],
-                        [-0.3044308424,-0.857896447182,0.413926929235],
-                        [-0.352179646492,-0.820587992668,0.450116455555],
-                        [-0.419940322638,-0.806385576725,0.416404157877],
-                        [-0.436200261116,-0.830415487289,0.346611320972],
-                        [-0.486395716667,-0.787004828453,0.379529476166],
-                        [-0.352179646492,-0.820587992668,0.450116455555],
-                        [-0.419940322638,-0.806385576725,0.416404157877],
-                        [-0.400663375854,-0.776785671711,0.485873311758],
-                        [-0.171839639544,-0.759706020355,0.627150595188],
-                        [-0.238753452897,-0.757998526096,0.606988489628],
-                        [-0.213841319084,-0.715529501438,0.665048420429],
-                        [-0.217834427953,-0.834127128124,0.506734728813],
-                        [-0.284414708614,-0.829719662666,0.480284929276],
-                        [-0.26241543889,-0.796284377575,0.545040607452],
-                        [-0.308011889458,-0.752189457417,0.582528710365],
-                        [-0.378517180681,-0.74177056551,0.553625464439],
-                        [-0.353819847107,-0.701809465885,0.618283927441],
-                        [-0.26241543889,-0.796284377575,0.545040607452],
-                        [-0.308011889458,-0.752189457417,0.582528710365],
-                        [-0.238753452897,-0.757998526096,0.606988489628],
-                        [-0.787004828453,-0.379529476166,0.486395716667],
-                        [-0.806385576725,-0.416404157877,0.419940322638],
-                        [-0.830415487289,-0.346611320972,0.436200261116],
-                        [-0.726413309574,-0.520354926586,0.44894811511],
-                        [-0.74177056551,-0.553625464439,0.378517180681],
-                        [-0.776785671711,-0.485873311758,0.400663375854],
-                        [-0.820587992668,-0.450116455555,0.352179646492],
-                        [-0.829719662666,-0.480284929276,0.284414708614],
-                        [-0.857896447182,-0.413926929235,0.3044308424],
-                        [-0.776785671711,-0.485873311758,0.400663375854],
-                        [-0.820587992668,-0.450116455555,0.352179646492],
-                        [-0.806385576725,-0.416404157877,0.419940322638],
-                        [-0.645450055599,-0.65135627985,0.398910075426],
-                        [-0.657660841942,-0.678621411324,0.327040165663],
-                        [-0.701809465885,-0.618283927441,0.353819847107],
-                        [-0.550243675709,-0.762617051601,0.340069264174],
-                        [-0.560828924179,-0.782811582088,0.269586592913],
-                        [-0.610302150249,-0.733673810959,0.298754066229],
-                        [-0.665616393089,-0.700865805149,0.256401896477],
-                        [-0.669747889042,-0.718357801437,0.188148602843],
-                        [-0.715529501438,-0.665048420429,0.213841319084],
-                        [-0.610302150249,-0.733673810959,0.298754066229],
-                        [-0.665616393089,-0.700865805149,0.256401896477],
-                        [-0.657660841942,-0.678621411324,0.327040165663],
-                        [-0.834127128124,-0.506734728813,0.217834427953],
-                        [-0.834331154823,-0.529480218887,0.153434738517],
-                        [-0.866019308567,-0.468421578407,0.174905076623],
-                        [-0.759706020355,-0.627150595188,0.171839639544],
-                        [-0.757922053337,-0.643326640129,0.108097285032],
-                        [-0.798110127449,-0.588087081909,0.131048902869],
-                        [-0.830952167511,-0.548688352108,0.091976031661],
-                        [-0.82464236021,-0.564633131027,0.0339771322906],
-                        [-0.858619451523,-0.509656965733,0.0549761541188],
-                        [-0.798110127449,-0.588087081909,0.131048902869],
-                        [-0.830952167511,-0.548688352108,0.091976031661],
-                        [-0.834331154823,-0.529480218887,0.153434738517],
-                        [-0.701809465885,-0.618283927441,0.353819847107],
-                        [-0.752189457417,-0.582528710365,0.308011889458],
-                        [-0.74177056551,-0.553625464439,0.378517180681],
-                        [-0.715529501438,-0.665048420429,0.213841319084],
-                        [-0.759706020355,-0.627150595188,0.171839639544],
-                        [-0.757998526096,-0.606988489628,0.238753452897],
-                        [-0.796284377575,-0.545040607452,0.26241543889],
-                        [-0.834127128124,-0.506734728813,0.217834427953],
-                        [-0.829719662666,-0.480284929276,0.284414708614],
-                        [-0.757998526096,-0.606988489628,0.238753452897],
-                        [-0.796284377575,-0.545040607452,0.26241543889],
-                        [-0.752189457417,-0.582528710365,0.308011889458],
-                        [-0.340069264174,-0.550243675709,0.762617051601],
-                        [-0.411682873964,-0.535965919495,0.737060189247],
-                        [-0.379529476166,-0.486395716667,0.787004828453],
-                        [-0.398910075426,-0.645450055599,0.65135627985],
-                        [-0.470621615648,-0.628728508949,0.619044244289],
-                        [-0.44230055809,-0.58378881216,0.680853009224],
-                        [-0.483050197363,-0.517854511738,0.706037700176],
-                        [-0.552667617798,-0.495975226164,0.669751524925],
-                        [-0.520354926586,-0.44894811511,0.726413309574],
-                        [-0.44230055809,-0.58378881216,0.680853009224],
-                        [-0.483050197363,-0.517854511738,0.706037700176],
-                        [-0.411682873964,-0.535965919495,0.737060189247],
-                        [-0.44894811511,-0.726413309574,0.520354926586],
-                        [-0.517854511738,-0.706037700176,0.483050197363],
-                        [-0.495975226164,-0.669751524925,0.552667617798],
-                        [-0.486395716667,-0.787004828453,0.379529476166],
-                        [-0.550243675709,-0.762617051601,0.340069264174],
-                        [-0.535965919495,-0.737060189247,0.411682873964],
-                        [-0.58378881216,-0.680853009224,0.44230055809],
-                        [-0.645450055599,-0.65135627985,0.398910075426],
-                        [-0.628728508949,-0.619044244289,0.470621615648],
-                        [-0.535965919495,-0.737060189247,0.411682873964],
-                        [-0.58378881216,-0.680853009224,0.44230055809],
-                        [-0.517854511738,-0.706037700176,0.483050197363],
-                        [-0.619044244289,-0.470621615648,0.628728508949],
-                        [-0.680853009224,-0.44230055809,0.58378881216],
-                        [-0.65135627985,-0.398910075426,0.645450055599],
-                        [-0.669751524925,-0.552667617798,0.495975226164],
-                        [-0.726413309574,-0.520354926586,0.44894811511],
-                        [-0.706037700176,-0.483050197363,0.517854511738],
-                        [-0.737060189247,-0.411682873964,0.535965919495],
-                        [-0.787004828453,-0.379529476166,0.486395716667],
-                        [-0.762617051601,-0.340069264174,0.550243675709],
-                        [-0.706037700176,-0.483050197363,0.517854511738],
-                        [-0.737060189247,-0.411682873964,0.535965919495],
-                        [-0.680853009224,-0.44230055809,0.58378881216],
-                        [-0.495975226164,-0.669751524925,0.552667617798],
-                        [-0.540649950504,-0.607478022575,0.581951975822],
-                        [-0.470621615648,-0.628728508949,0.619044244289],
-                        [-0.628728508949,-0.619044244289,0.470621615648],
-                        [-0.669751524925,-0.552667617798,0.495975226164],
-                        [-0.607478022575,-0.581951975822,0.540649950504],
-                        [-0.581951975822,-0.540649950504,0.607478022575],
-                        [-0.619044244289,-0.470621615648,0.628728508949],
-                        [-0.552667617798,-0.495975226164,0.669751524925],
-                        [-0.607478022575,-0.581951975822,0.540649950504],
-                        [-0.581951975822,-0.540649950504,0.607478022575],
-                        [-0.540649950504,-0.607478022575,0.581951975822],
-                        [-0.0339771322906,-0.82464236021,0.564633131027],
-                        [0.0,-0.79582041502,0.605532705784],
-                        [0.0339771322906,-0.82464236021,0.564633131027],
-                        [-0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.0744211226702,-0.722495436668,0.687358558178],
-                        [-0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0744211226702,-0.722495436668,0.687358558178],
-                        [0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0,-0.79582041502,0.605532705784],
-                        [-0.188148602843,-0.669747889042,0.718357801437],
-                        [-0.154971644282,-0.62687343359,0.763553202152],
-                        [-0.114190116525,-0.677466154099,0.726636230946],
-                        [-0.269586592913,-0.560828924179,0.782811582088],
-                        [-0.236761152744,-0.510783493519,0.826465010643],
-                        [-0.196083456278,-0.571085453033,0.797127783298],
-                        [-0.119124859571,-0.578244268894,0.807120084763],
-                        [-0.0809632539749,-0.524005174637,0.847858190536],
-                        [-0.0399611219764,-0.581926107407,0.81225925684],
-                        [-0.196083456278,-0.571085453033,0.797127783298],
-                        [-0.119124859571,-0.578244268894,0.807120084763],
-                        [-0.154971644282,-0.62687343359,0.763553202152],
-                        [0.114190116525,-0.677466154099,0.726636230946],
-                        [0.154971644282,-0.62687343359,0.763553202152],
-                        [0.188148602843,-0.669747889042,0.718357801437],
-                        [0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0809632539749,-0.524005174637,0.847858190536],
-                        [0.119124859571,-0.578244268894,0.807120084763],
-                        [0.196083456278,-0.571085453033,0.797127783298],
-                        [0.236761152744,-0.510783493519,0.826465010643],
-                        [0.269586592913,-0.560828924179,0.782811582088],
-                        [0.119124859571,-0.578244268894,0.807120084763],
-                        [0.196083456278,-0.571085453033,0.797127783298],
-                        [0.154971644282,-0.62687343359,0.763553202152],
-                        [-0.114190116525,-0.677466154099,0.726636230946],
-                        [-0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.0744211226702,-0.722495436668,0.687358558178],
-                        [-0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0,-0.634539365768,0.772890508175],
-                        [0.0382858961821,-0.68142670393,0.730884253979],
-                        [0.114190116525,-0.677466154099,0.726636230946],
-                        [0.0744211226702,-0.722495436668,0.687358558178],
-                        [0.0,-0.634539365768,0.772890508175],
-                        [0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.346611320972,-0.436200261116,0.830415487289],
-                        [-0.313733518124,-0.380723625422,0.869839549065],
-                        [-0.276221334934,-0.446935534477,0.85085272789],
-                        [-0.413926929235,-0.3044308424,0.857896447182],
-                        [-0.380633711815,-0.246351331472,0.891307473183],
-                        [-0.348686188459,-0.313436716795,0.883275330067],
-                        [-0.277958005667,-0.321246802807,0.905284404755],
-                        [-0.239766731858,-0.258633822203,0.935745954514],
-                        [-0.202408134937,-0.327503234148,0.922915279865],
-                        [-0.348686188459,-0.313436716795,0.883275330067],
-                        [-0.277958005667,-0.321246802807,0.905284404755],
-                        [-0.313733518124,-0.380723625422,0.869839549065],
-                        [-0.468421578407,-0.174905076623,0.866019308567],
-                        [-0.434652328491,-0.117213711143,0.892938017845],
-                        [-0.409316182137,-0.180623859167,0.894335091114],
-                        [-0.509656965733,-0.0549761541188,0.858619451523],
-                        [-0.475679844618,0.0,0.8796184659],
-                        [-0.456712335348,-0.0568443164229,0.887796461582],
-                        [-0.398431301117,-0.0586068555713,0.915323853493],
-                        [-0.360324263573,0.0,0.932827115059],
-                        [-0.334895044565,-0.0602079555392,0.940329909325],
-                        [-0.456712335348,-0.0568443164229,0.887796461582],
-                        [-0.398431301117,-0.0586068555713,0.915323853493],
-                        [-0.434652328491,-0.117213711143,0.892938017845],
-                        [-0.199805602431,-0.193975359201,0.960443258286],
-                        [-0.158833146095,-0.128498718143,0.978907585144],
-                        [-0.121444880962,-0.196501940489,0.97295331955],
-                        [-0.266443610191,-0.0615878328681,0.961880862713],
-                        [-0.225778326392,0.0,0.974178731441],
-                        [-0.193714544177,-0.0626873448491,0.979053080082],
-                        [-0.117650069296,-0.0634539350867,0.991025745869],
-                        [-0.0770247355103,0.0,0.997029185295],
-                        [-0.0394601933658,-0.0638479366899,0.997179210186],
-                        [-0.193714544177,-0.0626873448491,0.979053080082],
-                        [-0.117650069296,-0.0634539350867,0.991025745869],
-                        [-0.158833146095,-0.128498718143,0.978907585144],
-                        [-0.409316182137,-0.180623859167,0.894335091114],
-                        [-0.34457308054,-0.185843646526,0.920180141926],
-                        [-0.380633711815,-0.246351331472,0.891307473183],
-                        [-0.334895044565,-0.0602079555392,0.940329909325],
-                        [-0.266443610191,-0.0615878328681,0.961880862713],
-                        [-0.306287169456,-0.123895764351,0.943842172623],
-                        [-0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.199805602431,-0.193975359201,0.960443258286],
-                        [-0.239766731858,-0.258633822203,0.935745954514],
-                        [-0.306287169456,-0.123895764351,0.943842172623],
-                        [-0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.34457308054,-0.185843646526,0.920180141926],
-                        [0.276221334934,-0.446935534477,0.85085272789],
-                        [0.313733518124,-0.380723625422,0.869839549065],
-                        [0.346611320972,-0.436200261116,0.830415487289],
-                        [0.202408134937,-0.327503234148,0.922915279865],
-                        [0.239766731858,-0.258633822203,0.935745954514],
-                        [0.277958005667,-0.321246802807,0.905284404755],
-                        [0.348686188459,-0.313436716795,0.883275330067],
-                        [0.380633711815,-0.246351331472,0.891307473183],
-                        [0.413926929235,-0.3044308424,0.857896447182],
-                        [0.277958005667,-0.321246802807,0.905284404755],
-                        [0.348686188459,-0.313436716795,0.883275330067],
-                        [0.313733518124,-0.380723625422,0.869839549065],
-                        [0.121444880962,-0.196501940489,0.97295331955],
-                        [0.158833146095,-0.128498718143,0.978907585144],
-                        [0.199805602431,-0.193975359201,0.960443258286],
-                        [0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0770247355103,0.0,0.997029185295],
-                        [0.117650069296,-0.0634539350867,0.991025745869],
-                        [0.193714544177,-0.0626873448491,0.979053080082],
-                        [0.225778326392,0.0,0.974178731441],
-                        [0.266443610191,-0.0615878328681,0.961880862713],
-                        [0.117650069296,-0.0634539350867,0.991025745869],
-                        [0.193714544177,-0.0626873448491,0.979053080082],
-                        [0.158833146095,-0.128498718143,0.978907585144],
-                        [0.409316182137,-0.180623859167,0.894335091114],
-                        [0.434652328491,-0.117213711143,0.892938017845],
-                        [0.468421578407,-0.174905076623,0.866019308567],
-                        [0.334895044565,-0.0602079555392,0.940329909325],
-                        [0.360324263573,0.0,0.932827115059],
-                        [0.398431301117,-0.0586068555713,0.915323853493],
-                        [0.456712335348,-0.0568443164229,0.887796461582],
-                        [0.475679844618,0.0,0.8796184659],
-                        [0.509656965733,-0.0549761541188,0.858619451523],
-                        [0.398431301117,-0.0586068555713,0.915323853493],
-                        [0.456712335348,-0.0568443164229,0.887796461582],
-                        [0.434652328491,-0.117213711143,0.892938017845],
-                        [0.199805602431,-0.193975359201,0.960443258286],
-                        [0.274516820908,-0.190361812711,0.942551255226],
-                        [0.239766731858,-0.258633822203,0.935745954514],
-                        [0.266443610191,-0.0615878328681,0.961880862713],
-                        [0.334895044565,-0.0602079555392,0.940329909325],
-                        [0.306287169456,-0.123895764351,0.943842172623],
-                        [0.34457308054,-0.185843646526,0.920180141926],
-                        [0.409316182137,-0.180623859167,0.894335091114],
-                        [0.380633711815,-0.246351331472,0.891307473183],
-                        [0.306287169456,-0.123895764351,0.943842172623],
-                        [0.34457308054,-0.185843646526,0.920180141926],
-                        [0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.276221334934,-0.446935534477,0.85085272789],
-                        [-0.20109423995,-0.455528259277,0.867211103439],
-                        [-0.236761152744,-0.510783493519,0.826465010643],
-                        [-0.202408134937,-0.327503234148,0.922915279865],
-                        [-0.123069040477,-0.33188316226,0.935258030891],
-                        [-0.162998497486,-0.395605653524,0.903840482235],
-                        [-0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.0410230122507,-0.464636415243,0.88455080986],
-                        [-0.0809632539749,-0.524005174637,0.847858190536],
-                        [-0.162998497486,-0.395605653524,0.903840482235],
-                        [-0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.20109423995,-0.455528259277,0.867211103439],
-                        [-0.121444880962,-0.196501940489,0.97295331955],
-                        [-0.0407496243715,-0.197802826762,0.979394435883],
-                        [-0.0820460245013,-0.265506535769,0.960611641407],
-                        [-0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0,-0.130150929093,0.991494178772],
-                        [0.0407496243715,-0.197802826762,0.979394435883],
-                        [0.121444880962,-0.196501940489,0.97295331955],
-                        [0.0820460245013,-0.265506535769,0.960611641407],
-                        [0.0,-0.130150929093,0.991494178772],
-                        [0.0407496243715,-0.197802826762,0.979394435883],
-                        [-0.0407496243715,-0.197802826762,0.979394435883],
-                        [0.0410230122507,-0.464636415243,0.88455080986],
-                        [0.122248865664,-0.461539924145,0.878655850887],
-                        [0.0809632539749,-0.524005174637,0.847858190536],
-                        [0.123069040477,-0.33188316226,0.935258030891],
-                        [0.202408134937,-0.327503234148,0.922915279865],
-                        [0.162998497486,-0.395605653524,0.903840482235],
-                        [0.20109423995,-0.455528259277,0.867211103439],
-                        [0.276221334934,-0.446935534477,0.85085272789],
-                        [0.236761152744,-0.510783493519,0.826465010643],
-                        [0.162998497486,-0.395605653524,0.903840482235],
-                        [0.20109423995,-0.455528259277,0.867211103439],
-                        [0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.0820460245013,-0.265506535769,0.960611641407],
-                        [-0.04130198434,-0.334140062332,0.941618084908],
-                        [-0.123069040477,-0.33188316226,0.935258030891],
-                        [0.0820460245013,-0.265506535769,0.960611641407],
-                        [0.123069040477,-0.33188316226,0.935258030891],
-                        [0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0,-0.400968074799,0.916092038155],
-                        [0.0410230122507,-0.464636415243,0.88455080986],
-                        [-0.0410230122507,-0.464636415243,0.88455080986],
-                        [0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0,-0.400968074799,0.916092038155],
-                        [-0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0339771322906,-0.82464236021,0.564633131027],
-                        [0.091976031661,-0.830952167511,0.548688352108],
-                        [0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.108097285032,-0.757922053337,0.643326640129],
-                        [0.171839639544,-0.759706020355,0.627150595188],
-                        [0.131048902869,-0.798110127449,0.588087081909],
-                        [0.153434738517,-0.834331154823,0.529480218887],
-                        [0.217834427953,-0.834127128124,0.506734728813],
-                        [0.174905076623,-0.866019308567,0.468421578407],
-                        [0.131048902869,-0.798110127449,0.588087081909],
-                        [0.153434738517,-0.834331154823,0.529480218887],
-                        [0.091976031661,-0.830952167511,0.548688352108],
-                        [0.188148602843,-0.669747889042,0.718357801437],
-                        [0.256401896477,-0.665616393089,0.700865805149],
-                        [0.213841319084,-0.715529501438,0.665048420429],
-                        [0.269586592913,-0.560828924179,0.782811582088],
-                        [0.340069264174,-0.550243675709,0.762617051601],
-                        [0.298754066229,-0.610302150249,0.733673810959],
-                        [0.327040165663,-0.657660841942,0.678621411324],
-                        [0.398910075426,-0.645450055599,0.65135627985],
-                        [0.353819847107,-0.701809465885,0.618283927441],
-                        [0.298754066229,-0.610302150249,0.733673810959],
-                        [0.327040165663,-0.657660841942,0.678621411324],
-                        [0.256401896477,-0.665616393089,0.700865805149],
-                        [0.284414708614,-0.829719662666,0.480284929276],
-                        [0.352179646492,-0.820587992668,0.450116455555],
-                        [0.3044308424,-0.857896447182,0.413926929235],
-                        [0.378517180681,-0.74177056551,0.553625464439],
-                        [0.44894811511,-0.726413309574,0.520354926586],
-                        [0.400663375854,-0.776785671711,0.485873311758],
-                        [0.419940322638,-0.806385576725,0.416404157877],
-                        [0.486395716667,-0.787004828453,0.379529476166],
-                        [0.436200261116,-0.830415487289,0.346611320972],
-                        [0.400663375854,-0.776785671711,0.485873311758],
-                        [0.419940322638,-0.806385576725,0.416404157877],
-                        [0.352179646492,-0.820587992668,0.450116455555],
-                        [0.213841319084,-0.715529501438,0.665048420429],
-                        [0.238753452897,-0.757998526096,0.606988489628],
-                        [0.171839639544,-0.759706020355,0.627150595188],
-                        [0.353819847107,-0.701809465885,0.618283927441],
-                        [0.378517180681,-0.74177056551,0.553625464439],
-                        [0.308011889458,-0.752189457417,0.582528710365],
-                        [0.26241543889,-0.796284377575,0.545040607452],
-                        [0.284414708614,-0.829719662666,0.480284929276],
-                        [0.217834427953,-0.834127128124,0.506734728813],
-                        [0.308011889458,-0.752189457417,0.582528710365],
-                        [0.26241543889,-0.796284377575,0.545040607452],
-                        [0.238753452897,-0.757998526096,0.606988489628],
-                        [0.346611320972,-0.436200261116,0.830415487289],
-                        [0.416404157877,-0.419940322638,0.806385576725],
-                        [0.379529476166,-0.486395716667,0.787004828453],
-                        [0.413926929235,-0.3044308424,0.857896447182],
-                        [0.480284929276,-0.284414708614,0.829719662666],
-                        [0.450116455555,-0.352179646492,0.820587992668],
-                        [0.485873311758,-0.400663375854,0.776785671711],
-                        [0.553625464439,-0.378517180681,0.74177056551],
-                        [0.520354926586,-0.44894811511,0.726413309574],
-                        [0.450116455555,-0.352179646492,0.820587992668],
-                        [0.485873311758,-0.400663375854,0.776785671711],
-                        [0.416404157877,-0.419940322638,0.806385576725],
-                        [0.468421578407,-0.174905076623,0.866019308567],
-                        [0.529480218887,-0.153434738517,0.834331154823],
-                        [0.506734728813,-0.217834427953,0.834127128124],
-                        [0.509656965733,-0.0549761541188,0.858619451523],
-                        [0.564633131027,-0.0339771322906,0.82464236021],
-                        [0.548688352108,-0.091976031661,0.830952167511],
-                        [0.588087081909,-0.131048902869,0.798110127449],
-                        [0.643326640129,-0.108097285032,0.757922053337],
-                        [0.627150595188,-0.171839639544,0.759706020355],
-                        [0.548688352108,-0.091976031661,0.830952167511],
-                        [0.588087081909,-0.131048902869,0.798110127449],
-                        [0.529480218887,-0.153434738517,0.834331154823],
-                        [0.618283927441,-0.353819847107,0.701809465885],
-                        [0.678621411324,-0.327040165663,0.657660841942],
-                        [0.65135627985,-0.398910075426,0.645450055599],
-                        [0.665048420429,-0.213841319084,0.715529501438],
-                        [0.718357801437,-0.188148602843,0.669747889042],
-                        [0.700865805149,-0.256401896477,0.665616393089],
-                        [0.733673810959,-0.298754066229,0.610302150249],
-                        [0.782811582088,-0.269586592913,0.560828924179],
-                        [0.762617051601,-0.340069264174,0.550243675709],
-                        [0.700865805149,-0.256401896477,0.665616393089],
-                        [0.733673810959,-0.298754066229,0.610302150249],
-                        [0.678621411324,-0.327040165663,0.657660841942],
-                        [0.506734728813,-0.217834427953,0.834127128124],
-                        [0.545040607452,-0.26241543889,0.796284377575],
-                        [0.480284929276,-0.284414708614,0.829719662666],
-                        [0.627150595188,-0.171839639544,0.759706020355],
-                        [0.665048420429,-0.213841319084,0.715529501438],
-                        [0.606988489628,-0.238753452897,0.757998526096],
-                        [0.582528710365,-0.308011889458,0.752189457417],
-                        [0.618283927441,-0.353819847107,0.701809465885],
-                        [0.553625464439,-0.378517180681,0.74177056551],
-                        [0.606988489628,-0.238753452897,0.757998526096],
-                        [0.582528710365,-0.308011889458,0.752189457417],
-                        [0.545040607452,-0.26241543889,0.796284377575],
-                        [0.550243675709,-0.762617051601,0.340069264174],
-                        [0.610302150249,-0.733673810959,0.298754066229],
-                        [0.560828924179,-0.782811582088,0.269586592913],
-                        [0.645450055599,-0.65135627985,0.398910075426],
-                        [0.701809465885,-0.618283927441,0.353819847107],
-                        [0.657660841942,-0.678621411324,0.327040165663],
-                        [0.665616393089,-0.700865805149,0.256401896477],
-                        [0.715529501438,-0.665048420429,0.213841319084],
-                        [0.669747889042,-0.718357801437,0.188148602843],
-                        [0.657660841942,-0.678621411324,0.327040165663],
-                        [0.665616393089,-0.700865805149,0.256401896477],
-                        [0.610302150249,-0.733673810959,0.298754066229],
-                        [0.726413309574,-0.520354926586,0.44894811511],
-                        [0.776785671711,-0.485873311758,0.400663375854],
-                        [0.74177056551,-0.553625464439,0.378517180681],
-                        [0.787004828453,-0.379529476166,0.486395716667],
-                        [0.830415487289,-0.346611320972,0.436200261116],
-                        [0.806385576725,-0.416404157877,0.419940322638],
-                        [0.820587992668,-0.450116455555,0.352179646492],
-                        [0.857896447182,-0.413926929235,0.3044308424],
-                        [0.829719662666,-0.480284929276,0.284414708614],
-                        [0.806385576725,-0.416404157877,0.419940322638],
-                        [0.820587992668,-0.450116455555,0.352179646492],
-                        [0.776785671711,-0.485873311758,0.400663375854],
-                        [0.759706020355,-0.627150595188,0.171839639544],
-                        [0.798110127449,-0.588087081909,0.131048902869],
-                        [0.757922053337,-0.643326640129,0.108097285032],
-                        [0.834127128124,-0.506734728813,0.217834427953],
-                        [0.866019308567,-0.468421578407,0.174905076623],
-                        [0.834331154823,-0.529480218887,0.153434738517],
-                        [0.830952167511,-0.548688352108,0.091976031661],
-                        [0.858619451523,-0.509656965733,0.0549761541188],
-                        [0.82464236021,-0.564633131027,0.0339771322906],
-                        [0.834331154823,-0.529480218887,0.153434738517],
-                        [0.830952167511,-0.548688352108,0.091976031661],
-                        [0.798110127449,-0.588087081909,0.131048902869],
-                        [0.74177056551,-0.553625464439,0.378517180681],
-                        [0.752189457417,-0.582528710365,0.308011889458],
-                        [0.701809465885,-0.618283927441,0.353819847107],
-                        [0.829719662666,-0.480284929276,0.284414708614],
-                        [0.834127128124,-0.506734728813,0.217834427953],
-                        [0.796284377575,-0.545040607452,0.26241543889],
-                        [0.757998526096,-0.606988489628,0.238753452897],
-                        [0.759706020355,-0.627150595188,0.171839639544],
-                        [0.715529501438,-0.665048420429,0.213841319084],
-                        [0.796284377575,-0.545040607452,0.26241543889],
-                        [0.757998526096,-0.606988489628,0.238753452897],
-                        [0.752189457417,-0.582528710365,0.308011889458],
-                        [0.379529476166,-0.486395716667,0.787004828453],
-                        [0.411682873964,-0.535965919495,0.737060189247],
-                        [0.340069264174,-0.550243675709,0.762617051601],
-                        [0.520354926586,-0.44894811511,0.726413309574],
-                        [0.552667617798,-0.495975226164,0.669751524925],
-                        [0.483050197363,-0.517854511738,0.706037700176],
-                        [0.44230055809,-0.58378881216,0.680853009224],
-                        [0.470621615648,-0.628728508949,0.619044244289],
-                        [0.398910075426,-0.645450055599,0.65135627985],
-                        [0.483050197363,-0.517854511738,0.706037700176],
-                        [0.44230055809,-0.58378881216,0.680853009224],
-                        [0.411682873964,-0.535965919495,0.737060189247],
-                        [0.65135627985,-0.398910075426,0.645450055599],
-                        [0.680853009224,-0.44230055809,0.58378881216],
-                        [0.619044244289,-0.470621615648,0.628728508949],
-                        [0.762617051601,-0.340069264174,0.550243675709],
-                        [0.787004828453,-0.379529476166,0.486395716667],
-                        [0.737060189247,-0.411682873964,0.535965919495],
-                        [0.706037700176,-0.483050197363,0.517854511738],
-                        [0.726413309574,-0.520354926586,0.44894811511],
-                        [0.669751524925,-0.552667617798,0.495975226164],
-                        [0.737060189247,-0.411682873964,0.535965919495],
-                        [0.706037700176,-0.483050197363,0.517854511738],
-                        [0.680853009224,-0.44230055809,0.58378881216],
-                        [0.495975226164,-0.669751524925,0.552667617798],
-                        [0.517854511738,-0.706037700176,0.483050197363],
-                        [0.44894811511,-0.726413309574,0.520354926586],
-                        [0.628728508949,-0.619044244289,0.470621615648],
-                        [0.645450055599,-0.65135627985,0.398910075426],
-                        [0.58378881216,-0.680853009224,0.44230055809],
-                        [0.535965919495,-0.737060189247,0.411682873964],
-                        [0.550243675709,-0.762617051601,0.340069264174],
-                        [0.486395716667,-0.787004828453,0.379529476166],
-                        [0.58378881216,-0.680853009224,0.44230055809],
-                        [0.535965919495,-0.737060189247,0.411682873964],
-                        [0.517854511738,-0.706037700176,0.483050197363],
-                        [0.619044244289,-0.470621615648,0.628728508949],
-                        [0.581951975822,-0.540649950504,0.607478022575],
-                        [0.552667617798,-0.495975226164,0.669751524925],
-                        [0.669751524925,-0.552667617798,0.495975226164],
-                        [0.628728508949,-0.619044244289,0.470621615648],
-                        [0.607478022575,-0.581951975822,0.540649950504],
-                        [0.540649950504,-0.607478022575,0.581951975822],
-                        [0.495975226164,-0.669751524925,0.552667617798],
-                        [0.470621615648,-0.628728508949,0.619044244289],
-                        [0.607478022575,-0.581951975822,0.540649950504],
-                        [0.540649950504,-0.607478022575,0.581951975822],
-                        [0.581951975822,-0.540649950504,0.607478022575],
-                        [0.82464236021,-0.564633131027,-0.0339771322906],
-                        [0.79582041502,-0.605532705784,0.0],
-                        [0.82464236021,-0.564633131027,0.0339771322906],
-                        [0.757922053337,-0.643326640129,-0.108097285032],
-                        [0.722495436668,-0.687358558178,-0.0744211226702],
-                        [0.761889100075,-0.646693944931,-0.0362210273743],
-                        [0.761889100075,-0.646693944931,0.0362210273743],
-                        [0.722495436668,-0.687358558178,0.0744211226702],
-                        [0.757922053337,-0.643326640129,0.108097285032],
-                        [0.761889100075,-0.646693944931,-0.0362210273743],
-                        [0.761889100075,-0.646693944931,0.0362210273743],
-                        [0.79582041502,-0.605532705784,0.0],
-                        [0.669747889042,-0.718357801437,-0.188148602843],
-                        [0.62687343359,-0.763553202152,-0.154971644282],
-                        [0.677466154099,-0.726636230946,-0.114190116525],
-                        [0.560828924179,-0.782811582088,-0.269586592913],
-                        [0.510783493519,-0.826465010643,-0.236761152744],
-                        [0.571085453033,-0.797127783298,-0.196083456278],
-                        [0.578244268894,-0.807120084763,-0.119124859571],
-                        [0.524005174637,-0.847858190536,-0.0809632539749],
-                        [0.581926107407,-0.81225925684,-0.0399611219764],
-                        [0.571085453033,-0.797127783298,-0.196083456278],
-                        [0.578244268894,-0.807120084763,-0.119124859571],
-                        [0.62687343359,-0.763553202152,-0.154971644282],
-                        [0.677466154099,-0.726636230946,0.114190116525],
-                        [0.62687343359,-0.763553202152,0.154971644282],
-                        [0.669747889042,-0.718357801437,0.188148602843],
-                        [0.581926107407,-0.81225925684,0.0399611219764],
-                        [0.524005174637,-0.847858190536,0.0809632539749],
-                        [0.578244268894,-0.807120084763,0.119124859571],
-                        [0.571085453033,-0.797127783298,0.196083456278],
-                        [0.510783493519,-0.826465010643,0.236761152744],
-                        [0.560828924179,-0.782811582088,0.269586592913],
-                        [0.578244268894,-0.807120084763,0.119124859571],
-                        [0.571085453033,-0.797127783298,0.196083456278],
-                        [0.62687343359,-0.763553202152,0.154971644282],
-                        [0.677466154099,-0.726636230946,-0.114190116525],
-                        [0.68142670393,-0.730884253979,-0.0382858961821],
-                        [0.722495436668,-0.687358558178,-0.0744211226702],
-                        [0.581926107407,-0.81225925684,-0.0399611219764],
-                        [0.581926107407,-0.81225925684,0.0399611219764],
-                        [0.634539365768,-0.772890508175,0.0],
-                        [0.68142670393,-0.730884253979,0.0382858961821],
-                        [0.677466154099,-0.726636230946,0.114190116525],
-                        [0.722495436668,-0.687358558178,0.0744211226702],
-                        [0.634539365768,-0.772890508175,0.0],
-                        [0.68142670393,-0.730884253979,0.0382858961821],
-                        [0.68142670393,-0.730884253979,-0.0382858961821],
-                        [0.436200261116,-0.830415487289,-0.346611320972],
-                        [0.380723625422,-0.869839549065,-0.313733518124],
-                        [0.446935534477,-0.85085272789,-0.276221334934],
-                        [0.3044308424,-0.857896447182,-0.413926929235],
-                        [0.246351331472,-0.891307473183,-0.380633711815],
-                        [0.313436716795,-0.883275330067,-0.348686188459],
-                        [0.321246802807,-0.905284404755,-0.277958005667],
-                        [0.258633822203,-0.935745954514,-0.239766731858],
-                        [0.327503234148,-0.922915279865,-0.202408134937],
-                        [0.313436716795,-0.883275330067,-0.348686188459],
-                        [0.321246802807,-0.905284404755,-0.277958005667],
-                        [0.380723625422,-0.869839549065,-0.313733518124],
-                        [0.174905076623,-0.866019308567,-0.468421578407],
-                        [0.117213711143,-0.892938017845,-0.434652328491],
-                        [0.180623859167,-0.894335091114,-0.409316182137],
-                        [0.0549761541188,-0.858619451523,-0.509656965733],
-                        [0.0,-0.8796184659,-0.475679844618],
-                        [0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0586068555713,-0.915323853493,-0.398431301117],
-                        [0.0,-0.932827115059,-0.360324263573],
-                        [0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0586068555713,-0.915323853493,-0.398431301117],
-                        [0.117213711143,-0.892938017845,-0.434652328491],
-                        [0.193975359201,-0.960443258286,-0.199805602431],
-                        [0.128498718143,-0.978907585144,-0.158833146095],
-                        [0.196501940489,-0.97295331955,-0.121444880962],
-                        [0.0615878328681,-0.961880862713,-0.266443610191],
-                        [0.0,-0.974178731441,-0.225778326392],
-                        [0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0634539350867,-0.991025745869,-0.117650069296],
-                        [0.0,-0.997029185295,-0.0770247355103],
-                        [0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0634539350867,-0.991025745869,-0.117650069296],
-                        [0.128498718143,-0.978907585144,-0.158833146095],
-                        [0.180623859167,-0.894335091114,-0.409316182137],
-                        [0.185843646526,-0.920180141926,-0.34457308054],
-                        [0.246351331472,-0.891307473183,-0.380633711815],
-                        [0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0615878328681,-0.961880862713,-0.266443610191],
-                        [0.123895764351,-0.943842172623,-0.306287169456],
-                        [0.190361812711,-0.942551255226,-0.274516820908],
-                        [0.193975359201,-0.960443258286,-0.199805602431],
-                        [0.258633822203,-0.935745954514,-0.239766731858],
-                        [0.123895764351,-0.943842172623,-0.306287169456],
-                        [0.190361812711,-0.942551255226,-0.274516820908],
-                        [0.185843646526,-0.920180141926,-0.34457308054],
-                        [0.446935534477,-0.85085272789,0.276221334934],
-                        [0.380723625422,-0.869839549065,0.313733518124],
-                        [0.436200261116,-0.830415487289,0.346611320972],
-                        [0.327503234148,-0.922915279865,0.202408134937],
-                        [0.258633822203,-0.935745954514,0.239766731858],
-                        [0.321246802807,-0.905284404755,0.277958005667],
-                        [0.313436716795,-0.883275330067,0.348686188459],
-                        [0.246351331472,-0.891307473183,0.380633711815],
-                        [0.3044308424,-0.857896447182,0.413926929235],
-                        [0.321246802807,-0.905284404755,0.277958005667],
-                        [0.313436716795,-0.883275330067,0.348686188459],
-                        [0.380723625422,-0.869839549065,0.313733518124],
-                        [0.196501940489,-0.97295331955,0.121444880962],
-                        [0.128498718143,-0.978907585144,0.158833146095],
-                        [0.193975359201,-0.960443258286,0.199805602431],
-                        [0.0638479366899,-0.997179210186,0.0394601933658],
-                        [0.0,-0.997029185295,0.0770247355103],
-                        [0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0626873448491,-0.979053080082,0.193714544177],
-                        [0.0,-0.974178731441,0.225778326392],
-                        [0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0626873448491,-0.979053080082,0.193714544177],
-                        [0.128498718143,-0.978907585144,0.158833146095],
-                        [0.180623859167,-0.894335091114,0.409316182137],
-                        [0.117213711143,-0.892938017845,0.434652328491],
-                        [0.174905076623,-0.866019308567,0.468421578407],
-                        [0.0602079555392,-0.940329909325,0.334895044565],
-                        [0.0,-0.932827115059,0.360324263573],
-                        [0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0568443164229,-0.887796461582,0.456712335348],
-                        [0.0,-0.8796184659,0.475679844618],
-                        [0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0568443164229,-0.887796461582,0.456712335348],
-                        [0.117213711143,-0.892938017845,0.434652328491],
-                        [0.193975359201,-0.960443258286,0.199805602431],
-                        [0.190361812711,-0.942551255226,0.274516820908],
-                        [0.258633822203,-0.935745954514,0.239766731858],
-                        [0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0602079555392,-0.940329909325,0.334895044565],
-                        [0.123895764351,-0.943842172623,0.306287169456],
-                        [0.185843646526,-0.920180141926,0.34457308054],
-                        [0.180623859167,-0.894335091114,0.409316182137],
-                        [0.246351331472,-0.891307473183,0.380633711815],
-                        [0.123895764351,-0.943842172623,0.306287169456],
-                        [0.185843646526,-0.920180141926,0.34457308054],
-                        [0.190361812711,-0.942551255226,0.274516820908],
-                        [0.446935534477,-0.85085272789,-0.276221334934],
-                        [0.455528259277,-0.867211103439,-0.20109423995],
-                        [0.510783493519,-0.826465010643,-0.236761152744],
-                        [0.327503234148,-0.922915279865,-0.202408134937],
-                        [0.33188316226,-0.935258030891,-0.123069040477],
-                        [0.395605653524,-0.903840482235,-0.162998497486],
-                        [0.461539924145,-0.878655850887,-0.122248865664],
-                        [0.464636415243,-0.88455080986,-0.0410230122507],
-                        [0.524005174637,-0.847858190536,-0.0809632539749],
-                        [0.395605653524,-0.903840482235,-0.162998497486],
-                        [0.461539924145,-0.878655850887,-0.122248865664],
-                        [0.455528259277,-0.867211103439,-0.20109423995],
-                        [0.196501940489,-0.97295331955,-0.121444880962],
-                        [0.197802826762,-0.979394435883,-0.0407496243715],
-                        [0.265506535769,-0.960611641407,-0.0820460245013],
-                        [0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0638479366899,-0.997179210186,0.0394601933658],
-                        [0.130150929093,-0.991494178772,0.0],
-                        [0.197802826762,-0.979394435883,0.0407496243715],
-                        [0.196501940489,-0.97295331955,0.121444880962],
-                        [0.265506535769,-0.960611641407,0.0820460245013],
-                        [0.130150929093,-0.991494178772,0.0],
-                        [0.197802826762,-0.979394435883,0.0407496243715],
-                        [0.197802826762,-0.979394435883,-0.0407496243715],
-                        [0.464636415243,-0.88455080986,0.0410230122507],
-                        [0.461539924145,-0.878655850887,0.122248865664],
-                        [0.524005174637,-0.847858190536,0.0809632539749],
-                        [0.33188316226,-0.935258030891,0.123069040477],
-                        [0.327503234148,-0.922915279865,0.202408134937],
-                        [0.395605653524,-0.903840482235,0.162998497486],
-                        [0.455528259277,-0.867211103439,0.20109423995],
-                        [0.446935534477,-0.85085272789,0.276221334934],
-                        [0.510783493519,-0.826465010643,0.236761152744],
-                        [0.395605653524,-0.903840482235,0.162998497486],
-                        [0.455528259277,-0.867211103439,0.20109423995],
-                        [0.461539924145,-0.878655850887,0.122248865664],
-                        [0.265506535769,-0.960611641407,-0.0820460245013],
-                        [0.334140062332,-0.941618084908,-0.04130198434],
-                        [0.33188316226,-0.935258030891,-0.123069040477],
-                        [0.265506535769,-0.960611641407,0.0820460245013],
-                        [0.33188316226,-0.935258030891,0.123069040477],
-                        [0.334140062332,-0.941618084908,0.04130198434],
-                        [0.400968074799,-0.916092038155,0.0],
-                        [0.464636415243,-0.88455080986,0.0410230122507],
-                        [0.464636415243,-0.88455080986,-0.0410230122507],
-                        [0.334140062332,-0.941618084908,0.04130198434],
-                        [0.400968074799,-0.916092038155,0.0],
-                        [0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.82464236021,-0.564633131027,-0.0339771322906],
-                        [-0.830952167511,-0.548688352108,-0.091976031661],
-                        [-0.858619451523,-0.509656965733,-0.0549761541188],
-                        [-0.757922053337,-0.643326640129,-0.108097285032],
-                        [-0.759706020355,-0.627150595188,-0.171839639544],
-                        [-0.798110127449,-0.588087081909,-0.131048902869],
-                        [-0.834331154823,-0.529480218887,-0.153434738517],
-                        [-0.834127128124,-0.506734728813,-0.217834427953],
-                        [-0.866019308567,-0.468421578407,-0.174905076623],
-                        [-0.798110127449,-0.588087081909,-0.131048902869],
-                        [-0.834331154823,-0.529480218887,-0.153434738517],
-                        [-0.830952167511,-0.548688352108,-0.091976031661],
-                        [-0.669747889042,-0.718357801437,-0.188148602843],
-                        [-0.665616393089,-0.700865805149,-0.256401896477],
-                        [-0.715529501438,-0.665048420429,-0.213841319084],
-                        [-0.560828924179,-0.782811582088,-0.269586592913],
-                        [-0.550243675709,-0.762617051601,-0.340069264174],
-                        [-0.610302150249,-0.733673810959,-0.298754066229],
-                        [-0.657660841942,-0.678621411324,-0.327040165663],
-                        [-0.645450055599,-0.65135627985,-0.398910075426],
-                        [-0.701809465885,-0.618283927441,-0.353819847107],
-                        [-0.610302150249,-0.733673810959,-0.298754066229],
-                        [-0.657660841942,-0.678621411324,-0.327040165663],
-                        [-0.665616393089,-0.700865805149,-0.256401896477],
-                        [-0.829719662666,-0.480284929276,-0.284414708614],
-                        [-0.820587992668,-0.450116455555,-0.352179646492],
-                        [-0.857896447182,-0.413926929235,-0.3044308424],
-                        [-0.74177056551,-0.553625464439,-0.378517180681],
-                        [-0.726413309574,-0.520354926586,-0.44894811511],
-                        [-0.776785671711,-0.485873311758,-0.400663375854],
-                        [-0.806385576725,-0.416404157877,-0.419940322638],
-                        [-0.787004828453,-0.379529476166,-0.486395716667],
-                        [-0.830415487289,-0.346611320972,-0.436200261116],
-                        [-0.776785671711,-0.485873311758,-0.400663375854],
-                        [-0.806385576725,-0.416404157877,-0.419940322638],
-                        [-0.820587992668,-0.450116455555,-0.352179646492],
-                        [-0.715529501438,-0.665048420429,-0.213841319084],
-                        [-0.757998526096,-0.606988489628,-0.238753452897],
-                        [-0.759706020355,-0.627150595188,-0.171839639544],
-                        [-0.701809465885,-0.618283927441,-0.353819847107],
-                        [-0.74177056551,-0.553625464439,-0.378517180681],
-                        [-0.752189457417,-0.582528710365,-0.308011889458],
-                        [-0.796284377575,-0.545040607452,-0.26241543889],
-                        [-0.829719662666,-0.480284929276,-0.284414708614],
-                        [-0.834127128124,-0.506734728813,-0.217834427953],
-                        [-0.752189457417,-0.582528710365,-0.308011889458],
-                        [-0.796284377575,-0.545040607452,-0.26241543889],
-                        [-0.757998526096,-0.606988489628,-0.238753452897],
-                        [-0.436200261116,-0.830415487289,-0.346611320972],
-                        [-0.419940322638,-0.806385576725,-0.416404157877],
-                        [-0.486395716667,-0.787004828453,-0.379529476166],
-                        [-0.3044308424,-0.857896447182,-0.413926929235],
-                        [-0.284414708614,-0.829719662666,-0.480284929276],
-                        [-0.352179646492,-0.820587992668,-0.450116455555],
-                        [-0.400663375854,-0.776785671711,-0.485873311758],
-                        [-0.378517180681,-0.74177056551,-0.553625464439],
-                        [-0.44894811511,-0.726413309574,-0.520354926586],
-                        [-0.352179646492,-0.820587992668,-0.450116455555],
-                        [-0.400663375854,-0.776785671711,-0.485873311758],
-                        [-0.419940322638,-0.806385576725,-0.416404157877],
-                        [-0.174905076623,-0.866019308567,-0.468421578407],
-                        [-0.153434738517,-0.834331154823,-0.529480218887],
-                        [-0.217834427953,-0.834127128124,-0.506734728813],
-                        [-0.0549761541188,-0.858619451523,-0.509656965733],
-                        [-0.0339771322906,-0.82464236021,-0.564633131027],
-                        [-0.091976031661,-0.830952167511,-0.548688352108],
-                        [-0.131048902869,-0.798110127449,-0.588087081909],
-                        [-0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.171839639544,-0.759706020355,-0.627150595188],
-                        [-0.091976031661,-0.830952167511,-0.548688352108],
-                        [-0.131048902869,-0.798110127449,-0.588087081909],
-                        [-0.153434738517,-0.834331154823,-0.529480218887],
-                        [-0.353819847107,-0.701809465885,-0.618283927441],
-                        [-0.327040165663,-0.657660841942,-0.678621411324],
-                        [-0.398910075426,-0.645450055599,-0.65135627985],
-                        [-0.213841319084,-0.715529501438,-0.665048420429],
-                        [-0.188148602843,-0.669747889042,-0.718357801437],
-                        [-0.256401896477,-0.665616393089,-0.700865805149],
-                        [-0.298754066229,-0.610302150249,-0.733673810959],
-                        [-0.269586592913,-0.560828924179,-0.782811582088],
-                        [-0.340069264174,-0.550243675709,-0.762617051601],
-                        [-0.256401896477,-0.665616393089,-0.700865805149],
-                        [-0.298754066229,-0.610302150249,-0.733673810959],
-                        [-0.327040165663,-0.657660841942,-0.678621411324],
-                        [-0.217834427953,-0.834127128124,-0.506734728813],
-                        [-0.26241543889,-0.796284377575,-0.545040607452],
-                        [-0.284414708614,-0.829719662666,-0.480284929276],
-                        [-0.171839639544,-0.759706020355,-0.627150595188],
-                        [-0.213841319084,-0.715529501438,-0.665048420429],
-                        [-0.238753452897,-0.757998526096,-0.606988489628],
-                        [-0.308011889458,-0.752189457417,-0.582528710365],
-                        [-0.353819847107,-0.701809465885,-0.618283927441],
-                        [-0.378517180681,-0.74177056551,-0.553625464439],
-                        [-0.238753452897,-0.757998526096,-0.606988489628],
-                        [-0.308011889458,-0.752189457417,-0.582528710365],
-                        [-0.26241543889,-0.796284377575,-0.545040607452],
-                        [-0.762617051601,-0.340069264174,-0.550243675709],
-                        [-0.733673810959,-0.298754066229,-0.610302150249],
-                        [-0.782811582088,-0.269586592913,-0.560828924179],
-                        [-0.65135627985,-0.398910075426,-0.645450055599],
-                        [-0.618283927441,-0.353819847107,-0.701809465885],
-                        [-0.678621411324,-0.327040165663,-0.657660841942],
-                        [-0.700865805149,-0.256401896477,-0.665616393089],
-                        [-0.665048420429,-0.213841319084,-0.715529501438],
-                        [-0.718357801437,-0.188148602843,-0.669747889042],
-                        [-0.678621411324,-0.327040165663,-0.657660841942],
-                        [-0.700865805149,-0.256401896477,-0.665616393089],
-                        [-0.733673810959,-0.298754066229,-0.610302150249],
-                        [-0.520354926586,-0.44894811511,-0.726413309574],
-                        [-0.485873311758,-0.400663375854,-0.776785671711],
-                        [-0.553625464439,-0.378517180681,-0.74177056551],
-                        [-0.379529476166,-0.486395716667,-0.787004828453],
-                        [-0.346611320972,-0.436200261116,-0.830415487289],
-                        [-0.416404157877,-0.419940322638,-0.806385576725],
-                        [-0.450116455555,-0.352179646492,-0.820587992668],
-                        [-0.413926929235,-0.3044308424,-0.857896447182],
-                        [-0.480284929276,-0.284414708614,-0.829719662666],
-                        [-0.416404157877,-0.419940322638,-0.806385576725],
-                        [-0.450116455555,-0.352179646492,-0.820587992668],
-                        [-0.485873311758,-0.400663375854,-0.776785671711],
-                        [-0.627150595188,-0.171839639544,-0.759706020355],
-                        [-0.588087081909,-0.131048902869,-0.798110127449],
-                        [-0.643326640129,-0.108097285032,-0.757922053337],
-                        [-0.506734728813,-0.217834427953,-0.834127128124],
-                        [-0.468421578407,-0.174905076623,-0.866019308567],
-                        [-0.529480218887,-0.153434738517,-0.834331154823],
-                        [-0.548688352108,-0.091976031661,-0.830952167511],
-                        [-0.509656965733,-0.0549761541188,-0.858619451523],
-                        [-0.564633131027,-0.0339771322906,-0.82464236021],
-                        [-0.529480218887,-0.153434738517,-0.834331154823],
-                        [-0.548688352108,-0.091976031661,-0.830952167511],
-                        [-0.588087081909,-0.131048902869,-0.798110127449],
-                        [-0.553625464439,-0.378517180681,-0.74177056551],
-                        [-0.582528710365,-0.308011889458,-0.752189457417],
-                        [-0.618283927441,-0.353819847107,-0.701809465885],
-                        [-0.480284929276,-0.284414708614,-0.829719662666],
-                        [-0.506734728813,-0.217834427953,-0.834127128124],
-                        [-0.545040607452,-0.26241543889,-0.796284377575],
-                        [-0.606988489628,-0.238753452897,-0.757998526096],
-                        [-0.627150595188,-0.171839639544,-0.759706020355],
-                        [-0.665048420429,-0.213841319084,-0.715529501438],
-                        [-0.545040607452,-0.26241543889,-0.796284377575],
-                        [-0.606988489628,-0.238753452897,-0.757998526096],
-                        [-0.582528710365,-0.308011889458,-0.752189457417],
-                        [-0.486395716667,-0.787004828453,-0.379529476166],
-                        [-0.535965919495,-0.737060189247,-0.411682873964],
-                        [-0.550243675709,-0.762617051601,-0.340069264174],
-                        [-0.44894811511,-0.726413309574,-0.520354926586],
-                        [-0.495975226164,-0.669751524925,-0.552667617798],
-                        [-0.517854511738,-0.706037700176,-0.483050197363],
-                        [-0.58378881216,-0.680853009224,-0.44230055809],
-                        [-0.628728508949,-0.619044244289,-0.470621615648],
-                        [-0.645450055599,-0.65135627985,-0.398910075426],
-                        [-0.517854511738,-0.706037700176,-0.483050197363],
-                        [-0.58378881216,-0.680853009224,-0.44230055809],
-                        [-0.535965919495,-0.737060189247,-0.411682873964],
-                        [-0.398910075426,-0.645450055599,-0.65135627985],
-                        [-0.44230055809,-0.58378881216,-0.680853009224],
-                        [-0.470621615648,-0.628728508949,-0.619044244289],
-                        [-0.340069264174,-0.550243675709,-0.762617051601],
-                        [-0.379529476166,-0.486395716667,-0.787004828453],
-                        [-0.411682873964,-0.535965919495,-0.737060189247],
-                        [-0.483050197363,-0.517854511738,-0.706037700176],
-                        [-0.520354926586,-0.44894811511,-0.726413309574],
-                        [-0.552667617798,-0.495975226164,-0.669751524925],
-                        [-0.411682873964,-0.535965919495,-0.737060189247],
-                        [-0.483050197363,-0.517854511738,-0.706037700176],
-                        [-0.44230055809,-0.58378881216,-0.680853009224],
-                        [-0.669751524925,-0.552667617798,-0.495975226164],
-                        [-0.706037700176,-0.483050197363,-0.517854511738],
-                        [-0.726413309574,-0.520354926586,-0.44894811511],
-                        [-0.619044244289,-0.470621615648,-0.628728508949],
-                        [-0.65135627985,-0.398910075426,-0.645450055599],
-                        [-0.680853009224,-0.44230055809,-0.58378881216],
-                        [-0.737060189247,-0.411682873964,-0.535965919495],
-                        [-0.762617051601,-0.340069264174,-0.550243675709],
-                        [-0.787004828453,-0.379529476166,-0.486395716667],
-                        [-0.680853009224,-0.44230055809,-0.58378881216],
-                        [-0.737060189247,-0.411682873964,-0.535965919495],
-                        [-0.706037700176,-0.483050197363,-0.517854511738],
-                        [-0.470621615648,-0.628728508949,-0.619044244289],
-                        [-0.540649950504,-0.607478022575,-0.581951975822],
-                        [-0.495975226164,-0.669751524925,-0.552667617798],
-                        [-0.552667617798,-0.495975226164,-0.669751524925],
-                        [-0.619044244289,-0.470621615648,-0.628728508949],
-                        [-0.581951975822,-0.540649950504,-0.607478022575],
-                        [-0.607478022575,-0.581951975822,-0.540649950504],
-                        [-0.669751524925,-0.552667617798,-0.495975226164],
-                        [-0.628728508949,-0.619044244289,-0.470621615648],
-                        [-0.581951975822,-0.540649950504,-0.607478022575],
-                        [-0.607478022575,-0.581951975822,-0.540649950504],
-                        [-0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.0549761541188,-0.858619451523,-0.509656965733],
-                        [0.091976031661,-0.830952167511,-0.548688352108],
-                        [0.0339771322906,-0.82464236021,-0.564633131027],
-                        [0.174905076623,-0.866019308567,-0.468421578407],
-                        [0.217834427953,-0.834127128124,-0.506734728813],
-                        [0.153434738517,-0.834331154823,-0.529480218887],
-                        [0.131048902869,-0.798110127449,-0.588087081909],
-                        [0.171839639544,-0.759706020355,-0.627150595188],
-                        [0.108097285032,-0.757922053337,-0.643326640129],
-                        [0.153434738517,-0.834331154823,-0.529480218887],
-                        [0.131048902869,-0.798110127449,-0.588087081909],
-                        [0.091976031661,-0.830952167511,-0.548688352108],
-                        [0.3044308424,-0.857896447182,-0.413926929235],
-                        [0.352179646492,-0.820587992668,-0.450116455555],
-                        [0.284414708614,-0.829719662666,-0.480284929276],
-                        [0.436200261116,-0.830415487289,-0.346611320972],
-                        [0.486395716667,-0.787004828453,-0.379529476166],
-                        [0.419940322638,-0.806385576725,-0.416404157877],
-                        [0.400663375854,-0.776785671711,-0.485873311758],
-                        [0.44894811511,-0.726413309574,-0.520354926586],
-                        [0.378517180681,-0.74177056551,-0.553625464439],
-                        [0.419940322638,-0.806385576725,-0.416404157877],
-                        [0.400663375854,-0.776785671711,-0.485873311758],
-                        [0.352179646492,-0.820587992668,-0.450116455555],
-                        [0.213841319084,-0.715529501438,-0.665048420429],
-                        [0.256401896477,-0.665616393089,-0.700865805149],
-                        [0.188148602843,-0.669747889042,-0.718357801437],
-                        [0.353819847107,-0.701809465885,-0.618283927441],
-                        [0.398910075426,-0.645450055599,-0.65135627985],
-                        [0.327040165663,-0.657660841942,-0.678621411324],
-                        [0.298754066229,-0.610302150249,-0.733673810959],
-                        [0.340069264174,-0.550243675709,-0.762617051601],
-                        [0.269586592913,-0.560828924179,-0.782811582088],
-                        [0.327040165663,-0.657660841942,-0.678621411324],
-                        [0.298754066229,-0.610302150249,-0.733673810959],
-                        [0.256401896477,-0.665616393089,-0.700865805149],
-                        [0.284414708614,-0.829719662666,-0.480284929276],
-                        [0.26241543889,-0.796284377575,-0.545040607452],
-                        [0.217834427953,-0.834127128124,-0.506734728813],
-                        [0.378517180681,-0.74177056551,-0.553625464439],
-                        [0.353819847107,-0.701809465885,-0.618283927441],
-                        [0.308011889458,-0.752189457417,-0.582528710365],
-                        [0.238753452897,-0.757998526096,-0.606988489628],
-                        [0.213841319084,-0.715529501438,-0.665048420429],
-                        [0.171839639544,-0.759706020355,-0.627150595188],
-                        [0.308011889458,-0.752189457417,-0.582528710365],
-                        [0.238753452897,-0.757998526096,-0.606988489628],
-                        [0.26241543889,-0.796284377575,-0.545040607452],
-                        [0.560828924179,-0.782811582088,-0.269586592913],
-                        [0.610302150249,-0.733673810959,-0.298754066229],
-                        [0.550243675709,-0.762617051601,-0.340069264174],
-                        [0.669747889042,-0.718357801437,-0.188148602843],
-                        [0.715529501438,-0.665048420429,-0.213841319084],
-                        [0.665616393089,-0.700865805149,-0.256401896477],
-                        [0.657660841942,-0.678621411324,-0.327040165663],
-                        [0.701809465885,-0.618283927441,-0.353819847107],
-                        [0.645450055599,-0.65135627985,-0.398910075426],
-                        [0.665616393089,-0.700865805149,-0.256401896477],
-                        [0.657660841942,-0.678621411324,-0.327040165663],
-                        [0.610302150249,-0.733673810959,-0.298754066229],
-                        [0.757922053337,-0.643326640129,-0.108097285032],
-                        [0.798110127449,-0.588087081909,-0.131048902869],
-                        [0.759706020355,-0.627150595188,-0.171839639544],
-                        [0.82464236021,-0.564633131027,-0.0339771322906],
-                        [0.858619451523,-0.509656965733,-0.0549761541188],
-                        [0.830952167511,-0.548688352108,-0.091976031661],
-                        [0.834331154823,-0.529480218887,-0.153434738517],
-                        [0.866019308567,-0.468421578407,-0.174905076623],
-                        [0.834127128124,-0.506734728813,-0.217834427953],
-                        [0.830952167511,-0.548688352108,-0.091976031661],
-                        [0.834331154823,-0.529480218887,-0.153434738517],
-                        [0.798110127449,-0.588087081909,-0.131048902869],
-                        [0.74177056551,-0.553625464439,-0.378517180681],
-                        [0.776785671711,-0.485873311758,-0.400663375854],
-                        [0.726413309574,-0.520354926586,-0.44894811511],
-                        [0.829719662666,-0.480284929276,-0.284414708614],
-                        [0.857896447182,-0.413926929235,-0.3044308424],
-                        [0.820587992668,-0.450116455555,-0.352179646492],
-                        [0.806385576725,-0.416404157877,-0.419940322638],
-                        [0.830415487289,-0.346611320972,-0.436200261116],
-                        [0.787004828453,-0.379529476166,-0.486395716667],
-                        [0.820587992668,-0.450116455555,-0.352179646492],
-                        [0.806385576725,-0.416404157877,-0.419940322638],
-                        [0.776785671711,-0.485873311758,-0.400663375854],
-                        [0.759706020355,-0.627150595188,-0.171839639544],
-                        [0.757998526096,-0.606988489628,-0.238753452897],
-                        [0.715529501438,-0.665048420429,-0.213841319084],
-                        [0.834127128124,-0.506734728813,-0.217834427953],
-                        [0.829719662666,-0.480284929276,-0.284414708614],
-                        [0.796284377575,-0.545040607452,-0.26241543889],
-                        [0.752189457417,-0.582528710365,-0.308011889458],
-                        [0.74177056551,-0.553625464439,-0.378517180681],
-                        [0.701809465885,-0.618283927441,-0.353819847107],
-                        [0.796284377575,-0.545040607452,-0.26241543889],
-                        [0.752189457417,-0.582528710365,-0.308011889458],
-                        [0.757998526096,-0.606988489628,-0.238753452897],
-                        [0.379529476166,-0.486395716667,-0.787004828453],
-                        [0.416404157877,-0.419940322638,-0.806385576725],
-                        [0.346611320972,-0.436200261116,-0.830415487289],
-                        [0.520354926586,-0.44894811511,-0.726413309574],
-                        [0.553625464439,-0.378517180681,-0.74177056551],
-                        [0.485873311758,-0.400663375854,-0.776785671711],
-                        [0.450116455555,-0.352179646492,-0.820587992668],
-                        [0.480284929276,-0.284414708614,-0.829719662666],
-                        [0.413926929235,-0.3044308424,-0.857896447182],
-                        [0.485873311758,-0.400663375854,-0.776785671711],
-                        [0.450116455555,-0.352179646492,-0.820587992668],
-                        [0.416404157877,-0.419940322638,-0.806385576725],
-                        [0.65135627985,-0.398910075426,-0.645450055599],
-                        [0.678621411324,-0.327040165663,-0.657660841942],
-                        [0.618283927441,-0.353819847107,-0.701809465885],
-                        [0.762617051601,-0.340069264174,-0.550243675709],
-                        [0.782811582088,-0.269586592913,-0.560828924179],
-                        [0.733673810959,-0.298754066229,-0.610302150249],
-                        [0.700865805149,-0.256401896477,-0.665616393089],
-                        [0.718357801437,-0.188148602843,-0.669747889042],
-                        [0.665048420429,-0.213841319084,-0.715529501438],
-                        [0.733673810959,-0.298754066229,-0.610302150249],
-                        [0.700865805149,-0.256401896477,-0.665616393089],
-                        [0.678621411324,-0.327040165663,-0.657660841942],
-                        [0.506734728813,-0.217834427953,-0.834127128124],
-                        [0.529480218887,-0.153434738517,-0.834331154823],
-                        [0.468421578407,-0.174905076623,-0.866019308567],
-                        [0.627150595188,-0.171839639544,-0.759706020355],
-                        [0.643326640129,-0.108097285032,-0.757922053337],
-                        [0.588087081909,-0.131048902869,-0.798110127449],
-                        [0.548688352108,-0.091976031661,-0.830952167511],
-                        [0.564633131027,-0.0339771322906,-0.82464236021],
-                        [0.509656965733,-0.0549761541188,-0.858619451523],
-                        [0.588087081909,-0.131048902869,-0.798110127449],
-                        [0.548688352108,-0.091976031661,-0.830952167511],
-                        [0.529480218887,-0.153434738517,-0.834331154823],
-                        [0.618283927441,-0.353819847107,-0.701809465885],
-                        [0.582528710365,-0.308011889458,-0.752189457417],
-                        [0.553625464439,-0.378517180681,-0.74177056551],
-                        [0.665048420429,-0.213841319084,-0.715529501438],
-                        [0.627150595188,-0.171839639544,-0.759706020355],
-                        [0.606988489628,-0.238753452897,-0.757998526096],
-                        [0.545040607452,-0.26241543889,-0.796284377575],
-                        [0.506734728813,-0.217834427953,-0.834127128124],
-                        [0.480284929276,-0.284414708614,-0.829719662666],
-                        [0.606988489628,-0.238753452897,-0.757998526096],
-                        [0.545040607452,-0.26241543889,-0.796284377575],
-                        [0.582528710365,-0.308011889458,-0.752189457417],
-                        [0.550243675709,-0.762617051601,-0.340069264174],
-                        [0.535965919495,-0.737060189247,-0.411682873964],
-                        [0.486395716667,-0.787004828453,-0.379529476166],
-                        [0.645450055599,-0.65135627985,-0.398910075426],
-                        [0.628728508949,-0.619044244289,-0.470621615648],
-                        [0.58378881216,-0.680853009224,-0.44230055809],
-                        [0.517854511738,-0.706037700176,-0.483050197363],
-                        [0.495975226164,-0.669751524925,-0.552667617798],
-                        [0.44894811511,-0.726413309574,-0.520354926586],
-                        [0.58378881216,-0.680853009224,-0.44230055809],
-                        [0.517854511738,-0.706037700176,-0.483050197363],
-                        [0.535965919495,-0.737060189247,-0.411682873964],
-                        [0.726413309574,-0.520354926586,-0.44894811511],
-                        [0.706037700176,-0.483050197363,-0.517854511738],
-                        [0.669751524925,-0.552667617798,-0.495975226164],
-                        [0.787004828453,-0.379529476166,-0.486395716667],
-                        [0.762617051601,-0.340069264174,-0.550243675709],
-                        [0.737060189247,-0.411682873964,-0.535965919495],
-                        [0.680853009224,-0.44230055809,-0.58378881216],
-                        [0.65135627985,-0.398910075426,-0.645450055599],
-                        [0.619044244289,-0.470621615648,-0.628728508949],
-                        [0.737060189247,-0.411682873964,-0.535965919495],
-                        [0.680853009224,-0.44230055809,-0.58378881216],
-                        [0.706037700176,-0.483050197363,-0.517854511738],
-                        [0.470621615648,-0.628728508949,-0.619044244289],
-                        [0.44230055809,-0.58378881216,-0.680853009224],
-                        [0.398910075426,-0.645450055599,-0.65135627985],
-                        [0.552667617798,-0.495975226164,-0.669751524925],
-                        [0.520354926586,-0.44894811511,-0.726413309574],
-                        [0.483050197363,-0.517854511738,-0.706037700176],
-                        [0.411682873964,-0.535965919495,-0.737060189247],
-                        [0.379529476166,-0.486395716667,-0.787004828453],
-                        [0.340069264174,-0.550243675709,-0.762617051601],
-                        [0.483050197363,-0.517854511738,-0.706037700176],
-                        [0.411682873964,-0.535965919495,-0.737060189247],
-                        [0.44230055809,-0.58378881216,-0.680853009224],
-                        [0.669751524925,-0.552667617798,-0.495975226164],
-                        [0.607478022575,-0.581951975822,-0.540649950504],
-                        [0.628728508949,-0.619044244289,-0.470621615648],
-                        [0.619044244289,-0.470621615648,-0.628728508949],
-                        [0.552667617798,-0.495975226164,-0.669751524925],
-                        [0.581951975822,-0.540649950504,-0.607478022575],
-                        [0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.470621615648,-0.628728508949,-0.619044244289],
-                        [0.495975226164,-0.669751524925,-0.552667617798],
-                        [0.581951975822,-0.540649950504,-0.607478022575],
-                        [0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.607478022575,-0.581951975822,-0.540649950504],
-                        [0.475679844618,0.0,-0.8796184659],
-                        [0.456712335348,-0.0568443164229,-0.887796461582],
-                        [0.509656965733,-0.0549761541188,-0.858619451523],
-                        [0.360324263573,0.0,-0.932827115059],
-                        [0.334895044565,-0.0602079555392,-0.940329909325],
-                        [0.398431301117,-0.0586068555713,-0.915323853493],
-                        [0.434652328491,-0.117213711143,-0.892938017845],
-                        [0.409316182137,-0.180623859167,-0.894335091114],
-                        [0.468421578407,-0.174905076623,-0.866019308567],
-                        [0.398431301117,-0.0586068555713,-0.915323853493],
-                        [0.434652328491,-0.117213711143,-0.892938017845],
-                        [0.456712335348,-0.0568443164229,-0.887796461582],
-                        [0.225778326392,0.0,-0.974178731441],
-                        [0.193714544177,-0.0626873448491,-0.979053080082],
-                        [0.266443610191,-0.0615878328681,-0.961880862713],
-                        [0.0770247355103,0.0,-0.997029185295],
-                        [0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [0.117650069296,-0.0634539350867,-0.991025745869],
-                        [0.158833146095,-0.128498718143,-0.978907585144],
-                        [0.121444880962,-0.196501940489,-0.97295331955],
-                        [0.199805602431,-0.193975359201,-0.960443258286],
-                        [0.117650069296,-0.0634539350867,-0.991025745869],
-                        [0.158833146095,-0.128498718143,-0.978907585144],
-                        [0.193714544177,-0.0626873448491,-0.979053080082],
-                        [0.380633711815,-0.246351331472,-0.891307473183],
-                        [0.348686188459,-0.313436716795,-0.883275330067],
-                        [0.413926929235,-0.3044308424,-0.857896447182],
-                        [0.239766731858,-0.258633822203,-0.935745954514],
-                        [0.202408134937,-0.327503234148,-0.922915279865],
-                        [0.277958005667,-0.321246802807,-0.905284404755],
-                        [0.313733518124,-0.380723625422,-0.869839549065],
-                        [0.276221334934,-0.446935534477,-0.85085272789],
-                        [0.346611320972,-0.436200261116,-0.830415487289],
-                        [0.277958005667,-0.321246802807,-0.905284404755],
-                        [0.313733518124,-0.380723625422,-0.869839549065],
-                        [0.348686188459,-0.313436716795,-0.883275330067],
-                        [0.266443610191,-0.0615878328681,-0.961880862713],
-                        [0.306287169456,-0.123895764351,-0.943842172623],
-                        [0.334895044565,-0.0602079555392,-0.940329909325],
-                        [0.199805602431,-0.193975359201,-0.960443258286],
-                        [0.239766731858,-0.258633822203,-0.935745954514],
-                        [0.274516820908,-0.190361812711,-0.942551255226],
-                        [0.34457308054,-0.185843646526,-0.920180141926],
-                        [0.380633711815,-0.246351331472,-0.891307473183],
-                        [0.409316182137,-0.180623859167,-0.894335091114],
-                        [0.274516820908,-0.190361812711,-0.942551255226],
-                        [0.34457308054,-0.185843646526,-0.920180141926],
-                        [0.306287169456,-0.123895764351,-0.943842172623],
-                        [-0.0770247355103,0.0,-0.997029185295],
-                        [-0.117650069296,-0.0634539350867,-0.991025745869],
-                        [-0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [-0.225778326392,0.0,-0.974178731441],
-                        [-0.266443610191,-0.0615878328681,-0.961880862713],
-                        [-0.193714544177,-0.0626873448491,-0.979053080082],
-                        [-0.158833146095,-0.128498718143,-0.978907585144],
-                        [-0.199805602431,-0.193975359201,-0.960443258286],
-                        [-0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.193714544177,-0.0626873448491,-0.979053080082],
-                        [-0.158833146095,-0.128498718143,-0.978907585144],
-                        [-0.117650069296,-0.0634539350867,-0.991025745869],
-                        [-0.360324263573,0.0,-0.932827115059],
-                        [-0.398431301117,-0.0586068555713,-0.915323853493],
-                        [-0.334895044565,-0.0602079555392,-0.940329909325],
-                        [-0.475679844618,0.0,-0.8796184659],
-                        [-0.509656965733,-0.0549761541188,-0.858619451523],
-                        [-0.456712335348,-0.0568443164229,-0.887796461582],
-                        [-0.434652328491,-0.117213711143,-0.892938017845],
-                        [-0.468421578407,-0.174905076623,-0.866019308567],
-                        [-0.409316182137,-0.180623859167,-0.894335091114],
-                        [-0.456712335348,-0.0568443164229,-0.887796461582],
-                        [-0.434652328491,-0.117213711143,-0.892938017845],
-                        [-0.398431301117,-0.0586068555713,-0.915323853493],
-                        [-0.239766731858,-0.258633822203,-0.935745954514],
-                        [-0.277958005667,-0.321246802807,-0.905284404755],
-                        [-0.202408134937,-0.327503234148,-0.922915279865],
-                        [-0.380633711815,-0.246351331472,-0.891307473183],
-                        [-0.413926929235,-0.3044308424,-0.857896447182],
-                        [-0.348686188459,-0.313436716795,-0.883275330067],
-                        [-0.313733518124,-0.380723625422,-0.869839549065],
-                        [-0.346611320972,-0.436200261116,-0.830415487289],
-                        [-0.276221334934,-0.446935534477,-0.85085272789],
-                        [-0.348686188459,-0.313436716795,-0.883275330067],
-                        [-0.313733518124,-0.380723625422,-0.869839549065],
-                        [-0.277958005667,-0.321246802807,-0.905284404755],
-                        [-0.334895044565,-0.0602079555392,-0.940329909325],
-                        [-0.306287169456,-0.123895764351,-0.943842172623],
-                        [-0.266443610191,-0.0615878328681,-0.961880862713],
-                        [-0.409316182137,-0.180623859167,-0.894335091114],
-                        [-0.380633711815,-0.246351331472,-0.891307473183],
-                        [-0.34457308054,-0.185843646526,-0.920180141926],
-                        [-0.274516820908,-0.190361812711,-0.942551255226],
-                        [-0.239766731858,-0.258633822203,-0.935745954514],
-                        [-0.199805602431,-0.193975359201,-0.960443258286],
-                        [-0.34457308054,-0.185843646526,-0.920180141926],
-                        [-0.274516820908,-0.190361812711,-0.942551255226],
-                        [-0.306287169456,-0.123895764351,-0.943842172623],
-                        [0.236761152744,-0.510783493519,-0.826465010643],
-                        [0.196083456278,-0.571085453033,-0.797127783298],
-                        [0.269586592913,-0.560828924179,-0.782811582088],
-                        [0.0809632539749,-0.524005174637,-0.847858190536],
-                        [0.0399611219764,-0.581926107407,-0.81225925684],
-                        [0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.154971644282,-0.62687343359,-0.763553202152],
-                        [0.114190116525,-0.677466154099,-0.726636230946],
-                        [0.188148602843,-0.669747889042,-0.718357801437],
-                        [0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.154971644282,-0.62687343359,-0.763553202152],
-                        [0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.0809632539749,-0.524005174637,-0.847858190536],
-                        [-0.119124859571,-0.578244268894,-0.807120084763],
-                        [-0.0399611219764,-0.581926107407,-0.81225925684],
-                        [-0.236761152744,-0.510783493519,-0.826465010643],
-                        [-0.269586592913,-0.560828924179,-0.782811582088],
-                        [-0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.154971644282,-0.62687343359,-0.763553202152],
-                        [-0.188148602843,-0.669747889042,-0.718357801437],
-                        [-0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.154971644282,-0.62687343359,-0.763553202152],
-                        [-0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.0744211226702,-0.722495436668,-0.687358558178],
-                        [0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.0744211226702,-0.722495436668,-0.687358558178],
-                        [-0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.0,-0.79582041502,-0.605532705784],
-                        [-0.0339771322906,-0.82464236021,-0.564633131027],
-                        [0.0339771322906,-0.82464236021,-0.564633131027],
-                        [-0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.0,-0.79582041502,-0.605532705784],
-                        [0.0362210273743,-0.761889100075,-0.646693944931],
-                        [-0.0399611219764,-0.581926107407,-0.81225925684],
-                        [0.0,-0.634539365768,-0.772890508175],
-                        [0.0399611219764,-0.581926107407,-0.81225925684],
-                        [-0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.0744211226702,-0.722495436668,-0.687358558178],
-                        [-0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0744211226702,-0.722495436668,-0.687358558178],
-                        [0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0,-0.634539365768,-0.772890508175],
-                        [-0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [0.0,-0.130150929093,-0.991494178772],
-                        [0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [-0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.0820460245013,-0.265506535769,-0.960611641407],
-                        [-0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0820460245013,-0.265506535769,-0.960611641407],
-                        [0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0,-0.130150929093,-0.991494178772],
-                        [-0.202408134937,-0.327503234148,-0.922915279865],
-                        [-0.162998497486,-0.395605653524,-0.903840482235],
-                        [-0.123069040477,-0.33188316226,-0.935258030891],
-                        [-0.276221334934,-0.446935534477,-0.85085272789],
-                        [-0.236761152744,-0.510783493519,-0.826465010643],
-                        [-0.20109423995,-0.455528259277,-0.867211103439],
-                        [-0.122248865664,-0.461539924145,-0.878655850887],
-                        [-0.0809632539749,-0.524005174637,-0.847858190536],
-                        [-0.0410230122507,-0.464636415243,-0.88455080986],
-                        [-0.20109423995,-0.455528259277,-0.867211103439],
-                        [-0.122248865664,-0.461539924145,-0.878655850887],
-                        [-0.162998497486,-0.395605653524,-0.903840482235],
-                        [0.123069040477,-0.33188316226,-0.935258030891],
-                        [0.162998497486,-0.395605653524,-0.903840482235],
-                        [0.202408134937,-0.327503234148,-0.922915279865],
-                        [0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0809632539749,-0.524005174637,-0.847858190536],
-                        [0.122248865664,-0.461539924145,-0.878655850887],
-                        [0.20109423995,-0.455528259277,-0.867211103439],
-                        [0.236761152744,-0.510783493519,-0.826465010643],
-                        [0.276221334934,-0.446935534477,-0.85085272789],
-                        [0.122248865664,-0.461539924145,-0.878655850887],
-                        [0.20109423995,-0.455528259277,-0.867211103439],
-                        [0.162998497486,-0.395605653524,-0.903840482235],
-                        [-0.123069040477,-0.33188316226,-0.935258030891],
-                        [-0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.0820460245013,-0.265506535769,-0.960611641407],
-                        [-0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0,-0.400968074799,-0.916092038155],
-                        [0.04130198434,-0.334140062332,-0.941618084908],
-                        [0.123069040477,-0.33188316226,-0.935258030891],
-                        [0.0820460245013,-0.265506535769,-0.960611641407],
-                        [0.0,-0.400968074799,-0.916092038155],
-                        [0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.8796184659,-0.475679844618,0.0],
-                        [-0.887796461582,-0.456712335348,-0.0568443164229],
-                        [-0.858619451523,-0.509656965733,-0.0549761541188],
-                        [-0.932827115059,-0.360324263573,0.0],
-                        [-0.940329909325,-0.334895044565,-0.0602079555392],
-                        [-0.915323853493,-0.398431301117,-0.0586068555713],
-                        [-0.892938017845,-0.434652328491,-0.117213711143],
-                        [-0.894335091114,-0.409316182137,-0.180623859167],
-                        [-0.866019308567,-0.468421578407,-0.174905076623],
-                        [-0.915323853493,-0.398431301117,-0.0586068555713],
-                        [-0.892938017845,-0.434652328491,-0.117213711143],
-                        [-0.887796461582,-0.456712335348,-0.0568443164229],
-                        [-0.974178731441,-0.225778326392,0.0],
-                        [-0.979053080082,-0.193714544177,-0.0626873448491],
-                        [-0.961880862713,-0.266443610191,-0.0615878328681],
-                        [-0.997029185295,-0.0770247355103,0.0],
-                        [-0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [-0.991025745869,-0.117650069296,-0.0634539350867],
-                        [-0.978907585144,-0.158833146095,-0.128498718143],
-                        [-0.97295331955,-0.121444880962,-0.196501940489],
-                        [-0.960443258286,-0.199805602431,-0.193975359201],
-                        [-0.991025745869,-0.117650069296,-0.0634539350867],
-                        [-0.978907585144,-0.158833146095,-0.128498718143],
-                        [-0.979053080082,-0.193714544177,-0.0626873448491],
-                        [-0.891307473183,-0.380633711815,-0.246351331472],
-                        [-0.883275330067,-0.348686188459,-0.313436716795],
-                        [-0.857896447182,-0.413926929235,-0.3044308424],
-                        [-0.935745954514,-0.239766731858,-0.258633822203],
-                        [-0.922915279865,-0.202408134937,-0.327503234148],
-                        [-0.905284404755,-0.277958005667,-0.321246802807],
-                        [-0.869839549065,-0.313733518124,-0.380723625422],
-                        [-0.85085272789,-0.276221334934,-0.446935534477],
-                        [-0.830415487289,-0.346611320972,-0.436200261116],
-                        [-0.905284404755,-0.277958005667,-0.321246802807],
-                        [-0.869839549065,-0.313733518124,-0.380723625422],
-                        [-0.883275330067,-0.348686188459,-0.313436716795],
-                        [-0.961880862713,-0.266443610191,-0.0615878328681],
-                        [-0.943842172623,-0.306287169456,-0.123895764351],
-                        [-0.940329909325,-0.334895044565,-0.0602079555392],
-                        [-0.960443258286,-0.199805602431,-0.193975359201],
-                        [-0.935745954514,-0.239766731858,-0.258633822203],
-                        [-0.942551255226,-0.274516820908,-0.190361812711],
-                        [-0.920180141926,-0.34457308054,-0.185843646526],
-                        [-0.891307473183,-0.380633711815,-0.246351331472],
-                        [-0.894335091114,-0.409316182137,-0.180623859167],
-                        [-0.942551255226,-0.274516820908,-0.190361812711],
-                        [-0.920180141926,-0.34457308054,-0.185843646526],
-                        [-0.943842172623,-0.306287169456,-0.123895764351],
-                        [-0.997029185295,0.0770247355103,0.0],
-                        [-0.991025745869,0.117650069296,-0.0634539350867],
-                        [-0.997179210186,0.0394601933658,-0.0638479366899],
-                        [-0.974178731441,0.225778326392,0.0],
-                        [-0.961880862713,0.266443610191,-0.0615878328681],
-                        [-0.979053080082,0.193714544177,-0.0626873448491],
-                        [-0.978907585144,0.158833146095,-0.128498718143],
-                        [-0.960443258286,0.199805602431,-0.193975359201],
-                        [-0.97295331955,0.121444880962,-0.196501940489],
-                        [-0.979053080082,0.193714544177,-0.0626873448491],
-                        [-0.978907585144,0.158833146095,-0.128498718143],
-                        [-0.991025745869,0.117650069296,-0.0634539350867],
-                        [-0.932827115059,0.360324263573,0.0],
-                        [-0.915323853493,0.398431301117,-0.0586068555713],
-                        [-0.940329909325,0.334895044565,-0.0602079555392],
-                        [-0.8796184659,0.475679844618,0.0],
-                        [-0.858619451523,0.509656965733,-0.0549761541188],
-                        [-0.887796461582,0.456712335348,-0.0568443164229],
-                        [-0.892938017845,0.434652328491,-0.117213711143],
-                        [-0.866019308567,0.468421578407,-0.174905076623],
-                        [-0.894335091114,0.409316182137,-0.180623859167],
-                        [-0.887796461582,0.456712335348,-0.0568443164229],
-                        [-0.892938017845,0.434652328491,-0.117213711143],
-                        [-0.915323853493,0.398431301117,-0.0586068555713],
-                        [-0.935745954514,0.239766731858,-0.258633822203],
-                        [-0.905284404755,0.277958005667,-0.321246802807],
-                        [-0.922915279865,0.202408134937,-0.327503234148],
-                        [-0.891307473183,0.380633711815,-0.246351331472],
-                        [-0.857896447182,0.413926929235,-0.3044308424],
-                        [-0.883275330067,0.348686188459,-0.313436716795],
-                        [-0.869839549065,0.313733518124,-0.380723625422],
-                        [-0.830415487289,0.346611320972,-0.436200261116],
-                        [-0.85085272789,0.276221334934,-0.446935534477],
-                        [-0.883275330067,0.348686188459,-0.313436716795],
-                        [-0.869839549065,0.313733518124,-0.380723625422],
-                        [-0.905284404755,0.277958005667,-0.321246802807],
-                        [-0.940329909325,0.334895044565,-0.0602079555392],
-                        [-0.943842172623,0.306287169456,-0.123895764351],
-                        [-0.961880862713,0.266443610191,-0.0615878328681],
-                        [-0.894335091114,0.409316182137,-0.180623859167],
-                        [-0.891307473183,0.380633711815,-0.246351331472],
-                        [-0.920180141926,0.34457308054,-0.185843646526],
-                        [-0.942551255226,0.274516820908,-0.190361812711],
-                        [-0.935745954514,0.239766731858,-0.258633822203],
-                        [-0.960443258286,0.199805602431,-0.193975359201],
-                        [-0.920180141926,0.34457308054,-0.185843646526],
-                        [-0.942551255226,0.274516820908,-0.190361812711],
-                        [-0.943842172623,0.306287169456,-0.123895764351],
-                        [-0.826465010643,-0.236761152744,-0.510783493519],
-                        [-0.797127783298,-0.196083456278,-0.571085453033],
-                        [-0.782811582088,-0.269586592913,-0.560828924179],
-                        [-0.847858190536,-0.0809632539749,-0.524005174637],
-                        [-0.81225925684,-0.0399611219764,-0.581926107407],
-                        [-0.807120084763,-0.119124859571,-0.578244268894],
-                        [-0.763553202152,-0.154971644282,-0.62687343359],
-                        [-0.726636230946,-0.114190116525,-0.677466154099],
-                        [-0.718357801437,-0.188148602843,-0.669747889042],
-                        [-0.807120084763,-0.119124859571,-0.578244268894],
-                        [-0.763553202152,-0.154971644282,-0.62687343359],
-                        [-0.797127783298,-0.196083456278,-0.571085453033],
-                        [-0.847858190536,0.0809632539749,-0.524005174637],
-                        [-0.807120084763,0.119124859571,-0.578244268894],
-                        [-0.81225925684,0.0399611219764,-0.581926107407],
-                        [-0.826465010643,0.236761152744,-0.510783493519],
-                        [-0.782811582088,0.269586592913,-0.560828924179],
-                        [-0.797127783298,0.196083456278,-0.571085453033],
-                        [-0.763553202152,0.154971644282,-0.62687343359],
-                        [-0.718357801437,0.188148602843,-0.669747889042],
-                        [-0.726636230946,0.114190116525,-0.677466154099],
-                        [-0.797127783298,0.196083456278,-0.571085453033],
-                        [-0.763553202152,0.154971644282,-0.62687343359],
-                        [-0.807120084763,0.119124859571,-0.578244268894],
-                        [-0.687358558178,-0.0744211226702,-0.722495436668],
-                        [-0.646693944931,-0.0362210273743,-0.761889100075],
-                        [-0.643326640129,-0.108097285032,-0.757922053337],
-                        [-0.687358558178,0.0744211226702,-0.722495436668],
-                        [-0.643326640129,0.108097285032,-0.757922053337],
-                        [-0.646693944931,0.0362210273743,-0.761889100075],
-                        [-0.605532705784,0.0,-0.79582041502],
-                        [-0.564633131027,0.0339771322906,-0.82464236021],
-                        [-0.564633131027,-0.0339771322906,-0.82464236021],
-                        [-0.646693944931,0.0362210273743,-0.761889100075],
-                        [-0.605532705784,0.0,-0.79582041502],
-                        [-0.646693944931,-0.0362210273743,-0.761889100075],
-                        [-0.81225925684,0.0399611219764,-0.581926107407],
-                        [-0.772890508175,0.0,-0.634539365768],
-                        [-0.81225925684,-0.0399611219764,-0.581926107407],
-                        [-0.726636230946,0.114190116525,-0.677466154099],
-                        [-0.687358558178,0.0744211226702,-0.722495436668],
-                        [-0.730884253979,0.0382858961821,-0.68142670393],
-                        [-0.730884253979,-0.0382858961821,-0.68142670393],
-                        [-0.687358558178,-0.0744211226702,-0.722495436668],
-                        [-0.726636230946,-0.114190116525,-0.677466154099],
-                        [-0.730884253979,0.0382858961821,-0.68142670393],
-                        [-0.730884253979,-0.0382858961821,-0.68142670393],
-                        [-0.772890508175,0.0,-0.634539365768],
-                        [-0.997179210186,0.0394601933658,-0.0638479366899],
-                        [-0.991494178772,0.0,-0.130150929093],
-                        [-0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [-0.97295331955,0.121444880962,-0.196501940489],
-                        [-0.960611641407,0.0820460245013,-0.265506535769],
-                        [-0.979394435883,0.0407496243715,-0.197802826762],
-                        [-0.979394435883,-0.0407496243715,-0.197802826762],
-                        [-0.960611641407,-0.0820460245013,-0.265506535769],
-                        [-0.97295331955,-0.121444880962,-0.196501940489],
-                        [-0.979394435883,0.0407496243715,-0.197802826762],
-                        [-0.979394435883,-0.0407496243715,-0.197802826762],
-                        [-0.991494178772,0.0,-0.130150929093],
-                        [-0.922915279865,0.202408134937,-0.327503234148],
-                        [-0.903840482235,0.162998497486,-0.395605653524],
-                        [-0.935258030891,0.123069040477,-0.33188316226],
-                        [-0.85085272789,0.276221334934,-0.446935534477],
-                        [-0.826465010643,0.236761152744,-0.510783493519],
-                        [-0.867211103439,0.20109423995,-0.455528259277],
-                        [-0.878655850887,0.122248865664,-0.461539924145],
-                        [-0.847858190536,0.0809632539749,-0.524005174637],
-                        [-0.88455080986,0.0410230122507,-0.464636415243],
-                        [-0.867211103439,0.20109423995,-0.455528259277],
-                        [-0.878655850887,0.122248865664,-0.461539924145],
-                        [-0.903840482235,0.162998497486,-0.395605653524],
-                        [-0.935258030891,-0.123069040477,-0.33188316226],
-                        [-0.903840482235,-0.162998497486,-0.395605653524],
-                        [-0.922915279865,-0.202408134937,-0.327503234148],
-                        [-0.88455080986,-0.0410230122507,-0.464636415243],
-                        [-0.847858190536,-0.0809632539749,-0.524005174637],
-                        [-0.878655850887,-0.122248865664,-0.461539924145],
-                        [-0.867211103439,-0.20109423995,-0.455528259277],
-                        [-0.826465010643,-0.236761152744,-0.510783493519],
-                        [-0.85085272789,-0.276221334934,-0.446935534477],
-                        [-0.878655850887,-0.122248865664,-0.461539924145],
-                        [-0.867211103439,-0.20109423995,-0.455528259277],
-                        [-0.903840482235,-0.162998497486,-0.395605653524],
-                        [-0.935258030891,0.123069040477,-0.33188316226],
-                        [-0.941618084908,0.04130198434,-0.334140062332],
-                        [-0.960611641407,0.0820460245013,-0.265506535769],
-                        [-0.88455080986,0.0410230122507,-0.464636415243],
-                        [-0.88455080986,-0.0410230122507,-0.464636415243],
-                        [-0.916092038155,0.0,-0.400968074799],
-                        [-0.941618084908,-0.04130198434,-0.334140062332],
-                        [-0.935258030891,-0.123069040477,-0.33188316226],
-                        [-0.960611641407,-0.0820460245013,-0.265506535769],
-                        [-0.916092038155,0.0,-0.400968074799],
-                        [-0.941618084908,-0.04130198434,-0.334140062332],
-                        [-0.941618084908,0.04130198434,-0.334140062332],
-                        [-0.82464236021,0.564633131027,-0.0339771322906],
-                        [-0.830952167511,0.548688352108,-0.091976031661],
-                        [-0.858619451523,0.509656965733,-0.0549761541188],
-                        [-0.757922053337,0.643326640129,-0.108097285032],
-                        [-0.759706020355,0.627150595188,-0.171839639544],
-                        [-0.798110127449,0.588087081909,-0.131048902869],
-                        [-0.834331154823,0.529480218887,-0.153434738517],
-                        [-0.834127128124,0.506734728813,-0.217834427953],
-                        [-0.866019308567,0.468421578407,-0.174905076623],
-                        [-0.798110127449,0.588087081909,-0.131048902869],
-                        [-0.834331154823,0.529480218887,-0.153434738517],
-                        [-0.830952167511,0.548688352108,-0.091976031661],
-                        [-0.669747889042,0.718357801437,-0.188148602843],
-                        [-0.665616393089,0.700865805149,-0.256401896477],
-                        [-0.715529501438,0.665048420429,-0.213841319084],
-                        [-0.560828924179,0.782811582088,-0.269586592913],
-                        [-0.550243675709,0.762617051601,-0.340069264174],
-                        [-0.610302150249,0.733673810959,-0.298754066229],
-                        [-0.657660841942,0.678621411324,-0.327040165663],
-                        [-0.645450055599,0.65135627985,-0.398910075426],
-                        [-0.701809465885,0.618283927441,-0.353819847107],
-                        [-0.610302150249,0.733673810959,-0.298754066229],
-                        [-0.657660841942,0.678621411324,-0.327040165663],
-                        [-0.665616393089,0.700865805149,-0.256401896477],
-                        [-0.829719662666,0.480284929276,-0.284414708614],
-                        [-0.820587992668,0.450116455555,-0.352179646492],
-                        [-0.857896447182,0.413926929235,-0.3044308424],
-                        [-0.74177056551,0.553625464439,-0.378517180681],
-                        [-0.726413309574,0.520354926586,-0.44894811511],
-                        [-0.776785671711,0.485873311758,-0.400663375854],
-                        [-0.806385576725,0.416404157877,-0.419940322638],
-                        [-0.787004828453,0.379529476166,-0.486395716667],
-                        [-0.830415487289,0.346611320972,-0.436200261116],
-                        [-0.776785671711,0.485873311758,-0.400663375854],
-                        [-0.806385576725,0.416404157877,-0.419940322638],
-                        [-0.820587992668,0.450116455555,-0.352179646492],
-                        [-0.715529501438,0.665048420429,-0.213841319084],
-                        [-0.757998526096,0.606988489628,-0.238753452897],
-                        [-0.759706020355,0.627150595188,-0.171839639544],
-                        [-0.701809465885,0.618283927441,-0.353819847107],
-                        [-0.74177056551,0.553625464439,-0.378517180681],
-                        [-0.752189457417,0.582528710365,-0.308011889458],
-                        [-0.796284377575,0.545040607452,-0.26241543889],
-                        [-0.829719662666,0.480284929276,-0.284414708614],
-                        [-0.834127128124,0.506734728813,-0.217834427953],
-                        [-0.752189457417,0.582528710365,-0.308011889458],
-                        [-0.796284377575,0.545040607452,-0.26241543889],
-                        [-0.757998526096,0.606988489628,-0.238753452897],
-                        [-0.436200261116,0.830415487289,-0.346611320972],
-                        [-0.419940322638,0.806385576725,-0.416404157877],
-                        [-0.486395716667,0.787004828453,-0.379529476166],
-                        [-0.3044308424,0.857896447182,-0.413926929235],
-                        [-0.284414708614,0.829719662666,-0.480284929276],
-                        [-0.352179646492,0.820587992668,-0.450116455555],
-                        [-0.400663375854,0.776785671711,-0.485873311758],
-                        [-0.378517180681,0.74177056551,-0.553625464439],
-                        [-0.44894811511,0.726413309574,-0.520354926586],
-                        [-0.352179646492,0.820587992668,-0.450116455555],
-                        [-0.400663375854,0.776785671711,-0.485873311758],
-                        [-0.419940322638,0.806385576725,-0.416404157877],
-                        [-0.174905076623,0.866019308567,-0.468421578407],
-                        [-0.153434738517,0.834331154823,-0.529480218887],
-                        [-0.217834427953,0.834127128124,-0.506734728813],
-                        [-0.0549761541188,0.858619451523,-0.509656965733],
-                        [-0.0339771322906,0.82464236021,-0.564633131027],
-                        [-0.091976031661,0.830952167511,-0.548688352108],
-                        [-0.131048902869,0.798110127449,-0.588087081909],
-                        [-0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.171839639544,0.759706020355,-0.627150595188],
-                        [-0.091976031661,0.830952167511,-0.548688352108],
-                        [-0.131048902869,0.798110127449,-0.588087081909],
-                        [-0.153434738517,0.834331154823,-0.529480218887],
-                        [-0.353819847107,0.701809465885,-0.618283927441],
-                        [-0.327040165663,0.657660841942,-0.678621411324],
-                        [-0.398910075426,0.645450055599,-0.65135627985],
-                        [-0.213841319084,0.715529501438,-0.665048420429],
-                        [-0.188148602843,0.669747889042,-0.718357801437],
-                        [-0.256401896477,0.665616393089,-0.700865805149],
-                        [-0.298754066229,0.610302150249,-0.733673810959],
-                        [-0.269586592913,0.560828924179,-0.782811582088],
-                        [-0.340069264174,0.550243675709,-0.762617051601],
-                        [-0.256401896477,0.665616393089,-0.700865805149],
-                        [-0.298754066229,0.610302150249,-0.733673810959],
-                        [-0.327040165663,0.657660841942,-0.678621411324],
-                        [-0.217834427953,0.834127128124,-0.506734728813],
-                        [-0.26241543889,0.796284377575,-0.545040607452],
-                        [-0.284414708614,0.829719662666,-0.480284929276],
-                        [-0.171839639544,0.759706020355,-0.627150595188],
-                        [-0.213841319084,0.715529501438,-0.665048420429],
-                        [-0.238753452897,0.757998526096,-0.606988489628],
-                        [-0.308011889458,0.752189457417,-0.582528710365],
-                        [-0.353819847107,0.701809465885,-0.618283927441],
-                        [-0.378517180681,0.74177056551,-0.553625464439],
-                        [-0.238753452897,0.757998526096,-0.606988489628],
-                        [-0.308011889458,0.752189457417,-0.582528710365],
-                        [-0.26241543889,0.796284377575,-0.545040607452],
-                        [-0.762617051601,0.340069264174,-0.550243675709],
-                        [-0.733673810959,0.298754066229,-0.610302150249],
-                        [-0.782811582088,0.269586592913,-0.560828924179],
-                        [-0.65135627985,0.398910075426,-0.645450055599],
-                        [-0.618283927441,0.353819847107,-0.701809465885],
-                        [-0.678621411324,0.327040165663,-0.657660841942],
-                        [-0.700865805149,0.256401896477,-0.665616393089],
-                        [-0.665048420429,0.213841319084,-0.715529501438],
-                        [-0.718357801437,0.188148602843,-0.669747889042],
-                        [-0.678621411324,0.327040165663,-0.657660841942],
-                        [-0.700865805149,0.256401896477,-0.665616393089],
-                        [-0.733673810959,0.298754066229,-0.610302150249],
-                        [-0.520354926586,0.44894811511,-0.726413309574],
-                        [-0.485873311758,0.400663375854,-0.776785671711],
-                        [-0.553625464439,0.378517180681,-0.74177056551],
-                        [-0.379529476166,0.486395716667,-0.787004828453],
-                        [-0.346611320972,0.436200261116,-0.830415487289],
-                        [-0.416404157877,0.419940322638,-0.806385576725],
-                        [-0.450116455555,0.352179646492,-0.820587992668],
-                        [-0.413926929235,0.3044308424,-0.857896447182],
-                        [-0.480284929276,0.284414708614,-0.829719662666],
-                        [-0.416404157877,0.419940322638,-0.806385576725],
-                        [-0.450116455555,0.352179646492,-0.820587992668],
-                        [-0.485873311758,0.400663375854,-0.776785671711],
-                        [-0.627150595188,0.171839639544,-0.759706020355],
-                        [-0.588087081909,0.131048902869,-0.798110127449],
-                        [-0.643326640129,0.108097285032,-0.757922053337],
-                        [-0.506734728813,0.217834427953,-0.834127128124],
-                        [-0.468421578407,0.174905076623,-0.866019308567],
-                        [-0.529480218887,0.153434738517,-0.834331154823],
-                        [-0.548688352108,0.091976031661,-0.830952167511],
-                        [-0.509656965733,0.0549761541188,-0.858619451523],
-                        [-0.564633131027,0.0339771322906,-0.82464236021],
-                        [-0.529480218887,0.153434738517,-0.834331154823],
-                        [-0.548688352108,0.091976031661,-0.830952167511],
-                        [-0.588087081909,0.131048902869,-0.798110127449],
-                        [-0.553625464439,0.378517180681,-0.74177056551],
-                        [-0.582528710365,0.308011889458,-0.752189457417],
-                        [-0.618283927441,0.353819847107,-0.701809465885],
-                        [-0.480284929276,0.284414708614,-0.829719662666],
-                        [-0.506734728813,0.217834427953,-0.834127128124],
-                        [-0.545040607452,0.26241543889,-0.796284377575],
-                        [-0.606988489628,0.238753452897,-0.757998526096],
-                        [-0.627150595188,0.171839639544,-0.759706020355],
-                        [-0.665048420429,0.213841319084,-0.715529501438],
-                        [-0.545040607452,0.26241543889,-0.796284377575],
-                        [-0.606988489628,0.238753452897,-0.757998526096],
-                        [-0.582528710365,0.308011889458,-0.752189457417],
-                        [-0.486395716667,0.787004828453,-0.379529476166],
-                        [-0.535965919495,0.737060189247,-0.411682873964],
-                        [-0.550243675709,0.762617051601,-0.340069264174],
-                        [-0.44894811511,0.726413309574,-0.520354926586],
-                        [-0.495975226164,0.669751524925,-0.552667617798],
-                        [-0.517854511738,0.706037700176,-0.483050197363],
-                        [-0.58378881216,0.680853009224,-0.44230055809],
-                        [-0.628728508949,0.619044244289,-0.470621615648],
-                        [-0.645450055599,0.65135627985,-0.398910075426],
-                        [-0.517854511738,0.706037700176,-0.483050197363],
-                        [-0.58378881216,0.680853009224,-0.44230055809],
-                        [-0.535965919495,0.737060189247,-0.411682873964],
-                        [-0.398910075426,0.645450055599,-0.65135627985],
-                        [-0.44230055809,0.58378881216,-0.680853009224],
-                        [-0.470621615648,0.628728508949,-0.619044244289],
-                        [-0.340069264174,0.550243675709,-0.762617051601],
-                        [-0.379529476166,0.486395716667,-0.787004828453],
-                        [-0.411682873964,0.535965919495,-0.737060189247],
-                        [-0.483050197363,0.517854511738,-0.706037700176],
-                        [-0.520354926586,0.44894811511,-0.726413309574],
-                        [-0.552667617798,0.495975226164,-0.669751524925],
-                        [-0.411682873964,0.535965919495,-0.737060189247],
-                        [-0.483050197363,0.517854511738,-0.706037700176],
-                        [-0.44230055809,0.58378881216,-0.680853009224],
-                        [-0.669751524925,0.552667617798,-0.495975226164],
-                        [-0.706037700176,0.483050197363,-0.517854511738],
-                        [-0.726413309574,0.520354926586,-0.44894811511],
-                        [-0.619044244289,0.470621615648,-0.628728508949],
-                        [-0.65135627985,0.398910075426,-0.645450055599],
-                        [-0.680853009224,0.44230055809,-0.58378881216],
-                        [-0.737060189247,0.411682873964,-0.535965919495],
-                        [-0.762617051601,0.340069264174,-0.550243675709],
-                        [-0.787004828453,0.379529476166,-0.486395716667],
-                        [-0.680853009224,0.44230055809,-0.58378881216],
-                        [-0.737060189247,0.411682873964,-0.535965919495],
-                        [-0.706037700176,0.483050197363,-0.517854511738],
-                        [-0.470621615648,0.628728508949,-0.619044244289],
-                        [-0.540649950504,0.607478022575,-0.581951975822],
-                        [-0.495975226164,0.669751524925,-0.552667617798],
-                        [-0.552667617798,0.495975226164,-0.669751524925],
-                        [-0.619044244289,0.470621615648,-0.628728508949],
-                        [-0.581951975822,0.540649950504,-0.607478022575],
-                        [-0.607478022575,0.581951975822,-0.540649950504],
-                        [-0.669751524925,0.552667617798,-0.495975226164],
-                        [-0.628728508949,0.619044244289,-0.470621615648],
-                        [-0.581951975822,0.540649950504,-0.607478022575],
-                        [-0.607478022575,0.581951975822,-0.540649950504],
-                        [-0.540649950504,0.607478022575,-0.581951975822],
-                        [0.475679844618,0.0,-0.8796184659],
-                        [0.456712335348,0.0568443164229,-0.887796461582],
-                        [0.509656965733,0.0549761541188,-0.858619451523],
-                        [0.360324263573,0.0,-0.932827115059],
-                        [0.334895044565,0.0602079555392,-0.940329909325],
-                        [0.398431301117,0.0586068555713,-0.915323853493],
-                        [0.434652328491,0.117213711143,-0.892938017845],
-                        [0.409316182137,0.180623859167,-0.894335091114],
-                        [0.468421578407,0.174905076623,-0.866019308567],
-                        [0.398431301117,0.0586068555713,-0.915323853493],
-                        [0.434652328491,0.117213711143,-0.892938017845],
-                        [0.456712335348,0.0568443164229,-0.887796461582],
-                        [0.225778326392,0.0,-0.974178731441],
-                        [0.193714544177,0.0626873448491,-0.979053080082],
-                        [0.266443610191,0.0615878328681,-0.961880862713],
-                        [0.0770247355103,0.0,-0.997029185295],
-                        [0.0394601933658,0.0638479366899,-0.997179210186],
-                        [0.117650069296,0.0634539350867,-0.991025745869],
-                        [0.158833146095,0.128498718143,-0.978907585144],
-                        [0.121444880962,0.196501940489,-0.97295331955],
-                        [0.199805602431,0.193975359201,-0.960443258286],
-                        [0.117650069296,0.0634539350867,-0.991025745869],
-                        [0.158833146095,0.128498718143,-0.978907585144],
-                        [0.193714544177,0.0626873448491,-0.979053080082],
-                        [0.380633711815,0.246351331472,-0.891307473183],
-                        [0.348686188459,0.313436716795,-0.883275330067],
-                        [0.413926929235,0.3044308424,-0.857896447182],
-                        [0.239766731858,0.258633822203,-0.935745954514],
-                        [0.202408134937,0.327503234148,-0.922915279865],
-                        [0.277958005667,0.321246802807,-0.905284404755],
-                        [0.313733518124,0.380723625422,-0.869839549065],
-                        [0.276221334934,0.446935534477,-0.85085272789],
-                        [0.346611320972,0.436200261116,-0.830415487289],
-                        [0.277958005667,0.321246802807,-0.905284404755],
-                        [0.313733518124,0.380723625422,-0.869839549065],
-                        [0.348686188459,0.313436716795,-0.883275330067],
-                        [0.266443610191,0.0615878328681,-0.961880862713],
-                        [0.306287169456,0.123895764351,-0.943842172623],
-                        [0.334895044565,0.0602079555392,-0.940329909325],
-                        [0.199805602431,0.193975359201,-0.960443258286],
-                        [0.239766731858,0.258633822203,-0.935745954514],
-                        [0.274516820908,0.190361812711,-0.942551255226],
-                        [0.34457308054,0.185843646526,-0.920180141926],
-                        [0.380633711815,0.246351331472,-0.891307473183],
-                        [0.409316182137,0.180623859167,-0.894335091114],
-                        [0.274516820908,0.190361812711,-0.942551255226],
-                        [0.34457308054,0.185843646526,-0.920180141926],
-                        [0.306287169456,0.123895764351,-0.943842172623],
-                        [-0.0770247355103,0.0,-0.997029185295],
-                        [-0.117650069296,0.0634539350867,-0.991025745869],
-                        [-0.0394601933658,0.0638479366899,-0.997179210186],
-                        [-0.225778326392,0.0,-0.974178731441],
-                        [-0.266443610191,0.0615878328681,-0.961880862713],
-                        [-0.193714544177,0.0626873448491,-0.979053080082],
-                        [-0.158833146095,0.128498718143,-0.978907585144],
-                        [-0.199805602431,0.193975359201,-0.960443258286],
-                        [-0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.193714544177,0.0626873448491,-0.979053080082],
-                        [-0.158833146095,0.128498718143,-0.978907585144],
-                        [-0.117650069296,0.0634539350867,-0.991025745869],
-                        [-0.360324263573,0.0,-0.932827115059],
-                        [-0.398431301117,0.0586068555713,-0.915323853493],
-                        [-0.334895044565,0.0602079555392,-0.940329909325],
-                        [-0.475679844618,0.0,-0.8796184659],
-                        [-0.509656965733,0.0549761541188,-0.858619451523],
-                        [-0.456712335348,0.0568443164229,-0.887796461582],
-                        [-0.434652328491,0.117213711143,-0.892938017845],
-                        [-0.468421578407,0.174905076623,-0.866019308567],
-                        [-0.409316182137,0.180623859167,-0.894335091114],
-                        [-0.456712335348,0.0568443164229,-0.887796461582],
-                        [-0.434652328491,0.117213711143,-0.892938017845],
-                        [-0.398431301117,0.0586068555713,-0.915323853493],
-                        [-0.239766731858,0.258633822203,-0.935745954514],
-                        [-0.277958005667,0.321246802807,-0.905284404755],
-                        [-0.202408134937,0.327503234148,-0.922915279865],
-                        [-0.380633711815,0.246351331472,-0.891307473183],
-                        [-0.413926929235,0.3044308424,-0.857896447182],
-                        [-0.348686188459,0.313436716795,-0.883275330067],
-                        [-0.313733518124,0.380723625422,-0.869839549065],
-                        [-0.346611320972,0.436200261116,-0.830415487289],
-                        [-0.276221334934,0.446935534477,-0.85085272789],
-                        [-0.348686188459,0.313436716795,-0.883275330067],
-                        [-0.313733518124,0.380723625422,-0.869839549065],
-                        [-0.277958005667,0.321246802807,-0.905284404755],
-                        [-0.334895044565,0.0602079555392,-0.940329909325],
-                        [-0.306287169456,0.123895764351,-0.943842172623],
-                        [-0.266443610191,0.0615878328681,-0.961880862713],
-                        [-0.409316182137,0.180623859167,-0.894335091114],
-                        [-0.380633711815,0.246351331472,-0.891307473183],
-                        [-0.34457308054,0.185843646526,-0.920180141926],
-                        [-0.274516820908,0.190361812711,-0.942551255226],
-                        [-0.239766731858,0.258633822203,-0.935745954514],
-                        [-0.199805602431,0.193975359201,-0.960443258286],
-                        [-0.34457308054,0.185843646526,-0.920180141926],
-                        [-0.274516820908,0.190361812711,-0.942551255226],
-                        [-0.306287169456,0.123895764351,-0.943842172623],
-                        [0.236761152744,0.510783493519,-0.826465010643],
-                        [0.196083456278,0.571085453033,-0.797127783298],
-                        [0.269586592913,0.560828924179,-0.782811582088],
-                        [0.0809632539749,0.524005174637,-0.847858190536],
-                        [0.0399611219764,0.581926107407,-0.81225925684],
-                        [0.119124859571,0.578244268894,-0.807120084763],
-                        [0.154971644282,0.62687343359,-0.763553202152],
-                        [0.114190116525,0.677466154099,-0.726636230946],
-                        [0.188148602843,0.669747889042,-0.718357801437],
-                        [0.119124859571,0.578244268894,-0.807120084763],
-                        [0.154971644282,0.62687343359,-0.763553202152],
-                        [0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.0809632539749,0.524005174637,-0.847858190536],
-                        [-0.119124859571,0.578244268894,-0.807120084763],
-                        [-0.0399611219764,0.581926107407,-0.81225925684],
-                        [-0.236761152744,0.510783493519,-0.826465010643],
-                        [-0.269586592913,0.560828924179,-0.782811582088],
-                        [-0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.154971644282,0.62687343359,-0.763553202152],
-                        [-0.188148602843,0.669747889042,-0.718357801437],
-                        [-0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.154971644282,0.62687343359,-0.763553202152],
-                        [-0.119124859571,0.578244268894,-0.807120084763],
-                        [0.0744211226702,0.722495436668,-0.687358558178],
-                        [0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.0744211226702,0.722495436668,-0.687358558178],
-                        [-0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.0,0.79582041502,-0.605532705784],
-                        [-0.0339771322906,0.82464236021,-0.564633131027],
-                        [0.0339771322906,0.82464236021,-0.564633131027],
-                        [-0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.0,0.79582041502,-0.605532705784],
-                        [0.0362210273743,0.761889100075,-0.646693944931],
-                        [-0.0399611219764,0.581926107407,-0.81225925684],
-                        [0.0,0.634539365768,-0.772890508175],
-                        [0.0399611219764,0.581926107407,-0.81225925684],
-                        [-0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.0744211226702,0.722495436668,-0.687358558178],
-                        [-0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0744211226702,0.722495436668,-0.687358558178],
-                        [0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0,0.634539365768,-0.772890508175],
-                        [-0.0394601933658,0.0638479366899,-0.997179210186],
-                        [0.0,0.130150929093,-0.991494178772],
-                        [0.0394601933658,0.0638479366899,-0.997179210186],
-                        [-0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.0820460245013,0.265506535769,-0.960611641407],
-                        [-0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0820460245013,0.265506535769,-0.960611641407],
-                        [0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0,0.130150929093,-0.991494178772],
-                        [-0.202408134937,0.327503234148,-0.922915279865],
-                        [-0.162998497486,0.395605653524,-0.903840482235],
-                        [-0.123069040477,0.33188316226,-0.935258030891],
-                        [-0.276221334934,0.446935534477,-0.85085272789],
-                        [-0.236761152744,0.510783493519,-0.826465010643],
-                        [-0.20109423995,0.455528259277,-0.867211103439],
-                        [-0.122248865664,0.461539924145,-0.878655850887],
-                        [-0.0809632539749,0.524005174637,-0.847858190536],
-                        [-0.0410230122507,0.464636415243,-0.88455080986],
-                        [-0.20109423995,0.455528259277,-0.867211103439],
-                        [-0.122248865664,0.461539924145,-0.878655850887],
-                        [-0.162998497486,0.395605653524,-0.903840482235],
-                        [0.123069040477,0.33188316226,-0.935258030891],
-                        [0.162998497486,0.395605653524,-0.903840482235],
-                        [0.202408134937,0.327503234148,-0.922915279865],
-                        [0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0809632539749,0.524005174637,-0.847858190536],
-                        [0.122248865664,0.461539924145,-0.878655850887],
-                        [0.20109423995,0.455528259277,-0.867211103439],
-                        [0.236761152744,0.510783493519,-0.826465010643],
-                        [0.276221334934,0.446935534477,-0.85085272789],
-                        [0.122248865664,0.461539924145,-0.878655850887],
-                        [0.20109423995,0.455528259277,-0.867211103439],
-                        [0.162998497486,0.395605653524,-0.903840482235],
-                        [-0.123069040477,0.33188316226,-0.935258030891],
-                        [-0.04130198434,0.334140062332,-0.941618084908],
-                        [-0.0820460245013,0.265506535769,-0.960611641407],
-                        [-0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0,0.400968074799,-0.916092038155],
-                        [0.04130198434,0.334140062332,-0.941618084908],
-                        [0.123069040477,0.33188316226,-0.935258030891],
-                        [0.0820460245013,0.265506535769,-0.960611641407],
-                        [0.0,0.400968074799,-0.916092038155],
-                        [0.04130198434,0.334140062332,-0.941618084908],
-                        [-0.04130198434,0.334140062332,-0.941618084908],
-                        [0.509656965733,0.0549761541188,-0.858619451523],
-                        [0.548688352108,0.091976031661,-0.830952167511],
-                        [0.564633131027,0.0339771322906,-0.82464236021],
-                        [0.468421578407,0.174905076623,-0.866019308567],
-                        [0.506734728813,0.217834427953,-0.834127128124],
-                        [0.529480218887,0.153434738517,-0.834331154823],
-                        [0.588087081909,0.131048902869,-0.798110127449],
-                        [0.627150595188,0.171839639544,-0.759706020355],
-                        [0.643326640129,0.108097285032,-0.757922053337],
-                        [0.529480218887,0.153434738517,-0.834331154823],
-                        [0.588087081909,0.131048902869,-0.798110127449],
-                        [0.548688352108,0.091976031661,-0.830952167511],
-                        [0.413926929235,0.3044308424,-0.857896447182],
-                        [0.450116455555,0.352179646492,-0.820587992668],
-                        [0.480284929276,0.284414708614,-0.829719662666],
-                        [0.346611320972,0.436200261116,-0.830415487289],
-                        [0.379529476166,0.486395716667,-0.787004828453],
-                        [0.416404157877,0.419940322638,-0.806385576725],
-                        [0.485873311758,0.400663375854,-0.776785671711],
-                        [0.520354926586,0.44894811511,-0.726413309574],
-                        [0.553625464439,0.378517180681,-0.74177056551],
-                        [0.416404157877,0.419940322638,-0.806385576725],
-                        [0.485873311758,0.400663375854,-0.776785671711],
-                        [0.450116455555,0.352179646492,-0.820587992668],
-                        [0.665048420429,0.213841319084,-0.715529501438],
-                        [0.700865805149,0.256401896477,-0.665616393089],
-                        [0.718357801437,0.188148602843,-0.669747889042],
-                        [0.618283927441,0.353819847107,-0.701809465885],
-                        [0.65135627985,0.398910075426,-0.645450055599],
-                        [0.678621411324,0.327040165663,-0.657660841942],
-                        [0.733673810959,0.298754066229,-0.610302150249],
-                        [0.762617051601,0.340069264174,-0.550243675709],
-                        [0.782811582088,0.269586592913,-0.560828924179],
-                        [0.678621411324,0.327040165663,-0.657660841942],
-                        [0.733673810959,0.298754066229,-0.610302150249],
-                        [0.700865805149,0.256401896477,-0.665616393089],
-                        [0.480284929276,0.284414708614,-0.829719662666],
-                        [0.545040607452,0.26241543889,-0.796284377575],
-                        [0.506734728813,0.217834427953,-0.834127128124],
-                        [0.553625464439,0.378517180681,-0.74177056551],
-                        [0.618283927441,0.353819847107,-0.701809465885],
-                        [0.582528710365,0.308011889458,-0.752189457417],
-                        [0.606988489628,0.238753452897,-0.757998526096],
-                        [0.665048420429,0.213841319084,-0.715529501438],
-                        [0.627150595188,0.171839639544,-0.759706020355],
-                        [0.582528710365,0.308011889458,-0.752189457417],
-                        [0.606988489628,0.238753452897,-0.757998526096],
-                        [0.545040607452,0.26241543889,-0.796284377575],
-                        [0.269586592913,0.560828924179,-0.782811582088],
-                        [0.298754066229,0.610302150249,-0.733673810959],
-                        [0.340069264174,0.550243675709,-0.762617051601],
-                        [0.188148602843,0.669747889042,-0.718357801437],
-                        [0.213841319084,0.715529501438,-0.665048420429],
-                        [0.256401896477,0.665616393089,-0.700865805149],
-                        [0.327040165663,0.657660841942,-0.678621411324],
-                        [0.353819847107,0.701809465885,-0.618283927441],
-                        [0.398910075426,0.645450055599,-0.65135627985],
-                        [0.256401896477,0.665616393089,-0.700865805149],
-                        [0.327040165663,0.657660841942,-0.678621411324],
-                        [0.298754066229,0.610302150249,-0.733673810959],
-                        [0.108097285032,0.757922053337,-0.643326640129],
-                        [0.131048902869,0.798110127449,-0.588087081909],
-                        [0.171839639544,0.759706020355,-0.627150595188],
-                        [0.0339771322906,0.82464236021,-0.564633131027],
-                        [0.0549761541188,0.858619451523,-0.509656965733],
-                        [0.091976031661,0.830952167511,-0.548688352108],
-                        [0.153434738517,0.834331154823,-0.529480218887],
-                        [0.174905076623,0.866019308567,-0.468421578407],
-                        [0.217834427953,0.834127128124,-0.506734728813],
-                        [0.091976031661,0.830952167511,-0.548688352108],
-                        [0.153434738517,0.834331154823,-0.529480218887],
-                        [0.131048902869,0.798110127449,-0.588087081909],
-                        [0.378517180681,0.74177056551,-0.553625464439],
-                        [0.400663375854,0.776785671711,-0.485873311758],
-                        [0.44894811511,0.726413309574,-0.520354926586],
-                        [0.284414708614,0.829719662666,-0.480284929276],
-                        [0.3044308424,0.857896447182,-0.413926929235],
-                        [0.352179646492,0.820587992668,-0.450116455555],
-                        [0.419940322638,0.806385576725,-0.416404157877],
-                        [0.436200261116,0.830415487289,-0.346611320972],
-                        [0.486395716667,0.787004828453,-0.379529476166],
-                        [0.352179646492,0.820587992668,-0.450116455555],
-                        [0.419940322638,0.806385576725,-0.416404157877],
-                        [0.400663375854,0.776785671711,-0.485873311758],
-                        [0.171839639544,0.759706020355,-0.627150595188],
-                        [0.238753452897,0.757998526096,-0.606988489628],
-                        [0.213841319084,0.715529501438,-0.665048420429],
-                        [0.217834427953,0.834127128124,-0.506734728813],
-                        [0.284414708614,0.829719662666,-0.480284929276],
-                        [0.26241543889,0.796284377575,-0.545040607452],
-                        [0.308011889458,0.752189457417,-0.582528710365],
-                        [0.378517180681,0.74177056551,-0.553625464439],
-                        [0.353819847107,0.701809465885,-0.618283927441],
-                        [0.26241543889,0.796284377575,-0.545040607452],
-                        [0.308011889458,0.752189457417,-0.582528710365],
-                        [0.238753452897,0.757998526096,-0.606988489628],
-                        [0.787004828453,0.379529476166,-0.486395716667],
-                        [0.806385576725,0.416404157877,-0.419940322638],
-                        [0.830415487289,0.346611320972,-0.436200261116],
-                        [0.726413309574,0.520354926586,-0.44894811511],
-                        [0.74177056551,0.553625464439,-0.378517180681],
-                        [0.776785671711,0.485873311758,-0.400663375854],
-                        [0.820587992668,0.450116455555,-0.352179646492],
-                        [0.829719662666,0.480284929276,-0.284414708614],
-                        [0.857896447182,0.413926929235,-0.3044308424],
-                        [0.776785671711,0.485873311758,-0.400663375854],
-                        [0.820587992668,0.450116455555,-0.352179646492],
-                        [0.806385576725,0.416404157877,-0.419940322638],
-                        [0.645450055599,0.65135627985,-0.398910075426],
-                        [0.657660841942,0.678621411324,-0.327040165663],
-                        [0.701809465885,0.618283927441,-0.353819847107],
-                        [0.550243675709,0.762617051601,-0.340069264174],
-                        [0.560828924179,0.782811582088,-0.269586592913],
-                        [0.610302150249,0.733673810959,-0.298754066229],
-                        [0.665616393089,0.700865805149,-0.256401896477],
-                        [0.669747889042,0.718357801437,-0.188148602843],
-                        [0.715529501438,0.665048420429,-0.213841319084],
-                        [0.610302150249,0.733673810959,-0.298754066229],
-                        [0.665616393089,0.700865805149,-0.256401896477],
-                        [0.657660841942,0.678621411324,-0.327040165663],
-                        [0.834127128124,0.506734728813,-0.217834427953],
-                        [0.834331154823,0.529480218887,-0.153434738517],
-                        [0.866019308567,0.468421578407,-0.174905076623],
-                        [0.759706020355,0.627150595188,-0.171839639544],
-                        [0.757922053337,0.643326640129,-0.108097285032],
-                        [0.798110127449,0.588087081909,-0.131048902869],
-                        [0.830952167511,0.548688352108,-0.091976031661],
-                        [0.82464236021,0.564633131027,-0.0339771322906],
-                        [0.858619451523,0.509656965733,-0.0549761541188],
-                        [0.798110127449,0.588087081909,-0.131048902869],
-                        [0.830952167511,0.548688352108,-0.091976031661],
-                        [0.834331154823,0.529480218887,-0.153434738517],
-                        [0.701809465885,0.618283927441,-0.353819847107],
-                        [0.752189457417,0.582528710365,-0.308011889458],
-                        [0.74177056551,0.553625464439,-0.378517180681],
-                        [0.715529501438,0.665048420429,-0.213841319084],
-                        [0.759706020355,0.627150595188,-0.171839639544],
-                        [0.757998526096,0.606988489628,-0.238753452897],
-                        [0.796284377575,0.545040607452,-0.26241543889],
-                        [0.834127128124,0.506734728813,-0.217834427953],
-                        [0.829719662666,0.480284929276,-0.284414708614],
-                        [0.757998526096,0.606988489628,-0.238753452897],
-                        [0.796284377575,0.545040607452,-0.26241543889],
-                        [0.752189457417,0.582528710365,-0.308011889458],
-                        [0.340069264174,0.550243675709,-0.762617051601],
-                        [0.411682873964,0.535965919495,-0.737060189247],
-                        [0.379529476166,0.486395716667,-0.787004828453],
-                        [0.398910075426,0.645450055599,-0.65135627985],
-                        [0.470621615648,0.628728508949,-0.619044244289],
-                        [0.44230055809,0.58378881216,-0.680853009224],
-                        [0.483050197363,0.517854511738,-0.706037700176],
-                        [0.552667617798,0.495975226164,-0.669751524925],
-                        [0.520354926586,0.44894811511,-0.726413309574],
-                        [0.44230055809,0.58378881216,-0.680853009224],
-                        [0.483050197363,0.517854511738,-0.706037700176],
-                        [0.411682873964,0.535965919495,-0.737060189247],
-                        [0.44894811511,0.726413309574,-0.520354926586],
-                        [0.517854511738,0.706037700176,-0.483050197363],
-                        [0.495975226164,0.669751524925,-0.552667617798],
-                        [0.486395716667,0.787004828453,-0.379529476166],
-                        [0.550243675709,0.762617051601,-0.340069264174],
-                        [0.535965919495,0.737060189247,-0.411682873964],
-                        [0.58378881216,0.680853009224,-0.44230055809],
-                        [0.645450055599,0.65135627985,-0.398910075426],
-                        [0.628728508949,0.619044244289,-0.470621615648],
-                        [0.535965919495,0.737060189247,-0.411682873964],
-                        [0.58378881216,0.680853009224,-0.44230055809],
-                        [0.517854511738,0.706037700176,-0.483050197363],
-                        [0.619044244289,0.470621615648,-0.628728508949],
-                        [0.680853009224,0.44230055809,-0.58378881216],
-                        [0.65135627985,0.398910075426,-0.645450055599],
-                        [0.669751524925,0.552667617798,-0.495975226164],
-                        [0.726413309574,0.520354926586,-0.44894811511],
-                        [0.706037700176,0.483050197363,-0.517854511738],
-                        [0.737060189247,0.411682873964,-0.535965919495],
-                        [0.787004828453,0.379529476166,-0.486395716667],
-                        [0.762617051601,0.340069264174,-0.550243675709],
-                        [0.706037700176,0.483050197363,-0.517854511738],
-                        [0.737060189247,0.411682873964,-0.535965919495],
-                        [0.680853009224,0.44230055809,-0.58378881216],
-                        [0.495975226164,0.669751524925,-0.552667617798],
-                        [0.540649950504,0.607478022575,-0.581951975822],
-                        [0.470621615648,0.628728508949,-0.619044244289],
-                        [0.628728508949,0.619044244289,-0.470621615648],
-                        [0.669751524925,0.552667617798,-0.495975226164],
-                        [0.607478022575,0.581951975822,-0.540649950504],
-                        [0.581951975822,0.540649950504,-0.607478022575],
-                        [0.619044244289,0.470621615648,-0.628728508949],
-                        [0.552667617798,0.495975226164,-0.669751524925],
-                        [0.607478022575,0.581951975822,-0.540649950504],
-                        [0.581951975822,0.540649950504,-0.607478022575],
-                        [0.540649950504,0.607478022575,-0.581951975822],
-                        [0.82464236021,0.564633131027,-0.0339771322906],
-                        [0.79582041502,0.605532705784,0.0],
-                        [0.82464236021,0.564633131027,0.0339771322906],
-                        [0.757922053337,0.643326640129,-0.108097285032],
-                        [0.722495436668,0.687358558178,-0.0744211226702],
-                        [0.761889100075,0.646693944931,-0.0362210273743],
-                        [0.761889100075,0.646693944931,0.0362210273743],
-                        [0.722495436668,0.687358558178,0.0744211226702],
-                        [0.757922053337,0.643326640129,0.108097285032],
-                        [0.761889100075,0.646693944931,-0.0362210273743],
-                        [0.761889100075,0.646693944931,0.0362210273743],
-                        [0.79582041502,0.605532705784,0.0],
-                        [0.669747889042,0.718357801437,-0.188148602843],
-                        [0.62687343359,0.763553202152,-0.154971644282],
-                        [0.677466154099,0.726636230946,-0.114190116525],
-                        [0.560828924179,0.782811582088,-0.269586592913],
-                        [0.510783493519,0.826465010643,-0.236761152744],
-                        [0.571085453033,0.797127783298,-0.196083456278],
-                        [0.578244268894,0.807120084763,-0.119124859571],
-                        [0.524005174637,0.847858190536,-0.0809632539749],
-                        [0.581926107407,0.81225925684,-0.0399611219764],
-                        [0.571085453033,0.797127783298,-0.196083456278],
-                        [0.578244268894,0.807120084763,-0.119124859571],
-                        [0.62687343359,0.763553202152,-0.154971644282],
-                        [0.677466154099,0.726636230946,0.114190116525],
-                        [0.62687343359,0.763553202152,0.154971644282],
-                        [0.669747889042,0.718357801437,0.188148602843],
-                        [0.581926107407,0.81225925684,0.0399611219764],
-                        [0.524005174637,0.847858190536,0.0809632539749],
-                        [0.578244268894,0.807120084763,0.119124859571],
-                        [0.571085453033,0.797127783298,0.196083456278],
-                        [0.510783493519,0.826465010643,0.236761152744],
-                        [0.560828924179,0.782811582088,0.269586592913],
-                        [0.578244268894,0.807120084763,0.119124859571],
-                        [0.571085453033,0.797127783298,0.196083456278],
-                        [0.62687343359,0.763553202152,0.154971644282],
-                        [0.677466154099,0.726636230946,-0.114190116525],
-                        [0.68142670393,0.730884253979,-0.0382858961821],
-                        [0.722495436668,0.687358558178,-0.0744211226702],
-                        [0.581926107407,0.81225925684,-0.0399611219764],
-                        [0.581926107407,0.81225925684,0.0399611219764],
-                        [0.634539365768,0.772890508175,0.0],
-                        [0.68142670393,0.730884253979,0.0382858961821],
-                        [0.677466154099,0.726636230946,0.114190116525],
-                        [0.722495436668,0.687358558178,0.0744211226702],
-                        [0.634539365768,0.772890508175,0.0],
-                        [0.68142670393,0.730884253979,0.0382858961821],
-                        [0.68142670393,0.730884253979,-0.0382858961821],
-                        [0.436200261116,0.830415487289,-0.346611320972],
-                        [0.380723625422,0.869839549065,-0.313733518124],
-                        [0.446935534477,0.85085272789,-0.276221334934],
-                        [0.3044308424,0.857896447182,-0.413926929235],
-                        [0.246351331472,0.891307473183,-0.380633711815],
-                        [0.313436716795,0.883275330067,-0.348686188459],
-                        [0.321246802807,0.905284404755,-0.277958005667],
-                        [0.258633822203,0.935745954514,-0.239766731858],
-                        [0.327503234148,0.922915279865,-0.202408134937],
-                        [0.313436716795,0.883275330067,-0.348686188459],
-                        [0.321246802807,0.905284404755,-0.277958005667],
-                        [0.380723625422,0.869839549065,-0.313733518124],
-                        [0.174905076623,0.866019308567,-0.468421578407],
-                        [0.117213711143,0.892938017845,-0.434652328491],
-                        [0.180623859167,0.894335091114,-0.409316182137],
-                        [0.0549761541188,0.858619451523,-0.509656965733],
-                        [0.0,0.8796184659,-0.475679844618],
-                        [0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0586068555713,0.915323853493,-0.398431301117],
-                        [0.0,0.932827115059,-0.360324263573],
-                        [0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0586068555713,0.915323853493,-0.398431301117],
-                        [0.117213711143,0.892938017845,-0.434652328491],
-                        [0.193975359201,0.960443258286,-0.199805602431],
-                        [0.128498718143,0.978907585144,-0.158833146095],
-                        [0.196501940489,0.97295331955,-0.121444880962],
-                        [0.0615878328681,0.961880862713,-0.266443610191],
-                        [0.0,0.974178731441,-0.225778326392],
-                        [0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0634539350867,0.991025745869,-0.117650069296],
-                        [0.0,0.997029185295,-0.0770247355103],
-                        [0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0634539350867,0.991025745869,-0.117650069296],
-                        [0.128498718143,0.978907585144,-0.158833146095],
-                        [0.180623859167,0.894335091114,-0.409316182137],
-                        [0.185843646526,0.920180141926,-0.34457308054],
-                        [0.246351331472,0.891307473183,-0.380633711815],
-                        [0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0615878328681,0.961880862713,-0.266443610191],
-                        [0.123895764351,0.943842172623,-0.306287169456],
-                        [0.190361812711,0.942551255226,-0.274516820908],
-                        [0.193975359201,0.960443258286,-0.199805602431],
-                        [0.258633822203,0.935745954514,-0.239766731858],
-                        [0.123895764351,0.943842172623,-0.306287169456],
-                        [0.190361812711,0.942551255226,-0.274516820908],
-                        [0.185843646526,0.920180141926,-0.34457308054],
-                        [0.446935534477,0.85085272789,0.276221334934],
-                        [0.380723625422,0.869839549065,0.313733518124],
-                        [0.436200261116,0.830415487289,0.346611320972],
-                        [0.327503234148,0.922915279865,0.202408134937],
-                        [0.258633822203,0.935745954514,0.239766731858],
-                        [0.321246802807,0.905284404755,0.277958005667],
-                        [0.313436716795,0.883275330067,0.348686188459],
-                        [0.246351331472,0.891307473183,0.380633711815],
-                        [0.3044308424,0.857896447182,0.413926929235],
-                        [0.321246802807,0.905284404755,0.277958005667],
-                        [0.313436716795,0.883275330067,0.348686188459],
-                        [0.380723625422,0.869839549065,0.313733518124],
-                        [0.196501940489,0.97295331955,0.121444880962],
-                        [0.128498718143,0.978907585144,0.158833146095],
-                        [0.193975359201,0.960443258286,0.199805602431],
-                        [0.0638479366899,0.997179210186,0.0394601933658],
-                        [0.0,0.997029185295,0.0770247355103],
-                        [0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0626873448491,0.979053080082,0.193714544177],
-                        [0.0,0.974178731441,0.225778326392],
-                        [0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0626873448491,0.979053080082,0.193714544177],
-                        [0.128498718143,0.978907585144,0.158833146095],
-                        [0.180623859167,0.894335091114,0.409316182137],
-                        [0.117213711143,0.892938017845,0.434652328491],
-                        [0.174905076623,0.866019308567,0.468421578407],
-                        [0.0602079555392,0.940329909325,0.334895044565],
-                        [0.0,0.932827115059,0.360324263573],
-                        [0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0568443164229,0.887796461582,0.456712335348],
-                        [0.0,0.8796184659,0.475679844618],
-                        [0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0568443164229,0.887796461582,0.456712335348],
-                        [0.117213711143,0.892938017845,0.434652328491],
-                        [0.193975359201,0.960443258286,0.199805602431],
-                        [0.190361812711,0.942551255226,0.274516820908],
-                        [0.258633822203,0.935745954514,0.239766731858],
-                        [0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0602079555392,0.940329909325,0.334895044565],
-                        [0.123895764351,0.943842172623,0.306287169456],
-                        [0.185843646526,0.920180141926,0.34457308054],
-                        [0.180623859167,0.894335091114,0.409316182137],
-                        [0.246351331472,0.891307473183,0.380633711815],
-                        [0.123895764351,0.943842172623,0.306287169456],
-                        [0.185843646526,0.920180141926,0.34457308054],
-                        [0.190361812711,0.942551255226,0.274516820908],
-                        [0.446935534477,0.85085272789,-0.276221334934],
-                        [0.455528259277,0.867211103439,-0.20109423995],
-                        [0.510783493519,0.826465010643,-0.236761152744],
-                        [0.327503234148,0.922915279865,-0.202408134937],
-                        [0.33188316226,0.935258030891,-0.123069040477],
-                        [0.395605653524,0.903840482235,-0.162998497486],
-                        [0.461539924145,0.878655850887,-0.122248865664],
-                        [0.464636415243,0.88455080986,-0.0410230122507],
-                        [0.524005174637,0.847858190536,-0.0809632539749],
-                        [0.395605653524,0.903840482235,-0.162998497486],
-                        [0.461539924145,0.878655850887,-0.122248865664],
-                        [0.455528259277,0.867211103439,-0.20109423995],
-                        [0.196501940489,0.97295331955,-0.121444880962],
-                        [0.197802826762,0.979394435883,-0.0407496243715],
-                        [0.265506535769,0.960611641407,-0.0820460245013],
-                        [0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0638479366899,0.997179210186,0.0394601933658],
-                        [0.130150929093,0.991494178772,0.0],
-                        [0.197802826762,0.979394435883,0.0407496243715],
-                        [0.196501940489,0.97295331955,0.121444880962],
-                        [0.265506535769,0.960611641407,0.0820460245013],
-                        [0.130150929093,0.991494178772,0.0],
-                        [0.197802826762,0.979394435883,0.0407496243715],
-                        [0.197802826762,0.979394435883,-0.0407496243715],
-                        [0.464636415243,0.88455080986,0.0410230122507],
-                        [0.461539924145,0.878655850887,0.122248865664],
-                        [0.524005174637,0.847858190536,0.0809632539749],
-                        [0.33188316226,0.935258030891,0.123069040477],
-                        [0.327503234148,0.922915279865,0.202408134937],
-                        [0.395605653524,0.903840482235,0.162998497486],
-                        [0.455528259277,0.867211103439,0.20109423995],
-                        [0.446935534477,0.85085272789,0.276221334934],
-                        [0.510783493519,0.826465010643,0.236761152744],
-                        [0.395605653524,0.903840482235,0.162998497486],
-                        [0.455528259277,0.867211103439,0.20109423995],
-                        [0.461539924145,0.878655850887,0.122248865664],
-                        [0.265506535769,0.960611641407,-0.0820460245013],
-                        [0.334140062332,0.941618084908,-0.04130198434],
-                        [0.33188316226,0.935258030891,-0.123069040477],
-                        [0.265506535769,0.960611641407,0.0820460245013],
-                        [0.33188316226,0.935258030891,0.123069040477],
-                        [0.334140062332,0.941618084908,0.04130198434],
-                        [0.400968074799,0.916092038155,0.0],
-                        [0.464636415243,0.88455080986,0.0410230122507],
-                        [0.464636415243,0.88455080986,-0.0410230122507],
-                        [0.334140062332,0.941618084908,0.04130198434],
-                        [0.400968074799,0.916092038155,0.0],
-                        [0.334140062332,0.941618084908,-0.04130198434],
-                        [0.82464236021,0.564633131027,0.0339771322906],
-                        [0.830952167511,0.548688352108,0.091976031661],
-                        [0.858619451523,0.509656965733,0.0549761541188],
-                        [0.757922053337,0.643326640129,0.108097285032],
-                        [0.759706020355,0.627150595188,0.171839639544],
-                        [0.798110127449,0.588087081909,0.131048902869],
-                        [0.834331154823,0.529480218887,0.153434738517],
-                        [0.834127128124,0.506734728813,0.217834427953],
-                        [0.866019308567,0.468421578407,0.174905076623],
-                        [0.798110127449,0.588087081909,0.131048902869],
-                        [0.834331154823,0.529480218887,0.153434738517],
-                        [0.830952167511,0.548688352108,0.091976031661],
-                        [0.669747889042,0.718357801437,0.188148602843],
-                        [0.665616393089,0.700865805149,0.256401896477],
-                        [0.715529501438,0.665048420429,0.213841319084],
-                        [0.560828924179,0.782811582088,0.269586592913],
-                        [0.550243675709,0.762617051601,0.340069264174],
-                        [0.610302150249,0.733673810959,0.298754066229],
-                        [0.657660841942,0.678621411324,0.327040165663],
-                        [0.645450055599,0.65135627985,0.398910075426],
-                        [0.701809465885,0.618283927441,0.353819847107],
-                        [0.610302150249,0.733673810959,0.298754066229],
-                        [0.657660841942,0.678621411324,0.327040165663],
-                        [0.665616393089,0.700865805149,0.256401896477],
-                        [0.829719662666,0.480284929276,0.284414708614],
-                        [0.820587992668,0.450116455555,0.352179646492],
-                        [0.857896447182,0.413926929235,0.3044308424],
-                        [0.74177056551,0.553625464439,0.378517180681],
-                        [0.726413309574,0.520354926586,0.44894811511],
-                        [0.776785671711,0.485873311758,0.400663375854],
-                        [0.806385576725,0.416404157877,0.419940322638],
-                        [0.787004828453,0.379529476166,0.486395716667],
-                        [0.830415487289,0.346611320972,0.436200261116],
-                        [0.776785671711,0.485873311758,0.400663375854],
-                        [0.806385576725,0.416404157877,0.419940322638],
-                        [0.820587992668,0.450116455555,0.352179646492],
-                        [0.715529501438,0.665048420429,0.213841319084],
-                        [0.757998526096,0.606988489628,0.238753452897],
-                        [0.759706020355,0.627150595188,0.171839639544],
-                        [0.701809465885,0.618283927441,0.353819847107],
-                        [0.74177056551,0.553625464439,0.378517180681],
-                        [0.752189457417,0.582528710365,0.308011889458],
-                        [0.796284377575,0.545040607452,0.26241543889],
-                        [0.829719662666,0.480284929276,0.284414708614],
-                        [0.834127128124,0.506734728813,0.217834427953],
-                        [0.752189457417,0.582528710365,0.308011889458],
-                        [0.796284377575,0.545040607452,0.26241543889],
-                        [0.757998526096,0.606988489628,0.238753452897],
-                        [0.436200261116,0.830415487289,0.346611320972],
-                        [0.419940322638,0.806385576725,0.416404157877],
-                        [0.486395716667,0.787004828453,0.379529476166],
-                        [0.3044308424,0.857896447182,0.413926929235],
-                        [0.284414708614,0.829719662666,0.480284929276],
-                        [0.352179646492,0.820587992668,0.450116455555],
-                        [0.400663375854,0.776785671711,0.485873311758],
-                        [0.378517180681,0.74177056551,0.553625464439],
-                        [0.44894811511,0.726413309574,0.520354926586],
-                        [0.352179646492,0.820587992668,0.450116455555],
-                        [0.400663375854,0.776785671711,0.485873311758],
-                        [0.419940322638,0.806385576725,0.416404157877],
-                        [0.174905076623,0.866019308567,0.468421578407],
-                        [0.153434738517,0.834331154823,0.529480218887],
-                        [0.217834427953,0.834127128124,0.506734728813],
-                        [0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0339771322906,0.82464236021,0.564633131027],
-                        [0.091976031661,0.830952167511,0.548688352108],
-                        [0.131048902869,0.798110127449,0.588087081909],
-                        [0.108097285032,0.757922053337,0.643326640129],
-                        [0.171839639544,0.759706020355,0.627150595188],
-                        [0.091976031661,0.830952167511,0.548688352108],
-                        [0.131048902869,0.798110127449,0.588087081909],
-                        [0.153434738517,0.834331154823,0.529480218887],
-                        [0.353819847107,0.701809465885,0.618283927441],
-                        [0.327040165663,0.657660841942,0.678621411324],
-                        [0.398910075426,0.645450055599,0.65135627985],
-                        [0.213841319084,0.715529501438,0.665048420429],
-                        [0.188148602843,0.669747889042,0.718357801437],
-                        [0.256401896477,0.665616393089,0.700865805149],
-                        [0.298754066229,0.610302150249,0.733673810959],
-                        [0.269586592913,0.560828924179,0.782811582088],
-                        [0.340069264174,0.550243675709,0.762617051601],
-                        [0.256401896477,0.665616393089,0.700865805149],
-                        [0.298754066229,0.610302150249,0.733673810959],
-                        [0.327040165663,0.657660841942,0.678621411324],
-                        [0.217834427953,0.834127128124,0.506734728813],
-                        [0.26241543889,0.796284377575,0.545040607452],
-                        [0.284414708614,0.829719662666,0.480284929276],
-                        [0.171839639544,0.759706020355,0.627150595188],
-                        [0.213841319084,0.715529501438,0.665048420429],
-                        [0.238753452897,0.757998526096,0.606988489628],
-                        [0.308011889458,0.752189457417,0.582528710365],
-                        [0.353819847107,0.701809465885,0.618283927441],
-                        [0.378517180681,0.74177056551,0.553625464439],
-                        [0.238753452897,0.757998526096,0.606988489628],
-                        [0.308011889458,0.752189457417,0.582528710365],
-                        [0.26241543889,0.796284377575,0.545040607452],
-                        [0.762617051601,0.340069264174,0.550243675709],
-                        [0.733673810959,0.298754066229,0.610302150249],
-                        [0.782811582088,0.269586592913,0.560828924179],
-                        [0.65135627985,0.398910075426,0.645450055599],
-                        [0.618283927441,0.353819847107,0.701809465885],
-                        [0.678621411324,0.327040165663,0.657660841942],
-                        [0.700865805149,0.256401896477,0.665616393089],
-                        [0.665048420429,0.213841319084,0.715529501438],
-                        [0.718357801437,0.188148602843,0.669747889042],
-                        [0.678621411324,0.327040165663,0.657660841942],
-                        [0.700865805149,0.256401896477,0.665616393089],
-                        [0.733673810959,0.298754066229,0.610302150249],
-                        [0.520354926586,0.44894811511,0.726413309574],
-                        [0.485873311758,0.400663375854,0.776785671711],
-                        [0.553625464439,0.378517180681,0.74177056551],
-                        [0.379529476166,0.486395716667,0.787004828453],
-                        [0.346611320972,0.436200261116,0.830415487289],
-                        [0.416404157877,0.419940322638,0.806385576725],
-                        [0.450116455555,0.352179646492,0.820587992668],
-                        [0.413926929235,0.3044308424,0.857896447182],
-                        [0.480284929276,0.284414708614,0.829719662666],
-                        [0.416404157877,0.419940322638,0.806385576725],
-                        [0.450116455555,0.352179646492,0.820587992668],
-                        [0.485873311758,0.400663375854,0.776785671711],
-                        [0.627150595188,0.171839639544,0.759706020355],
-                        [0.588087081909,0.131048902869,0.798110127449],
-                        [0.643326640129,0.108097285032,0.757922053337],
-                        [0.506734728813,0.217834427953,0.834127128124],
-                        [0.468421578407,0.174905076623,0.866019308567],
-                        [0.529480218887,0.153434738517,0.834331154823],
-                        [0.548688352108,0.091976031661,0.830952167511],
-                        [0.509656965733,0.0549761541188,0.858619451523],
-                        [0.564633131027,0.0339771322906,0.82464236021],
-                        [0.529480218887,0.153434738517,0.834331154823],
-                        [0.548688352108,0.091976031661,0.830952167511],
-                        [0.588087081909,0.131048902869,0.798110127449],
-                        [0.553625464439,0.378517180681,0.74177056551],
-                        [0.582528710365,0.308011889458,0.752189457417],
-                        [0.618283927441,0.353819847107,0.701809465885],
-                        [0.480284929276,0.284414708614,0.829719662666],
-                        [0.506734728813,0.217834427953,0.834127128124],
-                        [0.545040607452,0.26241543889,0.796284377575],
-                        [0.606988489628,0.238753452897,0.757998526096],
-                        [0.627150595188,0.171839639544,0.759706020355],
-                        [0.665048420429,0.213841319084,0.715529501438],
-                        [0.545040607452,0.26241543889,0.796284377575],
-                        [0.606988489628,0.238753452897,0.757998526096],
-                        [0.582528710365,0.308011889458,0.752189457417],
-                        [0.486395716667,0.787004828453,0.379529476166],
-                        [0.535965919495,0.737060189247,0.411682873964],
-                        [0.550243675709,0.762617051601,0.340069264174],
-                        [0.44894811511,0.726413309574,0.520354926586],
-                        [0.495975226164,0.669751524925,0.552667617798],
-                        [0.517854511738,0.706037700176,0.483050197363],
-                        [0.58378881216,0.680853009224,0.44230055809],
-                        [0.628728508949,0.619044244289,0.470621615648],
-                        [0.645450055599,0.65135627985,0.398910075426],
-                        [0.517854511738,0.706037700176,0.483050197363],
-                        [0.58378881216,0.680853009224,0.44230055809],
-                        [0.535965919495,0.737060189247,0.411682873964],
-                        [0.398910075426,0.645450055599,0.65135627985],
-                        [0.44230055809,0.58378881216,0.680853009224],
-                        [0.470621615648,0.628728508949,0.619044244289],
-                        [0.340069264174,0.550243675709,0.762617051601],
-                        [0.379529476166,0.486395716667,0.787004828453],
-                        [0.411682873964,0.535965919495,0.737060189247],
-                        [0.483050197363,0.517854511738,0.706037700176],
-                        [0.520354926586,0.44894811511,0.726413309574],
-                        [0.552667617798,0.495975226164,0.669751524925],
-                        [0.411682873964,0.535965919495,0.737060189247],
-                        [0.483050197363,0.517854511738,0.706037700176],
-                        [0.44230055809,0.58378881216,0.680853009224],
-                        [0.669751524925,0.552667617798,0.495975226164],
-                        [0.706037700176,0.483050197363,0.517854511738],
-                        [0.726413309574,0.520354926586,0.44894811511],
-                        [0.619044244289,0.470621615648,0.628728508949],
-                        [0.65135627985,0.398910075426,0.645450055599],
-                        [0.680853009224,0.44230055809,0.58378881216],
-                        [0.737060189247,0.411682873964,0.535965919495],
-                        [0.762617051601,0.340069264174,0.550243675709],
-                        [0.787004828453,0.379529476166,0.486395716667],
-                        [0.680853009224,0.44230055809,0.58378881216],
-                        [0.737060189247,0.411682873964,0.535965919495],
-                        [0.706037700176,0.483050197363,0.517854511738],
-                        [0.470621615648,0.628728508949,0.619044244289],
-                        [0.540649950504,0.607478022575,0.581951975822],
-                        [0.495975226164,0.669751524925,0.552667617798],
-                        [0.552667617798,0.495975226164,0.669751524925],
-                        [0.619044244289,0.470621615648,0.628728508949],
-                        [0.581951975822,0.540649950504,0.607478022575],
-                        [0.607478022575,0.581951975822,0.540649950504],
-                        [0.669751524925,0.552667617798,0.495975226164],
-                        [0.628728508949,0.619044244289,0.470621615648],
-                        [0.581951975822,0.540649950504,0.607478022575],
-                        [0.607478022575,0.581951975822,0.540649950504],
-                        [0.540649950504,0.607478022575,0.581951975822],
-                        [0.8796184659,-0.475679844618,0.0],
-                        [0.887796461582,-0.456712335348,0.0568443164229],
-                        [0.858619451523,-0.509656965733,0.0549761541188],
-                        [0.932827115059,-0.360324263573,0.0],
-                        [0.940329909325,-0.334895044565,0.0602079555392],
-                        [0.915323853493,-0.398431301117,0.0586068555713],
-                        [0.892938017845,-0.434652328491,0.117213711143],
-                        [0.894335091114,-0.409316182137,0.180623859167],
-                        [0.866019308567,-0.468421578407,0.174905076623],
-                        [0.915323853493,-0.398431301117,0.0586068555713],
-                        [0.892938017845,-0.434652328491,0.117213711143],
-                        [0.887796461582,-0.456712335348,0.0568443164229],
-                        [0.974178731441,-0.225778326392,0.0],
-                        [0.979053080082,-0.193714544177,0.0626873448491],
-                        [0.961880862713,-0.266443610191,0.0615878328681],
-                        [0.997029185295,-0.0770247355103,0.0],
-                        [0.997179210186,-0.0394601933658,0.0638479366899],
-                        [0.991025745869,-0.117650069296,0.0634539350867],
-                        [0.978907585144,-0.158833146095,0.128498718143],
-                        [0.97295331955,-0.121444880962,0.196501940489],
-                        [0.960443258286,-0.199805602431,0.193975359201],
-                        [0.991025745869,-0.117650069296,0.0634539350867],
-                        [0.978907585144,-0.158833146095,0.128498718143],
-                        [0.979053080082,-0.193714544177,0.0626873448491],
-                        [0.891307473183,-0.380633711815,0.246351331472],
-                        [0.883275330067,-0.348686188459,0.313436716795],
-                        [0.857896447182,-0.413926929235,0.3044308424],
-                        [0.935745954514,-0.239766731858,0.258633822203],
-                        [0.922915279865,-0.202408134937,0.327503234148],
-                        [0.905284404755,-0.277958005667,0.321246802807],
-                        [0.869839549065,-0.313733518124,0.380723625422],
-                        [0.85085272789,-0.276221334934,0.446935534477],
-                        [0.830415487289,-0.346611320972,0.436200261116],
-                        [0.905284404755,-0.277958005667,0.321246802807],
-                        [0.869839549065,-0.313733518124,0.380723625422],
-                        [0.883275330067,-0.348686188459,0.313436716795],
-                        [0.961880862713,-0.266443610191,0.0615878328681],
-                        [0.943842172623,-0.306287169456,0.123895764351],
-                        [0.940329909325,-0.334895044565,0.0602079555392],
-                        [0.960443258286,-0.199805602431,0.193975359201],
-                        [0.935745954514,-0.239766731858,0.258633822203],
-                        [0.942551255226,-0.274516820908,0.190361812711],
-                        [0.920180141926,-0.34457308054,0.185843646526],
-                        [0.891307473183,-0.380633711815,0.246351331472],
-                        [0.894335091114,-0.409316182137,0.180623859167],
-                        [0.942551255226,-0.274516820908,0.190361812711],
-                        [0.920180141926,-0.34457308054,0.185843646526],
-                        [0.943842172623,-0.306287169456,0.123895764351],
-                        [0.997029185295,0.0770247355103,0.0],
-                        [0.991025745869,0.117650069296,0.0634539350867],
-                        [0.997179210186,0.0394601933658,0.0638479366899],
-                        [0.974178731441,0.225778326392,0.0],
-                        [0.961880862713,0.266443610191,0.0615878328681],
-                        [0.979053080082,0.193714544177,0.0626873448491],
-                        [0.978907585144,0.158833146095,0.128498718143],
-                        [0.960443258286,0.199805602431,0.193975359201],
-                        [0.97295331955,0.121444880962,0.196501940489],
-                        [0.979053080082,0.193714544177,0.0626873448491],
-                        [0.978907585144,0.158833146095,0.128498718143],
-                        [0.991025745869,0.117650069296,0.0634539350867],
-                        [0.932827115059,0.360324263573,0.0],
-                        [0.915323853493,0.398431301117,0.0586068555713],
-                        [0.940329909325,0.334895044565,0.0602079555392],
-                        [0.8796184659,0.475679844618,0.0],
-                        [0.858619451523,0.509656965733,0.0549761541188],
-                        [0.887796461582,0.456712335348,0.0568443164229],
-                        [0.892938017845,0.434652328491,0.117213711143],
-                        [0.866019308567,0.468421578407,0.174905076623],
-                        [0.894335091114,0.409316182137,0.180623859167],
-                        [0.887796461582,0.456712335348,0.0568443164229],
-                        [0.892938017845,0.434652328491,0.117213711143],
-                        [0.915323853493,0.398431301117,0.0586068555713],
-                        [0.935745954514,0.239766731858,0.258633822203],
-                        [0.905284404755,0.277958005667,0.321246802807],
-                        [0.922915279865,0.202408134937,0.327503234148],
-                        [0.891307473183,0.380633711815,0.246351331472],
-                        [0.857896447182,0.413926929235,0.3044308424],
-                        [0.883275330067,0.348686188459,0.313436716795],
-                        [0.869839549065,0.313733518124,0.380723625422],
-                        [0.830415487289,0.346611320972,0.436200261116],
-                        [0.85085272789,0.276221334934,0.446935534477],
-                        [0.883275330067,0.348686188459,0.313436716795],
-                        [0.869839549065,0.313733518124,0.380723625422],
-                        [0.905284404755,0.277958005667,0.321246802807],
-                        [0.940329909325,0.334895044565,0.0602079555392],
-                        [0.943842172623,0.306287169456,0.123895764351],
-                        [0.961880862713,0.266443610191,0.0615878328681],
-                        [0.894335091114,0.409316182137,0.180623859167],
-                        [0.891307473183,0.380633711815,0.246351331472],
-                        [0.920180141926,0.34457308054,0.185843646526],
-                        [0.942551255226,0.274516820908,0.190361812711],
-                        [0.935745954514,0.239766731858,0.258633822203],
-                        [0.960443258286,0.199805602431,0.193975359201],
-                        [0.920180141926,0.34457308054,0.185843646526],
-                        [0.942551255226,0.274516820908,0.190361812711],
-                        [0.943842172623,0.306287169456,0.123895764351],
-                        [0.826465010643,-0.236761152744,0.510783493519],
-                        [0.797127783298,-0.196083456278,0.571085453033],
-                        [0.782811582088,-0.269586592913,0.560828924179],
-                        [0.847858190536,-0.0809632539749,0.524005174637],
-                        [0.81225925684,-0.0399611219764,0.581926107407],
-                        [0.807120084763,-0.119124859571,0.578244268894],
-                        [0.763553202152,-0.154971644282,0.62687343359],
-                        [0.726636230946,-0.114190116525,0.677466154099],
-                        [0.718357801437,-0.188148602843,0.669747889042],
-                        [0.807120084763,-0.119124859571,0.578244268894],
-                        [0.763553202152,-0.154971644282,0.62687343359],
-                        [0.797127783298,-0.196083456278,0.571085453033],
-                        [0.847858190536,0.0809632539749,0.524005174637],
-                        [0.807120084763,0.119124859571,0.578244268894],
-                        [0.81225925684,0.0399611219764,0.581926107407],
-                        [0.826465010643,0.236761152744,0.510783493519],
-                        [0.782811582088,0.269586592913,0.560828924179],
-                        [0.797127783298,0.196083456278,0.571085453033],
-                        [0.763553202152,0.154971644282,0.62687343359],
-                        [0.718357801437,0.188148602843,0.669747889042],
-                        [0.726636230946,0.114190116525,0.677466154099],
-                        [0.797127783298,0.196083456278,0.571085453033],
-                        [0.763553202152,0.154971644282,0.62687343359],
-                        [0.807120084763,0.119124859571,0.578244268894],
-                        [0.687358558178,-0.0744211226702,0.722495436668],
-                        [0.646693944931,-0.0362210273743,0.761889100075],
-                        [0.643326640129,-0.108097285032,0.757922053337],
-                        [0.687358558178,0.0744211226702,0.722495436668],
-                        [0.643326640129,0.108097285032,0.757922053337],
-                        [0.646693944931,0.0362210273743,0.761889100075],
-                        [0.605532705784,0.0,0.79582041502],
-                        [0.564633131027,0.0339771322906,0.82464236021],
-                        [0.564633131027,-0.0339771322906,0.82464236021],
-                        [0.646693944931,0.0362210273743,0.761889100075],
-                        [0.605532705784,0.0,0.79582041502],
-                        [0.646693944931,-0.0362210273743,0.761889100075],
-                        [0.81225925684,0.0399611219764,0.581926107407],
-                        [0.772890508175,0.0,0.634539365768],
-                        [0.81225925684,-0.0399611219764,0.581926107407],
-                        [0.726636230946,0.114190116525,0.677466154099],
-                        [0.687358558178,0.0744211226702,0.722495436668],
-                        [0.730884253979,0.0382858961821,0.68142670393],
-                        [0.730884253979,-0.0382858961821,0.68142670393],
-                        [0.687358558178,-0.0744211226702,0.722495436668],
-                        [0.726636230946,-0.114190116525,0.677466154099],
-                        [0.730884253979,0.0382858961821,0.68142670393],
-                        [0.730884253979,-0.0382858961821,0.68142670393],
-                        [0.772890508175,0.0,0.634539365768],
-                        [0.997179210186,0.0394601933658,0.0638479366899],
-                        [0.991494178772,0.0,0.130150929093],
-                        [0.997179210186,-0.0394601933658,0.0638479366899],
-                        [0.97295331955,0.121444880962,0.196501940489],
-                        [0.960611641407,0.0820460245013,0.265506535769],
-                        [0.979394435883,0.0407496243715,0.197802826762],
-                        [0.979394435883,-0.0407496243715,0.197802826762],
-                        [0.960611641407,-0.0820460245013,0.265506535769],
-                        [0.97295331955,-0.121444880962,0.196501940489],
-                        [0.979394435883,0.0407496243715,0.197802826762],
-                        [0.979394435883,-0.0407496243715,0.197802826762],
-                        [0.991494178772,0.0,0.130150929093],
-                        [0.922915279865,0.202408134937,0.327503234148],
-                        [0.903840482235,0.162998497486,0.395605653524],
-                        [0.935258030891,0.123069040477,0.33188316226],
-                        [0.85085272789,0.276221334934,0.446935534477],
-                        [0.826465010643,0.236761152744,0.510783493519],
-                        [0.867211103439,0.20109423995,0.455528259277],
-                        [0.878655850887,0.122248865664,0.461539924145],
-                        [0.847858190536,0.0809632539749,0.524005174637],
-                        [0.88455080986,0.0410230122507,0.464636415243],
-                        [0.867211103439,0.20109423995,0.455528259277],
-                        [0.878655850887,0.122248865664,0.461539924145],
-                        [0.903840482235,0.162998497486,0.395605653524],
-                        [0.935258030891,-0.123069040477,0.33188316226],
-                        [0.903840482235,-0.162998497486,0.395605653524],
-                        [0.922915279865,-0.202408134937,0.327503234148],
-                        [0.88455080986,-0.0410230122507,0.464636415243],
-                        [0.847858190536,-0.0809632539749,0.524005174637],
-                        [0.878655850887,-0.122248865664,0.461539924145],
-                        [0.867211103439,-0.20109423995,0.455528259277],
-                        [0.826465010643,-0.236761152744,0.510783493519],
-                        [0.85085272789,-0.276221334934,0.446935534477],
-                        [0.878655850887,-0.122248865664,0.461539924145],
-                        [0.867211103439,-0.20109423995,0.455528259277],
-                        [0.903840482235,-0.162998497486,0.395605653524],
-                        [0.935258030891,0.123069040477,0.33188316226],
-                        [0.941618084908,0.04130198434,0.334140062332],
-                        [0.960611641407,0.0820460245013,0.265506535769],
-                        [0.88455080986,0.0410230122507,0.464636415243],
-                        [0.88455080986,-0.0410230122507,0.464636415243],
-                        [0.916092038155,0.0,0.400968074799],
-                        [0.941618084908,-0.04130198434,0.334140062332],
-                        [0.935258030891,-0.123069040477,0.33188316226],
-                        [0.960611641407,-0.0820460245013,0.265506535769],
-                        [0.916092038155,0.0,0.400968074799],
-                        [0.941618084908,-0.04130198434,0.334140062332],
-                        [0.941618084908,0.04130198434,0.334140062332],
-                        [-0.564633131027,0.0339771322906,0.82464236021],
-                        [-0.605532705784,0.0,0.79582041502],
-                        [-0.564633131027,-0.0339771322906,0.82464236021],
-                        [-0.643326640129,0.108097285032,0.757922053337],
-                        [-0.687358558178,0.0744211226702,0.722495436668],
-                        [-0.646693944931,0.0362210273743,0.761889100075],
-                        [-0.646693944931,-0.0362210273743,0.761889100075],
-                        [-0.687358558178,-0.0744211226702,0.722495436668],
-                        [-0.643326640129,-0.108097285032,0.757922053337],
-                        [-0.646693944931,0.0362210273743,0.761889100075],
-                        [-0.646693944931,-0.0362210273743,0.761889100075],
-                        [-0.605532705784,0.0,0.79582041502],
-                        [-0.718357801437,0.188148602843,0.669747889042],
-                        [-0.763553202152,0.154971644282,0.62687343359],
-                        [-0.726636230946,0.114190116525,0.677466154099],
-                        [-0.782811582088,0.269586592913,0.560828924179],
-                        [-0.826465010643,0.236761152744,0.510783493519],
-                        [-0.797127783298,0.196083456278,0.571085453033],
-                        [-0.807120084763,0.119124859571,0.578244268894],
-                        [-0.847858190536,0.0809632539749,0.524005174637],
-                        [-0.81225925684,0.0399611219764,0.581926107407],
-                        [-0.797127783298,0.196083456278,0.571085453033],
-                        [-0.807120084763,0.119124859571,0.578244268894],
-                        [-0.763553202152,0.154971644282,0.62687343359],
-                        [-0.726636230946,-0.114190116525,0.677466154099],
-                        [-0.763553202152,-0.154971644282,0.62687343359],
-                        [-0.718357801437,-0.188148602843,0.669747889042],
-                        [-0.81225925684,-0.0399611219764,0.581926107407],
-                        [-0.847858190536,-0.0809632539749,0.524005174637],
-                        [-0.807120084763,-0.119124859571,0.578244268894],
-                        [-0.797127783298,-0.196083456278,0.571085453033],
-                        [-0.826465010643,-0.236761152744,0.510783493519],
-                        [-0.782811582088,-0.269586592913,0.560828924179],
-                        [-0.807120084763,-0.119124859571,0.578244268894],
-                        [-0.797127783298,-0.196083456278,0.571085453033],
-                        [-0.763553202152,-0.154971644282,0.62687343359],
-                        [-0.726636230946,0.114190116525,0.677466154099],
-                        [-0.730884253979,0.0382858961821,0.68142670393],
-                        [-0.687358558178,0.0744211226702,0.722495436668],
-                        [-0.81225925684,0.0399611219764,0.581926107407],
-                        [-0.81225925684,-0.0399611219764,0.581926107407],
-                        [-0.772890508175,0.0,0.634539365768],
-                        [-0.730884253979,-0.0382858961821,0.68142670393],
-                        [-0.726636230946,-0.114190116525,0.677466154099],
-                        [-0.687358558178,-0.0744211226702,0.722495436668],
-                        [-0.772890508175,0.0,0.634539365768],
-                        [-0.730884253979,-0.0382858961821,0.68142670393],
-                        [-0.730884253979,0.0382858961821,0.68142670393],
-                        [-0.830415487289,0.346611320972,0.436200261116],
-                        [-0.869839549065,0.313733518124,0.380723625422],
-                        [-0.85085272789,0.276221334934,0.446935534477],
-                        [-0.857896447182,0.413926929235,0.3044308424],
-                        [-0.891307473183,0.380633711815,0.246351331472],
-                        [-0.883275330067,0.348686188459,0.313436716795],
-                        [-0.905284404755,0.277958005667,0.321246802807],
-                        [-0.935745954514,0.239766731858,0.258633822203],
-                        [-0.922915279865,0.202408134937,0.327503234148],
-                        [-0.883275330067,0.348686188459,0.313436716795],
-                        [-0.905284404755,0.277958005667,0.321246802807],
-                        [-0.869839549065,0.313733518124,0.380723625422],
-                        [-0.866019308567,0.468421578407,0.174905076623],
-                        [-0.892938017845,0.434652328491,0.117213711143],
-                        [-0.894335091114,0.409316182137,0.180623859167],
-                        [-0.858619451523,0.509656965733,0.0549761541188],
-                        [-0.8796184659,0.475679844618,0.0],
-                        [-0.887796461582,0.456712335348,0.0568443164229],
-                        [-0.915323853493,0.398431301117,0.0586068555713],
-                        [-0.932827115059,0.360324263573,0.0],
-                        [-0.940329909325,0.334895044565,0.0602079555392],
-                        [-0.887796461582,0.456712335348,0.0568443164229],
-                        [-0.915323853493,0.398431301117,0.0586068555713],
-                        [-0.892938017845,0.434652328491,0.117213711143],
-                        [-0.960443258286,0.199805602431,0.193975359201],
-                        [-0.978907585144,0.158833146095,0.128498718143],
-                        [-0.97295331955,0.121444880962,0.196501940489],
-                        [-0.961880862713,0.266443610191,0.0615878328681],
-                        [-0.974178731441,0.225778326392,0.0],
-                        [-0.979053080082,0.193714544177,0.0626873448491],
-                        [-0.991025745869,0.117650069296,0.0634539350867],
-                        [-0.997029185295,0.0770247355103,0.0],
-                        [-0.997179210186,0.0394601933658,0.0638479366899],
-                        [-0.979053080082,0.193714544177,0.0626873448491],
-                        [-0.991025745869,0.117650069296,0.0634539350867],
-                        [-0.978907585144,0.158833146095,0.128498718143],
-                        [-0.894335091114,0.409316182137,0.180623859167],
-                        [-0.920180141926,0.34457308054,0.185843646526],
-                        [-0.891307473183,0.380633711815,0.246351331472],
-                        [-0.940329909325,0.334895044565,0.0602079555392],
-                        [-0.961880862713,0.266443610191,0.0615878328681],
-                        [-0.943842172623,0.306287169456,0.123895764351],
-                        [-0.942551255226,0.274516820908,0.190361812711],
-                        [-0.960443258286,0.199805602431,0.193975359201],
-                        [-0.935745954514,0.239766731858,0.258633822203],
-                        [-0.943842172623,0.306287169456,0.123895764351],
-                        [-0.942551255226,0.274516820908,0.190361812711],
-                        [-0.920180141926,0.34457308054,0.185843646526],
-                        [-0.85085272789,-0.276221334934,0.446935534477],
-                        [-0.869839549065,-0.313733518124,0.380723625422],
-                        [-0.830415487289,-0.346611320972,0.436200261116],
-                        [-0.922915279865,-0.202408134937,0.327503234148],
-                        [-0.935745954514,-0.239766731858,0.258633822203],
-                        [-0.905284404755,-0.277958005667,0.321246802807],
-                        [-0.883275330067,-0.348686188459,0.313436716795],
-                        [-0.891307473183,-0.380633711815,0.246351331472],
-                        [-0.857896447182,-0.413926929235,0.3044308424],
-                        [-0.905284404755,-0.277958005667,0.321246802807],
-                        [-0.883275330067,-0.348686188459,0.313436716795],
-                        [-0.869839549065,-0.313733518124,0.380723625422],
-                        [-0.97295331955,-0.121444880962,0.196501940489],
-                        [-0.978907585144,-0.158833146095,0.128498718143],
-                        [-0.960443258286,-0.199805602431,0.193975359201],
-                        [-0.997179210186,-0.0394601933658,0.0638479366899],
-                        [-0.997029185295,-0.0770247355103,0.0],
-                        [-0.991025745869,-0.117650069296,0.0634539350867],
-                        [-0.979053080082,-0.193714544177,0.0626873448491],
-                        [-0.974178731441,-0.225778326392,0.0],
-                        [-0.961880862713,-0.266443610191,0.0615878328681],
-                        [-0.991025745869,-0.117650069296,0.0634539350867],
-                        [-0.979053080082,-0.193714544177,0.0626873448491],
-                        [-0.978907585144,-0.158833146095,0.128498718143],
-                        [-0.894335091114,-0.409316182137,0.180623859167],
-                        [-0.892938017845,-0.434652328491,0.117213711143],
-                        [-0.866019308567,-0.468421578407,0.174905076623],
-                        [-0.940329909325,-0.334895044565,0.0602079555392],
-                        [-0.932827115059,-0.360324263573,0.0],
-                        [-0.915323853493,-0.398431301117,0.0586068555713],
-                        [-0.887796461582,-0.456712335348,0.0568443164229],
-                        [-0.8796184659,-0.475679844618,0.0],
-                        [-0.858619451523,-0.509656965733,0.0549761541188],
-                        [-0.915323853493,-0.398431301117,0.0586068555713],
-                        [-0.887796461582,-0.456712335348,0.0568443164229],
-                        [-0.892938017845,-0.434652328491,0.117213711143],
-                        [-0.960443258286,-0.199805602431,0.193975359201],
-                        [-0.942551255226,-0.274516820908,0.190361812711],
-                        [-0.935745954514,-0.239766731858,0.258633822203],
-                        [-0.961880862713,-0.266443610191,0.0615878328681],
-                        [-0.940329909325,-0.334895044565,0.0602079555392],
-                        [-0.943842172623,-0.306287169456,0.123895764351],
-                        [-0.920180141926,-0.34457308054,0.185843646526],
-                        [-0.894335091114,-0.409316182137,0.180623859167],
-                        [-0.891307473183,-0.380633711815,0.246351331472],
-                        [-0.943842172623,-0.306287169456,0.123895764351],
-                        [-0.920180141926,-0.34457308054,0.185843646526],
-                        [-0.942551255226,-0.274516820908,0.190361812711],
-                        [-0.85085272789,0.276221334934,0.446935534477],
-                        [-0.867211103439,0.20109423995,0.455528259277],
-                        [-0.826465010643,0.236761152744,0.510783493519],
-                        [-0.922915279865,0.202408134937,0.327503234148],
-                        [-0.935258030891,0.123069040477,0.33188316226],
-                        [-0.903840482235,0.162998497486,0.395605653524],
-                        [-0.878655850887,0.122248865664,0.461539924145],
-                        [-0.88455080986,0.0410230122507,0.464636415243],
-                        [-0.847858190536,0.0809632539749,0.524005174637],
-                        [-0.903840482235,0.162998497486,0.395605653524],
-                        [-0.878655850887,0.122248865664,0.461539924145],
-                        [-0.867211103439,0.20109423995,0.455528259277],
-                        [-0.97295331955,0.121444880962,0.196501940489],
-                        [-0.979394435883,0.0407496243715,0.197802826762],
-                        [-0.960611641407,0.0820460245013,0.265506535769],
-                        [-0.997179210186,0.0394601933658,0.0638479366899],
-                        [-0.997179210186,-0.0394601933658,0.0638479366899],
-                        [-0.991494178772,0.0,0.130150929093],
-                        [-0.979394435883,-0.0407496243715,0.197802826762],
-                        [-0.97295331955,-0.121444880962,0.196501940489],
-                        [-0.960611641407,-0.0820460245013,0.265506535769],
-                        [-0.991494178772,0.0,0.130150929093],
-                        [-0.979394435883,-0.0407496243715,0.197802826762],
-                        [-0.979394435883,0.0407496243715,0.197802826762],
-                        [-0.88455080986,-0.0410230122507,0.464636415243],
-                        [-0.878655850887,-0.122248865664,0.461539924145],
-                        [-0.847858190536,-0.0809632539749,0.524005174637],
-                        [-0.935258030891,-0.123069040477,0.33188316226],
-                        [-0.922915279865,-0.202408134937,0.327503234148],
-                        [-0.903840482235,-0.162998497486,0.395605653524],
-                        [-0.867211103439,-0.20109423995,0.455528259277],
-                        [-0.85085272789,-0.276221334934,0.446935534477],
-                        [-0.826465010643,-0.236761152744,0.510783493519],
-                        [-0.903840482235,-0.162998497486,0.395605653524],
-                        [-0.867211103439,-0.20109423995,0.455528259277],
-                        [-0.878655850887,-0.122248865664,0.461539924145],
-                        [-0.960611641407,0.0820460245013,0.265506535769],
-                        [-0.941618084908,0.04130198434,0.334140062332],
-                        [-0.935258030891,0.123069040477,0.33188316226],
-                        [-0.960611641407,-0.0820460245013,0.265506535769],
-                        [-0.935258030891,-0.123069040477,0.33188316226],
-                        [-0.941618084908,-0.04130198434,0.334140062332],
-                        [-0.916092038155,0.0,0.400968074799],
-                        [-0.88455080986,-0.0410230122507,0.464636415243],
-                        [-0.88455080986,0.0410230122507,0.464636415243],
-                        [-0.941618084908,-0.04130198434,0.334140062332],
-                        [-0.916092038155,0.0,0.400968074799],
-                        [-0.941618084908,0.04130198434,0.334140062332],
-                        [-0.509656965733,0.0549761541188,0.858619451523],
-                        [-0.548688352108,0.091976031661,0.830952167511],
-                        [-0.564633131027,0.0339771322906,0.82464236021],
-                        [-0.468421578407,0.174905076623,0.866019308567],
-                        [-0.506734728813,0.217834427953,0.834127128124],
-                        [-0.529480218887,0.153434738517,0.834331154823],
-                        [-0.588087081909,0.131048902869,0.798110127449],
-                        [-0.627150595188,0.171839639544,0.759706020355],
-                        [-0.643326640129,0.108097285032,0.757922053337],
-                        [-0.529480218887,0.153434738517,0.834331154823],
-                        [-0.588087081909,0.131048902869,0.798110127449],
-                        [-0.548688352108,0.091976031661,0.830952167511],
-                        [-0.413926929235,0.3044308424,0.857896447182],
-                        [-0.450116455555,0.352179646492,0.820587992668],
-                        [-0.480284929276,0.284414708614,0.829719662666],
-                        [-0.346611320972,0.436200261116,0.830415487289],
-                        [-0.379529476166,0.486395716667,0.787004828453],
-                        [-0.416404157877,0.419940322638,0.806385576725],
-                        [-0.485873311758,0.400663375854,0.776785671711],
-                        [-0.520354926586,0.44894811511,0.726413309574],
-                        [-0.553625464439,0.378517180681,0.74177056551],
-                        [-0.416404157877,0.419940322638,0.806385576725],
-                        [-0.485873311758,0.400663375854,0.776785671711],
-                        [-0.450116455555,0.352179646492,0.820587992668],
-                        [-0.665048420429,0.213841319084,0.715529501438],
-                        [-0.700865805149,0.256401896477,0.665616393089],
-                        [-0.718357801437,0.188148602843,0.669747889042],
-                        [-0.618283927441,0.353819847107,0.701809465885],
-                        [-0.65135627985,0.398910075426,0.645450055599],
-                        [-0.678621411324,0.327040165663,0.657660841942],
-                        [-0.733673810959,0.298754066229,0.610302150249],
-                        [-0.762617051601,0.340069264174,0.550243675709],
-                        [-0.782811582088,0.269586592913,0.560828924179],
-                        [-0.678621411324,0.327040165663,0.657660841942],
-                        [-0.733673810959,0.298754066229,0.610302150249],
-                        [-0.700865805149,0.256401896477,0.665616393089],
-                        [-0.480284929276,0.284414708614,0.829719662666],
-                        [-0.545040607452,0.26241543889,0.796284377575],
-                        [-0.506734728813,0.217834427953,0.834127128124],
-                        [-0.553625464439,0.378517180681,0.74177056551],
-                        [-0.618283927441,0.353819847107,0.701809465885],
-                        [-0.582528710365,0.308011889458,0.752189457417],
-                        [-0.606988489628,0.238753452897,0.757998526096],
-                        [-0.665048420429,0.213841319084,0.715529501438],
-                        [-0.627150595188,0.171839639544,0.759706020355],
-                        [-0.582528710365,0.308011889458,0.752189457417],
-                        [-0.606988489628,0.238753452897,0.757998526096],
-                        [-0.545040607452,0.26241543889,0.796284377575],
-                        [-0.269586592913,0.560828924179,0.782811582088],
-                        [-0.298754066229,0.610302150249,0.733673810959],
-                        [-0.340069264174,0.550243675709,0.762617051601],
-                        [-0.188148602843,0.669747889042,0.718357801437],
-                        [-0.213841319084,0.715529501438,0.665048420429],
-                        [-0.256401896477,0.665616393089,0.700865805149],
-                        [-0.327040165663,0.657660841942,0.678621411324],
-                        [-0.353819847107,0.701809465885,0.618283927441],
-                        [-0.398910075426,0.645450055599,0.65135627985],
-                        [-0.256401896477,0.665616393089,0.700865805149],
-                        [-0.327040165663,0.657660841942,0.678621411324],
-                        [-0.298754066229,0.610302150249,0.733673810959],
-                        [-0.108097285032,0.757922053337,0.643326640129],
-                        [-0.131048902869,0.798110127449,0.588087081909],
-                        [-0.171839639544,0.759706020355,0.627150595188],
-                        [-0.0339771322906,0.82464236021,0.564633131027],
-                        [-0.0549761541188,0.858619451523,0.509656965733],
-                        [-0.091976031661,0.830952167511,0.548688352108],
-                        [-0.153434738517,0.834331154823,0.529480218887],
-                        [-0.174905076623,0.866019308567,0.468421578407],
-                        [-0.217834427953,0.834127128124,0.506734728813],
-                        [-0.091976031661,0.830952167511,0.548688352108],
-                        [-0.153434738517,0.834331154823,0.529480218887],
-                        [-0.131048902869,0.798110127449,0.588087081909],
-                        [-0.378517180681,0.74177056551,0.553625464439],
-                        [-0.400663375854,0.776785671711,0.485873311758],
-                        [-0.44894811511,0.726413309574,0.520354926586],
-                        [-0.284414708614,0.829719662666,0.480284929276],
-                        [-0.3044308424,0.857896447182,0.413926929235],
-                        [-0.352179646492,0.820587992668,0.450116455555],
-                        [-0.419940322638,0.806385576725,0.416404157877],
-                        [-0.436200261116,0.830415487289,0.346611320972],
-                        [-0.486395716667,0.787004828453,0.379529476166],
-                        [-0.352179646492,0.820587992668,0.450116455555],
-                        [-0.419940322638,0.806385576725,0.416404157877],
-                        [-0.400663375854,0.776785671711,0.485873311758],
-                        [-0.171839639544,0.759706020355,0.627150595188],
-                        [-0.238753452897,0.757998526096,0.606988489628],
-                        [-0.213841319084,0.715529501438,0.665048420429],
-                        [-0.217834427953,0.834127128124,0.506734728813],
-                        [-0.284414708614,0.829719662666,0.480284929276],
-                        [-0.26241543889,0.796284377575,0.545040607452],
-                        [-0.308011889458,0.752189457417,0.582528710365],
-                        [-0.378517180681,0.74177056551,0.553625464439],
-                        [-0.353819847107,0.701809465885,0.618283927441],
-                        [-0.26241543889,0.796284377575,0.545040607452],
-                        [-0.308011889458,0.752189457417,0.582528710365],
-                        [-0.238753452897,0.757998526096,0.606988489628],
-                        [-0.787004828453,0.379529476166,0.486395716667],
-                        [-0.806385576725,0.416404157877,0.419940322638],
-                        [-0.830415487289,0.346611320972,0.436200261116],
-                        [-0.726413309574,0.520354926586,0.44894811511],
-                        [-0.74177056551,0.553625464439,0.378517180681],
-                        [-0.776785671711,0.485873311758,0.400663375854],
-                        [-0.820587992668,0.450116455555,0.352179646492],
-                        [-0.829719662666,0.480284929276,0.284414708614],
-                        [-0.857896447182,0.413926929235,0.3044308424],
-                        [-0.776785671711,0.485873311758,0.400663375854],
-                        [-0.820587992668,0.450116455555,0.352179646492],
-                        [-0.806385576725,0.416404157877,0.419940322638],
-                        [-0.645450055599,0.65135627985,0.398910075426],
-                        [-0.657660841942,0.678621411324,0.327040165663],
-                        [-0.701809465885,0.618283927441,0.353819847107],
-                        [-0.550243675709,0.762617051601,0.340069264174],
-                        [-0.560828924179,0.782811582088,0.269586592913],
-                        [-0.610302150249,0.733673810959,0.298754066229],
-                        [-0.665616393089,0.700865805149,0.256401896477],
-                        [-0.669747889042,0.718357801437,0.188148602843],
-                        [-0.715529501438,0.665048420429,0.213841319084],
-                        [-0.610302150249,0.733673810959,0.298754066229],
-                        [-0.665616393089,0.700865805149,0.256401896477],
-                        [-0.657660841942,0.678621411324,0.327040165663],
-                        [-0.834127128124,0.506734728813,0.217834427953],
-                        [-0.834331154823,0.529480218887,0.153434738517],
-                        [-0.866019308567,0.468421578407,0.174905076623],
-                        [-0.759706020355,0.627150595188,0.171839639544],
-                        [-0.757922053337,0.643326640129,0.108097285032],
-                        [-0.798110127449,0.588087081909,0.131048902869],
-                        [-0.830952167511,0.548688352108,0.091976031661],
-                        [-0.82464236021,0.564633131027,0.0339771322906],
-                        [-0.858619451523,0.509656965733,0.0549761541188],
-                        [-0.798110127449,0.588087081909,0.131048902869],
-                        [-0.830952167511,0.548688352108,0.091976031661],
-                        [-0.834331154823,0.529480218887,0.153434738517],
-                        [-0.701809465885,0.618283927441,0.353819847107],
-                        [-0.752189457417,0.582528710365,0.308011889458],
-                        [-0.74177056551,0.553625464439,0.378517180681],
-                        [-0.715529501438,0.665048420429,0.213841319084],
-                        [-0.759706020355,0.627150595188,0.171839639544],
-                        [-0.757998526096,0.606988489628,0.238753452897],
-                        [-0.796284377575,0.545040607452,0.26241543889],
-                        [-0.834127128124,0.506734728813,0.217834427953],
-                        [-0.829719662666,0.480284929276,0.284414708614],
-                        [-0.757998526096,0.606988489628,0.238753452897],
-                        [-0.796284377575,0.545040607452,0.26241543889],
-                        [-0.752189457417,0.582528710365,0.308011889458],
-                        [-0.340069264174,0.550243675709,0.762617051601],
-                        [-0.411682873964,0.535965919495,0.737060189247],
-                        [-0.379529476166,0.486395716667,0.787004828453],
-                        [-0.398910075426,0.645450055599,0.65135627985],
-                        [-0.470621615648,0.628728508949,0.619044244289],
-                        [-0.44230055809,0.58378881216,0.680853009224],
-                        [-0.483050197363,0.517854511738,0.706037700176],
-                        [-0.552667617798,0.495975226164,0.669751524925],
-                        [-0.520354926586,0.44894811511,0.726413309574],
-                        [-0.44230055809,0.58378881216,0.680853009224],
-                        [-0.483050197363,0.517854511738,0.706037700176],
-                        [-0.411682873964,0.535965919495,0.737060189247],
-                        [-0.44894811511,0.726413309574,0.520354926586],
-                        [-0.517854511738,0.706037700176,0.483050197363],
-                        [-0.495975226164,0.669751524925,0.552667617798],
-                        [-0.486395716667,0.787004828453,0.379529476166],
-                        [-0.550243675709,0.762617051601,0.340069264174],
-                        [-0.535965919495,0.737060189247,0.411682873964],
-                        [-0.58378881216,0.680853009224,0.44230055809],
-                        [-0.645450055599,0.65135627985,0.398910075426],
-                        [-0.628728508949,0.619044244289,0.470621615648],
-                        [-0.535965919495,0.737060189247,0.411682873964],
-                        [-0.58378881216,0.680853009224,0.44230055809],
-                        [-0.517854511738,0.706037700176,0.483050197363],
-                        [-0.619044244289,0.470621615648,0.628728508949],
-                        [-0.680853009224,0.44230055809,0.58378881216],
-                        [-0.65135627985,0.398910075426,0.645450055599],
-                        [-0.669751524925,0.552667617798,0.495975226164],
-                        [-0.726413309574,0.520354926586,0.44894811511],
-                        [-0.706037700176,0.483050197363,0.517854511738],
-                        [-0.737060189247,0.411682873964,0.535965919495],
-                        [-0.787004828453,0.379529476166,0.486395716667],
-                        [-0.762617051601,0.340069264174,0.550243675709],
-                        [-0.706037700176,0.483050197363,0.517854511738],
-                        [-0.737060189247,0.411682873964,0.535965919495],
-                        [-0.680853009224,0.44230055809,0.58378881216],
-                        [-0.495975226164,0.669751524925,0.552667617798],
-                        [-0.540649950504,0.607478022575,0.581951975822],
-                        [-0.470621615648,0.628728508949,0.619044244289],
-                        [-0.628728508949,0.619044244289,0.470621615648],
-                        [-0.669751524925,0.552667617798,0.495975226164],
-                        [-0.607478022575,0.581951975822,0.540649950504],
-                        [-0.581951975822,0.540649950504,0.607478022575],
-                        [-0.619044244289,0.470621615648,0.628728508949],
-                        [-0.552667617798,0.495975226164,0.669751524925],
-                        [-0.607478022575,0.581951975822,0.540649950504],
-                        [-0.581951975822,0.540649950504,0.607478022575],
-                        [-0.540649950504,0.607478022575,0.581951975822],
-                        [-0.0339771322906,0.82464236021,0.564633131027],
-                        [0.0,0.79582041502,0.605532705784],
-                        [0.0339771322906,0.82464236021,0.564633131027],
-                        [-0.108097285032,0.757922053337,0.643326640129],
-                        [-0.0744211226702,0.722495436668,0.687358558178],
-                        [-0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0744211226702,0.722495436668,0.687358558178],
-                        [0.108097285032,0.757922053337,0.643326640129],
-                        [-0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0,0.79582041502,0.605532705784],
-                        [-0.188148602843,0.669747889042,0.718357801437],
-                        [-0.154971644282,0.62687343359,0.763553202152],
-                        [-0.114190116525,0.677466154099,0.726636230946],
-                        [-0.269586592913,0.560828924179,0.782811582088],
-                        [-0.236761152744,0.510783493519,0.826465010643],
-                        [-0.196083456278,0.571085453033,0.797127783298],
-                        [-0.119124859571,0.578244268894,0.807120084763],
-                        [-0.0809632539749,0.524005174637,0.847858190536],
-                        [-0.0399611219764,0.581926107407,0.81225925684],
-                        [-0.196083456278,0.571085453033,0.797127783298],
-                        [-0.119124859571,0.578244268894,0.807120084763],
-                        [-0.154971644282,0.62687343359,0.763553202152],
-                        [0.114190116525,0.677466154099,0.726636230946],
-                        [0.154971644282,0.62687343359,0.763553202152],
-                        [0.188148602843,0.669747889042,0.718357801437],
-                        [0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0809632539749,0.524005174637,0.847858190536],
-                        [0.119124859571,0.578244268894,0.807120084763],
-                        [0.196083456278,0.571085453033,0.797127783298],
-                        [0.236761152744,0.510783493519,0.826465010643],
-                        [0.269586592913,0.560828924179,0.782811582088],
-                        [0.119124859571,0.578244268894,0.807120084763],
-                        [0.196083456278,0.571085453033,0.797127783298],
-                        [0.154971644282,0.62687343359,0.763553202152],
-                        [-0.114190116525,0.677466154099,0.726636230946],
-                        [-0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.0744211226702,0.722495436668,0.687358558178],
-                        [-0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0,0.634539365768,0.772890508175],
-                        [0.0382858961821,0.68142670393,0.730884253979],
-                        [0.114190116525,0.677466154099,0.726636230946],
-                        [0.0744211226702,0.722495436668,0.687358558178],
-                        [0.0,0.634539365768,0.772890508175],
-                        [0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.346611320972,0.436200261116,0.830415487289],
-                        [-0.313733518124,0.380723625422,0.869839549065],
-                        [-0.276221334934,0.446935534477,0.85085272789],
-                        [-0.413926929235,0.3044308424,0.857896447182],
-                        [-0.380633711815,0.246351331472,0.891307473183],
-                        [-0.348686188459,0.313436716795,0.883275330067],
-                        [-0.277958005667,0.321246802807,0.905284404755],
-                        [-0.239766731858,0.258633822203,0.935745954514],
-                        [-0.202408134937,0.327503234148,0.922915279865],
-                        [-0.348686188459,0.313436716795,0.883275330067],
-                        [-0.277958005667,0.321246802807,0.905284404755],
-                        [-0.313733518124,0.380723625422,0.869839549065],
-                        [-0.468421578407,0.174905076623,0.866019308567],
-                        [-0.434652328491,0.117213711143,0.892938017845],
-                        [-0.409316182137,0.180623859167,0.894335091114],
-                        [-0.509656965733,0.0549761541188,0.858619451523],
-                        [-0.475679844618,0.0,0.8796184659],
-                        [-0.456712335348,0.0568443164229,0.887796461582],
-                        [-0.398431301117,0.0586068555713,0.915323853493],
-                        [-0.360324263573,0.0,0.932827115059],
-                        [-0.334895044565,0.0602079555392,0.940329909325],
-                        [-0.456712335348,0.0568443164229,0.887796461582],
-                        [-0.398431301117,0.0586068555713,0.915323853493],
-                        [-0.434652328491,0.117213711143,0.892938017845],
-                        [-0.199805602431,0.193975359201,0.960443258286],
-                        [-0.158833146095,0.128498718143,0.978907585144],
-                        [-0.121444880962,0.196501940489,0.97295331955],
-                        [-0.266443610191,0.0615878328681,0.961880862713],
-                        [-0.225778326392,0.0,0.974178731441],
-                        [-0.193714544177,0.0626873448491,0.979053080082],
-                        [-0.117650069296,0.0634539350867,0.991025745869],
-                        [-0.0770247355103,0.0,0.997029185295],
-                        [-0.0394601933658,0.0638479366899,0.997179210186],
-                        [-0.193714544177,0.0626873448491,0.979053080082],
-                        [-0.117650069296,0.0634539350867,0.991025745869],
-                        [-0.158833146095,0.128498718143,0.978907585144],
-                        [-0.409316182137,0.180623859167,0.894335091114],
-                        [-0.34457308054,0.185843646526,0.920180141926],
-                        [-0.380633711815,0.246351331472,0.891307473183],
-                        [-0.334895044565,0.0602079555392,0.940329909325],
-                        [-0.266443610191,0.0615878328681,0.961880862713],
-                        [-0.306287169456,0.123895764351,0.943842172623],
-                        [-0.274516820908,0.190361812711,0.942551255226],
-                        [-0.199805602431,0.193975359201,0.960443258286],
-                        [-0.239766731858,0.258633822203,0.935745954514],
-                        [-0.306287169456,0.123895764351,0.943842172623],
-                        [-0.274516820908,0.190361812711,0.942551255226],
-                        [-0.34457308054,0.185843646526,0.920180141926],
-                        [0.276221334934,0.446935534477,0.85085272789],
-                        [0.313733518124,0.380723625422,0.869839549065],
-                        [0.346611320972,0.436200261116,0.830415487289],
-                        [0.202408134937,0.327503234148,0.922915279865],
-                        [0.239766731858,0.258633822203,0.935745954514],
-                        [0.277958005667,0.321246802807,0.905284404755],
-                        [0.348686188459,0.313436716795,0.883275330067],
-                        [0.380633711815,0.246351331472,0.891307473183],
-                        [0.413926929235,0.3044308424,0.857896447182],
-                        [0.277958005667,0.321246802807,0.905284404755],
-                        [0.348686188459,0.313436716795,0.883275330067],
-                        [0.313733518124,0.380723625422,0.869839549065],
-                        [0.121444880962,0.196501940489,0.97295331955],
-                        [0.158833146095,0.128498718143,0.978907585144],
-                        [0.199805602431,0.193975359201,0.960443258286],
-                        [0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0770247355103,0.0,0.997029185295],
-                        [0.117650069296,0.0634539350867,0.991025745869],
-                        [0.193714544177,0.0626873448491,0.979053080082],
-                        [0.225778326392,0.0,0.974178731441],
-                        [0.266443610191,0.0615878328681,0.961880862713],
-                        [0.117650069296,0.0634539350867,0.991025745869],
-                        [0.193714544177,0.0626873448491,0.979053080082],
-                        [0.158833146095,0.128498718143,0.978907585144],
-                        [0.409316182137,0.180623859167,0.894335091114],
-                        [0.434652328491,0.117213711143,0.892938017845],
-                        [0.468421578407,0.174905076623,0.866019308567],
-                        [0.334895044565,0.0602079555392,0.940329909325],
-                        [0.360324263573,0.0,0.932827115059],
-                        [0.398431301117,0.0586068555713,0.915323853493],
-                        [0.456712335348,0.0568443164229,0.887796461582],
-                        [0.475679844618,0.0,0.8796184659],
-                        [0.509656965733,0.0549761541188,0.858619451523],
-                        [0.398431301117,0.0586068555713,0.915323853493],
-                        [0.456712335348,0.0568443164229,0.887796461582],
-                        [0.434652328491,0.117213711143,0.892938017845],
-                        [0.199805602431,0.193975359201,0.960443258286],
-                        [0.274516820908,0.190361812711,0.942551255226],
-                        [0.239766731858,0.258633822203,0.935745954514],
-                        [0.266443610191,0.0615878328681,0.961880862713],
-                        [0.334895044565,0.0602079555392,0.940329909325],
-                        [0.306287169456,0.123895764351,0.943842172623],
-                        [0.34457308054,0.185843646526,0.920180141926],
-                        [0.409316182137,0.180623859167,0.894335091114],
-                        [0.380633711815,0.246351331472,0.891307473183],
-                        [0.306287169456,0.123895764351,0.943842172623],
-                        [0.34457308054,0.185843646526,0.920180141926],
-                        [0.274516820908,0.190361812711,0.942551255226],
-                        [-0.276221334934,0.446935534477,0.85085272789],
-                        [-0.20109423995,0.455528259277,0.867211103439],
-                        [-0.236761152744,0.510783493519,0.826465010643],
-                        [-0.202408134937,0.327503234148,0.922915279865],
-                        [-0.123069040477,0.33188316226,0.935258030891],
-                        [-0.162998497486,0.395605653524,0.903840482235],
-                        [-0.122248865664,0.461539924145,0.878655850887],
-                        [-0.0410230122507,0.464636415243,0.88455080986],
-                        [-0.0809632539749,0.524005174637,0.847858190536],
-                        [-0.162998497486,0.395605653524,0.903840482235],
-                        [-0.122248865664,0.461539924145,0.878655850887],
-                        [-0.20109423995,0.455528259277,0.867211103439],
-                        [-0.121444880962,0.196501940489,0.97295331955],
-                        [-0.0407496243715,0.197802826762,0.979394435883],
-                        [-0.0820460245013,0.265506535769,0.960611641407],
-                        [-0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0,0.130150929093,0.991494178772],
-                        [0.0407496243715,0.197802826762,0.979394435883],
-                        [0.121444880962,0.196501940489,0.97295331955],
-                        [0.0820460245013,0.265506535769,0.960611641407],
-                        [0.0,0.130150929093,0.991494178772],
-                        [0.0407496243715,0.197802826762,0.979394435883],
-                        [-0.0407496243715,0.197802826762,0.979394435883],
-                        [0.0410230122507,0.464636415243,0.88455080986],
-                        [0.122248865664,0.461539924145,0.878655850887],
-                        [0.0809632539749,0.524005174637,0.847858190536],
-                        [0.123069040477,0.33188316226,0.935258030891],
-                        [0.202408134937,0.327503234148,0.922915279865],
-                        [0.162998497486,0.395605653524,0.903840482235],
-                        [0.20109423995,0.455528259277,0.867211103439],
-                        [0.276221334934,0.446935534477,0.85085272789],
-                        [0.236761152744,0.510783493519,0.826465010643],
-                        [0.162998497486,0.395605653524,0.903840482235],
-                        [0.20109423995,0.455528259277,0.867211103439],
-                        [0.122248865664,0.461539924145,0.878655850887],
-                        [-0.0820460245013,0.265506535769,0.960611641407],
-                        [-0.04130198434,0.334140062332,0.941618084908],
-                        [-0.123069040477,0.33188316226,0.935258030891],
-                        [0.0820460245013,0.265506535769,0.960611641407],
-                        [0.123069040477,0.33188316226,0.935258030891],
-                        [0.04130198434,0.334140062332,0.941618084908],
-                        [0.0,0.400968074799,0.916092038155],
-                        [0.0410230122507,0.464636415243,0.88455080986],
-                        [-0.0410230122507,0.464636415243,0.88455080986],
-                        [0.04130198434,0.334140062332,0.941618084908],
-                        [0.0,0.400968074799,0.916092038155],
-                        [-0.04130198434,0.334140062332,0.941618084908],
-                        [-0.0549761541188,0.858619451523,-0.509656965733],
-                        [-0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0,0.8796184659,-0.475679844618],
-                        [-0.174905076623,0.866019308567,-0.468421578407],
-                        [-0.180623859167,0.894335091114,-0.409316182137],
-                        [-0.117213711143,0.892938017845,-0.434652328491],
-                        [-0.0586068555713,0.915323853493,-0.398431301117],
-                        [-0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0,0.932827115059,-0.360324263573],
-                        [-0.117213711143,0.892938017845,-0.434652328491],
-                        [-0.0586068555713,0.915323853493,-0.398431301117],
-                        [-0.0568443164229,0.887796461582,-0.456712335348],
-                        [-0.3044308424,0.857896447182,-0.413926929235],
-                        [-0.313436716795,0.883275330067,-0.348686188459],
-                        [-0.246351331472,0.891307473183,-0.380633711815],
-                        [-0.436200261116,0.830415487289,-0.346611320972],
-                        [-0.446935534477,0.85085272789,-0.276221334934],
-                        [-0.380723625422,0.869839549065,-0.313733518124],
-                        [-0.321246802807,0.905284404755,-0.277958005667],
-                        [-0.327503234148,0.922915279865,-0.202408134937],
-                        [-0.258633822203,0.935745954514,-0.239766731858],
-                        [-0.380723625422,0.869839549065,-0.313733518124],
-                        [-0.321246802807,0.905284404755,-0.277958005667],
-                        [-0.313436716795,0.883275330067,-0.348686188459],
-                        [-0.0615878328681,0.961880862713,-0.266443610191],
-                        [-0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0,0.974178731441,-0.225778326392],
-                        [-0.193975359201,0.960443258286,-0.199805602431],
-                        [-0.196501940489,0.97295331955,-0.121444880962],
-                        [-0.128498718143,0.978907585144,-0.158833146095],
-                        [-0.0634539350867,0.991025745869,-0.117650069296],
-                        [-0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0,0.997029185295,-0.0770247355103],
-                        [-0.128498718143,0.978907585144,-0.158833146095],
-                        [-0.0634539350867,0.991025745869,-0.117650069296],
-                        [-0.0626873448491,0.979053080082,-0.193714544177],
-                        [-0.246351331472,0.891307473183,-0.380633711815],
-                        [-0.185843646526,0.920180141926,-0.34457308054],
-                        [-0.180623859167,0.894335091114,-0.409316182137],
-                        [-0.258633822203,0.935745954514,-0.239766731858],
-                        [-0.193975359201,0.960443258286,-0.199805602431],
-                        [-0.190361812711,0.942551255226,-0.274516820908],
-                        [-0.123895764351,0.943842172623,-0.306287169456],
-                        [-0.0615878328681,0.961880862713,-0.266443610191],
-                        [-0.0602079555392,0.940329909325,-0.334895044565],
-                        [-0.190361812711,0.942551255226,-0.274516820908],
-                        [-0.123895764351,0.943842172623,-0.306287169456],
-                        [-0.185843646526,0.920180141926,-0.34457308054],
-                        [-0.560828924179,0.782811582088,-0.269586592913],
-                        [-0.571085453033,0.797127783298,-0.196083456278],
-                        [-0.510783493519,0.826465010643,-0.236761152744],
-                        [-0.669747889042,0.718357801437,-0.188148602843],
-                        [-0.677466154099,0.726636230946,-0.114190116525],
-                        [-0.62687343359,0.763553202152,-0.154971644282],
-                        [-0.578244268894,0.807120084763,-0.119124859571],
-                        [-0.581926107407,0.81225925684,-0.0399611219764],
-                        [-0.524005174637,0.847858190536,-0.0809632539749],
-                        [-0.62687343359,0.763553202152,-0.154971644282],
-                        [-0.578244268894,0.807120084763,-0.119124859571],
-                        [-0.571085453033,0.797127783298,-0.196083456278],
-                        [-0.757922053337,0.643326640129,-0.108097285032],
-                        [-0.761889100075,0.646693944931,-0.0362210273743],
-                        [-0.722495436668,0.687358558178,-0.0744211226702],
-                        [-0.82464236021,0.564633131027,-0.0339771322906],
-                        [-0.82464236021,0.564633131027,0.0339771322906],
-                        [-0.79582041502,0.605532705784,0.0],
-                        [-0.761889100075,0.646693944931,0.0362210273743],
-                        [-0.757922053337,0.643326640129,0.108097285032],
-                        [-0.722495436668,0.687358558178,0.0744211226702],
-                        [-0.79582041502,0.605532705784,0.0],
-                        [-0.761889100075,0.646693944931,0.0362210273743],
-                        [-0.761889100075,0.646693944931,-0.0362210273743],
-                        [-0.581926107407,0.81225925684,0.0399611219764],
-                        [-0.578244268894,0.807120084763,0.119124859571],
-                        [-0.524005174637,0.847858190536,0.0809632539749],
-                        [-0.677466154099,0.726636230946,0.114190116525],
-                        [-0.669747889042,0.718357801437,0.188148602843],
-                        [-0.62687343359,0.763553202152,0.154971644282],
-                        [-0.571085453033,0.797127783298,0.196083456278],
-                        [-0.560828924179,0.782811582088,0.269586592913],
-                        [-0.510783493519,0.826465010643,0.236761152744],
-                        [-0.62687343359,0.763553202152,0.154971644282],
-                        [-0.571085453033,0.797127783298,0.196083456278],
-                        [-0.578244268894,0.807120084763,0.119124859571],
-                        [-0.722495436668,0.687358558178,-0.0744211226702],
-                        [-0.68142670393,0.730884253979,-0.0382858961821],
-                        [-0.677466154099,0.726636230946,-0.114190116525],
-                        [-0.722495436668,0.687358558178,0.0744211226702],
-                        [-0.677466154099,0.726636230946,0.114190116525],
-                        [-0.68142670393,0.730884253979,0.0382858961821],
-                        [-0.634539365768,0.772890508175,0.0],
-                        [-0.581926107407,0.81225925684,0.0399611219764],
-                        [-0.581926107407,0.81225925684,-0.0399611219764],
-                        [-0.68142670393,0.730884253979,0.0382858961821],
-                        [-0.634539365768,0.772890508175,0.0],
-                        [-0.68142670393,0.730884253979,-0.0382858961821],
-                        [-0.0638479366899,0.997179210186,0.0394601933658],
-                        [-0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0,0.997029185295,0.0770247355103],
-                        [-0.196501940489,0.97295331955,0.121444880962],
-                        [-0.193975359201,0.960443258286,0.199805602431],
-                        [-0.128498718143,0.978907585144,0.158833146095],
-                        [-0.0626873448491,0.979053080082,0.193714544177],
-                        [-0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0,0.974178731441,0.225778326392],
-                        [-0.128498718143,0.978907585144,0.158833146095],
-                        [-0.0626873448491,0.979053080082,0.193714544177],
-                        [-0.0634539350867,0.991025745869,0.117650069296],
-                        [-0.327503234148,0.922915279865,0.202408134937],
-                        [-0.321246802807,0.905284404755,0.277958005667],
-                        [-0.258633822203,0.935745954514,0.239766731858],
-                        [-0.446935534477,0.85085272789,0.276221334934],
-                        [-0.436200261116,0.830415487289,0.346611320972],
-                        [-0.380723625422,0.869839549065,0.313733518124],
-                        [-0.313436716795,0.883275330067,0.348686188459],
-                        [-0.3044308424,0.857896447182,0.413926929235],
-                        [-0.246351331472,0.891307473183,0.380633711815],
-                        [-0.380723625422,0.869839549065,0.313733518124],
-                        [-0.313436716795,0.883275330067,0.348686188459],
-                        [-0.321246802807,0.905284404755,0.277958005667],
-                        [-0.0602079555392,0.940329909325,0.334895044565],
-                        [-0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0,0.932827115059,0.360324263573],
-                        [-0.180623859167,0.894335091114,0.409316182137],
-                        [-0.174905076623,0.866019308567,0.468421578407],
-                        [-0.117213711143,0.892938017845,0.434652328491],
-                        [-0.0568443164229,0.887796461582,0.456712335348],
-                        [-0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0,0.8796184659,0.475679844618],
-                        [-0.117213711143,0.892938017845,0.434652328491],
-                        [-0.0568443164229,0.887796461582,0.456712335348],
-                        [-0.0586068555713,0.915323853493,0.398431301117],
-                        [-0.258633822203,0.935745954514,0.239766731858],
-                        [-0.190361812711,0.942551255226,0.274516820908],
-                        [-0.193975359201,0.960443258286,0.199805602431],
-                        [-0.246351331472,0.891307473183,0.380633711815],
-                        [-0.180623859167,0.894335091114,0.409316182137],
-                        [-0.185843646526,0.920180141926,0.34457308054],
-                        [-0.123895764351,0.943842172623,0.306287169456],
-                        [-0.0602079555392,0.940329909325,0.334895044565],
-                        [-0.0615878328681,0.961880862713,0.266443610191],
-                        [-0.185843646526,0.920180141926,0.34457308054],
-                        [-0.123895764351,0.943842172623,0.306287169456],
-                        [-0.190361812711,0.942551255226,0.274516820908],
-                        [-0.510783493519,0.826465010643,-0.236761152744],
-                        [-0.455528259277,0.867211103439,-0.20109423995],
-                        [-0.446935534477,0.85085272789,-0.276221334934],
-                        [-0.524005174637,0.847858190536,-0.0809632539749],
-                        [-0.464636415243,0.88455080986,-0.0410230122507],
-                        [-0.461539924145,0.878655850887,-0.122248865664],
-                        [-0.395605653524,0.903840482235,-0.162998497486],
-                        [-0.33188316226,0.935258030891,-0.123069040477],
-                        [-0.327503234148,0.922915279865,-0.202408134937],
-                        [-0.461539924145,0.878655850887,-0.122248865664],
-                        [-0.395605653524,0.903840482235,-0.162998497486],
-                        [-0.455528259277,0.867211103439,-0.20109423995],
-                        [-0.524005174637,0.847858190536,0.0809632539749],
-                        [-0.461539924145,0.878655850887,0.122248865664],
-                        [-0.464636415243,0.88455080986,0.0410230122507],
-                        [-0.510783493519,0.826465010643,0.236761152744],
-                        [-0.446935534477,0.85085272789,0.276221334934],
-                        [-0.455528259277,0.867211103439,0.20109423995],
-                        [-0.395605653524,0.903840482235,0.162998497486],
-                        [-0.327503234148,0.922915279865,0.202408134937],
-                        [-0.33188316226,0.935258030891,0.123069040477],
-                        [-0.455528259277,0.867211103439,0.20109423995],
-                        [-0.395605653524,0.903840482235,0.162998497486],
-                        [-0.461539924145,0.878655850887,0.122248865664],
-                        [-0.265506535769,0.960611641407,-0.0820460245013],
-                        [-0.197802826762,0.979394435883,-0.0407496243715],
-                        [-0.196501940489,0.97295331955,-0.121444880962],
-                        [-0.265506535769,0.960611641407,0.0820460245013],
-                        [-0.196501940489,0.97295331955,0.121444880962],
-                        [-0.197802826762,0.979394435883,0.0407496243715],
-                        [-0.130150929093,0.991494178772,0.0],
-                        [-0.0638479366899,0.997179210186,0.0394601933658],
-                        [-0.0638479366899,0.997179210186,-0.0394601933658],
-                        [-0.197802826762,0.979394435883,0.0407496243715],
-                        [-0.130150929093,0.991494178772,0.0],
-                        [-0.197802826762,0.979394435883,-0.0407496243715],
-                        [-0.464636415243,0.88455080986,0.0410230122507],
-                        [-0.400968074799,0.916092038155,0.0],
-                        [-0.464636415243,0.88455080986,-0.0410230122507],
-                        [-0.33188316226,0.935258030891,0.123069040477],
-                        [-0.265506535769,0.960611641407,0.0820460245013],
-                        [-0.334140062332,0.941618084908,0.04130198434],
-                        [-0.334140062332,0.941618084908,-0.04130198434],
-                        [-0.265506535769,0.960611641407,-0.0820460245013],
-                        [-0.33188316226,0.935258030891,-0.123069040477],
-                        [-0.334140062332,0.941618084908,0.04130198434],
-                        [-0.334140062332,0.941618084908,-0.04130198434],
-                        [-0.400968074799,0.916092038155,0.0],
-                        [0.564633131027,0.0339771322906,-0.82464236021],
-                        [0.605532705784,0.0,-0.79582041502],
-                        [0.564633131027,-0.0339771322906,-0.82464236021],
-                        [0.643326640129,0.108097285032,-0.757922053337],
-                        [0.687358558178,0.0744211226702,-0.722495436668],
-                        [0.646693944931,0.0362210273743,-0.761889100075],
-                        [0.646693944931,-0.0362210273743,-0.761889100075],
-                        [0.687358558178,-0.0744211226702,-0.722495436668],
-                        [0.643326640129,-0.108097285032,-0.757922053337],
-                        [0.646693944931,0.0362210273743,-0.761889100075],
-                        [0.646693944931,-0.0362210273743,-0.761889100075],
-                        [0.605532705784,0.0,-0.79582041502],
-                        [0.718357801437,0.188148602843,-0.669747889042],
-                        [0.763553202152,0.154971644282,-0.62687343359],
-                        [0.726636230946,0.114190116525,-0.677466154099],
-                        [0.782811582088,0.269586592913,-0.560828924179],
-                        [0.826465010643,0.236761152744,-0.510783493519],
-                        [0.797127783298,0.196083456278,-0.571085453033],
-                        [0.807120084763,0.119124859571,-0.578244268894],
-                        [0.847858190536,0.0809632539749,-0.524005174637],
-                        [0.81225925684,0.0399611219764,-0.581926107407],
-                        [0.797127783298,0.196083456278,-0.571085453033],
-                        [0.807120084763,0.119124859571,-0.578244268894],
-                        [0.763553202152,0.154971644282,-0.62687343359],
-                        [0.726636230946,-0.114190116525,-0.677466154099],
-                        [0.763553202152,-0.154971644282,-0.62687343359],
-                        [0.718357801437,-0.188148602843,-0.669747889042],
-                        [0.81225925684,-0.0399611219764,-0.581926107407],
-                        [0.847858190536,-0.0809632539749,-0.524005174637],
-                        [0.807120084763,-0.119124859571,-0.578244268894],
-                        [0.797127783298,-0.196083456278,-0.571085453033],
-                        [0.826465010643,-0.236761152744,-0.510783493519],
-                        [0.782811582088,-0.269586592913,-0.560828924179],
-                        [0.807120084763,-0.119124859571,-0.578244268894],
-                        [0.797127783298,-0.196083456278,-0.571085453033],
-                        [0.763553202152,-0.154971644282,-0.62687343359],
-                        [0.726636230946,0.114190116525,-0.677466154099],
-                        [0.730884253979,0.0382858961821,-0.68142670393],
-                        [0.687358558178,0.0744211226702,-0.722495436668],
-                        [0.81225925684,0.0399611219764,-0.581926107407],
-                        [0.81225925684,-0.0399611219764,-0.581926107407],
-                        [0.772890508175,0.0,-0.634539365768],
-                        [0.730884253979,-0.0382858961821,-0.68142670393],
-                        [0.726636230946,-0.114190116525,-0.677466154099],
-                        [0.687358558178,-0.0744211226702,-0.722495436668],
-                        [0.772890508175,0.0,-0.634539365768],
-                        [0.730884253979,-0.0382858961821,-0.68142670393],
-                        [0.730884253979,0.0382858961821,-0.68142670393],
-                        [0.830415487289,0.346611320972,-0.436200261116],
-                        [0.869839549065,0.313733518124,-0.380723625422],
-                        [0.85085272789,0.276221334934,-0.446935534477],
-                        [0.857896447182,0.413926929235,-0.3044308424],
-                        [0.891307473183,0.380633711815,-0.246351331472],
-                        [0.883275330067,0.348686188459,-0.313436716795],
-                        [0.905284404755,0.277958005667,-0.321246802807],
-                        [0.935745954514,0.239766731858,-0.258633822203],
-                        [0.922915279865,0.202408134937,-0.327503234148],
-                        [0.883275330067,0.348686188459,-0.313436716795],
-                        [0.905284404755,0.277958005667,-0.321246802807],
-                        [0.869839549065,0.313733518124,-0.380723625422],
-                        [0.866019308567,0.468421578407,-0.174905076623],
-                        [0.892938017845,0.434652328491,-0.117213711143],
-                        [0.894335091114,0.409316182137,-0.180623859167],
-                        [0.858619451523,0.509656965733,-0.0549761541188],
-                        [0.8796184659,0.475679844618,0.0],
-                        [0.887796461582,0.456712335348,-0.0568443164229],
-                        [0.915323853493,0.398431301117,-0.0586068555713],
-                        [0.932827115059,0.360324263573,0.0],
-                        [0.940329909325,0.334895044565,-0.0602079555392],
-                        [0.887796461582,0.456712335348,-0.0568443164229],
-                        [0.915323853493,0.398431301117,-0.0586068555713],
-                        [0.892938017845,0.434652328491,-0.117213711143],
-                        [0.960443258286,0.199805602431,-0.193975359201],
-                        [0.978907585144,0.158833146095,-0.128498718143],
-                        [0.97295331955,0.121444880962,-0.196501940489],
-                        [0.961880862713,0.266443610191,-0.0615878328681],
-                        [0.974178731441,0.225778326392,0.0],
-                        [0.979053080082,0.193714544177,-0.0626873448491],
-                        [0.991025745869,0.117650069296,-0.0634539350867],
-                        [0.997029185295,0.0770247355103,0.0],
-                        [0.997179210186,0.0394601933658,-0.0638479366899],
-                        [0.979053080082,0.193714544177,-0.0626873448491],
-                        [0.991025745869,0.117650069296,-0.0634539350867],
-                        [0.978907585144,0.158833146095,-0.128498718143],
-                        [0.894335091114,0.409316182137,-0.180623859167],
-                        [0.920180141926,0.34457308054,-0.185843646526],
-                        [0.891307473183,0.380633711815,-0.246351331472],
-                        [0.940329909325,0.334895044565,-0.0602079555392],
-                        [0.961880862713,0.266443610191,-0.0615878328681],
-                        [0.943842172623,0.306287169456,-0.123895764351],
-                        [0.942551255226,0.274516820908,-0.190361812711],
-                        [0.960443258286,0.199805602431,-0.193975359201],
-                        [0.935745954514,0.239766731858,-0.258633822203],
-                        [0.943842172623,0.306287169456,-0.123895764351],
-                        [0.942551255226,0.274516820908,-0.190361812711],
-                        [0.920180141926,0.34457308054,-0.185843646526],
-                        [0.85085272789,-0.276221334934,-0.446935534477],
-                        [0.869839549065,-0.313733518124,-0.380723625422],
-                        [0.830415487289,-0.346611320972,-0.436200261116],
-                        [0.922915279865,-0.202408134937,-0.327503234148],
-                        [0.935745954514,-0.239766731858,-0.258633822203],
-                        [0.905284404755,-0.277958005667,-0.321246802807],
-                        [0.883275330067,-0.348686188459,-0.313436716795],
-                        [0.891307473183,-0.380633711815,-0.246351331472],
-                        [0.857896447182,-0.413926929235,-0.3044308424],
-                        [0.905284404755,-0.277958005667,-0.321246802807],
-                        [0.883275330067,-0.348686188459,-0.313436716795],
-                        [0.869839549065,-0.313733518124,-0.380723625422],
-                        [0.97295331955,-0.121444880962,-0.196501940489],
-                        [0.978907585144,-0.158833146095,-0.128498718143],
-                        [0.960443258286,-0.199805602431,-0.193975359201],
-                        [0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [0.997029185295,-0.0770247355103,0.0],
-                        [0.991025745869,-0.117650069296,-0.0634539350867],
-                        [0.979053080082,-0.193714544177,-0.0626873448491],
-                        [0.974178731441,-0.225778326392,0.0],
-                        [0.961880862713,-0.266443610191,-0.0615878328681],
-                        [0.991025745869,-0.117650069296,-0.0634539350867],
-                        [0.979053080082,-0.193714544177,-0.0626873448491],
-                        [0.978907585144,-0.158833146095,-0.128498718143],
-                        [0.894335091114,-0.409316182137,-0.180623859167],
-                        [0.892938017845,-0.434652328491,-0.117213711143],
-                        [0.866019308567,-0.468421578407,-0.174905076623],
-                        [0.940329909325,-0.334895044565,-0.0602079555392],
-                        [0.932827115059,-0.360324263573,0.0],
-                        [0.915323853493,-0.398431301117,-0.0586068555713],
-                        [0.887796461582,-0.456712335348,-0.0568443164229],
-                        [0.8796184659,-0.475679844618,0.0],
-                        [0.858619451523,-0.509656965733,-0.0549761541188],
-                        [0.915323853493,-0.398431301117,-0.0586068555713],
-                        [0.887796461582,-0.456712335348,-0.0568443164229],
-                        [0.892938017845,-0.434652328491,-0.117213711143],
-                        [0.960443258286,-0.199805602431,-0.193975359201],
-                        [0.942551255226,-0.274516820908,-0.190361812711],
-                        [0.935745954514,-0.239766731858,-0.258633822203],
-                        [0.961880862713,-0.266443610191,-0.0615878328681],
-                        [0.940329909325,-0.334895044565,-0.0602079555392],
-                        [0.943842172623,-0.306287169456,-0.123895764351],
-                        [0.920180141926,-0.34457308054,-0.185843646526],
-                        [0.894335091114,-0.409316182137,-0.180623859167],
-                        [0.891307473183,-0.380633711815,-0.246351331472],
-                        [0.943842172623,-0.306287169456,-0.123895764351],
-                        [0.920180141926,-0.34457308054,-0.185843646526],
-                        [0.942551255226,-0.274516820908,-0.190361812711],
-                        [0.85085272789,0.276221334934,-0.446935534477],
-                        [0.867211103439,0.20109423995,-0.455528259277],
-                        [0.826465010643,0.236761152744,-0.510783493519],
-                        [0.922915279865,0.202408134937,-0.327503234148],
-                        [0.935258030891,0.123069040477,-0.33188316226],
-                        [0.903840482235,0.162998497486,-0.395605653524],
-                        [0.878655850887,0.122248865664,-0.461539924145],
-                        [0.88455080986,0.0410230122507,-0.464636415243],
-                        [0.847858190536,0.0809632539749,-0.524005174637],
-                        [0.903840482235,0.162998497486,-0.395605653524],
-                        [0.878655850887,0.122248865664,-0.461539924145],
-                        [0.867211103439,0.20109423995,-0.455528259277],
-                        [0.97295331955,0.121444880962,-0.196501940489],
-                        [0.979394435883,0.0407496243715,-0.197802826762],
-                        [0.960611641407,0.0820460245013,-0.265506535769],
-                        [0.997179210186,0.0394601933658,-0.0638479366899],
-                        [0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [0.991494178772,0.0,-0.130150929093],
-                        [0.979394435883,-0.0407496243715,-0.197802826762],
-                        [0.97295331955,-0.121444880962,-0.196501940489],
-                        [0.960611641407,-0.0820460245013,-0.265506535769],
-                        [0.991494178772,0.0,-0.130150929093],
-                        [0.979394435883,-0.0407496243715,-0.197802826762],
-                        [0.979394435883,0.0407496243715,-0.197802826762],
-                        [0.88455080986,-0.0410230122507,-0.464636415243],
-                        [0.878655850887,-0.122248865664,-0.461539924145],
-                        [0.847858190536,-0.0809632539749,-0.524005174637],
-                        [0.935258030891,-0.123069040477,-0.33188316226],
-                        [0.922915279865,-0.202408134937,-0.327503234148],
-                        [0.903840482235,-0.162998497486,-0.395605653524],
-                        [0.867211103439,-0.20109423995,-0.455528259277],
-                        [0.85085272789,-0.276221334934,-0.446935534477],
-                        [0.826465010643,-0.236761152744,-0.510783493519],
-                        [0.903840482235,-0.162998497486,-0.395605653524],
-                        [0.867211103439,-0.20109423995,-0.455528259277],
-                        [0.878655850887,-0.122248865664,-0.461539924145],
-                        [0.960611641407,0.0820460245013,-0.265506535769],
-                        [0.941618084908,0.04130198434,-0.334140062332],
-                        [0.935258030891,0.123069040477,-0.33188316226],
-                        [0.960611641407,-0.0820460245013,-0.265506535769],
-                        [0.935258030891,-0.123069040477,-0.33188316226],
-                        [0.941618084908,-0.04130198434,-0.334140062332],
-                        [0.916092038155,0.0,-0.400968074799],
-                        [0.88455080986,-0.0410230122507,-0.464636415243],
-                        [0.88455080986,0.0410230122507,-0.464636415243],
-                        [0.941618084908,-0.04130198434,-0.334140062332],
-                        [0.916092038155,0.0,-0.400968074799],
-                        [0.941618084908,0.04130198434,-0.334140062332]]
+                def geodesic_sphere_points(level=4):
+                    """vertices of an icosphere of radius 1 as a flat float array (x,y,z,x,y,z...), built once per subdivision level (level 4: 2562 points)"""
+                    if level in Toolbox.Points.GEODESIC: return Toolbox.Points.GEODESIC[level]
+
+                    # icosahedron
+                    t = (1 + math.sqrt(5)) / 2
+                    vertices = []
+                    for a in (-1, 1):
+                        for b in (-1, 1):
+                            vertices += [(a*t, b, 0), (0, a*t, b), (b, 0, a*t)]
+                    faces = []
+                    for i in range(12):
+                        for j in range(i+1, 12):
+                            for k in range(j+1, 12):
+                                if [1 for (p, q) in [(i, j), (j, k), (i, k)] if abs(math.sqrt(sum([(vertices[p][x]-vertices[q][x])**2 for x in range(3)])) - 2) > 1e-9] == []:
+                                    faces.append((i, j, k))
+
+                    # each face of the icosahedron is divided into a triangular grid of 2^level segments per edge, pushed back on the sphere
+                    frequency = 2 ** level
+                    points = array('d')
+                    found = set()
+                    for (a, b, c) in faces:
+                        for i in range(frequency + 1):
+                            for j in range(frequency + 1 - i):
+                                k = frequency - i - j
+                                p = [i*vertices[a][x] + j*vertices[b][x] + k*vertices[c][x] for x in range(3)]
+                                length = math.sqrt(p[0]**2 + p[1]**2 + p[2]**2)
+                                p = [p[0]/length, p[1]/length, p[2]/length]
+                                key = (round(p[0], 9), round(p[1], 9), round(p[2], 9))
+                                if key not in found:
+                                    found.add(key)
+                                    points.extend(p)
+                    Toolbox.Points.GEODESIC[level] = points
                     return points
 
 
@@ -64,12 +64,18 @@ class MyComponent(component):
 
     
     def RunScript(self, alpha, beta):
-       
+
+        class InsertionConstraint(object):
+            """parametric insertion space read by the model: directions within alpha (XZ) and beta (YZ) angular limits around the contact normal"""
+            def __init__(self, alpha, beta):
+                self.alpha = alpha
+                self.beta = beta
+            def __repr__(self):
+                return 'InsertionConstraint(alpha=' + str(self.alpha) + ', beta=' + str(self.beta) + ')'
+
         constraint = None
         boundaries = None
-        sphere =  rs.AddSphere((0,0,0),1)
         cutter = rs.AddPlanarSrf(rs.AddPolyline([(1,1,0),(1,-1,0),(-1,-1,0),(-1,1,0),(1,1,0)]))
-        hemisphere = rs.SplitBrep(sphere,cutter)[1]
 
         if alpha is None: alpha = 180
         if beta is None: beta = 180
@@ -84,24 +90,7 @@ class MyComponent(component):
         boundaries.append(cutter4)
         boundaries.append(cutter5)
 
-        if alpha == 0:
-            if beta == 0:
-                constraint = rs.AddPoint(0,0,1)
-            else:
-                arc = rs.AddArc(rs.WorldYZPlane(),1,beta)
-                constraint = rs.RotateObject(arc,(0,0,0),90-(beta/2),(1,0,0),(True))
-        else:
-            if beta == 0:
-                arc = rs.AddArc(rs.WorldZXPlane(),1,alpha)
-                constraint = rs.RotateObject(arc,(0,0,0),-(alpha/2),(0,1,0),(True))
-            else:
-                constraint = hemisphere
-                if alpha<180:
-                    constraint = rs.SplitBrep(constraint,cutter2)[0]
-                    constraint = rs.SplitBrep(constraint,cutter3)[1]
-                if beta<180:
-                    constraint = rs.SplitBrep(constraint,cutter4)[0]
-                    constraint = rs.SplitBrep(constraint,cutter5)[1]
+        constraint = InsertionConstraint(alpha, beta)
 
         return (constraint,boundaries)
 
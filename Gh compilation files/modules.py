@@ -108,7 +108,7 @@ class MyComponent(component):
             if module_id != None:
                 module_id = module_id % len(model.modules)
                 module = model.modules[module_id]
-                breps = model.modules[module_id].breps
+                breps = model.modules[module_id].breps.to_list()
                 step = str(model.modules[module_id].step)
                 sequence = str(model.modules[module_id].sequence)
                 assembly_vectors = []
@@ -125,7 +125,7 @@ class MyComponent(component):
                 assembly_vectors = []
                 for mod in model.modules:
                     module.append(mod)
-                    breps.append(mod.breps)
+                    breps.append(mod.breps.to_list())
                     sequence.append(str(mod.sequence))
                     step.append(str(mod.step))
                     sub_assembly_vectors = []
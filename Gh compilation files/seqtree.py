@@ -84,173 +84,186 @@ class MyComponent(component):
         seq = sequence
         tree = datatree
 
+        class SequenceTree(object):
+            """
+            Assembly sequence parsed once. Nodes are numbered in preorder, node 0 is the whole sequence.
+            A node is a module (value None) or a plate (value = plate index).
+            Plates of node n are plates[first[n]:last[n]], in sequence order.
+            """
+
+            def __init__(self, sequence):
+                self.value = []
+                self.parent = []
+                self.children = []
+                self.depth = []
+                self.index = [] # position of the node in its parent
+                self.first = []
+                self.last = []
+                self.plates = []
+                self.leaf = {} # plate -> node
+                self.__parse(str(sequence))
+                self.modules = self.__get_modules()
+
+            def __repr__(self):
+                return 'SequenceTree(' + self.text() + ')'
+
+            def __len__(self):
+                return len(self.plates)
+
+            def __add_node(self, parent, value):
+                n = len(self.value)
+                self.value.append(value)
+                self.parent.append(parent)
+                self.children.append([])
+                self.first.append(len(self.plates))
+                self.last.append(len(self.plates))
+                if parent < 0:
+                    self.depth.append(0)
+                    self.index.append(0)
+                else:
+                    self.depth.append(self.depth[parent] + 1)
+                    self.index.append(len(self.children[parent]))
+                    self.children[parent].append(n)
+                return n
+
+            def __parse(self, text):
+                """single pass over the text, nested lists of integers only"""
+                text = text.strip()
+                if len(text) <= 2: raise Exception(' Error is sequence input.')
+                if text[0] != '[' or text[-1] != ']': raise Exception(' Sequence should start and end with hooks.')
+                digits = '0123456789'
+                stack = []
+                need = True # an item is expected
+                i = 0
+                while i < len(text):
+                    c = text[i]
+                    if c == '[':
+                        if not need: raise Exception(' Missing coma(s) in sequence.')
+                        if stack == [] and len(self.value) > 0: raise Exception(' Missing hook(s) in sequence.')
+                        stack.append(self.__add_node(stack[-1] if stack != [] else -1, None))
+                    elif c == ']':
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if self.children[stack[-1]] == []: raise Exception(' Empty module in sequence.')
+                        if need: raise Exception(' Missing coma(s) in sequence.')
+                        self.last[stack.pop()] = len(self.plates)
+                    elif c == ',':
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if need: raise Exception(' Missing coma(s) in sequence.')
+                        need = True
+                        i += 1
+                        continue
+                    elif c in digits:
+                        j = i
+                        while j < len(text) and text[j] in digits: j += 1
+                        plate = int(text[i:j])
+                        if not need: raise Exception(' Missing coma(s) in sequence.')
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if plate in self.leaf: raise Exception(' Plate ' + str(plate) + ' appears several times in sequence.')
+                        self.leaf[plate] = self.__add_node(stack[-1], plate)
+                        self.plates.append(plate)
+                        self.last[-1] = len(self.plates)
+                        need = False
+                        i = j
+                        continue
+                    elif c == ' ': 
+                        i += 1
+                        continue
+                    else: raise Exception(' Invalid character in sequence.')
+                    need = c == '['
+                    i += 1
+                if stack != []: raise Exception(' Missing hook(s) in sequence.')
+
+            def __get_modules(self):
+                """modules deepest first (in sequence order for a same depth), the whole sequence last"""
+                buckets = []
+                for n in range(1, len(self.value)):
+                    if self.value[n] is None:
+                        while len(buckets) < self.depth[n]: buckets.append([])
+                        buckets[self.depth[n] - 1].append(n)
+                buckets.reverse()
+                return [n for bucket in buckets for n in bucket] + [0]
+
+            # ACCESS -----------------------------------------------------
+
+            def path(self, n):
+                """path of a node as a list of indices, [] for the whole sequence"""
+                path = []
+                while n > 0:
+                    path.append(self.index[n])
+                    n = self.parent[n]
+                path.reverse()
+                return path
+
+            def node(self, path):
+                """node at a path ('Model', [] or a list of indices)"""
+                n = 0
+                if path == 'Model' or path == ['Model']: return n
+                for j in path:
+                    if self.value[n] is not None or j >= len(self.children[n]): raise Exception(' Path ' + str(path) + ' is not in the sequence.')
+                    n = self.children[n][j]
+                return n
+
+            def members(self, n=0):
+                """plates of a node in sequence order"""
+                return self.plates[self.first[n]:self.last[n]]
+
+            def leaves(self):
+                """plate nodes in sequence order"""
+                return [self.leaf[p] for p in self.plates]
+
+            def item(self, n=0):
+                """node as a nested list (or an integer for a plate)"""
+                if self.value[n] is not None: return self.value[n]
+                return [self.item(c) for c in self.children[n]]
+
+            def text(self, n=0, names=None):
+                """node as a sequence string, plates can be renamed with a dictionary"""
+                if self.value[n] is not None:
+                    if names is None: return str(self.value[n])
+                    return str(names[self.value[n]])
+                return '[' + ','.join([self.text(c, names) for c in self.children[n]]) + ']'
+
+            def renumbered(self):
+                """same tree with plates numbered in sequence order"""
+                return SequenceTree(self.text(0, dict([(self.plates[k], k) for k in range(len(self.plates))])))
+
+            @staticmethod
+            def from_paths(paths, values):
+                """tree from the paths of its plates (as seq_to_tree datatree branches)"""
+                root = []
+                for (path, value) in zip(paths, values):
+                    item = root
+                    for j in path[:-1]:
+                        if j == len(item): item.append([])
+                        if j > len(item) or type(item[j]) is not list: raise Exception(' Datatree paths do not describe a sequence.')
+                        item = item[j]
+                    if len(path) == 0 or path[-1] != len(item): raise Exception(' Datatree paths do not describe a sequence.')
+                    item.append(int(value))
+                return SequenceTree(root)
+
         def flatten_integer_list(l):
             """Flatten a nested list of integers"""
-            if type(l) is list:
-                new_l=[]
-                num = None
-                for i in range(len(str(l))):
-                    char = str(l)[i]
-                    if char != '[' and char != ']' and char!= ' ' and char != ',':
-                        if num == None: num = char
-                        else: num += char
-                    elif num != None: 
-                        new_l.append(int(num))
-                        num = None
-                return(new_l)
+            if type(l) is list: return SequenceTree(l).plates
             else: return l
-       
-        def seq_to_steps(seq):
-            step=[]
-            steps=[]
-            for i in range(len(str(seq))):
-                char = str(seq)[i]
-                if char == '[':
-                    index = 0
-                    step.append(index)
-                elif char == ']':
-                    del step[-1]
-                    index = 0
-                elif char == ' ':
-                    pass
-                elif char == ',':
-                    step[-1] += 1
-                if char == ',' or  char == '[':
-                    steps.append(copy.deepcopy(step))
-            return(steps)
-        
-        def deepest_steps(seq):
-            step=[]
-            steps=[]
-            for i in range(len(str(seq))):
-                char = str(seq)[i]
-                if char == '[':
-                    index = 0
-                    step.append(index)
-                elif char == ']':
-                    del step[-1]
-                    index = 0
-                elif char == ' ':
-                    pass
-                elif char == ',':
-                    step[-1] += 1
-                else:
-                    steps.append(copy.deepcopy(step))
-            return(steps)
-        
-        def get_item_from_path(l, path):
-            l = copy.deepcopy(l)
-            if type(path) == list:
-                for i in range(len(path)):
-                    l = l[path[i]]
-                return l
 
         def seq_to_tree(text):
             #sequence as text
-            seq = ast.literal_eval(text)
-            steps = seq_to_steps(seq)
-            deep = deepest_steps(seq)
+            seq = SequenceTree(text)
             tree = DataTree[object]()
-            for i in range(len(deep)):
-                path = deep[i]
-                item = get_item_from_path(seq, path)
-                temp = [item]
-                tree.Add(item, GH_Path(*path))
+            for n in seq.leaves():
+                tree.Add(seq.value[n], GH_Path(*seq.path(n)))
             return tree
 
         def tree_to_seq(tree):
-
-            # get tree paths as list of int
-            paths = []
-            parents = []
-            all_parents = []
-            for i in range(tree.BranchCount):
-                path_string = tree.Path(i).ToString()
-                path = []
-                num = None
-                for char in path_string:
-                    if char == '{' or char == ';' or char == '}':
-                        if num != None :
-                            path.append(num)
-                            num = None
-                    else : 
-                        if num == None: num = int(char)
-                        else: num = int(str(num) + char)
-                paths.append(path)
-                #parents
-                all_par=[]
-                if len(path) == 1 : 
-                    parents.append('M')
-                else: 
-                    parents.append(path[0:len(path)-1])
-                    for j in range(len(path)-1):
-                        all_par.append(path[0:len(path)-1-j])
-                all_par.append('M')
-                all_parents.append(all_par)
-
-            # create sequence from paths
-            seq_as_string = ''
-            for i in range(len(paths)):
-                path = paths[i]
-                #add coma
-                if i != 0 : seq_as_string += ','
-                #if parent doesn't exists before, add opening parenthesis
-                if (parents[i] in parents[0:i]) is False:
-                    #add one parenthesis for each zero in path.
-                    last_zeros = 0
-                    for j in range(len(path)):
-                        if path[j] == 0: last_zeros += 1
-                        else: last_zeros = 0
-                    seq_as_string += '[' * last_zeros 
-                #add number
-                seq_as_string += str(tree.AllData()[i])
-                #if parent doesn't exist after, add closing parenthesis
-                if (parents[i] in parents[i+1:len(parents)]) is False:
-                    #last parenthesis of the sequence
-                    if i+1 == len(paths):
-                        seq_as_string += ']' * len(path)
-                    else:
-                        count = 0
-                        search = True
-                        for j in range(len(all_parents[i])):
-                            if search == True:
-                                for k in range(len(all_parents[i+1])):
-                                    if search == True:
-                                        if all_parents[i][j] == all_parents[i+1][k]:
-                                            count = j
-                                            search = False
-                        seq_as_string += ']' * count
-            
-            return seq_as_string
+            """sequence string from a datatree with one plate per branch (see seq_to_tree)"""
+            paths = [list(tree.Path(i).Indices) for i in range(tree.BranchCount)]
+            data = tree.AllData()
+            return SequenceTree.from_paths(paths, [data[i] for i in range(len(paths))]).text()
 
         def test_seq(seq):
-            flag = False
-            if (type(seq) is str):
-                if len(seq) > 2:
-                    if seq[0] == '[' and seq[-1] == ']':
-                        comas=0
-                        ophook=0
-                        clhook=0
-                        numbers=[]
-                        num = ''
-                        flag = True
-                        for i in range(len(seq)):
-                            if seq[i] == '[' : ophook += 1
-                            elif seq[i] == ']' : clhook += 1
-                            elif seq[i] == ',' : comas += 1
-                            elif seq[i] == ' ': pass
-                            elif seq[i] in ['0','1','2','3','4','5','6','7','8','9'] :
-                                num += seq[i]
-                                if seq[i+1] not in ['0','1','2','3','4','5','6','7','8','9']: 
-                                    numbers.append(int(num))
-                                    num = ''
-                            else: raise Exception( 'Invalid character in sequence.')
-                        if ophook != clhook : raise Exception( 'Missing hook(s) in sequence.')
-                        if comas != len(numbers)-1 : raise Exception( 'Missing coma(s) in sequence.')
-                    else: raise Exception( 'Sequence should start and end with hooks.')
-            else: raise Exception( 'Sequence should be expressed as a string.')
-            if flag == False: raise Exception( 'Error is sequence input.')
-            return flag
+            if type(seq) is not str: raise Exception( 'Sequence should be expressed as a string.')
+            SequenceTree(seq)
+            return True
 
         def list_to_datatree(raggedList):
             """Python to Grasshopper"""
@@ -4,7 +4,6 @@ from ghpythonlib.componentbase import dotnetcompiledcomponent as component
 import Grasshopper, GhPython
 import System
 import rhinoscriptsyntax as rs
-import copy
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
@@ -85,13 +84,9 @@ class MyComponent(component):
         grouped = None
         if scale is None: scale = 1
         if model:
-            spheres = copy.deepcopy(model.contact_spheres)
-            grouped = copy.deepcopy(model.contact_spheres)
-            for i in range(len(model.contact_spheres)):
-                for j in range(len(model.contact_spheres[i])):
-                    spheres[i][j] = rs.ScaleObject(spheres[i][j],model.contact_centers[i][j],[scale,scale,scale])
-                    grouped[i][j] = rs.CopyObject(model.contact_spheres[i][j],rs.VectorCreate((0,0,0),model.contact_centers[i][j]))
-                    grouped[i][j] = rs.ScaleObject(grouped[i][j],(0,0,0),[scale,scale,scale])
+            # insertion constraints are parametric, their geometry is only built here for display
+            spheres = [[constraint.to_geometry(model.contact_centers[i][j], scale) for j, constraint in enumerate(row)] for i, row in enumerate(model.contact_spheres)]
+            grouped = [[constraint.to_geometry((0,0,0), scale) for constraint in row] for row in model.contact_spheres]
             spheres = list_to_datatree(spheres)
             grouped = list_to_datatree(grouped)
         
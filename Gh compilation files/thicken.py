@@ -131,50 +131,73 @@ class MyComponent(component):
                 except: rs.ReverseCurve(curve)
             return curve
 
-        def line_to_vec(line, unitize=False):
-            """get a vector from a line"""
-            vec = rs.VectorCreate(rs.CurveEndPoint(line),rs.CurveStartPoint(line))
-            if unitize is True:
-                vec = rs.VectorUnitize(vec)
-            return vec
+        def polyline_points(curve, tolerance=0.00001):
+            """vertices of a closed polyline without the closing vertex nor null segments"""
+            points = rs.PolylineVertices(curve)
+            return [points[k] for k in range(len(points)-1) if rs.Distance(points[k], points[k+1]) > tolerance]
 
-        def curve_seam(curve, point):
-            return rs.CurveSeam(curve, rs.CurveClosestPoint(curve, point))
+        def direction_symbols(points, symbols=None, angle_tolerance=1.0):
+            """quantize the segment directions of a closed polygon into integers, -1 for directions unknown to a frozen symbols table"""
+            frozen = symbols is not None
+            if symbols is None: symbols = {'cells': {}, 'directions': []}
+            cos = math.cos(math.radians(angle_tolerance))
+            step = 2 * math.sin(math.radians(angle_tolerance) / 2)
+            sequence = []
+            for k in range(len(points)):
+                u = rs.VectorUnitize(rs.VectorCreate(points[(k+1) % len(points)], points[k]))
+                cell = (int(math.floor(u[0]/step)), int(math.floor(u[1]/step)), int(math.floor(u[2]/step)))
+                best, best_dot = -1, cos
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for dz in (-1, 0, 1):
+                            for symbol in symbols['cells'].get((cell[0]+dx, cell[1]+dy, cell[2]+dz), []):
+                                dot = rs.VectorDotProduct(symbols['directions'][symbol], u)
+                                if dot >= best_dot: best, best_dot = symbol, dot
+                if best == -1 and frozen is False:
+                    best = len(symbols['directions'])
+                    symbols['directions'].append(u)
+                    symbols['cells'].setdefault(cell, []).append(best)
+                sequence.append(best)
+            return sequence, symbols
+
+        def seam_shift(points1, points2, angle_tolerance=1.0):
+            """smallest cyclic shift of polygon 2 making its segments parallel to polygon 1 ones, KMP search on the doubled direction sequence"""
+            symbols = direction_symbols(points1, None, angle_tolerance)[1]
+            pattern = direction_symbols(points1, symbols, angle_tolerance)[0]
+            text = direction_symbols(points2, symbols, angle_tolerance)[0]
+            n = len(pattern)
+            if n != len(text): return None
+            if n == 0: return 0
+            failure = [0] * n
+            k = 0
+            for i in range(1, n):
+                while k > 0 and pattern[i] != pattern[k]: k = failure[k-1]
+                if pattern[i] == pattern[k]: k += 1
+                failure[i] = k
+            k = 0
+            for i in range(2*n - 1):
+                symbol = text[i % n]
+                while k > 0 and symbol != pattern[k]: k = failure[k-1]
+                if symbol == pattern[k]: k += 1
+                if k == n: return i - n + 1
+            return None
 
         def match_seams(curve1, curve2, simplify=True):
-                            """match the seam of two curves that have parallel segments"""
-
-                            if simplify is True:
-                                curve1=resimplify_Curve(curve1)
-                                curve2=resimplify_Curve(curve2)
-                            curve2 = align_curve_direction(rs.coercecurve(curve1),rs.coercecurve(curve2))
-                            curve1=scriptcontext.doc.Objects.Add(curve1)
-                            curve2=scriptcontext.doc.Objects.Add(curve2)
-                            seg1 = rs.ExplodeCurves(curve1)
-                            seg2 = rs.ExplodeCurves(curve2)
-                            shift = None
-
-                            if len(seg1) == len(seg2):
-                                for i in range(len(seg2)):
-                                    flag = True
-                                    for j in range(len(seg1)):
-                                        vec1 = line_to_vec(seg2[(i+j)%len(seg2)])
-                                        vec2 = line_to_vec(seg1[j])
-                                        if rs.IsVectorParallelTo(vec1,vec2) != 1:
-                                            flag = False
-                                    if flag == True:
-                                        shift = i
-                                        break
-                            else: raise Exception("polylines have a different number of segments")
-                            if shift == None: raise Exception("polyline segments are not parallel")
-                            else:
-                                points = rs.PolylineVertices(curve2)
-
-                                curve_seam(curve2, points[shift])
-                                rs.coercecurve(curve2)
-                            curve1 = rs.coercecurve(curve1)
-                            curve2 = rs.coercecurve(curve2)
-                            return [curve1,curve2]
+            """match the seam of two curves that have parallel segments"""
+
+            if simplify is True:
+                curve1=resimplify_Curve(curve1)
+                curve2=resimplify_Curve(curve2)
+            curve2 = align_curve_direction(rs.coercecurve(curve1),rs.coercecurve(curve2))
+            points1 = polyline_points(curve1)
+            points2 = polyline_points(curve2)
+            if len(points1) != len(points2): raise Exception("polylines have a different number of segments")
+            shift = seam_shift(points1, points2)
+            if shift == None: raise Exception("polyline segments are not parallel")
+            points2 = points2[shift:] + points2[:shift]
+            curve1 = rg.PolylineCurve(points1 + [points1[0]])
+            curve2 = rg.PolylineCurve(points2 + [points2[0]])
+            return [curve1,curve2]
                 
         def brep_from_2_poly(poly1, poly2):
                             poly2 = align_curve_direction(rs.coercegeometry(poly1), rs.coercegeometry(poly2))
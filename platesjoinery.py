@@ -5,6 +5,7 @@ Classes:
     - PlateModel : adjacency, topology, insertion vectors, assembly sequence...
     - Module : inherits from model, sub-sequence, insertion vectors...
     - Plate : thickness, contour, plane, normal...
+    - ContactTable : columnar storage of contact ids, types, centers, normals and planes
     - ToolBox : geometry function for rhino objects
 
 TO DO LIST:
@@ -31,7 +32,10 @@ from Grasshopper.Kernel.Data import GH_Path
 import scriptcontext
 import math
 import copy
-import ast
+import sys
+import re
+import time
+from array import array
 
 import rhinoscriptsyntax as rs
 import Rhino.Geometry as rg
@@ -41,7 +45,6 @@ from Grasshopper.Kernel.Data import GH_Path
 import scriptcontext
 import math
 import copy
-import ast
 
 
 
@@ -53,30 +56,41 @@ if yes:
 
         class PlateModel:
 
-            def __init__(self, breps, sequence=0, constraints=[None,None,None,None,None], discard=[]):
+            def __init__(self, breps, sequence=0, constraints=[None,None,None,None,None], discard=[], engine='brep', workers=1):
 
                     # INITIALIZATION -------------------------------------
 
                     self.temp = []
                     self.log = []
                     self.count = len(breps)
-                    self.sequence = self.__set_sequence(sequence)
+                    self.tolerance = rs.UnitAbsoluteTolerance()
+                    self.sequence_tree = self.__set_sequence(sequence)
+                    self.input_order = list(self.sequence_tree.plates)
                     self.breps = self.__reorder_breps(breps)
-                    self.sequence = self.__reorder_sequence(self.sequence)
+                    self.hashes = [Toolbox.Breps.brep_hash(brep, self.tolerance) for brep in self.breps]
+                    self.sequence_tree = self.__reorder_sequence(self.sequence_tree)
+                    self.sequence = self.sequence_tree.text()
                     self.plates = self.__get_plates_from_breps()
 
                     # TOPOLOGY -------------------------------------------
 
-                    self.discard = discard
+                    self.discard = Toolbox.Data.parse_pairs(discard)
+                    self.engine = engine
+                    self.workers = workers
+                    self.intersections = {}
+                    self.__analytic_contacts = None
+                    self.__slabs = {}
+                    self.__clips = {}
                     self.contact_ids = self.__get_contact_ids()
                     self.contact_pairs = self.__get_contact_pairs()
-                    self.contact_breps = self.__get_contact_breps()
-                    self.contact_zones= self.__get_contact_zones()
+                    self.contact_geometry = self.__get_contact_geometry()
+                    self.contact_zones = ContactRows(self, '_PlateModel__get_contact_zones_row')
                     self.contact_types = self.__get_contact_types()
-                    self.contact_strings = self.__get_contact_strings()
+                    self.contact_index = self.__get_contact_index()
                     self.contact_centers= self.__get_contact_centers()
                     self.contact_normals = self.__get_contact_normals()
                     self.contact_planes= self.__get_contact_planes()
+                    self.__pack_contacts()
                     self.contact_spheres = self.__get_contact_spheres(constraints)
                     
                     # ASSEMBLY -------------------------------------------
@@ -86,6 +100,8 @@ if yes:
                     self.assembly_vectors = []
                     self.assembly_spaces = []
                     self.assembly_relatives = []
+                    self.__assembly_cache = {}
+                    self.__insertion_cache = {}
                     self.__get_assembly_vectors()
 
 
@@ -97,28 +113,25 @@ if yes:
             # MODEL INITIALIZATION ---------------------------------------
 
             def __set_sequence(self, sequence):
-                """return the default sequence if incorrect input is provided"""
+                """return the parsed sequence, the default one if no sequence is provided"""
                 if sequence == 0 or sequence == [] or sequence == None:
-                    self.log.append('Sequence set to default : '+ str(range(self.count)))
-                    return str(range(self.count))
+                    self.log.append('Sequence set to default : '+ str(list(range(self.count))))
+                    return SequenceTree(list(range(self.count)))
                 else:
                     if type(sequence) is str:
-                        Toolbox.Data.test_seq(sequence)
-                        try: test = ast.literal_eval(sequence)
-                        except: raise Exception(' An error occured when trying to convert sequence text to list of lists.')
+                        tree = SequenceTree(sequence)
                         self.log.append('Sequence set to custom : '+ str(sequence))
-                        return sequence
+                        return tree
                     else: raise Exception(' Sequence input should be expressed as a string.')
 
             def __reorder_breps(self, breps):
-                seq = ast.literal_eval(self.sequence)
-                return Toolbox.Data.sort_list_sync(breps, Toolbox.Data.flatten_integer_list(seq))
+                return Toolbox.Data.sort_list_sync(breps, self.input_order)
 
-            def __reorder_sequence(self, sequence):
-                new_sequence = Toolbox.Data.reorder_sequence(sequence)
-                if new_sequence != sequence:
-                    self.log.append('Breps and sequence have been reordered: '+ str(new_sequence))
-                return new_sequence
+            def __reorder_sequence(self, tree):
+                new_tree = tree.renumbered()
+                if new_tree.plates != tree.plates:
+                    self.log.append('Breps and sequence have been reordered: '+ new_tree.text())
+                return new_tree
 
             def __get_plates_from_breps(self):
                 plates=[]
@@ -129,356 +142,519 @@ if yes:
 
             def __get_modules_from_sequence(self):
 
-                # create sub_sequence list
-                seq = ast.literal_eval(self.sequence)
-                steps = Toolbox.Data.seq_to_steps(seq)
-                steps = Toolbox.Data.order_sequence(steps)
-                sub_seq = []
-                sub_steps = []
-
-                for i in range(len(steps)):
-                    if steps[i] in Toolbox.Data.deepest_steps(seq): pass
-                    else:
-                        sub_steps.append(steps[i])
-                        sub_seq.append(Toolbox.Data.get_item_from_path(seq, steps[i]))
-                sub_seq.append(seq)
-                sub_steps.append(['Model'])
-
-                # fill parent list
-                parents = []
-                for sub_step in sub_steps:
-                    if sub_step == ['Model']: parents.append([])
-                    elif len(sub_step) == 1 : parents.append(['Model'])
-                    else: parents.append(sub_step[0:len(sub_step)-1])
-
-                # fill children list
-                children = Toolbox.Data.list_of_empty_lists(len(parents))
-                for i in range(len(parents)):
-                    for j in range(len(sub_steps)):
-                        if parents[i] == sub_steps[j]: 
-                            children[j].append(sub_steps[i])
-
-                # module creation
+                # modules deepest first, the whole sequence last
+                tree = self.sequence_tree
                 modules = []
-                for i in range(len(sub_seq)):
-                    modules.append(PlateModule(self, i, sub_steps[i], str(sub_seq[i]), parents[i], children[i]))
+                for i in range(len(tree.modules)):
+                    n = tree.modules[i]
+                    if n == 0: 
+                        step = ['Model']
+                        parent = []
+                    else:
+                        step = tree.path(n)
+                        parent = ['Model'] if tree.parent[n] == 0 else tree.path(tree.parent[n])
+                    children = [tree.path(c) for c in tree.children[n] if tree.value[c] is None]
+                    modules.append(PlateModule(self, i, step, tree.text(n), parent, children))
                 return modules
 
+            # MODEL UPDATE -----------------------------------------------
+
+            def update(self, breps):
+                """
+                Update the model when some input breps have changed (same breps, in the same order, as the model input).
+                Only the changed plates are rebuilt, only the pairs involving them are evaluated again,
+                and only the assembly steps whose contacts changed are recomputed.
+                Should be called before adding joints. Return the list of rebuilt plates.
+                """
+                if len(breps) != self.count: raise Exception(' The number of breps should not change when updating the model.')
+                breps = self.__reorder_breps(breps)
+                hashes = [Toolbox.Breps.brep_hash(brep, self.tolerance) for brep in breps]
+                changed = [i for i in range(self.count) if hashes[i] != self.hashes[i]]
+                if changed == []: return changed
+                self.log.append('Plates updated: ' + str(changed))
+                self.hashes = hashes
+
+                # plates
+                for i in changed:
+                    self.breps[i] = breps[i]
+                    self.plates[i] = Plate(breps[i], i)
+                    self.FEM_plates[i] = self.plates[i].mid_contour
+
+                # topology of changed plates and of their old and new neighbours
+                for cache in [self.intersections, self.__clips]:
+                    for key in list(cache.keys()):
+                        if key[0] in changed or key[1] in changed: del cache[key]
+                for i in changed: self.__slabs.pop(i, None)
+                self.__unpack_contacts()
+                old_ids = self.contact_ids
+                self.contact_ids = self.__update_contact_ids(changed)
+                rows = set(changed)
+                for i in changed:
+                    rows.update(old_ids[i])
+                    rows.update(self.contact_ids[i])
+                rows = sorted(rows)
+                self.__compute_intersection_volumes([(i, nb) for i in rows for nb in self.contact_ids[i] if self.__is_intersecting(i, nb)])
+                for i in rows:
+                    self.contact_pairs[i] = self.__get_contact_pairs_row(i)
+                    self.contact_geometry[i] = self.__get_contact_geometry_row(i)
+                    self.contact_zones.reset(i)
+                    self.contact_types[i] = self.__get_contact_types_row(i)
+                    self.contact_centers[i] = self.__get_contact_centers_row(i)
+                    self.contact_normals[i] = self.__get_contact_normals_row(i)
+                    self.contact_planes[i] = self.__get_contact_planes_row(i)
+                    self.contact_spheres[i] = self.__get_contact_spheres_row(i)
+                self.__pack_contacts()
+                self.contact_index = self.__get_contact_index()
+
+                # assembly steps involving these rows
+                for key in list(self.__insertion_cache.keys()):
+                    if [p for p in key[0] if p in rows] != [] or [nb for (p, nb) in key[1] if nb in rows] != []: del self.__insertion_cache[key]
+                self.modules = self.__get_modules_from_sequence()
+                self.__get_assembly_vectors(rows)
+                return changed
+
             # MODEL TOPOLOGY ---------------------------------------------
 
             def __get_contact_ids(self):
+                if self.engine == 'analytic':
+                    return self.__get_analytic_contacts()[0]
+                # broad phase: only plates with overlapping bounding boxes can be in contact
+                boxes = [Toolbox.Boxes.brep_box(brep, self.tolerance) for brep in self.breps]
+                pairs = self.__get_candidate_pairs(boxes)
+                return self.__add_contact_ids(Toolbox.Data.list_of_empty_lists(self.count), pairs)
+
+            def __update_contact_ids(self, changed):
+                """return the contact ids after the plates in changed were rebuilt, only pairs involving them are evaluated"""
+                if self.engine == 'analytic':
+                    self.__analytic_contacts = None
+                    return self.__get_contact_ids()
                 mylist = []
                 for i in range(self.count):
-                    sub = []
-                    for j in range(self.count):
-                        if i != j:
-                            #discard
-                            if ('('+str(i)+','+str(j)+')' == self.discard) or ('('+str(i)+','+str(j)+')' in self.discard) or ('('+str(j)+','+str(i)+')' == self.discard) or ('('+str(j)+','+str(i)+')' in self.discard):
-                                self.log.append("pair "+str(i)+","+str(j)+" skipped")
-                            else: 
-                                intersect = rs.IntersectBreps(self.breps[i],self.breps[j])
-                                if intersect != None:
-                                    if len(intersect) == 1:
-                                        if rs.IsCurveClosed(intersect) is True:
-                                            if rs.IsCurvePlanar(intersect) is True:
-                                                sub.append(j)
-                                            else:
-                                                # if plate contours are intersecting the surfaces of the other plate
-                                                if rs.CurveBrepIntersect(self.plates[i].top_contour,self.plates[j].top_face) != None:
-                                                    if rs.CurveBrepIntersect(self.plates[i].top_contour,self.plates[j].bottom_face) != None: 
-                                                        if rs.CurveBrepIntersect(self.plates[i].bottom_contour,self.plates[j].top_face) != None:
-                                                            if rs.CurveBrepIntersect(self.plates[i].bottom_contour,self.plates[j].bottom_face) != None:
-                                                                sub.append(j)
-                    mylist.append(sub)
+                    if i in changed: mylist.append([])
+                    else: mylist.append([nb for nb in self.contact_ids[i] if nb not in changed])
+                boxes = [Toolbox.Boxes.brep_box(brep, self.tolerance) for brep in self.breps]
+                pairs = self.__get_candidate_pairs(boxes, changed)
+                return self.__add_contact_ids(mylist, pairs)
+
+            def __add_contact_ids(self, mylist, pairs):
+                """evaluate candidate pairs (i,j) and add the contacts found to the neighbour lists"""
+                self.__compute_intersections(pairs)
+                for pair in pairs:
+                    for (i, j) in [pair, pair[::-1]]:
+                        record = self.__get_intersection(i, j)
+                        if record['closed'] is True:
+                            if record['planar'] is True:
+                                mylist[i].append(j)
+                            else:
+                                # if plate contours are intersecting the surfaces of the other plate
+                                if rs.CurveBrepIntersect(self.plates[i].top_contour,self.plates[j].top_face) != None:
+                                    if rs.CurveBrepIntersect(self.plates[i].top_contour,self.plates[j].bottom_face) != None: 
+                                        if rs.CurveBrepIntersect(self.plates[i].bottom_contour,self.plates[j].top_face) != None:
+                                            if rs.CurveBrepIntersect(self.plates[i].bottom_contour,self.plates[j].bottom_face) != None:
+                                                mylist[i].append(j)
+                # narrow phase follows pair order, restore neighbour order
+                for sub in mylist: sub.sort()
                 return mylist
 
+            def __get_candidate_pairs(self, boxes, plates=None):
+                """return the pairs (i,j) with i<j of overlapping boxes which are not discarded (and involve one of the plates if provided)"""
+                pairs = []
+                for (i, j) in Toolbox.Boxes.overlapping_pairs(boxes):
+                    if plates is not None and i not in plates and j not in plates: continue
+                    #discard
+                    if (i, j) in self.discard or (j, i) in self.discard:
+                        self.log.append("pair "+str(i)+","+str(j)+" skipped")
+                        self.log.append("pair "+str(j)+","+str(i)+" skipped")
+                    else: pairs.append((i, j))
+                return pairs
+
+            def __get_analytic_contacts(self):
+                """classify contacts from plate planes and contours only, without brep intersection"""
+                if self.__analytic_contacts is None:
+                    slabs = [self.__get_slab(i) for i in range(self.count)]
+                    boxes = [Toolbox.Boxes.points_box(slab['top'] + slab['bottom'], self.tolerance) for slab in slabs]
+                    pairs = self.__get_candidate_pairs(boxes)
+                    self.__analytic_contacts = Toolbox.Slabs.contacts(slabs, pairs, self.tolerance, self.workers)
+                return self.__analytic_contacts
+
+            def __get_slab(self, i):
+                """analytic slab of a plate, computed once"""
+                if i not in self.__slabs:
+                    self.__slabs[i] = Toolbox.Slabs.from_plate(self.plates[i])
+                return self.__slabs[i]
+
+            def __is_intersecting(self, i, nb):
+                """check if a contact is an intersection of volumes (IN) rather than a planar contact"""
+                if self.engine == 'analytic':
+                    ids, types = self.__get_analytic_contacts()
+                    return types[i][ids[i].index(nb)] == 'IN'
+                return self.__get_intersection(i, nb)['planar'] is False
+
+            def __compute_intersections(self, pairs):
+                """compute the missing intersection records of a list of pairs (i,j), in parallel if workers > 1"""
+                keys = [(min(pair), max(pair)) for pair in pairs]
+                keys = [key for key in keys if key not in self.intersections]
+                breps = [rs.coercebrep(brep) for brep in self.breps]
+                tol = self.tolerance
+                def run(chunk):
+                    return [Toolbox.Breps.intersection_record(breps[a], breps[b], tol) for (a, b) in chunk]
+                chunks = Toolbox.Parallel.chunks(keys, 4 * self.workers)
+                results = Toolbox.Parallel.map(run, chunks, self.workers, processes=False)
+                # merge in pair order
+                for k in range(len(chunks)):
+                    for l in range(len(chunks[k])):
+                        self.intersections[chunks[k][l]] = results[k][l]
+
+            def __compute_intersection_volumes(self, pairs):
+                """compute the missing boolean volumes of a list of intersecting pairs (i,j), in parallel if workers > 1"""
+                keys = []
+                for pair in pairs:
+                    key = (min(pair), max(pair))
+                    if self.__get_intersection(*key)['volume'] is None and key not in keys: keys.append(key)
+                plates = self.plates
+                def run(chunk):
+                    return [Toolbox.Breps.intersection_volume(plates[a].brep, plates[b].brep) for (a, b) in chunk]
+                chunks = Toolbox.Parallel.chunks(keys, 4 * self.workers)
+                results = Toolbox.Parallel.map(run, chunks, self.workers, processes=False)
+                for k in range(len(chunks)):
+                    for l in range(len(chunks[k])):
+                        self.intersections[chunks[k][l]]['volume'] = results[k][l]
+
+            def __get_intersection(self, i, j):
+                """return the intersection record of a pair of plates, computed once and shared by (i,j) and (j,i)"""
+                key = (min(i,j), max(i,j))
+                if key not in self.intersections:
+                    self.intersections[key] = Toolbox.Breps.intersection_record(self.breps[key[0]], self.breps[key[1]], self.tolerance)
+                return self.intersections[key]
+
+            def __get_intersection_volume(self, i, j):
+                """return the boolean intersection of two intersecting plates, computed once for (i,j) and (j,i)"""
+                record = self.__get_intersection(i, j)
+                if record['volume'] is None:
+                    key = (min(i,j), max(i,j))
+                    record['volume'] = Toolbox.Breps.intersection_volume(self.plates[key[0]].brep, self.plates[key[1]].brep)
+                return record['volume']
+
             def __get_contact_pairs(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        brep_id = self.contact_ids[i][j]
-                        sub.append( '(' + str(i) + ',' + str(brep_id) + ')' )
-                    mylist.append(sub)
-                return mylist
+                return [self.__get_contact_pairs_row(i) for i in range(self.count)]
 
-            def __get_contact_breps(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        brep_id = self.contact_ids[i][j]
-                        brep = rs.coercebrep(rs.CopyObject(self.breps[brep_id]))
-                        sub.append(brep)
-                    mylist.append(sub)
-                return mylist
-            
-            def __get_contact_zones(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                            brep_id = self.contact_ids[i][j]
-                            pi = copy.deepcopy(self.plates[i])
-                            pj = copy.deepcopy(self.plates[brep_id])
-                            intersect = rs.IntersectBreps(pi.brep,pj.brep)
-                            if intersect !=  None:
-                                if len(intersect) == 1:
-                                    if rs.IsCurveClosed(intersect) is True:
-                                        if rs.IsCurvePlanar(intersect) is True:
-                                            zone = rs.coercegeometry(rs.AddPlanarSrf(intersect)[0])
-                                            sub.append(zone)
-                                        # intersecting breps
-                                        else:
-                                            # if plate contours are intersecting the surfaces of the other plate
-                                            if rs.CurveBrepIntersect(pi.top_contour, pj.top_face) != None:
-                                                if rs.CurveBrepIntersect(pi.top_contour, pj.bottom_face) != None: 
-                                                    if rs.CurveBrepIntersect(pi.bottom_contour, pj.top_face) != None:
-                                                        if rs.CurveBrepIntersect(pi.bottom_contour, pj.bottom_face) != None:
-                                                            volume = rg.Brep.CreateBooleanIntersection(pi.brep,pj.brep,0.1)[0]
-                                                            edges = Toolbox.Breps.brep_edges(volume)
-                                                            edges.sort(key=rs.CurveLength)
-                                                            edges.reverse()
-                                                            vec_dir = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.cross(pi.top_normal, pj.top_normal)),6)
-                                                            four_edges = []
-                                                            for edge in edges:
-                                                                vec_line = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.line_to_vec(edge)),6) 
-                                                                if vec_dir == vec_line or vec_dir == rs.VectorReverse(vec_line):
-                                                                    four_edges.append(edge)
-                                                                if len(four_edges) == 4: break
-                                                            mids = [rs.CurveMidPoint(four_edges[k]) for k in range(4)]
-                                                            center = Toolbox.Points.average_point(mids)
-                                                            proj = rs.coerce3dpointlist([rs.EvaluateCurve(four_edges[l],rs.CurveClosestPoint(four_edges[l],center)) for l in range(4)])
-                                                            poly = rs.AddPolyline(rs.PolylineVertices(gh.ConvexHull(proj, rs.PlaneFitFromPoints(proj))[0]))
-                                                            zone = rs.coercegeometry(rs.AddPlanarSrf(poly)[0])
-                                                            #orient surface normal
-                                                            current_normal = rs.SurfaceNormal(zone,[0,0])
-                                                            new_vec = Toolbox.Vectors.line_to_vec(four_edges[0],True)
-                                                            test_point = rs.CurveStartPoint(four_edges[0])
-                                                            test1 = rs.IsPointOnCurve(pi.top_contour, test_point)
-                                                            test2 = rs.IsPointOnCurve(pi.bottom_contour, test_point)
-                                                            if test1 is True or test2 is True:
-                                                                new_vec =rs.VectorReverse(new_vec)
-                                                            if rs.IsVectorParallelTo(current_normal, new_vec) == -1:
-                                                                rs.FlipSurface(zone,True)
-                                                            sub.append(zone)    
-                    mylist.append(sub)
-                return mylist
+            def __get_contact_pairs_row(self, i):
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    brep_id = self.contact_ids[i][j]
+                    sub.append( '(' + str(i) + ',' + str(brep_id) + ')' )
+                return sub
 
-            def __get_contact_types(self):
-                mylist = []
-                for i in range(self.count):
-                    
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        nb = self.contact_ids[i][j]
-                        zone = self.contact_zones[i][j]
-                        zone_normal = rs.SurfaceNormal(zone,[0,0])
-                        plate1_normal = self.plates[i].top_normal
-                        plate2_normal = self.plates[nb].top_normal
-                        cross1 = Toolbox.Vectors.cross(zone_normal,plate1_normal)
-                        cross2 = Toolbox.Vectors.cross(zone_normal,plate2_normal)
-
-                        if Toolbox.Vectors.isvectornull(cross1) is False and Toolbox.Vectors.isvectornull(cross2) is False :
-                            intersect = rs.IntersectBreps(self.breps[i],self.breps[nb])
-                            if rs.IsCurvePlanar(intersect) is True: sub.append('SS')
-                            else: sub.append('IN')
+            def __get_contact_geometry(self):
+                # boolean volumes of intersecting plates are independent from each other
+                self.__compute_intersection_volumes([(i, nb) for i in range(self.count) for nb in self.contact_ids[i] if self.__is_intersecting(i, nb)])
+                return [self.__get_contact_geometry_row(i) for i in range(self.count)]
 
-                        elif Toolbox.Vectors.isvectornull(cross1) is True and Toolbox.Vectors.isvectornull(cross2) is True :
-                            sub.append('FF')
+            def __get_contact_geometry_row(self, i):
+                """
+                Center, unoriented normal, longest border axis and area of each contact zone of a plate.
+                Planar contacts are computed by clipping the touching faces or sides, intersecting plates need the Rhino zone.
+                """
+                sub = []
+                for nb in self.contact_ids[i]:
+                    geometry = None
+                    if not self.__is_intersecting(i, nb):
+                        key = (min(i, nb), max(i, nb))
+                        if key not in self.__clips:
+                            self.__clips[key] = Toolbox.Slabs.contact_zone(self.__get_slab(key[0]), self.__get_slab(key[1]), self.tolerance)
+                        geometry = self.__clips[key]
+                    if geometry is None:
+                        geometry = self.__get_zone_geometry(self.__get_rhino_zone(i, nb))
+                    sub.append(geometry)
+                return sub
+
+            def __get_zone_geometry(self, zone):
+                """center, normal, longest border axis and area of a Rhino contact zone"""
+                border = Toolbox.Surfaces.get_face_largest_contour(zone)
+                sides = rs.ExplodeCurves(rs.CopyObject(border))
+                longest_side = Toolbox.Curves.sort_curves_by_length(sides)[-1][0]
+                return {'zone': zone,
+                    'polygons': None,
+                    'center': Toolbox.Surfaces.surface_centroid(zone),
+                    'normal': rs.VectorUnitize(rs.SurfaceNormal(zone,[0,0])),
+                    'axis': rs.VectorCreate(rs.CurveStartPoint(longest_side), rs.CurveEndPoint(longest_side)),
+                    'area': rs.SurfaceArea(zone)[0]}
+
+            def __get_contact_zones_row(self, i):
+                """contact zones as Rhino surfaces, created on first access"""
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    geometry = self.contact_geometry[i][j]
+                    if geometry['polygons'] is None: sub.append(geometry['zone'])
+                    else: sub.append(Toolbox.Surfaces.planar_surface(geometry['polygons'], self.contact_normals[i][j], self.tolerance))
+                return sub
+
+            def __get_rhino_zone(self, i, brep_id):
+                """contact zone of two plates from their brep intersection"""
+                pi = self.plates[i]
+                pj = self.plates[brep_id]
+                record = self.__get_intersection(i, brep_id)
+                if record['planar'] is True:
+                    zone = rs.coercegeometry(rs.AddPlanarSrf(record['curve'])[0])
+                    return zone
+                # intersecting breps (contours crossing was already checked by contact_ids)
+                else:
+                    volume = self.__get_intersection_volume(i, brep_id)
+                    edges = Toolbox.Breps.brep_edges(volume)
+                    edges.sort(key=rs.CurveLength)
+                    edges.reverse()
+                    vec_dir = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.cross(pi.top_normal, pj.top_normal)),6)
+                    four_edges = []
+                    for edge in edges:
+                        vec_line = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.line_to_vec(edge)),6) 
+                        if vec_dir == vec_line or vec_dir == rs.VectorReverse(vec_line):
+                            four_edges.append(edge)
+                        if len(four_edges) == 4: break
+                    mids = [rs.CurveMidPoint(four_edges[k]) for k in range(4)]
+                    center = Toolbox.Points.average_point(mids)
+                    proj = rs.coerce3dpointlist([rs.EvaluateCurve(four_edges[l],rs.CurveClosestPoint(four_edges[l],center)) for l in range(4)])
+                    poly = rs.AddPolyline(rs.PolylineVertices(gh.ConvexHull(proj, rs.PlaneFitFromPoints(proj))[0]))
+                    zone = rs.coercegeometry(rs.AddPlanarSrf(poly)[0])
+                    #orient surface normal
+                    current_normal = rs.SurfaceNormal(zone,[0,0])
+                    new_vec = Toolbox.Vectors.line_to_vec(four_edges[0],True)
+                    test_point = rs.CurveStartPoint(four_edges[0])
+                    test1 = rs.IsPointOnCurve(pi.top_contour, test_point)
+                    test2 = rs.IsPointOnCurve(pi.bottom_contour, test_point)
+                    if test1 is True or test2 is True:
+                        new_vec =rs.VectorReverse(new_vec)
+                    if rs.IsVectorParallelTo(current_normal, new_vec) == -1:
+                        rs.FlipSurface(zone,True)
+                    return zone
 
-                        else:
-                            #edge test:
-                            top_top = Toolbox.Curves.isSharingEdge(self.plates[i].top_contour, self.plates[nb].top_contour)
-                            top_bottom = Toolbox.Curves.isSharingEdge(self.plates[i].top_contour, self.plates[nb].bottom_contour)
-                            bottom_top = Toolbox.Curves.isSharingEdge(self.plates[i].bottom_contour, self.plates[nb].top_contour)
-                            bottom_bottom = Toolbox.Curves.isSharingEdge(self.plates[i].bottom_contour, self.plates[nb].bottom_contour)
-                            if Toolbox.Vectors.isvectornull(cross1) is True and Toolbox.Vectors.isvectornull(cross2) is False :
-                                if top_top == False and top_bottom == False and bottom_top == False and bottom_bottom == False:
-                                    sub.append('FS')
-                                else: sub.append('ES')
-                            elif Toolbox.Vectors.isvectornull(cross1) is False and Toolbox.Vectors.isvectornull(cross2) is True :
-                                if top_top == False and top_bottom == False and bottom_top == False and bottom_bottom == False:
-                                    sub.append('SF')
-                                else: sub.append('SE')
-
-                    mylist.append(sub)
-                return mylist
+            def __get_contact_types(self):
+                return [self.__get_contact_types_row(i) for i in range(self.count)]
+
+            def __get_contact_types_row(self, i):
+                if self.engine == 'analytic':
+                    return self.__get_analytic_contacts()[1][i]
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    nb = self.contact_ids[i][j]
+                    zone_normal = self.contact_geometry[i][j]['normal']
+                    plate1_normal = self.plates[i].top_normal
+                    plate2_normal = self.plates[nb].top_normal
+                    cross1 = Toolbox.Vectors.cross(zone_normal,plate1_normal)
+                    cross2 = Toolbox.Vectors.cross(zone_normal,plate2_normal)
+
+                    if Toolbox.Vectors.isvectornull(cross1) is False and Toolbox.Vectors.isvectornull(cross2) is False :
+                        if self.__get_intersection(i, nb)['planar'] is True: sub.append('SS')
+                        else: sub.append('IN')
+
+                    elif Toolbox.Vectors.isvectornull(cross1) is True and Toolbox.Vectors.isvectornull(cross2) is True :
+                        sub.append('FF')
 
-            def __get_contact_strings(self):
-                mylist = []
+                    else:
+                        #edge test:
+                        top_top = Toolbox.Curves.isSharingEdge(self.plates[i].top_contour, self.plates[nb].top_contour)
+                        top_bottom = Toolbox.Curves.isSharingEdge(self.plates[i].top_contour, self.plates[nb].bottom_contour)
+                        bottom_top = Toolbox.Curves.isSharingEdge(self.plates[i].bottom_contour, self.plates[nb].top_contour)
+                        bottom_bottom = Toolbox.Curves.isSharingEdge(self.plates[i].bottom_contour, self.plates[nb].bottom_contour)
+                        if Toolbox.Vectors.isvectornull(cross1) is True and Toolbox.Vectors.isvectornull(cross2) is False :
+                            if top_top == False and top_bottom == False and bottom_top == False and bottom_bottom == False:
+                                sub.append('FS')
+                            else: sub.append('ES')
+                        elif Toolbox.Vectors.isvectornull(cross1) is False and Toolbox.Vectors.isvectornull(cross2) is True :
+                            if top_top == False and top_bottom == False and bottom_top == False and bottom_bottom == False:
+                                sub.append('SF')
+                            else: sub.append('SE')
+                return sub
+
+            def __get_contact_index(self):
+                """return the contacts (i,nb) with i<nb as sets bucketed by contact type, and the position of nb in contact_ids[i]"""
+                buckets = {}
+                position = {}
                 for i in range(self.count):
-                    sub = []
                     for j in range(len(self.contact_ids[i])):
-                        brep_id = self.contact_ids[i][j]
-                        ptype = self.contact_types[i][j]
-
-                        if ptype == 'SS':
-                            sub.append('Side of plate '+str(i)+' is connected to Side of plate '+str(brep_id))
-                        elif ptype == 'FS':
-                            sub.append('Face of plate '+str(i)+' is connected to Side of plate '+str(brep_id))
-                        elif ptype == 'ES':
-                            sub.append('Edge of plate '+str(i)+' is connected to Side of plate '+str(brep_id))
-                        elif ptype == 'SF':
-                            sub.append('Side of plate '+str(i)+' is connected to Face of plate '+str(brep_id))
-                        elif ptype == 'SE':
-                            sub.append('Side of plate '+str(i)+' is connected to Edge of plate '+str(brep_id))
-                        elif ptype == 'FF':
-                            sub.append('Face of plate '+str(i)+' is connected to Face of plate '+str(brep_id))
-                        elif ptype == 'IN':
-                            sub.append('Volume of plate '+str(i)+' is intersecting volume of plate '+str(brep_id))   
-                    mylist.append(sub)
-                return mylist
+                        nb = self.contact_ids[i][j]
+                        position[(i, nb)] = j
+                        if nb > i:
+                            buckets.setdefault(self.contact_types[i][j], set()).add((i, nb))
+                return {'types': buckets, 'position': position}
 
             def __get_contact_centers(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        center = Toolbox.Surfaces.surface_centroid(self.contact_zones[i][j])
-                        sub.append(rs.coerce3dpoint(center))
-                    mylist.append(sub)
-                return mylist
+                return [self.__get_contact_centers_row(i) for i in range(self.count)]
+
+            def __get_contact_centers_row(self, i):
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    sub.append(rs.coerce3dpoint(self.contact_geometry[i][j]['center']))
+                return sub
 
             def __get_contact_normals(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        brep_id = self.contact_ids[i][j]
-                        zone = self.contact_zones[i][j]
-                        vec = rs.VectorUnitize(rs.SurfaceNormal(zone,[0,0]))
-                        plate_center = self.plates[i].plate_center
-                        zone_center = Toolbox.Surfaces.surface_centroid(zone)
-                        if self.contact_types[i][j] != "IN":
-                            if Toolbox.Vectors.is_vector_outward(plate_center, zone_center, copy.deepcopy(vec)) is False:
-                                vec=rs.VectorReverse(copy.deepcopy(vec))
-                        sub.append(rs.coerce3dvector(vec))
-                    mylist.append(sub)
-                return mylist
+                return [self.__get_contact_normals_row(i) for i in range(self.count)]
+
+            def __get_contact_normals_row(self, i):
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    brep_id = self.contact_ids[i][j]
+                    geometry = self.contact_geometry[i][j]
+                    vec = rs.VectorUnitize(rs.coerce3dvector(geometry['normal']))
+                    plate_center = self.plates[i].plate_center
+                    zone_center = rs.coerce3dpoint(geometry['center'])
+                    if self.contact_types[i][j] != "IN":
+                        if Toolbox.Vectors.is_vector_outward(plate_center, zone_center, copy.deepcopy(vec)) is False:
+                            vec=rs.VectorReverse(copy.deepcopy(vec))
+                    sub.append(rs.coerce3dvector(vec))
+                return sub
 
             def __get_contact_planes(self):
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_ids[i])):
-                        nb = self.contact_ids[i][j]
-                        origin = self.contact_centers[i][j]
-                        zone = Toolbox.Surfaces.get_face_largest_contour(self.contact_zones[i][j])
-                        sides = rs.ExplodeCurves(rs.CopyObject(zone)) 
-                        longest_side = Toolbox.Curves.sort_curves_by_length(sides)[-1][0]
-                        x_axis = rs.VectorCreate(rs.CurveStartPoint(longest_side), rs.CurveEndPoint(longest_side))
-                        plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], x_axis)
-                        if self.contact_types[i][j] == 'ES':
-                            if Toolbox.Vectors.is_vector_outward(self.plates[i].mid_plane.Origin, self.contact_centers[i][j], plane.YAxis) is False:
-                                plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], -x_axis)
-                        if self.contact_types[i][j] == 'SE':
-                            if Toolbox.Vectors.is_vector_outward(self.plates[nb].mid_plane.Origin, self.contact_centers[i][j], plane.YAxis) is True:
-                                plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], -x_axis)
-                        sub.append(rs.coerceplane(plane))
-                    mylist.append(sub)
-                return mylist
+                return [self.__get_contact_planes_row(i) for i in range(self.count)]
+
+            def __get_contact_planes_row(self, i):
+                sub = []
+                for j in range(len(self.contact_ids[i])):
+                    nb = self.contact_ids[i][j]
+                    origin = self.contact_centers[i][j]
+                    x_axis = rs.coerce3dvector(self.contact_geometry[i][j]['axis'])
+                    plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], x_axis)
+                    if self.contact_types[i][j] == 'ES':
+                        if Toolbox.Vectors.is_vector_outward(self.plates[i].mid_plane.Origin, self.contact_centers[i][j], plane.YAxis) is False:
+                            plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], -x_axis)
+                    if self.contact_types[i][j] == 'SE':
+                        if Toolbox.Vectors.is_vector_outward(self.plates[nb].mid_plane.Origin, self.contact_centers[i][j], plane.YAxis) is True:
+                            plane = rs.PlaneFromNormal(origin, self.contact_normals[i][j], -x_axis)
+                    sub.append(rs.coerceplane(plane))
+                return sub
+
+            def __pack_contacts(self):
+                """store contacts in a table, contact ids, pairs, breps, types, strings, centers, normals and planes become views of it"""
+                self.contacts = ContactTable(self.contact_ids, self.contact_types, self.contact_centers, self.contact_normals, self.contact_planes)
+                self.contact_ids = self.contacts.view('ids')
+                self.contact_pairs = self.contacts.view('pairs')
+                self.contact_breps = self.contacts.view('ids', self.breps)
+                self.contact_types = self.contacts.view('types')
+                self.contact_strings = self.contacts.view('strings')
+                self.contact_centers = self.contacts.view('centers')
+                self.contact_normals = self.contacts.view('normals')
+                self.contact_planes = self.contacts.view('planes')
+
+            def __unpack_contacts(self):
+                """turn contact table views back into editable lists"""
+                for name in ['ids', 'pairs', 'types', 'centers', 'normals', 'planes']:
+                    setattr(self, 'contact_' + name, [list(row) for row in getattr(self, 'contact_' + name)])
 
             def __get_contact_spheres(self, constraints):
 
                 if constraints.BranchCount != 5: constraints = [[],[],[],[],[]]
                 else: constraints = Toolbox.Data.datatree_to_list(constraints)
-
-                # Create canonic insertion space
-                sphere =  rs.AddSphere((0,0,0),1)
-                cutter = rs.AddPlanarSrf(rs.AddPolyline([(1,1,0),(1,-1,0),(-1,-1,0),(-1,1,0),(1,1,0)]))
-                hemisphere = rs.SplitBrep(sphere,cutter)[1]
-                hemicircle_horizontal = rs.RotateObject(rs.AddArc(rs.WorldZXPlane(),1,180),(0,0,0),-90,(0,1,0))
-                hemicircle_vertical = rs.RotateObject(rs.AddArc(rs.WorldYZPlane(),1,180),(0,0,0),0,(1,0,0))
-                normal_point= rs.AddPoint(0,0,1)
-
-                # Orient hemisphere on each conctact zone
-                mylist = []
-                for i in range(self.count):
-                    sub = []
-                    for j in range(len(self.contact_types[i])):
-                        #face-to-face
-                        if self.contact_types[i][j] == 'FF':
-                            if constraints[0] != []:
-                                insertion_space = constraints[0]
-                            else: insertion_space = hemisphere
-                        #face-to-side
-                        elif (self.contact_types[i][j] == 'FS' or self.contact_types[i][j]  == 'SF'):
-                            if constraints[1] != []:
-                                insertion_space = constraints[1]
-                            else: insertion_space = hemicircle_horizontal
-                        #edge-to-side
-                        elif (self.contact_types[i][j] == 'ES' or self.contact_types[i][j]  == 'SE'):
-                            if constraints[2] != []:
-                                insertion_space = constraints[2]
-                            else: insertion_space = hemisphere
-                        #side-to-side
-                        elif self.contact_types[i][j] == 'SS':
-                            if constraints[3] != []:
-                                insertion_space = constraints[3]
-                            else: insertion_space = hemicircle_vertical
-                        #intersecting
-                        elif self.contact_types[i][j] == 'IN':
-                            if constraints[4] != []:
-                                insertion_space = constraints[4]
-                            else: insertion_space = normal_point
-                                            
-                        #Exception for SF/FS where the default constraint is oriented with the male plane
-                        if constraints[1] == [] and (self.contact_types[i][j] == 'FS' or self.contact_types[i][j]  == 'SF'):
-                            nb = self.contact_ids[i][j]
-                            if self.contact_types[i][j] == 'SF': male_normal = self.plates[i].top_plane.ZAxis
-                            else: male_normal = self.plates[nb].top_plane.ZAxis
-                            pl_origin = self.contact_planes[i][j].Origin
-                            pl_X = self.contact_planes[i][j].XAxis
-                            pl_Z = rs.VectorCrossProduct(male_normal, pl_X)
-                            proj_plane = rs.PlaneFromNormal(pl_origin, pl_Z, pl_X)
-                            test_point = rs.CopyObject(pl_origin, -self.contact_normals[i][j])
-                            if Toolbox.Vectors.is_vector_outward(test_point, pl_origin, pl_Z) is False:
-                                proj_plane = rs.PlaneFromNormal(pl_origin, -pl_Z, -pl_X)
-                            matrix = rg.Transform.PlaneToPlane(rs.WorldXYPlane(), proj_plane)
-                            insertion_space = rs.TransformObject(insertion_space, matrix,True) 
-
-                        #normal Orientation of all other insertion constraints
-                        else:
-                            matrix = rg.Transform.PlaneToPlane(rs.WorldXYPlane(), self.contact_planes[i][j])
-                            insertion_space = rs.TransformObject(insertion_space, matrix,True)
-
-                        #Exception for SE/ES where the default constraint is trimmed by plate planes
-                        if constraints[2] == [] and (self.contact_types[i][j] == 'ES' or self.contact_types[i][j]  == 'SE'):
-                            test_point = rs.CopyObject(self.contact_centers[i][j], - self.contact_planes[i][j].YAxis)
-                            if self.contact_types[i][j] == 'SE':
-                                trim_plane = self.plates[i].mid_plane
-                            else: trim_plane = self.plates[self.contact_ids[i][j]].mid_plane
-                            trim_plane = rs.MovePlane(trim_plane, self.contact_centers[i][j])
-                            if Toolbox.Vectors.is_vector_outward(test_point, self.contact_centers[i][j], trim_plane.ZAxis) is True:
-                                trim_plane = rs.RotatePlane(trim_plane, 180, trim_plane.XAxis)
-                            insertion_space = rs.TrimBrep(insertion_space, trim_plane)     
-                                
-                        sub.append(insertion_space)
-                    mylist.append(sub)
-                return mylist
+                self.constraints = [InsertionConstraint.from_input(constraint) if constraint != [] else None for constraint in constraints]
+
+                # Orient insertion constraint on each conctact zone
+                return [self.__get_contact_spheres_row(i) for i in range(self.count)]
+
+            def __get_insertion_space_type(self, i, j):
+                """index of the custom constraint and (alpha, beta) angles of the default constraint of a contact"""
+                contact_type = self.contact_types[i][j]
+                if contact_type == 'FF': return (0, 180, 180) #face-to-face: hemisphere
+                if contact_type in ['FS', 'SF']: return (1, 180, 0) #face-to-side: horizontal hemicircle
+                if contact_type in ['ES', 'SE']: return (2, 180, 180) #edge-to-side: hemisphere
+                if contact_type == 'SS': return (3, 0, 180) #side-to-side: vertical hemicircle
+                return (4, 0, 0) #intersecting: normal point
+
+            def __get_insertion_frame(self, i, j):
+                """plane orienting the insertion space of a contact, and plane trimming it (None if not trimmed)"""
+                constraints = self.constraints
+                contact_type = self.contact_types[i][j]
+
+                #Exception for SF/FS where the default constraint is oriented with the male plane
+                if constraints[1] is None and (contact_type == 'FS' or contact_type == 'SF'):
+                    nb = self.contact_ids[i][j]
+                    if contact_type == 'SF': male_normal = self.plates[i].top_plane.ZAxis
+                    else: male_normal = self.plates[nb].top_plane.ZAxis
+                    pl_origin = self.contact_planes[i][j].Origin
+                    pl_X = self.contact_planes[i][j].XAxis
+                    pl_Z = rs.VectorCrossProduct(male_normal, pl_X)
+                    plane = rs.PlaneFromNormal(pl_origin, pl_Z, pl_X)
+                    test_point = pl_origin - self.contact_normals[i][j]
+                    if Toolbox.Vectors.is_vector_outward(test_point, pl_origin, pl_Z) is False:
+                        plane = rs.PlaneFromNormal(pl_origin, -pl_Z, -pl_X)
+
+                #normal Orientation of all other insertion constraints
+                else: plane = self.contact_planes[i][j]
+
+                #Exception for SE/ES where the default constraint is trimmed by plate planes
+                trim_plane = None
+                if constraints[2] is None and (contact_type == 'ES' or contact_type == 'SE'):
+                    test_point = self.contact_centers[i][j] - self.contact_planes[i][j].YAxis
+                    if contact_type == 'SE':
+                        trim_plane = self.plates[i].mid_plane
+                    else: trim_plane = self.plates[self.contact_ids[i][j]].mid_plane
+                    trim_plane = rs.MovePlane(trim_plane, self.contact_centers[i][j])
+                    if Toolbox.Vectors.is_vector_outward(test_point, self.contact_centers[i][j], trim_plane.ZAxis) is True:
+                        trim_plane = rs.RotatePlane(trim_plane, 180, trim_plane.XAxis)
+                return (plane, trim_plane)
+
+            def __get_contact_spheres_row(self, i):
+                sub = []
+                for j in range(len(self.contact_types[i])):
+                    index, alpha, beta = self.__get_insertion_space_type(i, j)
+                    if self.constraints[index] is not None: constraint = self.constraints[index]
+                    else: constraint = InsertionConstraint(alpha, beta)
+                    plane, trim_plane = self.__get_insertion_frame(i, j)
+                    # trimming keeps the part of the hemisphere opposite to the trimming plane normal
+                    if trim_plane is not None: trims = [-trim_plane.ZAxis]
+                    else: trims = []
+                    sub.append(constraint.oriented(plane, trims))
+                return sub
             
             # MODULES ASSEMBLY -------------------------------------------
 
-            def __get_assembly_vectors(self):
-                
-                adj = self.contact_ids
-                seq = ast.literal_eval(self.sequence)
-                steps = Toolbox.Data.seq_to_steps(seq)
-                steps = Toolbox.Data.order_sequence(steps)
+            def __get_sequence_index(self):
+                """
+                Index the sequence following the modules list:
+                    module, step, position: deepest module of each plate, its step in this module and its position in the whole sequence.
+                    path: path of each plate in the sequence.
+                    modules: {module path: module index}, 'Model' is the empty path.
+                    units: plates of each step of each module (a plate or the plates of a sub-module).
+                    rank: {plate: step} of each module, nb is in place at step j of module k if rank[k][nb] < j.
+                """
+                tree = self.sequence_tree
+                modules = {}
+                for k in range(len(self.modules)):
+                    step = self.modules[k].step
+                    modules[() if step == ['Model'] else tuple(step)] = k
+                index = {'module': [None] * self.count, 'step': [None] * self.count, 'position': [None] * self.count, 'path': [None] * self.count,
+                         'modules': modules, 'units': [None] * len(self.modules), 'rank': [None] * len(self.modules)}
+
+                order = {}
+                for k in range(len(tree.modules)):
+                    n = tree.modules[k]
+                    order[n] = k
+                    units = [tree.members(c) for c in tree.children[n]]
+                    rank = {}
+                    for j in range(len(units)):
+                        for p in units[j]: rank[p] = j
+                    index['units'][k] = units
+                    index['rank'][k] = rank
+                for n in tree.leaves():
+                    p = tree.value[n]
+                    index['module'][p] = order[tree.parent[n]]
+                    index['step'][p] = tree.index[n]
+                    index['position'][p] = tree.first[n]
+                    index['path'][p] = tuple(tree.path(n))
+                return index
+
+            def __get_assembly_vectors(self, rows=None):
+                """compute insertion vectors of each module step, steps whose contacts are not in rows are reused from the previous run"""
 
-                sub_seq = []
-                for i in range(len(steps)):
-                    if steps[i] in Toolbox.Data.deepest_steps(seq): pass
-                    else: sub_seq.append(Toolbox.Data.get_item_from_path(seq, steps[i]))
-                sub_seq.append(seq)
+                adj = self.contact_ids
+                self.sequence_index = self.__get_sequence_index()
+                units = self.sequence_index['units']
+                ranks = self.sequence_index['rank']
 
                 # Assembly vectors following modules list
-                iv = copy.deepcopy(sub_seq)
-                space = copy.deepcopy(sub_seq)
-                rel = copy.deepcopy(sub_seq)
-                for i in range(len(sub_seq)):
-                    for j in range(len(sub_seq[i])):
+                iv = [[None] * len(units[i]) for i in range(len(self.modules))]
+                space = [[None] * len(units[i]) for i in range(len(self.modules))]
+                rel = [[None] * len(units[i]) for i in range(len(self.modules))]
+                for i in range(len(self.modules)):
+                    rank = ranks[i]
+                    for j in range(len(units[i])):
                         # first element in subsequence
                         if j == 0:
                             iv[i][j] = "gravity"
@@ -486,83 +662,47 @@ if yes:
                             space[i][j] = []
 
                         else:
-                            # look for all connection between the plate (or a plate of the module) to insert and the plates in place
-                            rel_list = [] #
-                            is_list = [] #insertion spaces
-                            # element in subsequence is a module
-                            if type(sub_seq[i][j]) is list:
-                                plates = Toolbox.Data.flatten_integer_list(sub_seq[i][j])
-                                for plate in plates:
-                                    neighbours = adj[plate]
-                                    prequel = sub_seq[i][:j]
-                                    # find all corespondance between the neighbour group and the prequel group
-                                    for k in range(len(neighbours)):
-                                        for l in range(len(prequel)):
-                                            # element in prequel is a module
-                                            if type(prequel[l]) is list:
-                                                prequel[l] = Toolbox.Data.flatten_integer_list(prequel[l])
-                                                for m in range(len(prequel[l])):
-                                                    if prequel[l][m] == neighbours[k]:
-                                                        to_zero = rs.VectorCreate((0,0,0),self.contact_centers[plate][k])
-                                                        sphere = rs.CopyObject(self.contact_spheres[plate][k],to_zero)
-                                                        is_list.append(sphere)
-                                                        rel_list.append(neighbours[k])  
-                                            # element in prequel is a plate
-                                            else:
-                                                if prequel[l] == neighbours[k]:
-                                                    to_zero = rs.VectorCreate((0,0,0),self.contact_centers[plate][k])
-                                                    sphere = rs.CopyObject(self.contact_spheres[plate][k],to_zero)
-                                                    is_list.append(sphere)
-                                                    rel_list.append(neighbours[k])
-
-                            # element in subsequence is a plate
-                            else: 
-                                plate = sub_seq[i][j]
-                                neighbours = adj[plate]
-                                prequel = sub_seq[i][:j]
-                                # find the first corespondance between the neighbour group and the prequel group
-                                for k in range(len(neighbours)):
-                                    for l in range(len(prequel)):
-                                        # element in prequel is a module
-                                        if type(prequel[l]) is list:
-                                            for m in range(len(prequel[l])):
-                                                if prequel[l][m] == neighbours[k]:
-                                                    to_zero = rs.VectorCreate((0,0,0),self.contact_centers[plate][k])
-                                                    sphere = rs.CopyObject(self.contact_spheres[plate][k],to_zero)
-                                                    is_list.append(sphere)
-                                                    rel_list.append(neighbours[k])
-                                        # element in prequel is a plate
-                                        else:
-                                            if prequel[l] == neighbours[k]:
-                                                to_zero = rs.VectorCreate((0,0,0),self.contact_centers[plate][k])
-                                                sphere = rs.CopyObject(self.contact_spheres[plate][k],to_zero)
-                                                is_list.append(sphere)
-                                                rel_list.append(neighbours[k])
-
-                            # If plate/module has no contact, add a default vector and a support
-                            if is_list == []:
-                                iv[i][j] = "gravity"
-                                space[i][j] = []
-                                rel[i][j] = []
-                                self.modules[i].needed_supports += 1
-                            
-                            # If plate/module has contacts, intersect insertion spheres and take average candidate
+                            # contacts (plate, neighbour index) between the plate (or the plates of the module) to insert and the plates in place
+                            found = [(plate, k) for plate in units[i][j] for k in range(len(adj[plate])) if rank.get(adj[plate][k], j) < j]
+                            rel_list = [adj[plate][k] for (plate, k) in found]
+
+                            # If contacts of this step did not change since the previous run, reuse its result
+                            signature = [(plate, adj[plate][k]) for (plate, k) in found]
+                            cached = self.__assembly_cache.get((i, j))
+                            if rows is not None and cached is not None and cached[0] == signature and [p for (p, k) in found if p in rows] == []:
+                                iv[i][j] = copy.deepcopy(cached[1])
+                                space[i][j] = cached[2]
+                                rel[i][j] = cached[3]
+                                if found == []: self.modules[i].needed_supports += 1
+
                             else:
+                                is_list = [self.contact_spheres[plate][k] for (plate, k) in found] #insertion constraints
 
-                                try:
-                                    inter = self.intersect_insertion_spaces(is_list)
-                                    iv[i][j] = inter[0] #average vector
-                                    space[i][j] = inter[1] #candidates
-                                    rel[i][j] = rel_list
-                                except:
-                                    self.temp = is_list
+                                # If plate/module has no contact, add a default vector and a support
+                                if is_list == []:
                                     iv[i][j] = "gravity"
                                     space[i][j] = []
-                                    rel[i][j] = rel_list
-                                    #raise Exception('Insertion space intersection returns no compatible vector for plate(s) '+str(sub_seq[i][j])+' with plates '+str(rel[i][j]))
+                                    rel[i][j] = []
+                                    self.modules[i].needed_supports += 1
+                            
+                                # If plate/module has contacts, intersect insertion cones and take the maximum-clearance direction
+                                else:
+
+                                    try:
+                                        inter = self.intersect_insertion_spaces(is_list)
+                                        iv[i][j] = inter[0] #maximum-clearance vector
+                                        space[i][j] = inter[1] #points sampling the feasible region
+                                        rel[i][j] = rel_list
+                                    except:
+                                        self.temp = is_list
+                                        iv[i][j] = "gravity"
+                                        space[i][j] = []
+                                        rel[i][j] = rel_list
+                                        #raise Exception('Insertion space intersection returns no compatible vector for plate(s) '+str(sub_seq[i][j])+' with plates '+str(rel[i][j]))
 
-                                # if average vector failed or was null, take gravity instead
-                                if iv[i][j] == None: iv[i][j] = "gravity"
+                                    # if the intersection failed or was null, take gravity instead
+                                    if iv[i][j] == None: iv[i][j] = "gravity"
+                                self.__assembly_cache[(i, j)] = (signature, copy.deepcopy(iv[i][j]), space[i][j], rel[i][j])
 
                 # Update modules attributes
                 for i in range(len(self.modules)):
@@ -570,53 +710,21 @@ if yes:
                     self.modules[i].assembly_relatives = rel[i]
                     self.modules[i].assembly_spaces = space[i]
                 
-                # Assembly vectors following contact list
-                iv2 = copy.deepcopy(self.contact_planes)
-                rel2 = copy.deepcopy(self.contact_planes)
-                # Compare each contact zone...
+                # Assembly vectors following contact list:
+                # the vector of contact (i, nb) is the one of the step inserting nb (if i < nb) or i (reversed)
+                # in the deepest module containing both plates
+                paths = self.sequence_index['path']
+                modules = self.sequence_index['modules']
+                iv2 = [list(row) for row in self.contact_planes]
                 for i in range(self.count):
                     for j in range(len(adj[i])):
-                        
-                        # ... with each module sequence.
-                        search = True
-                        for k in range(len(self.modules)):
-                            # to retrieve the associated assembly vector
-                            if search is True:
-                                mod_seq = ast.literal_eval(self.modules[k].sequence)
-                                plates_in_sequence = Toolbox.Data.flatten_integer_list(mod_seq)
-                                if (i in plates_in_sequence) and (adj[i][j] in plates_in_sequence):
-                                    for l in  range(len(mod_seq)):
-                                        corresponding_vector = copy.deepcopy(self.modules[k].assembly_vectors[l])
-                                        if type(mod_seq[l]) is list:
-                                            plates_in_sub_sequence = Toolbox.Data.flatten_integer_list(mod_seq[l])
-                                            if i < adj[i][j] and adj[i][j] in plates_in_sub_sequence:
-                                                iv2[i][j] = corresponding_vector
-                                                rel2[i][j] = adj[i][j]
-                                                search = False
-                                    
-                                            elif i > adj[i][j] and i in plates_in_sub_sequence:
-                                                iv2[i][j] = rs.VectorReverse(corresponding_vector)
-                                                rel2[i][j] = adj[i][j]
-                                                search = False
-
-                                        else:
-                                            
-                                            if i < adj[i][j] and mod_seq[l] == adj[i][j]:
-                                                iv2[i][j] = corresponding_vector
-                                                rel2[i][j] = adj[i][j]
-                                                search = False
-
-                                            elif i > adj[i][j] and mod_seq[l] == i:
-                                                iv2[i][j] = rs.VectorReverse(corresponding_vector)
-                                                rel2[i][j] = adj[i][j]
-                                                search = False
-                #self.assembly_relatives = rel2
+                        nb = adj[i][j]
+                        c = 0
+                        while paths[i][c] == paths[nb][c]: c += 1
+                        module = self.modules[modules[paths[i][:c]]]
+                        if i < nb: iv2[i][j] = copy.deepcopy(module.assembly_vectors[paths[nb][c]])
+                        elif i > nb: iv2[i][j] = rs.VectorReverse(copy.deepcopy(module.assembly_vectors[paths[i][c]]))
                 self.contact_vectors = iv2
-                
-                #coerce geometry of contact spheres to avoid guid instance problem.
-                for i in range(len(self.contact_spheres)):
-                    for j in range(len(self.contact_spheres[i])):
-                        self.contact_spheres[i][j]=rs.coercegeometry(self.contact_spheres[i][j])
 
                 #assign model attributes
                 self.assembly_vectors = self.modules[0].assembly_vectors
@@ -626,184 +734,612 @@ if yes:
             def intersect_insertion_spaces(self, insertion_spaces):
                 """
                 Hypothesis:
-                    insertion spaces are points, curves and surfaces
-                    pts, crvs and srfs are parts of a sphere of radius 1
+                    insertion spaces are insertion constraints, cones (see Toolbox.Cones) or points, curves and surfaces
+                    pts, crvs and srfs are parts of a sphere of radius 1 centered at the origin
                     crvs are geodesics on that sphere
                     crvs are smaller than the hemisphere (L = pi.r)
-                    srfs have convex perimeters and no holes
+                    srfs have convex perimeters bounded by circles and no holes
                     srfs are smaller than the hemisphere (A = 2.pi.r^2)
                 Method:
-                    we start from the most constraining (point to surface)
-                    we avoid surface intersection using geodesic points
+                    each space is a set of halfspace, plane and point constraints on unit directions
+                    the maximum-clearance direction of their intersection is found by linear programming
+                Return:
+                    (vector, points sampling the feasible region, feasible region as a cone)
                 """
 
-                # Sort insertion_spaces
-                pts,crvs,srfs = [],[],[]
+                if len(insertion_spaces) == 0: raise Exception('Please provide at least one point/curve/surface')
+                cones = []
                 for space in insertion_spaces:
-                    if rs.IsPoint(space) is True:
-                        pts.append(space)
-                    elif rs.IsCurve(space) is True:
-                        crvs.append(space)        
-                    elif rs.IsBrep(space) is True:
-                        srfs.append(space)
-                geodesic_cloud = Toolbox.Points.geodesic_sphere_points()
-
-                tol = 0.001 # intersection tolerance
-                dso = 2 # design space order
-                candidates = []
-                
-                # Intersection functions:
-                
-                def pt_pt(pt1, pt2, tol):
-                    if rs.Distance(pt1,pt2) > tol:
-                        raise Exception('No pt-pt intersection was found')
-                
-                def pt_crv(pt,crv):
-                    if rs.IsPointOnCurve(crv, pt) is False:
-                        raise Exception('No pt-crv intersection was found')
-                
-                def pts_crv(pts, crv, warning=True):
-                    new_pts = []
-                    for pt in pts:
-                        if rs.IsPointOnCurve(crv, pt) is True:
-                            new_pts.append(pt)
-                    if new_pts == [] and warning == True:
-                        raise Exception('No pts-crv intersection was found')
-                    else: return new_pts
-                
-                def pt_srf(pt,srf):
-                    if rs.IsPointOnSurface(srf, pt) is False:
-                        raise Exception('No pt-srf intersection was found')
-                
-                def pts_srf(pts, srf, tol, warning=True):
-                    new_pts = []
-                    for pt in pts:
-                        srf_pt = rs.BrepClosestPoint(srf,pt)[0]
-                        if rs.Distance(pt,srf_pt) < tol:
-                            new_pts.append(pt)
-                    if new_pts == [] and warning==True:
-                        raise Exception('No pts-srf intersection was found')
-                    else: return new_pts
-                
-                def crv_crv(crv1, crv2, warning=True):
-                    inter = rs.CurveCurveIntersection(crv1,crv2)
-                    if inter == None and warning == True:
-                        raise Exception('No crv-crv intersection was found')
-                    else: return inter
-                
-                def crv_srf():
-                    pass
-                
-                def srf_srf():
-                    pass
-                
-                def dist_to_srf(srf,pt):
-                    srf_pt = rs.BrepClosestPoint(srf,pt)[0]
-                    return rs.Distance(srf_pt,pt)
-                
-                def dist_to_crv(crv,pt):
-                    t = rs.CurveClosestPoint(crv,pt)
-                    return rs.Distance(rs.EvaluateCurve(crv,t),pt)
-                
-                def crv_to_pts(crv):
-                    segments = rs.CurveLength(crv) /0.01
-                    pts = rs.DivideCurve(crv,segments)
-                    return pts
-                
-                def srf_to_pts(srf,geodesic_cloud,edge=True):
-                    pts=[]
-                    border = rs.DuplicateSurfaceBorder(srf,1)
-                    if edge is True:
-                        border_pts = crv_to_pts(border)
-                        for pt in border_pts:
-                            pts.append(pt)
-                    for pt in geodesic_cloud:
-                        pt = rs.AddPoint(pt)
-                        srf_pt = rs.BrepClosestPoint(srf,pt)[0]
-                        if rs.Distance(srf_pt,pt) < tol:
-                            t =rs.CurveClosestPoint(border,pt)
-                            border_pt = rs.EvaluateCurve(border,t)
-                            if rs.Distance(border_pt,pt) > tol:
-                                pts.append(pt)
-                    return pts
-                
-                # Start from points
-                if len(pts) != 0:
-                    dso = 0
-                    candidates.append(pts[0])
-                    #check points
-                    for i in range(len(pts)-1):
-                        pt_pt(candidates[0],pts[i+1],tol)
-                    # check curves
-                    for crv in crvs:
-                        pt_crv(candidates[0],crv)
-                    # check surfaces
-                    for srf in srfs:
-                        pt_srf(candidates[0],srf)
-                
-                # Start from curves
-                elif len(crvs) != 0:
-                    dso = 1
-                    candidates = crv_to_pts(crvs[0])
-                    base_crv = crvs[0]
-                    #check curves
-                    for i in range(len(crvs)-1):
-                        if dso == 1:
-                            inter = crv_crv(base_crv,crvs[i+1])[0]
-                            #intersection
-                            if inter[0] == 1:
-                                candidates = [inter[1]]
-                                dso = 0
-                            #overlap
+                    if isinstance(space, InsertionConstraint): cones.append(space.cone)
+                    else: cones.append(Toolbox.Cones.from_geometry(space))
+                region = Toolbox.Cones.merge(cones)
+                solution = Toolbox.Cones.solve(region)
+                if solution is None: raise Exception('No intersection of the insertion spaces was found')
+                vector = rg.Vector3d(solution[0][0], solution[0][1], solution[0][2])
+                samples = [rg.Point3d(p[0], p[1], p[2]) for p in Toolbox.Cones.samples(region)]
+                return (vector, samples, region)
+
+            def insertion_candidates(self, placed, candidates=None):
+                """
+                Evaluate at once which plates could be inserted next, given the plates already placed.
+                Plates are indices in self.plates (in the order of the model sequence, not of the breps as given to the model).
+                    placed: plates already assembled (list or set).
+                    candidates: plates to evaluate, all unplaced plates by default.
+                Return a dictionary {plate: {'feasible', 'vector', 'clearance', 'relatives', 'region'}}:
+                    feasible: True if the insertion constraints of all contacts with placed plates intersect.
+                    vector: maximum-clearance insertion vector, "gravity" if the plate touches no placed plate (a support is needed).
+                    clearance: sine of the angular margin of the vector to the closest constraint boundary.
+                    relatives: placed plates in contact with the plate.
+                    region: intersection of the insertion constraints as a cone (see Toolbox.Cones).
+                """
+                if type(placed) is str: raise Exception(' Plates in place are indices in self.plates, not a sequence string.')
+                placed = set(placed)
+                if candidates is None: candidates = [i for i in range(self.count) if i not in placed]
+                candidates = [i for i in candidates if i not in placed]
+
+                # single pass over the contacts of the placed plates to gather the constraints of each candidate
+                wanted = set(candidates)
+                gathered = dict([(i, []) for i in candidates])
+                for nb in placed:
+                    for i in self.contact_ids[nb]:
+                        if i in wanted: gathered[i].append(nb)
+
+                result = {}
+                for i in candidates:
+                    result[i] = self.insertion_entry((i,), [(i, nb) for nb in sorted(gathered[i])])
+                return result
+
+            def insertion_entry(self, unit, found):
+                """
+                Evaluate the insertion of a plate or module, memoized until the model is transformed.
+                    unit: tuple of the plates inserted together.
+                    found: list of its contacts (plate, neighbour) with the plates in place.
+                Return a dictionary {'feasible', 'vector', 'clearance', 'relatives', 'region'} (see insertion_candidates).
+                """
+                key = (unit, tuple(found))
+                if key not in self.__insertion_cache:
+                    relatives = sorted(set([nb for (p, nb) in found]))
+                    if found == []: entry = {'feasible': True, 'vector': "gravity", 'clearance': None, 'relatives': [], 'region': None}
+                    else:
+                        position = self.contact_index['position']
+                        region = Toolbox.Cones.merge([self.contact_spheres[p][position[(p, nb)]].cone for (p, nb) in found])
+                        solution = Toolbox.Cones.solve(region)
+                        if solution is None: entry = {'feasible': False, 'vector': None, 'clearance': None, 'relatives': relatives, 'region': region}
+                        else: entry = {'feasible': True, 'vector': rg.Vector3d(solution[0][0], solution[0][1], solution[0][2]), 'clearance': solution[1], 'relatives': relatives, 'region': region}
+                    self.__insertion_cache[key] = entry
+                return self.__insertion_cache[key]
+
+            def solve_sequence(self, modules=None, beam_width=8, time_budget=10.0, support_weight=1.0, workers=None):
+                """
+                Search a feasible assembly sequence from the contact graph and the insertion constraints (beam search).
+                    modules: optional grouping, list of lists of plates (or sequence string) assembled as modules, indices of the breps as given to this model.
+                    beam_width: number of partial sequences kept at each step.
+                    time_budget: seconds, once exceeded the search goes on greedily with the best partial sequence, backtracking to the others on dead ends.
+                    support_weight: score penalty of each needed support, the score of a step is its insertion clearance.
+                    workers: number of threads expanding partial sequences, model workers by default.
+                Partial sequences are pruned as soon as an insertion is infeasible,
+                a plate without contact with the plates in place (new support) is only chosen when no connected plate can be inserted.
+                Return a sequence string, indices refer to the breps as given to this model.
+                """
+                if workers is None: workers = self.workers
+                deadline = time.time() + time_budget
+                if type(modules) is str: modules = SequenceTree(modules).item()
+                if modules is None: modules = []
+                modules = [Toolbox.Data.flatten_integer_list(module) for module in modules]
+                modules = [module for module in modules if type(module) is list and len(module) > 1]
+                grouped = set([p for module in modules for p in module])
+                if len(grouped) != sum([len(module) for module in modules]): raise Exception(' A plate belongs to several modules.')
+                position = dict([(self.input_order[i], i) for i in range(self.count)])
+                if [p for p in grouped if p not in position] != []: raise Exception(' Modules refer to plates that are not in the model.')
+                modules = [[position[p] for p in module] for module in modules]
+                grouped = set([p for module in modules for p in module])
+
+                # order the plates inside each module, then the modules and remaining plates
+                units = []
+                for module in modules:
+                    order = self.__search_sequence([(p,) for p in module], beam_width, deadline, support_weight, workers)
+                    units.append(tuple([module[u] for u in order]))
+                units += [(p,) for p in range(self.count) if p not in grouped]
+                order = self.__search_sequence(units, beam_width, deadline, support_weight, workers)
+
+                sequence = []
+                for u in order:
+                    if len(units[u]) == 1: sequence.append(self.input_order[units[u][0]])
+                    else: sequence.append([self.input_order[p] for p in units[u]])
+                self.log.append('Sequence found by search : ' + str(sequence))
+                return str(sequence)
+
+            def __search_sequence(self, units, beam_width, deadline, support_weight, workers):
+                """beam search of an order of units (tuples of plates), insertions only consider plates of these units"""
+                n = len(units)
+                owner = {}
+                for u in range(n):
+                    for p in units[u]: owner[p] = u
+                links = [set([owner[nb] for p in units[u] for nb in self.contact_ids[p] if nb in owner]) - set([u]) for u in range(n)]
+
+                def rank(state):
+                    return state[1] - support_weight * state[2]
+
+                def expand(state):
+                    order, score, supports = state
+                    done = set(order)
+                    placed = set([p for u in order for p in units[u]])
+                    frontier = set([v for u in order for v in links[u] if v not in done])
+                    children = []
+                    for v in sorted(frontier):
+                        found = [(p, nb) for p in units[v] for nb in self.contact_ids[p] if nb in placed]
+                        entry = self.insertion_entry(units[v], found)
+                        if entry['feasible']: children.append((order + (v,), score + entry['clearance'], supports))
+                    # nothing connected can be inserted: start a new support
+                    if children == []:
+                        children = [(order + (v,), score, supports + 1) for v in range(n) if v not in done and v not in frontier]
+                    return children
+
+                # start with the best connected units, partial sequences left out of the beam are kept to backtrack from dead ends
+                states = [((u,), 0.0, 1) for u in sorted(range(n), key=lambda u: -len(links[u]))]
+                beam, reserve = states[:beam_width], states[beam_width:]
+                seen = set() # units of the partial sequences expanded
+                while len(beam[0][0]) < n:
+                    if time.time() > deadline: beam, reserve = beam[:1], reserve + beam[1:]
+                    seen.update([frozenset(state[0]) for state in beam])
+                    best = {}
+                    for children in Toolbox.Parallel.map(expand, beam, workers, processes=False):
+                        for child in children:
+                            key = frozenset(child[0])
+                            if key in seen: continue
+                            if key not in best or rank(child) > rank(best[key]): best[key] = child
+                    if best == {}:
+                        # dead end: go back to the deepest partial sequences left out
+                        reserve = [state for state in reserve if frozenset(state[0]) not in seen]
+                        if reserve == []: raise Exception(' No feasible sequence was found, every partial sequence is blocked.')
+                        reserve.sort(key=lambda state: (len(state[0]), rank(state)))
+                        k = len(reserve) - 1
+                        while k > 0 and len(reserve[k-1][0]) == len(reserve[-1][0]) and len(reserve) - k < beam_width: k -= 1
+                        beam, reserve = reserve[k:][::-1], reserve[:k]
+                        continue
+                    states = sorted(best.values(), key=rank, reverse=True)
+                    beam, reserve = states[:beam_width], reserve + states[beam_width:]
+                return list(beam[0][0])
+
+            def check_insertion_paths(self, retreat_dist=10.0, clearance=None):
+                """
+                Check that each plate (or module) can be inserted along its assembly vector without hitting the plates in place.
+                The plate is swept from retreat_dist away to its final position (as in trajectory and animation components),
+                gravity steps are inserted from above. Plates are split in convex prisms, the plates in place are found
+                with a bounding volume hierarchy and checked with separating axis tests. Joints are not considered.
+                    clearance: distance to the plates in place for the plate to be out of its slot, model tolerance by default.
+                Return, for each module, a list with a dictionary for each step:
+                    collisions: plates in place hit by the plate(s) swept from retreat_dist.
+                    blocked: distance of the first collision along the insertion path (None if the path is free).
+                    retreat: minimal retreat distance for the plate(s) to be clearance away from the plates in place.
+                """
+                V = Toolbox.Vectors
+                if clearance is None: clearance = self.tolerance
+                parts = [Toolbox.Collisions.convex_parts(self.__get_slab(i)) for i in range(self.count)]
+                boxes = [Toolbox.Boxes.union([part['box'] for part in parts[i]]) for i in range(self.count)]
+                tree = Toolbox.Boxes.bvh(boxes)
+                model_box = Toolbox.Boxes.union(boxes)
+                reach = V.length(V.subtract(model_box[3:], model_box[:3])) + retreat_dist
+                units = self.sequence_index['units']
+                ranks = self.sequence_index['rank']
+
+                results = []
+                colliding = 0
+                for k in range(len(self.modules)):
+                    steps = []
+                    for j in range(len(units[k])):
+                        vector = self.modules[k].assembly_vectors[j]
+                        if vector is None or vector == "gravity": vector = (0, 0, -1)
+                        direction = V.unitize((-vector[0], -vector[1], -vector[2])) # retreat direction
+                        unit = units[k][j]
+                        moving = [part for p in unit for part in parts[p]]
+
+                        # plates in place around the swept volume
+                        box = Toolbox.Boxes.union([boxes[p] for p in unit])
+                        far = tuple([box[c] + reach * direction[c % 3] for c in range(6)])
+                        swept = Toolbox.Boxes.union([box, far])
+                        swept = tuple([swept[c] - clearance for c in range(3)] + [swept[c] + clearance for c in range(3, 6)])
+                        placed = [b for b in Toolbox.Boxes.bvh_query(tree, swept) if ranks[k].get(b, j) < j]
+
+                        collisions = []
+                        blocked = None
+                        near = []
+                        for b in sorted(placed):
+                            hit = False
+                            for pa in moving:
+                                for pb in parts[b]:
+                                    overlap = Toolbox.Collisions.interval(pa, pb, direction, -self.tolerance)
+                                    if overlap is not None and overlap[1] > self.tolerance:
+                                        first = max(overlap[0], 0.0)
+                                        if blocked is None or first < blocked: blocked = first
+                                        if first < retreat_dist: hit = True
+                                    close = Toolbox.Collisions.interval(pa, pb, direction, clearance)
+                                    if close is not None and close[1] > 0: near.append(close)
+                            if hit: collisions.append(b)
+
+                        # retreat until the plate leaves the chain of close intervals starting at its final position
+                        retreat = 0.0
+                        for (t_in, t_out) in sorted(near):
+                            if t_in <= retreat: retreat = max(retreat, min(t_out, reach))
+                        if collisions != []: colliding += 1
+                        steps.append({'collisions': collisions, 'blocked': blocked, 'retreat': retreat})
+                    results.append(steps)
+                self.log.append('Insertion paths checked: ' + str(colliding) + ' step(s) with collisions')
+                return results
+
+            def check_interlocking(self, fixed=None, module=None, keys=True):
+                """
+                Check which plates can still be moved away from the assembly by rigid motions (translations and rotations, to first order).
+                Each plate has a twist (velocity of its center of mass, rotation scaled by its size). At each vertex of a contact zone,
+                the velocity of the two plates may not close the contact along its normal (nor open it for intersecting plates),
+                and at the center of the zone their relative velocity stays in the opposite of the insertion space of the contact
+                (halfspaces through the origin, planes and points; spherical patches are relaxed to their halfspaces).
+                The contact table is turned into sparse constraint rows in one pass, equalities are eliminated by sparse
+                gauss-jordan elimination, then a sparse linear program on the remaining free directions finds the contacts
+                that some motion can open. The plates moving in the directions left free are mobile.
+                    fixed: plates held in place, first plate of the sequence (or of the module) by default.
+                    module: only check the plates of this module (index in self.modules), the other plates being ignored.
+                    keys: also look for the key plates (one more check per mobile plate).
+                Return a dictionary:
+                    interlocked: True if no plate can move.
+                    mobile: plates that can still move.
+                    groups: mobile plates grouped by contact.
+                    keys: mobile plates locking all the others once held in place.
+                """
+                V = Toolbox.Vectors
+                if module is None: plates = list(range(self.count))
+                else: plates = sorted(self.modules[module].plate_ids)
+                scope = set(plates)
+                if fixed is None: fixed = [plates[0]]
+                fixed = [int(p) for p in fixed]
+
+                # constraints on the relative velocity n.(u[nb](x)-u[i](x)) of the plates at a point x of a contact, as sparse rows,
+                # with u[p](x) = v[p] + w[p] x (x - center[p]) / size[p] for the twist (v, w) of plate p in columns (p, 0..5)
+                bodies = {}
+                def body(p):
+                    if p not in bodies: bodies[p] = self.__get_body(p)
+                    return bodies[p]
+                equalities, inequalities, seen = [], [], set()
+                def add(rows, i, nb, x, n):
+                    row = {}
+                    for (p, sign) in ((nb, 1.0), (i, -1.0)):
+                        volume, center, size = body(p)
+                        m = V.cross(V.subtract(x, center), n)
+                        for a in range(3):
+                            if abs(n[a]) > 1e-9: row[(p, a)] = sign * n[a]
+                            if abs(m[a]) > 1e-9 * size: row[(p, 3 + a)] = sign * m[a] / size
+                    key = (rows is equalities, tuple(sorted([(col, round(c, 6)) for (col, c) in row.items()])))
+                    if row and key not in seen:
+                        seen.add(key)
+                        rows.append(row)
+                for i in plates:
+                    for j in range(len(self.contact_ids[i])):
+                        nb = self.contact_ids[i][j]
+                        if nb not in scope: continue
+                        normal = V.unitize(tuple([self.contact_normals[i][j][k] for k in range(3)]))
+                        for x in self.__get_contact_points(i, j):
+                            add(equalities if self.contact_types[i][j] == 'IN' else inequalities, i, nb, x, normal)
+                        x = tuple([self.contact_geometry[i][j]['center'][k] for k in range(3)])
+                        cone = self.contact_spheres[i][j].cone
+                        for (n, c) in cone['halfspaces']:
+                            if c >= -self.tolerance: add(inequalities, i, nb, x, n)
+                        for n in cone['planes']:
+                            add(equalities, i, nb, x, n)
+                        for p in cone['points']:
+                            e1 = V.unitize(V.cross(p, (1, 0, 0) if abs(p[0]) < 0.9 else (0, 1, 0)))
+                            add(equalities, i, nb, x, e1)
+                            add(equalities, i, nb, x, V.cross(p, e1))
+                            add(inequalities, i, nb, x, p)
+
+                mobile = self.__get_mobile_plates(plates, fixed, equalities, inequalities)
+                groups, visited = [], set()
+                for p in sorted(mobile):
+                    if p in visited: continue
+                    visited.add(p)
+                    group, stack = [], [p]
+                    while stack:
+                        q = stack.pop()
+                        group.append(q)
+                        for nb in self.contact_ids[q]:
+                            if nb in mobile and nb not in visited:
+                                visited.add(nb)
+                                stack.append(nb)
+                    groups.append(sorted(group))
+
+                # separate groups move independently, a single plate cannot lock them all
+                key_plates = []
+                if keys is True and len(groups) == 1:
+                    for p in groups[0]:
+                        if not self.__get_mobile_plates(plates, fixed + [p], equalities, inequalities): key_plates.append(p)
+
+                self.log.append('Interlocking checked: ' + str(len(mobile)) + ' mobile plate(s) in ' + str(len(groups)) + ' group(s)')
+                return {'interlocked': not mobile, 'mobile': sorted(mobile), 'groups': groups, 'keys': key_plates}
+
+            def __get_mobile_plates(self, plates, fixed, equalities, inequalities, tolerance=1e-7):
+                """set of plates moved by some twist satisfying the constraint rows, fixed plates staying in place"""
+                fixed = set(fixed)
+                def free(row):
+                    return dict([(col, a) for (col, a) in row.items() if col[0] not in fixed])
+                columns = [(p, a) for p in plates if p not in fixed for a in range(6)]
+                basis = Toolbox.Numbers.null_space([free(row) for row in equalities], columns)
+
+                # inequalities in the coordinates of the basis
+                entries = {}
+                for k in range(len(basis)):
+                    for (col, a) in basis[k].items(): entries.setdefault(col, []).append((k, a))
+                rows = {}
+                for row in inequalities:
+                    g = {}
+                    for (col, a) in free(row).items():
+                        for (k, b) in entries.get(col, ()): g[k] = g.get(k, 0.0) + a * b
+                    g = dict([(k, a) for (k, a) in g.items() if abs(a) > tolerance])
+                    if g:
+                        scale = max([abs(a) for a in g.values()])
+                        key = tuple(sorted([(k, round(a / scale, 9)) for (k, a) in g.items()]))
+                        rows[key] = dict(key)
+
+                rows = list(rows.values())
+                touching = {}
+                for l in range(len(rows)):
+                    for k in rows[l]: touching.setdefault(k, []).append(l)
+
+                # a motion opening some inequalities can be added to any other motion, so the opened ones are dropped
+                # as they are found: first along single basis directions, then with linear programs on the closed ones
+                closed = set(range(len(rows)))
+                while closed:
+                    changed = True
+                    while changed:
+                        changed = False
+                        for k in touching:
+                            for sign in (1.0, -1.0):
+                                values = [sign * rows[l][k] for l in touching[k] if l in closed]
+                                if values and min(values) > 0:
+                                    closed.difference_update(touching[k])
+                                    changed = True
+
+                    # basis directions linked by closed inequalities are solved together
+                    parent = dict([(k, k) for k in touching])
+                    def find(k):
+                        while parent[k] != k:
+                            parent[k] = parent[parent[k]]
+                            k = parent[k]
+                        return k
+                    for l in closed:
+                        ks = list(rows[l].keys())
+                        for k in ks[1:]: parent[find(k)] = find(ks[0])
+                    components = {}
+                    for l in closed: components.setdefault(find(list(rows[l].keys())[0]), []).append(l)
+
+                    found = []
+                    for ls in components.values():
+                        # maximize the sum of g.y over the closed inequalities g.y >= 0, with y = y+ - y- in a unit box:
+                        # a positive value opens some of them, zero proves that none opens
+                        ks = sorted(set([k for l in ls for k in rows[l]]))
+                        m = len(ks)
+                        position = dict([(ks[j], j) for j in range(m)])
+                        A_ub, b_ub, c = [], [], {}
+                        for l in ls:
+                            row = {}
+                            for (k, a) in rows[l].items():
+                                row[position[k]] = -a
+                                row[m + position[k]] = a
+                                c[position[k]] = c.get(position[k], 0.0) + a
+                                c[m + position[k]] = c.get(m + position[k], 0.0) - a
+                            A_ub.append(row)
+                            b_ub.append(0.0)
+                        value, x = Toolbox.Numbers.sparse_linear_program(c, A_ub, b_ub, dict([(j, 1.0) for j in range(2*m)]))
+                        y = dict([(k, x.get(position[k], 0.0) - x.get(m + position[k], 0.0)) for k in ks])
+                        found += [l for l in ls if sum([a * y[k] for (k, a) in rows[l].items()]) > tolerance]
+                    if found == []: break
+                    closed.difference_update(found)
+
+                # inequalities that no motion opens hold as equalities
+                mobile = set()
+                for w in Toolbox.Numbers.null_space([rows[l] for l in closed], range(len(basis))):
+                    motion = {}
+                    for (k, a) in w.items():
+                        for (col, b) in basis[k].items(): motion[col] = motion.get(col, 0.0) + a * b
+                    mobile.update([col[0] for (col, a) in motion.items() if abs(a) > tolerance])
+                return mobile
+
+            def __get_body(self, i):
+                """weight (volume), center of mass and size (largest distance of a vertex to the center) of a plate"""
+                V, P = Toolbox.Vectors, Toolbox.Polygons
+                slab = self.__get_slab(i)
+                normal = slab['normal']
+                top = P.to_2d(slab['top'], slab['top'][0], normal)
+                bottom = P.to_2d(slab['bottom'], slab['bottom'][0], normal)
+                volume = abs(P.area(top)) * abs(slab['top_d'] - slab['bottom_d'])
+                centers = P.to_3d([P.centroid(top)], slab['top'][0], normal) + P.to_3d([P.centroid(bottom)], slab['bottom'][0], normal)
+                center = tuple([(centers[0][k] + centers[1][k]) / 2.0 for k in range(3)])
+                size = max([V.length(V.subtract(p, center)) for p in slab['top'] + slab['bottom']])
+                return (max(volume, self.tolerance ** 3), center, max(size, self.tolerance))
+
+            def __get_contact_points(self, i, j):
+                """vertices of the contact zone j of plate i, the ends of its longest border axis around its center when it has no polygons"""
+                geometry = self.contact_geometry[i][j]
+                if geometry['polygons']: return [tuple(p) for polygon in geometry['polygons'] for p in polygon]
+                center = tuple([geometry['center'][k] for k in range(3)])
+                axis = tuple([geometry['axis'][k] / 2.0 for k in range(3)])
+                return [Toolbox.Vectors.subtract(center, axis), tuple([center[k] + axis[k] for k in range(3)])]
+
+            def check_stability(self, friction=0.5, tolerance=1e-6):
+                """
+                Check that each partial assembly stands under gravity, the plates being rigid blocks resting on each other.
+                Contact zones are polygonal interfaces carrying compression and friction at their vertices (inscribed friction
+                pyramid), intersecting plates (IN) also carry tension. The first plate (or module) of each module is held in place,
+                and so are the plates that can no longer move, their contacts with the held plates balancing any force and moment.
+                At each step, the other plates in place are split into sub-assemblies connected by contacts, and only the new or
+                grown ones are solved again: a sparse linear program first looks for contact forces balancing their plates, and
+                only if there are none, a second one looks for the temporary support forces needed at the vertices of the plates,
+                both programs being warm-started from the sub-assembly they grew from.
+                    friction: friction coefficient of the contacts.
+                    tolerance: support force (relative to the weight of the plate) below which a plate stands by itself.
+                Return, for each module, a list with a dictionary for each step:
+                    stable: True if the plates in place stand without temporary support.
+                    supports: plate of each support.
+                    points: plate vertex where each support is needed.
+                    forces: force of each support, the weight of a plate being its volume.
+                """
+                V, P, N = Toolbox.Vectors, Toolbox.Polygons, Toolbox.Numbers
+                units = self.sequence_index['units']
+
+                # weight, center of mass and size of the plates
+                masses = {}
+                def mass(i):
+                    if i not in masses: masses[i] = self.__get_body(i)
+                    return masses[i]
+
+                # force generators of a contact, acting on nb, opposite on i
+                def generators(i, j):
+                    normal = V.unitize(tuple([self.contact_normals[i][j][k] for k in range(3)]))
+                    points = self.__get_contact_points(i, j)
+                    normals = [normal]
+                    if self.contact_types[i][j] == 'IN': normals.append((-normal[0], -normal[1], -normal[2]))
+                    forces = []
+                    for n in normals:
+                        u, v = P.frame(n)
+                        for t in (u, v, (-u[0], -u[1], -u[2]), (-v[0], -v[1], -v[2])):
+                            forces.append(tuple([n[k] + friction * t[k] for k in range(3)]))
+                    return [(p, f) for p in points for f in forces]
+
+                # force on a plate, relative to its weight and size
+                def wrench(body, point, force):
+                    volume, center, size = mass(body)
+                    m = V.cross(V.subtract(point, center), force)
+                    return [force[a] for a in range(3)] + [m[a] / size for a in range(3)]
+
+                # force on a plate in place, in its equilibrium rows
+                def add(body, column, point, force, scale):
+                    if body in held: return
+                    w = wrench(body, point, force)
+                    for a in range(6):
+                        row = equations[body][a] if column not in props else rests[body][a]
+                        row[column] = row.get(column, 0.0) + scale * w[a]
+
+                # a plate can no longer move when the forces of its contacts with the held plates span every force and moment,
+                # that is a full rank set of forces balanced by a strictly positive combination
+                def locked(p):
+                    forces = []
+                    for l in range(len(self.contact_ids[p])):
+                        if self.contact_ids[p][l] in held:
+                            forces += [wrench(p, point, (-f[0], -f[1], -f[2])) for (point, f) in generators(p, l)]
+                    if len(forces) < 7 or N.null_space([dict(enumerate(w)) for w in forces], range(6)) != []: return False
+                    A_eq = [[w[a] for w in forces] for a in range(6)]
+                    return N.linear_program([0.0] * len(forces), A_eq=A_eq, b_eq=[-sum(row) for row in A_eq]) is not None
+
+                # contact forces balancing the plates of a sub-assembly, or else the support forces needed
+                def solve(order, states):
+                    B_ub, b_ub, d = [], [], {}
+                    for p in order:
+                        for a in range(6):
+                            B_ub.append(equations[p][a])
+                            b_ub.append(1.0 if a == 2 else 0.0)
+                            for (column, v) in equations[p][a].items(): d[column] = d.get(column, 0.0) + penalty * v
+                    value, x = N.sparse_linear_program(d, B_ub, b_ub, state=states[0])
+                    if value > penalty * (sum(b_ub) - tolerance): return []
+                    A_ub, c = [], dict(d)
+                    for p in order:
+                        for a in range(6):
+                            row = dict(equations[p][a])
+                            row.update(rests[p][a])
+                            A_ub.append(row)
+                            for (column, v) in rests[p][a].items(): c[column] = c.get(column, -1.0) + penalty * v
+                    value, x = N.sparse_linear_program(c, A_ub, b_ub, state=states[1])
+                    return [(column, x[column]) for column in x if column in props and x[column] > tolerance]
+
+                penalty = 1000.0
+                results = []
+                unstable = 0
+                for k in range(len(self.modules)):
+                    held = set(units[k][0])
+                    placed = set(held)
+                    sequence = []
+                    columns, props = {}, {} # support columns: (plate, vertex, direction)
+                    equations, rests = {}, {} # six equilibrium rows per plate, for the contact forces and for the support forces
+                    tested = {} # held neighbours of a plate when it was last found to move
+                    solved = {} # sub-assembly: plates in the order of the rows, states of the programs and supports found
+                    steps = [{'stable': True, 'supports': [], 'points': [], 'forces': []}]
+                    for j in range(1, len(units[k])):
+                        unit = units[k][j]
+                        placed.update(unit)
+                        sequence += list(unit)
+
+                        # equilibrium rows of the new plates, relative to their weight and size (the slacks being penalized),
+                        # with support forces (relative to the weight) at their vertices
+                        for p in unit:
+                            equations[p] = [{} for a in range(6)]
+                            rests[p] = [{} for a in range(6)]
+                            slab = self.__get_slab(p)
+                            for vertex in slab['top'] + slab['bottom']:
+                                for e in ((1,0,0), (0,1,0), (0,0,1), (-1,0,0), (0,-1,0), (0,0,-1)):
+                                    column = columns.setdefault(('support', p, vertex, e), len(columns))
+                                    props[column] = (p, vertex, e)
+                                    add(p, column, vertex, e, 1.0)
+
+                        # contacts of the new plates with the plates in place
+                        for p in unit:
+                            for l in range(len(self.contact_ids[p])):
+                                nb = self.contact_ids[p][l]
+                                if nb not in placed or (nb in unit and nb < p): continue
+                                for (point, force) in generators(p, l):
+                                    column = columns.setdefault((p, nb, point, force), len(columns))
+                                    add(nb, column, point, force, 1.0 / mass(nb)[0])
+                                    add(p, column, point, force, -1.0 / mass(p)[0])
+
+                        # plates that can no longer move are held from now on
+                        changed = True
+                        while changed:
+                            changed = False
+                            for p in [p for p in sequence if p not in held]:
+                                anchors = set([nb for nb in self.contact_ids[p] if nb in held])
+                                if anchors and anchors != tested.get(p):
+                                    tested[p] = anchors
+                                    if locked(p):
+                                        held.add(p)
+                                        changed = True
+
+                        # sub-assemblies of the other plates in place, solved again when new or grown
+                        free = placed - held
+                        parts, seen = [], set()
+                        for p in sequence:
+                            if p not in free or p in seen: continue
+                            part, stack = set([p]), [p]
+                            while stack:
+                                q = stack.pop()
+                                for nb in self.contact_ids[q]:
+                                    if nb in free and nb not in part:
+                                        part.add(nb)
+                                        stack.append(nb)
+                            seen.update(part)
+                            parts.append(frozenset(part))
+                        previous, solved = solved, {}
+                        for part in parts:
+                            if part in previous: solved[part] = previous[part]
                             else:
-                                candidates = pts_crv(candidates,crvs[i+1])
-                                new_start=rs.CurveClosestPoint(base_crv,candidates[0])
-                                new_end=rs.CurveClosestPoint(base_crv,candidates[-1])
-                                base_crv=rs.AddSubCrv(base_crv,new_start,new_end)
-                        else: candidates = pts_crv(candidates,crvs[i+1])
-                    # check surfaces
-                    for srf in srfs:
-                        candidates = pts_srf(candidates,srf,tol)
-                
-                # Start from surfaces
-                elif len(srfs) != 0:
-                    dso = 2
-                    candidates = srf_to_pts(srfs[0],geodesic_cloud,edge=True)
-                    # check surfaces
-                    for i in range(len(srfs)-1):
-                        candidates = pts_srf(candidates,srfs[i+1],tol,False)
-                        #complete border
-                        border_i = rs.DuplicateSurfaceBorder(srfs[i+1])
-                        border_points = crv_to_pts(border_i)
-                        for j in range(i+1):
-                            border_points = pts_srf(border_points,srfs[j],tol,False)
-                        candidates = candidates + border_points
-                        if candidates == []: raise Exception('No srf-srf intersection was found')
-                
-                else: raise Exception('Please provide at least one point/curve/surface')
-
-                
-                if len(candidates) == 1:
-                    chosen = candidates[0]
-                elif len(candidates) > 1:
-                    l = len(candidates)
-                    x = 0
-                    y = 0
-                    z = 0
-                    for i in range(len(candidates)):
-                        if rs.IsPoint(candidates[i]) is False:
-                            candidates[i] = rs.AddPoint(candidates[i])
-                        coord = rs.PointCoordinates(candidates[i])
-                        candidates[i] = rs.coercegeometry(candidates[i])
-                        x += coord[0]
-                        y += coord[1]
-                        z += coord[2]
-                    x = x/l
-                    y = y/l
-                    z = z/l
-                    chosen = rs.AddPoint(x,y,z)
-                vector = rs.VectorUnitize(rs.VectorCreate(chosen,(0,0,0)))
-                return (vector, candidates)
+                                grown = sorted([q for q in previous if q <= part], key=len)
+                                if grown: order, states = previous[grown[-1]]['order'], previous[grown[-1]]['states']
+                                else: order, states = [], ({}, {})
+                                order = order + [p for p in sequence if p in part and p not in order]
+                                solved[part] = {'order': order, 'states': states, 'supports': solve(order, states)}
+
+                        found = {}
+                        for part in parts:
+                            for (column, value) in solved[part]['supports']: found[props[column]] = value
+                        supports, points, forces, where = [], [], [], {}
+                        for (p, vertex, e) in sorted(found):
+                            if (p, vertex) not in where:
+                                where[(p, vertex)] = len(points)
+                                supports.append(p)
+                                points.append(vertex)
+                                forces.append((0.0, 0.0, 0.0))
+                            n = where[(p, vertex)]
+                            forces[n] = tuple([forces[n][a] + e[a] * found[(p, vertex, e)] * mass(p)[0] for a in range(3)])
+                        if supports: unstable += 1
+                        steps.append({'stable': supports == [], 'supports': supports, 'points': points, 'forces': forces})
+                    results.append(steps)
+                self.log.append('Stability checked: ' + str(unstable) + ' step(s) needing temporary supports')
+                return results
                 
             # Decorator -----------------------------------
 
@@ -818,6 +1354,53 @@ if yes:
                     return fun(**kwargs)
                 return _
             
+            # CONTACT SELECTION ------------------------------------------
+
+            def select_contacts(self, pairs='all', types=None, plates=None, module=None, angles=None, areas=None, symmetric=True):
+                """
+                Return the contacts (i,j) matching all given filters, j being the position of the neighbour nb in contact_ids[i], with i < nb.
+                    pairs: 'all' or plate pairs such as '(i,nb)', as strings or tuples.
+                    types: list of contact types (e.g. ['SF','FS']), all types by default.
+                    plates: only contacts involving one of these plates.
+                    module: only contacts between plates of this module (index in self.modules).
+                    angles: (min, max) angle in degrees between the two plates.
+                    areas: (min, max) area of the contact zone.
+                    symmetric: if False, a pair (nb,i) does not select the contact (i,nb).
+                """
+                buckets = self.contact_index['types']
+                if types is None: types = list(buckets.keys())
+                elif type(types) is str: types = [types]
+
+                # smallest candidate set first
+                if pairs != 'all' and pairs is not None:
+                    selection = Toolbox.Data.parse_pairs(pairs)
+                    candidates = set([pair for pair in selection if pair[0] < pair[1]])
+                    if symmetric is True:
+                        candidates.update([(pair[1], pair[0]) for pair in selection if pair[0] > pair[1]])
+                    candidates = [pair for pair in candidates if [t for t in types if pair in buckets.get(t, ())]]
+                else:
+                    candidates = [pair for t in types for pair in buckets.get(t, ())]
+
+                if plates is not None:
+                    plates = set([int(p) for p in plates])
+                    candidates = [pair for pair in candidates if pair[0] in plates or pair[1] in plates]
+                if module is not None:
+                    members = set(self.modules[module].plate_ids)
+                    candidates = [pair for pair in candidates if pair[0] in members and pair[1] in members]
+
+                contacts = []
+                for (i, nb) in sorted(candidates):
+                    j = self.contact_index['position'][(i, nb)]
+                    if angles is not None:
+                        angle = rs.VectorAngle(self.plates[i].top_normal, self.plates[nb].top_normal)
+                        angle = min(angle, 180.0 - angle)
+                        if not (angles[0] <= angle <= angles[1]): continue
+                    if areas is not None:
+                        area = self.contact_geometry[i][j]['area']
+                        if not (areas[0] <= area <= areas[1]): continue
+                    contacts.append((i, j))
+                return contacts
+
             # PLATE JOINERY ----------------------------------------------
 
             @__skip_nones
@@ -837,119 +1420,103 @@ if yes:
 
                 """Add dowels on Face-to-Face contact zones."""
 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 #conditional loop
-                for i in range(self.count):
-                    types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        #specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)): 
-                                i_want_a_dowel = True
-                        else: i_want_a_dowel = False
-
-                        #for all specified Face-to-Face connection
-                        if (types[j] == 'FF') and (nb > i) and (i_want_a_dowel is True):
-
-                            #prerequisite
-                            if dowel_radius <= 0 : raise Exception(' Dowel_radius must be greater than 0')
-                            if dowel_number <= 0 : raise Exception(' Dowel_number must be greater than 0')
-                            if dowel_tolerance < 0 : raise Exception(' Dowel_tolerance must be greater than 0')
-                            if dowel_retreat_1 >= self.plates[i].thickness : raise Exception(' Dowel_retreat_1 must be smaller than plate '+str(i)+' thickness')
-                            if dowel_retreat_2 >= self.plates[nb].thickness : raise Exception(' Dowel_retreat_2 must be smaller than plate '+str(nb)+' thickness')
-                            if circle_radius <= 0 : raise Exception(' Circle_radius must be greater than 0')
-                            if not (-180.0 <= dowel_angle_1 <= 180.0) : raise Exception(' Dowel_angle_1 must be between -180 and 180')
-                            if not (-45.0 <= dowel_angle_2 <= 45.0) : raise Exception(' Dowel_angle_1 must be between -45 and 45')
-
-
-                            #location
-                            plane = self.contact_planes[i][j]
-                            location=[]
-                            if dowel_number == 1:
-                                location.append(plane)
-                            elif dowel_number > 1:
-                                polygon = Toolbox.Curves.create_polygon(plane, circle_radius, dowel_number)
-                                polygon = rs.RotateObject(polygon, plane.Origin, circle_rotation, plane.ZAxis)
-                                vertices = rs.PolylineVertices(polygon)
-                                for k in range(len(vertices)-1):
-                                    x_axis = rs.VectorCreate(plane.Origin,vertices[k])
-                                    new_plane = rs.PlaneFromNormal(vertices[k], plane.ZAxis, x_axis)
-                                    location.append(new_plane)
-
-                            if tile != False :
-                                tile = scriptcontext.doc.Objects.Add(tile)    
-
-                            for k in range(len(location)):
-
-                                #construction lines
-                                base_circle = tile
-                                if tile == False :
-                                    base_circle = rs.AddCircle(location[k],float(dowel_radius))
+                for (i, j) in self.select_contacts(plates_pairs, ['FF'], symmetric=False):
+                    nb = self.contact_ids[i][j]
+
+                    #for all specified Face-to-Face connection
+                    #prerequisite
+                    if dowel_radius <= 0 : raise Exception(' Dowel_radius must be greater than 0')
+                    if dowel_number <= 0 : raise Exception(' Dowel_number must be greater than 0')
+                    if dowel_tolerance < 0 : raise Exception(' Dowel_tolerance must be greater than 0')
+                    if dowel_retreat_1 >= self.plates[i].thickness : raise Exception(' Dowel_retreat_1 must be smaller than plate '+str(i)+' thickness')
+                    if dowel_retreat_2 >= self.plates[nb].thickness : raise Exception(' Dowel_retreat_2 must be smaller than plate '+str(nb)+' thickness')
+                    if circle_radius <= 0 : raise Exception(' Circle_radius must be greater than 0')
+                    if not (-180.0 <= dowel_angle_1 <= 180.0) : raise Exception(' Dowel_angle_1 must be between -180 and 180')
+                    if not (-45.0 <= dowel_angle_2 <= 45.0) : raise Exception(' Dowel_angle_1 must be between -45 and 45')
+
+
+                    #location
+                    plane = self.contact_planes[i][j]
+                    location=[]
+                    if dowel_number == 1:
+                        location.append(plane)
+                    elif dowel_number > 1:
+                        polygon = Toolbox.Curves.create_polygon(plane, circle_radius, dowel_number)
+                        polygon = rs.RotateObject(polygon, plane.Origin, circle_rotation, plane.ZAxis)
+                        vertices = rs.PolylineVertices(polygon)
+                        for k in range(len(vertices)-1):
+                            x_axis = rs.VectorCreate(plane.Origin,vertices[k])
+                            new_plane = rs.PlaneFromNormal(vertices[k], plane.ZAxis, x_axis)
+                            location.append(new_plane)
+
+                    if tile != False :
+                        tile = scriptcontext.doc.Objects.Add(tile)    
+
+                    for k in range(len(location)):
+
+                        #construction lines
+                        base_circle = tile
+                        if tile == False :
+                            base_circle = rs.AddCircle(location[k],float(dowel_radius))
                                 
-                                else : 
-                                    x_target = rs.CopyObject(location[k].Origin, location[k].XAxis)
-                                    y_target = rs.CopyObject(location[k].Origin, location[k].YAxis)
-                                    base_circle = Toolbox.Planes.orient(tile, rs.WorldXYPlane(), rs.RotatePlane(location[k], 90, location[k].ZAxis))
+                        else : 
+                            x_target = rs.CopyObject(location[k].Origin, location[k].XAxis)
+                            y_target = rs.CopyObject(location[k].Origin, location[k].YAxis)
+                            base_circle = Toolbox.Planes.orient(tile, rs.WorldXYPlane(), rs.RotatePlane(location[k], 90, location[k].ZAxis))
                                 
-                                top_circle = rs.CopyObject(base_circle, self.contact_normals[i][j] * (self.plates[nb].thickness - dowel_retreat_2))
-                                bottom_circle = rs.CopyObject(base_circle, -self.contact_normals[i][j] * (self.plates[i].thickness - dowel_retreat_1))
+                        top_circle = rs.CopyObject(base_circle, self.contact_normals[i][j] * (self.plates[nb].thickness - dowel_retreat_2))
+                        bottom_circle = rs.CopyObject(base_circle, -self.contact_normals[i][j] * (self.plates[i].thickness - dowel_retreat_1))
                                 
-                                #inclination
-                                if (-180 <= dowel_angle_1 <= 180) and (-45 <= dowel_angle_2 <= 45) :
-                                    if parallel is True :
-                                        ref = rs.PlaneFromFrame(plane.Origin,plane.XAxis,plane.YAxis)
-                                        ref = rs.RotatePlane(ref, dowel_angle_1, ref.ZAxis)
-                                    else :
-                                        x_axis = rs.VectorCreate(plane.Origin, location[k].Origin)
-                                        ref = rs.PlaneFromNormal(location[k].Origin, plane.ZAxis, x_axis)
-                                    top_move = (self.plates[nb].thickness - dowel_retreat_2) * math.tan(math.radians(dowel_angle_2)) * ref.XAxis
-                                    bottom_move = (self.plates[i].thickness - dowel_retreat_1) * math.tan(math.radians(dowel_angle_2)) * -ref.XAxis
-                                    rs.MoveObject(top_circle,top_move)
-                                    rs.MoveObject(bottom_circle,bottom_move)
-
-                                #keys geometry
-                                rail = rs.AddLine(rs.CurveAreaCentroid(bottom_circle)[0],rs.CurveAreaCentroid(top_circle)[0])
-                                cylinder = rs.ExtrudeCurve(bottom_circle, rail)
-                                rs.CapPlanarHoles(cylinder)
-                                self.plates[nb].joints_keys.append(rs.coercebrep(cylinder))
-
-                                #solid
-                                base_circle_bool = Toolbox.Curves.offset(base_circle, - dowel_tolerance)
-                                rail_top = rs.AddLine(rs.CurveAreaCentroid(base_circle)[0],rs.CurveAreaCentroid(top_circle)[0])
-                                cylinder_top = rs.ExtrudeCurve(base_circle_bool, rail_top)
-                                rail_bottom = rs.AddLine(rs.CurveAreaCentroid(base_circle)[0],rs.CurveAreaCentroid(bottom_circle)[0])
-                                cylinder_bottom = rs.ExtrudeCurve(base_circle_bool, rail_bottom)
-                                rs.CapPlanarHoles(cylinder_top)
-                                rs.CapPlanarHoles(cylinder_bottom)
-                                self.plates[i].joints_negatives.append(rs.coercebrep(cylinder_bottom))
-                                self.plates[nb].joints_negatives.append(rs.coercebrep(cylinder_top))
-
-                                #fabrication lines
-                                top_poly = rs.ConvertCurveToPolyline(top_circle, 10)
-                                bottom_poly = rs.ConvertCurveToPolyline(bottom_circle, 10)
-                                base_poly = rs.ConvertCurveToPolyline(base_circle, 10)
-
-                                if dowel_retreat_1 == 0 :
-                                    self.plates[i].top_holes.append(rs.coercecurve(base_poly))
-                                    self.plates[i].bottom_holes.append(rs.coercecurve(bottom_poly))   
-                                else:
-                                    self.plates[i].top_holes.append(rs.coercecurve(base_poly))
-                                    self.plates[i].bottom_holes.append(rs.coercecurve(bottom_poly))   
-                                if dowel_retreat_2 == 0 :
-                                    self.plates[nb].top_holes.append(rs.coercecurve(top_poly))
-                                    self.plates[nb].bottom_holes.append(rs.coercecurve(base_poly))  
-                                else:
-                                    self.plates[nb].top_holes.append(rs.coercecurve(top_poly))
-                                    self.plates[nb].bottom_holes.append(rs.coercecurve(base_poly))  
+                        #inclination
+                        if (-180 <= dowel_angle_1 <= 180) and (-45 <= dowel_angle_2 <= 45) :
+                            if parallel is True :
+                                ref = rs.PlaneFromFrame(plane.Origin,plane.XAxis,plane.YAxis)
+                                ref = rs.RotatePlane(ref, dowel_angle_1, ref.ZAxis)
+                            else :
+                                x_axis = rs.VectorCreate(plane.Origin, location[k].Origin)
+                                ref = rs.PlaneFromNormal(location[k].Origin, plane.ZAxis, x_axis)
+                            top_move = (self.plates[nb].thickness - dowel_retreat_2) * math.tan(math.radians(dowel_angle_2)) * ref.XAxis
+                            bottom_move = (self.plates[i].thickness - dowel_retreat_1) * math.tan(math.radians(dowel_angle_2)) * -ref.XAxis
+                            rs.MoveObject(top_circle,top_move)
+                            rs.MoveObject(bottom_circle,bottom_move)
+
+                        #keys geometry
+                        rail = rs.AddLine(rs.CurveAreaCentroid(bottom_circle)[0],rs.CurveAreaCentroid(top_circle)[0])
+                        cylinder = rs.ExtrudeCurve(bottom_circle, rail)
+                        rs.CapPlanarHoles(cylinder)
+                        self.plates[nb].joints_keys.append(rs.coercebrep(cylinder))
+
+                        #solid
+                        base_circle_bool = Toolbox.Curves.offset(base_circle, - dowel_tolerance)
+                        rail_top = rs.AddLine(rs.CurveAreaCentroid(base_circle)[0],rs.CurveAreaCentroid(top_circle)[0])
+                        cylinder_top = rs.ExtrudeCurve(base_circle_bool, rail_top)
+                        rail_bottom = rs.AddLine(rs.CurveAreaCentroid(base_circle)[0],rs.CurveAreaCentroid(bottom_circle)[0])
+                        cylinder_bottom = rs.ExtrudeCurve(base_circle_bool, rail_bottom)
+                        rs.CapPlanarHoles(cylinder_top)
+                        rs.CapPlanarHoles(cylinder_bottom)
+                        self.plates[i].joints_negatives.append(rs.coercebrep(cylinder_bottom))
+                        self.plates[nb].joints_negatives.append(rs.coercebrep(cylinder_top))
+
+                        #fabrication lines
+                        top_poly = rs.ConvertCurveToPolyline(top_circle, 10)
+                        bottom_poly = rs.ConvertCurveToPolyline(bottom_circle, 10)
+                        base_poly = rs.ConvertCurveToPolyline(base_circle, 10)
+
+                        if dowel_retreat_1 == 0 :
+                            self.plates[i].top_holes.append(rs.coercecurve(base_poly))
+                            self.plates[i].bottom_holes.append(rs.coercecurve(bottom_poly))   
+                        else:
+                            self.plates[i].top_holes.append(rs.coercecurve(base_poly))
+                            self.plates[i].bottom_holes.append(rs.coercecurve(bottom_poly))   
+                        if dowel_retreat_2 == 0 :
+                            self.plates[nb].top_holes.append(rs.coercecurve(top_poly))
+                            self.plates[nb].bottom_holes.append(rs.coercecurve(base_poly))  
+                        else:
+                            self.plates[nb].top_holes.append(rs.coercecurve(top_poly))
+                            self.plates[nb].bottom_holes.append(rs.coercecurve(base_poly))  
 
-                            self.log.append('Dowel joint added bewteen plates '+ str(i)+ ' and '+str(nb))
+                    self.log.append('Dowel joint added bewteen plates '+ str(i)+ ' and '+str(nb))
 
             @__skip_nones
             def add_tenons(self, 
@@ -962,157 +1529,140 @@ if yes:
 
                 """Add tenon and mortise on Side-to-Face or Face-to-Side contact zones."""
                 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 #conditional loop
-                for i in range(self.count):
+                for (i, j) in self.select_contacts(plates_pairs, ['SF','FS']):
                     types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        #specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)
-                            or ('('+str(nb)+','+str(i)+')' == plates_pairs) 
-                            or ('('+str(nb)+','+str(i)+')' in plates_pairs)): 
-                                i_want_a_tenon = True
-                        else: i_want_a_tenon = False
-                        
-                        #for all specified Side-to-Face connection
-                        if (types[j] in 'SFS') and (nb > i) and i_want_a_tenon is True:
-                            
-                            #prerequisite
-                            if tenon_number <= 0 : raise Exception(' Tenon_number must be greater than 0')
-                            if tenon_width <= 0 : raise Exception(' Tenon_width must be greater than 0')
-
-                            #male-female parameters
-                            if types[j] == 'SF':
-                                male = i
-                                female = nb
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
-                            if types[j] == 'FS':
-                                male = nb
-                                female = i
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
-                            plane_male = self.plates[male].top_plane
-                            plane_female = self.plates[female].top_plane
-                            thickness_female = self.plates[female].thickness
-                            top_contour_male = copy.deepcopy(self.plates[male].top_contour)
-                            bottom_contour_male = copy.deepcopy(self.plates[male].bottom_contour)
-                            top_contour_mstart = rs.CurveStartPoint(top_contour_male)
-                            bottom_contour_mstart= rs.CurveStartPoint(bottom_contour_male)
+                    nb = self.contact_ids[i][j]
+
+                    #for all specified Side-to-Face connection
+                    #prerequisite
+                    if tenon_number <= 0 : raise Exception(' Tenon_number must be greater than 0')
+                    if tenon_width <= 0 : raise Exception(' Tenon_width must be greater than 0')
+
+                    #male-female parameters
+                    if types[j] == 'SF':
+                        male = i
+                        female = nb
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
+                    if types[j] == 'FS':
+                        male = nb
+                        female = i
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
+                    plane_male = self.plates[male].top_plane
+                    plane_female = self.plates[female].top_plane
+                    thickness_female = self.plates[female].thickness
+                    top_contour_male = copy.deepcopy(self.plates[male].top_contour)
+                    bottom_contour_male = copy.deepcopy(self.plates[male].bottom_contour)
+                    top_contour_mstart = rs.CurveStartPoint(top_contour_male)
+                    bottom_contour_mstart= rs.CurveStartPoint(bottom_contour_male)
                             
-                            """"""
-                            #joint location
-                            zone = self.contact_zones[i][j]
-                            rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
-                            if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (tenon_width*tenon_number + tenon_spacing*(tenon_number-1) + tenon_shift*2):
-                                excess = (tenon_width*tenon_number + tenon_spacing*(tenon_number-1) + tenon_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
-                                raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
-                            center = rs.CurveAreaCentroid(rectangle)[0]
-                            default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
-                            joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
-
-                            #direction for assembly
-                            if types[j] == 'FS': direction = self.contact_vectors[i][j]
-                            if types[j] == 'SF': direction = -self.contact_vectors[i][j]
-
-                            #default length
-                            if (tenon_length == 'default') or (tenon_length == 0) :
-                                alpha = rs.VectorAngle(direction, plane_female[3])
-                                new_tenon_length = abs(thickness_female / math.cos(math.radians(alpha)))
-                            else: new_tenon_length = tenon_length
+                    """"""
+                    #joint location
+                    zone = self.contact_zones[i][j]
+                    rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
+                    if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (tenon_width*tenon_number + tenon_spacing*(tenon_number-1) + tenon_shift*2):
+                        excess = (tenon_width*tenon_number + tenon_spacing*(tenon_number-1) + tenon_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
+                        raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
+                    center = rs.CurveAreaCentroid(rectangle)[0]
+                    default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
+                    joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
+
+                    #direction for assembly
+                    if types[j] == 'FS': direction = self.contact_vectors[i][j]
+                    if types[j] == 'SF': direction = -self.contact_vectors[i][j]
+
+                    #default length
+                    if (tenon_length == 'default') or (tenon_length == 0) :
+                        alpha = rs.VectorAngle(direction, plane_female[3])
+                        new_tenon_length = abs(thickness_female / math.cos(math.radians(alpha)))
+                    else: new_tenon_length = tenon_length
                             
-                            #tenon location
-                            if tenon_number > 1 :
-                                dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
-                                pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
-                                pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, joint_plane.YAxis * tenon_shift)
-                                location = rs.DivideCurve(shifted_line, tenon_number-1)
-                            else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * tenon_shift)]
-
-                            #solid
-                            for k in range(len(location)):
-
-                                #tenon box
-                                point1 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
-                                point4 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
-                                point2 = rs.CopyObject(point1, direction * new_tenon_length)
-                                point3 = rs.CopyObject(point4, direction * new_tenon_length)
-                                polyline = rs.AddPolyline([point1, point2, point3, point4, point1])
-                                top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
-                                bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
-                                tenon_box = rs.coercebrep(Toolbox.Breps.box_from_2_poly(top_poly, bottom_poly))
-
-                                """
-                                #slice joint
-                                top_plane = rs.coerceplane(self.plates[i].top_plane)
-                                bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
-                                tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_plane, bottom_plane)
-                                """
-                                #append
-                                self.plates[male].joints_positives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
-                                self.plates[female].joints_negatives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
-
-                            # update contour lines
-                            for k in range(len(location)):
-
-                                # male part
-                                point1 = rs.CopyObject(location[k], joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
-                                point2 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
-                                point5 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
-                                point6 = rs.CopyObject(location[k], -joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
-                                point3 = rs.CopyObject(point2, direction * new_tenon_length)
-                                point4 = rs.CopyObject(point5, direction * new_tenon_length)
-                                polyline = rs.AddPolyline([point2, point3, point4, point5])
-                                top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
-                                bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
-                                self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [top_poly], top_contour_mstart)
-                                self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [bottom_poly], bottom_contour_mstart)
-
-                                # female part
-                                mod = 0
-                                if tenon_spacing < 0.0001 : mod = -1
-                                point1 = rs.PolylineVertices(top_poly)[0 + mod]
-                                point2 = rs.PolylineVertices(top_poly)[3 + mod]
-                                point3 = rs.PolylineVertices(bottom_poly)[3 + mod]
-                                point4 = rs.PolylineVertices(bottom_poly)[0 + mod]
-                                point5 = rs.PolylineVertices(top_poly)[1 + mod]
-                                point6 = rs.PolylineVertices(top_poly)[2 + mod]
-                                point7 = rs.PolylineVertices(bottom_poly)[2 + mod]
-                                point8 = rs.PolylineVertices(bottom_poly)[1 + mod]
-                                top_poly = rs.AddPolyline([point1, point2, point3, point4, point1])
-                                bottom_poly = rs.AddPolyline([point5, point6, point7, point8, point5])
-                                self.plates[female].top_holes.append(rs.coercecurve(top_poly))
-                                self.plates[female].bottom_holes.append(rs.coercecurve(bottom_poly))                
+                    #tenon location
+                    if tenon_number > 1 :
+                        dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
+                        pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
+                        pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, joint_plane.YAxis * tenon_shift)
+                        location = rs.DivideCurve(shifted_line, tenon_number-1)
+                    else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * tenon_shift)]
+
+                    #solid
+                    for k in range(len(location)):
+
+                        #tenon box
+                        point1 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
+                        point4 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
+                        point2 = rs.CopyObject(point1, direction * new_tenon_length)
+                        point3 = rs.CopyObject(point4, direction * new_tenon_length)
+                        polyline = rs.AddPolyline([point1, point2, point3, point4, point1])
+                        top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
+                        bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
+                        tenon_box = rs.coercebrep(Toolbox.Breps.box_from_2_poly(top_poly, bottom_poly))
+
+                        """
+                        #slice joint
+                        top_plane = rs.coerceplane(self.plates[i].top_plane)
+                        bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
+                        tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_plane, bottom_plane)
+                        """
+                        #append
+                        self.plates[male].joints_positives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
+                        self.plates[female].joints_negatives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
+
+                    # update contour lines
+                    for k in range(len(location)):
+
+                        # male part
+                        point1 = rs.CopyObject(location[k], joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
+                        point2 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
+                        point5 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
+                        point6 = rs.CopyObject(location[k], -joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
+                        point3 = rs.CopyObject(point2, direction * new_tenon_length)
+                        point4 = rs.CopyObject(point5, direction * new_tenon_length)
+                        polyline = rs.AddPolyline([point2, point3, point4, point5])
+                        top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
+                        bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
+                        self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [top_poly], top_contour_mstart)
+                        self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [bottom_poly], bottom_contour_mstart)
+
+                        # female part
+                        mod = 0
+                        if tenon_spacing < 0.0001 : mod = -1
+                        point1 = rs.PolylineVertices(top_poly)[0 + mod]
+                        point2 = rs.PolylineVertices(top_poly)[3 + mod]
+                        point3 = rs.PolylineVertices(bottom_poly)[3 + mod]
+                        point4 = rs.PolylineVertices(bottom_poly)[0 + mod]
+                        point5 = rs.PolylineVertices(top_poly)[1 + mod]
+                        point6 = rs.PolylineVertices(top_poly)[2 + mod]
+                        point7 = rs.PolylineVertices(bottom_poly)[2 + mod]
+                        point8 = rs.PolylineVertices(bottom_poly)[1 + mod]
+                        top_poly = rs.AddPolyline([point1, point2, point3, point4, point1])
+                        bottom_poly = rs.AddPolyline([point5, point6, point7, point8, point5])
+                        self.plates[female].top_holes.append(rs.coercecurve(top_poly))
+                        self.plates[female].bottom_holes.append(rs.coercecurve(bottom_poly))                
                             
-                            self.log.append('Tenon joint added bewteen plates '+str(i)+ ' and '+ str(nb))
-
-                            # Structural analysis
-
-                            for k in range(len(location)):
-                                pm=rs.CurveClosestPoint(self.FEM_plates[male],location[k])
-                                pf=rs.CurveClosestPoint(self.FEM_plates[female],location[k])
-                                self.FEM_plates[male] = scriptcontext.doc.Objects.Add(self.FEM_plates[male])
-                                self.FEM_plates[female] = scriptcontext.doc.Objects.Add(self.FEM_plates[female])
-                                joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[male],pm), rs.EvaluateCurve(self.FEM_plates[female],pf))
-                                rs.InsertCurveKnot(self.FEM_plates[male],pm)
-                                rs.InsertCurveKnot(self.FEM_plates[female],pf)
-                                self.FEM_plates[male] = rs.coercecurve(self.FEM_plates[male])
-                                self.FEM_plates[female] = rs.coercecurve(self.FEM_plates[female])
-                                self.FEM_joints.append(rs.coercecurve(joint_line))
+                    self.log.append('Tenon joint added bewteen plates '+str(i)+ ' and '+ str(nb))
+
+                    # Structural analysis
+
+                    for k in range(len(location)):
+                        pm=rs.CurveClosestPoint(self.FEM_plates[male],location[k])
+                        pf=rs.CurveClosestPoint(self.FEM_plates[female],location[k])
+                        self.FEM_plates[male] = scriptcontext.doc.Objects.Add(self.FEM_plates[male])
+                        self.FEM_plates[female] = scriptcontext.doc.Objects.Add(self.FEM_plates[female])
+                        joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[male],pm), rs.EvaluateCurve(self.FEM_plates[female],pf))
+                        rs.InsertCurveKnot(self.FEM_plates[male],pm)
+                        rs.InsertCurveKnot(self.FEM_plates[female],pf)
+                        self.FEM_plates[male] = rs.coercecurve(self.FEM_plates[male])
+                        self.FEM_plates[female] = rs.coercecurve(self.FEM_plates[female])
+                        self.FEM_joints.append(rs.coercecurve(joint_line))
                                 
-                            pass
+                    pass
 
             @__skip_nones
             def add_chamfered_tenons(self, 
@@ -1128,219 +1678,202 @@ if yes:
 
                 """Add tenon and mortise on Side-to-Face or Face-to-Side contact zones."""
 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 #conditional loop
-                for i in range(self.count):
+                for (i, j) in self.select_contacts(plates_pairs, ['SF','FS']):
                     types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        #specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)
-                            or ('('+str(nb)+','+str(i)+')' == plates_pairs) 
-                            or ('('+str(nb)+','+str(i)+')' in plates_pairs)): 
-                                i_want_a_tenon = True
-                        else: i_want_a_tenon = False
-                        
-                        #for all specified Side-to-Face connection
-                        if (types[j] in 'SFS') and (nb > i) and i_want_a_tenon is True:
-                            
-                            #prerequisite
-                            if tenon_number <= 0 : raise Exception('tenon_number must be greater than 0')
-                            if tenon_width <= 0 : raise Exception('tenon_width must be greater than 0')
-
-                            #male-female parameters
-                            if types[j] == 'SF':
-                                male = i
-                                female = nb
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
-                            if types[j] == 'FS':
-                                male = nb
-                                female = i
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
-                            plane_male = self.plates[male].top_plane
-                            plane_female = self.plates[female].top_plane
-                            thickness_female = self.plates[female].thickness
-                            top_contour_male = copy.deepcopy(self.plates[male].top_contour)
-                            bottom_contour_male = copy.deepcopy(self.plates[male].bottom_contour)
+                    nb = self.contact_ids[i][j]
+
+                    #for all specified Side-to-Face connection
+                    #prerequisite
+                    if tenon_number <= 0 : raise Exception('tenon_number must be greater than 0')
+                    if tenon_width <= 0 : raise Exception('tenon_width must be greater than 0')
+
+                    #male-female parameters
+                    if types[j] == 'SF':
+                        male = i
+                        female = nb
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
+                    if types[j] == 'FS':
+                        male = nb
+                        female = i
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
+                    plane_male = self.plates[male].top_plane
+                    plane_female = self.plates[female].top_plane
+                    thickness_female = self.plates[female].thickness
+                    top_contour_male = copy.deepcopy(self.plates[male].top_contour)
+                    bottom_contour_male = copy.deepcopy(self.plates[male].bottom_contour)
                             
-                            #joint location
-                            zone = self.contact_zones[i][j]
-                            rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
-                            if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (tenon_width*tenon_number + tenon_spacing*(tenon_number) + tenon_shift*2):
-                                excess = (tenon_width*tenon_number + tenon_spacing*(tenon_number) + tenon_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
-                                raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
-                            center = rs.CurveAreaCentroid(rectangle)[0]
-                            default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
-                            joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
-
-                            #direction of assembly
-                            if types[j] == 'FS': direction = self.contact_vectors[nb]
-                            if types[j] == 'SF': direction = -self.contact_vectors[nb]
+                    #joint location
+                    zone = self.contact_zones[i][j]
+                    rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
+                    if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (tenon_width*tenon_number + tenon_spacing*(tenon_number) + tenon_shift*2):
+                        excess = (tenon_width*tenon_number + tenon_spacing*(tenon_number) + tenon_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
+                        raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
+                    center = rs.CurveAreaCentroid(rectangle)[0]
+                    default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
+                    joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
+
+                    #direction of assembly
+                    if types[j] == 'FS': direction = self.contact_vectors[nb]
+                    if types[j] == 'SF': direction = -self.contact_vectors[nb]
                             
-                            #default length
-                            if (tenon_length == 'default') or (tenon_length == 0) :
-                                alpha = rs.VectorAngle(direction, plane_female[3])
-                                new_tenon_length = abs(thickness_female / math.cos(math.radians(alpha)))
-                            else: new_tenon_length = tenon_length
+                    #default length
+                    if (tenon_length == 'default') or (tenon_length == 0) :
+                        alpha = rs.VectorAngle(direction, plane_female[3])
+                        new_tenon_length = abs(thickness_female / math.cos(math.radians(alpha)))
+                    else: new_tenon_length = tenon_length
                             
-                            #tenon location
-                            if tenon_number > 1 :
-                                dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
-                                pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
-                                pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, joint_plane.YAxis * tenon_shift)
-                                location = rs.DivideCurve(shifted_line, tenon_number-1)
-                            else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * tenon_shift)]
-
-                            #solid
-                            for k in range(len(location)):
-
-                                #tenon box
-                                if side_tolerance >= tenon_width/2 :
-                                    raise Exception(' Side chamfer should be reduced for the joint between plate '+str(i)+' and plate '+str(nb))
-                                point1 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
-                                point4 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
-                                point2 = rs.CopyObject(point1, (direction * new_tenon_length) + (side_tolerance * -joint_plane.YAxis))
-                                point3 = rs.CopyObject(point4, (direction * new_tenon_length) + (side_tolerance * joint_plane.YAxis))
-                                polyline = rs.AddPolyline([point1, point2, point3, point4, point1])
-                                top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
-                                bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
-                                tenon_box = rs.coercebrep(Toolbox.Breps.box_from_2_poly(top_poly, bottom_poly))
+                    #tenon location
+                    if tenon_number > 1 :
+                        dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
+                        pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
+                        pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, joint_plane.YAxis * tenon_shift)
+                        location = rs.DivideCurve(shifted_line, tenon_number-1)
+                    else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * tenon_shift)]
+
+                    #solid
+                    for k in range(len(location)):
+
+                        #tenon box
+                        if side_tolerance >= tenon_width/2 :
+                            raise Exception(' Side chamfer should be reduced for the joint between plate '+str(i)+' and plate '+str(nb))
+                        point1 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
+                        point4 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
+                        point2 = rs.CopyObject(point1, (direction * new_tenon_length) + (side_tolerance * -joint_plane.YAxis))
+                        point3 = rs.CopyObject(point4, (direction * new_tenon_length) + (side_tolerance * joint_plane.YAxis))
+                        polyline = rs.AddPolyline([point1, point2, point3, point4, point1])
+                        top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        top_poly = rs.CopyObject(polyline, rs.VectorCreate(top_point, joint_plane.Origin))
+                        bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        bottom_poly = rs.CopyObject(polyline, rs.VectorCreate(bottom_point, joint_plane.Origin))
+                        tenon_box = rs.coercebrep(Toolbox.Breps.box_from_2_poly(top_poly, bottom_poly))
                                 
-                                #slice joint for top and bottom tolerance
-                                top_pointa = rs.CopyObject(rs.PolylineVertices(top_poly)[0])
-                                bottom_pointa = rs.CopyObject(rs.PolylineVertices(bottom_poly)[0])
-                                top_pointb = rs.CopyObject(rs.PolylineVertices(top_poly)[1])
-                                bottom_pointb = rs.CopyObject(rs.PolylineVertices(bottom_poly)[1])
-                                tb_vector = rs.VectorUnitize(rs.VectorCreate(top_pointb, bottom_pointb))
-                                top_pointc = rs.CopyObject(rs.PolylineVertices(top_poly)[1], -top_tolerance*tb_vector)
-                                bottom_pointc = rs.CopyObject(rs.PolylineVertices(bottom_poly)[1], bottom_tolerance*tb_vector)
-                                top_vector = rs.VectorUnitize(rs.VectorCreate(top_pointc, top_pointa))
-                                bottom_vector = rs.VectorUnitize(rs.VectorCreate(bottom_pointc, bottom_pointa))
-                                top_chamfer_origin = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                top_chamfer_plane = rs.PlaneFromFrame(top_chamfer_origin, top_vector, joint_plane.YAxis)
-                                bottom_chamfer_origin = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                bottom_chamfer_plane = rs.PlaneFromFrame(bottom_chamfer_origin, joint_plane.YAxis,bottom_vector )
-                                if (bottom_tolerance + top_tolerance) > self.plates[male].thickness:
-                                    raise Exception(' Top and/or bottom chamfer should be reduced for the joint between plate '+str(i)+' and plate '+str(nb))
-                                tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_chamfer_plane, bottom_chamfer_plane)
+                        #slice joint for top and bottom tolerance
+                        top_pointa = rs.CopyObject(rs.PolylineVertices(top_poly)[0])
+                        bottom_pointa = rs.CopyObject(rs.PolylineVertices(bottom_poly)[0])
+                        top_pointb = rs.CopyObject(rs.PolylineVertices(top_poly)[1])
+                        bottom_pointb = rs.CopyObject(rs.PolylineVertices(bottom_poly)[1])
+                        tb_vector = rs.VectorUnitize(rs.VectorCreate(top_pointb, bottom_pointb))
+                        top_pointc = rs.CopyObject(rs.PolylineVertices(top_poly)[1], -top_tolerance*tb_vector)
+                        bottom_pointc = rs.CopyObject(rs.PolylineVertices(bottom_poly)[1], bottom_tolerance*tb_vector)
+                        top_vector = rs.VectorUnitize(rs.VectorCreate(top_pointc, top_pointa))
+                        bottom_vector = rs.VectorUnitize(rs.VectorCreate(bottom_pointc, bottom_pointa))
+                        top_chamfer_origin = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        top_chamfer_plane = rs.PlaneFromFrame(top_chamfer_origin, top_vector, joint_plane.YAxis)
+                        bottom_chamfer_origin = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        bottom_chamfer_plane = rs.PlaneFromFrame(bottom_chamfer_origin, joint_plane.YAxis,bottom_vector )
+                        if (bottom_tolerance + top_tolerance) > self.plates[male].thickness:
+                            raise Exception(' Top and/or bottom chamfer should be reduced for the joint between plate '+str(i)+' and plate '+str(nb))
+                        tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_chamfer_plane, bottom_chamfer_plane)
                                 
-                                #slice joint if tenon goes out of plate plane
-                                top_plane = rs.coerceplane(self.plates[i].top_plane)
-                                bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
-                                tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_plane, bottom_plane)
+                        #slice joint if tenon goes out of plate plane
+                        top_plane = rs.coerceplane(self.plates[i].top_plane)
+                        bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
+                        tenon_box = Toolbox.Breps.slice_2_planes(tenon_box, top_plane, bottom_plane)
                                 
-                                #append
-                                self.plates[male].joints_positives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
-                                self.plates[female].joints_negatives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
-
-                            # update contour lines
-                            for k in range(len(location)):
-
-                                # male part
-                                mpoint1 = rs.CopyObject(location[k], joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
-                                mpoint2 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
-                                mpoint5 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
-                                mpoint6 = rs.CopyObject(location[k], -joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
-                                mpoint3 = rs.CopyObject(mpoint2, direction * (new_tenon_length) + (side_tolerance * -joint_plane.YAxis))
-                                mpoint4 = rs.CopyObject(mpoint5, direction * (new_tenon_length) + (side_tolerance * joint_plane.YAxis))
+                        #append
+                        self.plates[male].joints_positives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
+                        self.plates[female].joints_negatives.append(rs.coercebrep(rs.CopyObject(tenon_box)))
+
+                    # update contour lines
+                    for k in range(len(location)):
+
+                        # male part
+                        mpoint1 = rs.CopyObject(location[k], joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
+                        mpoint2 = rs.CopyObject(location[k], joint_plane.YAxis * tenon_width/2)
+                        mpoint5 = rs.CopyObject(location[k], -joint_plane.YAxis * tenon_width/2)
+                        mpoint6 = rs.CopyObject(location[k], -joint_plane.YAxis * (tenon_width/2 + tenon_spacing/2))
+                        mpoint3 = rs.CopyObject(mpoint2, direction * (new_tenon_length) + (side_tolerance * -joint_plane.YAxis))
+                        mpoint4 = rs.CopyObject(mpoint5, direction * (new_tenon_length) + (side_tolerance * joint_plane.YAxis))
                                 
-                                #projection if tenon goes out of plate plane
-                                mpoint3p = Toolbox.Points.project_point_to_plane(mpoint3, self.plates[male].mid_plane, -self.contact_planes[i][j].YAxis)
-                                mpoint4p = Toolbox.Points.project_point_to_plane(mpoint4, self.plates[male].mid_plane, -self.contact_planes[i][j].YAxis)
-
-                                #polyline reconstruction
-                                top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                mpolyline = rs.AddPolyline([mpoint1, mpoint2, mpoint3, mpoint4, mpoint5, mpoint6]) #original poly
-                                mpolylinep = rs.AddPolyline([mpoint1, mpoint2, mpoint3p, mpoint4p, mpoint5, mpoint6]) #reduced poly
-                                mtop_poly = rs.CopyObject(mpolyline, rs.VectorCreate(top_point, joint_plane.Origin))
-                                mtop_polyp = rs.CopyObject(mpolylinep, rs.VectorCreate(top_point, joint_plane.Origin))
-                                mbottom_poly = rs.CopyObject(mpolyline, rs.VectorCreate(bottom_point, joint_plane.Origin))                            
-                                mbottom_polyp = rs.CopyObject(mpolylinep, rs.VectorCreate(bottom_point, joint_plane.Origin))
-
-                                # modifier for null space
-                                # if space is null, tenon polyline is made out of 4 points instead of 6 (indices need to change)    
-                                mod = 0
-                                if tenon_spacing < 0.0001 : mod = -1
-
-                                #change poly with top and bottom chamfer
-                                top_vertices = rs.PolylineVertices(mtop_poly)
-                                top_vertices[2+mod] = rs.CopyObject(top_vertices[2+mod], -top_tolerance*tb_vector)
-                                top_vertices[3+mod] = rs.CopyObject(top_vertices[3+mod], -top_tolerance*tb_vector)
-                                mtop_poly = rs.AddPolyline(top_vertices)
-                                bottom_vertices = rs.PolylineVertices(mbottom_poly)
-                                bottom_vertices[2+mod] = rs.CopyObject(bottom_vertices[2+mod], bottom_tolerance*tb_vector)
-                                bottom_vertices[3+mod] = rs.CopyObject(bottom_vertices[3+mod], bottom_tolerance*tb_vector)
-                                mbottom_poly = rs.AddPolyline(bottom_vertices)
-
-                                #append
-                                self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [mtop_polyp])
-                                self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [mbottom_polyp])
+                        #projection if tenon goes out of plate plane
+                        mpoint3p = Toolbox.Points.project_point_to_plane(mpoint3, self.plates[male].mid_plane, -self.contact_planes[i][j].YAxis)
+                        mpoint4p = Toolbox.Points.project_point_to_plane(mpoint4, self.plates[male].mid_plane, -self.contact_planes[i][j].YAxis)
+
+                        #polyline reconstruction
+                        top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        mpolyline = rs.AddPolyline([mpoint1, mpoint2, mpoint3, mpoint4, mpoint5, mpoint6]) #original poly
+                        mpolylinep = rs.AddPolyline([mpoint1, mpoint2, mpoint3p, mpoint4p, mpoint5, mpoint6]) #reduced poly
+                        mtop_poly = rs.CopyObject(mpolyline, rs.VectorCreate(top_point, joint_plane.Origin))
+                        mtop_polyp = rs.CopyObject(mpolylinep, rs.VectorCreate(top_point, joint_plane.Origin))
+                        mbottom_poly = rs.CopyObject(mpolyline, rs.VectorCreate(bottom_point, joint_plane.Origin))                            
+                        mbottom_polyp = rs.CopyObject(mpolylinep, rs.VectorCreate(bottom_point, joint_plane.Origin))
+
+                        # modifier for null space
+                        # if space is null, tenon polyline is made out of 4 points instead of 6 (indices need to change)    
+                        mod = 0
+                        if tenon_spacing < 0.0001 : mod = -1
+
+                        #change poly with top and bottom chamfer
+                        top_vertices = rs.PolylineVertices(mtop_poly)
+                        top_vertices[2+mod] = rs.CopyObject(top_vertices[2+mod], -top_tolerance*tb_vector)
+                        top_vertices[3+mod] = rs.CopyObject(top_vertices[3+mod], -top_tolerance*tb_vector)
+                        mtop_poly = rs.AddPolyline(top_vertices)
+                        bottom_vertices = rs.PolylineVertices(mbottom_poly)
+                        bottom_vertices[2+mod] = rs.CopyObject(bottom_vertices[2+mod], bottom_tolerance*tb_vector)
+                        bottom_vertices[3+mod] = rs.CopyObject(bottom_vertices[3+mod], bottom_tolerance*tb_vector)
+                        mbottom_poly = rs.AddPolyline(bottom_vertices)
+
+                        #append
+                        self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [mtop_polyp])
+                        self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [mbottom_polyp])
                                 
-                                # female part
-                                fpoint1 = rs.PolylineVertices(mtop_polyp)[1 + mod]
-                                fpoint2 = rs.PolylineVertices(mtop_polyp)[4 + mod]
-                                fpoint3 = rs.PolylineVertices(mbottom_polyp)[4 + mod]
-                                fpoint4 = rs.PolylineVertices(mbottom_polyp)[1 + mod]
-                                midpointtest = Toolbox.Points.average_point([rs.PolylineVertices(mtop_poly)[2 + mod], rs.PolylineVertices(mbottom_poly)[2 + mod]])
-                                d1 = rs.Distance(midpointtest, rs.PolylineVertices(mbottom_polyp)[2 + mod])
-                                d2 = rs.Distance(midpointtest, rs.PolylineVertices(mtop_polyp)[2 + mod])
-                                if d1 < d2 : #checking which points to use for reduced holes
-                                    fpoint5 = rs.PolylineVertices(mtop_poly)[2 + mod]
-                                    fpoint6 = rs.PolylineVertices(mtop_poly)[3 + mod]
-                                    fpoint7 = rs.PolylineVertices(mbottom_polyp)[3 + mod]
-                                    fpoint8 = rs.PolylineVertices(mbottom_polyp)[2 + mod]
-                                else:
-                                    fpoint5 = rs.PolylineVertices(mtop_polyp)[2 + mod]
-                                    fpoint6 = rs.PolylineVertices(mtop_polyp)[3 + mod]
-                                    fpoint7 = rs.PolylineVertices(mbottom_poly)[3 + mod]
-                                    fpoint8 = rs.PolylineVertices(mbottom_poly)[2 + mod]
-                                ftop_poly = rs.AddPolyline([fpoint1, fpoint2, fpoint3, fpoint4, fpoint1])
-                                fbottom_poly = rs.AddPolyline([fpoint5, fpoint6, fpoint7, fpoint8, fpoint5])
-                                self.plates[female].top_holes.append(rs.coercecurve(ftop_poly))
-                                self.plates[female].bottom_holes.append(rs.coercecurve(fbottom_poly))                
-
-                                #holes lines for chamfer on tenon due to out of plane
-                                if round(d1,6) != round(d2,6) :
-                                    if d1 < d2 :
-                                        cpoly = mtop_poly
-                                        cplane = self.plates[male].top_plane
-                                    else : 
-                                        cpoly = mbottom_poly
-                                        cplane = self.plates[male].bottom_plane
-                                    cpoint1 = rs.PolylineVertices(cpoly)[1 + mod]
-                                    cpoint2 = rs.PolylineVertices(cpoly)[2 + mod]
-                                    cpoint3 = rs.PolylineVertices(cpoly)[3 + mod]
-                                    cpoint4 = rs.PolylineVertices(cpoly)[4 + mod]     
-                                    cpoly_down = rs.AddPolyline([cpoint1, cpoint2, cpoint3, cpoint4, cpoint1])
-                                    vec = rs.VectorRotate(direction, -90, joint_plane.YAxis)
-                                    vecp = rs.VectorCreate(Toolbox.Points.project_point_to_plane(cpoint2, cplane, vec), cpoint2)
-                                    cpoly_up = rs.CopyObject(cpoly_down, vecp)
-                                    self.plates[male].top_holes.append(rs.coercecurve(cpoly_up))
-                                    self.plates[male].bottom_holes.append(rs.coercecurve(cpoly_down))
-
-                                """
-                                #holes lines for chamfer on tenon due to out of plane
-                                if top_tolerance > 0: 
-                                    point1 = 
-                                    point2 = 
-                                    point3 = rs.PlaneClosestPoint(top_chamfer_plane, )
-                                    point4 = rs.PlaneClosestPoint(top_chamfer_plane, )
-                                """
-                            self.log.append('Tenon joint added bewteen plates '+str(i)+ ' and '+ str(nb))
-
-                            pass
+                        # female part
+                        fpoint1 = rs.PolylineVertices(mtop_polyp)[1 + mod]
+                        fpoint2 = rs.PolylineVertices(mtop_polyp)[4 + mod]
+                        fpoint3 = rs.PolylineVertices(mbottom_polyp)[4 + mod]
+                        fpoint4 = rs.PolylineVertices(mbottom_polyp)[1 + mod]
+                        midpointtest = Toolbox.Points.average_point([rs.PolylineVertices(mtop_poly)[2 + mod], rs.PolylineVertices(mbottom_poly)[2 + mod]])
+                        d1 = rs.Distance(midpointtest, rs.PolylineVertices(mbottom_polyp)[2 + mod])
+                        d2 = rs.Distance(midpointtest, rs.PolylineVertices(mtop_polyp)[2 + mod])
+                        if d1 < d2 : #checking which points to use for reduced holes
+                            fpoint5 = rs.PolylineVertices(mtop_poly)[2 + mod]
+                            fpoint6 = rs.PolylineVertices(mtop_poly)[3 + mod]
+                            fpoint7 = rs.PolylineVertices(mbottom_polyp)[3 + mod]
+                            fpoint8 = rs.PolylineVertices(mbottom_polyp)[2 + mod]
+                        else:
+                            fpoint5 = rs.PolylineVertices(mtop_polyp)[2 + mod]
+                            fpoint6 = rs.PolylineVertices(mtop_polyp)[3 + mod]
+                            fpoint7 = rs.PolylineVertices(mbottom_poly)[3 + mod]
+                            fpoint8 = rs.PolylineVertices(mbottom_poly)[2 + mod]
+                        ftop_poly = rs.AddPolyline([fpoint1, fpoint2, fpoint3, fpoint4, fpoint1])
+                        fbottom_poly = rs.AddPolyline([fpoint5, fpoint6, fpoint7, fpoint8, fpoint5])
+                        self.plates[female].top_holes.append(rs.coercecurve(ftop_poly))
+                        self.plates[female].bottom_holes.append(rs.coercecurve(fbottom_poly))                
+
+                        #holes lines for chamfer on tenon due to out of plane
+                        if round(d1,6) != round(d2,6) :
+                            if d1 < d2 :
+                                cpoly = mtop_poly
+                                cplane = self.plates[male].top_plane
+                            else : 
+                                cpoly = mbottom_poly
+                                cplane = self.plates[male].bottom_plane
+                            cpoint1 = rs.PolylineVertices(cpoly)[1 + mod]
+                            cpoint2 = rs.PolylineVertices(cpoly)[2 + mod]
+                            cpoint3 = rs.PolylineVertices(cpoly)[3 + mod]
+                            cpoint4 = rs.PolylineVertices(cpoly)[4 + mod]     
+                            cpoly_down = rs.AddPolyline([cpoint1, cpoint2, cpoint3, cpoint4, cpoint1])
+                            vec = rs.VectorRotate(direction, -90, joint_plane.YAxis)
+                            vecp = rs.VectorCreate(Toolbox.Points.project_point_to_plane(cpoint2, cplane, vec), cpoint2)
+                            cpoly_up = rs.CopyObject(cpoly_down, vecp)
+                            self.plates[male].top_holes.append(rs.coercecurve(cpoly_up))
+                            self.plates[male].bottom_holes.append(rs.coercecurve(cpoly_down))
+
+                        """
+                        #holes lines for chamfer on tenon due to out of plane
+                        if top_tolerance > 0: 
+                            point1 = 
+                            point2 = 
+                            point3 = rs.PlaneClosestPoint(top_chamfer_plane, )
+                            point4 = rs.PlaneClosestPoint(top_chamfer_plane, )
+                        """
+                    self.log.append('Tenon joint added bewteen plates '+str(i)+ ' and '+ str(nb))
+
+                    pass
 
             @__skip_nones                   
             def add_sunrise(self,
@@ -1354,143 +1887,127 @@ if yes:
                 custom_insertion=None):
                 """ Add a sunrise dovetail on Edgewise contact zones."""
                                 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 #conditional loop
-                for i in range(self.count):
+                for (i, j) in self.select_contacts(plates_pairs, ['SE','ES']):
                     types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
+                    nb = self.contact_ids[i][j]
 
-                        # Specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)
-                            or ('('+str(nb)+','+str(i)+')' == plates_pairs) 
-                            or ('('+str(nb)+','+str(i)+')' in plates_pairs)): 
-                                i_want_a_tenon = True
-                        else: i_want_a_tenon = False
-
-                        # For all specified Edgewise connection
-                        if (types[j] in 'SES') and (nb > i) and i_want_a_tenon is True:
+                    # For all specified Edgewise connection
                                                         
-                            # Prerequisite
-                            if tenon_number < 1 : raise Exception('tenon_number must be greater than 1')
-                            if tenon_width <= 0 : raise Exception('tenon_width must be greater than 0')
-                            if tenon_spacing <= 0 : raise Exception('tenon_spacing must be greater than 0')
-
-                            #deal with male/female
-                            nb = self.contact_ids[i][j]
-                            if types[j] == 'SE':
-                                new_spread_angle=-spread_angle
-                                male, female = i, nb
-                            else:
-                                male, female = nb, i
-                                new_spread_angle=spread_angle
+                    # Prerequisite
+                    if tenon_number < 1 : raise Exception('tenon_number must be greater than 1')
+                    if tenon_width <= 0 : raise Exception('tenon_width must be greater than 0')
+                    if tenon_spacing <= 0 : raise Exception('tenon_spacing must be greater than 0')
+
+                    #deal with male/female
+                    nb = self.contact_ids[i][j]
+                    if types[j] == 'SE':
+                        new_spread_angle=-spread_angle
+                        male, female = i, nb
+                    else:
+                        male, female = nb, i
+                        new_spread_angle=spread_angle
 
-                            #compute plane angles
-                            angles = []
-                            if parallel_tenons is True:
-                                if tenon_number == 1: angles = [0,0]
-                                else:
-                                    for k in range(tenon_number):
-                                        angles.append(- new_spread_angle + 2*k*new_spread_angle/(tenon_number-1))
-                                        angles.append(- new_spread_angle + 2*k*new_spread_angle/(tenon_number-1))
-                            else:
-                                for k in range(2*tenon_number):
-                                    angles.append(- new_spread_angle + 2*k*(new_spread_angle/(2*tenon_number-1)))
-
-                            #tenon locations
-                            cp = self.contact_planes[i][j]
-                            if tenon_number > 1 :
-                                dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
-                                pointA = rs.CopyObject(cp.Origin, cp.XAxis * dist)
-                                pointB = rs.CopyObject(cp.Origin, -cp.XAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, cp.XAxis * tenon_shift)
-                                location = rs.DivideCurve(shifted_line, tenon_number-1)
-                            else: location = [rs.CopyObject(cp.Origin, cp.XAxis * tenon_shift)]
-
-                            #get insertion vector
-                            vec = self.contact_vectors[i][j]
-                            if custom_insertion != None: vec=custom_insertion
-
-                            #get and reorder top/bottom
-                            tpf = self.plates[female].top_plane
-                            bpf = self.plates[female].bottom_plane
-                            if rs.Distance(tpf.Origin, cp.Origin) < rs.Distance(bpf.Origin, cp.Origin):
-                                self.switch_top_bottom(plates=[female])
-                            tpm = self.plates[male].top_plane
-                            bpm = self.plates[male].bottom_plane
-                            tcf = self.plates[female].top_center
-                            bcf = self.plates[female].bottom_center
-                            if rs.Distance(tpm.Origin, bcf) < rs.Distance(bpm.Origin, bcf):
-                                self.switch_top_bottom(plates=[male])
-                                tpm = self.plates[male].top_plane
-                                bpm = self.plates[male].bottom_plane
-
-                            #create tenons
-                            m_poly_top=[]
-                            m_poly_bottom=[]
-                            f_poly_top=[]
-                            f_poly_bottom=[]
+                    #compute plane angles
+                    angles = []
+                    if parallel_tenons is True:
+                        if tenon_number == 1: angles = [0,0]
+                        else:
                             for k in range(tenon_number):
-                                #plane_location
-                                rot_vec_1 = rs.VectorRotate(cp.YAxis, angles[2*k], cp.ZAxis)
-                                rot_vec_2 = rs.VectorRotate(cp.YAxis, angles[2*k+1], cp.ZAxis)
-                                loc1= rs.CopyObject(location[k], cp.XAxis * tenon_width/2)
-                                loc2= rs.CopyObject(location[k], cp.XAxis * -tenon_width/2)                              
-                                pl1 = rs.PlaneFromFrame(loc1,vec,rot_vec_1)
-                                pl2 = rs.PlaneFromFrame(loc2,vec,rot_vec_2)
-                                if rs.IsVectorPerpendicularTo(cp.ZAxis, vec) is True:
-                                    pl1 = rs.PlaneFromFrame(loc1,vec,cp.ZAxis)
-                                    pl2 = rs.PlaneFromFrame(loc2,vec,cp.ZAxis)
-
-                                #solid creation
-                                solid = rs.coercebrep(Toolbox.Breps.box_from_6_planes([pl1,pl2],[tpm,bpm],[tpf,bpf]))
-                                if solid.SolidOrientation == rg.BrepSolidOrientation.Inward: rg.Brep.Flip(solid) 
-                                self.plates[male].joints_positives.append(copy.deepcopy(solid))
-                                self.plates[female].joints_negatives.append(copy.deepcopy(solid))
-                                #contour creation
-                                m_poly_top.append(Toolbox.Planes.three_planes_intersection(bpf,tpm,pl1))
-                                m_poly_top.append(Toolbox.Planes.three_planes_intersection(tpf,tpm,pl1))
-                                m_poly_top.append(Toolbox.Planes.three_planes_intersection(tpf,tpm,pl2))
-                                m_poly_top.append(Toolbox.Planes.three_planes_intersection(bpf,tpm,pl2))
-                                m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpf,bpm,pl1))
-                                m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpf,bpm,pl1))
-                                m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpf,bpm,pl2))
-                                m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpf,bpm,pl2))
-                                f_poly_top.append(Toolbox.Planes.three_planes_intersection(tpm,tpf,pl1))
-                                f_poly_top.append(Toolbox.Planes.three_planes_intersection(bpm,tpf,pl1))
-                                f_poly_top.append(Toolbox.Planes.three_planes_intersection(bpm,tpf,pl2))
-                                f_poly_top.append(Toolbox.Planes.three_planes_intersection(tpm,tpf,pl2))
-                                f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpm,bpf,pl1))
-                                f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpm,bpf,pl1))
-                                f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpm,bpf,pl2))
-                                f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpm,bpf,pl2))
-
-
-                            self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [rs.AddPolyline(m_poly_top)])
-                            self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [rs.AddPolyline(m_poly_bottom)])
-                            self.plates[female].top_contour = Toolbox.Curves.insert_curves(self.plates[female].top_contour, [rs.AddPolyline(f_poly_top)])
-                            self.plates[female].bottom_contour = Toolbox.Curves.insert_curves(self.plates[female].bottom_contour, [rs.AddPolyline(f_poly_bottom)])
+                                angles.append(- new_spread_angle + 2*k*new_spread_angle/(tenon_number-1))
+                                angles.append(- new_spread_angle + 2*k*new_spread_angle/(tenon_number-1))
+                    else:
+                        for k in range(2*tenon_number):
+                            angles.append(- new_spread_angle + 2*k*(new_spread_angle/(2*tenon_number-1)))
+
+                    #tenon locations
+                    cp = self.contact_planes[i][j]
+                    if tenon_number > 1 :
+                        dist = (float(tenon_number-1) /2) * (tenon_width + tenon_spacing)
+                        pointA = rs.CopyObject(cp.Origin, cp.XAxis * dist)
+                        pointB = rs.CopyObject(cp.Origin, -cp.XAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, cp.XAxis * tenon_shift)
+                        location = rs.DivideCurve(shifted_line, tenon_number-1)
+                    else: location = [rs.CopyObject(cp.Origin, cp.XAxis * tenon_shift)]
+
+                    #get insertion vector
+                    vec = self.contact_vectors[i][j]
+                    if custom_insertion != None: vec=custom_insertion
+
+                    #get and reorder top/bottom
+                    tpf = self.plates[female].top_plane
+                    bpf = self.plates[female].bottom_plane
+                    if rs.Distance(tpf.Origin, cp.Origin) < rs.Distance(bpf.Origin, cp.Origin):
+                        self.switch_top_bottom(plates=[female])
+                    tpm = self.plates[male].top_plane
+                    bpm = self.plates[male].bottom_plane
+                    tcf = self.plates[female].top_center
+                    bcf = self.plates[female].bottom_center
+                    if rs.Distance(tpm.Origin, bcf) < rs.Distance(bpm.Origin, bcf):
+                        self.switch_top_bottom(plates=[male])
+                        tpm = self.plates[male].top_plane
+                        bpm = self.plates[male].bottom_plane
+
+                    #create tenons
+                    m_poly_top=[]
+                    m_poly_bottom=[]
+                    f_poly_top=[]
+                    f_poly_bottom=[]
+                    for k in range(tenon_number):
+                        #plane_location
+                        rot_vec_1 = rs.VectorRotate(cp.YAxis, angles[2*k], cp.ZAxis)
+                        rot_vec_2 = rs.VectorRotate(cp.YAxis, angles[2*k+1], cp.ZAxis)
+                        loc1= rs.CopyObject(location[k], cp.XAxis * tenon_width/2)
+                        loc2= rs.CopyObject(location[k], cp.XAxis * -tenon_width/2)                              
+                        pl1 = rs.PlaneFromFrame(loc1,vec,rot_vec_1)
+                        pl2 = rs.PlaneFromFrame(loc2,vec,rot_vec_2)
+                        if rs.IsVectorPerpendicularTo(cp.ZAxis, vec) is True:
+                            pl1 = rs.PlaneFromFrame(loc1,vec,cp.ZAxis)
+                            pl2 = rs.PlaneFromFrame(loc2,vec,cp.ZAxis)
+
+                        #solid creation
+                        solid = rs.coercebrep(Toolbox.Breps.box_from_6_planes([pl1,pl2],[tpm,bpm],[tpf,bpf]))
+                        if solid.SolidOrientation == rg.BrepSolidOrientation.Inward: rg.Brep.Flip(solid) 
+                        self.plates[male].joints_positives.append(copy.deepcopy(solid))
+                        self.plates[female].joints_negatives.append(copy.deepcopy(solid))
+                        #contour creation
+                        m_poly_top.append(Toolbox.Planes.three_planes_intersection(bpf,tpm,pl1))
+                        m_poly_top.append(Toolbox.Planes.three_planes_intersection(tpf,tpm,pl1))
+                        m_poly_top.append(Toolbox.Planes.three_planes_intersection(tpf,tpm,pl2))
+                        m_poly_top.append(Toolbox.Planes.three_planes_intersection(bpf,tpm,pl2))
+                        m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpf,bpm,pl1))
+                        m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpf,bpm,pl1))
+                        m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpf,bpm,pl2))
+                        m_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpf,bpm,pl2))
+                        f_poly_top.append(Toolbox.Planes.three_planes_intersection(tpm,tpf,pl1))
+                        f_poly_top.append(Toolbox.Planes.three_planes_intersection(bpm,tpf,pl1))
+                        f_poly_top.append(Toolbox.Planes.three_planes_intersection(bpm,tpf,pl2))
+                        f_poly_top.append(Toolbox.Planes.three_planes_intersection(tpm,tpf,pl2))
+                        f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpm,bpf,pl1))
+                        f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpm,bpf,pl1))
+                        f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(bpm,bpf,pl2))
+                        f_poly_bottom.append(Toolbox.Planes.three_planes_intersection(tpm,bpf,pl2))
+
+
+                    self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [rs.AddPolyline(m_poly_top)])
+                    self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [rs.AddPolyline(m_poly_bottom)])
+                    self.plates[female].top_contour = Toolbox.Curves.insert_curves(self.plates[female].top_contour, [rs.AddPolyline(f_poly_top)])
+                    self.plates[female].bottom_contour = Toolbox.Curves.insert_curves(self.plates[female].bottom_contour, [rs.AddPolyline(f_poly_bottom)])
                             
-                            # Structural analysis
-
-                            for k in range(len(location)):
-                                pm=rs.CurveClosestPoint(self.FEM_plates[male],location[k])
-                                pf=rs.CurveClosestPoint(self.FEM_plates[female],location[k])
-                                self.FEM_plates[male] = scriptcontext.doc.Objects.Add(self.FEM_plates[male])
-                                self.FEM_plates[female] = scriptcontext.doc.Objects.Add(self.FEM_plates[female])
-                                joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[male],pm), rs.EvaluateCurve(self.FEM_plates[female],pf))
-                                rs.InsertCurveKnot(self.FEM_plates[male],pm)
-                                rs.InsertCurveKnot(self.FEM_plates[female],pf)
-                                self.FEM_plates[male] = rs.coercecurve(self.FEM_plates[male])
-                                self.FEM_plates[female] = rs.coercecurve(self.FEM_plates[female])
-                                self.FEM_joints.append(rs.coercecurve(joint_line))
+                    # Structural analysis
+
+                    for k in range(len(location)):
+                        pm=rs.CurveClosestPoint(self.FEM_plates[male],location[k])
+                        pf=rs.CurveClosestPoint(self.FEM_plates[female],location[k])
+                        self.FEM_plates[male] = scriptcontext.doc.Objects.Add(self.FEM_plates[male])
+                        self.FEM_plates[female] = scriptcontext.doc.Objects.Add(self.FEM_plates[female])
+                        joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[male],pm), rs.EvaluateCurve(self.FEM_plates[female],pf))
+                        rs.InsertCurveKnot(self.FEM_plates[male],pm)
+                        rs.InsertCurveKnot(self.FEM_plates[female],pf)
+                        self.FEM_plates[male] = rs.coercecurve(self.FEM_plates[male])
+                        self.FEM_plates[female] = rs.coercecurve(self.FEM_plates[female])
+                        self.FEM_joints.append(rs.coercecurve(joint_line))
                             
             @__skip_nones
             def add_custom_FS_joints(self, 
@@ -1537,137 +2054,122 @@ if yes:
                     tile_positives = tile_zones[1]
                     tile_negatives = tile_zones[0]
 
-                # Cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 # Conditional loop for joint generation
-                for i in range(self.count):
+                for (i, j) in self.select_contacts(plates_pairs, ['SF','FS'], symmetric=False):
                     types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        # Specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)): 
-                                i_want_a_joint = True
-                        else: i_want_a_joint = False
-                        
-                        # For all specified Side-to-Face connection
-                        if (types[j] in 'SFS') and (nb > i) and i_want_a_joint is True:
-                            
-                            # Prerequisite
-                            if joint_number <= 0 : raise Exception('joint_number must be greater than 0')
-                            if joint_width <= 0 : raise Exception('joint_width must be greater than 0')
-
-                            # Male-female parameters
-                            if types[j] == 'SF':
-                                male = i
-                                female = nb
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
-                            if types[j] == 'FS':
-                                male = nb
-                                female = i
-                                plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
-                            plane_male = self.plates[male].top_plane
-                            plane_female = self.plates[female].top_plane
-                            thickness_female = self.plates[female].thickness
-                            top_contour_male = self.plates[male].top_contour
-                            bottom_contour_male = self.plates[male].bottom_contour
+                    nb = self.contact_ids[i][j]
+
+                    # For all specified Side-to-Face connection
+                    # Prerequisite
+                    if joint_number <= 0 : raise Exception('joint_number must be greater than 0')
+                    if joint_width <= 0 : raise Exception('joint_width must be greater than 0')
+
+                    # Male-female parameters
+                    if types[j] == 'SF':
+                        male = i
+                        female = nb
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].XAxis, self.contact_planes[i][j].YAxis)
+                    if types[j] == 'FS':
+                        male = nb
+                        female = i
+                        plane_zone = rs.PlaneFromFrame(self.contact_planes[i][j].Origin, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
+                    plane_male = self.plates[male].top_plane
+                    plane_female = self.plates[female].top_plane
+                    thickness_female = self.plates[female].thickness
+                    top_contour_male = self.plates[male].top_contour
+                    bottom_contour_male = self.plates[male].bottom_contour
                             
-                            # Joint location
-                            zone = self.contact_zones[i][j]
-                            rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
-                            if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (joint_width*joint_number + joint_spacing*(joint_number) + joint_shift*2):
-                                excess = (joint_width*joint_number + joint_spacing*(joint_number) + joint_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
-                                raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
-                            center = rs.CurveAreaCentroid(rectangle)[0]
-                            default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
-                            joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
-                            if joint_number > 1 :
-                                dist = (float(joint_number-1) /2) * (joint_width + joint_spacing)
-                                pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
-                                pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, joint_plane.YAxis * joint_shift)
-                                location = rs.DivideCurve(shifted_line, joint_number-1)
-                            else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * joint_shift)]
+                    # Joint location
+                    zone = self.contact_zones[i][j]
+                    rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
+                    if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (joint_width*joint_number + joint_spacing*(joint_number) + joint_shift*2):
+                        excess = (joint_width*joint_number + joint_spacing*(joint_number) + joint_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
+                        raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
+                    center = rs.CurveAreaCentroid(rectangle)[0]
+                    default_direction = Toolbox.Vectors.project_vector_to_plane(plane_zone.ZAxis, plane_male)
+                    joint_plane = rs.PlaneFromNormal(center, plane_male.ZAxis, default_direction)
+                    if joint_number > 1 :
+                        dist = (float(joint_number-1) /2) * (joint_width + joint_spacing)
+                        pointA = rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * dist)
+                        pointB = rs.CopyObject(joint_plane.Origin, -joint_plane.YAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, joint_plane.YAxis * joint_shift)
+                        location = rs.DivideCurve(shifted_line, joint_number-1)
+                    else: location = [rs.CopyObject(joint_plane.Origin, joint_plane.YAxis * joint_shift)]
                             
-                            # Solid
-                            for k in range(len(location)):
-
-                                # Get transformation matrix for top and bottom poly (male)
-                                top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
-                                bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
-                                top_loc = rs.CopyObject(location[k], rs.VectorCreate(top_point, joint_plane.Origin))
-                                bottom_loc = rs.CopyObject(location[k], rs.VectorCreate(bottom_point, joint_plane.Origin))
-                                top_target_plane = rs.PlaneFromFrame(top_loc, joint_plane.XAxis, joint_plane.YAxis)
-                                bottom_target_plane = rs.PlaneFromFrame(bottom_loc, joint_plane.XAxis, joint_plane.YAxis)
-                                top_matrix = rg.Transform.PlaneToPlane(tile_plane, top_target_plane)
-                                bottom_matrix = rg.Transform.PlaneToPlane(tile_plane, bottom_target_plane)
-
-                                # Orient joint positives and negatives on male plate
-                                if len(tile_positives) != 0:
-                                    for l in range(len(tile_positives)):
-                                        top_poly = rs.coercegeometry(rs.TransformObject(tile_positives[l], top_matrix, True))
-                                        bottom_poly = rs.coercegeometry(rs.TransformObject(tile_positives[l], bottom_matrix, True))
-                                        brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
-                                        self.plates[male].joints_positives.append(brep)
-                                if len(tile_negatives) != 0:
-                                    for l in range(len(tile_negatives)):
-                                        top_poly = rs.coercegeometry(rs.TransformObject(tile_negatives[l], top_matrix, True))
-                                        bottom_poly = rs.coercegeometry(rs.TransformObject(tile_negatives[l], bottom_matrix, True))
-                                        brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
-                                        self.plates[male].joints_negatives.append(brep)
+                    # Solid
+                    for k in range(len(location)):
+
+                        # Get transformation matrix for top and bottom poly (male)
+                        top_point = Toolbox.Curves.curve_closest_point(top_contour_male, joint_plane.Origin)
+                        bottom_point = Toolbox.Curves.curve_closest_point(bottom_contour_male, joint_plane.Origin)
+                        top_loc = rs.CopyObject(location[k], rs.VectorCreate(top_point, joint_plane.Origin))
+                        bottom_loc = rs.CopyObject(location[k], rs.VectorCreate(bottom_point, joint_plane.Origin))
+                        top_target_plane = rs.PlaneFromFrame(top_loc, joint_plane.XAxis, joint_plane.YAxis)
+                        bottom_target_plane = rs.PlaneFromFrame(bottom_loc, joint_plane.XAxis, joint_plane.YAxis)
+                        top_matrix = rg.Transform.PlaneToPlane(tile_plane, top_target_plane)
+                        bottom_matrix = rg.Transform.PlaneToPlane(tile_plane, bottom_target_plane)
+
+                        # Orient joint positives and negatives on male plate
+                        if len(tile_positives) != 0:
+                            for l in range(len(tile_positives)):
+                                top_poly = rs.coercegeometry(rs.TransformObject(tile_positives[l], top_matrix, True))
+                                bottom_poly = rs.coercegeometry(rs.TransformObject(tile_positives[l], bottom_matrix, True))
+                                brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
+                                self.plates[male].joints_positives.append(brep)
+                        if len(tile_negatives) != 0:
+                            for l in range(len(tile_negatives)):
+                                top_poly = rs.coercegeometry(rs.TransformObject(tile_negatives[l], top_matrix, True))
+                                bottom_poly = rs.coercegeometry(rs.TransformObject(tile_negatives[l], bottom_matrix, True))
+                                brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
+                                self.plates[male].joints_negatives.append(brep)
                                 
-                                # Insert tile in male contour
-                                top_poly = rs.coercegeometry(rs.TransformObject(tile, top_matrix, True))
-                                bottom_poly = rs.coercegeometry(rs.TransformObject(tile, bottom_matrix, True))
-                                self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [top_poly])
-                                self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [bottom_poly])
-
-                                # Orient female part
-                                if len(hole_sides) == 2:
-                                    link_1 = rs.AddLine(rs.CurveStartPoint(hole_sides[0]), rs.CurveStartPoint(hole_sides[1]))
-                                    link_2 = rs.AddLine(rs.CurveEndPoint(hole_sides[0]), rs.CurveEndPoint(hole_sides[1]))
-                                    female_tile = rs.JoinCurves(hole_sides + [link_1, link_2])[0]
-                                    top_poly = rs.coercegeometry(rs.TransformObject(female_tile, top_matrix, True))
-                                    bottom_poly = rs.coercegeometry(rs.TransformObject(female_tile, bottom_matrix, True))
-                                    brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
-                                    self.plates[female].joints_negatives.append(brep)
-
-                                    # Get holes from female drawing
-                                    vertices_1 = rs.PolylineVertices(hole_sides[0])
-                                    vertices_2 = rs.PolylineVertices(hole_sides[1])
-                                    if len(vertices_1) == len(vertices_2):
-                                        for l in range(len(vertices_1)-1):
-                                            line_1 = rs.AddLine(vertices_1[l], vertices_2[l])
-                                            line_2 = rs.AddLine(vertices_1[l+1], vertices_2[l+1])
-                                            top_line_1 = rs.coercegeometry(rs.TransformObject(line_1, top_matrix, True))
-                                            bottom_line_1 = rs.coercegeometry(rs.TransformObject(line_1, bottom_matrix, True))
-                                            top_line_2 = rs.coercegeometry(rs.TransformObject(line_2, top_matrix, True))
-                                            bottom_line_2 = rs.coercegeometry(rs.TransformObject(line_2, bottom_matrix, True))
-                                            link = rs.AddLine(rs.CurveStartPoint(top_line_1), rs.CurveStartPoint(bottom_line_1))
-                                            pol_1 = rs.AddPolyline([rs.CurveStartPoint(top_line_1), rs.CurveEndPoint(top_line_1), rs.CurveEndPoint(bottom_line_1), rs.CurveStartPoint(bottom_line_1), rs.CurveStartPoint(top_line_1)])
-                                            pol_2 = rs.AddPolyline([rs.CurveStartPoint(top_line_2), rs.CurveEndPoint(top_line_2), rs.CurveEndPoint(bottom_line_2), rs.CurveStartPoint(bottom_line_2), rs.CurveStartPoint(top_line_2)])
-                                            # discard holes contour which are co-planar
-                                            if Toolbox.Planes.is_plane_in_plane(rs.CurvePlane(pol_1), rs.CurvePlane(pol_2)) == False:
-                                                # check the closest between top and bottom faces
-                                                d1 = rs.Distance(rs.CurvePlane(pol_1).Origin, self.plates[female].top_center)
-                                                d2 = rs.Distance(rs.CurvePlane(pol_2).Origin, self.plates[female].top_center)
-                                                if d1 < d2:
-                                                    self.plates[female].top_holes.append(rs.coercecurve(pol_1))
-                                                    self.plates[female].bottom_holes.append(rs.coercecurve(pol_2))
-                                                else:
-                                                    self.plates[female].top_holes.append(rs.coercecurve(pol_2))
-                                                    self.plates[female].bottom_holes.append(rs.coercecurve(pol_1))
-                                    else: raise Exception('holes_sides should have the same number of vertices')
-
-                            self.log.append('Custom joint added bewteen plates '+str(i)+ ' and '+ str(nb))
-
-                            pass
+                        # Insert tile in male contour
+                        top_poly = rs.coercegeometry(rs.TransformObject(tile, top_matrix, True))
+                        bottom_poly = rs.coercegeometry(rs.TransformObject(tile, bottom_matrix, True))
+                        self.plates[male].top_contour = Toolbox.Curves.insert_curves(self.plates[male].top_contour, [top_poly])
+                        self.plates[male].bottom_contour = Toolbox.Curves.insert_curves(self.plates[male].bottom_contour, [bottom_poly])
+
+                        # Orient female part
+                        if len(hole_sides) == 2:
+                            link_1 = rs.AddLine(rs.CurveStartPoint(hole_sides[0]), rs.CurveStartPoint(hole_sides[1]))
+                            link_2 = rs.AddLine(rs.CurveEndPoint(hole_sides[0]), rs.CurveEndPoint(hole_sides[1]))
+                            female_tile = rs.JoinCurves(hole_sides + [link_1, link_2])[0]
+                            top_poly = rs.coercegeometry(rs.TransformObject(female_tile, top_matrix, True))
+                            bottom_poly = rs.coercegeometry(rs.TransformObject(female_tile, bottom_matrix, True))
+                            brep = Toolbox.Breps.brep_from_2_poly(top_poly, bottom_poly)
+                            self.plates[female].joints_negatives.append(brep)
+
+                            # Get holes from female drawing
+                            vertices_1 = rs.PolylineVertices(hole_sides[0])
+                            vertices_2 = rs.PolylineVertices(hole_sides[1])
+                            if len(vertices_1) == len(vertices_2):
+                                for l in range(len(vertices_1)-1):
+                                    line_1 = rs.AddLine(vertices_1[l], vertices_2[l])
+                                    line_2 = rs.AddLine(vertices_1[l+1], vertices_2[l+1])
+                                    top_line_1 = rs.coercegeometry(rs.TransformObject(line_1, top_matrix, True))
+                                    bottom_line_1 = rs.coercegeometry(rs.TransformObject(line_1, bottom_matrix, True))
+                                    top_line_2 = rs.coercegeometry(rs.TransformObject(line_2, top_matrix, True))
+                                    bottom_line_2 = rs.coercegeometry(rs.TransformObject(line_2, bottom_matrix, True))
+                                    link = rs.AddLine(rs.CurveStartPoint(top_line_1), rs.CurveStartPoint(bottom_line_1))
+                                    pol_1 = rs.AddPolyline([rs.CurveStartPoint(top_line_1), rs.CurveEndPoint(top_line_1), rs.CurveEndPoint(bottom_line_1), rs.CurveStartPoint(bottom_line_1), rs.CurveStartPoint(top_line_1)])
+                                    pol_2 = rs.AddPolyline([rs.CurveStartPoint(top_line_2), rs.CurveEndPoint(top_line_2), rs.CurveEndPoint(bottom_line_2), rs.CurveStartPoint(bottom_line_2), rs.CurveStartPoint(top_line_2)])
+                                    # discard holes contour which are co-planar
+                                    if Toolbox.Planes.is_plane_in_plane(rs.CurvePlane(pol_1), rs.CurvePlane(pol_2)) == False:
+                                        # check the closest between top and bottom faces
+                                        d1 = rs.Distance(rs.CurvePlane(pol_1).Origin, self.plates[female].top_center)
+                                        d2 = rs.Distance(rs.CurvePlane(pol_2).Origin, self.plates[female].top_center)
+                                        if d1 < d2:
+                                            self.plates[female].top_holes.append(rs.coercecurve(pol_1))
+                                            self.plates[female].bottom_holes.append(rs.coercecurve(pol_2))
+                                        else:
+                                            self.plates[female].top_holes.append(rs.coercecurve(pol_2))
+                                            self.plates[female].bottom_holes.append(rs.coercecurve(pol_1))
+                            else: raise Exception('holes_sides should have the same number of vertices')
+
+                    self.log.append('Custom joint added bewteen plates '+str(i)+ ' and '+ str(nb))
+
+                    pass
 
             @__skip_nones
             def add_fingers(self, 
@@ -1684,220 +2186,204 @@ if yes:
 
                 """Add finger joints on Side-to-Side contact zones."""
 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-
                 #conditional loop
-                for i in range(self.count):
-                    types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        #specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)): 
-                                i_want_a_finger = True
-                        else: i_want_a_finger = False
-                        
-                        #for all specified Side-to-Side connection
-                        if (types[j] == 'SS') and (nb > i) and (i_want_a_finger is True):
-
-                            #prerequisite
-                            if finger_length_1 < 0 : raise Exception('finger_length_1 must be greater than 0')
-                            if finger_length_2 < 0 : raise Exception('finger_length_2 must be greater than 0')
-
-                            #joint location
-                            zone = self.contact_zones[i][j]
-                            rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
-                            #if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (finger_width_1*finger_number_1 + finger_width_2*finger_number_2 + 2*finger_spacing*(finger_number_1+finger_number_2-1) + finger_shift*2):
-                            #    excess = (finger_width_1*finger_number_1 + finger_width_2*finger_number_2 + 2*finger_spacing*(finger_number_1+finger_number_2-1) + finger_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
-                            #    raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
-
-                            plane_male = self.plates[i].top_plane
-                            plane_female = self.plates[nb].top_plane
-                            center = self.contact_centers[i][j]
-                            joint_plane = rs.PlaneFromNormal(center, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
+                for (i, j) in self.select_contacts(plates_pairs, ['SS'], symmetric=False):
+                    nb = self.contact_ids[i][j]
+
+                    #for all specified Side-to-Side connection
+                    #prerequisite
+                    if finger_length_1 < 0 : raise Exception('finger_length_1 must be greater than 0')
+                    if finger_length_2 < 0 : raise Exception('finger_length_2 must be greater than 0')
+
+                    #joint location
+                    zone = self.contact_zones[i][j]
+                    rectangle = Toolbox.Curves.trapeze_to_rectangle(rs.JoinCurves(rs.DuplicateEdgeCurves(zone)))
+                    #if Toolbox.Curves.rectangle_dimensions(rectangle)[0] < (finger_width_1*finger_number_1 + finger_width_2*finger_number_2 + 2*finger_spacing*(finger_number_1+finger_number_2-1) + finger_shift*2):
+                    #    excess = (finger_width_1*finger_number_1 + finger_width_2*finger_number_2 + 2*finger_spacing*(finger_number_1+finger_number_2-1) + finger_shift*2) / (Toolbox.Curves.rectangle_dimensions(rectangle)[0]) * 100
+                    #    raise Exception(' Joint is to large ('+ str(int(excess)) +' %) for contact area between plate '+str(i)+' and plate '+str(nb))
+
+                    plane_male = self.plates[i].top_plane
+                    plane_female = self.plates[nb].top_plane
+                    center = self.contact_centers[i][j]
+                    joint_plane = rs.PlaneFromNormal(center, self.contact_planes[i][j].YAxis, self.contact_planes[i][j].XAxis)
                             
-                            #default length 1
-                            if (finger_length_1 == 'default') or (finger_length_1 == 0) :
-                                if abs(rs.IsVectorParallelTo(plane_male.ZAxis, plane_female.ZAxis)) == 0 and rs.IsVectorPerpendicularTo(plane_male.ZAxis, plane_female.ZAxis) is False:
-                                        alpha = rs.VectorAngle(plane_male.ZAxis, plane_female.ZAxis)
-                                        thickness_female = self.plates[nb].thickness
-                                        new_finger_length_1 = abs(thickness_female / math.sin(math.radians(180-alpha)))
-                                else: new_finger_length_1 = self.plates[nb].thickness
-                            else: new_finger_length_1 = finger_length_1
-
-                            #default length 2
-                            if (finger_length_2 == 'default') or (finger_length_2 == 0) :
-                                if abs(rs.IsVectorParallelTo(plane_male.ZAxis, plane_female.ZAxis)) == 0 and rs.IsVectorPerpendicularTo(plane_male.ZAxis, plane_female.ZAxis) is False:
-                                        alpha = rs.VectorAngle(plane_male.ZAxis, plane_female.ZAxis)
-                                        thickness_male = self.plates[i].thickness
-                                        new_finger_length_2 = abs(thickness_male / math.sin(math.radians(180-alpha)))
-                                else: new_finger_length_2 = self.plates[i].thickness
-                            else: new_finger_length_2 = finger_length_2
-
-                            #correct length projection
-                            if abs(rs.IsVectorParallelTo(plane_male.ZAxis, joint_plane.ZAxis)) == 0:
-                                beta = rs.VectorAngle(plane_male.ZAxis, joint_plane.ZAxis)
-                                new_finger_length_1 = new_finger_length_1 * abs(math.cos(math.radians(beta)))
-                            if abs(rs.IsVectorParallelTo(plane_female.ZAxis, joint_plane.ZAxis)) == 0:
-                                beta = rs.VectorAngle(plane_female.ZAxis, joint_plane.ZAxis)
-                                new_finger_length_2 = new_finger_length_2*abs(math.cos(math.radians(beta)))
+                    #default length 1
+                    if (finger_length_1 == 'default') or (finger_length_1 == 0) :
+                        if abs(rs.IsVectorParallelTo(plane_male.ZAxis, plane_female.ZAxis)) == 0 and rs.IsVectorPerpendicularTo(plane_male.ZAxis, plane_female.ZAxis) is False:
+                                alpha = rs.VectorAngle(plane_male.ZAxis, plane_female.ZAxis)
+                                thickness_female = self.plates[nb].thickness
+                                new_finger_length_1 = abs(thickness_female / math.sin(math.radians(180-alpha)))
+                        else: new_finger_length_1 = self.plates[nb].thickness
+                    else: new_finger_length_1 = finger_length_1
+
+                    #default length 2
+                    if (finger_length_2 == 'default') or (finger_length_2 == 0) :
+                        if abs(rs.IsVectorParallelTo(plane_male.ZAxis, plane_female.ZAxis)) == 0 and rs.IsVectorPerpendicularTo(plane_male.ZAxis, plane_female.ZAxis) is False:
+                                alpha = rs.VectorAngle(plane_male.ZAxis, plane_female.ZAxis)
+                                thickness_male = self.plates[i].thickness
+                                new_finger_length_2 = abs(thickness_male / math.sin(math.radians(180-alpha)))
+                        else: new_finger_length_2 = self.plates[i].thickness
+                    else: new_finger_length_2 = finger_length_2
+
+                    #correct length projection
+                    if abs(rs.IsVectorParallelTo(plane_male.ZAxis, joint_plane.ZAxis)) == 0:
+                        beta = rs.VectorAngle(plane_male.ZAxis, joint_plane.ZAxis)
+                        new_finger_length_1 = new_finger_length_1 * abs(math.cos(math.radians(beta)))
+                    if abs(rs.IsVectorParallelTo(plane_female.ZAxis, joint_plane.ZAxis)) == 0:
+                        beta = rs.VectorAngle(plane_female.ZAxis, joint_plane.ZAxis)
+                        new_finger_length_2 = new_finger_length_2*abs(math.cos(math.radians(beta)))
                             
-                            #configuration (alternate or centered)
-                            if (finger_number_1 + finger_number_2) % 2 == 0:
-                                #alternate
-                                if mirror is False:
-                                    center_1 = rs.CopyObject(joint_plane.Origin, joint_plane.XAxis * (finger_spacing + finger_width_2) /2)
-                                    center_2 = rs.CopyObject(joint_plane.Origin, -joint_plane.XAxis * (finger_spacing + finger_width_1) /2)
-                                else: 
-                                    center_1 = rs.CopyObject(joint_plane.Origin, -joint_plane.XAxis * (finger_spacing + finger_width_2) /2)
-                                    center_2 = rs.CopyObject(joint_plane.Origin, joint_plane.XAxis * (finger_spacing + finger_width_1) /2)
-                            else: 
-                                #centered
-                                center_1 = joint_plane.Origin
-                                center_2 = joint_plane.Origin
+                    #configuration (alternate or centered)
+                    if (finger_number_1 + finger_number_2) % 2 == 0:
+                        #alternate
+                        if mirror is False:
+                            center_1 = rs.CopyObject(joint_plane.Origin, joint_plane.XAxis * (finger_spacing + finger_width_2) /2)
+                            center_2 = rs.CopyObject(joint_plane.Origin, -joint_plane.XAxis * (finger_spacing + finger_width_1) /2)
+                        else: 
+                            center_1 = rs.CopyObject(joint_plane.Origin, -joint_plane.XAxis * (finger_spacing + finger_width_2) /2)
+                            center_2 = rs.CopyObject(joint_plane.Origin, joint_plane.XAxis * (finger_spacing + finger_width_1) /2)
+                    else: 
+                        #centered
+                        center_1 = joint_plane.Origin
+                        center_2 = joint_plane.Origin
                             
-                            #finger location - first side
-                            if finger_number_1 > 1 :
-                                dist = (float(finger_number_1 -1) /2) * (finger_width_1 + finger_width_2 + 2*finger_spacing)
-                                pointA = rs.CopyObject(center_1, joint_plane.XAxis * dist)
-                                pointB = rs.CopyObject(center_1, -joint_plane.XAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, joint_plane.XAxis * finger_shift)
-                                location_1 = rs.DivideCurve(shifted_line, finger_number_1 -1)
-                            else: location_1 = [rs.CopyObject(center_1, joint_plane.XAxis * finger_shift)]
+                    #finger location - first side
+                    if finger_number_1 > 1 :
+                        dist = (float(finger_number_1 -1) /2) * (finger_width_1 + finger_width_2 + 2*finger_spacing)
+                        pointA = rs.CopyObject(center_1, joint_plane.XAxis * dist)
+                        pointB = rs.CopyObject(center_1, -joint_plane.XAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, joint_plane.XAxis * finger_shift)
+                        location_1 = rs.DivideCurve(shifted_line, finger_number_1 -1)
+                    else: location_1 = [rs.CopyObject(center_1, joint_plane.XAxis * finger_shift)]
                             
-                            #finger location - second side
-                            if finger_number_2 > 1 :
-                                dist = (float(finger_number_2 -1) /2) * (finger_width_1 + finger_width_2 +2*finger_spacing)
-                                pointA = rs.CopyObject(center_2, joint_plane.XAxis * dist)
-                                pointB = rs.CopyObject(center_2, -joint_plane.XAxis * dist)
-                                line = rs.AddLine(pointA, pointB)
-                                shifted_line = rs.CopyObject(line, joint_plane.XAxis * finger_shift)
-                                location_2 = rs.DivideCurve(shifted_line, finger_number_2 -1)
-                            else: location_2 = [rs.CopyObject(center_2, joint_plane.XAxis * finger_shift)]
-
-                            #solid - first side
-                            for k in range(len(location_2)):
-                                #base polyline
-                                point1 = rs.coerce3dpoint(rs.CopyObject(location_2[k], joint_plane.XAxis * finger_width_2/2))
-                                point4 = rs.coerce3dpoint(rs.CopyObject(location_2[k], -joint_plane.XAxis * finger_width_2/2))
-                                point2 = rs.coerce3dpoint(rs.CopyObject(point1, joint_plane.YAxis * new_finger_length_2))
-                                point3 = rs.coerce3dpoint(rs.CopyObject(point4, joint_plane.YAxis  * new_finger_length_2))
-                                polyline = [point1, point2, point3, point4, point1]
-
-                                #projection for joint negative
-                                proj_top_n = rg.Polyline(copy.deepcopy(polyline))
-                                proj_top_n.Transform(rg.Transform.ProjectAlong(self.plates[i].top_plane, joint_plane.ZAxis))                               
-                                proj_top_n =proj_top_n.ToArray()
-                                proj_bottom_n = rg.Polyline(copy.deepcopy(polyline))
-                                proj_bottom_n.Transform(rg.Transform.ProjectAlong(self.plates[i].bottom_plane, joint_plane.ZAxis))
-                                proj_bottom_n = proj_bottom_n.ToArray()
-                                finger_box_n = box = rg.Brep.CreateFromBox(proj_top_n[0:4] + proj_bottom_n[0:4])
-                                self.plates[i].joints_negatives.append(finger_box_n)
+                    #finger location - second side
+                    if finger_number_2 > 1 :
+                        dist = (float(finger_number_2 -1) /2) * (finger_width_1 + finger_width_2 +2*finger_spacing)
+                        pointA = rs.CopyObject(center_2, joint_plane.XAxis * dist)
+                        pointB = rs.CopyObject(center_2, -joint_plane.XAxis * dist)
+                        line = rs.AddLine(pointA, pointB)
+                        shifted_line = rs.CopyObject(line, joint_plane.XAxis * finger_shift)
+                        location_2 = rs.DivideCurve(shifted_line, finger_number_2 -1)
+                    else: location_2 = [rs.CopyObject(center_2, joint_plane.XAxis * finger_shift)]
+
+                    #solid - first side
+                    for k in range(len(location_2)):
+                        #base polyline
+                        point1 = rs.coerce3dpoint(rs.CopyObject(location_2[k], joint_plane.XAxis * finger_width_2/2))
+                        point4 = rs.coerce3dpoint(rs.CopyObject(location_2[k], -joint_plane.XAxis * finger_width_2/2))
+                        point2 = rs.coerce3dpoint(rs.CopyObject(point1, joint_plane.YAxis * new_finger_length_2))
+                        point3 = rs.coerce3dpoint(rs.CopyObject(point4, joint_plane.YAxis  * new_finger_length_2))
+                        polyline = [point1, point2, point3, point4, point1]
+
+                        #projection for joint negative
+                        proj_top_n = rg.Polyline(copy.deepcopy(polyline))
+                        proj_top_n.Transform(rg.Transform.ProjectAlong(self.plates[i].top_plane, joint_plane.ZAxis))                               
+                        proj_top_n =proj_top_n.ToArray()
+                        proj_bottom_n = rg.Polyline(copy.deepcopy(polyline))
+                        proj_bottom_n.Transform(rg.Transform.ProjectAlong(self.plates[i].bottom_plane, joint_plane.ZAxis))
+                        proj_bottom_n = proj_bottom_n.ToArray()
+                        finger_box_n = box = rg.Brep.CreateFromBox(proj_top_n[0:4] + proj_bottom_n[0:4])
+                        self.plates[i].joints_negatives.append(finger_box_n)
                                 
-                                #projection for joint positive
-                                proj_top_p = rg.Polyline(copy.deepcopy(polyline))
-                                proj_top_p.Transform(rg.Transform.ProjectAlong(self.plates[nb].top_plane, joint_plane.ZAxis))
-                                proj_top_p =proj_top_p.ToArray()
-                                proj_bottom_p = rg.Polyline(copy.deepcopy(polyline))
-                                proj_bottom_p.Transform(rg.Transform.ProjectAlong(self.plates[nb].bottom_plane, joint_plane.ZAxis))
-                                proj_bottom_p = proj_bottom_p.ToArray()
-                                finger_box_p = box = rg.Brep.CreateFromBox(proj_top_p[0:4] + proj_bottom_p[0:4])   
-                                #if (finger_length_2 == 'default') or (finger_length_2 == 0) :
-                                top_plane = rs.coerceplane(self.plates[i].top_plane)
-                                bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
-                                finger_box_p = Toolbox.Breps.slice_2_planes(finger_box_p, top_plane, bottom_plane)                  
-                                self.plates[nb].joints_positives.append(finger_box_p)
+                        #projection for joint positive
+                        proj_top_p = rg.Polyline(copy.deepcopy(polyline))
+                        proj_top_p.Transform(rg.Transform.ProjectAlong(self.plates[nb].top_plane, joint_plane.ZAxis))
+                        proj_top_p =proj_top_p.ToArray()
+                        proj_bottom_p = rg.Polyline(copy.deepcopy(polyline))
+                        proj_bottom_p.Transform(rg.Transform.ProjectAlong(self.plates[nb].bottom_plane, joint_plane.ZAxis))
+                        proj_bottom_p = proj_bottom_p.ToArray()
+                        finger_box_p = box = rg.Brep.CreateFromBox(proj_top_p[0:4] + proj_bottom_p[0:4])   
+                        #if (finger_length_2 == 'default') or (finger_length_2 == 0) :
+                        top_plane = rs.coerceplane(self.plates[i].top_plane)
+                        bottom_plane =  rs.coerceplane(self.plates[i].bottom_plane)
+                        finger_box_p = Toolbox.Breps.slice_2_planes(finger_box_p, top_plane, bottom_plane)                  
+                        self.plates[nb].joints_positives.append(finger_box_p)
                                 
-                                # contour
-                                top_poly_n = rs.AddPolyline([proj_top_n[0],proj_top_n[1], proj_top_n[2], proj_top_n[3]])
-                                bottom_poly_n = rs.AddPolyline([proj_bottom_n[0],proj_bottom_n[1], proj_bottom_n[2], proj_bottom_n[3]])
-                                top_poly_p = rs.AddPolyline([proj_top_p[0],proj_top_p[1], proj_top_p[2], proj_top_p[3]])
-                                bottom_poly_p = rs.AddPolyline([proj_bottom_p[0],proj_bottom_p[1], proj_bottom_p[2], proj_bottom_p[3]])
-                                self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [top_poly_p])
-                                self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [bottom_poly_p])
-                                self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [top_poly_n])
-                                self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [bottom_poly_n])   
-
-                            #solid - second side
-                            for k in range(len(location_1)):
-                                #base polyline
-                                point1 = rs.coerce3dpoint(rs.CopyObject(location_1[k], joint_plane.XAxis * finger_width_1/2))
-                                point4 = rs.coerce3dpoint(rs.CopyObject(location_1[k], -joint_plane.XAxis * finger_width_1/2))
-                                point2 = rs.coerce3dpoint(rs.CopyObject(point1, -joint_plane.YAxis * new_finger_length_1))
-                                point3 = rs.coerce3dpoint(rs.CopyObject(point4, -joint_plane.YAxis * new_finger_length_1))
-                                polyline = [point1, point2, point3, point4, point1]
+                        # contour
+                        top_poly_n = rs.AddPolyline([proj_top_n[0],proj_top_n[1], proj_top_n[2], proj_top_n[3]])
+                        bottom_poly_n = rs.AddPolyline([proj_bottom_n[0],proj_bottom_n[1], proj_bottom_n[2], proj_bottom_n[3]])
+                        top_poly_p = rs.AddPolyline([proj_top_p[0],proj_top_p[1], proj_top_p[2], proj_top_p[3]])
+                        bottom_poly_p = rs.AddPolyline([proj_bottom_p[0],proj_bottom_p[1], proj_bottom_p[2], proj_bottom_p[3]])
+                        self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [top_poly_p])
+                        self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [bottom_poly_p])
+                        self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [top_poly_n])
+                        self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [bottom_poly_n])   
+
+                    #solid - second side
+                    for k in range(len(location_1)):
+                        #base polyline
+                        point1 = rs.coerce3dpoint(rs.CopyObject(location_1[k], joint_plane.XAxis * finger_width_1/2))
+                        point4 = rs.coerce3dpoint(rs.CopyObject(location_1[k], -joint_plane.XAxis * finger_width_1/2))
+                        point2 = rs.coerce3dpoint(rs.CopyObject(point1, -joint_plane.YAxis * new_finger_length_1))
+                        point3 = rs.coerce3dpoint(rs.CopyObject(point4, -joint_plane.YAxis * new_finger_length_1))
+                        polyline = [point1, point2, point3, point4, point1]
                                 
-                                #projection for joint negative
-                                proj_top_n = rg.Polyline(copy.deepcopy(polyline))
-                                proj_top_n.Transform(rg.Transform.ProjectAlong(self.plates[nb].top_plane, joint_plane.ZAxis))
-                                proj_top_n =proj_top_n.ToArray()
-                                proj_bottom_n = rg.Polyline(copy.deepcopy(polyline))
-                                proj_bottom_n.Transform(rg.Transform.ProjectAlong(self.plates[nb].bottom_plane, joint_plane.ZAxis))
-                                proj_bottom_n = proj_bottom_n.ToArray()
-                                finger_box_n = box = rg.Brep.CreateFromBox(proj_top_n[0:4] + proj_bottom_n[0:4])
-                                self.plates[nb].joints_negatives.append(finger_box_n)
+                        #projection for joint negative
+                        proj_top_n = rg.Polyline(copy.deepcopy(polyline))
+                        proj_top_n.Transform(rg.Transform.ProjectAlong(self.plates[nb].top_plane, joint_plane.ZAxis))
+                        proj_top_n =proj_top_n.ToArray()
+                        proj_bottom_n = rg.Polyline(copy.deepcopy(polyline))
+                        proj_bottom_n.Transform(rg.Transform.ProjectAlong(self.plates[nb].bottom_plane, joint_plane.ZAxis))
+                        proj_bottom_n = proj_bottom_n.ToArray()
+                        finger_box_n = box = rg.Brep.CreateFromBox(proj_top_n[0:4] + proj_bottom_n[0:4])
+                        self.plates[nb].joints_negatives.append(finger_box_n)
                                 
-                                #projection for joint positive
-                                proj_top_p = rg.Polyline(copy.deepcopy(polyline))
-                                proj_top_p.Transform(rg.Transform.ProjectAlong(self.plates[i].top_plane, joint_plane.ZAxis))
-                                proj_top_p =proj_top_p.ToArray()
-                                proj_bottom_p = rg.Polyline(copy.deepcopy(polyline))
-                                proj_bottom_p.Transform(rg.Transform.ProjectAlong(self.plates[i].bottom_plane, joint_plane.ZAxis))
-                                proj_bottom_p = proj_bottom_p.ToArray()
-                                finger_box_p = box = rg.Brep.CreateFromBox(proj_top_p[0:4] + proj_bottom_p[0:4])
-                                #if (finger_length_1 == 'default') or (finger_length_1 == 0) :
-                                top_plane = rs.coerceplane(self.plates[nb].top_plane)
-                                bottom_plane =  rs.coerceplane(self.plates[nb].bottom_plane)
-                                finger_box_p = Toolbox.Breps.slice_2_planes(finger_box_p, top_plane, bottom_plane)
-                                self.plates[i].joints_positives.append(finger_box_p)
-
-                                # contour
-                                top_poly_n = rs.AddPolyline([proj_top_n[0],proj_top_n[1], proj_top_n[2], proj_top_n[3]])
-                                bottom_poly_n = rs.AddPolyline([proj_bottom_n[0],proj_bottom_n[1], proj_bottom_n[2], proj_bottom_n[3]])
-                                top_poly_p = rs.AddPolyline([proj_top_p[0],proj_top_p[1], proj_top_p[2], proj_top_p[3]])
-                                bottom_poly_p = rs.AddPolyline([proj_bottom_p[0],proj_bottom_p[1], proj_bottom_p[2], proj_bottom_p[3]])
-
-                                self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [top_poly_p])
-                                self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [bottom_poly_p])
-                                self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [top_poly_n])
-                                self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [bottom_poly_n])
-
-                            # Structural analysis
-
-                            for k in range(len(location_1)):
-                                pm=rs.CurveClosestPoint(self.FEM_plates[i],location_1[k])
-                                pf=rs.CurveClosestPoint(self.FEM_plates[nb],location_1[k])
-
-                                self.temp.append(rs.EvaluateCurve(self.FEM_plates[i],pm))
-                                self.temp.append(rs.EvaluateCurve(self.FEM_plates[nb],pf))
-                                """
-                                self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
-                                self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
-                                joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
-                                rs.InsertCurveKnot(self.FEM_plates[i],pm)
-                                rs.InsertCurveKnot(self.FEM_plates[nb],pf)
-                                self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
-                                self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
-                                self.FEM_joints.append(rs.coercecurve(joint_line))
-
-                            for k in range(len(location_2)):
-                                pm=rs.CurveClosestPoint(self.FEM_plates[i],location_2[k])
-                                pf=rs.CurveClosestPoint(self.FEM_plates[nb],location_2[k])
-                                self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
-                                self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
-                                joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
-                                rs.InsertCurveKnot(self.FEM_plates[i],pm)
-                                rs.InsertCurveKnot(self.FEM_plates[nb],pf)
-                                self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
-                                self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
-                                self.FEM_joints.append(rs.coercecurve(joint_line))
-                            """
+                        #projection for joint positive
+                        proj_top_p = rg.Polyline(copy.deepcopy(polyline))
+                        proj_top_p.Transform(rg.Transform.ProjectAlong(self.plates[i].top_plane, joint_plane.ZAxis))
+                        proj_top_p =proj_top_p.ToArray()
+                        proj_bottom_p = rg.Polyline(copy.deepcopy(polyline))
+                        proj_bottom_p.Transform(rg.Transform.ProjectAlong(self.plates[i].bottom_plane, joint_plane.ZAxis))
+                        proj_bottom_p = proj_bottom_p.ToArray()
+                        finger_box_p = box = rg.Brep.CreateFromBox(proj_top_p[0:4] + proj_bottom_p[0:4])
+                        #if (finger_length_1 == 'default') or (finger_length_1 == 0) :
+                        top_plane = rs.coerceplane(self.plates[nb].top_plane)
+                        bottom_plane =  rs.coerceplane(self.plates[nb].bottom_plane)
+                        finger_box_p = Toolbox.Breps.slice_2_planes(finger_box_p, top_plane, bottom_plane)
+                        self.plates[i].joints_positives.append(finger_box_p)
+
+                        # contour
+                        top_poly_n = rs.AddPolyline([proj_top_n[0],proj_top_n[1], proj_top_n[2], proj_top_n[3]])
+                        bottom_poly_n = rs.AddPolyline([proj_bottom_n[0],proj_bottom_n[1], proj_bottom_n[2], proj_bottom_n[3]])
+                        top_poly_p = rs.AddPolyline([proj_top_p[0],proj_top_p[1], proj_top_p[2], proj_top_p[3]])
+                        bottom_poly_p = rs.AddPolyline([proj_bottom_p[0],proj_bottom_p[1], proj_bottom_p[2], proj_bottom_p[3]])
+
+                        self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [top_poly_p])
+                        self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [bottom_poly_p])
+                        self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [top_poly_n])
+                        self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [bottom_poly_n])
+
+                    # Structural analysis
+
+                    for k in range(len(location_1)):
+                        pm=rs.CurveClosestPoint(self.FEM_plates[i],location_1[k])
+                        pf=rs.CurveClosestPoint(self.FEM_plates[nb],location_1[k])
+
+                        self.temp.append(rs.EvaluateCurve(self.FEM_plates[i],pm))
+                        self.temp.append(rs.EvaluateCurve(self.FEM_plates[nb],pf))
+                        """
+                        self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
+                        self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
+                        joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
+                        rs.InsertCurveKnot(self.FEM_plates[i],pm)
+                        rs.InsertCurveKnot(self.FEM_plates[nb],pf)
+                        self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
+                        self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
+                        self.FEM_joints.append(rs.coercecurve(joint_line))
+
+                    for k in range(len(location_2)):
+                        pm=rs.CurveClosestPoint(self.FEM_plates[i],location_2[k])
+                        pf=rs.CurveClosestPoint(self.FEM_plates[nb],location_2[k])
+                        self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
+                        self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
+                        joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
+                        rs.InsertCurveKnot(self.FEM_plates[i],pm)
+                        rs.InsertCurveKnot(self.FEM_plates[nb],pf)
+                        self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
+                        self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
+                        self.FEM_joints.append(rs.coercecurve(joint_line))
+                    """
             
             @__skip_nones
             def add_halflap(self,
@@ -1911,178 +2397,162 @@ if yes:
 
                 """Add half-lap joints on Intersecting Plates."""
 
-                #cast plate_pairs to string
-                if plates_pairs != 'all':
-                    for i in range(len(plates_pairs)):
-                        plates_pairs[i] = str(plates_pairs[i])
-                
                 #conditional loop
-                for i in range(self.count):
-                    types = self.contact_types[i]
-                    for j in range(len(types)):
-                        nb = self.contact_ids[i][j]
-
-                        #specific selection function
-                        if ((plates_pairs == 'all') 
-                            or ('('+str(i)+','+str(nb)+')' == plates_pairs) 
-                            or ('('+str(i)+','+str(nb)+')' in plates_pairs)): 
-                                i_want_a_halflap = True
-                        else: i_want_a_halflap = False
-                        
-                        #for all specified Side-to-Side connection
-                        if (types[j] == 'IN') and (nb > i) and (i_want_a_halflap is True):
-
-                            #prerequisite
-                            if proportion < 0.01 or proportion > 0.99: raise Exception(' Proportion should remain strictly between 0.01 and 0.99.')
-                            if tolerance < 0 : raise Exception(' Tolerance should be higher than 0.0.')
-                            if segments < 1: segments =1
-
-                            # Solids
-                            zone = self.contact_zones[i][j]
-                            volume = rg.Brep.CreateBooleanIntersection(self.plates[i].brep,self.plates[nb].brep, 0.001)[0]
-                            edges = Toolbox.Breps.brep_edges(volume)
-                            edges.sort(key=rs.CurveLength)
-                            edges.reverse()
-                            vec_dir = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.cross(self.plates[i].top_normal, self.plates[nb].top_normal)),6)
-                            four_edges = []
-                            for edge in edges:
-                                vec_line = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.line_to_vec(edge)),6) 
-                                if vec_dir == vec_line:
-                                    four_edges.append(edge)
-                                elif vec_dir == rs.VectorReverse(vec_line):
-                                    rg.Curve.Reverse(edge)
-                                    four_edges.append(edge)
-                                if len(four_edges) == 4: break
-
-                            # Mid plane
-                            mids = [rs.CurveMidPoint(four_edges[k]) for k in range(4)]
-                            center = Toolbox.Points.average_point(mids)
-                            proj = rs.coerce3dpointlist([rs.EvaluateCurve(four_edges[l],rs.CurveClosestPoint(four_edges[l],center)) for l in range(4)])
-
-                            # Proportion parameter
-                            d1 = rs.Distance(rs.CurveStartPoint(four_edges[0]), proj[0])
-                            d2 = rs.Distance(rs.CurveStartPoint(four_edges[1]), proj[1]) 
-                            d3 = rs.Distance(rs.CurveStartPoint(four_edges[2]), proj[2]) 
-                            d4 = rs.Distance(rs.CurveStartPoint(four_edges[3]), proj[3])
-                            min1 = min(d1,d2,d3,d4)
-                            d5 = rs.Distance(rs.CurveEndPoint(four_edges[0]), proj[0])
-                            d6 = rs.Distance(rs.CurveEndPoint(four_edges[1]), proj[1]) 
-                            d7 = rs.Distance(rs.CurveEndPoint(four_edges[2]), proj[2]) 
-                            d8 = rs.Distance(rs.CurveEndPoint(four_edges[3]), proj[3])
-                            min2 = min(d5,d6,d7,d8)
-                            poly = rs.AddPolyline(rs.PolylineVertices(gh.ConvexHull(proj, rs.PlaneFitFromPoints(proj))[0]))
-                            vec1 = rs.VectorUnitize(rs.VectorCreate(rs.CurveStartPoint(four_edges[0]), proj[0]))
-                            polyAt0 = rs.CopyObject(poly, min1*vec1)
-                            poly = rs.CopyObject(polyAt0, proportion*(min1+min2)*rs.VectorUnitize(-vec1))
-                            # Cutting volume in pieces
-                            cutter = rs.coercebrep(rs.AddPlanarSrf(poly))
-                            pieces = rs.SplitBrep(volume, cutter)                            
+                for (i, j) in self.select_contacts(plates_pairs, ['IN'], symmetric=False):
+                    nb = self.contact_ids[i][j]
+
+                    #for all specified Side-to-Side connection
+                    #prerequisite
+                    if proportion < 0.01 or proportion > 0.99: raise Exception(' Proportion should remain strictly between 0.01 and 0.99.')
+                    if tolerance < 0 : raise Exception(' Tolerance should be higher than 0.0.')
+                    if segments < 1: segments =1
+
+                    # Solids
+                    zone = self.contact_zones[i][j]
+                    volume = rg.Brep.CreateBooleanIntersection(self.plates[i].brep,self.plates[nb].brep, 0.001)[0]
+                    edges = Toolbox.Breps.brep_edges(volume)
+                    edges.sort(key=rs.CurveLength)
+                    edges.reverse()
+                    vec_dir = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.cross(self.plates[i].top_normal, self.plates[nb].top_normal)),6)
+                    four_edges = []
+                    for edge in edges:
+                        vec_line = Toolbox.Vectors.round_vector(rs.VectorUnitize(Toolbox.Vectors.line_to_vec(edge)),6) 
+                        if vec_dir == vec_line:
+                            four_edges.append(edge)
+                        elif vec_dir == rs.VectorReverse(vec_line):
+                            rg.Curve.Reverse(edge)
+                            four_edges.append(edge)
+                        if len(four_edges) == 4: break
+
+                    # Mid plane
+                    mids = [rs.CurveMidPoint(four_edges[k]) for k in range(4)]
+                    center = Toolbox.Points.average_point(mids)
+                    proj = rs.coerce3dpointlist([rs.EvaluateCurve(four_edges[l],rs.CurveClosestPoint(four_edges[l],center)) for l in range(4)])
+
+                    # Proportion parameter
+                    d1 = rs.Distance(rs.CurveStartPoint(four_edges[0]), proj[0])
+                    d2 = rs.Distance(rs.CurveStartPoint(four_edges[1]), proj[1]) 
+                    d3 = rs.Distance(rs.CurveStartPoint(four_edges[2]), proj[2]) 
+                    d4 = rs.Distance(rs.CurveStartPoint(four_edges[3]), proj[3])
+                    min1 = min(d1,d2,d3,d4)
+                    d5 = rs.Distance(rs.CurveEndPoint(four_edges[0]), proj[0])
+                    d6 = rs.Distance(rs.CurveEndPoint(four_edges[1]), proj[1]) 
+                    d7 = rs.Distance(rs.CurveEndPoint(four_edges[2]), proj[2]) 
+                    d8 = rs.Distance(rs.CurveEndPoint(four_edges[3]), proj[3])
+                    min2 = min(d5,d6,d7,d8)
+                    poly = rs.AddPolyline(rs.PolylineVertices(gh.ConvexHull(proj, rs.PlaneFitFromPoints(proj))[0]))
+                    vec1 = rs.VectorUnitize(rs.VectorCreate(rs.CurveStartPoint(four_edges[0]), proj[0]))
+                    polyAt0 = rs.CopyObject(poly, min1*vec1)
+                    poly = rs.CopyObject(polyAt0, proportion*(min1+min2)*rs.VectorUnitize(-vec1))
+                    # Cutting volume in pieces
+                    cutter = rs.coercebrep(rs.AddPlanarSrf(poly))
+                    pieces = rs.SplitBrep(volume, cutter)                            
                             
-                            for piece in pieces: piece = rs.CapPlanarHoles(piece)
-                            int_i = rs.CurveBrepIntersect(self.plates[i].top_contour, pieces[0])
-                            int_nb = rs.CurveBrepIntersect(self.plates[nb].top_contour, pieces[0])
-                            if int_i != None:
-                                if int_nb != None: 
-                                    if rs.CurveLength(int_i[0]) < rs.CurveLength(int_nb[0]):
-                                        pieces.reverse()
-                            else: pieces.reverse()
+                    for piece in pieces: piece = rs.CapPlanarHoles(piece)
+                    int_i = rs.CurveBrepIntersect(self.plates[i].top_contour, pieces[0])
+                    int_nb = rs.CurveBrepIntersect(self.plates[nb].top_contour, pieces[0])
+                    if int_i != None:
+                        if int_nb != None: 
+                            if rs.CurveLength(int_i[0]) < rs.CurveLength(int_nb[0]):
+                                pieces.reverse()
+                    else: pieces.reverse()
                             
-                            # Fabrication lines
-                            piece_i_top = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[0], self.plates[i].top_face)[0], self.plates[i].top_contour)
-                            piece_i_bottom = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[0], self.plates[i].bottom_face)[0], self.plates[i].bottom_contour)
-                            piece_nb_top = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[1], self.plates[nb].top_face)[0], self.plates[nb].top_contour)
-                            piece_nb_bottom = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[1], self.plates[nb].bottom_face)[0], self.plates[nb].bottom_contour)
+                    # Fabrication lines
+                    piece_i_top = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[0], self.plates[i].top_face)[0], self.plates[i].top_contour)
+                    piece_i_bottom = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[0], self.plates[i].bottom_face)[0], self.plates[i].bottom_contour)
+                    piece_nb_top = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[1], self.plates[nb].top_face)[0], self.plates[nb].top_contour)
+                    piece_nb_bottom = Toolbox.Curves.curve_difference(rs.IntersectBreps(pieces[1], self.plates[nb].bottom_face)[0], self.plates[nb].bottom_contour)
 
 
-                            # Chamfer
-                            if tolerance != 0:
+                    # Chamfer
+                    if tolerance != 0:
                                 
-                                if not 0 < min_angle < 90 : raise Exception(' The angle of the slope should remain strictly between 0 and 90.')
+                        if not 0 < min_angle < 90 : raise Exception(' The angle of the slope should remain strictly between 0 and 90.')
                                 
-                                radius = fillet_height/math.sin(math.radians(90-min_angle))
-                                fillet_width = radius - math.sqrt((radius*radius)-(fillet_height*fillet_height))
+                        radius = fillet_height/math.sin(math.radians(90-min_angle))
+                        fillet_width = radius - math.sqrt((radius*radius)-(fillet_height*fillet_height))
                                 
-                                if fillet_width > tolerance: raise Exception(' Fillet height is to big according to the tolerance you specified.')
+                        if fillet_width > tolerance: raise Exception(' Fillet height is to big according to the tolerance you specified.')
                                 
-                                #polyline vertices without chamfer   
-                                pv_i_top = rs.CullDuplicatePoints(rs.PolylineVertices(piece_i_top),0.01)
-                                pv_i_bottom = rs.CullDuplicatePoints(rs.PolylineVertices(piece_i_bottom),0.01)
-                                pv_nb_top = rs.CullDuplicatePoints(rs.PolylineVertices(piece_nb_top),0.01)
-                                pv_nb_bottom = rs.CullDuplicatePoints(rs.PolylineVertices(piece_nb_bottom),0.01)
-
-                                #chamfer planes
-                                chamfer_planes = []
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_i_top[1],pv_i_top[2],pv_i_top[0]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_i_top[2],pv_i_top[1],pv_i_top[3]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_i_bottom[2],pv_i_bottom[1],pv_i_bottom[3]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_i_bottom[1],pv_i_bottom[2],pv_i_bottom[0]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_nb_top[1],pv_nb_top[2],pv_nb_top[0]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_nb_top[2],pv_nb_top[1],pv_nb_top[3]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_nb_bottom[2],pv_nb_bottom[1],pv_nb_bottom[3]))
-                                chamfer_planes.append(rs.PlaneFromPoints(pv_nb_bottom[1],pv_nb_bottom[2],pv_nb_bottom[0]))
-                                contours = [self.plates[i].top_contour, self.plates[i].bottom_contour, self.plates[nb].top_contour, self.plates[nb].bottom_contour]
+                        #polyline vertices without chamfer   
+                        pv_i_top = rs.CullDuplicatePoints(rs.PolylineVertices(piece_i_top),0.01)
+                        pv_i_bottom = rs.CullDuplicatePoints(rs.PolylineVertices(piece_i_bottom),0.01)
+                        pv_nb_top = rs.CullDuplicatePoints(rs.PolylineVertices(piece_nb_top),0.01)
+                        pv_nb_bottom = rs.CullDuplicatePoints(rs.PolylineVertices(piece_nb_bottom),0.01)
+
+                        #chamfer planes
+                        chamfer_planes = []
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_i_top[1],pv_i_top[2],pv_i_top[0]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_i_top[2],pv_i_top[1],pv_i_top[3]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_i_bottom[2],pv_i_bottom[1],pv_i_bottom[3]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_i_bottom[1],pv_i_bottom[2],pv_i_bottom[0]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_nb_top[1],pv_nb_top[2],pv_nb_top[0]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_nb_top[2],pv_nb_top[1],pv_nb_top[3]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_nb_bottom[2],pv_nb_bottom[1],pv_nb_bottom[3]))
+                        chamfer_planes.append(rs.PlaneFromPoints(pv_nb_bottom[1],pv_nb_bottom[2],pv_nb_bottom[0]))
+                        contours = [self.plates[i].top_contour, self.plates[i].bottom_contour, self.plates[nb].top_contour, self.plates[nb].bottom_contour]
                                 
-                                #chamfer geometry
-                                chamfer_sides = []
-                                chamfer_faces = []
-                                int_contour = []
-                                for k in range(len(chamfer_planes)):
-                                    cp = chamfer_planes[k]
-                                    #new joint polyline
-                                    point_A = cp.Origin #origin
-                                    point_B = rs.CopyObject(point_A, straight_height * cp.YAxis) #before fillet
-                                    point_C = rs.CopyObject(point_B, rs.VectorAdd(fillet_height * cp.YAxis, -fillet_width * cp.XAxis)) #after fillet
-                                    point_D = rs.CopyObject(point_C, rs.VectorAdd( (tolerance - fillet_width) * math.tan(math.radians(min_angle)) * cp.YAxis,  -(tolerance - fillet_width) * cp.XAxis))
-                                    point_E = rs.CopyObject(point_D, 100*cp.YAxis)
-                                    chamfer_side = [point_A]
-                                    if fillet_height > 0:
-                                        fillet = Toolbox.Curves.fillet_curves(rs.AddLine(point_A,point_B), rs.AddLine(point_C,point_D), radius, False)
-                                        discreet = rs.DivideCurve(fillet, segments)
-                                        for point in discreet:
-                                            chamfer_side.append(point)
-                                    else:
-                                        chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_C)))
-                                    chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_D)))
-                                    chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_E)))
-                                    chamfer_sides.append(rs.AddPolyline(chamfer_side))
-
-                                    #new joint brep
-                                    if k%2 == 1:
-                                        chamfer_faces.append(Toolbox.Curves.connect_curves(chamfer_sides[k-1],chamfer_sides[k]))
-
-                                chamfer_brep_1 = Toolbox.Breps.brep_from_2_poly(chamfer_faces[0], chamfer_faces[1])
-                                chamfer_brep_2 = Toolbox.Breps.brep_from_2_poly(chamfer_faces[2], chamfer_faces[3])
-                                pieces[0] = chamfer_brep_1
-                                pieces[1] = chamfer_brep_2
+                        #chamfer geometry
+                        chamfer_sides = []
+                        chamfer_faces = []
+                        int_contour = []
+                        for k in range(len(chamfer_planes)):
+                            cp = chamfer_planes[k]
+                            #new joint polyline
+                            point_A = cp.Origin #origin
+                            point_B = rs.CopyObject(point_A, straight_height * cp.YAxis) #before fillet
+                            point_C = rs.CopyObject(point_B, rs.VectorAdd(fillet_height * cp.YAxis, -fillet_width * cp.XAxis)) #after fillet
+                            point_D = rs.CopyObject(point_C, rs.VectorAdd( (tolerance - fillet_width) * math.tan(math.radians(min_angle)) * cp.YAxis,  -(tolerance - fillet_width) * cp.XAxis))
+                            point_E = rs.CopyObject(point_D, 100*cp.YAxis)
+                            chamfer_side = [point_A]
+                            if fillet_height > 0:
+                                fillet = Toolbox.Curves.fillet_curves(rs.AddLine(point_A,point_B), rs.AddLine(point_C,point_D), radius, False)
+                                discreet = rs.DivideCurve(fillet, segments)
+                                for point in discreet:
+                                    chamfer_side.append(point)
+                            else:
+                                chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_C)))
+                            chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_D)))
+                            chamfer_side.append(rg.Point3d(rs.PointCoordinates(point_E)))
+                            chamfer_sides.append(rs.AddPolyline(chamfer_side))
+
+                            #new joint brep
+                            if k%2 == 1:
+                                chamfer_faces.append(Toolbox.Curves.connect_curves(chamfer_sides[k-1],chamfer_sides[k]))
+
+                        chamfer_brep_1 = Toolbox.Breps.brep_from_2_poly(chamfer_faces[0], chamfer_faces[1])
+                        chamfer_brep_2 = Toolbox.Breps.brep_from_2_poly(chamfer_faces[2], chamfer_faces[3])
+                        pieces[0] = chamfer_brep_1
+                        pieces[1] = chamfer_brep_2
                                 
-                                #chamfer contour
-                                to_insert=[]
-                                for k in range(len(contours)):
-                                    c1 = Toolbox.Curves.trim_curve_with_curve(rs.coercecurve(chamfer_sides[2*k]), contours[k])
-                                    c2 = Toolbox.Curves.trim_curve_with_curve(rs.coercecurve(chamfer_sides[2*k+1]), contours[k])
-                                    line = rs.AddLine(rs.CurveStartPoint(c1),rs.CurveStartPoint(c2))
-                                    to_insert.append(rs.coercecurve(rs.JoinCurves([c1, line, c2])))
-                                piece_i_top, piece_i_bottom, piece_nb_top, piece_nb_bottom = to_insert[0], to_insert[1], to_insert[2], to_insert[3]
+                        #chamfer contour
+                        to_insert=[]
+                        for k in range(len(contours)):
+                            c1 = Toolbox.Curves.trim_curve_with_curve(rs.coercecurve(chamfer_sides[2*k]), contours[k])
+                            c2 = Toolbox.Curves.trim_curve_with_curve(rs.coercecurve(chamfer_sides[2*k+1]), contours[k])
+                            line = rs.AddLine(rs.CurveStartPoint(c1),rs.CurveStartPoint(c2))
+                            to_insert.append(rs.coercecurve(rs.JoinCurves([c1, line, c2])))
+                        piece_i_top, piece_i_bottom, piece_nb_top, piece_nb_bottom = to_insert[0], to_insert[1], to_insert[2], to_insert[3]
                             
-                            #append final attributes
-                            self.plates[i].joints_negatives.append(pieces[0])
-                            self.plates[nb].joints_negatives.append(pieces[1])
-                            self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [piece_i_top])
-                            self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [piece_i_bottom])
-                            self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [piece_nb_top])
-                            self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [piece_nb_bottom])
+                    #append final attributes
+                    self.plates[i].joints_negatives.append(pieces[0])
+                    self.plates[nb].joints_negatives.append(pieces[1])
+                    self.plates[i].top_contour = Toolbox.Curves.insert_curves(self.plates[i].top_contour, [piece_i_top])
+                    self.plates[i].bottom_contour = Toolbox.Curves.insert_curves(self.plates[i].bottom_contour, [piece_i_bottom])
+                    self.plates[nb].top_contour = Toolbox.Curves.insert_curves(self.plates[nb].top_contour, [piece_nb_top])
+                    self.plates[nb].bottom_contour = Toolbox.Curves.insert_curves(self.plates[nb].bottom_contour, [piece_nb_bottom])
                             
-                            #Structural analysis
-                            pm=rs.CurveClosestPoint(self.FEM_plates[i],center)
-                            pf=rs.CurveClosestPoint(self.FEM_plates[nb],center)
-                            self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
-                            self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
-                            joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
-                            rs.InsertCurveKnot(self.FEM_plates[i],pm)
-                            rs.InsertCurveKnot(self.FEM_plates[nb],pf)
-                            self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
-                            self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
-                            self.FEM_joints.append(rs.coercecurve(joint_line))
+                    #Structural analysis
+                    pm=rs.CurveClosestPoint(self.FEM_plates[i],center)
+                    pf=rs.CurveClosestPoint(self.FEM_plates[nb],center)
+                    self.FEM_plates[i] = scriptcontext.doc.Objects.Add(self.FEM_plates[i])
+                    self.FEM_plates[nb] = scriptcontext.doc.Objects.Add(self.FEM_plates[nb])
+                    joint_line = rs.AddLine(rs.EvaluateCurve(self.FEM_plates[i],pm), rs.EvaluateCurve(self.FEM_plates[nb],pf))
+                    rs.InsertCurveKnot(self.FEM_plates[i],pm)
+                    rs.InsertCurveKnot(self.FEM_plates[nb],pf)
+                    self.FEM_plates[i] = rs.coercecurve(self.FEM_plates[i])
+                    self.FEM_plates[nb] = rs.coercecurve(self.FEM_plates[nb])
+                    self.FEM_joints.append(rs.coercecurve(joint_line))
 
                             
             # Operations ----------------------------------
@@ -2307,21 +2777,23 @@ if yes:
                     for i in range(self.count):
                         stack_height += self.plates[i].thickness
 
+                #geometry caches are rebuilt from the transformed plates
+                self.__insertion_cache = {}
+                self.__assembly_cache = {}
+                self.__slabs = {}
+                self.__clips = {}
+                self.intersections = {}
+                self.__analytic_contacts = None
+
                 #get transformation for each plate
                 for i in range(self.count):
 
-                    #list of all attributes to be transformed
+                    #list of all attributes to be transformed (the plate brep is the model brep)
                     attributes=[self.breps[i],
                     self.contact_zones[i],
                     self.contact_vectors[i],
-                    self.contact_spheres[i],
-                    self.contact_breps[i],
-                    self.contact_centers[i],
-                    self.contact_planes[i],
-                    self.contact_normals[i],
                     self.FEM_joints[i],
                     self.FEM_plates[i],
-                    self.plates[i].brep,
                     self.plates[i].top_face,
                     self.plates[i].bottom_face,
                     self.plates[i].top_contour,
@@ -2344,6 +2816,9 @@ if yes:
                     self.plates[i].joints_positives,
                     self.plates[i].joints_negatives,
                     self.plates[i].joints_keys]                  
+
+                    #objects shared by several attributes (FEM plate and mid contour) are transformed once
+                    attributes = [attributes[j] for j in range(len(attributes)) if [a for a in attributes[:j] if a is attributes[j]] == []]
                     
                     # stack transform
                     if mode == 'Stack':
@@ -2391,6 +2866,8 @@ if yes:
 
                     # Transforming each attribute
                     if mode == 'Custom' or mode == 'Array' or mode == 'Stack' or mode == 'Scale' or mode == 'Orient':
+                        self.contacts.transform(matrix, [i])
+                        self.contact_spheres[i] = [constraint.transform(matrix) for constraint in self.contact_spheres[i]]
                         for j in range(len(attributes)):
                             #dealing with attributes as lists of lists
                             if isinstance(attributes[j], list) is True:
@@ -2421,12 +2898,14 @@ if yes:
                                             except:
                                                 if attributes[j] != "gravity":print(attributes[j], j)
 
-                for module in self.modules:
+                        #vertices are recomputed from the transformed contours on next access
+                        for slot in ['_top_vertices', '_bottom_vertices']:
+                            try: delattr(self.plates[i], slot)
+                            except AttributeError: pass
 
-                    #update attributes that are linked to plate and model class
-                    module.update()
+                for module in self.modules:
 
-                    #update attributes that are independant of the model and plate class
+                    #attributes linked to plate and model class are views of the model, only update attributes that are independant of them
                     attributes=[module.assembly_vectors]
 
                     # Transforming each attribute
@@ -2492,11 +2971,12 @@ if yes:
                 self.temp = []
                 self.model = model #inherit model attributes
                 self.index = index
-                self.plate_ids = Toolbox.Data.flatten_integer_list(ast.literal_eval(sub_sequence))
-                self.plates = [self.model.plates[integer] for integer in self.plate_ids]
-                self.breps = [plate.brep for plate in self.plates]
-                self.count = len(ast.literal_eval(sub_sequence))
-                self.count_all = len(self.breps)
+                self.node = self.model.sequence_tree.node(step)
+                self.plate_ids = ModuleView(self)
+                self.plates = ModuleView(self, 'plates')
+                self.breps = ModuleView(self, 'plates', 'brep')
+                self.count = len(self.model.sequence_tree.children[self.node])
+                self.count_all = len(self.plate_ids)
                 self.step = step
                 self.sequence = sub_sequence
                 self.parent = parent
@@ -2508,30 +2988,746 @@ if yes:
 
                 # TOPOLOGY -------------------------------------------
                 
-                self.contact_ids = [self.model.contact_ids[integer] for integer in self.plate_ids]
-                self.contact_pairs = [self.model.contact_pairs[integer] for integer in self.plate_ids]
-                self.contact_breps = [self.model.contact_breps[integer] for integer in self.plate_ids]
-                self.contact_zones= [self.model.contact_zones[integer] for integer in self.plate_ids]
-                self.contact_types = [self.model.contact_types[integer] for integer in self.plate_ids]
-                self.contact_strings = [self.model.contact_strings[integer] for integer in self.plate_ids]
-                self.contact_centers = [self.model.contact_centers[integer] for integer in self.plate_ids]
-                self.contact_normals = [self.model.contact_normals[integer] for integer in self.plate_ids]
-                self.contact_planes = [self.model.contact_planes[integer] for integer in self.plate_ids]
+                self.contact_ids = ModuleView(self, 'contact_ids')
+                self.contact_pairs = ModuleView(self, 'contact_pairs')
+                self.contact_breps = ModuleView(self, 'contact_breps')
+                self.contact_zones= ModuleView(self, 'contact_zones')
+                self.contact_types = ModuleView(self, 'contact_types')
+                self.contact_strings = ModuleView(self, 'contact_strings')
+                self.contact_centers = ModuleView(self, 'contact_centers')
+                self.contact_normals = ModuleView(self, 'contact_normals')
+                self.contact_planes = ModuleView(self, 'contact_planes')
 
             def update(self):
-                self.plates = [self.model.plates[integer] for integer in self.plate_ids]
-                self.breps = [plate.brep for plate in self.plates]
-                self.contact_breps = [self.model.contact_breps[integer] for integer in self.plate_ids]
-                self.contact_zones= [self.model.contact_zones[integer] for integer in self.plate_ids]
-                self.contact_centers = [self.model.contact_centers[integer] for integer in self.plate_ids]
-                self.contact_normals = [self.model.contact_normals[integer] for integer in self.plate_ids]
-                self.contact_planes = [self.model.contact_planes[integer] for integer in self.plate_ids]
+                """attributes are views resolved in the model on access, nothing to update"""
+                pass
+
+            pass
+
+
+        class ModuleView(object):
+            """
+            Per plate attribute of the model restricted to the plates of a module, resolved in the model on access.
+            Plate ids of the module if no attribute is given, a field of each item can be read instead of the item (plate.brep).
+            """
+
+            def __init__(self, module, attribute=None, field=None):
+                self.module = module
+                self.attribute = attribute
+                self.field = field
+
+            def __len__(self):
+                tree = self.module.model.sequence_tree
+                return tree.last[self.module.node] - tree.first[self.module.node]
+
+            def __getitem__(self, k):
+                if isinstance(k, slice): return [self[i] for i in range(*k.indices(len(self)))]
+                if k < 0: k += len(self)
+                if not 0 <= k < len(self): raise IndexError('module view index out of range')
+                tree = self.module.model.sequence_tree
+                plate = tree.plates[tree.first[self.module.node] + k]
+                if self.attribute is None: return plate
+                item = getattr(self.module.model, self.attribute)[plate]
+                if self.field is None: return item
+                return getattr(item, self.field)
+
+            def __iter__(self):
+                for k in range(len(self)):
+                    yield self[k]
+
+            def __eq__(self, other):
+                if not isinstance(other, (list, tuple, ModuleView)): return NotImplemented
+                return list(self) == list(other)
+
+            def __ne__(self, other):
+                equal = self.__eq__(other)
+                if equal is NotImplemented: return equal
+                return not equal
+
+            __hash__ = None # views are compared by their items, which change with the sequence
+
+            def __repr__(self):
+                return repr(list(self))
+
+            def to_list(self):
+                """items as a plain list, for component outputs"""
+                return list(self)
+
+        #Sequences -----------------------------------------------------------------------
+
+        class SequenceTree(object):
+            """
+            Assembly sequence parsed once. Nodes are numbered in preorder, node 0 is the whole sequence.
+            A node is a module (value None) or a plate (value = plate index).
+            Plates of node n are plates[first[n]:last[n]], in sequence order.
+            """
+
+            def __init__(self, sequence):
+                self.value = []
+                self.parent = []
+                self.children = []
+                self.depth = []
+                self.index = [] # position of the node in its parent
+                self.first = []
+                self.last = []
+                self.plates = []
+                self.leaf = {} # plate -> node
+                self.__parse(str(sequence))
+                self.modules = self.__get_modules()
+
+            def __repr__(self):
+                return 'SequenceTree(' + self.text() + ')'
+
+            def __len__(self):
+                return len(self.plates)
+
+            def __add_node(self, parent, value):
+                n = len(self.value)
+                self.value.append(value)
+                self.parent.append(parent)
+                self.children.append([])
+                self.first.append(len(self.plates))
+                self.last.append(len(self.plates))
+                if parent < 0:
+                    self.depth.append(0)
+                    self.index.append(0)
+                else:
+                    self.depth.append(self.depth[parent] + 1)
+                    self.index.append(len(self.children[parent]))
+                    self.children[parent].append(n)
+                return n
+
+            def __parse(self, text):
+                """single pass over the text, nested lists of integers only"""
+                text = text.strip()
+                if len(text) <= 2: raise Exception(' Error is sequence input.')
+                if text[0] != '[' or text[-1] != ']': raise Exception(' Sequence should start and end with hooks.')
+                digits = '0123456789'
+                stack = []
+                need = True # an item is expected
+                i = 0
+                while i < len(text):
+                    c = text[i]
+                    if c == '[':
+                        if not need: raise Exception(' Missing coma(s) in sequence.')
+                        if stack == [] and len(self.value) > 0: raise Exception(' Missing hook(s) in sequence.')
+                        stack.append(self.__add_node(stack[-1] if stack != [] else -1, None))
+                    elif c == ']':
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if self.children[stack[-1]] == []: raise Exception(' Empty module in sequence.')
+                        if need: raise Exception(' Missing coma(s) in sequence.')
+                        self.last[stack.pop()] = len(self.plates)
+                    elif c == ',':
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if need: raise Exception(' Missing coma(s) in sequence.')
+                        need = True
+                        i += 1
+                        continue
+                    elif c in digits:
+                        j = i
+                        while j < len(text) and text[j] in digits: j += 1
+                        plate = int(text[i:j])
+                        if not need: raise Exception(' Missing coma(s) in sequence.')
+                        if stack == []: raise Exception(' Missing hook(s) in sequence.')
+                        if plate in self.leaf: raise Exception(' Plate ' + str(plate) + ' appears several times in sequence.')
+                        self.leaf[plate] = self.__add_node(stack[-1], plate)
+                        self.plates.append(plate)
+                        self.last[-1] = len(self.plates)
+                        need = False
+                        i = j
+                        continue
+                    elif c == ' ': 
+                        i += 1
+                        continue
+                    else: raise Exception(' Invalid character in sequence.')
+                    need = c == '['
+                    i += 1
+                if stack != []: raise Exception(' Missing hook(s) in sequence.')
+
+            def __get_modules(self):
+                """modules deepest first (in sequence order for a same depth), the whole sequence last"""
+                buckets = []
+                for n in range(1, len(self.value)):
+                    if self.value[n] is None:
+                        while len(buckets) < self.depth[n]: buckets.append([])
+                        buckets[self.depth[n] - 1].append(n)
+                buckets.reverse()
+                return [n for bucket in buckets for n in bucket] + [0]
+
+            # ACCESS -----------------------------------------------------
+
+            def path(self, n):
+                """path of a node as a list of indices, [] for the whole sequence"""
+                path = []
+                while n > 0:
+                    path.append(self.index[n])
+                    n = self.parent[n]
+                path.reverse()
+                return path
+
+            def node(self, path):
+                """node at a path ('Model', [] or a list of indices)"""
+                n = 0
+                if path == 'Model' or path == ['Model']: return n
+                for j in path:
+                    if self.value[n] is not None or j >= len(self.children[n]): raise Exception(' Path ' + str(path) + ' is not in the sequence.')
+                    n = self.children[n][j]
+                return n
+
+            def members(self, n=0):
+                """plates of a node in sequence order"""
+                return self.plates[self.first[n]:self.last[n]]
+
+            def leaves(self):
+                """plate nodes in sequence order"""
+                return [self.leaf[p] for p in self.plates]
+
+            def item(self, n=0):
+                """node as a nested list (or an integer for a plate)"""
+                if self.value[n] is not None: return self.value[n]
+                return [self.item(c) for c in self.children[n]]
+
+            def text(self, n=0, names=None):
+                """node as a sequence string, plates can be renamed with a dictionary"""
+                if self.value[n] is not None:
+                    if names is None: return str(self.value[n])
+                    return str(names[self.value[n]])
+                return '[' + ','.join([self.text(c, names) for c in self.children[n]]) + ']'
+
+            def renumbered(self):
+                """same tree with plates numbered in sequence order"""
+                return SequenceTree(self.text(0, dict([(self.plates[k], k) for k in range(len(self.plates))])))
+
+            @staticmethod
+            def from_paths(paths, values):
+                """tree from the paths of its plates (as seq_to_tree datatree branches)"""
+                root = []
+                for (path, value) in zip(paths, values):
+                    item = root
+                    for j in path[:-1]:
+                        if j == len(item): item.append([])
+                        if j > len(item) or type(item[j]) is not list: raise Exception(' Datatree paths do not describe a sequence.')
+                        item = item[j]
+                    if len(path) == 0 or path[-1] != len(item): raise Exception(' Datatree paths do not describe a sequence.')
+                    item.append(int(value))
+                return SequenceTree(root)
+
+        class SequenceEvaluator(object):
+            """
+            Edit the assembly sequence of a model without rebuilding it.
+            Topology and insertion constraints of the model are kept, only the steps whose plates in place changed are evaluated again.
+            Modules are addressed by their path in the sequence (as PlateModule.step), the whole sequence is 'Model' or the empty path.
+            Plates (sequence string, swap, move, locate) are the indices of the breps as given to the model, as in its sequence.
+            Results are dictionaries {module path: list of step values}.
+            """
+
+            def __init__(self, model, sequence=None):
+                self.model = model
+                self.__position = dict([(model.input_order[i], i) for i in range(model.count)])
+                if sequence is None: self.sequence = model.sequence_tree.item()
+                else:
+                    def rename(item):
+                        if type(item) is list: return [rename(x) for x in item]
+                        return self.__plate(item)
+                    self.sequence = rename(SequenceTree(sequence).item())
+                self.assembly_vectors = {}
+                self.assembly_spaces = {}
+                self.assembly_relatives = {}
+                self.history = []
+                self.__evaluate(dict([(path, 0) for path in self.module_paths()]))
+
+            def __repr__(self):
+                return 'SequenceEvaluator(' + self.text() + ')'
+
+            def __plate(self, plate):
+                """index in the model of a plate given as a brep index"""
+                if plate not in self.__position: raise Exception(' Plate ' + str(plate) + ' is not in the model.')
+                return self.__position[plate]
+
+            def module_paths(self):
+                """paths of all modules, the whole sequence first (empty path)"""
+                paths = [()]
+                for path in paths:
+                    module = self.module(path)
+                    paths += [path + (j,) for j in range(len(module)) if type(module[j]) is list]
+                return paths
+
+            def module(self, path):
+                """module list at a path ('Model', [] or a list of indices)"""
+                item = self.sequence
+                for j in SequenceEvaluator.as_path(path):
+                    item = item[j]
+                if type(item) is not list: raise Exception(' Path ' + str(path) + ' does not lead to a module.')
+                return item
+
+            def locate(self, plate):
+                """path of a plate (brep index) in the sequence"""
+                plate = self.__plate(plate)
+                paths = [()]
+                for path in paths:
+                    module = self.module(path)
+                    for j in range(len(module)):
+                        if module[j] == plate: return path + (j,)
+                        if type(module[j]) is list: paths.append(path + (j,))
+                raise Exception(' Plate ' + str(plate) + ' is not in the sequence.')
+
+            def text(self):
+                """sequence string, indices refer to the breps as given to the model"""
+                def rename(item):
+                    if type(item) is list: return [rename(x) for x in item]
+                    return self.model.input_order[item]
+                return str(rename(self.sequence))
+
+            @staticmethod
+            def as_path(path):
+                if path == 'Model' or path == ['Model']: return ()
+                return tuple(path)
+
+            @staticmethod
+            def shift_path(path, parent, index, delta):
+                """shift a path after an item was removed (delta=-1) or inserted (delta=1) at index of the parent module"""
+                n = len(parent)
+                if len(path) > n and path[:n] == parent and path[n] >= index:
+                    return path[:n] + (path[n] + delta,) + path[n+1:]
+                return path
+
+            # EDITION ----------------------------------------------------
+
+            def swap(self, a, b, record=True):
+                """swap plates a and b (brep indices), return {module path: (vectors, spaces)} of the evaluated modules"""
+                path_a, path_b = self.locate(a), self.locate(b)
+                self.module(path_a[:-1])[path_a[-1]] = self.__plate(b)
+                self.module(path_b[:-1])[path_b[-1]] = self.__plate(a)
+                if record: self.history.append(('swap', a, b))
+                return self.__evaluate(self.__invalidated(path_a, path_b))
+
+            def move(self, plate, module, position=None, record=True):
+                """move a plate (brep index) to a module (path), at the end or at a given position, return {module path: (vectors, spaces)} of the evaluated modules"""
+                old = self.locate(plate)
+                parent, index = old[:-1], old[-1]
+                target = SequenceEvaluator.as_path(module)
+                self.module(target)
+                if len(self.module(parent)) == 1: raise Exception(' Module ' + str(list(parent)) + ' cannot be emptied.')
+
+                # remove the plate
+                del self.module(parent)[index]
+                self.__shift(parent, index + 1, -1)
+                target = SequenceEvaluator.shift_path(target, parent, index + 1, -1)
+
+                # insert the plate
+                members = self.module(target)
+                if position is None or position > len(members): position = len(members)
+                members.insert(position, self.__plate(plate))
+                self.__shift(target, position, 1)
+                parent = SequenceEvaluator.shift_path(parent, target, position, 1)
+                new = target + (position,)
+
+                if record: self.history.append(('move', plate, parent, index))
+                return self.__evaluate(self.__invalidated(parent + (index,), new))
+
+            def undo(self):
+                """revert the last edition, return {module path: (vectors, spaces)} of the evaluated modules"""
+                if self.history == []: raise Exception(' Nothing to undo.')
+                action = self.history.pop()
+                if action[0] == 'swap': return self.swap(action[1], action[2], record=False)
+                return self.move(action[1], action[2], action[3], record=False)
+
+            # EVALUATION -------------------------------------------------
+
+            def __shift(self, parent, index, delta):
+                """rename the results of the modules shifted by a removal or an insertion"""
+                for results in [self.assembly_vectors, self.assembly_spaces, self.assembly_relatives]:
+                    items = list(results.items())
+                    results.clear()
+                    for (path, value) in items:
+                        results[SequenceEvaluator.shift_path(path, parent, index, delta)] = value
+
+            def __invalidated(self, path_a, path_b):
+                """first step to evaluate again in each module containing path_a or path_b, below their common module"""
+                common = 0
+                while common < min(len(path_a), len(path_b)) and path_a[common] == path_b[common]: common += 1
+                starts = {}
+                for path in [path_a, path_b]:
+                    for level in range(min(common, len(path) - 1), len(path)):
+                        module = path[:level]
+                        starts[module] = min(starts.get(module, path[level]), path[level])
+                return starts
+
+            def __evaluate(self, starts):
+                """evaluate the steps of each module from its first invalidated step"""
+                adj = self.model.contact_ids
+                updated = {}
+                for (path, start) in starts.items():
+                    module = self.module(path)
+                    vectors = self.assembly_vectors.get(path, [])[:start]
+                    spaces = self.assembly_spaces.get(path, [])[:start]
+                    relatives = self.assembly_relatives.get(path, [])[:start]
+                    placed = set(Toolbox.Data.flatten_integer_list(module[:start]))
+                    for j in range(start, len(module)):
+                        unit = module[j] if type(module[j]) is list else [module[j]]
+                        unit = Toolbox.Data.flatten_integer_list(unit)
+                        found = [(p, nb) for p in unit for nb in adj[p] if nb in placed]
+                        if j == 0 or found == []:
+                            vectors.append("gravity")
+                            spaces.append([])
+                            relatives.append([])
+                        else:
+                            entry = self.model.insertion_entry(tuple(sorted(unit)), sorted(found)) # same entry whatever the order inside the unit
+                            if entry['feasible']:
+                                vectors.append(entry['vector'])
+                                spaces.append([rg.Point3d(p[0], p[1], p[2]) for p in Toolbox.Cones.samples(entry['region'])])
+                            else:
+                                vectors.append("gravity")
+                                spaces.append([])
+                            relatives.append(entry['relatives'])
+                        placed.update(unit)
+                    self.assembly_vectors[path] = vectors
+                    self.assembly_spaces[path] = spaces
+                    self.assembly_relatives[path] = relatives
+                    updated[path] = (vectors, spaces)
+                return updated
+
+
+        #Contacts -----------------------------------------------------------------------
+
+        class ContactTable:
+            """
+            Contacts of a model stored as columns, rows sorted by plate then by neighbour.
+            Plate i owns rows offsets[i] to offsets[i+1], row r is the contact of plate i[r] with plate j[r],
+            reverse[r] is the row of the same contact seen from plate j[r] (-1 if missing).
+            Centers, normals and plane axes are stored as 3 floats per row.
+            Rows of the views are built on first access and cached until the contacts of their plate are transformed.
+            """
+
+            TYPES = ['FF', 'FS', 'SF', 'ES', 'SE', 'SS', 'IN']
+            STRINGS = {
+                'FF': 'Face of plate {0} is connected to Face of plate {1}',
+                'FS': 'Face of plate {0} is connected to Side of plate {1}',
+                'SF': 'Side of plate {0} is connected to Face of plate {1}',
+                'ES': 'Edge of plate {0} is connected to Side of plate {1}',
+                'SE': 'Side of plate {0} is connected to Edge of plate {1}',
+                'SS': 'Side of plate {0} is connected to Side of plate {1}',
+                'IN': 'Volume of plate {0} is intersecting volume of plate {1}'}
+
+            def __init__(self, ids, types, centers, normals, planes):
+                self.count = len(ids)
+                self.cache = {} # (column, plate): row built by a view
+                self.offsets = array('i', [0])
+                self.i = array('i')
+                self.j = array('i')
+                self.reverse = array('i')
+                self.type = array('B')
+                self.center = array('d')
+                self.normal = array('d')
+                self.xaxis = array('d')
+                self.yaxis = array('d')
+                for i in range(self.count):
+                    for k in range(len(ids[i])):
+                        self.i.append(i)
+                        self.j.append(ids[i][k])
+                        self.type.append(ContactTable.TYPES.index(types[i][k]))
+                        self.center.extend([centers[i][k].X, centers[i][k].Y, centers[i][k].Z])
+                        self.normal.extend([normals[i][k].X, normals[i][k].Y, normals[i][k].Z])
+                        self.xaxis.extend([planes[i][k].XAxis.X, planes[i][k].XAxis.Y, planes[i][k].XAxis.Z])
+                        self.yaxis.extend([planes[i][k].YAxis.X, planes[i][k].YAxis.Y, planes[i][k].YAxis.Z])
+                    self.offsets.append(len(self.i))
+                self.reverse = self.__get_reverse()
+
+            def __get_reverse(self):
+                rows = dict([((self.i[r], self.j[r]), r) for r in range(len(self.i))])
+                return array('i', [rows.get((self.j[r], self.i[r]), -1) for r in range(len(self.i))])
+
+            def rows(self, i):
+                """rows of plate i"""
+                return range(self.offsets[i], self.offsets[i+1])
+
+            def row(self, i, nb):
+                """row of the contact of plate i with plate nb, -1 if missing"""
+                for r in self.rows(i):
+                    if self.j[r] == nb: return r
+                return -1
+
+            def view(self, column, items=None):
+                """
+                Per plate list of lists view of a column: ids, pairs, types, strings, centers, normals or planes.
+                If items are provided, neighbour ids are replaced by the corresponding items (e.g. model breps).
+                """
+                return ContactView(self, column, items)
+
+            # ROWS OF A PLATE --------------------------------------------
+
+            def ids(self, i):
+                return list(self.j[self.offsets[i]:self.offsets[i+1]])
+
+            def pairs(self, i):
+                return ['(' + str(i) + ',' + str(nb) + ')' for nb in self.ids(i)]
+
+            def types(self, i):
+                return [ContactTable.TYPES[code] for code in self.type[self.offsets[i]:self.offsets[i+1]]]
+
+            def strings(self, i):
+                return [ContactTable.STRINGS[ctype].format(i, nb) for (ctype, nb) in zip(self.types(i), self.ids(i))]
+
+            def centers(self, i):
+                c = self.center
+                return [rg.Point3d(c[3*r], c[3*r+1], c[3*r+2]) for r in self.rows(i)]
+
+            def normals(self, i):
+                n = self.normal
+                return [rg.Vector3d(n[3*r], n[3*r+1], n[3*r+2]) for r in self.rows(i)]
+
+            def planes(self, i):
+                c, x, y = self.center, self.xaxis, self.yaxis
+                return [rg.Plane(rg.Point3d(c[3*r], c[3*r+1], c[3*r+2]), rg.Vector3d(x[3*r], x[3*r+1], x[3*r+2]), rg.Vector3d(y[3*r], y[3*r+1], y[3*r+2])) for r in self.rows(i)]
+
+            # BULK OPERATIONS --------------------------------------------
+
+            def select(self, types):
+                """rows of the given contact types"""
+                codes = set([ContactTable.TYPES.index(t) for t in types])
+                return [r for r in range(len(self.type)) if self.type[r] in codes]
+
+            def transform(self, matrix, plates=None):
+                """apply a rhino transformation to the centers, normals and plane axes of all plates (or of some plates)"""
+                m = [[matrix[a, b] for b in range(4)] for a in range(4)]
+                if plates is None: plates = range(self.count)
+                for i in plates:
+                    for column in ['centers', 'normals', 'planes']: self.cache.pop((column, i), None)
+                    for r in self.rows(i):
+                        k = 3 * r
+                        x, y, z = self.center[k], self.center[k+1], self.center[k+2]
+                        w = m[3][0]*x + m[3][1]*y + m[3][2]*z + m[3][3]
+                        for a in range(3):
+                            self.center[k+a] = (m[a][0]*x + m[a][1]*y + m[a][2]*z + m[a][3]) / w
+                        for column in [self.normal, self.xaxis, self.yaxis]:
+                            x, y, z = column[k], column[k+1], column[k+2]
+                            v = [m[a][0]*x + m[a][1]*y + m[a][2]*z for a in range(3)]
+                            length = math.sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+                            if length > 0:
+                                for a in range(3): column[k+a] = v[a] / length
+
+            def to_dict(self):
+                """columns as plain lists (for serialization)"""
+                return {'count': self.count, 'offsets': list(self.offsets), 'i': list(self.i), 'j': list(self.j), 'type': list(self.type), 
+                    'center': list(self.center), 'normal': list(self.normal), 'xaxis': list(self.xaxis), 'yaxis': list(self.yaxis)}
+
+            @staticmethod
+            def from_dict(data):
+                """rebuild a table from the output of to_dict"""
+                table = ContactTable([], [], [], [], [])
+                table.count = data['count']
+                for name, code in [('offsets','i'), ('i','i'), ('j','i'), ('type','B'), ('center','d'), ('normal','d'), ('xaxis','d'), ('yaxis','d')]:
+                    setattr(table, name, array(code, data[name]))
+                table.reverse = table._ContactTable__get_reverse()
+                return table
+
+
+        class ContactView:
+            """List of lists view of a contact table column, rows are built on first access and cached by the table"""
+
+            def __init__(self, table, column, items=None):
+                self.table = table
+                self.column = column
+                self.items = items
+
+            def __len__(self):
+                return self.table.count
+
+            def __getitem__(self, i):
+                if isinstance(i, slice): return [self[k] for k in range(*i.indices(len(self)))]
+                if i < 0: i += self.table.count
+                if not 0 <= i < self.table.count: raise IndexError('contact view index out of range')
+                key = (self.column, i)
+                if key not in self.table.cache: self.table.cache[key] = getattr(self.table, self.column)(i)
+                row = self.table.cache[key]
+                if self.items is not None: return [self.items[k] for k in row]
+                return row
+
+            def __iter__(self):
+                for i in range(self.table.count):
+                    yield self[i]
+
+
+        class ContactRows:
+            """Per plate rows computed on first access by a method of the model, then cached"""
+
+            def __init__(self, model, method):
+                self.model = model
+                self.method = method
+                self.rows = {}
+
+            def __len__(self):
+                return self.model.count
+
+            def __getitem__(self, i):
+                if isinstance(i, slice): return [self[k] for k in range(*i.indices(len(self)))]
+                if i < 0: i += self.model.count
+                if not 0 <= i < self.model.count: raise IndexError('contact rows index out of range')
+                if i not in self.rows:
+                    self.rows[i] = getattr(self.model, self.method)(i)
+                return self.rows[i]
+
+            def __iter__(self):
+                for i in range(self.model.count):
+                    yield self[i]
+
+            def reset(self, i):
+                """forget the row of plate i, it will be computed again on next access"""
+                self.rows.pop(i, None)
+
+            def subset(self, ids):
+                """rows of some plates only, sharing the cache of these rows"""
+                return ContactSubset(self, ids)
+
+
+        class ContactSubset:
+            """Rows of some plates of a ContactRows or ContactView, accessed on demand"""
+
+            def __init__(self, rows, ids):
+                self.rows = rows
+                self.ids = ids
+
+            def __len__(self):
+                return len(self.ids)
+
+            def __getitem__(self, k):
+                if isinstance(k, slice): return [self.rows[i] for i in self.ids[k]]
+                return self.rows[self.ids[k]]
+
+            def __iter__(self):
+                for i in self.ids:
+                    yield self.rows[i]
+
+
+        #Insertion -----------------------------------------------------------------------
+
+        class InsertionConstraint(object):
+            """insertion space of a contact: directions within alpha (XZ) and beta (YZ) angular limits around the z axis of a frame, trimmed by halfspaces"""
+
+            def __init__(self, alpha=180, beta=180, frame=None, trims=[], local=None, geometry=None):
+                self.alpha = float(alpha)
+                self.beta = float(beta)
+                self.frame = frame # rhino plane, world XY if None
+                self.trims = [Toolbox.Vectors.unitize(n) for n in trims] # world normals n of halfspaces n.v >= 0
+                self.local = local if local is not None else InsertionConstraint.local_cone(self.alpha, self.beta)
+                self.geometry = geometry # source geometry of custom constraints, for display only
+                self.__cone = None
+
+            def __repr__(self):
+                return 'InsertionConstraint(alpha=' + str(self.alpha) + ', beta=' + str(self.beta) + ', trims=' + str(len(self.trims)) + ')'
+
+            @staticmethod
+            def local_cone(alpha, beta):
+                """cone of directions in the constraint frame, see constraint component"""
+                if alpha == 0 and beta == 0: return Toolbox.Cones.cone([], [], [(0,0,1)])
+                halfspaces, planes = [((0,0,1), 0)], []
+                a, b = math.radians(alpha) / 2, math.radians(beta) / 2
+                if alpha == 0: planes.append((1,0,0))
+                elif alpha < 180: halfspaces += [((math.cos(a), 0, math.sin(a)), 0), ((-math.cos(a), 0, math.sin(a)), 0)]
+                if beta == 0: planes.append((0,1,0))
+                elif beta < 180: halfspaces += [((0, math.cos(b), math.sin(b)), 0), ((0, -math.cos(b), math.sin(b)), 0)]
+                return Toolbox.Cones.merge([Toolbox.Cones.cone(halfspaces, planes)])
+
+            @staticmethod
+            def from_input(constraint):
+                """constraint from a constraint component object (alpha and beta attributes), an InsertionConstraint or geometry on the unit sphere"""
+                if isinstance(constraint, list): constraint = constraint[0]
+                if isinstance(constraint, InsertionConstraint): return constraint
+                if hasattr(constraint, 'alpha') and hasattr(constraint, 'beta'): return InsertionConstraint(constraint.alpha, constraint.beta)
+                return InsertionConstraint(local=Toolbox.Cones.from_geometry(constraint), geometry=constraint)
+
+            @property
+            def cone(self):
+                """cone of directions in the world frame"""
+                if self.__cone is None:
+                    cone = self.local
+                    if self.frame is not None: cone = Toolbox.Cones.orient(cone, self.frame)
+                    if self.trims: cone = Toolbox.Cones.merge([cone, Toolbox.Cones.cone([(n, 0) for n in self.trims])])
+                    self.__cone = cone
+                return self.__cone
+
+            def oriented(self, frame, trims=[]):
+                """same constraint expressed in another frame, with extra trimming halfspaces"""
+                return InsertionConstraint(self.alpha, self.beta, frame, self.trims + list(trims), self.local, self.geometry)
+
+            def transform(self, matrix):
+                """constraint moved by a rhino transformation, only its rotation matters"""
+                frame = rg.Plane(self.frame) if self.frame is not None else rg.Plane.WorldXY
+                frame.Transform(matrix)
+                trims = Toolbox.Cones.transform(Toolbox.Cones.cone([(n, 0) for n in self.trims]), matrix)['halfspaces']
+                return InsertionConstraint(self.alpha, self.beta, frame, [n for (n, c) in trims], self.local, self.geometry)
+
+            def to_geometry(self, center=(0,0,0), scale=1.0):
+                """rhino geometry of the constraint as a piece of sphere centered on a point, for display"""
+                tolerance = 0.001
+                if self.geometry is not None: geometry = rs.coercegeometry(self.geometry).Duplicate()
+                elif self.alpha == 0 and self.beta == 0: geometry = rg.Point(rg.Point3d(0,0,1))
+                elif self.alpha == 0 or self.beta == 0:
+                    angle = math.radians(max(self.alpha, self.beta)) / 2
+                    if self.alpha == 0: u = rg.Vector3d(0,1,0)
+                    else: u = rg.Vector3d(1,0,0)
+                    points = [rg.Point3d(u * math.sin(t) + rg.Vector3d(0,0,1) * math.cos(t)) for t in (-angle, 0, angle)]
+                    geometry = rg.ArcCurve(rg.Arc(points[0], points[1], points[2]))
+                else:
+                    geometry = rg.Sphere(rg.Point3d(0,0,0), 1).ToBrep()
+                    for (n, c) in self.local['halfspaces']:
+                        pieces = geometry.Trim(rg.Plane(rg.Point3d(0,0,0), rg.Vector3d(-n[0], -n[1], -n[2])), tolerance)
+                        if pieces: geometry = pieces[0]
+                frame = rg.Plane(self.frame) if self.frame is not None else rg.Plane(rg.Plane.WorldXY)
+                frame.Origin = rg.Point3d(center[0], center[1], center[2])
+                geometry.Transform(rg.Transform.Scale(rg.Point3d(0,0,0), scale))
+                geometry.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, frame))
+                if self.trims and isinstance(geometry, rg.Brep):
+                    for n in self.trims:
+                        pieces = geometry.Trim(rg.Plane(frame.Origin, rg.Vector3d(-n[0], -n[1], -n[2])), tolerance)
+                        if pieces: geometry = pieces[0]
+                return geometry
 
             pass
 
         #Plates -----------------------------------------------------------------------
 
-        class Plate:
+        class Plate(object):
+
+            # geometric properties computed on first access by __get_<name> and cached in slot _<name>
+            LAZY = ['top_face', 'bottom_face', 'top_contour', 'bottom_contour', 'mid_contour', 'top_holes', 'bottom_holes',
+                'top_center', 'bottom_center', 'plate_center', 'top_normal', 'bottom_normal', 'top_plane', 'bottom_plane',
+                'mid_plane', 'thickness', 'top_vertices', 'bottom_vertices']
+
+            __slots__ = ['temp', 'index', 'brep', 'joints_positives', 'joints_negatives', 'joints_keys',
+                'top_milling_contour', 'bottom_milling_contour', 'top_milling_holes', 'bottom_milling_holes'] + ['_' + name for name in LAZY]
+
+            def __lazy(name):
+                slot = '_' + name
+                getter = '_Plate__get_' + name
+                def fget(self):
+                    try: return getattr(self, slot)
+                    except AttributeError:
+                        value = getattr(self, getter)()
+                        setattr(self, slot, value)
+                        return value
+                def fset(self, value):
+                    setattr(self, slot, value)
+                return property(fget, fset)
+
+            top_face = __lazy('top_face')
+            bottom_face = __lazy('bottom_face')
+            top_contour = __lazy('top_contour')
+            bottom_contour = __lazy('bottom_contour')
+            mid_contour = __lazy('mid_contour')
+            top_holes = __lazy('top_holes')
+            bottom_holes = __lazy('bottom_holes')
+            top_center = __lazy('top_center')
+            bottom_center = __lazy('bottom_center')
+            plate_center = __lazy('plate_center')
+            top_normal = __lazy('top_normal')
+            bottom_normal = __lazy('bottom_normal')
+            top_plane = __lazy('top_plane')
+            bottom_plane = __lazy('bottom_plane')
+            mid_plane = __lazy('mid_plane')
+            thickness = __lazy('thickness')
+            top_vertices = __lazy('top_vertices')
+            bottom_vertices = __lazy('bottom_vertices')
 
             def __init__(self, brep, index):
 
@@ -2539,23 +3735,7 @@ if yes:
 
                 self.temp = []
                 self.index = index
-                self.brep = copy.deepcopy(brep)
-                self.top_face = self.__get_top_face()
-                self.bottom_face = self.__get_bottom_face()
-                self.top_contour = self.__get_top_contour()
-                self.bottom_contour = self.__get_bottom_contour()
-                self.mid_contour = self.__get_mid_contour()
-                self.top_holes = self.__get_top_holes()
-                self.bottom_holes = self.__get_bottom_holes()
-                self.top_center = self.__get_top_center()
-                self.bottom_center = self.__get_bottom_center()
-                self.plate_center =self.__get_plate_center()
-                self.top_normal = self.__get_top_normal()
-                self.bottom_normal = self.__get_bottom_normal()
-                self.top_plane = self.__get_top_plane()
-                self.bottom_plane = self.__get_bottom_plane()
-                self.mid_plane = self.__get_mid_plane()
-                self.thickness = self.__get_thickness()
+                self.brep = brep # shared with the model, geometric properties are computed on demand
 
                 # JOINERY --------------------------------------------
 
@@ -2571,21 +3751,34 @@ if yes:
                 self.bottom_milling_holes = []
 
 
+            def __get_faces(self):
+                """classify faces once to get top and bottom faces, their outward normals and the thickness"""
+                faces = Toolbox.Surfaces.classify_faces(self.brep)
+                if faces is None:
+                    # no pair of parallel planar faces, falling back on the two largest faces
+                    sortedfaces = Toolbox.Surfaces.sort_surfaces_by_area(self.brep.Faces)
+                    sortedfaces.reverse()
+                    top_and_bottom = [sortedfaces[0][0],sortedfaces[1][0]]
+                    by_altitude = Toolbox.Surfaces.sort_surfaces_by_altitude(top_and_bottom)
+                    faces = {'top': by_altitude[1][0], 'bottom': by_altitude[0][0]}
+                if not hasattr(self, '_top_face'): self._top_face = faces['top']
+                if not hasattr(self, '_bottom_face'): self._bottom_face = faces['bottom']
+                if 'thickness' in faces:
+                    if not hasattr(self, '_top_normal'): self._top_normal = faces['top_normal']
+                    if not hasattr(self, '_bottom_normal'): self._bottom_normal = faces['bottom_normal']
+                    if not hasattr(self, '_thickness'): self._thickness = faces['thickness']
+                return (self._top_face, self._bottom_face)
+
+            def __get_classified(self, name):
+                """value set by the face classification, None if it could not provide it"""
+                if not hasattr(self, '_top_face'): self.__get_faces()
+                return getattr(self, '_' + name, None)
+
             def __get_top_face(self):
-                faces = self.brep.Faces
-                sortedfaces = Toolbox.Surfaces.sort_surfaces_by_area(faces)
-                sortedfaces.reverse()
-                top_and_bottom = [sortedfaces[0][0],sortedfaces[1][0]]
-                top_face = Toolbox.Surfaces.sort_surfaces_by_altitude(top_and_bottom)[1][0]
-                return top_face
+                return self.__get_faces()[0]
 
             def __get_bottom_face(self):
-                faces = self.brep.Faces
-                sortedfaces = Toolbox.Surfaces.sort_surfaces_by_area(faces)
-                sortedfaces.reverse()
-                top_and_bottom = [sortedfaces[0][0],sortedfaces[1][0]]
-                bottom_face = Toolbox.Surfaces.sort_surfaces_by_altitude(top_and_bottom)[0][0]
-                return bottom_face
+                return self.__get_faces()[1]
 
             def __get_top_contour(self):
                 largest_contour = Toolbox.Surfaces.get_face_largest_contour(self.top_face)
@@ -2608,6 +3801,12 @@ if yes:
                     mid_vertices.append((top_vertices[i]+bottom_vertices[i])/2)
                 return rs.coercecurve(rs.AddPolyline(mid_vertices))
 
+            def __get_top_vertices(self):
+                return Toolbox.Curves.vertices_array(self.top_contour)
+
+            def __get_bottom_vertices(self):
+                return Toolbox.Curves.vertices_array(self.bottom_contour)
+
             def __get_top_holes(self):
                 return Toolbox.Surfaces.get_face_other_contours(self.top_face)
 
@@ -2632,12 +3831,16 @@ if yes:
                 return (self.top_center + self.bottom_center) /2
 
             def __get_top_normal(self):
+                normal = self.__get_classified('top_normal')
+                if normal is not None: return normal
                 normal = rs.SurfaceNormal(self.top_face,[0,0])
                 if Toolbox.Vectors.is_vector_outward(self.plate_center, self.top_center, normal) is True:
                     return normal
                 else: return -normal
 
             def __get_bottom_normal(self):
+                normal = self.__get_classified('bottom_normal')
+                if normal is not None: return normal
                 normal = rs.SurfaceNormal(self.bottom_face,[0,0])
                 if Toolbox.Vectors.is_vector_outward(self.plate_center, self.bottom_center, normal) is True:
                     return normal
@@ -2654,9 +3857,14 @@ if yes:
                 return rs.CreatePlane(self.bottom_center,self.top_plane.YAxis,self.top_plane.XAxis)
 
             def __get_mid_plane(self):
-                return rs.CreatePlane(self.plate_center,self.top_plane.XAxis,self.top_plane.YAxis)
+                if self.__get_classified('thickness') is not None:
+                    origin = self.top_center - self.top_normal * (self.thickness / 2)
+                else: origin = self.plate_center
+                return rs.CreatePlane(origin,self.top_plane.XAxis,self.top_plane.YAxis)
 
             def __get_thickness(self):
+                thickness = self.__get_classified('thickness')
+                if thickness is not None: return thickness
                 pointA = self.top_center
                 pointB = rg.Plane.ClosestPoint(self.bottom_plane, pointA)
                 t = rg.Point3d.DistanceTo(pointA,pointB)
@@ -2704,6 +3912,34 @@ if yes:
                     brep = rs.coercebrep(brep)
                     return rg.AreaMassProperties.Compute(brep).Centroid
                 
+                @staticmethod
+                def brep_hash(brep, tolerance=0.001):
+                    """hash of the brep vertices rounded to the tolerance, to detect modified breps"""
+                    digits = max(int(-math.floor(math.log10(tolerance))), 0)
+                    brep = rs.coercebrep(brep)
+                    return hash(tuple([(round(v.Location.X, digits), round(v.Location.Y, digits), round(v.Location.Z, digits)) for v in brep.Vertices]))
+
+                @staticmethod
+                def intersection_record(brep1, brep2, tolerance):
+                    """
+                    Intersect two breps without adding objects to the document (thread safe).
+                    Return a dictionary with the intersection curve (as a list, like rs.IntersectBreps), its closed and planar flags.
+                    """
+                    record = {'curve': None, 'closed': False, 'planar': False, 'volume': None}
+                    rc = rg.Intersect.Intersection.BrepBrep(rs.coercebrep(brep1), rs.coercebrep(brep2), tolerance)
+                    if rc[0] and len(rc[1]) > 0:
+                        curves = rg.Curve.JoinCurves(rc[1], 2.1 * tolerance)
+                        if len(curves) == 1 and len(rc[2]) == 0:
+                            record['curve'] = [curves[0]]
+                            record['closed'] = curves[0].IsClosed
+                            record['planar'] = record['closed'] and curves[0].IsPlanar(tolerance)
+                    return record
+
+                @staticmethod
+                def intersection_volume(brep1, brep2, tolerance=0.1):
+                    """boolean intersection of two breps (thread safe)"""
+                    return rg.Brep.CreateBooleanIntersection(rs.coercebrep(brep1), rs.coercebrep(brep2), tolerance)[0]
+
                 @staticmethod
                 def slice_2_planes(brep, top_plane, bottom_plane):
                     #top plane
@@ -2762,6 +3998,85 @@ if yes:
                     return box
 
 
+            class Boxes:
+                """Axis-aligned bounding boxes stored as tuples (xmin, ymin, zmin, xmax, ymax, zmax)"""
+
+                @staticmethod
+                def brep_box(brep, tolerance=0.0):
+                    """get the bounding box of a brep inflated by a tolerance"""
+                    box = rs.coercebrep(brep).GetBoundingBox(True)
+                    return (box.Min.X - tolerance, box.Min.Y - tolerance, box.Min.Z - tolerance,
+                        box.Max.X + tolerance, box.Max.Y + tolerance, box.Max.Z + tolerance)
+
+                @staticmethod
+                def points_box(points, tolerance=0.0):
+                    """get the bounding box of a list of points inflated by a tolerance"""
+                    xs = [pt[0] for pt in points]
+                    ys = [pt[1] for pt in points]
+                    zs = [pt[2] for pt in points]
+                    return (min(xs) - tolerance, min(ys) - tolerance, min(zs) - tolerance,
+                        max(xs) + tolerance, max(ys) + tolerance, max(zs) + tolerance)
+
+                @staticmethod
+                def union(boxes):
+                    """get the bounding box of a list of boxes"""
+                    return (min([b[0] for b in boxes]), min([b[1] for b in boxes]), min([b[2] for b in boxes]),
+                        max([b[3] for b in boxes]), max([b[4] for b in boxes]), max([b[5] for b in boxes]))
+
+                @staticmethod
+                def overlap(a, b):
+                    """check if two boxes overlap or touch"""
+                    return (a[0] <= b[3] and b[0] <= a[3] and
+                        a[1] <= b[4] and b[1] <= a[4] and
+                        a[2] <= b[5] and b[2] <= a[5])
+
+                @staticmethod
+                def bvh(boxes, leaf_size=4):
+                    """
+                    Build a bounding volume hierarchy over a list of boxes.
+                    Nodes are lists [box, left, right, leaves] where leaves is a list of (index, box) or None.
+                    """
+                    def build(ids):
+                        box = Toolbox.Boxes.union([boxes[k] for k in ids])
+                        if len(ids) <= leaf_size:
+                            return [box, None, None, [(k, boxes[k]) for k in ids]]
+                        # median split along the longest axis of the node
+                        extent = [box[3]-box[0], box[4]-box[1], box[5]-box[2]]
+                        axis = extent.index(max(extent))
+                        ids = sorted(ids, key=lambda k: boxes[k][axis] + boxes[k][axis+3])
+                        half = len(ids) // 2
+                        return [box, build(ids[:half]), build(ids[half:]), None]
+                    if len(boxes) == 0: return None
+                    return build(list(range(len(boxes))))
+
+                @staticmethod
+                def bvh_query(tree, box):
+                    """get the indices of all boxes of the hierarchy overlapping a box"""
+                    found = []
+                    stack = [tree] if tree is not None else []
+                    while stack:
+                        node = stack.pop()
+                        if Toolbox.Boxes.overlap(node[0], box):
+                            if node[3] is not None:
+                                for (k, leaf_box) in node[3]:
+                                    if Toolbox.Boxes.overlap(leaf_box, box): found.append(k)
+                            else:
+                                stack.append(node[1])
+                                stack.append(node[2])
+                    return found
+
+                @staticmethod
+                def overlapping_pairs(boxes):
+                    """get all pairs (i,j) with i<j of overlapping boxes, sorted"""
+                    tree = Toolbox.Boxes.bvh(boxes)
+                    pairs = []
+                    for i in range(len(boxes)):
+                        for j in Toolbox.Boxes.bvh_query(tree, boxes[i]):
+                            if j > i: pairs.append((i, j))
+                    pairs.sort()
+                    return pairs
+
+
             class Surfaces:
 
                 @staticmethod
@@ -2769,6 +4084,89 @@ if yes:
                     surface = rs.coercesurface(surface)
                     return rg.AreaMassProperties.Compute(surface).Centroid
 
+                @staticmethod
+                def planar_surface(polygons, normal, tolerance=0.001):
+                    """planar brep covering the union of coplanar polygons (lists of 3d points), oriented along the normal"""
+                    breps = []
+                    for polygon in polygons:
+                        curve = rg.PolylineCurve([rg.Point3d(p[0], p[1], p[2]) for p in list(polygon) + [polygon[0]]])
+                        breps.extend(rg.Brep.CreatePlanarBreps(curve, tolerance))
+                    zone = breps[0]
+                    if len(breps) > 1:
+                        zone = rg.Brep.JoinBreps(breps, tolerance)[0]
+                        zone.MergeCoplanarFaces(tolerance)
+                    face = zone.Faces[0]
+                    if Toolbox.Vectors.dot(face.NormalAt(face.Domain(0).Min, face.Domain(1).Min), normal) < 0:
+                        zone.Flip()
+                    return zone
+
+                @staticmethod
+                def classify_faces(brep, tolerance=0.01, angle_tolerance=0.001):
+                    """top and bottom faces of a plate from planar faces grouped by normal direction and offset, None if no antiparallel pair"""
+                    groups = [] # [direction, {offset_key: [area, offset, face_index, centroid, sign]}]
+                    for face in brep.Faces:
+                        test, plane = face.TryGetPlane(tolerance)
+                        if test is False: continue
+                        normal = rg.Vector3d(plane.Normal)
+                        if face.OrientationIsReversed: normal.Reverse()
+                        # cheap area and centroid from the outer loop vertices
+                        points = []
+                        for trim in face.OuterLoop.Trims:
+                            uv = trim.PointAtStart
+                            points.append(face.PointAt(uv.X, uv.Y))
+                        if len(points) < 3: continue
+                        cx, cy, cz = 0.0, 0.0, 0.0
+                        for point in points:
+                            cx += point.X; cy += point.Y; cz += point.Z
+                        centroid = rg.Point3d(cx / len(points), cy / len(points), cz / len(points))
+                        area = 0.0
+                        for k in range(len(points)):
+                            area += Toolbox.Vectors.dot(rg.Vector3d.CrossProduct(rg.Vector3d(points[k]), rg.Vector3d(points[k-1])), normal)
+                        area = abs(area) / 2
+                        # clustering by direction, antiparallel faces share their group
+                        group = None
+                        for candidate in groups:
+                            cos = Toolbox.Vectors.dot(candidate[0], normal)
+                            if abs(cos) > 1 - angle_tolerance:
+                                group = candidate
+                                sign = 1 if cos > 0 else -1
+                                break
+                        if group is None:
+                            group = [normal, {}]
+                            sign = 1
+                            groups.append(group)
+                        # clustering by offset along the group direction and orientation
+                        offset = Toolbox.Vectors.dot(group[0], rg.Vector3d(centroid))
+                        key = (sign, int(round(offset / tolerance)))
+                        if key in group[1]:
+                            cluster = group[1][key]
+                            cluster[0] += area
+                            if area > cluster[5]: cluster[2], cluster[3], cluster[5] = face.FaceIndex, centroid, area
+                        else: group[1][key] = [area, offset, face.FaceIndex, centroid, sign, area]
+
+                    # antiparallel pair with the largest projected extent
+                    best = None
+                    for direction, clusters in groups:
+                        positives = [cluster for cluster in clusters.values() if cluster[4] == 1]
+                        negatives = [cluster for cluster in clusters.values() if cluster[4] == -1]
+                        for a in positives:
+                            for b in negatives:
+                                if abs(a[1] - b[1]) <= tolerance: continue
+                                score = min(a[0], b[0])
+                                if best is None or score > best[0]: best = (score, direction, a, b)
+                    if best is None: return None
+
+                    score, direction, a, b = best
+                    top, bottom = (a, b) if a[3].Z >= b[3].Z else (b, a)
+                    # outward normal of the top face points away from the bottom face, whatever the brep orientation
+                    top_normal = rg.Vector3d(direction) * (1 if top[1] > bottom[1] else -1)
+                    top_normal.Unitize()
+                    return {'top': rg.BrepFace.DuplicateFace(brep.Faces[top[2]], False),
+                        'bottom': rg.BrepFace.DuplicateFace(brep.Faces[bottom[2]], False),
+                        'top_normal': top_normal,
+                        'bottom_normal': -top_normal,
+                        'thickness': abs(top[1] - bottom[1])}
+
                 @staticmethod
                 def sort_surfaces_by_altitude(planar_surfaces):
                     faces = planar_surfaces
@@ -2840,6 +4238,15 @@ if yes:
 
             class Curves:
                 
+                @staticmethod
+                def vertices_array(polyline):
+                    """polyline vertices as a flat float array (x,y,z,x,y,z...) without the closing vertex"""
+                    vertices = rs.PolylineVertices(polyline)
+                    if len(vertices) > 1 and vertices[0] == vertices[-1]: vertices = vertices[:-1]
+                    coordinates = array('d')
+                    for p in vertices: coordinates.extend([p[0], p[1], p[2]])
+                    return coordinates
+
                 @staticmethod
                 def rectangle_dimensions(rectangle):
                     "get length and width from a rectangle"
@@ -3196,23 +4603,48 @@ if yes:
                     return y
                 
                 @staticmethod
-                def resimplify_Curve(curve):
+                def simplify_vertices(points, closed=True, tolerance=0.001, angle_tolerance=1.0):
+                    """indices of the corners of a polyline, dropping duplicate and collinear vertices in one pass (closed: no closing vertex, seam on the first corner)"""
+                    sine = math.sin(math.radians(angle_tolerance))
+                    def is_corner(a, b, c):
+                        u = Toolbox.Vectors.subtract(points[b], points[a])
+                        v = Toolbox.Vectors.subtract(points[c], points[b])
+                        lu = Toolbox.Vectors.length(u)
+                        lv = Toolbox.Vectors.length(v)
+                        if lu <= tolerance or lv <= tolerance: return False
+                        if Toolbox.Vectors.dot(u, v) < 0: return True
+                        return Toolbox.Vectors.length(Toolbox.Vectors.cross(u, v)) > sine * lu * lv
+
+                    def is_duplicate(a, b):
+                        return Toolbox.Vectors.length(Toolbox.Vectors.subtract(points[b], points[a])) <= tolerance
+
+                    kept = []
+                    for k in range(len(points)):
+                        if kept and is_duplicate(kept[-1], k): continue
+                        while len(kept) > 1 and not is_corner(kept[-2], kept[-1], k): kept.pop()
+                        kept.append(k)
+                    if not closed or len(kept) < 3: return kept
+
+                    # wrapping around the seam, the first corner in vertex order becomes the seam
+                    while len(kept) > 1 and is_duplicate(kept[-1], kept[0]): kept.pop()
+                    while len(kept) > 2 and not is_corner(kept[-2], kept[-1], kept[0]): kept.pop()
+                    while len(kept) > 2 and not is_corner(kept[-1], kept[0], kept[1]): kept.pop(0)
+                    return kept
+
+                @staticmethod
+                def resimplify_Curve(curve, tolerance=0.001, angle_tolerance=1.0):
                     """Simplify and change curve seam if it's not already a vertice"""
 
-                    curve=scriptcontext.doc.Objects.Add(curve)
-                    vertices = rs.PolylineVertices(curve)
-                    best_candidate=curve
-                    best_v_len = len(vertices)
-
-                    for i in range(len(vertices)):
-                        new_candidate = rs.CopyObject(curve)
-                        rs.CurveSeam(new_candidate, rs.CurveClosestPoint(new_candidate,vertices[i]))
-                        rs.SimplifyCurve(new_candidate)
-                        v_len = len(rs.PolylineVertices(new_candidate))
-                        if v_len < best_v_len:
-                            best_candidate = rs.CopyObject(new_candidate)
-                            best_v_len = v_len
-                    return rs.coercecurve(best_candidate)
+                    test, polyline = curve.TryGetPolyline()
+                    if test: vertices = [rg.Point3d(p) for p in polyline]
+                    else: vertices = [rg.Point3d(p) for p in rs.PolylineVertices(curve)]
+                    closed = curve.IsClosed
+                    if closed and len(vertices) > 1 and Toolbox.Vectors.length(Toolbox.Vectors.subtract(vertices[-1], vertices[0])) <= tolerance:
+                        vertices = vertices[:-1]
+                    kept = Toolbox.Curves.simplify_vertices(vertices, closed, tolerance, angle_tolerance)
+                    simplified = [vertices[k] for k in kept]
+                    if closed: simplified.append(simplified[0])
+                    return rg.PolylineCurve(simplified)
 
                 @staticmethod
                 def match_seams(curve1, curve2, simplify=True):
@@ -3222,37 +4654,84 @@ if yes:
                         curve1=Toolbox.Curves.resimplify_Curve(curve1)
                         curve2=Toolbox.Curves.resimplify_Curve(curve2)
                     curve2 = Toolbox.Curves.align_curve_direction(rs.coercecurve(curve1),rs.coercecurve(curve2))
-                    curve1=scriptcontext.doc.Objects.Add(curve1)
-                    curve2=scriptcontext.doc.Objects.Add(curve2)
-                    seg1 = rs.ExplodeCurves(curve1)
-                    seg2 = rs.ExplodeCurves(curve2)
-                    seg1 = [seg for seg in seg1 if rs.CurveLength(seg)>0.00001]
-                    seg2 = [seg for seg in seg2 if rs.CurveLength(seg)>0.00001]
-                    curve1 = rs.AddPolyline([rs.CurveStartPoint(seg) for seg in seg1]+[rs.CurveStartPoint(curve1)])
-                    curve2 = rs.AddPolyline([rs.CurveStartPoint(seg) for seg in seg2]+[rs.CurveStartPoint(curve2)])
-                    shift = None
-
-                    if len(seg1) == len(seg2):
-                        for i in range(len(seg2)):
-                            flag = True
-                            for j in range(len(seg1)):
-                                vec1 = Toolbox.Vectors.line_to_vec(seg2[(i+j)%len(seg2)])
-                                vec2 = Toolbox.Vectors.line_to_vec(seg1[j])
-                                if rs.IsVectorParallelTo(vec1,vec2) != 1:
-                                    flag = False
-                            if flag == True:
-                                shift = i
-                                break
-                    else: raise Exception("polylines have a different number of segments")
+                    vertices1 = Toolbox.Curves.segment_vertices(rs.coercecurve(curve1))
+                    vertices2 = Toolbox.Curves.segment_vertices(rs.coercecurve(curve2))
+
+                    if len(vertices1) != len(vertices2): raise Exception("polylines have a different number of segments")
+                    shift = Toolbox.Curves.seam_shift(vertices1, vertices2)
                     if shift == None: raise Exception("polyline segments are not parallel")
-                    else:
-                        points = rs.PolylineVertices(curve2)
-                        Toolbox.Curves.curve_seam(curve2, points[shift])
-                        rs.coercecurve(curve2)
-                    curve1 = rs.coercecurve(curve1)
-                    curve2 = rs.coercecurve(curve2)
+                    n = len(vertices2) // 3
+                    points1 = [rg.Point3d(vertices1[3*k], vertices1[3*k+1], vertices1[3*k+2]) for k in range(n)]
+                    points2 = [rg.Point3d(vertices2[3*k], vertices2[3*k+1], vertices2[3*k+2]) for k in range(n)]
+                    points2 = points2[shift:] + points2[:shift]
+                    curve1 = rg.PolylineCurve(points1 + [points1[0]])
+                    curve2 = rg.PolylineCurve(points2 + [points2[0]])
                     return [curve1,curve2]
 
+                @staticmethod
+                def segment_vertices(curve, tolerance=0.00001):
+                    """vertices of a closed polyline as a flat float array, without the closing vertex nor null segments"""
+                    test, polyline = curve.TryGetPolyline()
+                    if test: points = [(p.X, p.Y, p.Z) for p in polyline]
+                    else: points = [(p[0], p[1], p[2]) for p in rs.PolylineVertices(curve)]
+                    coordinates = array('d')
+                    for k in range(len(points)-1):
+                        if Toolbox.Vectors.length(Toolbox.Vectors.subtract(points[k+1], points[k])) > tolerance:
+                            coordinates.extend(points[k])
+                    return coordinates
+
+                @staticmethod
+                def direction_symbols(vertices, symbols=None, angle_tolerance=1.0):
+                    """quantize the segment directions of a closed polygon (flat vertex array) into integers, -1 for directions unknown to a frozen symbols table"""
+                    frozen = symbols is not None
+                    if symbols is None: symbols = {'cells': {}, 'directions': []}
+                    cos = math.cos(math.radians(angle_tolerance))
+                    step = 2 * math.sin(math.radians(angle_tolerance) / 2)
+                    n = len(vertices) // 3
+                    sequence = []
+                    for k in range(n):
+                        m = (k+1) % n
+                        u = Toolbox.Vectors.unitize((vertices[3*m]-vertices[3*k], vertices[3*m+1]-vertices[3*k+1], vertices[3*m+2]-vertices[3*k+2]))
+                        cell = (int(math.floor(u[0]/step)), int(math.floor(u[1]/step)), int(math.floor(u[2]/step)))
+                        # nearest known direction in the neighbouring cells
+                        best, best_dot = -1, cos
+                        for dx in (-1, 0, 1):
+                            for dy in (-1, 0, 1):
+                                for dz in (-1, 0, 1):
+                                    for symbol in symbols['cells'].get((cell[0]+dx, cell[1]+dy, cell[2]+dz), []):
+                                        dot = Toolbox.Vectors.dot(symbols['directions'][symbol], u)
+                                        if dot >= best_dot: best, best_dot = symbol, dot
+                        if best == -1 and frozen is False:
+                            best = len(symbols['directions'])
+                            symbols['directions'].append(u)
+                            symbols['cells'].setdefault(cell, []).append(best)
+                        sequence.append(best)
+                    return sequence, symbols
+
+                @staticmethod
+                def seam_shift(vertices1, vertices2, angle_tolerance=1.0):
+                    """smallest cyclic shift of polygon 2 making its segments parallel to polygon 1 ones, KMP search on the doubled direction sequence, None if none"""
+                    symbols = Toolbox.Curves.direction_symbols(vertices1, None, angle_tolerance)[1]
+                    # both sequences read from the final table so that equal directions get equal symbols
+                    pattern = Toolbox.Curves.direction_symbols(vertices1, symbols, angle_tolerance)[0]
+                    text = Toolbox.Curves.direction_symbols(vertices2, symbols, angle_tolerance)[0]
+                    n = len(pattern)
+                    if n != len(text): return None
+                    if n == 0: return 0
+                    failure = [0] * n
+                    k = 0
+                    for i in range(1, n):
+                        while k > 0 and pattern[i] != pattern[k]: k = failure[k-1]
+                        if pattern[i] == pattern[k]: k += 1
+                        failure[i] = k
+                    k = 0
+                    for i in range(2*n - 1):
+                        symbol = text[i % n]
+                        while k > 0 and symbol != pattern[k]: k = failure[k-1]
+                        if symbol == pattern[k]: k += 1
+                        if k == n: return i - n + 1
+                    return None
+
                 @staticmethod
                 def match_seams_old(curve1,curve2, simplify=True):
                     """Match the seams of two curves"""
@@ -3521,6 +5000,605 @@ if yes:
                     return points[0]
 
 
+            class Polygons:
+                """Planar polygons as lists of (x,y) tuples without duplicated closing vertex"""
+
+                @staticmethod
+                def frame(normal):
+                    """unit vectors (u,v) such as (u,v,normal) is a right-handed frame"""
+                    V = Toolbox.Vectors
+                    helper = (1.0, 0.0, 0.0)
+                    if abs(normal[0]) > 0.9: helper = (0.0, 1.0, 0.0)
+                    u = V.unitize(V.cross(normal, helper))
+                    v = V.cross(normal, u)
+                    return (u, v)
+
+                @staticmethod
+                def to_2d(points, origin, normal):
+                    """express 3d points in a 2d frame of the plane defined by an origin and a normal"""
+                    V = Toolbox.Vectors
+                    u, v = Toolbox.Polygons.frame(normal)
+                    return [(V.dot(V.subtract(p, origin), u), V.dot(V.subtract(p, origin), v)) for p in points]
+
+                @staticmethod
+                def to_3d(poly, origin, normal):
+                    """inverse of to_2d"""
+                    u, v = Toolbox.Polygons.frame(normal)
+                    return [tuple([origin[k] + p[0]*u[k] + p[1]*v[k] for k in range(3)]) for p in poly]
+
+                @staticmethod
+                def area(poly):
+                    """signed area of a polygon (positive if counterclockwise)"""
+                    a = 0.0
+                    for k in range(len(poly)):
+                        x1, y1 = poly[k-1]
+                        x2, y2 = poly[k]
+                        a += x1*y2 - x2*y1
+                    return a / 2.0
+
+                @staticmethod
+                def centroid(poly):
+                    """area centroid of a polygon (vertices average if the polygon is degenerated)"""
+                    a = Toolbox.Polygons.area(poly)
+                    if abs(a) < 1e-12:
+                        return (sum([p[0] for p in poly]) / len(poly), sum([p[1] for p in poly]) / len(poly))
+                    cx, cy = 0.0, 0.0
+                    for k in range(len(poly)):
+                        x1, y1 = poly[k-1]
+                        x2, y2 = poly[k]
+                        f = x1*y2 - x2*y1
+                        cx += (x1 + x2) * f
+                        cy += (y1 + y2) * f
+                    return (cx / (6.0*a), cy / (6.0*a))
+
+                @staticmethod
+                def segment_distance(pt, a, b):
+                    """distance from a 2d point to a 2d segment"""
+                    dx, dy = b[0]-a[0], b[1]-a[1]
+                    l2 = dx*dx + dy*dy
+                    t = 0.0
+                    if l2 > 0: t = max(0.0, min(1.0, ((pt[0]-a[0])*dx + (pt[1]-a[1])*dy) / l2))
+                    return math.hypot(pt[0] - (a[0] + t*dx), pt[1] - (a[1] + t*dy))
+
+                @staticmethod
+                def point_in_polygon(pt, poly, tol=0.001):
+                    """return 1 if the point is inside the polygon, 0 if it is on its border, -1 if outside"""
+                    inside = False
+                    for k in range(len(poly)):
+                        a, b = poly[k-1], poly[k]
+                        if Toolbox.Polygons.segment_distance(pt, a, b) < tol: return 0
+                        if (a[1] > pt[1]) != (b[1] > pt[1]):
+                            x = a[0] + (pt[1]-a[1]) * (b[0]-a[0]) / (b[1]-a[1])
+                            if pt[0] < x: inside = not inside
+                    if inside: return 1
+                    return -1
+
+                @staticmethod
+                def segments_cross(a, b, c, d, tol=0.001):
+                    """check if two 2d segments cross each other (touching does not count)"""
+                    def side(p, q, r):
+                        return (q[0]-p[0])*(r[1]-p[1]) - (q[1]-p[1])*(r[0]-p[0])
+                    lab = math.hypot(b[0]-a[0], b[1]-a[1])
+                    lcd = math.hypot(d[0]-c[0], d[1]-c[1])
+                    if lab < tol or lcd < tol: return False
+                    s1, s2 = side(a, b, c) / lab, side(a, b, d) / lab
+                    s3, s4 = side(c, d, a) / lcd, side(c, d, b) / lcd
+                    return ((s1 > tol and s2 < -tol) or (s1 < -tol and s2 > tol)) and ((s3 > tol and s4 < -tol) or (s3 < -tol and s4 > tol))
+
+                @staticmethod
+                def orient(poly):
+                    """return the polygon with counterclockwise orientation"""
+                    if Toolbox.Polygons.area(poly) < 0: return list(reversed(poly))
+                    return list(poly)
+
+                @staticmethod
+                def is_convex(poly, tol=1e-9):
+                    """check if a counterclockwise polygon is convex"""
+                    for k in range(len(poly)):
+                        a, b, c = poly[k-2], poly[k-1], poly[k]
+                        if (b[0]-a[0])*(c[1]-b[1]) - (b[1]-a[1])*(c[0]-b[0]) < -tol: return False
+                    return True
+
+                @staticmethod
+                def clip_convex(subject, clip):
+                    """Sutherland-Hodgman clipping of a polygon by a convex counterclockwise polygon"""
+                    def side(a, b, p):
+                        return (b[0]-a[0])*(p[1]-a[1]) - (b[1]-a[1])*(p[0]-a[0])
+                    output = list(subject)
+                    for k in range(len(clip)):
+                        if output == []: break
+                        a, b = clip[k-1], clip[k]
+                        polygon, output = output, []
+                        for l in range(len(polygon)):
+                            p, q = polygon[l-1], polygon[l]
+                            sp, sq = side(a, b, p), side(a, b, q)
+                            if sq >= 0:
+                                if sp < 0: output.append((p[0] + (q[0]-p[0])*sp/(sp-sq), p[1] + (q[1]-p[1])*sp/(sp-sq)))
+                                output.append(q)
+                            elif sp >= 0:
+                                output.append((p[0] + (q[0]-p[0])*sp/(sp-sq), p[1] + (q[1]-p[1])*sp/(sp-sq)))
+                    return output
+
+                @staticmethod
+                def triangulate(poly, tol=1e-9):
+                    """ear clipping triangulation of a simple counterclockwise polygon"""
+                    def cross(a, b, c):
+                        return (b[0]-a[0])*(c[1]-a[1]) - (b[1]-a[1])*(c[0]-a[0])
+                    def in_triangle(p, a, b, c):
+                        return cross(a, b, p) > tol and cross(b, c, p) > tol and cross(c, a, p) > tol
+                    points = list(poly)
+                    triangles = []
+                    while len(points) > 3:
+                        n = len(points)
+                        for k in range(n):
+                            a, b, c = points[k-1], points[k], points[(k+1) % n]
+                            if cross(a, b, c) <= tol:
+                                # reflex or flat vertex
+                                if abs(cross(a, b, c)) <= tol:
+                                    del points[k]
+                                    break
+                                continue
+                            if [p for p in points if p not in (a, b, c) and in_triangle(p, a, b, c)]: continue
+                            triangles.append([a, b, c])
+                            del points[k]
+                            break
+                        else:
+                            # degenerated polygon, stop here
+                            break
+                    if len(points) == 3 and abs(cross(points[0], points[1], points[2])) > tol: triangles.append(points)
+                    return triangles
+
+                @staticmethod
+                def intersection(poly1, poly2, tol=0.001):
+                    """
+                    Intersection of two simple polygons as a list of convex or clipped pieces (counterclockwise).
+                    Both polygons are split in triangles if none of them is convex, so that no piece is bridged along a clipping edge.
+                    """
+                    P = Toolbox.Polygons
+                    poly1, poly2 = P.orient(poly1), P.orient(poly2)
+                    if not P.is_convex(poly2) and P.is_convex(poly1): poly1, poly2 = poly2, poly1
+                    if P.is_convex(poly2): subjects, clips = [poly1], [poly2]
+                    else: subjects, clips = P.triangulate(poly1), P.triangulate(poly2)
+                    pieces = [P.simplify(P.clip_convex(subject, clip), tol) for subject in subjects for clip in clips]
+                    return [piece for piece in pieces if len(piece) > 2 and P.area(piece) > tol*tol]
+
+                @staticmethod
+                def simplify(poly, tol=0.001):
+                    """remove the duplicated vertices and the vertices lying on the line of their neighbours (including spikes)"""
+                    points = list(poly)
+                    changed = True
+                    while changed and len(points) > 2:
+                        changed = False
+                        for k in range(len(points)):
+                            a, b, c = points[k-1], points[k], points[(k+1) % len(points)]
+                            length = math.hypot(c[0]-a[0], c[1]-a[1])
+                            cross = (b[0]-a[0])*(c[1]-a[1]) - (b[1]-a[1])*(c[0]-a[0])
+                            if math.hypot(b[0]-a[0], b[1]-a[1]) < tol or abs(cross) <= tol * max(length, tol):
+                                del points[k]
+                                changed = True
+                                break
+                    return points
+
+                @staticmethod
+                def longest_edge(pieces, tol=0.001):
+                    """unit direction of the longest border edge of the union of pieces (collinear border edges are merged)"""
+                    P = Toolbox.Polygons
+                    borders = []
+                    for piece in pieces:
+                        for k in range(len(piece)):
+                            a, b = piece[k-1], piece[k]
+                            length = math.hypot(b[0]-a[0], b[1]-a[1])
+                            if length < tol: continue
+                            # an edge shared with another piece has this piece on its right side
+                            test = ((a[0]+b[0])/2.0 + 2*tol*(b[1]-a[1])/length, (a[1]+b[1])/2.0 - 2*tol*(b[0]-a[0])/length)
+                            if [other for other in pieces if P.point_in_polygon(test, other, tol/2.0) == 1]: continue
+                            borders.append((a, b, ((b[0]-a[0])/length, (b[1]-a[1])/length)))
+                    best, best_length = None, -1.0
+                    for (a, b, d) in borders:
+                        # merge the border edges lying on the same line
+                        intervals = []
+                        for (c, e, f) in borders:
+                            if abs(d[0]*f[1] - d[1]*f[0]) > 1e-6: continue
+                            if abs((c[0]-a[0])*d[1] - (c[1]-a[1])*d[0]) > tol: continue
+                            t1 = (c[0]-a[0])*d[0] + (c[1]-a[1])*d[1]
+                            t2 = (e[0]-a[0])*d[0] + (e[1]-a[1])*d[1]
+                            intervals.append((min(t1, t2), max(t1, t2)))
+                        intervals.sort()
+                        start, end = intervals[0]
+                        for (t1, t2) in intervals[1:]:
+                            if t1 > end + tol:
+                                if start <= tol and end >= -tol: break
+                                start, end = t1, t2
+                            else: end = max(end, t2)
+                        if end - start > best_length: best, best_length = d, end - start
+                    return best
+
+                @staticmethod
+                def overlap(poly1, poly2, tol=0.001):
+                    """check if two polygons share an area (sharing a border or a vertex does not count)"""
+                    P = Toolbox.Polygons
+                    for k in range(len(poly1)):
+                        for l in range(len(poly2)):
+                            if P.segments_cross(poly1[k-1], poly1[k], poly2[l-1], poly2[l], tol): return True
+                    for (a, b) in [(poly1, poly2), (poly2, poly1)]:
+                        tests = [P.centroid(a)]
+                        for k in range(len(a)):
+                            tests.append(a[k])
+                            tests.append(((a[k-1][0]+a[k][0])/2.0, (a[k-1][1]+a[k][1])/2.0))
+                        for pt in tests:
+                            if P.point_in_polygon(pt, b, tol) == 1: return True
+                    return False
+
+
+            class Slabs:
+                """
+                Analytic description of plates as planar slabs (pure python, no Rhino geometry).
+                A slab is a dictionary with the top and bottom contour vertices (aligned, without duplicated closing vertex),
+                the top normal, the offsets of the top and bottom planes and the side quads.
+                """
+
+                @staticmethod
+                def slab(top, bottom, normal):
+                    """create a slab from aligned top and bottom contour vertices and the top normal"""
+                    V = Toolbox.Vectors
+                    top = [tuple(p) for p in top]
+                    bottom = [tuple(p) for p in bottom]
+                    normal = V.unitize(normal)
+                    sides = []
+                    for k in range(len(top)):
+                        l = (k+1) % len(top)
+                        quad = [top[k], top[l], bottom[l], bottom[k]]
+                        side_normal = V.unitize(V.cross(V.subtract(top[l], top[k]), V.subtract(bottom[k], top[k])))
+                        if side_normal != (0.0, 0.0, 0.0):
+                            sides.append((quad, side_normal, V.dot(side_normal, top[k])))
+                    return {'top': top,
+                        'bottom': bottom,
+                        'normal': normal,
+                        'top_d': V.dot(normal, top[0]),
+                        'bottom_d': V.dot(normal, bottom[0]),
+                        'sides': sides}
+
+                @staticmethod
+                def from_plate(plate):
+                    """create a slab from a plate object"""
+                    top = plate.top_vertices
+                    bottom = plate.bottom_vertices
+                    top = [(top[k], top[k+1], top[k+2]) for k in range(0, len(top), 3)]
+                    bottom = [(bottom[k], bottom[k+1], bottom[k+2]) for k in range(0, len(bottom), 3)]
+                    normal = plate.top_normal
+                    return Toolbox.Slabs.slab(top, bottom, (normal[0], normal[1], normal[2]))
+
+                @staticmethod
+                def in_plane(points, normal, d, tol=0.001):
+                    """check if all points lie in the plane (normal, offset)"""
+                    for p in points:
+                        if abs(Toolbox.Vectors.dot(normal, p) - d) > tol: return False
+                    return True
+
+                @staticmethod
+                def overlap_in_plane(points1, points2, normal, tol=0.001):
+                    """check if two coplanar polygons share an area"""
+                    origin = points1[0]
+                    poly1 = Toolbox.Polygons.to_2d(points1, origin, normal)
+                    poly2 = Toolbox.Polygons.to_2d(points2, origin, normal)
+                    return Toolbox.Polygons.overlap(poly1, poly2, tol)
+
+                @staticmethod
+                def sharing_edge(poly1, poly2):
+                    """pure python version of Toolbox.Curves.isSharingEdge for closed vertex lists"""
+                    V = Toolbox.Vectors
+                    def dist(p, q): return math.sqrt((p[0]-q[0])**2 + (p[1]-q[1])**2 + (p[2]-q[2])**2)
+                    for k in range(len(poly1)):
+                        x0, x1 = poly1[k-1], poly1[k]
+                        vx = V.subtract(x1, x0)
+                        l2 = dist(x0, x1)
+                        if l2 == 0: continue
+                        for l in range(len(poly2)):
+                            y0, y1 = poly2[l-1], poly2[l]
+                            vy = V.subtract(y1, y0)
+                            l1 = dist(y0, y1)
+                            if l1 == 0: continue
+                            # parallel within the default Rhino angle tolerance (1 degree)
+                            cos = V.dot(vx, vy) / (l1 * l2)
+                            if abs(cos) < math.cos(math.radians(1.0)): continue
+                            # colinear
+                            t = V.dot(V.subtract(y0, x0), vx) / (l2 * l2)
+                            closest = (x0[0] + t*vx[0], x0[1] + t*vx[1], x0[2] + t*vx[2])
+                            if dist(closest, y0) >= 0.001: continue
+                            if cos < 0: y0, y1 = y1, y0
+                            d1, d2, d3, d4 = dist(x0, y0), dist(x1, y1), dist(x0, y1), dist(x1, y0)
+                            if ((d1 <= l1) and (d3 <= l1)) or ((d2 <= l1) and (d4 <= l1)): return True
+                            if ((d1 <= l2) and (d4 <= l2)) or ((d2 <= l2) and (d3 <= l2)): return True
+                    return False
+
+                @staticmethod
+                def contour_crosses_face(contour, face, normal, d, tol=0.001):
+                    """check if a closed contour crosses the plane of a face inside the face contour"""
+                    V = Toolbox.Vectors
+                    face_2d = None
+                    for k in range(len(contour)):
+                        p, q = contour[k-1], contour[k]
+                        dp = V.dot(normal, p) - d
+                        dq = V.dot(normal, q) - d
+                        if (dp > tol and dq < -tol) or (dp < -tol and dq > tol):
+                            t = dp / (dp - dq)
+                            x = (p[0] + t*(q[0]-p[0]), p[1] + t*(q[1]-p[1]), p[2] + t*(q[2]-p[2]))
+                            if face_2d is None: face_2d = Toolbox.Polygons.to_2d(face, face[0], normal)
+                            x_2d = Toolbox.Polygons.to_2d([x], face[0], normal)[0]
+                            if Toolbox.Polygons.point_in_polygon(x_2d, face_2d, tol) >= 0: return True
+                    return False
+
+                @staticmethod
+                def is_intersecting(a, b, tol=0.001):
+                    """check if both contours of slab a cross both faces of slab b (IN contact seen from a)"""
+                    S = Toolbox.Slabs
+                    for contour in (a['top'], a['bottom']):
+                        for face in ('top', 'bottom'):
+                            if S.contour_crosses_face(contour, b[face], b['normal'], b[face+'_d'], tol) is False:
+                                return False
+                    return True
+
+                @staticmethod
+                def contact_type(a, b, tol=0.001):
+                    """classify the contact of slab a with slab b (FF, FS, SF, ES, SE, SS or IN), None if not in contact"""
+                    S = Toolbox.Slabs
+                    parallel = Toolbox.Vectors.isvectornull(Toolbox.Vectors.cross(a['normal'], b['normal']))
+                    faces = ('top', 'bottom')
+                    if parallel:
+                        # face-to-face: coincident face planes with overlapping contours
+                        for fa in faces:
+                            for fb in faces:
+                                if S.in_plane(b[fb], a['normal'], a[fa+'_d'], tol):
+                                    if S.overlap_in_plane(a[fa], b[fb], a['normal'], tol): return 'FF'
+                    else:
+                        # face-to-side: a side of one slab lies on a face of the other
+                        for (x, y, types) in [(a, b, ('FS', 'ES')), (b, a, ('SF', 'SE'))]:
+                            for fx in faces:
+                                for (quad, side_normal, side_d) in y['sides']:
+                                    if S.in_plane(quad, x['normal'], x[fx+'_d'], tol):
+                                        if S.overlap_in_plane(x[fx], quad, x['normal'], tol):
+                                            for ca in faces:
+                                                for cb in faces:
+                                                    if S.sharing_edge(a[ca], b[cb]): return types[1]
+                                            return types[0]
+                    # side-to-side: coincident side planes with overlapping quads
+                    for (quad_a, normal_a, d_a) in a['sides']:
+                        for (quad_b, normal_b, d_b) in b['sides']:
+                            if abs(Toolbox.Vectors.dot(normal_a, normal_b)) > 1 - 1e-6:
+                                if S.in_plane(quad_b, normal_a, d_a, tol):
+                                    if S.overlap_in_plane(quad_a, quad_b, normal_a, tol): return 'SS'
+                    # intersecting volumes
+                    if not parallel and (S.is_intersecting(a, b, tol) or S.is_intersecting(b, a, tol)): return 'IN'
+                    return None
+
+                @staticmethod
+                def contact_zone(a, b, tol=0.001):
+                    """
+                    Zone shared by two touching slabs, clipping the first pair of coplanar faces or sides with a common area.
+                    Return a dictionary with the zone polygons (3d), center, plane normal (unoriented), longest border axis and area,
+                    None if no coplanar faces or sides overlap.
+                    """
+                    P, V = Toolbox.Polygons, Toolbox.Vectors
+                    planes_a = [(a['top'], a['normal']), (a['bottom'], a['normal'])] + [(quad, n) for (quad, n, d) in a['sides']]
+                    planes_b = [(b['top'], b['normal']), (b['bottom'], b['normal'])] + [(quad, n) for (quad, n, d) in b['sides']]
+                    for (points_a, normal) in planes_a:
+                        origin = points_a[0]
+                        for (points_b, normal_b) in planes_b:
+                            if abs(V.dot(normal, normal_b)) < 1 - 1e-6: continue
+                            if not Toolbox.Slabs.in_plane(points_b, normal, V.dot(normal, origin), tol): continue
+                            pieces = P.intersection(P.to_2d(points_a, origin, normal), P.to_2d(points_b, origin, normal), tol)
+                            if pieces == []: continue
+                            areas = [P.area(piece) for piece in pieces]
+                            centroids = [P.centroid(piece) for piece in pieces]
+                            area = sum(areas)
+                            center = (sum([c[0]*w for (c, w) in zip(centroids, areas)]) / area, sum([c[1]*w for (c, w) in zip(centroids, areas)]) / area)
+                            axis = P.longest_edge(pieces, tol)
+                            u, v = P.frame(normal)
+                            return {'zone': None,
+                                'polygons': [P.to_3d(piece, origin, normal) for piece in pieces],
+                                'center': P.to_3d([center], origin, normal)[0],
+                                'normal': normal,
+                                'axis': tuple([axis[0]*u[k] + axis[1]*v[k] for k in range(3)]),
+                                'area': area}
+                    return None
+
+                @staticmethod
+                def classify_pairs(args):
+                    """
+                    Classify a chunk of candidate pairs, args = (pairs, slabs, tol) where slabs maps plate ids to slabs.
+                    Return a list of (i, j, type of i with j, type of j with i) with None for missing contacts.
+                    """
+                    pairs, slabs, tol = args
+                    mirror = {'FF':'FF', 'FS':'SF', 'SF':'FS', 'ES':'SE', 'SE':'ES', 'SS':'SS'}
+                    results = []
+                    for (i, j) in pairs:
+                        ctype = Toolbox.Slabs.contact_type(slabs[i], slabs[j], tol)
+                        if ctype == 'IN':
+                            # contours crossing is not symmetric, as for the brep engine
+                            type_ij, type_ji = None, None
+                            if Toolbox.Slabs.is_intersecting(slabs[i], slabs[j], tol): type_ij = 'IN'
+                            if Toolbox.Slabs.is_intersecting(slabs[j], slabs[i], tol): type_ji = 'IN'
+                            results.append((i, j, type_ij, type_ji))
+                        elif ctype is not None:
+                            results.append((i, j, ctype, mirror[ctype]))
+                    return results
+
+                @staticmethod
+                def contacts(slabs, pairs, tol=0.001, workers=1):
+                    """
+                    Classify the contacts of all candidate pairs (i,j) with i<j, in parallel if workers > 1.
+                    Return the neighbour ids and contact types of each slab, sorted by neighbour id.
+                    """
+                    chunks = Toolbox.Parallel.chunks(pairs, 4 * workers)
+                    args = []
+                    for chunk in chunks:
+                        ids = set([i for pair in chunk for i in pair])
+                        args.append((chunk, dict([(i, slabs[i]) for i in ids]), tol))
+                    results = Toolbox.Parallel.map(Toolbox.Slabs.classify_pairs, args, workers)
+                    # deterministic merge into neighbour lists
+                    found = Toolbox.Data.list_of_empty_lists(len(slabs))
+                    for result in results:
+                        for (i, j, type_ij, type_ji) in result:
+                            if type_ij is not None: found[i].append((j, type_ij))
+                            if type_ji is not None: found[j].append((i, type_ji))
+                    ids, types = [], []
+                    for sub in found:
+                        sub.sort()
+                        ids.append([c[0] for c in sub])
+                        types.append([c[1] for c in sub])
+                    return (ids, types)
+
+
+            class Collisions:
+                """
+                Convex prisms (parts of slabs) moving along a line, checked with separating axis tests (pure python, no Rhino geometry).
+                A prism is a dictionary with its vertices as a flat array of coordinates, its face normals, its edge directions and its box.
+                """
+
+                @staticmethod
+                def unique(directions, tol=1e-6):
+                    """unit directions without duplicates, opposite directions are duplicates, null vectors are removed"""
+                    found = {}
+                    for d in directions:
+                        d = Toolbox.Vectors.unitize(d)
+                        if d == (0.0, 0.0, 0.0): continue
+                        if d[0] < -tol or (abs(d[0]) <= tol and (d[1] < -tol or (abs(d[1]) <= tol and d[2] < 0))): d = (-d[0], -d[1], -d[2])
+                        found.setdefault((round(d[0]/tol), round(d[1]/tol), round(d[2]/tol)), d)
+                    return list(found.values())
+
+                @staticmethod
+                def prism(top, bottom, normal):
+                    """convex prism from aligned top and bottom vertices"""
+                    V = Toolbox.Vectors
+                    points = array('d')
+                    for p in top + bottom: points.extend(p)
+                    normals = [normal]
+                    edges = []
+                    for k in range(len(top)):
+                        l = (k+1) % len(top)
+                        edges += [V.subtract(top[l], top[k]), V.subtract(bottom[l], bottom[k]), V.subtract(top[k], bottom[k])]
+                        normals.append(V.cross(V.subtract(top[l], top[k]), V.subtract(bottom[k], top[k])))
+                    return {'points': points,
+                        'normals': Toolbox.Collisions.unique(normals),
+                        'edges': Toolbox.Collisions.unique(edges),
+                        'box': Toolbox.Boxes.points_box(top + bottom)}
+
+                @staticmethod
+                def merge_convex(pieces, poly):
+                    """greedy merge of adjacent counterclockwise pieces (vertex indices of poly) as long as their union is convex"""
+                    def join(p, q):
+                        for i in range(len(p)):
+                            a, b = p[i], p[(i+1) % len(p)]
+                            for j in range(len(q)):
+                                if q[j] == b and q[(j+1) % len(q)] == a:
+                                    return [p[(i+1+k) % len(p)] for k in range(len(p))] + [q[(j+2+k) % len(q)] for k in range(len(q)-2)]
+                        return None
+                    pieces = [list(piece) for piece in pieces]
+                    a = 0
+                    while a < len(pieces):
+                        b = a + 1
+                        while b < len(pieces):
+                            union = join(pieces[a], pieces[b])
+                            if union is not None and Toolbox.Polygons.is_convex([poly[k] for k in union]):
+                                pieces[a] = union
+                                del pieces[b]
+                                b = a + 1
+                            else: b += 1
+                        a += 1
+                    return pieces
+
+                @staticmethod
+                def convex_parts(slab):
+                    """split a slab in convex prisms following a convex decomposition of its top contour"""
+                    P = Toolbox.Polygons
+                    top, bottom, normal = slab['top'], slab['bottom'], slab['normal']
+                    poly = P.to_2d(top, top[0], normal)
+                    indices = list(range(len(poly)))
+                    if P.area(poly) < 0: indices.reverse()
+                    pieces = [indices]
+                    if not P.is_convex([poly[k] for k in indices]):
+                        lookup = dict([(poly[k], k) for k in indices])
+                        triangles = P.triangulate([poly[k] for k in indices])
+                        if triangles != []: pieces = Toolbox.Collisions.merge_convex([[lookup[p] for p in t] for t in triangles], poly)
+                    return [Toolbox.Collisions.prism([top[k] for k in piece], [bottom[k] for k in piece], normal) for piece in pieces]
+
+                @staticmethod
+                def project(points, axis):
+                    """interval covered by a flat array of points projected on an axis"""
+                    x, y, z = axis
+                    values = [points[k]*x + points[k+1]*y + points[k+2]*z for k in range(0, len(points), 3)]
+                    return (min(values), max(values))
+
+                @staticmethod
+                def interval(moving, static, direction, margin=0.0, eps=1e-12):
+                    """
+                    Values of t for which the moving prism translated by t.direction overlaps the static prism, as (t_in, t_out) or None.
+                    Prisms overlap if their projections overlap by more than -margin on every axis:
+                    face normals of both prisms and cross products of their edges (separating axis theorem).
+                    """
+                    V = Toolbox.Vectors
+                    axes = moving['normals'] + static['normals']
+                    for e in moving['edges']:
+                        for f in static['edges']:
+                            c = V.cross(e, f)
+                            length = V.length(c)
+                            if length > 1e-6: axes.append((c[0]/length, c[1]/length, c[2]/length))
+                    t_in, t_out = -float('inf'), float('inf')
+                    for axis in axes:
+                        amin, amax = Toolbox.Collisions.project(moving['points'], axis)
+                        bmin, bmax = Toolbox.Collisions.project(static['points'], axis)
+                        low, high = bmin - margin - amax, bmax + margin - amin
+                        s = V.dot(direction, axis)
+                        if abs(s) < eps:
+                            if not low < 0 < high: return None
+                        else:
+                            if s > 0: t_in, t_out = max(t_in, low / s), min(t_out, high / s)
+                            else: t_in, t_out = max(t_in, high / s), min(t_out, low / s)
+                            if t_in >= t_out: return None
+                    return (t_in, t_out)
+
+
+            class Parallel:
+                """Run independent tasks on a pool of workers, results are returned in input order"""
+
+                @staticmethod
+                def chunks(items, n):
+                    """split a list in (at most) n chunks of consecutive items"""
+                    if len(items) == 0: return []
+                    size = int(math.ceil(len(items) / float(max(n, 1))))
+                    return [items[k:k+size] for k in range(0, len(items), size)]
+
+                @staticmethod
+                def map(function, items, workers=1, processes=True):
+                    """
+                    Apply a function to each item.
+                    IronPython (no GIL) uses a pool of threads, CPython uses a pool of processes if processes is True
+                    (function and items should then be picklable) and a pool of threads otherwise.
+                    """
+                    if workers is None or workers <= 1 or len(items) <= 1:
+                        return [function(item) for item in items]
+                    if sys.platform == 'cli':
+                        import System
+                        import System.Threading.Tasks as tasks
+                        results = [None] * len(items)
+                        def run(k):
+                            results[k] = function(items[k])
+                        options = tasks.ParallelOptions()
+                        options.MaxDegreeOfParallelism = workers
+                        tasks.Parallel.For(0, len(items), options, System.Action[int](run))
+                        return results
+                    if processes:
+                        from multiprocessing import Pool
+                    else:
+                        from multiprocessing.pool import ThreadPool as Pool
+                    pool = Pool(workers)
+                    try:
+                        return pool.map(function, items)
+                    finally:
+                        pool.close()
+                        pool.join()
+
+
             class Planes:
 
                 @staticmethod
@@ -3636,6 +5714,28 @@ if yes:
                         a[0]*b[1] - a[1]*b[0]]
                     return c
 
+                @staticmethod
+                def dot(a, b):
+                    """simple dot product between two vectors"""
+                    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+                @staticmethod
+                def subtract(a, b):
+                    """simple difference between two vectors (or points)"""
+                    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
+
+                @staticmethod
+                def unitize(vector):
+                    """simple unit vector as a tuple, (0,0,0) if the vector is null"""
+                    length = math.sqrt(vector[0]**2 + vector[1]**2 + vector[2]**2)
+                    if length == 0: return (0.0, 0.0, 0.0)
+                    return (vector[0]/length, vector[1]/length, vector[2]/length)
+
+                @staticmethod
+                def length(vector):
+                    """simple vector length"""
+                    return math.sqrt(vector[0]**2 + vector[1]**2 + vector[2]**2)
+
                 @staticmethod
                 def isvectornull(vector):
                     """check if a vector is null or close to (0,0,0)"""
@@ -3646,6 +5746,259 @@ if yes:
                     return state
 
 
+            class Cones:
+                """insertion spaces as sets of constraints on unit directions: halfspaces n.v >= c, planes n.v = 0 and points v = p"""
+
+                @staticmethod
+                def cone(halfspaces=[], planes=[], points=[]):
+                    """insertion cone from (normal, offset) halfspaces, plane normals and points given as 3d vectors"""
+                    return {'halfspaces': [(Toolbox.Vectors.unitize(n), float(c)) for (n, c) in halfspaces],
+                        'planes': [Toolbox.Vectors.unitize(n) for n in planes],
+                        'points': [Toolbox.Vectors.unitize(p) for p in points]}
+
+                @staticmethod
+                def map(cone, function):
+                    """apply a linear function to all the directions of a cone"""
+                    return Toolbox.Cones.cone([(function(n), c) for (n, c) in cone['halfspaces']],
+                        [function(n) for n in cone['planes']],
+                        [function(p) for p in cone['points']])
+
+                @staticmethod
+                def orient(cone, plane):
+                    """express a cone defined in the world frame in the frame of a plane"""
+                    x, y, z = plane.XAxis, plane.YAxis, plane.ZAxis
+                    def local_to_world(v):
+                        return tuple([x[k]*v[0] + y[k]*v[1] + z[k]*v[2] for k in range(3)])
+                    return Toolbox.Cones.map(cone, local_to_world)
+
+                @staticmethod
+                def transform(cone, matrix):
+                    """apply the rotation part of a rhino transformation to a cone"""
+                    m = [[matrix[a, b] for b in range(3)] for a in range(3)]
+                    def rotate(v):
+                        return tuple([m[k][0]*v[0] + m[k][1]*v[1] + m[k][2]*v[2] for k in range(3)])
+                    return Toolbox.Cones.map(cone, rotate)
+
+                @staticmethod
+                def from_geometry(geometry):
+                    """insertion cone from a point, a great-circle arc or a spherical patch lying on the unit sphere centered at the origin"""
+                    if isinstance(geometry, dict): return geometry
+                    if isinstance(geometry, list): geometry = geometry[0]
+                    point = rs.coerce3dpoint(geometry)
+                    if point is not None: return Toolbox.Cones.cone([], [], [point])
+                    curve = rs.coercecurve(geometry)
+                    if curve is not None:
+                        a = Toolbox.Vectors.unitize(curve.PointAtStart)
+                        b = Toolbox.Vectors.unitize(curve.PointAtEnd)
+                        m = Toolbox.Vectors.unitize(curve.PointAtNormalizedLength(0.5))
+                        n = Toolbox.Vectors.unitize(Toolbox.Vectors.cross(a, m))
+                        # arc from a to b turning around n
+                        return Toolbox.Cones.cone([(Toolbox.Vectors.cross(n, a), 0), (Toolbox.Vectors.cross(b, n), 0)], [n])
+                    brep = rs.coercebrep(geometry)
+                    if brep is not None:
+                        inside = Toolbox.Vectors.unitize(rg.AreaMassProperties.Compute(brep).Centroid)
+                        halfspaces = []
+                        for edge in brep.Edges:
+                            if edge.Valence != rg.EdgeAdjacency.Naked: continue
+                            p = [edge.PointAt(edge.Domain.ParameterAt(t)) for t in (0.0, 1.0/3, 2.0/3)]
+                            n = Toolbox.Vectors.cross(Toolbox.Vectors.subtract(p[1], p[0]), Toolbox.Vectors.subtract(p[2], p[0]))
+                            if Toolbox.Vectors.length(n) < 1e-9: continue
+                            n = Toolbox.Vectors.unitize(n)
+                            c = Toolbox.Vectors.dot(n, p[0])
+                            if Toolbox.Vectors.dot(n, inside) < c: n, c = (-n[0], -n[1], -n[2]), -c
+                            halfspaces.append((n, c))
+                        return Toolbox.Cones.merge([Toolbox.Cones.cone(halfspaces)])
+                    raise Exception(' Insertion space should be a point, a curve or a surface')
+
+                @staticmethod
+                def merge(cones, tolerance=0.001):
+                    """intersection of cones as a single cone, duplicated constraints removed"""
+                    merged = {'halfspaces': [], 'planes': [], 'points': []}
+                    def close(a, b):
+                        return Toolbox.Vectors.length(Toolbox.Vectors.subtract(a, b)) <= tolerance
+                    for cone in cones:
+                        for (n, c) in cone['halfspaces']:
+                            if not [1 for (m, d) in merged['halfspaces'] if close(n, m) and abs(c - d) <= tolerance]:
+                                merged['halfspaces'].append((n, c))
+                        for n in cone['planes']:
+                            if not [1 for m in merged['planes'] if close(n, m) or close(n, (-m[0], -m[1], -m[2]))]:
+                                merged['planes'].append(n)
+                        for p in cone['points']:
+                            if not [1 for q in merged['points'] if close(p, q)]:
+                                merged['points'].append(p)
+                    return merged
+
+                @staticmethod
+                def slack(cone, v):
+                    """smallest margin of a unit direction with respect to the constraints of a cone (negative if outside)"""
+                    margins = [Toolbox.Vectors.dot(n, v) - c for (n, c) in cone['halfspaces']]
+                    margins += [-abs(Toolbox.Vectors.dot(n, v)) for n in cone['planes']]
+                    margins += [-Toolbox.Vectors.length(Toolbox.Vectors.subtract(p, v)) for p in cone['points']]
+                    if margins == []: return 1.0
+                    return min(margins)
+
+                @staticmethod
+                def solve(cone, tolerance=0.001, max_iterations=50):
+                    """maximum-clearance direction of a cone and its clearance, None if the cone is empty"""
+                    halfspaces, planes, points = list(cone['halfspaces']), list(cone['planes']), cone['points']
+
+                    # opposite halfspaces through the origin leave only their common plane
+                    for (n, c) in cone['halfspaces']:
+                        opposite = [(m, d) for (m, d) in halfspaces if abs(c) <= tolerance and abs(d) <= tolerance and Toolbox.Vectors.dot(n, m) < -1 + tolerance]
+                        if opposite and (n, c) in halfspaces:
+                            halfspaces.remove((n, c))
+                            halfspaces.remove(opposite[0])
+                            planes.append(n)
+                    cone = {'halfspaces': halfspaces, 'planes': planes, 'points': points}
+
+                    # a point constraint fixes the direction
+                    if points:
+                        v = points[0]
+                        if Toolbox.Cones.slack(cone, v) < -tolerance: return None
+                        return (v, Toolbox.Cones.slack({'halfspaces': halfspaces, 'planes': [], 'points': []}, v))
+
+                    # two independent planes fix the direction up to its sign
+                    for k in range(len(planes)):
+                        for l in range(k+1, len(planes)):
+                            w = Toolbox.Vectors.cross(planes[k], planes[l])
+                            if Toolbox.Vectors.length(w) > tolerance:
+                                w = Toolbox.Vectors.unitize(w)
+                                best = None
+                                for v in (w, (-w[0], -w[1], -w[2])):
+                                    if Toolbox.Cones.slack(cone, v) < -tolerance: continue
+                                    s = Toolbox.Cones.slack({'halfspaces': halfspaces, 'planes': [], 'points': []}, v)
+                                    if best is None or s > best[1]: best = (v, s)
+                                return best
+
+                    # directions are expressed in the plane (circle) or in space (sphere)
+                    if planes:
+                        axis = (1, 0, 0) if abs(planes[0][0]) < 0.9 else (0, 1, 0)
+                        e1 = Toolbox.Vectors.unitize(Toolbox.Vectors.cross(planes[0], axis))
+                        basis = [e1, tuple(Toolbox.Vectors.cross(planes[0], e1))]
+                    else: basis = [(1, 0, 0), (0, 1, 0), (0, 0, 1)]
+                    if halfspaces == []: return (basis[0], 1.0)
+                    d = len(basis)
+                    rows = [([Toolbox.Vectors.dot(n, e) for e in basis], c) for (n, c) in halfspaces]
+                    def dot(a, b): return sum([a[k]*b[k] for k in range(d)])
+                    def margin(u): return min([dot(a, u) - c for (a, c) in rows])
+                    def unit(u):
+                        norm = math.sqrt(dot(u, u))
+                        if norm < 1e-12: return None
+                        return [x / norm for x in u]
+
+                    # maximize t subject to a.u - c >= t and |u| <= 1 (exact for c >= 0), the unit ball being outer-approximated by cutting planes
+                    # variables are shifted to be positive: x = u + 1, s = t + 3
+                    A_ub, b_ub = [], []
+                    for (a, c) in rows:
+                        A_ub.append([-x for x in a] + [1.0])
+                        b_ub.append(3.0 - c - sum(a))
+                    for k in range(d):
+                        A_ub.append([1.0 if x == k else 0.0 for x in range(d)] + [0.0])
+                        b_ub.append(2.0)
+                    A_ub.append([0.0] * d + [1.0])
+                    b_ub.append(4.0)
+                    cuts = [[1 - 2*((k >> x) & 1) for x in range(d)] for k in range(2**d)]
+                    for iteration in range(max_iterations):
+                        for g in cuts:
+                            g = unit(g)
+                            A_ub.append(g + [0.0])
+                            b_ub.append(1.0 + sum(g))
+                        result = Toolbox.Numbers.linear_program([0.0] * d + [1.0], A_ub, b_ub)
+                        if result is None: return None
+                        u = [x - 1 for x in result[1][:d]]
+                        if math.sqrt(dot(u, u)) <= 1 + tolerance: break
+                        cuts = [u]
+                    t = result[0] - 3
+                    if t < -tolerance: return None
+
+                    # exact optimum: one active constraint maximized, two equalized on a circle, or three equalized
+                    u = unit(u)
+                    candidates = [u] if u is not None else []
+                    active = sorted(range(len(rows)), key=lambda k: dot(rows[k][0], u) - rows[k][1] if u is not None else 0)
+                    active = [k for k in active if u is None or dot(rows[k][0], u) - rows[k][1] <= t + 10 * tolerance][:6]
+                    for k in active:
+                        candidates.append(unit(rows[k][0]))
+                    for x in range(len(active)):
+                        for y in range(x+1, len(active)):
+                            a, ca = rows[active[x]]
+                            b = [a[k] - rows[active[y]][0][k] for k in range(d)]
+                            e = ca - rows[active[y]][1]
+                            bb = dot(b, b)
+                            if bb < 1e-12 or e*e > bb: continue
+                            perp = unit([a[k] - dot(a, b) / bb * b[k] for k in range(d)])
+                            if perp is None: continue
+                            r = math.sqrt(1 - e*e / bb)
+                            candidates.append([e / bb * b[k] + r * perp[k] for k in range(d)])
+                            if d == 3:
+                                for z in range(y+1, len(active)):
+                                    b2 = [a[k] - rows[active[z]][0][k] for k in range(d)]
+                                    e2 = ca - rows[active[z]][1]
+                                    w = Toolbox.Vectors.cross(b, b2)
+                                    ww = dot(w, w)
+                                    if ww < 1e-12: continue
+                                    # point of the line b.u = e, b2.u = e2 closest to the origin
+                                    p = [(e * Toolbox.Vectors.cross(b2, w)[k] + e2 * Toolbox.Vectors.cross(w, b)[k]) / ww for k in range(d)]
+                                    h = 1 - dot(p, p)
+                                    if h < 0: continue
+                                    for sign in (1, -1):
+                                        candidates.append([p[k] + sign * math.sqrt(h / ww) * w[k] for k in range(d)])
+                    best = None
+                    for candidate in candidates:
+                        if candidate is None: continue
+                        s = margin(candidate)
+                        if best is None or s > best[1]: best = (candidate, s)
+                    if best is None or best[1] < -tolerance: return None
+                    v = tuple([sum([best[0][k] * basis[k][x] for k in range(d)]) for x in range(3)])
+                    return (v, best[1])
+
+                @staticmethod
+                def corners(cone, tolerance=0.001):
+                    """unit directions where two boundaries of a cone meet, i.e. the vertices of its spherical region"""
+                    if cone['points']: return [cone['points'][0]]
+                    circles = [(n, c) for (n, c) in cone['halfspaces']] + [(n, 0.0) for n in cone['planes']]
+                    corners = []
+                    for k in range(len(circles)):
+                        for l in range(k+1, len(circles)):
+                            (n1, c1), (n2, c2) = circles[k], circles[l]
+                            d = Toolbox.Vectors.dot(n1, n2)
+                            if 1 - d*d < 1e-12: continue
+                            a = (c1 - c2*d) / (1 - d*d)
+                            b = (c2 - c1*d) / (1 - d*d)
+                            r = a*a + b*b + 2*a*b*d
+                            if r > 1: continue
+                            g = math.sqrt((1 - r) / (1 - d*d))
+                            w = Toolbox.Vectors.cross(n1, n2)
+                            for sign in (1, -1):
+                                v = tuple([a*n1[i] + b*n2[i] + sign*g*w[i] for i in range(3)])
+                                if Toolbox.Cones.slack(cone, v) >= -tolerance:
+                                    if not [1 for u in corners if Toolbox.Vectors.length(Toolbox.Vectors.subtract(u, v)) <= tolerance]:
+                                        corners.append(v)
+                    return corners
+
+                @staticmethod
+                def samples(cone, level=3, tolerance=0.001):
+                    """unit directions sampling the spherical region of a cone for display: geodesic points inside it, points along its arc and its corners"""
+                    if cone['points']: return Toolbox.Cones.corners(cone, tolerance)
+                    samples = []
+                    if cone['planes']:
+                        n = cone['planes'][0]
+                        axis = (1, 0, 0) if abs(n[0]) < 0.9 else (0, 1, 0)
+                        e1 = Toolbox.Vectors.unitize(Toolbox.Vectors.cross(n, axis))
+                        e2 = Toolbox.Vectors.cross(n, e1)
+                        count = 10 * 2 ** level
+                        for k in range(count):
+                            a = 2 * math.pi * k / count
+                            v = tuple([math.cos(a) * e1[x] + math.sin(a) * e2[x] for x in range(3)])
+                            if Toolbox.Cones.slack(cone, v) >= -tolerance: samples.append(v)
+                    else:
+                        cloud = Toolbox.Points.geodesic_sphere_points(level)
+                        for k in range(0, len(cloud), 3):
+                            v = (cloud[k], cloud[k+1], cloud[k+2])
+                            if Toolbox.Cones.slack(cone, v) >= -tolerance: samples.append(v)
+                    for v in Toolbox.Cones.corners(cone, tolerance):
+                        if not [1 for u in samples if Toolbox.Vectors.length(Toolbox.Vectors.subtract(u, v)) <= tolerance]: samples.append(v)
+                    return samples
+
             class Points:
 
                 @staticmethod
@@ -3681,5120 +6034,40 @@ if yes:
                     intersect = rs.LinePlaneIntersection(line, plane)
                     return intersect
 
+                GEODESIC = {} # icosphere vertices cached by subdivision level
+
                 @staticmethod
-                def geodesic_sphere_points():
-                    points = [[-0.850650787354,-0.525731086731,0.0],
-                        [0.850650787354,-0.525731086731,0.0],
-                        [-0.850650787354,0.525731086731,0.0],
-                        [0.850650787354,0.525731086731,0.0],
-                        [0.0,-0.850650787354,-0.525731086731],
-                        [0.0,0.850650787354,-0.525731086731],
-                        [0.0,-0.850650787354,0.525731086731],
-                        [0.0,0.850650787354,0.525731086731],
-                        [-0.525731086731,0.0,-0.850650787354],
-                        [-0.525731086731,0.0,0.850650787354],
-                        [0.525731086731,0.0,-0.850650787354],
-                        [0.525731086731,0.0,0.850650787354],
-                        [-0.5,-0.809017002583,0.309017002583],
-                        [0.0,-1.0,0.0],
-                        [-0.5,-0.809017002583,-0.309017002583],
-                        [-0.309017002583,-0.5,0.809017002583],
-                        [-0.5,-0.809017002583,0.309017002583],
-                        [-0.809017002583,-0.309017002583,0.5],
-                        [-0.309017002583,-0.5,0.809017002583],
-                        [0.0,0.0,1.0],
-                        [0.309017002583,-0.5,0.809017002583],
-                        [0.309017002583,-0.5,0.809017002583],
-                        [0.809017002583,-0.309017002583,0.5],
-                        [0.5,-0.809017002583,0.309017002583],
-                        [0.5,-0.809017002583,-0.309017002583],
-                        [0.0,-1.0,0.0],
-                        [0.5,-0.809017002583,0.309017002583],
-                        [-0.5,-0.809017002583,-0.309017002583],
-                        [-0.309017002583,-0.5,-0.809017002583],
-                        [-0.809017002583,-0.309017002583,-0.5],
-                        [0.5,-0.809017002583,-0.309017002583],
-                        [0.809017002583,-0.309017002583,-0.5],
-                        [0.309017002583,-0.5,-0.809017002583],
-                        [0.0,0.0,-1.0],
-                        [-0.309017002583,-0.5,-0.809017002583],
-                        [0.309017002583,-0.5,-0.809017002583],
-                        [-1.0,0.0,0.0],
-                        [-0.809017002583,0.309017002583,-0.5],
-                        [-0.809017002583,-0.309017002583,-0.5],
-                        [-0.5,0.809017002583,-0.309017002583],
-                        [-0.309017002583,0.5,-0.809017002583],
-                        [-0.809017002583,0.309017002583,-0.5],
-                        [0.0,0.0,-1.0],
-                        [-0.309017002583,0.5,-0.809017002583],
-                        [0.309017002583,0.5,-0.809017002583],
-                        [0.309017002583,0.5,-0.809017002583],
-                        [0.5,0.809017002583,-0.309017002583],
-                        [0.809017002583,0.309017002583,-0.5],
-                        [0.5,0.809017002583,-0.309017002583],
-                        [0.0,1.0,0.0],
-                        [0.5,0.809017002583,0.309017002583],
-                        [0.5,0.809017002583,0.309017002583],
-                        [0.309017002583,0.5,0.809017002583],
-                        [0.809017002583,0.309017002583,0.5],
-                        [1.0,0.0,0.0],
-                        [0.809017002583,0.309017002583,0.5],
-                        [0.809017002583,-0.309017002583,0.5],
-                        [-0.809017002583,0.309017002583,0.5],
-                        [-1.0,0.0,0.0],
-                        [-0.809017002583,-0.309017002583,0.5],
-                        [-0.309017002583,0.5,0.809017002583],
-                        [-0.5,0.809017002583,0.309017002583],
-                        [-0.809017002583,0.309017002583,0.5],
-                        [-0.309017002583,0.5,0.809017002583],
-                        [0.0,0.0,1.0],
-                        [0.309017002583,0.5,0.809017002583],
-                        [-0.5,0.809017002583,-0.309017002583],
-                        [-0.5,0.809017002583,0.309017002583],
-                        [0.0,1.0,0.0],
-                        [0.809017002583,0.309017002583,-0.5],
-                        [1.0,0.0,0.0],
-                        [0.809017002583,-0.309017002583,-0.5],
-                        [-0.71656692028,-0.681718349457,0.147620901465],
-                        [-0.525731086731,-0.850650787354,0.0],
-                        [-0.71656692028,-0.681718349457,-0.147620901465],
-                        [-0.238855645061,-0.864187836647,0.442862719297],
-                        [0.0,-0.955422580242,0.295241802931],
-                        [-0.262865543365,-0.951056540012,0.162459850311],
-                        [-0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.0,-0.955422580242,-0.295241802931],
-                        [-0.238855645061,-0.864187836647,-0.442862719297],
-                        [-0.262865543365,-0.951056540012,0.162459850311],
-                        [-0.262865543365,-0.951056540012,-0.162459850311],
-                        [-0.525731086731,-0.850650787354,0.0],
-                        [-0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.587785243988,-0.425325393677,0.688190937042],
-                        [-0.681718349457,-0.147620901465,0.71656692028],
-                        [-0.147620901465,-0.71656692028,0.681718349457],
-                        [-0.238855645061,-0.864187836647,0.442862719297],
-                        [-0.425325393677,-0.688190937042,0.587785243988],
-                        [-0.688190937042,-0.587785243988,0.425325393677],
-                        [-0.71656692028,-0.681718349457,0.147620901465],
-                        [-0.864187836647,-0.442862719297,0.238855645061],
-                        [-0.425325393677,-0.688190937042,0.587785243988],
-                        [-0.688190937042,-0.587785243988,0.425325393677],
-                        [-0.587785243988,-0.425325393677,0.688190937042],
-                        [-0.147620901465,-0.71656692028,0.681718349457],
-                        [0.0,-0.525731086731,0.850650787354],
-                        [0.147620901465,-0.71656692028,0.681718349457],
-                        [-0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.295241802931,0.0,0.955422580242],
-                        [-0.162459850311,-0.262865543365,0.951056540012],
-                        [0.162459850311,-0.262865543365,0.951056540012],
-                        [0.295241802931,0.0,0.955422580242],
-                        [0.442862719297,-0.238855645061,0.864187836647],
-                        [-0.162459850311,-0.262865543365,0.951056540012],
-                        [0.162459850311,-0.262865543365,0.951056540012],
-                        [0.0,-0.525731086731,0.850650787354],
-                        [0.147620901465,-0.71656692028,0.681718349457],
-                        [0.425325393677,-0.688190937042,0.587785243988],
-                        [0.238855645061,-0.864187836647,0.442862719297],
-                        [0.442862719297,-0.238855645061,0.864187836647],
-                        [0.681718349457,-0.147620901465,0.71656692028],
-                        [0.587785243988,-0.425325393677,0.688190937042],
-                        [0.688190937042,-0.587785243988,0.425325393677],
-                        [0.864187836647,-0.442862719297,0.238855645061],
-                        [0.71656692028,-0.681718349457,0.147620901465],
-                        [0.587785243988,-0.425325393677,0.688190937042],
-                        [0.688190937042,-0.587785243988,0.425325393677],
-                        [0.425325393677,-0.688190937042,0.587785243988],
-                        [0.71656692028,-0.681718349457,-0.147620901465],
-                        [0.525731086731,-0.850650787354,0.0],
-                        [0.71656692028,-0.681718349457,0.147620901465],
-                        [0.238855645061,-0.864187836647,-0.442862719297],
-                        [0.0,-0.955422580242,-0.295241802931],
-                        [0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.262865543365,-0.951056540012,0.162459850311],
-                        [0.0,-0.955422580242,0.295241802931],
-                        [0.238855645061,-0.864187836647,0.442862719297],
-                        [0.262865543365,-0.951056540012,-0.162459850311],
-                        [0.262865543365,-0.951056540012,0.162459850311],
-                        [0.525731086731,-0.850650787354,0.0],
-                        [-0.71656692028,-0.681718349457,-0.147620901465],
-                        [-0.688190937042,-0.587785243988,-0.425325393677],
-                        [-0.864187836647,-0.442862719297,-0.238855645061],
-                        [-0.238855645061,-0.864187836647,-0.442862719297],
-                        [-0.147620901465,-0.71656692028,-0.681718349457],
-                        [-0.425325393677,-0.688190937042,-0.587785243988],
-                        [-0.587785243988,-0.425325393677,-0.688190937042],
-                        [-0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.681718349457,-0.147620901465,-0.71656692028],
-                        [-0.425325393677,-0.688190937042,-0.587785243988],
-                        [-0.587785243988,-0.425325393677,-0.688190937042],
-                        [-0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.238855645061,-0.864187836647,-0.442862719297],
-                        [0.425325393677,-0.688190937042,-0.587785243988],
-                        [0.147620901465,-0.71656692028,-0.681718349457],
-                        [0.71656692028,-0.681718349457,-0.147620901465],
-                        [0.864187836647,-0.442862719297,-0.238855645061],
-                        [0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.587785243988,-0.425325393677,-0.688190937042],
-                        [0.681718349457,-0.147620901465,-0.71656692028],
-                        [0.442862719297,-0.238855645061,-0.864187836647],
-                        [0.688190937042,-0.587785243988,-0.425325393677],
-                        [0.587785243988,-0.425325393677,-0.688190937042],
-                        [0.425325393677,-0.688190937042,-0.587785243988],
-                        [0.295241802931,0.0,-0.955422580242],
-                        [0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.295241802931,0.0,-0.955422580242],
-                        [-0.442862719297,-0.238855645061,-0.864187836647],
-                        [-0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.0,-0.525731086731,-0.850650787354],
-                        [-0.147620901465,-0.71656692028,-0.681718349457],
-                        [0.147620901465,-0.71656692028,-0.681718349457],
-                        [-0.162459850311,-0.262865543365,-0.951056540012],
-                        [0.0,-0.525731086731,-0.850650787354],
-                        [0.162459850311,-0.262865543365,-0.951056540012],
-                        [-0.955422580242,-0.295241802931,0.0],
-                        [-0.951056540012,-0.162459850311,-0.262865543365],
-                        [-0.864187836647,-0.442862719297,-0.238855645061],
-                        [-0.955422580242,0.295241802931,0.0],
-                        [-0.864187836647,0.442862719297,-0.238855645061],
-                        [-0.951056540012,0.162459850311,-0.262865543365],
-                        [-0.850650787354,0.0,-0.525731086731],
-                        [-0.681718349457,0.147620901465,-0.71656692028],
-                        [-0.681718349457,-0.147620901465,-0.71656692028],
-                        [-0.951056540012,0.162459850311,-0.262865543365],
-                        [-0.850650787354,0.0,-0.525731086731],
-                        [-0.951056540012,-0.162459850311,-0.262865543365],
-                        [-0.71656692028,0.681718349457,-0.147620901465],
-                        [-0.688190937042,0.587785243988,-0.425325393677],
-                        [-0.864187836647,0.442862719297,-0.238855645061],
-                        [-0.238855645061,0.864187836647,-0.442862719297],
-                        [-0.147620901465,0.71656692028,-0.681718349457],
-                        [-0.425325393677,0.688190937042,-0.587785243988],
-                        [-0.587785243988,0.425325393677,-0.688190937042],
-                        [-0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.681718349457,0.147620901465,-0.71656692028],
-                        [-0.425325393677,0.688190937042,-0.587785243988],
-                        [-0.587785243988,0.425325393677,-0.688190937042],
-                        [-0.688190937042,0.587785243988,-0.425325393677],
-                        [0.295241802931,0.0,-0.955422580242],
-                        [0.162459850311,0.262865543365,-0.951056540012],
-                        [0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.295241802931,0.0,-0.955422580242],
-                        [-0.442862719297,0.238855645061,-0.864187836647],
-                        [-0.162459850311,0.262865543365,-0.951056540012],
-                        [0.0,0.525731086731,-0.850650787354],
-                        [-0.147620901465,0.71656692028,-0.681718349457],
-                        [0.147620901465,0.71656692028,-0.681718349457],
-                        [-0.162459850311,0.262865543365,-0.951056540012],
-                        [0.0,0.525731086731,-0.850650787354],
-                        [0.162459850311,0.262865543365,-0.951056540012],
-                        [0.442862719297,0.238855645061,-0.864187836647],
-                        [0.587785243988,0.425325393677,-0.688190937042],
-                        [0.681718349457,0.147620901465,-0.71656692028],
-                        [0.147620901465,0.71656692028,-0.681718349457],
-                        [0.238855645061,0.864187836647,-0.442862719297],
-                        [0.425325393677,0.688190937042,-0.587785243988],
-                        [0.688190937042,0.587785243988,-0.425325393677],
-                        [0.71656692028,0.681718349457,-0.147620901465],
-                        [0.864187836647,0.442862719297,-0.238855645061],
-                        [0.425325393677,0.688190937042,-0.587785243988],
-                        [0.688190937042,0.587785243988,-0.425325393677],
-                        [0.587785243988,0.425325393677,-0.688190937042],
-                        [0.71656692028,0.681718349457,-0.147620901465],
-                        [0.525731086731,0.850650787354,0.0],
-                        [0.71656692028,0.681718349457,0.147620901465],
-                        [0.238855645061,0.864187836647,-0.442862719297],
-                        [0.0,0.955422580242,-0.295241802931],
-                        [0.262865543365,0.951056540012,-0.162459850311],
-                        [0.262865543365,0.951056540012,0.162459850311],
-                        [0.0,0.955422580242,0.295241802931],
-                        [0.238855645061,0.864187836647,0.442862719297],
-                        [0.262865543365,0.951056540012,-0.162459850311],
-                        [0.262865543365,0.951056540012,0.162459850311],
-                        [0.525731086731,0.850650787354,0.0],
-                        [0.71656692028,0.681718349457,0.147620901465],
-                        [0.688190937042,0.587785243988,0.425325393677],
-                        [0.864187836647,0.442862719297,0.238855645061],
-                        [0.238855645061,0.864187836647,0.442862719297],
-                        [0.147620901465,0.71656692028,0.681718349457],
-                        [0.425325393677,0.688190937042,0.587785243988],
-                        [0.587785243988,0.425325393677,0.688190937042],
-                        [0.442862719297,0.238855645061,0.864187836647],
-                        [0.681718349457,0.147620901465,0.71656692028],
-                        [0.425325393677,0.688190937042,0.587785243988],
-                        [0.587785243988,0.425325393677,0.688190937042],
-                        [0.688190937042,0.587785243988,0.425325393677],
-                        [0.955422580242,-0.295241802931,0.0],
-                        [0.951056540012,-0.162459850311,0.262865543365],
-                        [0.864187836647,-0.442862719297,0.238855645061],
-                        [0.955422580242,0.295241802931,0.0],
-                        [0.864187836647,0.442862719297,0.238855645061],
-                        [0.951056540012,0.162459850311,0.262865543365],
-                        [0.850650787354,0.0,0.525731086731],
-                        [0.681718349457,0.147620901465,0.71656692028],
-                        [0.681718349457,-0.147620901465,0.71656692028],
-                        [0.951056540012,0.162459850311,0.262865543365],
-                        [0.850650787354,0.0,0.525731086731],
-                        [0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.681718349457,0.147620901465,0.71656692028],
-                        [-0.850650787354,0.0,0.525731086731],
-                        [-0.681718349457,-0.147620901465,0.71656692028],
-                        [-0.864187836647,0.442862719297,0.238855645061],
-                        [-0.955422580242,0.295241802931,0.0],
-                        [-0.951056540012,0.162459850311,0.262865543365],
-                        [-0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.955422580242,-0.295241802931,0.0],
-                        [-0.864187836647,-0.442862719297,0.238855645061],
-                        [-0.951056540012,0.162459850311,0.262865543365],
-                        [-0.951056540012,-0.162459850311,0.262865543365],
-                        [-0.850650787354,0.0,0.525731086731],
-                        [-0.442862719297,0.238855645061,0.864187836647],
-                        [-0.587785243988,0.425325393677,0.688190937042],
-                        [-0.681718349457,0.147620901465,0.71656692028],
-                        [-0.147620901465,0.71656692028,0.681718349457],
-                        [-0.238855645061,0.864187836647,0.442862719297],
-                        [-0.425325393677,0.688190937042,0.587785243988],
-                        [-0.688190937042,0.587785243988,0.425325393677],
-                        [-0.71656692028,0.681718349457,0.147620901465],
-                        [-0.864187836647,0.442862719297,0.238855645061],
-                        [-0.425325393677,0.688190937042,0.587785243988],
-                        [-0.688190937042,0.587785243988,0.425325393677],
-                        [-0.587785243988,0.425325393677,0.688190937042],
-                        [-0.147620901465,0.71656692028,0.681718349457],
-                        [0.0,0.525731086731,0.850650787354],
-                        [0.147620901465,0.71656692028,0.681718349457],
-                        [-0.442862719297,0.238855645061,0.864187836647],
-                        [-0.295241802931,0.0,0.955422580242],
-                        [-0.162459850311,0.262865543365,0.951056540012],
-                        [0.162459850311,0.262865543365,0.951056540012],
-                        [0.295241802931,0.0,0.955422580242],
-                        [0.442862719297,0.238855645061,0.864187836647],
-                        [-0.162459850311,0.262865543365,0.951056540012],
-                        [0.162459850311,0.262865543365,0.951056540012],
-                        [0.0,0.525731086731,0.850650787354],
-                        [-0.238855645061,0.864187836647,-0.442862719297],
-                        [-0.262865543365,0.951056540012,-0.162459850311],
-                        [0.0,0.955422580242,-0.295241802931],
-                        [-0.71656692028,0.681718349457,-0.147620901465],
-                        [-0.71656692028,0.681718349457,0.147620901465],
-                        [-0.525731086731,0.850650787354,0.0],
-                        [-0.262865543365,0.951056540012,0.162459850311],
-                        [-0.238855645061,0.864187836647,0.442862719297],
-                        [0.0,0.955422580242,0.295241802931],
-                        [-0.525731086731,0.850650787354,0.0],
-                        [-0.262865543365,0.951056540012,0.162459850311],
-                        [-0.262865543365,0.951056540012,-0.162459850311],
-                        [0.681718349457,0.147620901465,-0.71656692028],
-                        [0.850650787354,0.0,-0.525731086731],
-                        [0.681718349457,-0.147620901465,-0.71656692028],
-                        [0.864187836647,0.442862719297,-0.238855645061],
-                        [0.955422580242,0.295241802931,0.0],
-                        [0.951056540012,0.162459850311,-0.262865543365],
-                        [0.951056540012,-0.162459850311,-0.262865543365],
-                        [0.955422580242,-0.295241802931,0.0],
-                        [0.864187836647,-0.442862719297,-0.238855645061],
-                        [0.951056540012,0.162459850311,-0.262865543365],
-                        [0.951056540012,-0.162459850311,-0.262865543365],
-                        [0.850650787354,0.0,-0.525731086731],
-                        [-0.793863236904,-0.604043483734,0.070090636611],
-                        [-0.724504590034,-0.689269959927,0.0],
-                        [-0.793863236904,-0.604043483734,-0.070090636611],
-                        [-0.617670714855,-0.752343893051,0.229044884443],
-                        [-0.518927633762,-0.839642524719,0.16035746038],
-                        [-0.632596552372,-0.770524084568,0.0781932324171],
-                        [-0.632596552372,-0.770524084568,-0.0781932324171],
-                        [-0.518927633762,-0.839642524719,-0.16035746038],
-                        [-0.617670714855,-0.752343893051,-0.229044884443],
-                        [-0.632596552372,-0.770524084568,0.0781932324171],
-                        [-0.632596552372,-0.770524084568,-0.0781932324171],
-                        [-0.724504590034,-0.689269959927,0.0],
-                        [-0.370602428913,-0.846715569496,0.381741464138],
-                        [-0.253038614988,-0.915502369404,0.312772929668],
-                        [-0.389195710421,-0.889195740223,0.240536183119],
-                        [-0.113409027457,-0.863953828812,0.490634441376],
-                        [0.0,-0.907272219658,0.420543789864],
-                        [-0.120750762522,-0.919883430004,0.373140364885],
-                        [-0.126519307494,-0.963828444481,0.234579697251],
-                        [0.0,-0.988273143768,0.152696594596],
-                        [-0.129731908441,-0.988302052021,0.0801787301898],
-                        [-0.120750762522,-0.919883430004,0.373140364885],
-                        [-0.126519307494,-0.963828444481,0.234579697251],
-                        [-0.253038614988,-0.915502369404,0.312772929668],
-                        [-0.389195710421,-0.889195740223,-0.240536183119],
-                        [-0.253038614988,-0.915502369404,-0.312772929668],
-                        [-0.370602428913,-0.846715569496,-0.381741464138],
-                        [-0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.0,-0.988273143768,-0.152696594596],
-                        [-0.126519307494,-0.963828444481,-0.234579697251],
-                        [-0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.0,-0.907272219658,-0.420543789864],
-                        [-0.113409027457,-0.863953828812,-0.490634441376],
-                        [-0.126519307494,-0.963828444481,-0.234579697251],
-                        [-0.120750762522,-0.919883430004,-0.373140364885],
-                        [-0.253038614988,-0.915502369404,-0.312772929668],
-                        [-0.389195710421,-0.889195740223,0.240536183119],
-                        [-0.39960706234,-0.912982463837,0.0823235809803],
-                        [-0.518927633762,-0.839642524719,0.16035746038],
-                        [-0.129731908441,-0.988302052021,0.0801787301898],
-                        [-0.129731908441,-0.988302052021,-0.0801787301898],
-                        [-0.266404688358,-0.96386128664,0.0],
-                        [-0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.389195710421,-0.889195740223,-0.240536183119],
-                        [-0.518927633762,-0.839642524719,-0.16035746038],
-                        [-0.266404688358,-0.96386128664,0.0],
-                        [-0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.39960706234,-0.912982463837,0.0823235809803],
-                        [-0.490634441376,-0.113409027457,0.863953828812],
-                        [-0.568519234657,-0.19537883997,0.79913264513],
-                        [-0.604043483734,-0.070090636611,0.793863236904],
-                        [-0.381741464138,-0.370602428913,0.846715569496],
-                        [-0.450446814299,-0.469374448061,0.759463787079],
-                        [-0.517485499382,-0.331231862307,0.788983047009],
-                        [-0.644004821777,-0.28290578723,0.71078979969],
-                        [-0.70991063118,-0.370268076658,0.599106371403],
-                        [-0.752343893051,-0.229044884443,0.617670714855],
-                        [-0.517485499382,-0.331231862307,0.788983047009],
-                        [-0.644004821777,-0.28290578723,0.71078979969],
-                        [-0.568519234657,-0.19537883997,0.79913264513],
-                        [-0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.28290578723,-0.71078979969,0.644004821777],
-                        [-0.370268076658,-0.599106371403,0.70991063118],
-                        [-0.070090636611,-0.793863236904,0.604043483734],
-                        [-0.113409027457,-0.863953828812,0.490634441376],
-                        [-0.19537883997,-0.79913264513,0.568519234657],
-                        [-0.331231862307,-0.788983047009,0.517485499382],
-                        [-0.370602428913,-0.846715569496,0.381741464138],
-                        [-0.469374448061,-0.759463787079,0.450446814299],
-                        [-0.19537883997,-0.79913264513,0.568519234657],
-                        [-0.331231862307,-0.788983047009,0.517485499382],
-                        [-0.28290578723,-0.71078979969,0.644004821777],
-                        [-0.759463787079,-0.450446814299,0.469374448061],
-                        [-0.788983047009,-0.517485499382,0.331231862307],
-                        [-0.846715569496,-0.381741464138,0.370602428913],
-                        [-0.599106371403,-0.70991063118,0.370268076658],
-                        [-0.617670714855,-0.752343893051,0.229044884443],
-                        [-0.71078979969,-0.644004821777,0.28290578723],
-                        [-0.79913264513,-0.568519234657,0.19537883997],
-                        [-0.793863236904,-0.604043483734,0.070090636611],
-                        [-0.863953828812,-0.490634441376,0.113409027457],
-                        [-0.71078979969,-0.644004821777,0.28290578723],
-                        [-0.79913264513,-0.568519234657,0.19537883997],
-                        [-0.788983047009,-0.517485499382,0.331231862307],
-                        [-0.370268076658,-0.599106371403,0.70991063118],
-                        [-0.513375461102,-0.5642542243,0.646577775478],
-                        [-0.450446814299,-0.469374448061,0.759463787079],
-                        [-0.469374448061,-0.759463787079,0.450446814299],
-                        [-0.599106371403,-0.70991063118,0.370268076658],
-                        [-0.5642542243,-0.646577775478,0.513375461102],
-                        [-0.646577775478,-0.513375461102,0.5642542243],
-                        [-0.759463787079,-0.450446814299,0.469374448061],
-                        [-0.70991063118,-0.370268076658,0.599106371403],
-                        [-0.5642542243,-0.646577775478,0.513375461102],
-                        [-0.646577775478,-0.513375461102,0.5642542243],
-                        [-0.513375461102,-0.5642542243,0.646577775478],
-                        [-0.070090636611,-0.793863236904,0.604043483734],
-                        [0.0,-0.724504590034,0.689269959927],
-                        [0.070090636611,-0.793863236904,0.604043483734],
-                        [-0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.16035746038,-0.518927633762,0.839642524719],
-                        [-0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.16035746038,-0.518927633762,0.839642524719],
-                        [0.229044884443,-0.617670714855,0.752343893051],
-                        [-0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0781932324171,-0.632596552372,0.770524084568],
-                        [0.0,-0.724504590034,0.689269959927],
-                        [-0.381741464138,-0.370602428913,0.846715569496],
-                        [-0.312772929668,-0.253038614988,0.915502369404],
-                        [-0.240536183119,-0.389195710421,0.889195740223],
-                        [-0.490634441376,-0.113409027457,0.863953828812],
-                        [-0.420543789864,0.0,0.907272219658],
-                        [-0.373140364885,-0.120750762522,0.919883430004],
-                        [-0.234579697251,-0.126519307494,0.963828444481],
-                        [-0.152696594596,0.0,0.988273143768],
-                        [-0.0801787301898,-0.129731908441,0.988302052021],
-                        [-0.373140364885,-0.120750762522,0.919883430004],
-                        [-0.234579697251,-0.126519307494,0.963828444481],
-                        [-0.312772929668,-0.253038614988,0.915502369404],
-                        [0.240536183119,-0.389195710421,0.889195740223],
-                        [0.312772929668,-0.253038614988,0.915502369404],
-                        [0.381741464138,-0.370602428913,0.846715569496],
-                        [0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.152696594596,0.0,0.988273143768],
-                        [0.234579697251,-0.126519307494,0.963828444481],
-                        [0.373140364885,-0.120750762522,0.919883430004],
-                        [0.420543789864,0.0,0.907272219658],
-                        [0.490634441376,-0.113409027457,0.863953828812],
-                        [0.234579697251,-0.126519307494,0.963828444481],
-                        [0.373140364885,-0.120750762522,0.919883430004],
-                        [0.312772929668,-0.253038614988,0.915502369404],
-                        [-0.240536183119,-0.389195710421,0.889195740223],
-                        [-0.0823235809803,-0.39960706234,0.912982463837],
-                        [-0.16035746038,-0.518927633762,0.839642524719],
-                        [-0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.0801787301898,-0.129731908441,0.988302052021],
-                        [0.0,-0.266404688358,0.96386128664],
-                        [0.0823235809803,-0.39960706234,0.912982463837],
-                        [0.240536183119,-0.389195710421,0.889195740223],
-                        [0.16035746038,-0.518927633762,0.839642524719],
-                        [0.0,-0.266404688358,0.96386128664],
-                        [0.0823235809803,-0.39960706234,0.912982463837],
-                        [-0.0823235809803,-0.39960706234,0.912982463837],
-                        [0.070090636611,-0.793863236904,0.604043483734],
-                        [0.19537883997,-0.79913264513,0.568519234657],
-                        [0.113409027457,-0.863953828812,0.490634441376],
-                        [0.229044884443,-0.617670714855,0.752343893051],
-                        [0.370268076658,-0.599106371403,0.70991063118],
-                        [0.28290578723,-0.71078979969,0.644004821777],
-                        [0.331231862307,-0.788983047009,0.517485499382],
-                        [0.469374448061,-0.759463787079,0.450446814299],
-                        [0.370602428913,-0.846715569496,0.381741464138],
-                        [0.28290578723,-0.71078979969,0.644004821777],
-                        [0.331231862307,-0.788983047009,0.517485499382],
-                        [0.19537883997,-0.79913264513,0.568519234657],
-                        [0.381741464138,-0.370602428913,0.846715569496],
-                        [0.517485499382,-0.331231862307,0.788983047009],
-                        [0.450446814299,-0.469374448061,0.759463787079],
-                        [0.490634441376,-0.113409027457,0.863953828812],
-                        [0.604043483734,-0.070090636611,0.793863236904],
-                        [0.568519234657,-0.19537883997,0.79913264513],
-                        [0.644004821777,-0.28290578723,0.71078979969],
-                        [0.752343893051,-0.229044884443,0.617670714855],
-                        [0.70991063118,-0.370268076658,0.599106371403],
-                        [0.568519234657,-0.19537883997,0.79913264513],
-                        [0.644004821777,-0.28290578723,0.71078979969],
-                        [0.517485499382,-0.331231862307,0.788983047009],
-                        [0.599106371403,-0.70991063118,0.370268076658],
-                        [0.71078979969,-0.644004821777,0.28290578723],
-                        [0.617670714855,-0.752343893051,0.229044884443],
-                        [0.759463787079,-0.450446814299,0.469374448061],
-                        [0.846715569496,-0.381741464138,0.370602428913],
-                        [0.788983047009,-0.517485499382,0.331231862307],
-                        [0.79913264513,-0.568519234657,0.19537883997],
-                        [0.863953828812,-0.490634441376,0.113409027457],
-                        [0.793863236904,-0.604043483734,0.070090636611],
-                        [0.788983047009,-0.517485499382,0.331231862307],
-                        [0.79913264513,-0.568519234657,0.19537883997],
-                        [0.71078979969,-0.644004821777,0.28290578723],
-                        [0.450446814299,-0.469374448061,0.759463787079],
-                        [0.513375461102,-0.5642542243,0.646577775478],
-                        [0.370268076658,-0.599106371403,0.70991063118],
-                        [0.70991063118,-0.370268076658,0.599106371403],
-                        [0.759463787079,-0.450446814299,0.469374448061],
-                        [0.646577775478,-0.513375461102,0.5642542243],
-                        [0.5642542243,-0.646577775478,0.513375461102],
-                        [0.599106371403,-0.70991063118,0.370268076658],
-                        [0.469374448061,-0.759463787079,0.450446814299],
-                        [0.646577775478,-0.513375461102,0.5642542243],
-                        [0.5642542243,-0.646577775478,0.513375461102],
-                        [0.513375461102,-0.5642542243,0.646577775478],
-                        [0.793863236904,-0.604043483734,-0.070090636611],
-                        [0.724504590034,-0.689269959927,0.0],
-                        [0.793863236904,-0.604043483734,0.070090636611],
-                        [0.617670714855,-0.752343893051,-0.229044884443],
-                        [0.518927633762,-0.839642524719,-0.16035746038],
-                        [0.632596552372,-0.770524084568,-0.0781932324171],
-                        [0.632596552372,-0.770524084568,0.0781932324171],
-                        [0.518927633762,-0.839642524719,0.16035746038],
-                        [0.617670714855,-0.752343893051,0.229044884443],
-                        [0.632596552372,-0.770524084568,-0.0781932324171],
-                        [0.632596552372,-0.770524084568,0.0781932324171],
-                        [0.724504590034,-0.689269959927,0.0],
-                        [0.370602428913,-0.846715569496,-0.381741464138],
-                        [0.253038614988,-0.915502369404,-0.312772929668],
-                        [0.389195710421,-0.889195740223,-0.240536183119],
-                        [0.113409027457,-0.863953828812,-0.490634441376],
-                        [0.0,-0.907272219658,-0.420543789864],
-                        [0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.126519307494,-0.963828444481,-0.234579697251],
-                        [0.0,-0.988273143768,-0.152696594596],
-                        [0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.120750762522,-0.919883430004,-0.373140364885],
-                        [0.126519307494,-0.963828444481,-0.234579697251],
-                        [0.253038614988,-0.915502369404,-0.312772929668],
-                        [0.389195710421,-0.889195740223,0.240536183119],
-                        [0.253038614988,-0.915502369404,0.312772929668],
-                        [0.370602428913,-0.846715569496,0.381741464138],
-                        [0.129731908441,-0.988302052021,0.0801787301898],
-                        [0.0,-0.988273143768,0.152696594596],
-                        [0.126519307494,-0.963828444481,0.234579697251],
-                        [0.120750762522,-0.919883430004,0.373140364885],
-                        [0.0,-0.907272219658,0.420543789864],
-                        [0.113409027457,-0.863953828812,0.490634441376],
-                        [0.126519307494,-0.963828444481,0.234579697251],
-                        [0.120750762522,-0.919883430004,0.373140364885],
-                        [0.253038614988,-0.915502369404,0.312772929668],
-                        [0.389195710421,-0.889195740223,-0.240536183119],
-                        [0.39960706234,-0.912982463837,-0.0823235809803],
-                        [0.518927633762,-0.839642524719,-0.16035746038],
-                        [0.129731908441,-0.988302052021,-0.0801787301898],
-                        [0.129731908441,-0.988302052021,0.0801787301898],
-                        [0.266404688358,-0.96386128664,0.0],
-                        [0.39960706234,-0.912982463837,0.0823235809803],
-                        [0.389195710421,-0.889195740223,0.240536183119],
-                        [0.518927633762,-0.839642524719,0.16035746038],
-                        [0.266404688358,-0.96386128664,0.0],
-                        [0.39960706234,-0.912982463837,0.0823235809803],
-                        [0.39960706234,-0.912982463837,-0.0823235809803],
-                        [-0.793863236904,-0.604043483734,-0.070090636611],
-                        [-0.79913264513,-0.568519234657,-0.19537883997],
-                        [-0.863953828812,-0.490634441376,-0.113409027457],
-                        [-0.617670714855,-0.752343893051,-0.229044884443],
-                        [-0.599106371403,-0.70991063118,-0.370268076658],
-                        [-0.71078979969,-0.644004821777,-0.28290578723],
-                        [-0.788983047009,-0.517485499382,-0.331231862307],
-                        [-0.759463787079,-0.450446814299,-0.469374448061],
-                        [-0.846715569496,-0.381741464138,-0.370602428913],
-                        [-0.71078979969,-0.644004821777,-0.28290578723],
-                        [-0.788983047009,-0.517485499382,-0.331231862307],
-                        [-0.79913264513,-0.568519234657,-0.19537883997],
-                        [-0.370602428913,-0.846715569496,-0.381741464138],
-                        [-0.331231862307,-0.788983047009,-0.517485499382],
-                        [-0.469374448061,-0.759463787079,-0.450446814299],
-                        [-0.113409027457,-0.863953828812,-0.490634441376],
-                        [-0.070090636611,-0.793863236904,-0.604043483734],
-                        [-0.19537883997,-0.79913264513,-0.568519234657],
-                        [-0.28290578723,-0.71078979969,-0.644004821777],
-                        [-0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.370268076658,-0.599106371403,-0.70991063118],
-                        [-0.19537883997,-0.79913264513,-0.568519234657],
-                        [-0.28290578723,-0.71078979969,-0.644004821777],
-                        [-0.331231862307,-0.788983047009,-0.517485499382],
-                        [-0.70991063118,-0.370268076658,-0.599106371403],
-                        [-0.644004821777,-0.28290578723,-0.71078979969],
-                        [-0.752343893051,-0.229044884443,-0.617670714855],
-                        [-0.450446814299,-0.469374448061,-0.759463787079],
-                        [-0.381741464138,-0.370602428913,-0.846715569496],
-                        [-0.517485499382,-0.331231862307,-0.788983047009],
-                        [-0.568519234657,-0.19537883997,-0.79913264513],
-                        [-0.490634441376,-0.113409027457,-0.863953828812],
-                        [-0.604043483734,-0.070090636611,-0.793863236904],
-                        [-0.517485499382,-0.331231862307,-0.788983047009],
-                        [-0.568519234657,-0.19537883997,-0.79913264513],
-                        [-0.644004821777,-0.28290578723,-0.71078979969],
-                        [-0.469374448061,-0.759463787079,-0.450446814299],
-                        [-0.5642542243,-0.646577775478,-0.513375461102],
-                        [-0.599106371403,-0.70991063118,-0.370268076658],
-                        [-0.370268076658,-0.599106371403,-0.70991063118],
-                        [-0.450446814299,-0.469374448061,-0.759463787079],
-                        [-0.513375461102,-0.5642542243,-0.646577775478],
-                        [-0.646577775478,-0.513375461102,-0.5642542243],
-                        [-0.70991063118,-0.370268076658,-0.599106371403],
-                        [-0.759463787079,-0.450446814299,-0.469374448061],
-                        [-0.513375461102,-0.5642542243,-0.646577775478],
-                        [-0.646577775478,-0.513375461102,-0.5642542243],
-                        [-0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.113409027457,-0.863953828812,-0.490634441376],
-                        [0.19537883997,-0.79913264513,-0.568519234657],
-                        [0.070090636611,-0.793863236904,-0.604043483734],
-                        [0.370602428913,-0.846715569496,-0.381741464138],
-                        [0.469374448061,-0.759463787079,-0.450446814299],
-                        [0.331231862307,-0.788983047009,-0.517485499382],
-                        [0.28290578723,-0.71078979969,-0.644004821777],
-                        [0.370268076658,-0.599106371403,-0.70991063118],
-                        [0.229044884443,-0.617670714855,-0.752343893051],
-                        [0.331231862307,-0.788983047009,-0.517485499382],
-                        [0.28290578723,-0.71078979969,-0.644004821777],
-                        [0.19537883997,-0.79913264513,-0.568519234657],
-                        [0.617670714855,-0.752343893051,-0.229044884443],
-                        [0.71078979969,-0.644004821777,-0.28290578723],
-                        [0.599106371403,-0.70991063118,-0.370268076658],
-                        [0.793863236904,-0.604043483734,-0.070090636611],
-                        [0.863953828812,-0.490634441376,-0.113409027457],
-                        [0.79913264513,-0.568519234657,-0.19537883997],
-                        [0.788983047009,-0.517485499382,-0.331231862307],
-                        [0.846715569496,-0.381741464138,-0.370602428913],
-                        [0.759463787079,-0.450446814299,-0.469374448061],
-                        [0.79913264513,-0.568519234657,-0.19537883997],
-                        [0.788983047009,-0.517485499382,-0.331231862307],
-                        [0.71078979969,-0.644004821777,-0.28290578723],
-                        [0.450446814299,-0.469374448061,-0.759463787079],
-                        [0.517485499382,-0.331231862307,-0.788983047009],
-                        [0.381741464138,-0.370602428913,-0.846715569496],
-                        [0.70991063118,-0.370268076658,-0.599106371403],
-                        [0.752343893051,-0.229044884443,-0.617670714855],
-                        [0.644004821777,-0.28290578723,-0.71078979969],
-                        [0.568519234657,-0.19537883997,-0.79913264513],
-                        [0.604043483734,-0.070090636611,-0.793863236904],
-                        [0.490634441376,-0.113409027457,-0.863953828812],
-                        [0.644004821777,-0.28290578723,-0.71078979969],
-                        [0.568519234657,-0.19537883997,-0.79913264513],
-                        [0.517485499382,-0.331231862307,-0.788983047009],
-                        [0.599106371403,-0.70991063118,-0.370268076658],
-                        [0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.469374448061,-0.759463787079,-0.450446814299],
-                        [0.759463787079,-0.450446814299,-0.469374448061],
-                        [0.70991063118,-0.370268076658,-0.599106371403],
-                        [0.646577775478,-0.513375461102,-0.5642542243],
-                        [0.513375461102,-0.5642542243,-0.646577775478],
-                        [0.450446814299,-0.469374448061,-0.759463787079],
-                        [0.370268076658,-0.599106371403,-0.70991063118],
-                        [0.646577775478,-0.513375461102,-0.5642542243],
-                        [0.513375461102,-0.5642542243,-0.646577775478],
-                        [0.5642542243,-0.646577775478,-0.513375461102],
-                        [0.420543789864,0.0,-0.907272219658],
-                        [0.373140364885,-0.120750762522,-0.919883430004],
-                        [0.490634441376,-0.113409027457,-0.863953828812],
-                        [0.152696594596,0.0,-0.988273143768],
-                        [0.0801787301898,-0.129731908441,-0.988302052021],
-                        [0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.312772929668,-0.253038614988,-0.915502369404],
-                        [0.240536183119,-0.389195710421,-0.889195740223],
-                        [0.381741464138,-0.370602428913,-0.846715569496],
-                        [0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.312772929668,-0.253038614988,-0.915502369404],
-                        [0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.152696594596,0.0,-0.988273143768],
-                        [-0.234579697251,-0.126519307494,-0.963828444481],
-                        [-0.0801787301898,-0.129731908441,-0.988302052021],
-                        [-0.420543789864,0.0,-0.907272219658],
-                        [-0.490634441376,-0.113409027457,-0.863953828812],
-                        [-0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.312772929668,-0.253038614988,-0.915502369404],
-                        [-0.381741464138,-0.370602428913,-0.846715569496],
-                        [-0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.373140364885,-0.120750762522,-0.919883430004],
-                        [-0.312772929668,-0.253038614988,-0.915502369404],
-                        [-0.234579697251,-0.126519307494,-0.963828444481],
-                        [0.16035746038,-0.518927633762,-0.839642524719],
-                        [0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.16035746038,-0.518927633762,-0.839642524719],
-                        [-0.229044884443,-0.617670714855,-0.752343893051],
-                        [-0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.0,-0.724504590034,-0.689269959927],
-                        [-0.070090636611,-0.793863236904,-0.604043483734],
-                        [0.070090636611,-0.793863236904,-0.604043483734],
-                        [-0.0781932324171,-0.632596552372,-0.770524084568],
-                        [0.0,-0.724504590034,-0.689269959927],
-                        [0.0781932324171,-0.632596552372,-0.770524084568],
-                        [-0.0801787301898,-0.129731908441,-0.988302052021],
-                        [0.0,-0.266404688358,-0.96386128664],
-                        [0.0801787301898,-0.129731908441,-0.988302052021],
-                        [-0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.16035746038,-0.518927633762,-0.839642524719],
-                        [-0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.16035746038,-0.518927633762,-0.839642524719],
-                        [0.240536183119,-0.389195710421,-0.889195740223],
-                        [-0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0823235809803,-0.39960706234,-0.912982463837],
-                        [0.0,-0.266404688358,-0.96386128664],
-                        [-0.907272219658,-0.420543789864,0.0],
-                        [-0.919883430004,-0.373140364885,-0.120750762522],
-                        [-0.863953828812,-0.490634441376,-0.113409027457],
-                        [-0.988273143768,-0.152696594596,0.0],
-                        [-0.988302052021,-0.0801787301898,-0.129731908441],
-                        [-0.963828444481,-0.234579697251,-0.126519307494],
-                        [-0.915502369404,-0.312772929668,-0.253038614988],
-                        [-0.889195740223,-0.240536183119,-0.389195710421],
-                        [-0.846715569496,-0.381741464138,-0.370602428913],
-                        [-0.963828444481,-0.234579697251,-0.126519307494],
-                        [-0.915502369404,-0.312772929668,-0.253038614988],
-                        [-0.919883430004,-0.373140364885,-0.120750762522],
-                        [-0.988273143768,0.152696594596,0.0],
-                        [-0.963828444481,0.234579697251,-0.126519307494],
-                        [-0.988302052021,0.0801787301898,-0.129731908441],
-                        [-0.907272219658,0.420543789864,0.0],
-                        [-0.863953828812,0.490634441376,-0.113409027457],
-                        [-0.919883430004,0.373140364885,-0.120750762522],
-                        [-0.915502369404,0.312772929668,-0.253038614988],
-                        [-0.846715569496,0.381741464138,-0.370602428913],
-                        [-0.889195740223,0.240536183119,-0.389195710421],
-                        [-0.919883430004,0.373140364885,-0.120750762522],
-                        [-0.915502369404,0.312772929668,-0.253038614988],
-                        [-0.963828444481,0.234579697251,-0.126519307494],
-                        [-0.839642524719,-0.16035746038,-0.518927633762],
-                        [-0.770524084568,-0.0781932324171,-0.632596552372],
-                        [-0.752343893051,-0.229044884443,-0.617670714855],
-                        [-0.839642524719,0.16035746038,-0.518927633762],
-                        [-0.752343893051,0.229044884443,-0.617670714855],
-                        [-0.770524084568,0.0781932324171,-0.632596552372],
-                        [-0.689269959927,0.0,-0.724504590034],
-                        [-0.604043483734,0.070090636611,-0.793863236904],
-                        [-0.604043483734,-0.070090636611,-0.793863236904],
-                        [-0.770524084568,0.0781932324171,-0.632596552372],
-                        [-0.689269959927,0.0,-0.724504590034],
-                        [-0.770524084568,-0.0781932324171,-0.632596552372],
-                        [-0.988302052021,0.0801787301898,-0.129731908441],
-                        [-0.96386128664,0.0,-0.266404688358],
-                        [-0.988302052021,-0.0801787301898,-0.129731908441],
-                        [-0.889195740223,0.240536183119,-0.389195710421],
-                        [-0.839642524719,0.16035746038,-0.518927633762],
-                        [-0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.912982463837,-0.0823235809803,-0.39960706234],
-                        [-0.839642524719,-0.16035746038,-0.518927633762],
-                        [-0.889195740223,-0.240536183119,-0.389195710421],
-                        [-0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.912982463837,-0.0823235809803,-0.39960706234],
-                        [-0.96386128664,0.0,-0.266404688358],
-                        [-0.793863236904,0.604043483734,-0.070090636611],
-                        [-0.79913264513,0.568519234657,-0.19537883997],
-                        [-0.863953828812,0.490634441376,-0.113409027457],
-                        [-0.617670714855,0.752343893051,-0.229044884443],
-                        [-0.599106371403,0.70991063118,-0.370268076658],
-                        [-0.71078979969,0.644004821777,-0.28290578723],
-                        [-0.788983047009,0.517485499382,-0.331231862307],
-                        [-0.759463787079,0.450446814299,-0.469374448061],
-                        [-0.846715569496,0.381741464138,-0.370602428913],
-                        [-0.71078979969,0.644004821777,-0.28290578723],
-                        [-0.788983047009,0.517485499382,-0.331231862307],
-                        [-0.79913264513,0.568519234657,-0.19537883997],
-                        [-0.370602428913,0.846715569496,-0.381741464138],
-                        [-0.331231862307,0.788983047009,-0.517485499382],
-                        [-0.469374448061,0.759463787079,-0.450446814299],
-                        [-0.113409027457,0.863953828812,-0.490634441376],
-                        [-0.070090636611,0.793863236904,-0.604043483734],
-                        [-0.19537883997,0.79913264513,-0.568519234657],
-                        [-0.28290578723,0.71078979969,-0.644004821777],
-                        [-0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.370268076658,0.599106371403,-0.70991063118],
-                        [-0.19537883997,0.79913264513,-0.568519234657],
-                        [-0.28290578723,0.71078979969,-0.644004821777],
-                        [-0.331231862307,0.788983047009,-0.517485499382],
-                        [-0.70991063118,0.370268076658,-0.599106371403],
-                        [-0.644004821777,0.28290578723,-0.71078979969],
-                        [-0.752343893051,0.229044884443,-0.617670714855],
-                        [-0.450446814299,0.469374448061,-0.759463787079],
-                        [-0.381741464138,0.370602428913,-0.846715569496],
-                        [-0.517485499382,0.331231862307,-0.788983047009],
-                        [-0.568519234657,0.19537883997,-0.79913264513],
-                        [-0.490634441376,0.113409027457,-0.863953828812],
-                        [-0.604043483734,0.070090636611,-0.793863236904],
-                        [-0.517485499382,0.331231862307,-0.788983047009],
-                        [-0.568519234657,0.19537883997,-0.79913264513],
-                        [-0.644004821777,0.28290578723,-0.71078979969],
-                        [-0.469374448061,0.759463787079,-0.450446814299],
-                        [-0.5642542243,0.646577775478,-0.513375461102],
-                        [-0.599106371403,0.70991063118,-0.370268076658],
-                        [-0.370268076658,0.599106371403,-0.70991063118],
-                        [-0.450446814299,0.469374448061,-0.759463787079],
-                        [-0.513375461102,0.5642542243,-0.646577775478],
-                        [-0.646577775478,0.513375461102,-0.5642542243],
-                        [-0.70991063118,0.370268076658,-0.599106371403],
-                        [-0.759463787079,0.450446814299,-0.469374448061],
-                        [-0.513375461102,0.5642542243,-0.646577775478],
-                        [-0.646577775478,0.513375461102,-0.5642542243],
-                        [-0.5642542243,0.646577775478,-0.513375461102],
-                        [0.420543789864,0.0,-0.907272219658],
-                        [0.373140364885,0.120750762522,-0.919883430004],
-                        [0.490634441376,0.113409027457,-0.863953828812],
-                        [0.152696594596,0.0,-0.988273143768],
-                        [0.0801787301898,0.129731908441,-0.988302052021],
-                        [0.234579697251,0.126519307494,-0.963828444481],
-                        [0.312772929668,0.253038614988,-0.915502369404],
-                        [0.240536183119,0.389195710421,-0.889195740223],
-                        [0.381741464138,0.370602428913,-0.846715569496],
-                        [0.234579697251,0.126519307494,-0.963828444481],
-                        [0.312772929668,0.253038614988,-0.915502369404],
-                        [0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.152696594596,0.0,-0.988273143768],
-                        [-0.234579697251,0.126519307494,-0.963828444481],
-                        [-0.0801787301898,0.129731908441,-0.988302052021],
-                        [-0.420543789864,0.0,-0.907272219658],
-                        [-0.490634441376,0.113409027457,-0.863953828812],
-                        [-0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.312772929668,0.253038614988,-0.915502369404],
-                        [-0.381741464138,0.370602428913,-0.846715569496],
-                        [-0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.373140364885,0.120750762522,-0.919883430004],
-                        [-0.312772929668,0.253038614988,-0.915502369404],
-                        [-0.234579697251,0.126519307494,-0.963828444481],
-                        [0.16035746038,0.518927633762,-0.839642524719],
-                        [0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.16035746038,0.518927633762,-0.839642524719],
-                        [-0.229044884443,0.617670714855,-0.752343893051],
-                        [-0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.0,0.724504590034,-0.689269959927],
-                        [-0.070090636611,0.793863236904,-0.604043483734],
-                        [0.070090636611,0.793863236904,-0.604043483734],
-                        [-0.0781932324171,0.632596552372,-0.770524084568],
-                        [0.0,0.724504590034,-0.689269959927],
-                        [0.0781932324171,0.632596552372,-0.770524084568],
-                        [-0.0801787301898,0.129731908441,-0.988302052021],
-                        [0.0,0.266404688358,-0.96386128664],
-                        [0.0801787301898,0.129731908441,-0.988302052021],
-                        [-0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.16035746038,0.518927633762,-0.839642524719],
-                        [-0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.16035746038,0.518927633762,-0.839642524719],
-                        [0.240536183119,0.389195710421,-0.889195740223],
-                        [-0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0823235809803,0.39960706234,-0.912982463837],
-                        [0.0,0.266404688358,-0.96386128664],
-                        [0.490634441376,0.113409027457,-0.863953828812],
-                        [0.568519234657,0.19537883997,-0.79913264513],
-                        [0.604043483734,0.070090636611,-0.793863236904],
-                        [0.381741464138,0.370602428913,-0.846715569496],
-                        [0.450446814299,0.469374448061,-0.759463787079],
-                        [0.517485499382,0.331231862307,-0.788983047009],
-                        [0.644004821777,0.28290578723,-0.71078979969],
-                        [0.70991063118,0.370268076658,-0.599106371403],
-                        [0.752343893051,0.229044884443,-0.617670714855],
-                        [0.517485499382,0.331231862307,-0.788983047009],
-                        [0.644004821777,0.28290578723,-0.71078979969],
-                        [0.568519234657,0.19537883997,-0.79913264513],
-                        [0.229044884443,0.617670714855,-0.752343893051],
-                        [0.28290578723,0.71078979969,-0.644004821777],
-                        [0.370268076658,0.599106371403,-0.70991063118],
-                        [0.070090636611,0.793863236904,-0.604043483734],
-                        [0.113409027457,0.863953828812,-0.490634441376],
-                        [0.19537883997,0.79913264513,-0.568519234657],
-                        [0.331231862307,0.788983047009,-0.517485499382],
-                        [0.370602428913,0.846715569496,-0.381741464138],
-                        [0.469374448061,0.759463787079,-0.450446814299],
-                        [0.19537883997,0.79913264513,-0.568519234657],
-                        [0.331231862307,0.788983047009,-0.517485499382],
-                        [0.28290578723,0.71078979969,-0.644004821777],
-                        [0.759463787079,0.450446814299,-0.469374448061],
-                        [0.788983047009,0.517485499382,-0.331231862307],
-                        [0.846715569496,0.381741464138,-0.370602428913],
-                        [0.599106371403,0.70991063118,-0.370268076658],
-                        [0.617670714855,0.752343893051,-0.229044884443],
-                        [0.71078979969,0.644004821777,-0.28290578723],
-                        [0.79913264513,0.568519234657,-0.19537883997],
-                        [0.793863236904,0.604043483734,-0.070090636611],
-                        [0.863953828812,0.490634441376,-0.113409027457],
-                        [0.71078979969,0.644004821777,-0.28290578723],
-                        [0.79913264513,0.568519234657,-0.19537883997],
-                        [0.788983047009,0.517485499382,-0.331231862307],
-                        [0.370268076658,0.599106371403,-0.70991063118],
-                        [0.513375461102,0.5642542243,-0.646577775478],
-                        [0.450446814299,0.469374448061,-0.759463787079],
-                        [0.469374448061,0.759463787079,-0.450446814299],
-                        [0.599106371403,0.70991063118,-0.370268076658],
-                        [0.5642542243,0.646577775478,-0.513375461102],
-                        [0.646577775478,0.513375461102,-0.5642542243],
-                        [0.759463787079,0.450446814299,-0.469374448061],
-                        [0.70991063118,0.370268076658,-0.599106371403],
-                        [0.5642542243,0.646577775478,-0.513375461102],
-                        [0.646577775478,0.513375461102,-0.5642542243],
-                        [0.513375461102,0.5642542243,-0.646577775478],
-                        [0.793863236904,0.604043483734,-0.070090636611],
-                        [0.724504590034,0.689269959927,0.0],
-                        [0.793863236904,0.604043483734,0.070090636611],
-                        [0.617670714855,0.752343893051,-0.229044884443],
-                        [0.518927633762,0.839642524719,-0.16035746038],
-                        [0.632596552372,0.770524084568,-0.0781932324171],
-                        [0.632596552372,0.770524084568,0.0781932324171],
-                        [0.518927633762,0.839642524719,0.16035746038],
-                        [0.617670714855,0.752343893051,0.229044884443],
-                        [0.632596552372,0.770524084568,-0.0781932324171],
-                        [0.632596552372,0.770524084568,0.0781932324171],
-                        [0.724504590034,0.689269959927,0.0],
-                        [0.370602428913,0.846715569496,-0.381741464138],
-                        [0.253038614988,0.915502369404,-0.312772929668],
-                        [0.389195710421,0.889195740223,-0.240536183119],
-                        [0.113409027457,0.863953828812,-0.490634441376],
-                        [0.0,0.907272219658,-0.420543789864],
-                        [0.120750762522,0.919883430004,-0.373140364885],
-                        [0.126519307494,0.963828444481,-0.234579697251],
-                        [0.0,0.988273143768,-0.152696594596],
-                        [0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.120750762522,0.919883430004,-0.373140364885],
-                        [0.126519307494,0.963828444481,-0.234579697251],
-                        [0.253038614988,0.915502369404,-0.312772929668],
-                        [0.389195710421,0.889195740223,0.240536183119],
-                        [0.253038614988,0.915502369404,0.312772929668],
-                        [0.370602428913,0.846715569496,0.381741464138],
-                        [0.129731908441,0.988302052021,0.0801787301898],
-                        [0.0,0.988273143768,0.152696594596],
-                        [0.126519307494,0.963828444481,0.234579697251],
-                        [0.120750762522,0.919883430004,0.373140364885],
-                        [0.0,0.907272219658,0.420543789864],
-                        [0.113409027457,0.863953828812,0.490634441376],
-                        [0.126519307494,0.963828444481,0.234579697251],
-                        [0.120750762522,0.919883430004,0.373140364885],
-                        [0.253038614988,0.915502369404,0.312772929668],
-                        [0.389195710421,0.889195740223,-0.240536183119],
-                        [0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.518927633762,0.839642524719,-0.16035746038],
-                        [0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.129731908441,0.988302052021,0.0801787301898],
-                        [0.266404688358,0.96386128664,0.0],
-                        [0.39960706234,0.912982463837,0.0823235809803],
-                        [0.389195710421,0.889195740223,0.240536183119],
-                        [0.518927633762,0.839642524719,0.16035746038],
-                        [0.266404688358,0.96386128664,0.0],
-                        [0.39960706234,0.912982463837,0.0823235809803],
-                        [0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.793863236904,0.604043483734,0.070090636611],
-                        [0.79913264513,0.568519234657,0.19537883997],
-                        [0.863953828812,0.490634441376,0.113409027457],
-                        [0.617670714855,0.752343893051,0.229044884443],
-                        [0.599106371403,0.70991063118,0.370268076658],
-                        [0.71078979969,0.644004821777,0.28290578723],
-                        [0.788983047009,0.517485499382,0.331231862307],
-                        [0.759463787079,0.450446814299,0.469374448061],
-                        [0.846715569496,0.381741464138,0.370602428913],
-                        [0.71078979969,0.644004821777,0.28290578723],
-                        [0.788983047009,0.517485499382,0.331231862307],
-                        [0.79913264513,0.568519234657,0.19537883997],
-                        [0.370602428913,0.846715569496,0.381741464138],
-                        [0.331231862307,0.788983047009,0.517485499382],
-                        [0.469374448061,0.759463787079,0.450446814299],
-                        [0.113409027457,0.863953828812,0.490634441376],
-                        [0.070090636611,0.793863236904,0.604043483734],
-                        [0.19537883997,0.79913264513,0.568519234657],
-                        [0.28290578723,0.71078979969,0.644004821777],
-                        [0.229044884443,0.617670714855,0.752343893051],
-                        [0.370268076658,0.599106371403,0.70991063118],
-                        [0.19537883997,0.79913264513,0.568519234657],
-                        [0.28290578723,0.71078979969,0.644004821777],
-                        [0.331231862307,0.788983047009,0.517485499382],
-                        [0.70991063118,0.370268076658,0.599106371403],
-                        [0.644004821777,0.28290578723,0.71078979969],
-                        [0.752343893051,0.229044884443,0.617670714855],
-                        [0.450446814299,0.469374448061,0.759463787079],
-                        [0.381741464138,0.370602428913,0.846715569496],
-                        [0.517485499382,0.331231862307,0.788983047009],
-                        [0.568519234657,0.19537883997,0.79913264513],
-                        [0.490634441376,0.113409027457,0.863953828812],
-                        [0.604043483734,0.070090636611,0.793863236904],
-                        [0.517485499382,0.331231862307,0.788983047009],
-                        [0.568519234657,0.19537883997,0.79913264513],
-                        [0.644004821777,0.28290578723,0.71078979969],
-                        [0.469374448061,0.759463787079,0.450446814299],
-                        [0.5642542243,0.646577775478,0.513375461102],
-                        [0.599106371403,0.70991063118,0.370268076658],
-                        [0.370268076658,0.599106371403,0.70991063118],
-                        [0.450446814299,0.469374448061,0.759463787079],
-                        [0.513375461102,0.5642542243,0.646577775478],
-                        [0.646577775478,0.513375461102,0.5642542243],
-                        [0.70991063118,0.370268076658,0.599106371403],
-                        [0.759463787079,0.450446814299,0.469374448061],
-                        [0.513375461102,0.5642542243,0.646577775478],
-                        [0.646577775478,0.513375461102,0.5642542243],
-                        [0.5642542243,0.646577775478,0.513375461102],
-                        [0.907272219658,-0.420543789864,0.0],
-                        [0.919883430004,-0.373140364885,0.120750762522],
-                        [0.863953828812,-0.490634441376,0.113409027457],
-                        [0.988273143768,-0.152696594596,0.0],
-                        [0.988302052021,-0.0801787301898,0.129731908441],
-                        [0.963828444481,-0.234579697251,0.126519307494],
-                        [0.915502369404,-0.312772929668,0.253038614988],
-                        [0.889195740223,-0.240536183119,0.389195710421],
-                        [0.846715569496,-0.381741464138,0.370602428913],
-                        [0.963828444481,-0.234579697251,0.126519307494],
-                        [0.915502369404,-0.312772929668,0.253038614988],
-                        [0.919883430004,-0.373140364885,0.120750762522],
-                        [0.988273143768,0.152696594596,0.0],
-                        [0.963828444481,0.234579697251,0.126519307494],
-                        [0.988302052021,0.0801787301898,0.129731908441],
-                        [0.907272219658,0.420543789864,0.0],
-                        [0.863953828812,0.490634441376,0.113409027457],
-                        [0.919883430004,0.373140364885,0.120750762522],
-                        [0.915502369404,0.312772929668,0.253038614988],
-                        [0.846715569496,0.381741464138,0.370602428913],
-                        [0.889195740223,0.240536183119,0.389195710421],
-                        [0.919883430004,0.373140364885,0.120750762522],
-                        [0.915502369404,0.312772929668,0.253038614988],
-                        [0.963828444481,0.234579697251,0.126519307494],
-                        [0.839642524719,-0.16035746038,0.518927633762],
-                        [0.770524084568,-0.0781932324171,0.632596552372],
-                        [0.752343893051,-0.229044884443,0.617670714855],
-                        [0.839642524719,0.16035746038,0.518927633762],
-                        [0.752343893051,0.229044884443,0.617670714855],
-                        [0.770524084568,0.0781932324171,0.632596552372],
-                        [0.689269959927,0.0,0.724504590034],
-                        [0.604043483734,0.070090636611,0.793863236904],
-                        [0.604043483734,-0.070090636611,0.793863236904],
-                        [0.770524084568,0.0781932324171,0.632596552372],
-                        [0.689269959927,0.0,0.724504590034],
-                        [0.770524084568,-0.0781932324171,0.632596552372],
-                        [0.988302052021,0.0801787301898,0.129731908441],
-                        [0.96386128664,0.0,0.266404688358],
-                        [0.988302052021,-0.0801787301898,0.129731908441],
-                        [0.889195740223,0.240536183119,0.389195710421],
-                        [0.839642524719,0.16035746038,0.518927633762],
-                        [0.912982463837,0.0823235809803,0.39960706234],
-                        [0.912982463837,-0.0823235809803,0.39960706234],
-                        [0.839642524719,-0.16035746038,0.518927633762],
-                        [0.889195740223,-0.240536183119,0.389195710421],
-                        [0.912982463837,0.0823235809803,0.39960706234],
-                        [0.912982463837,-0.0823235809803,0.39960706234],
-                        [0.96386128664,0.0,0.266404688358],
-                        [-0.604043483734,0.070090636611,0.793863236904],
-                        [-0.689269959927,0.0,0.724504590034],
-                        [-0.604043483734,-0.070090636611,0.793863236904],
-                        [-0.752343893051,0.229044884443,0.617670714855],
-                        [-0.839642524719,0.16035746038,0.518927633762],
-                        [-0.770524084568,0.0781932324171,0.632596552372],
-                        [-0.770524084568,-0.0781932324171,0.632596552372],
-                        [-0.839642524719,-0.16035746038,0.518927633762],
-                        [-0.752343893051,-0.229044884443,0.617670714855],
-                        [-0.770524084568,0.0781932324171,0.632596552372],
-                        [-0.770524084568,-0.0781932324171,0.632596552372],
-                        [-0.689269959927,0.0,0.724504590034],
-                        [-0.846715569496,0.381741464138,0.370602428913],
-                        [-0.915502369404,0.312772929668,0.253038614988],
-                        [-0.889195740223,0.240536183119,0.389195710421],
-                        [-0.863953828812,0.490634441376,0.113409027457],
-                        [-0.907272219658,0.420543789864,0.0],
-                        [-0.919883430004,0.373140364885,0.120750762522],
-                        [-0.963828444481,0.234579697251,0.126519307494],
-                        [-0.988273143768,0.152696594596,0.0],
-                        [-0.988302052021,0.0801787301898,0.129731908441],
-                        [-0.919883430004,0.373140364885,0.120750762522],
-                        [-0.963828444481,0.234579697251,0.126519307494],
-                        [-0.915502369404,0.312772929668,0.253038614988],
-                        [-0.889195740223,-0.240536183119,0.389195710421],
-                        [-0.915502369404,-0.312772929668,0.253038614988],
-                        [-0.846715569496,-0.381741464138,0.370602428913],
-                        [-0.988302052021,-0.0801787301898,0.129731908441],
-                        [-0.988273143768,-0.152696594596,0.0],
-                        [-0.963828444481,-0.234579697251,0.126519307494],
-                        [-0.919883430004,-0.373140364885,0.120750762522],
-                        [-0.907272219658,-0.420543789864,0.0],
-                        [-0.863953828812,-0.490634441376,0.113409027457],
-                        [-0.963828444481,-0.234579697251,0.126519307494],
-                        [-0.919883430004,-0.373140364885,0.120750762522],
-                        [-0.915502369404,-0.312772929668,0.253038614988],
-                        [-0.889195740223,0.240536183119,0.389195710421],
-                        [-0.912982463837,0.0823235809803,0.39960706234],
-                        [-0.839642524719,0.16035746038,0.518927633762],
-                        [-0.988302052021,0.0801787301898,0.129731908441],
-                        [-0.988302052021,-0.0801787301898,0.129731908441],
-                        [-0.96386128664,0.0,0.266404688358],
-                        [-0.912982463837,-0.0823235809803,0.39960706234],
-                        [-0.889195740223,-0.240536183119,0.389195710421],
-                        [-0.839642524719,-0.16035746038,0.518927633762],
-                        [-0.96386128664,0.0,0.266404688358],
-                        [-0.912982463837,-0.0823235809803,0.39960706234],
-                        [-0.912982463837,0.0823235809803,0.39960706234],
-                        [-0.490634441376,0.113409027457,0.863953828812],
-                        [-0.568519234657,0.19537883997,0.79913264513],
-                        [-0.604043483734,0.070090636611,0.793863236904],
-                        [-0.381741464138,0.370602428913,0.846715569496],
-                        [-0.450446814299,0.469374448061,0.759463787079],
-                        [-0.517485499382,0.331231862307,0.788983047009],
-                        [-0.644004821777,0.28290578723,0.71078979969],
-                        [-0.70991063118,0.370268076658,0.599106371403],
-                        [-0.752343893051,0.229044884443,0.617670714855],
-                        [-0.517485499382,0.331231862307,0.788983047009],
-                        [-0.644004821777,0.28290578723,0.71078979969],
-                        [-0.568519234657,0.19537883997,0.79913264513],
-                        [-0.229044884443,0.617670714855,0.752343893051],
-                        [-0.28290578723,0.71078979969,0.644004821777],
-                        [-0.370268076658,0.599106371403,0.70991063118],
-                        [-0.070090636611,0.793863236904,0.604043483734],
-                        [-0.113409027457,0.863953828812,0.490634441376],
-                        [-0.19537883997,0.79913264513,0.568519234657],
-                        [-0.331231862307,0.788983047009,0.517485499382],
-                        [-0.370602428913,0.846715569496,0.381741464138],
-                        [-0.469374448061,0.759463787079,0.450446814299],
-                        [-0.19537883997,0.79913264513,0.568519234657],
-                        [-0.331231862307,0.788983047009,0.517485499382],
-                        [-0.28290578723,0.71078979969,0.644004821777],
-                        [-0.759463787079,0.450446814299,0.469374448061],
-                        [-0.788983047009,0.517485499382,0.331231862307],
-                        [-0.846715569496,0.381741464138,0.370602428913],
-                        [-0.599106371403,0.70991063118,0.370268076658],
-                        [-0.617670714855,0.752343893051,0.229044884443],
-                        [-0.71078979969,0.644004821777,0.28290578723],
-                        [-0.79913264513,0.568519234657,0.19537883997],
-                        [-0.793863236904,0.604043483734,0.070090636611],
-                        [-0.863953828812,0.490634441376,0.113409027457],
-                        [-0.71078979969,0.644004821777,0.28290578723],
-                        [-0.79913264513,0.568519234657,0.19537883997],
-                        [-0.788983047009,0.517485499382,0.331231862307],
-                        [-0.370268076658,0.599106371403,0.70991063118],
-                        [-0.513375461102,0.5642542243,0.646577775478],
-                        [-0.450446814299,0.469374448061,0.759463787079],
-                        [-0.469374448061,0.759463787079,0.450446814299],
-                        [-0.599106371403,0.70991063118,0.370268076658],
-                        [-0.5642542243,0.646577775478,0.513375461102],
-                        [-0.646577775478,0.513375461102,0.5642542243],
-                        [-0.759463787079,0.450446814299,0.469374448061],
-                        [-0.70991063118,0.370268076658,0.599106371403],
-                        [-0.5642542243,0.646577775478,0.513375461102],
-                        [-0.646577775478,0.513375461102,0.5642542243],
-                        [-0.513375461102,0.5642542243,0.646577775478],
-                        [-0.070090636611,0.793863236904,0.604043483734],
-                        [0.0,0.724504590034,0.689269959927],
-                        [0.070090636611,0.793863236904,0.604043483734],
-                        [-0.229044884443,0.617670714855,0.752343893051],
-                        [-0.16035746038,0.518927633762,0.839642524719],
-                        [-0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0781932324171,0.632596552372,0.770524084568],
-                        [0.16035746038,0.518927633762,0.839642524719],
-                        [0.229044884443,0.617670714855,0.752343893051],
-                        [-0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0781932324171,0.632596552372,0.770524084568],
-                        [0.0,0.724504590034,0.689269959927],
-                        [-0.381741464138,0.370602428913,0.846715569496],
-                        [-0.312772929668,0.253038614988,0.915502369404],
-                        [-0.240536183119,0.389195710421,0.889195740223],
-                        [-0.490634441376,0.113409027457,0.863953828812],
-                        [-0.420543789864,0.0,0.907272219658],
-                        [-0.373140364885,0.120750762522,0.919883430004],
-                        [-0.234579697251,0.126519307494,0.963828444481],
-                        [-0.152696594596,0.0,0.988273143768],
-                        [-0.0801787301898,0.129731908441,0.988302052021],
-                        [-0.373140364885,0.120750762522,0.919883430004],
-                        [-0.234579697251,0.126519307494,0.963828444481],
-                        [-0.312772929668,0.253038614988,0.915502369404],
-                        [0.240536183119,0.389195710421,0.889195740223],
-                        [0.312772929668,0.253038614988,0.915502369404],
-                        [0.381741464138,0.370602428913,0.846715569496],
-                        [0.0801787301898,0.129731908441,0.988302052021],
-                        [0.152696594596,0.0,0.988273143768],
-                        [0.234579697251,0.126519307494,0.963828444481],
-                        [0.373140364885,0.120750762522,0.919883430004],
-                        [0.420543789864,0.0,0.907272219658],
-                        [0.490634441376,0.113409027457,0.863953828812],
-                        [0.234579697251,0.126519307494,0.963828444481],
-                        [0.373140364885,0.120750762522,0.919883430004],
-                        [0.312772929668,0.253038614988,0.915502369404],
-                        [-0.240536183119,0.389195710421,0.889195740223],
-                        [-0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.16035746038,0.518927633762,0.839642524719],
-                        [-0.0801787301898,0.129731908441,0.988302052021],
-                        [0.0801787301898,0.129731908441,0.988302052021],
-                        [0.0,0.266404688358,0.96386128664],
-                        [0.0823235809803,0.39960706234,0.912982463837],
-                        [0.240536183119,0.389195710421,0.889195740223],
-                        [0.16035746038,0.518927633762,0.839642524719],
-                        [0.0,0.266404688358,0.96386128664],
-                        [0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.0823235809803,0.39960706234,0.912982463837],
-                        [-0.113409027457,0.863953828812,-0.490634441376],
-                        [-0.120750762522,0.919883430004,-0.373140364885],
-                        [0.0,0.907272219658,-0.420543789864],
-                        [-0.370602428913,0.846715569496,-0.381741464138],
-                        [-0.389195710421,0.889195740223,-0.240536183119],
-                        [-0.253038614988,0.915502369404,-0.312772929668],
-                        [-0.126519307494,0.963828444481,-0.234579697251],
-                        [-0.129731908441,0.988302052021,-0.0801787301898],
-                        [0.0,0.988273143768,-0.152696594596],
-                        [-0.253038614988,0.915502369404,-0.312772929668],
-                        [-0.126519307494,0.963828444481,-0.234579697251],
-                        [-0.120750762522,0.919883430004,-0.373140364885],
-                        [-0.617670714855,0.752343893051,-0.229044884443],
-                        [-0.632596552372,0.770524084568,-0.0781932324171],
-                        [-0.518927633762,0.839642524719,-0.16035746038],
-                        [-0.793863236904,0.604043483734,-0.070090636611],
-                        [-0.793863236904,0.604043483734,0.070090636611],
-                        [-0.724504590034,0.689269959927,0.0],
-                        [-0.632596552372,0.770524084568,0.0781932324171],
-                        [-0.617670714855,0.752343893051,0.229044884443],
-                        [-0.518927633762,0.839642524719,0.16035746038],
-                        [-0.724504590034,0.689269959927,0.0],
-                        [-0.632596552372,0.770524084568,0.0781932324171],
-                        [-0.632596552372,0.770524084568,-0.0781932324171],
-                        [-0.129731908441,0.988302052021,0.0801787301898],
-                        [-0.126519307494,0.963828444481,0.234579697251],
-                        [0.0,0.988273143768,0.152696594596],
-                        [-0.389195710421,0.889195740223,0.240536183119],
-                        [-0.370602428913,0.846715569496,0.381741464138],
-                        [-0.253038614988,0.915502369404,0.312772929668],
-                        [-0.120750762522,0.919883430004,0.373140364885],
-                        [-0.113409027457,0.863953828812,0.490634441376],
-                        [0.0,0.907272219658,0.420543789864],
-                        [-0.253038614988,0.915502369404,0.312772929668],
-                        [-0.120750762522,0.919883430004,0.373140364885],
-                        [-0.126519307494,0.963828444481,0.234579697251],
-                        [-0.518927633762,0.839642524719,-0.16035746038],
-                        [-0.39960706234,0.912982463837,-0.0823235809803],
-                        [-0.389195710421,0.889195740223,-0.240536183119],
-                        [-0.518927633762,0.839642524719,0.16035746038],
-                        [-0.389195710421,0.889195740223,0.240536183119],
-                        [-0.39960706234,0.912982463837,0.0823235809803],
-                        [-0.266404688358,0.96386128664,0.0],
-                        [-0.129731908441,0.988302052021,0.0801787301898],
-                        [-0.129731908441,0.988302052021,-0.0801787301898],
-                        [-0.39960706234,0.912982463837,0.0823235809803],
-                        [-0.266404688358,0.96386128664,0.0],
-                        [-0.39960706234,0.912982463837,-0.0823235809803],
-                        [0.604043483734,0.070090636611,-0.793863236904],
-                        [0.689269959927,0.0,-0.724504590034],
-                        [0.604043483734,-0.070090636611,-0.793863236904],
-                        [0.752343893051,0.229044884443,-0.617670714855],
-                        [0.839642524719,0.16035746038,-0.518927633762],
-                        [0.770524084568,0.0781932324171,-0.632596552372],
-                        [0.770524084568,-0.0781932324171,-0.632596552372],
-                        [0.839642524719,-0.16035746038,-0.518927633762],
-                        [0.752343893051,-0.229044884443,-0.617670714855],
-                        [0.770524084568,0.0781932324171,-0.632596552372],
-                        [0.770524084568,-0.0781932324171,-0.632596552372],
-                        [0.689269959927,0.0,-0.724504590034],
-                        [0.846715569496,0.381741464138,-0.370602428913],
-                        [0.915502369404,0.312772929668,-0.253038614988],
-                        [0.889195740223,0.240536183119,-0.389195710421],
-                        [0.863953828812,0.490634441376,-0.113409027457],
-                        [0.907272219658,0.420543789864,0.0],
-                        [0.919883430004,0.373140364885,-0.120750762522],
-                        [0.963828444481,0.234579697251,-0.126519307494],
-                        [0.988273143768,0.152696594596,0.0],
-                        [0.988302052021,0.0801787301898,-0.129731908441],
-                        [0.919883430004,0.373140364885,-0.120750762522],
-                        [0.963828444481,0.234579697251,-0.126519307494],
-                        [0.915502369404,0.312772929668,-0.253038614988],
-                        [0.889195740223,-0.240536183119,-0.389195710421],
-                        [0.915502369404,-0.312772929668,-0.253038614988],
-                        [0.846715569496,-0.381741464138,-0.370602428913],
-                        [0.988302052021,-0.0801787301898,-0.129731908441],
-                        [0.988273143768,-0.152696594596,0.0],
-                        [0.963828444481,-0.234579697251,-0.126519307494],
-                        [0.919883430004,-0.373140364885,-0.120750762522],
-                        [0.907272219658,-0.420543789864,0.0],
-                        [0.863953828812,-0.490634441376,-0.113409027457],
-                        [0.963828444481,-0.234579697251,-0.126519307494],
-                        [0.919883430004,-0.373140364885,-0.120750762522],
-                        [0.915502369404,-0.312772929668,-0.253038614988],
-                        [0.889195740223,0.240536183119,-0.389195710421],
-                        [0.912982463837,0.0823235809803,-0.39960706234],
-                        [0.839642524719,0.16035746038,-0.518927633762],
-                        [0.988302052021,0.0801787301898,-0.129731908441],
-                        [0.988302052021,-0.0801787301898,-0.129731908441],
-                        [0.96386128664,0.0,-0.266404688358],
-                        [0.912982463837,-0.0823235809803,-0.39960706234],
-                        [0.889195740223,-0.240536183119,-0.389195710421],
-                        [0.839642524719,-0.16035746038,-0.518927633762],
-                        [0.96386128664,0.0,-0.266404688358],
-                        [0.912982463837,-0.0823235809803,-0.39960706234],
-                        [0.912982463837,0.0823235809803,-0.39960706234],
-                        [-0.82464236021,-0.564633131027,0.0339771322906],
-                        [-0.79582041502,-0.605532705784,0.0],
-                        [-0.82464236021,-0.564633131027,-0.0339771322906],
-                        [-0.757922053337,-0.643326640129,0.108097285032],
-                        [-0.722495436668,-0.687358558178,0.0744211226702],
-                        [-0.761889100075,-0.646693944931,0.0362210273743],
-                        [-0.761889100075,-0.646693944931,-0.0362210273743],
-                        [-0.722495436668,-0.687358558178,-0.0744211226702],
-                        [-0.757922053337,-0.643326640129,-0.108097285032],
-                        [-0.761889100075,-0.646693944931,0.0362210273743],
-                        [-0.761889100075,-0.646693944931,-0.0362210273743],
-                        [-0.79582041502,-0.605532705784,0.0],
-                        [-0.669747889042,-0.718357801437,0.188148602843],
-                        [-0.62687343359,-0.763553202152,0.154971644282],
-                        [-0.677466154099,-0.726636230946,0.114190116525],
-                        [-0.560828924179,-0.782811582088,0.269586592913],
-                        [-0.510783493519,-0.826465010643,0.236761152744],
-                        [-0.571085453033,-0.797127783298,0.196083456278],
-                        [-0.578244268894,-0.807120084763,0.119124859571],
-                        [-0.524005174637,-0.847858190536,0.0809632539749],
-                        [-0.581926107407,-0.81225925684,0.0399611219764],
-                        [-0.571085453033,-0.797127783298,0.196083456278],
-                        [-0.578244268894,-0.807120084763,0.119124859571],
-                        [-0.62687343359,-0.763553202152,0.154971644282],
-                        [-0.677466154099,-0.726636230946,-0.114190116525],
-                        [-0.62687343359,-0.763553202152,-0.154971644282],
-                        [-0.669747889042,-0.718357801437,-0.188148602843],
-                        [-0.581926107407,-0.81225925684,-0.0399611219764],
-                        [-0.524005174637,-0.847858190536,-0.0809632539749],
-                        [-0.578244268894,-0.807120084763,-0.119124859571],
-                        [-0.571085453033,-0.797127783298,-0.196083456278],
-                        [-0.510783493519,-0.826465010643,-0.236761152744],
-                        [-0.560828924179,-0.782811582088,-0.269586592913],
-                        [-0.578244268894,-0.807120084763,-0.119124859571],
-                        [-0.571085453033,-0.797127783298,-0.196083456278],
-                        [-0.62687343359,-0.763553202152,-0.154971644282],
-                        [-0.677466154099,-0.726636230946,0.114190116525],
-                        [-0.68142670393,-0.730884253979,0.0382858961821],
-                        [-0.722495436668,-0.687358558178,0.0744211226702],
-                        [-0.581926107407,-0.81225925684,0.0399611219764],
-                        [-0.581926107407,-0.81225925684,-0.0399611219764],
-                        [-0.634539365768,-0.772890508175,0.0],
-                        [-0.68142670393,-0.730884253979,-0.0382858961821],
-                        [-0.677466154099,-0.726636230946,-0.114190116525],
-                        [-0.722495436668,-0.687358558178,-0.0744211226702],
-                        [-0.634539365768,-0.772890508175,0.0],
-                        [-0.68142670393,-0.730884253979,-0.0382858961821],
-                        [-0.68142670393,-0.730884253979,0.0382858961821],
-                        [-0.436200261116,-0.830415487289,0.346611320972],
-                        [-0.380723625422,-0.869839549065,0.313733518124],
-                        [-0.446935534477,-0.85085272789,0.276221334934],
-                        [-0.3044308424,-0.857896447182,0.413926929235],
-                        [-0.246351331472,-0.891307473183,0.380633711815],
-                        [-0.313436716795,-0.883275330067,0.348686188459],
-                        [-0.321246802807,-0.905284404755,0.277958005667],
-                        [-0.258633822203,-0.935745954514,0.239766731858],
-                        [-0.327503234148,-0.922915279865,0.202408134937],
-                        [-0.313436716795,-0.883275330067,0.348686188459],
-                        [-0.321246802807,-0.905284404755,0.277958005667],
-                        [-0.380723625422,-0.869839549065,0.313733518124],
-                        [-0.174905076623,-0.866019308567,0.468421578407],
-                        [-0.117213711143,-0.892938017845,0.434652328491],
-                        [-0.180623859167,-0.894335091114,0.409316182137],
-                        [-0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.0,-0.8796184659,0.475679844618],
-                        [-0.0568443164229,-0.887796461582,0.456712335348],
-                        [-0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0,-0.932827115059,0.360324263573],
-                        [-0.0602079555392,-0.940329909325,0.334895044565],
-                        [-0.0568443164229,-0.887796461582,0.456712335348],
-                        [-0.0586068555713,-0.915323853493,0.398431301117],
-                        [-0.117213711143,-0.892938017845,0.434652328491],
-                        [-0.193975359201,-0.960443258286,0.199805602431],
-                        [-0.128498718143,-0.978907585144,0.158833146095],
-                        [-0.196501940489,-0.97295331955,0.121444880962],
-                        [-0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0,-0.974178731441,0.225778326392],
-                        [-0.0626873448491,-0.979053080082,0.193714544177],
-                        [-0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0,-0.997029185295,0.0770247355103],
-                        [-0.0638479366899,-0.997179210186,0.0394601933658],
-                        [-0.0626873448491,-0.979053080082,0.193714544177],
-                        [-0.0634539350867,-0.991025745869,0.117650069296],
-                        [-0.128498718143,-0.978907585144,0.158833146095],
-                        [-0.180623859167,-0.894335091114,0.409316182137],
-                        [-0.185843646526,-0.920180141926,0.34457308054],
-                        [-0.246351331472,-0.891307473183,0.380633711815],
-                        [-0.0602079555392,-0.940329909325,0.334895044565],
-                        [-0.0615878328681,-0.961880862713,0.266443610191],
-                        [-0.123895764351,-0.943842172623,0.306287169456],
-                        [-0.190361812711,-0.942551255226,0.274516820908],
-                        [-0.193975359201,-0.960443258286,0.199805602431],
-                        [-0.258633822203,-0.935745954514,0.239766731858],
-                        [-0.123895764351,-0.943842172623,0.306287169456],
-                        [-0.190361812711,-0.942551255226,0.274516820908],
-                        [-0.185843646526,-0.920180141926,0.34457308054],
-                        [-0.446935534477,-0.85085272789,-0.276221334934],
-                        [-0.380723625422,-0.869839549065,-0.313733518124],
-                        [-0.436200261116,-0.830415487289,-0.346611320972],
-                        [-0.327503234148,-0.922915279865,-0.202408134937],
-                        [-0.258633822203,-0.935745954514,-0.239766731858],
-                        [-0.321246802807,-0.905284404755,-0.277958005667],
-                        [-0.313436716795,-0.883275330067,-0.348686188459],
-                        [-0.246351331472,-0.891307473183,-0.380633711815],
-                        [-0.3044308424,-0.857896447182,-0.413926929235],
-                        [-0.321246802807,-0.905284404755,-0.277958005667],
-                        [-0.313436716795,-0.883275330067,-0.348686188459],
-                        [-0.380723625422,-0.869839549065,-0.313733518124],
-                        [-0.196501940489,-0.97295331955,-0.121444880962],
-                        [-0.128498718143,-0.978907585144,-0.158833146095],
-                        [-0.193975359201,-0.960443258286,-0.199805602431],
-                        [-0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0,-0.997029185295,-0.0770247355103],
-                        [-0.0634539350867,-0.991025745869,-0.117650069296],
-                        [-0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0,-0.974178731441,-0.225778326392],
-                        [-0.0615878328681,-0.961880862713,-0.266443610191],
-                        [-0.0634539350867,-0.991025745869,-0.117650069296],
-                        [-0.0626873448491,-0.979053080082,-0.193714544177],
-                        [-0.128498718143,-0.978907585144,-0.158833146095],
-                        [-0.180623859167,-0.894335091114,-0.409316182137],
-                        [-0.117213711143,-0.892938017845,-0.434652328491],
-                        [-0.174905076623,-0.866019308567,-0.468421578407],
-                        [-0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0,-0.932827115059,-0.360324263573],
-                        [-0.0586068555713,-0.915323853493,-0.398431301117],
-                        [-0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0,-0.8796184659,-0.475679844618],
-                        [-0.0549761541188,-0.858619451523,-0.509656965733],
-                        [-0.0586068555713,-0.915323853493,-0.398431301117],
-                        [-0.0568443164229,-0.887796461582,-0.456712335348],
-                        [-0.117213711143,-0.892938017845,-0.434652328491],
-                        [-0.193975359201,-0.960443258286,-0.199805602431],
-                        [-0.190361812711,-0.942551255226,-0.274516820908],
-                        [-0.258633822203,-0.935745954514,-0.239766731858],
-                        [-0.0615878328681,-0.961880862713,-0.266443610191],
-                        [-0.0602079555392,-0.940329909325,-0.334895044565],
-                        [-0.123895764351,-0.943842172623,-0.306287169456],
-                        [-0.185843646526,-0.920180141926,-0.34457308054],
-                        [-0.180623859167,-0.894335091114,-0.409316182137],
-                        [-0.246351331472,-0.891307473183,-0.380633711815],
-                        [-0.123895764351,-0.943842172623,-0.306287169456],
-                        [-0.185843646526,-0.920180141926,-0.34457308054],
-                        [-0.190361812711,-0.942551255226,-0.274516820908],
-                        [-0.446935534477,-0.85085272789,0.276221334934],
-                        [-0.455528259277,-0.867211103439,0.20109423995],
-                        [-0.510783493519,-0.826465010643,0.236761152744],
-                        [-0.327503234148,-0.922915279865,0.202408134937],
-                        [-0.33188316226,-0.935258030891,0.123069040477],
-                        [-0.395605653524,-0.903840482235,0.162998497486],
-                        [-0.461539924145,-0.878655850887,0.122248865664],
-                        [-0.464636415243,-0.88455080986,0.0410230122507],
-                        [-0.524005174637,-0.847858190536,0.0809632539749],
-                        [-0.395605653524,-0.903840482235,0.162998497486],
-                        [-0.461539924145,-0.878655850887,0.122248865664],
-                        [-0.455528259277,-0.867211103439,0.20109423995],
-                        [-0.196501940489,-0.97295331955,0.121444880962],
-                        [-0.197802826762,-0.979394435883,0.0407496243715],
-                        [-0.265506535769,-0.960611641407,0.0820460245013],
-                        [-0.0638479366899,-0.997179210186,0.0394601933658],
-                        [-0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [-0.130150929093,-0.991494178772,0.0],
-                        [-0.197802826762,-0.979394435883,-0.0407496243715],
-                        [-0.196501940489,-0.97295331955,-0.121444880962],
-                        [-0.265506535769,-0.960611641407,-0.0820460245013],
-                        [-0.130150929093,-0.991494178772,0.0],
-                        [-0.197802826762,-0.979394435883,-0.0407496243715],
-                        [-0.197802826762,-0.979394435883,0.0407496243715],
-                        [-0.464636415243,-0.88455080986,-0.0410230122507],
-                        [-0.461539924145,-0.878655850887,-0.122248865664],
-                        [-0.524005174637,-0.847858190536,-0.0809632539749],
-                        [-0.33188316226,-0.935258030891,-0.123069040477],
-                        [-0.327503234148,-0.922915279865,-0.202408134937],
-                        [-0.395605653524,-0.903840482235,-0.162998497486],
-                        [-0.455528259277,-0.867211103439,-0.20109423995],
-                        [-0.446935534477,-0.85085272789,-0.276221334934],
-                        [-0.510783493519,-0.826465010643,-0.236761152744],
-                        [-0.395605653524,-0.903840482235,-0.162998497486],
-                        [-0.455528259277,-0.867211103439,-0.20109423995],
-                        [-0.461539924145,-0.878655850887,-0.122248865664],
-                        [-0.265506535769,-0.960611641407,0.0820460245013],
-                        [-0.334140062332,-0.941618084908,0.04130198434],
-                        [-0.33188316226,-0.935258030891,0.123069040477],
-                        [-0.265506535769,-0.960611641407,-0.0820460245013],
-                        [-0.33188316226,-0.935258030891,-0.123069040477],
-                        [-0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.400968074799,-0.916092038155,0.0],
-                        [-0.464636415243,-0.88455080986,-0.0410230122507],
-                        [-0.464636415243,-0.88455080986,0.0410230122507],
-                        [-0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.400968074799,-0.916092038155,0.0],
-                        [-0.334140062332,-0.941618084908,0.04130198434],
-                        [-0.509656965733,-0.0549761541188,0.858619451523],
-                        [-0.548688352108,-0.091976031661,0.830952167511],
-                        [-0.564633131027,-0.0339771322906,0.82464236021],
-                        [-0.468421578407,-0.174905076623,0.866019308567],
-                        [-0.506734728813,-0.217834427953,0.834127128124],
-                        [-0.529480218887,-0.153434738517,0.834331154823],
-                        [-0.588087081909,-0.131048902869,0.798110127449],
-                        [-0.627150595188,-0.171839639544,0.759706020355],
-                        [-0.643326640129,-0.108097285032,0.757922053337],
-                        [-0.529480218887,-0.153434738517,0.834331154823],
-                        [-0.588087081909,-0.131048902869,0.798110127449],
-                        [-0.548688352108,-0.091976031661,0.830952167511],
-                        [-0.413926929235,-0.3044308424,0.857896447182],
-                        [-0.450116455555,-0.352179646492,0.820587992668],
-                        [-0.480284929276,-0.284414708614,0.829719662666],
-                        [-0.346611320972,-0.436200261116,0.830415487289],
-                        [-0.379529476166,-0.486395716667,0.787004828453],
-                        [-0.416404157877,-0.419940322638,0.806385576725],
-                        [-0.485873311758,-0.400663375854,0.776785671711],
-                        [-0.520354926586,-0.44894811511,0.726413309574],
-                        [-0.553625464439,-0.378517180681,0.74177056551],
-                        [-0.416404157877,-0.419940322638,0.806385576725],
-                        [-0.485873311758,-0.400663375854,0.776785671711],
-                        [-0.450116455555,-0.352179646492,0.820587992668],
-                        [-0.665048420429,-0.213841319084,0.715529501438],
-                        [-0.700865805149,-0.256401896477,0.665616393089],
-                        [-0.718357801437,-0.188148602843,0.669747889042],
-                        [-0.618283927441,-0.353819847107,0.701809465885],
-                        [-0.65135627985,-0.398910075426,0.645450055599],
-                        [-0.678621411324,-0.327040165663,0.657660841942],
-                        [-0.733673810959,-0.298754066229,0.610302150249],
-                        [-0.762617051601,-0.340069264174,0.550243675709],
-                        [-0.782811582088,-0.269586592913,0.560828924179],
-                        [-0.678621411324,-0.327040165663,0.657660841942],
-                        [-0.733673810959,-0.298754066229,0.610302150249],
-                        [-0.700865805149,-0.256401896477,0.665616393089],
-                        [-0.480284929276,-0.284414708614,0.829719662666],
-                        [-0.545040607452,-0.26241543889,0.796284377575],
-                        [-0.506734728813,-0.217834427953,0.834127128124],
-                        [-0.553625464439,-0.378517180681,0.74177056551],
-                        [-0.618283927441,-0.353819847107,0.701809465885],
-                        [-0.582528710365,-0.308011889458,0.752189457417],
-                        [-0.606988489628,-0.238753452897,0.757998526096],
-                        [-0.665048420429,-0.213841319084,0.715529501438],
-                        [-0.627150595188,-0.171839639544,0.759706020355],
-                        [-0.582528710365,-0.308011889458,0.752189457417],
-                        [-0.606988489628,-0.238753452897,0.757998526096],
-                        [-0.545040607452,-0.26241543889,0.796284377575],
-                        [-0.269586592913,-0.560828924179,0.782811582088],
-                        [-0.298754066229,-0.610302150249,0.733673810959],
-                        [-0.340069264174,-0.550243675709,0.762617051601],
-                        [-0.188148602843,-0.669747889042,0.718357801437],
-                        [-0.213841319084,-0.715529501438,0.665048420429],
-                        [-0.256401896477,-0.665616393089,0.700865805149],
-                        [-0.327040165663,-0.657660841942,0.678621411324],
-                        [-0.353819847107,-0.701809465885,0.618283927441],
-                        [-0.398910075426,-0.645450055599,0.65135627985],
-                        [-0.256401896477,-0.665616393089,0.700865805149],
-                        [-0.327040165663,-0.657660841942,0.678621411324],
-                        [-0.298754066229,-0.610302150249,0.733673810959],
-                        [-0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.131048902869,-0.798110127449,0.588087081909],
-                        [-0.171839639544,-0.759706020355,0.627150595188],
-                        [-0.0339771322906,-0.82464236021,0.564633131027],
-                        [-0.0549761541188,-0.858619451523,0.509656965733],
-                        [-0.091976031661,-0.830952167511,0.548688352108],
-                        [-0.153434738517,-0.834331154823,0.529480218887],
-                        [-0.174905076623,-0.866019308567,0.468421578407],
-                        [-0.217834427953,-0.834127128124,0.506734728813],
-                        [-0.091976031661,-0.830952167511,0.548688352108],
-                        [-0.153434738517,-0.834331154823,0.529480218887],
-                        [-0.131048902869,-0.798110127449,0.588087081909],
-                        [-0.378517180681,-0.74177056551,0.553625464439],
-                        [-0.400663375854,-0.776785671711,0.485873311758],
-                        [-0.44894811511,-0.726413309574,0.520354926586],
-                        [-0.284414708614,-0.829719662666,0.480284929276],
-                        [-0.3044308424,-0.857896447182,0.413926929235],
-                        [-0.352179646492,-0.820587992668,0.450116455555],
-                        [-0.419940322638,-0.806385576725,0.416404157877],
-                        [-0.436200261116,-0.830415487289,0.346611320972],
-                        [-0.486395716667,-0.787004828453,0.379529476166],
-                        [-0.352179646492,-0.820587992668,0.450116455555],
-                        [-0.419940322638,-0.806385576725,0.416404157877],
-                        [-0.400663375854,-0.776785671711,0.485873311758],
-                        [-0.171839639544,-0.759706020355,0.627150595188],
-                        [-0.238753452897,-0.757998526096,0.606988489628],
-                        [-0.213841319084,-0.715529501438,0.665048420429],
-                        [-0.217834427953,-0.834127128124,0.506734728813],
-                        [-0.284414708614,-0.829719662666,0.480284929276],
-                        [-0.26241543889,-0.796284377575,0.545040607452],
-                        [-0.308011889458,-0.752189457417,0.582528710365],
-                        [-0.378517180681,-0.74177056551,0.553625464439],
-                        [-0.353819847107,-0.701809465885,0.618283927441],
-                        [-0.26241543889,-0.796284377575,0.545040607452],
-                        [-0.308011889458,-0.752189457417,0.582528710365],
-                        [-0.238753452897,-0.757998526096,0.606988489628],
-                        [-0.787004828453,-0.379529476166,0.486395716667],
-                        [-0.806385576725,-0.416404157877,0.419940322638],
-                        [-0.830415487289,-0.346611320972,0.436200261116],
-                        [-0.726413309574,-0.520354926586,0.44894811511],
-                        [-0.74177056551,-0.553625464439,0.378517180681],
-                        [-0.776785671711,-0.485873311758,0.400663375854],
-                        [-0.820587992668,-0.450116455555,0.352179646492],
-                        [-0.829719662666,-0.480284929276,0.284414708614],
-                        [-0.857896447182,-0.413926929235,0.3044308424],
-                        [-0.776785671711,-0.485873311758,0.400663375854],
-                        [-0.820587992668,-0.450116455555,0.352179646492],
-                        [-0.806385576725,-0.416404157877,0.419940322638],
-                        [-0.645450055599,-0.65135627985,0.398910075426],
-                        [-0.657660841942,-0.678621411324,0.327040165663],
-                        [-0.701809465885,-0.618283927441,0.353819847107],
-                        [-0.550243675709,-0.762617051601,0.340069264174],
-                        [-0.560828924179,-0.782811582088,0.269586592913],
-                        [-0.610302150249,-0.733673810959,0.298754066229],
-                        [-0.665616393089,-0.700865805149,0.256401896477],
-                        [-0.669747889042,-0.718357801437,0.188148602843],
-                        [-0.715529501438,-0.665048420429,0.213841319084],
-                        [-0.610302150249,-0.733673810959,0.298754066229],
-                        [-0.665616393089,-0.700865805149,0.256401896477],
-                        [-0.657660841942,-0.678621411324,0.327040165663],
-                        [-0.834127128124,-0.506734728813,0.217834427953],
-                        [-0.834331154823,-0.529480218887,0.153434738517],
-                        [-0.866019308567,-0.468421578407,0.174905076623],
-                        [-0.759706020355,-0.627150595188,0.171839639544],
-                        [-0.757922053337,-0.643326640129,0.108097285032],
-                        [-0.798110127449,-0.588087081909,0.131048902869],
-                        [-0.830952167511,-0.548688352108,0.091976031661],
-                        [-0.82464236021,-0.564633131027,0.0339771322906],
-                        [-0.858619451523,-0.509656965733,0.0549761541188],
-                        [-0.798110127449,-0.588087081909,0.131048902869],
-                        [-0.830952167511,-0.548688352108,0.091976031661],
-                        [-0.834331154823,-0.529480218887,0.153434738517],
-                        [-0.701809465885,-0.618283927441,0.353819847107],
-                        [-0.752189457417,-0.582528710365,0.308011889458],
-                        [-0.74177056551,-0.553625464439,0.378517180681],
-                        [-0.715529501438,-0.665048420429,0.213841319084],
-                        [-0.759706020355,-0.627150595188,0.171839639544],
-                        [-0.757998526096,-0.606988489628,0.238753452897],
-                        [-0.796284377575,-0.545040607452,0.26241543889],
-                        [-0.834127128124,-0.506734728813,0.217834427953],
-                        [-0.829719662666,-0.480284929276,0.284414708614],
-                        [-0.757998526096,-0.606988489628,0.238753452897],
-                        [-0.796284377575,-0.545040607452,0.26241543889],
-                        [-0.752189457417,-0.582528710365,0.308011889458],
-                        [-0.340069264174,-0.550243675709,0.762617051601],
-                        [-0.411682873964,-0.535965919495,0.737060189247],
-                        [-0.379529476166,-0.486395716667,0.787004828453],
-                        [-0.398910075426,-0.645450055599,0.65135627985],
-                        [-0.470621615648,-0.628728508949,0.619044244289],
-                        [-0.44230055809,-0.58378881216,0.680853009224],
-                        [-0.483050197363,-0.517854511738,0.706037700176],
-                        [-0.552667617798,-0.495975226164,0.669751524925],
-                        [-0.520354926586,-0.44894811511,0.726413309574],
-                        [-0.44230055809,-0.58378881216,0.680853009224],
-                        [-0.483050197363,-0.517854511738,0.706037700176],
-                        [-0.411682873964,-0.535965919495,0.737060189247],
-                        [-0.44894811511,-0.726413309574,0.520354926586],
-                        [-0.517854511738,-0.706037700176,0.483050197363],
-                        [-0.495975226164,-0.669751524925,0.552667617798],
-                        [-0.486395716667,-0.787004828453,0.379529476166],
-                        [-0.550243675709,-0.762617051601,0.340069264174],
-                        [-0.535965919495,-0.737060189247,0.411682873964],
-                        [-0.58378881216,-0.680853009224,0.44230055809],
-                        [-0.645450055599,-0.65135627985,0.398910075426],
-                        [-0.628728508949,-0.619044244289,0.470621615648],
-                        [-0.535965919495,-0.737060189247,0.411682873964],
-                        [-0.58378881216,-0.680853009224,0.44230055809],
-                        [-0.517854511738,-0.706037700176,0.483050197363],
-                        [-0.619044244289,-0.470621615648,0.628728508949],
-                        [-0.680853009224,-0.44230055809,0.58378881216],
-                        [-0.65135627985,-0.398910075426,0.645450055599],
-                        [-0.669751524925,-0.552667617798,0.495975226164],
-                        [-0.726413309574,-0.520354926586,0.44894811511],
-                        [-0.706037700176,-0.483050197363,0.517854511738],
-                        [-0.737060189247,-0.411682873964,0.535965919495],
-                        [-0.787004828453,-0.379529476166,0.486395716667],
-                        [-0.762617051601,-0.340069264174,0.550243675709],
-                        [-0.706037700176,-0.483050197363,0.517854511738],
-                        [-0.737060189247,-0.411682873964,0.535965919495],
-                        [-0.680853009224,-0.44230055809,0.58378881216],
-                        [-0.495975226164,-0.669751524925,0.552667617798],
-                        [-0.540649950504,-0.607478022575,0.581951975822],
-                        [-0.470621615648,-0.628728508949,0.619044244289],
-                        [-0.628728508949,-0.619044244289,0.470621615648],
-                        [-0.669751524925,-0.552667617798,0.495975226164],
-                        [-0.607478022575,-0.581951975822,0.540649950504],
-                        [-0.581951975822,-0.540649950504,0.607478022575],
-                        [-0.619044244289,-0.470621615648,0.628728508949],
-                        [-0.552667617798,-0.495975226164,0.669751524925],
-                        [-0.607478022575,-0.581951975822,0.540649950504],
-                        [-0.581951975822,-0.540649950504,0.607478022575],
-                        [-0.540649950504,-0.607478022575,0.581951975822],
-                        [-0.0339771322906,-0.82464236021,0.564633131027],
-                        [0.0,-0.79582041502,0.605532705784],
-                        [0.0339771322906,-0.82464236021,0.564633131027],
-                        [-0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.0744211226702,-0.722495436668,0.687358558178],
-                        [-0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0744211226702,-0.722495436668,0.687358558178],
-                        [0.108097285032,-0.757922053337,0.643326640129],
-                        [-0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0362210273743,-0.761889100075,0.646693944931],
-                        [0.0,-0.79582041502,0.605532705784],
-                        [-0.188148602843,-0.669747889042,0.718357801437],
-                        [-0.154971644282,-0.62687343359,0.763553202152],
-                        [-0.114190116525,-0.677466154099,0.726636230946],
-                        [-0.269586592913,-0.560828924179,0.782811582088],
-                        [-0.236761152744,-0.510783493519,0.826465010643],
-                        [-0.196083456278,-0.571085453033,0.797127783298],
-                        [-0.119124859571,-0.578244268894,0.807120084763],
-                        [-0.0809632539749,-0.524005174637,0.847858190536],
-                        [-0.0399611219764,-0.581926107407,0.81225925684],
-                        [-0.196083456278,-0.571085453033,0.797127783298],
-                        [-0.119124859571,-0.578244268894,0.807120084763],
-                        [-0.154971644282,-0.62687343359,0.763553202152],
-                        [0.114190116525,-0.677466154099,0.726636230946],
-                        [0.154971644282,-0.62687343359,0.763553202152],
-                        [0.188148602843,-0.669747889042,0.718357801437],
-                        [0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0809632539749,-0.524005174637,0.847858190536],
-                        [0.119124859571,-0.578244268894,0.807120084763],
-                        [0.196083456278,-0.571085453033,0.797127783298],
-                        [0.236761152744,-0.510783493519,0.826465010643],
-                        [0.269586592913,-0.560828924179,0.782811582088],
-                        [0.119124859571,-0.578244268894,0.807120084763],
-                        [0.196083456278,-0.571085453033,0.797127783298],
-                        [0.154971644282,-0.62687343359,0.763553202152],
-                        [-0.114190116525,-0.677466154099,0.726636230946],
-                        [-0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.0744211226702,-0.722495436668,0.687358558178],
-                        [-0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0399611219764,-0.581926107407,0.81225925684],
-                        [0.0,-0.634539365768,0.772890508175],
-                        [0.0382858961821,-0.68142670393,0.730884253979],
-                        [0.114190116525,-0.677466154099,0.726636230946],
-                        [0.0744211226702,-0.722495436668,0.687358558178],
-                        [0.0,-0.634539365768,0.772890508175],
-                        [0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.0382858961821,-0.68142670393,0.730884253979],
-                        [-0.346611320972,-0.436200261116,0.830415487289],
-                        [-0.313733518124,-0.380723625422,0.869839549065],
-                        [-0.276221334934,-0.446935534477,0.85085272789],
-                        [-0.413926929235,-0.3044308424,0.857896447182],
-                        [-0.380633711815,-0.246351331472,0.891307473183],
-                        [-0.348686188459,-0.313436716795,0.883275330067],
-                        [-0.277958005667,-0.321246802807,0.905284404755],
-                        [-0.239766731858,-0.258633822203,0.935745954514],
-                        [-0.202408134937,-0.327503234148,0.922915279865],
-                        [-0.348686188459,-0.313436716795,0.883275330067],
-                        [-0.277958005667,-0.321246802807,0.905284404755],
-                        [-0.313733518124,-0.380723625422,0.869839549065],
-                        [-0.468421578407,-0.174905076623,0.866019308567],
-                        [-0.434652328491,-0.117213711143,0.892938017845],
-                        [-0.409316182137,-0.180623859167,0.894335091114],
-                        [-0.509656965733,-0.0549761541188,0.858619451523],
-                        [-0.475679844618,0.0,0.8796184659],
-                        [-0.456712335348,-0.0568443164229,0.887796461582],
-                        [-0.398431301117,-0.0586068555713,0.915323853493],
-                        [-0.360324263573,0.0,0.932827115059],
-                        [-0.334895044565,-0.0602079555392,0.940329909325],
-                        [-0.456712335348,-0.0568443164229,0.887796461582],
-                        [-0.398431301117,-0.0586068555713,0.915323853493],
-                        [-0.434652328491,-0.117213711143,0.892938017845],
-                        [-0.199805602431,-0.193975359201,0.960443258286],
-                        [-0.158833146095,-0.128498718143,0.978907585144],
-                        [-0.121444880962,-0.196501940489,0.97295331955],
-                        [-0.266443610191,-0.0615878328681,0.961880862713],
-                        [-0.225778326392,0.0,0.974178731441],
-                        [-0.193714544177,-0.0626873448491,0.979053080082],
-                        [-0.117650069296,-0.0634539350867,0.991025745869],
-                        [-0.0770247355103,0.0,0.997029185295],
-                        [-0.0394601933658,-0.0638479366899,0.997179210186],
-                        [-0.193714544177,-0.0626873448491,0.979053080082],
-                        [-0.117650069296,-0.0634539350867,0.991025745869],
-                        [-0.158833146095,-0.128498718143,0.978907585144],
-                        [-0.409316182137,-0.180623859167,0.894335091114],
-                        [-0.34457308054,-0.185843646526,0.920180141926],
-                        [-0.380633711815,-0.246351331472,0.891307473183],
-                        [-0.334895044565,-0.0602079555392,0.940329909325],
-                        [-0.266443610191,-0.0615878328681,0.961880862713],
-                        [-0.306287169456,-0.123895764351,0.943842172623],
-                        [-0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.199805602431,-0.193975359201,0.960443258286],
-                        [-0.239766731858,-0.258633822203,0.935745954514],
-                        [-0.306287169456,-0.123895764351,0.943842172623],
-                        [-0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.34457308054,-0.185843646526,0.920180141926],
-                        [0.276221334934,-0.446935534477,0.85085272789],
-                        [0.313733518124,-0.380723625422,0.869839549065],
-                        [0.346611320972,-0.436200261116,0.830415487289],
-                        [0.202408134937,-0.327503234148,0.922915279865],
-                        [0.239766731858,-0.258633822203,0.935745954514],
-                        [0.277958005667,-0.321246802807,0.905284404755],
-                        [0.348686188459,-0.313436716795,0.883275330067],
-                        [0.380633711815,-0.246351331472,0.891307473183],
-                        [0.413926929235,-0.3044308424,0.857896447182],
-                        [0.277958005667,-0.321246802807,0.905284404755],
-                        [0.348686188459,-0.313436716795,0.883275330067],
-                        [0.313733518124,-0.380723625422,0.869839549065],
-                        [0.121444880962,-0.196501940489,0.97295331955],
-                        [0.158833146095,-0.128498718143,0.978907585144],
-                        [0.199805602431,-0.193975359201,0.960443258286],
-                        [0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0770247355103,0.0,0.997029185295],
-                        [0.117650069296,-0.0634539350867,0.991025745869],
-                        [0.193714544177,-0.0626873448491,0.979053080082],
-                        [0.225778326392,0.0,0.974178731441],
-                        [0.266443610191,-0.0615878328681,0.961880862713],
-                        [0.117650069296,-0.0634539350867,0.991025745869],
-                        [0.193714544177,-0.0626873448491,0.979053080082],
-                        [0.158833146095,-0.128498718143,0.978907585144],
-                        [0.409316182137,-0.180623859167,0.894335091114],
-                        [0.434652328491,-0.117213711143,0.892938017845],
-                        [0.468421578407,-0.174905076623,0.866019308567],
-                        [0.334895044565,-0.0602079555392,0.940329909325],
-                        [0.360324263573,0.0,0.932827115059],
-                        [0.398431301117,-0.0586068555713,0.915323853493],
-                        [0.456712335348,-0.0568443164229,0.887796461582],
-                        [0.475679844618,0.0,0.8796184659],
-                        [0.509656965733,-0.0549761541188,0.858619451523],
-                        [0.398431301117,-0.0586068555713,0.915323853493],
-                        [0.456712335348,-0.0568443164229,0.887796461582],
-                        [0.434652328491,-0.117213711143,0.892938017845],
-                        [0.199805602431,-0.193975359201,0.960443258286],
-                        [0.274516820908,-0.190361812711,0.942551255226],
-                        [0.239766731858,-0.258633822203,0.935745954514],
-                        [0.266443610191,-0.0615878328681,0.961880862713],
-                        [0.334895044565,-0.0602079555392,0.940329909325],
-                        [0.306287169456,-0.123895764351,0.943842172623],
-                        [0.34457308054,-0.185843646526,0.920180141926],
-                        [0.409316182137,-0.180623859167,0.894335091114],
-                        [0.380633711815,-0.246351331472,0.891307473183],
-                        [0.306287169456,-0.123895764351,0.943842172623],
-                        [0.34457308054,-0.185843646526,0.920180141926],
-                        [0.274516820908,-0.190361812711,0.942551255226],
-                        [-0.276221334934,-0.446935534477,0.85085272789],
-                        [-0.20109423995,-0.455528259277,0.867211103439],
-                        [-0.236761152744,-0.510783493519,0.826465010643],
-                        [-0.202408134937,-0.327503234148,0.922915279865],
-                        [-0.123069040477,-0.33188316226,0.935258030891],
-                        [-0.162998497486,-0.395605653524,0.903840482235],
-                        [-0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.0410230122507,-0.464636415243,0.88455080986],
-                        [-0.0809632539749,-0.524005174637,0.847858190536],
-                        [-0.162998497486,-0.395605653524,0.903840482235],
-                        [-0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.20109423995,-0.455528259277,0.867211103439],
-                        [-0.121444880962,-0.196501940489,0.97295331955],
-                        [-0.0407496243715,-0.197802826762,0.979394435883],
-                        [-0.0820460245013,-0.265506535769,0.960611641407],
-                        [-0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0394601933658,-0.0638479366899,0.997179210186],
-                        [0.0,-0.130150929093,0.991494178772],
-                        [0.0407496243715,-0.197802826762,0.979394435883],
-                        [0.121444880962,-0.196501940489,0.97295331955],
-                        [0.0820460245013,-0.265506535769,0.960611641407],
-                        [0.0,-0.130150929093,0.991494178772],
-                        [0.0407496243715,-0.197802826762,0.979394435883],
-                        [-0.0407496243715,-0.197802826762,0.979394435883],
-                        [0.0410230122507,-0.464636415243,0.88455080986],
-                        [0.122248865664,-0.461539924145,0.878655850887],
-                        [0.0809632539749,-0.524005174637,0.847858190536],
-                        [0.123069040477,-0.33188316226,0.935258030891],
-                        [0.202408134937,-0.327503234148,0.922915279865],
-                        [0.162998497486,-0.395605653524,0.903840482235],
-                        [0.20109423995,-0.455528259277,0.867211103439],
-                        [0.276221334934,-0.446935534477,0.85085272789],
-                        [0.236761152744,-0.510783493519,0.826465010643],
-                        [0.162998497486,-0.395605653524,0.903840482235],
-                        [0.20109423995,-0.455528259277,0.867211103439],
-                        [0.122248865664,-0.461539924145,0.878655850887],
-                        [-0.0820460245013,-0.265506535769,0.960611641407],
-                        [-0.04130198434,-0.334140062332,0.941618084908],
-                        [-0.123069040477,-0.33188316226,0.935258030891],
-                        [0.0820460245013,-0.265506535769,0.960611641407],
-                        [0.123069040477,-0.33188316226,0.935258030891],
-                        [0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0,-0.400968074799,0.916092038155],
-                        [0.0410230122507,-0.464636415243,0.88455080986],
-                        [-0.0410230122507,-0.464636415243,0.88455080986],
-                        [0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0,-0.400968074799,0.916092038155],
-                        [-0.04130198434,-0.334140062332,0.941618084908],
-                        [0.0339771322906,-0.82464236021,0.564633131027],
-                        [0.091976031661,-0.830952167511,0.548688352108],
-                        [0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.108097285032,-0.757922053337,0.643326640129],
-                        [0.171839639544,-0.759706020355,0.627150595188],
-                        [0.131048902869,-0.798110127449,0.588087081909],
-                        [0.153434738517,-0.834331154823,0.529480218887],
-                        [0.217834427953,-0.834127128124,0.506734728813],
-                        [0.174905076623,-0.866019308567,0.468421578407],
-                        [0.131048902869,-0.798110127449,0.588087081909],
-                        [0.153434738517,-0.834331154823,0.529480218887],
-                        [0.091976031661,-0.830952167511,0.548688352108],
-                        [0.188148602843,-0.669747889042,0.718357801437],
-                        [0.256401896477,-0.665616393089,0.700865805149],
-                        [0.213841319084,-0.715529501438,0.665048420429],
-                        [0.269586592913,-0.560828924179,0.782811582088],
-                        [0.340069264174,-0.550243675709,0.762617051601],
-                        [0.298754066229,-0.610302150249,0.733673810959],
-                        [0.327040165663,-0.657660841942,0.678621411324],
-                        [0.398910075426,-0.645450055599,0.65135627985],
-                        [0.353819847107,-0.701809465885,0.618283927441],
-                        [0.298754066229,-0.610302150249,0.733673810959],
-                        [0.327040165663,-0.657660841942,0.678621411324],
-                        [0.256401896477,-0.665616393089,0.700865805149],
-                        [0.284414708614,-0.829719662666,0.480284929276],
-                        [0.352179646492,-0.820587992668,0.450116455555],
-                        [0.3044308424,-0.857896447182,0.413926929235],
-                        [0.378517180681,-0.74177056551,0.553625464439],
-                        [0.44894811511,-0.726413309574,0.520354926586],
-                        [0.400663375854,-0.776785671711,0.485873311758],
-                        [0.419940322638,-0.806385576725,0.416404157877],
-                        [0.486395716667,-0.787004828453,0.379529476166],
-                        [0.436200261116,-0.830415487289,0.346611320972],
-                        [0.400663375854,-0.776785671711,0.485873311758],
-                        [0.419940322638,-0.806385576725,0.416404157877],
-                        [0.352179646492,-0.820587992668,0.450116455555],
-                        [0.213841319084,-0.715529501438,0.665048420429],
-                        [0.238753452897,-0.757998526096,0.606988489628],
-                        [0.171839639544,-0.759706020355,0.627150595188],
-                        [0.353819847107,-0.701809465885,0.618283927441],
-                        [0.378517180681,-0.74177056551,0.553625464439],
-                        [0.308011889458,-0.752189457417,0.582528710365],
-                        [0.26241543889,-0.796284377575,0.545040607452],
-                        [0.284414708614,-0.829719662666,0.480284929276],
-                        [0.217834427953,-0.834127128124,0.506734728813],
-                        [0.308011889458,-0.752189457417,0.582528710365],
-                        [0.26241543889,-0.796284377575,0.545040607452],
-                        [0.238753452897,-0.757998526096,0.606988489628],
-                        [0.346611320972,-0.436200261116,0.830415487289],
-                        [0.416404157877,-0.419940322638,0.806385576725],
-                        [0.379529476166,-0.486395716667,0.787004828453],
-                        [0.413926929235,-0.3044308424,0.857896447182],
-                        [0.480284929276,-0.284414708614,0.829719662666],
-                        [0.450116455555,-0.352179646492,0.820587992668],
-                        [0.485873311758,-0.400663375854,0.776785671711],
-                        [0.553625464439,-0.378517180681,0.74177056551],
-                        [0.520354926586,-0.44894811511,0.726413309574],
-                        [0.450116455555,-0.352179646492,0.820587992668],
-                        [0.485873311758,-0.400663375854,0.776785671711],
-                        [0.416404157877,-0.419940322638,0.806385576725],
-                        [0.468421578407,-0.174905076623,0.866019308567],
-                        [0.529480218887,-0.153434738517,0.834331154823],
-                        [0.506734728813,-0.217834427953,0.834127128124],
-                        [0.509656965733,-0.0549761541188,0.858619451523],
-                        [0.564633131027,-0.0339771322906,0.82464236021],
-                        [0.548688352108,-0.091976031661,0.830952167511],
-                        [0.588087081909,-0.131048902869,0.798110127449],
-                        [0.643326640129,-0.108097285032,0.757922053337],
-                        [0.627150595188,-0.171839639544,0.759706020355],
-                        [0.548688352108,-0.091976031661,0.830952167511],
-                        [0.588087081909,-0.131048902869,0.798110127449],
-                        [0.529480218887,-0.153434738517,0.834331154823],
-                        [0.618283927441,-0.353819847107,0.701809465885],
-                        [0.678621411324,-0.327040165663,0.657660841942],
-                        [0.65135627985,-0.398910075426,0.645450055599],
-                        [0.665048420429,-0.213841319084,0.715529501438],
-                        [0.718357801437,-0.188148602843,0.669747889042],
-                        [0.700865805149,-0.256401896477,0.665616393089],
-                        [0.733673810959,-0.298754066229,0.610302150249],
-                        [0.782811582088,-0.269586592913,0.560828924179],
-                        [0.762617051601,-0.340069264174,0.550243675709],
-                        [0.700865805149,-0.256401896477,0.665616393089],
-                        [0.733673810959,-0.298754066229,0.610302150249],
-                        [0.678621411324,-0.327040165663,0.657660841942],
-                        [0.506734728813,-0.217834427953,0.834127128124],
-                        [0.545040607452,-0.26241543889,0.796284377575],
-                        [0.480284929276,-0.284414708614,0.829719662666],
-                        [0.627150595188,-0.171839639544,0.759706020355],
-                        [0.665048420429,-0.213841319084,0.715529501438],
-                        [0.606988489628,-0.238753452897,0.757998526096],
-                        [0.582528710365,-0.308011889458,0.752189457417],
-                        [0.618283927441,-0.353819847107,0.701809465885],
-                        [0.553625464439,-0.378517180681,0.74177056551],
-                        [0.606988489628,-0.238753452897,0.757998526096],
-                        [0.582528710365,-0.308011889458,0.752189457417],
-                        [0.545040607452,-0.26241543889,0.796284377575],
-                        [0.550243675709,-0.762617051601,0.340069264174],
-                        [0.610302150249,-0.733673810959,0.298754066229],
-                        [0.560828924179,-0.782811582088,0.269586592913],
-                        [0.645450055599,-0.65135627985,0.398910075426],
-                        [0.701809465885,-0.618283927441,0.353819847107],
-                        [0.657660841942,-0.678621411324,0.327040165663],
-                        [0.665616393089,-0.700865805149,0.256401896477],
-                        [0.715529501438,-0.665048420429,0.213841319084],
-                        [0.669747889042,-0.718357801437,0.188148602843],
-                        [0.657660841942,-0.678621411324,0.327040165663],
-                        [0.665616393089,-0.700865805149,0.256401896477],
-                        [0.610302150249,-0.733673810959,0.298754066229],
-                        [0.726413309574,-0.520354926586,0.44894811511],
-                        [0.776785671711,-0.485873311758,0.400663375854],
-                        [0.74177056551,-0.553625464439,0.378517180681],
-                        [0.787004828453,-0.379529476166,0.486395716667],
-                        [0.830415487289,-0.346611320972,0.436200261116],
-                        [0.806385576725,-0.416404157877,0.419940322638],
-                        [0.820587992668,-0.450116455555,0.352179646492],
-                        [0.857896447182,-0.413926929235,0.3044308424],
-                        [0.829719662666,-0.480284929276,0.284414708614],
-                        [0.806385576725,-0.416404157877,0.419940322638],
-                        [0.820587992668,-0.450116455555,0.352179646492],
-                        [0.776785671711,-0.485873311758,0.400663375854],
-                        [0.759706020355,-0.627150595188,0.171839639544],
-                        [0.798110127449,-0.588087081909,0.131048902869],
-                        [0.757922053337,-0.643326640129,0.108097285032],
-                        [0.834127128124,-0.506734728813,0.217834427953],
-                        [0.866019308567,-0.468421578407,0.174905076623],
-                        [0.834331154823,-0.529480218887,0.153434738517],
-                        [0.830952167511,-0.548688352108,0.091976031661],
-                        [0.858619451523,-0.509656965733,0.0549761541188],
-                        [0.82464236021,-0.564633131027,0.0339771322906],
-                        [0.834331154823,-0.529480218887,0.153434738517],
-                        [0.830952167511,-0.548688352108,0.091976031661],
-                        [0.798110127449,-0.588087081909,0.131048902869],
-                        [0.74177056551,-0.553625464439,0.378517180681],
-                        [0.752189457417,-0.582528710365,0.308011889458],
-                        [0.701809465885,-0.618283927441,0.353819847107],
-                        [0.829719662666,-0.480284929276,0.284414708614],
-                        [0.834127128124,-0.506734728813,0.217834427953],
-                        [0.796284377575,-0.545040607452,0.26241543889],
-                        [0.757998526096,-0.606988489628,0.238753452897],
-                        [0.759706020355,-0.627150595188,0.171839639544],
-                        [0.715529501438,-0.665048420429,0.213841319084],
-                        [0.796284377575,-0.545040607452,0.26241543889],
-                        [0.757998526096,-0.606988489628,0.238753452897],
-                        [0.752189457417,-0.582528710365,0.308011889458],
-                        [0.379529476166,-0.486395716667,0.787004828453],
-                        [0.411682873964,-0.535965919495,0.737060189247],
-                        [0.340069264174,-0.550243675709,0.762617051601],
-                        [0.520354926586,-0.44894811511,0.726413309574],
-                        [0.552667617798,-0.495975226164,0.669751524925],
-                        [0.483050197363,-0.517854511738,0.706037700176],
-                        [0.44230055809,-0.58378881216,0.680853009224],
-                        [0.470621615648,-0.628728508949,0.619044244289],
-                        [0.398910075426,-0.645450055599,0.65135627985],
-                        [0.483050197363,-0.517854511738,0.706037700176],
-                        [0.44230055809,-0.58378881216,0.680853009224],
-                        [0.411682873964,-0.535965919495,0.737060189247],
-                        [0.65135627985,-0.398910075426,0.645450055599],
-                        [0.680853009224,-0.44230055809,0.58378881216],
-                        [0.619044244289,-0.470621615648,0.628728508949],
-                        [0.762617051601,-0.340069264174,0.550243675709],
-                        [0.787004828453,-0.379529476166,0.486395716667],
-                        [0.737060189247,-0.411682873964,0.535965919495],
-                        [0.706037700176,-0.483050197363,0.517854511738],
-                        [0.726413309574,-0.520354926586,0.44894811511],
-                        [0.669751524925,-0.552667617798,0.495975226164],
-                        [0.737060189247,-0.411682873964,0.535965919495],
-                        [0.706037700176,-0.483050197363,0.517854511738],
-                        [0.680853009224,-0.44230055809,0.58378881216],
-                        [0.495975226164,-0.669751524925,0.552667617798],
-                        [0.517854511738,-0.706037700176,0.483050197363],
-                        [0.44894811511,-0.726413309574,0.520354926586],
-                        [0.628728508949,-0.619044244289,0.470621615648],
-                        [0.645450055599,-0.65135627985,0.398910075426],
-                        [0.58378881216,-0.680853009224,0.44230055809],
-                        [0.535965919495,-0.737060189247,0.411682873964],
-                        [0.550243675709,-0.762617051601,0.340069264174],
-                        [0.486395716667,-0.787004828453,0.379529476166],
-                        [0.58378881216,-0.680853009224,0.44230055809],
-                        [0.535965919495,-0.737060189247,0.411682873964],
-                        [0.517854511738,-0.706037700176,0.483050197363],
-                        [0.619044244289,-0.470621615648,0.628728508949],
-                        [0.581951975822,-0.540649950504,0.607478022575],
-                        [0.552667617798,-0.495975226164,0.669751524925],
-                        [0.669751524925,-0.552667617798,0.495975226164],
-                        [0.628728508949,-0.619044244289,0.470621615648],
-                        [0.607478022575,-0.581951975822,0.540649950504],
-                        [0.540649950504,-0.607478022575,0.581951975822],
-                        [0.495975226164,-0.669751524925,0.552667617798],
-                        [0.470621615648,-0.628728508949,0.619044244289],
-                        [0.607478022575,-0.581951975822,0.540649950504],
-                        [0.540649950504,-0.607478022575,0.581951975822],
-                        [0.581951975822,-0.540649950504,0.607478022575],
-                        [0.82464236021,-0.564633131027,-0.0339771322906],
-                        [0.79582041502,-0.605532705784,0.0],
-                        [0.82464236021,-0.564633131027,0.0339771322906],
-                        [0.757922053337,-0.643326640129,-0.108097285032],
-                        [0.722495436668,-0.687358558178,-0.0744211226702],
-                        [0.761889100075,-0.646693944931,-0.0362210273743],
-                        [0.761889100075,-0.646693944931,0.0362210273743],
-                        [0.722495436668,-0.687358558178,0.0744211226702],
-                        [0.757922053337,-0.643326640129,0.108097285032],
-                        [0.761889100075,-0.646693944931,-0.0362210273743],
-                        [0.761889100075,-0.646693944931,0.0362210273743],
-                        [0.79582041502,-0.605532705784,0.0],
-                        [0.669747889042,-0.718357801437,-0.188148602843],
-                        [0.62687343359,-0.763553202152,-0.154971644282],
-                        [0.677466154099,-0.726636230946,-0.114190116525],
-                        [0.560828924179,-0.782811582088,-0.269586592913],
-                        [0.510783493519,-0.826465010643,-0.236761152744],
-                        [0.571085453033,-0.797127783298,-0.196083456278],
-                        [0.578244268894,-0.807120084763,-0.119124859571],
-                        [0.524005174637,-0.847858190536,-0.0809632539749],
-                        [0.581926107407,-0.81225925684,-0.0399611219764],
-                        [0.571085453033,-0.797127783298,-0.196083456278],
-                        [0.578244268894,-0.807120084763,-0.119124859571],
-                        [0.62687343359,-0.763553202152,-0.154971644282],
-                        [0.677466154099,-0.726636230946,0.114190116525],
-                        [0.62687343359,-0.763553202152,0.154971644282],
-                        [0.669747889042,-0.718357801437,0.188148602843],
-                        [0.581926107407,-0.81225925684,0.0399611219764],
-                        [0.524005174637,-0.847858190536,0.0809632539749],
-                        [0.578244268894,-0.807120084763,0.119124859571],
-                        [0.571085453033,-0.797127783298,0.196083456278],
-                        [0.510783493519,-0.826465010643,0.236761152744],
-                        [0.560828924179,-0.782811582088,0.269586592913],
-                        [0.578244268894,-0.807120084763,0.119124859571],
-                        [0.571085453033,-0.797127783298,0.196083456278],
-                        [0.62687343359,-0.763553202152,0.154971644282],
-                        [0.677466154099,-0.726636230946,-0.114190116525],
-                        [0.68142670393,-0.730884253979,-0.0382858961821],
-                        [0.722495436668,-0.687358558178,-0.0744211226702],
-                        [0.581926107407,-0.81225925684,-0.0399611219764],
-                        [0.581926107407,-0.81225925684,0.0399611219764],
-                        [0.634539365768,-0.772890508175,0.0],
-                        [0.68142670393,-0.730884253979,0.0382858961821],
-                        [0.677466154099,-0.726636230946,0.114190116525],
-                        [0.722495436668,-0.687358558178,0.0744211226702],
-                        [0.634539365768,-0.772890508175,0.0],
-                        [0.68142670393,-0.730884253979,0.0382858961821],
-                        [0.68142670393,-0.730884253979,-0.0382858961821],
-                        [0.436200261116,-0.830415487289,-0.346611320972],
-                        [0.380723625422,-0.869839549065,-0.313733518124],
-                        [0.446935534477,-0.85085272789,-0.276221334934],
-                        [0.3044308424,-0.857896447182,-0.413926929235],
-                        [0.246351331472,-0.891307473183,-0.380633711815],
-                        [0.313436716795,-0.883275330067,-0.348686188459],
-                        [0.321246802807,-0.905284404755,-0.277958005667],
-                        [0.258633822203,-0.935745954514,-0.239766731858],
-                        [0.327503234148,-0.922915279865,-0.202408134937],
-                        [0.313436716795,-0.883275330067,-0.348686188459],
-                        [0.321246802807,-0.905284404755,-0.277958005667],
-                        [0.380723625422,-0.869839549065,-0.313733518124],
-                        [0.174905076623,-0.866019308567,-0.468421578407],
-                        [0.117213711143,-0.892938017845,-0.434652328491],
-                        [0.180623859167,-0.894335091114,-0.409316182137],
-                        [0.0549761541188,-0.858619451523,-0.509656965733],
-                        [0.0,-0.8796184659,-0.475679844618],
-                        [0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0586068555713,-0.915323853493,-0.398431301117],
-                        [0.0,-0.932827115059,-0.360324263573],
-                        [0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0568443164229,-0.887796461582,-0.456712335348],
-                        [0.0586068555713,-0.915323853493,-0.398431301117],
-                        [0.117213711143,-0.892938017845,-0.434652328491],
-                        [0.193975359201,-0.960443258286,-0.199805602431],
-                        [0.128498718143,-0.978907585144,-0.158833146095],
-                        [0.196501940489,-0.97295331955,-0.121444880962],
-                        [0.0615878328681,-0.961880862713,-0.266443610191],
-                        [0.0,-0.974178731441,-0.225778326392],
-                        [0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0634539350867,-0.991025745869,-0.117650069296],
-                        [0.0,-0.997029185295,-0.0770247355103],
-                        [0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0626873448491,-0.979053080082,-0.193714544177],
-                        [0.0634539350867,-0.991025745869,-0.117650069296],
-                        [0.128498718143,-0.978907585144,-0.158833146095],
-                        [0.180623859167,-0.894335091114,-0.409316182137],
-                        [0.185843646526,-0.920180141926,-0.34457308054],
-                        [0.246351331472,-0.891307473183,-0.380633711815],
-                        [0.0602079555392,-0.940329909325,-0.334895044565],
-                        [0.0615878328681,-0.961880862713,-0.266443610191],
-                        [0.123895764351,-0.943842172623,-0.306287169456],
-                        [0.190361812711,-0.942551255226,-0.274516820908],
-                        [0.193975359201,-0.960443258286,-0.199805602431],
-                        [0.258633822203,-0.935745954514,-0.239766731858],
-                        [0.123895764351,-0.943842172623,-0.306287169456],
-                        [0.190361812711,-0.942551255226,-0.274516820908],
-                        [0.185843646526,-0.920180141926,-0.34457308054],
-                        [0.446935534477,-0.85085272789,0.276221334934],
-                        [0.380723625422,-0.869839549065,0.313733518124],
-                        [0.436200261116,-0.830415487289,0.346611320972],
-                        [0.327503234148,-0.922915279865,0.202408134937],
-                        [0.258633822203,-0.935745954514,0.239766731858],
-                        [0.321246802807,-0.905284404755,0.277958005667],
-                        [0.313436716795,-0.883275330067,0.348686188459],
-                        [0.246351331472,-0.891307473183,0.380633711815],
-                        [0.3044308424,-0.857896447182,0.413926929235],
-                        [0.321246802807,-0.905284404755,0.277958005667],
-                        [0.313436716795,-0.883275330067,0.348686188459],
-                        [0.380723625422,-0.869839549065,0.313733518124],
-                        [0.196501940489,-0.97295331955,0.121444880962],
-                        [0.128498718143,-0.978907585144,0.158833146095],
-                        [0.193975359201,-0.960443258286,0.199805602431],
-                        [0.0638479366899,-0.997179210186,0.0394601933658],
-                        [0.0,-0.997029185295,0.0770247355103],
-                        [0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0626873448491,-0.979053080082,0.193714544177],
-                        [0.0,-0.974178731441,0.225778326392],
-                        [0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0634539350867,-0.991025745869,0.117650069296],
-                        [0.0626873448491,-0.979053080082,0.193714544177],
-                        [0.128498718143,-0.978907585144,0.158833146095],
-                        [0.180623859167,-0.894335091114,0.409316182137],
-                        [0.117213711143,-0.892938017845,0.434652328491],
-                        [0.174905076623,-0.866019308567,0.468421578407],
-                        [0.0602079555392,-0.940329909325,0.334895044565],
-                        [0.0,-0.932827115059,0.360324263573],
-                        [0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0568443164229,-0.887796461582,0.456712335348],
-                        [0.0,-0.8796184659,0.475679844618],
-                        [0.0549761541188,-0.858619451523,0.509656965733],
-                        [0.0586068555713,-0.915323853493,0.398431301117],
-                        [0.0568443164229,-0.887796461582,0.456712335348],
-                        [0.117213711143,-0.892938017845,0.434652328491],
-                        [0.193975359201,-0.960443258286,0.199805602431],
-                        [0.190361812711,-0.942551255226,0.274516820908],
-                        [0.258633822203,-0.935745954514,0.239766731858],
-                        [0.0615878328681,-0.961880862713,0.266443610191],
-                        [0.0602079555392,-0.940329909325,0.334895044565],
-                        [0.123895764351,-0.943842172623,0.306287169456],
-                        [0.185843646526,-0.920180141926,0.34457308054],
-                        [0.180623859167,-0.894335091114,0.409316182137],
-                        [0.246351331472,-0.891307473183,0.380633711815],
-                        [0.123895764351,-0.943842172623,0.306287169456],
-                        [0.185843646526,-0.920180141926,0.34457308054],
-                        [0.190361812711,-0.942551255226,0.274516820908],
-                        [0.446935534477,-0.85085272789,-0.276221334934],
-                        [0.455528259277,-0.867211103439,-0.20109423995],
-                        [0.510783493519,-0.826465010643,-0.236761152744],
-                        [0.327503234148,-0.922915279865,-0.202408134937],
-                        [0.33188316226,-0.935258030891,-0.123069040477],
-                        [0.395605653524,-0.903840482235,-0.162998497486],
-                        [0.461539924145,-0.878655850887,-0.122248865664],
-                        [0.464636415243,-0.88455080986,-0.0410230122507],
-                        [0.524005174637,-0.847858190536,-0.0809632539749],
-                        [0.395605653524,-0.903840482235,-0.162998497486],
-                        [0.461539924145,-0.878655850887,-0.122248865664],
-                        [0.455528259277,-0.867211103439,-0.20109423995],
-                        [0.196501940489,-0.97295331955,-0.121444880962],
-                        [0.197802826762,-0.979394435883,-0.0407496243715],
-                        [0.265506535769,-0.960611641407,-0.0820460245013],
-                        [0.0638479366899,-0.997179210186,-0.0394601933658],
-                        [0.0638479366899,-0.997179210186,0.0394601933658],
-                        [0.130150929093,-0.991494178772,0.0],
-                        [0.197802826762,-0.979394435883,0.0407496243715],
-                        [0.196501940489,-0.97295331955,0.121444880962],
-                        [0.265506535769,-0.960611641407,0.0820460245013],
-                        [0.130150929093,-0.991494178772,0.0],
-                        [0.197802826762,-0.979394435883,0.0407496243715],
-                        [0.197802826762,-0.979394435883,-0.0407496243715],
-                        [0.464636415243,-0.88455080986,0.0410230122507],
-                        [0.461539924145,-0.878655850887,0.122248865664],
-                        [0.524005174637,-0.847858190536,0.0809632539749],
-                        [0.33188316226,-0.935258030891,0.123069040477],
-                        [0.327503234148,-0.922915279865,0.202408134937],
-                        [0.395605653524,-0.903840482235,0.162998497486],
-                        [0.455528259277,-0.867211103439,0.20109423995],
-                        [0.446935534477,-0.85085272789,0.276221334934],
-                        [0.510783493519,-0.826465010643,0.236761152744],
-                        [0.395605653524,-0.903840482235,0.162998497486],
-                        [0.455528259277,-0.867211103439,0.20109423995],
-                        [0.461539924145,-0.878655850887,0.122248865664],
-                        [0.265506535769,-0.960611641407,-0.0820460245013],
-                        [0.334140062332,-0.941618084908,-0.04130198434],
-                        [0.33188316226,-0.935258030891,-0.123069040477],
-                        [0.265506535769,-0.960611641407,0.0820460245013],
-                        [0.33188316226,-0.935258030891,0.123069040477],
-                        [0.334140062332,-0.941618084908,0.04130198434],
-                        [0.400968074799,-0.916092038155,0.0],
-                        [0.464636415243,-0.88455080986,0.0410230122507],
-                        [0.464636415243,-0.88455080986,-0.0410230122507],
-                        [0.334140062332,-0.941618084908,0.04130198434],
-                        [0.400968074799,-0.916092038155,0.0],
-                        [0.334140062332,-0.941618084908,-0.04130198434],
-                        [-0.82464236021,-0.564633131027,-0.0339771322906],
-                        [-0.830952167511,-0.548688352108,-0.091976031661],
-                        [-0.858619451523,-0.509656965733,-0.0549761541188],
-                        [-0.757922053337,-0.643326640129,-0.108097285032],
-                        [-0.759706020355,-0.627150595188,-0.171839639544],
-                        [-0.798110127449,-0.588087081909,-0.131048902869],
-                        [-0.834331154823,-0.529480218887,-0.153434738517],
-                        [-0.834127128124,-0.506734728813,-0.217834427953],
-                        [-0.866019308567,-0.468421578407,-0.174905076623],
-                        [-0.798110127449,-0.588087081909,-0.131048902869],
-                        [-0.834331154823,-0.529480218887,-0.153434738517],
-                        [-0.830952167511,-0.548688352108,-0.091976031661],
-                        [-0.669747889042,-0.718357801437,-0.188148602843],
-                        [-0.665616393089,-0.700865805149,-0.256401896477],
-                        [-0.715529501438,-0.665048420429,-0.213841319084],
-                        [-0.560828924179,-0.782811582088,-0.269586592913],
-                        [-0.550243675709,-0.762617051601,-0.340069264174],
-                        [-0.610302150249,-0.733673810959,-0.298754066229],
-                        [-0.657660841942,-0.678621411324,-0.327040165663],
-                        [-0.645450055599,-0.65135627985,-0.398910075426],
-                        [-0.701809465885,-0.618283927441,-0.353819847107],
-                        [-0.610302150249,-0.733673810959,-0.298754066229],
-                        [-0.657660841942,-0.678621411324,-0.327040165663],
-                        [-0.665616393089,-0.700865805149,-0.256401896477],
-                        [-0.829719662666,-0.480284929276,-0.284414708614],
-                        [-0.820587992668,-0.450116455555,-0.352179646492],
-                        [-0.857896447182,-0.413926929235,-0.3044308424],
-                        [-0.74177056551,-0.553625464439,-0.378517180681],
-                        [-0.726413309574,-0.520354926586,-0.44894811511],
-                        [-0.776785671711,-0.485873311758,-0.400663375854],
-                        [-0.806385576725,-0.416404157877,-0.419940322638],
-                        [-0.787004828453,-0.379529476166,-0.486395716667],
-                        [-0.830415487289,-0.346611320972,-0.436200261116],
-                        [-0.776785671711,-0.485873311758,-0.400663375854],
-                        [-0.806385576725,-0.416404157877,-0.419940322638],
-                        [-0.820587992668,-0.450116455555,-0.352179646492],
-                        [-0.715529501438,-0.665048420429,-0.213841319084],
-                        [-0.757998526096,-0.606988489628,-0.238753452897],
-                        [-0.759706020355,-0.627150595188,-0.171839639544],
-                        [-0.701809465885,-0.618283927441,-0.353819847107],
-                        [-0.74177056551,-0.553625464439,-0.378517180681],
-                        [-0.752189457417,-0.582528710365,-0.308011889458],
-                        [-0.796284377575,-0.545040607452,-0.26241543889],
-                        [-0.829719662666,-0.480284929276,-0.284414708614],
-                        [-0.834127128124,-0.506734728813,-0.217834427953],
-                        [-0.752189457417,-0.582528710365,-0.308011889458],
-                        [-0.796284377575,-0.545040607452,-0.26241543889],
-                        [-0.757998526096,-0.606988489628,-0.238753452897],
-                        [-0.436200261116,-0.830415487289,-0.346611320972],
-                        [-0.419940322638,-0.806385576725,-0.416404157877],
-                        [-0.486395716667,-0.787004828453,-0.379529476166],
-                        [-0.3044308424,-0.857896447182,-0.413926929235],
-                        [-0.284414708614,-0.829719662666,-0.480284929276],
-                        [-0.352179646492,-0.820587992668,-0.450116455555],
-                        [-0.400663375854,-0.776785671711,-0.485873311758],
-                        [-0.378517180681,-0.74177056551,-0.553625464439],
-                        [-0.44894811511,-0.726413309574,-0.520354926586],
-                        [-0.352179646492,-0.820587992668,-0.450116455555],
-                        [-0.400663375854,-0.776785671711,-0.485873311758],
-                        [-0.419940322638,-0.806385576725,-0.416404157877],
-                        [-0.174905076623,-0.866019308567,-0.468421578407],
-                        [-0.153434738517,-0.834331154823,-0.529480218887],
-                        [-0.217834427953,-0.834127128124,-0.506734728813],
-                        [-0.0549761541188,-0.858619451523,-0.509656965733],
-                        [-0.0339771322906,-0.82464236021,-0.564633131027],
-                        [-0.091976031661,-0.830952167511,-0.548688352108],
-                        [-0.131048902869,-0.798110127449,-0.588087081909],
-                        [-0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.171839639544,-0.759706020355,-0.627150595188],
-                        [-0.091976031661,-0.830952167511,-0.548688352108],
-                        [-0.131048902869,-0.798110127449,-0.588087081909],
-                        [-0.153434738517,-0.834331154823,-0.529480218887],
-                        [-0.353819847107,-0.701809465885,-0.618283927441],
-                        [-0.327040165663,-0.657660841942,-0.678621411324],
-                        [-0.398910075426,-0.645450055599,-0.65135627985],
-                        [-0.213841319084,-0.715529501438,-0.665048420429],
-                        [-0.188148602843,-0.669747889042,-0.718357801437],
-                        [-0.256401896477,-0.665616393089,-0.700865805149],
-                        [-0.298754066229,-0.610302150249,-0.733673810959],
-                        [-0.269586592913,-0.560828924179,-0.782811582088],
-                        [-0.340069264174,-0.550243675709,-0.762617051601],
-                        [-0.256401896477,-0.665616393089,-0.700865805149],
-                        [-0.298754066229,-0.610302150249,-0.733673810959],
-                        [-0.327040165663,-0.657660841942,-0.678621411324],
-                        [-0.217834427953,-0.834127128124,-0.506734728813],
-                        [-0.26241543889,-0.796284377575,-0.545040607452],
-                        [-0.284414708614,-0.829719662666,-0.480284929276],
-                        [-0.171839639544,-0.759706020355,-0.627150595188],
-                        [-0.213841319084,-0.715529501438,-0.665048420429],
-                        [-0.238753452897,-0.757998526096,-0.606988489628],
-                        [-0.308011889458,-0.752189457417,-0.582528710365],
-                        [-0.353819847107,-0.701809465885,-0.618283927441],
-                        [-0.378517180681,-0.74177056551,-0.553625464439],
-                        [-0.238753452897,-0.757998526096,-0.606988489628],
-                        [-0.308011889458,-0.752189457417,-0.582528710365],
-                        [-0.26241543889,-0.796284377575,-0.545040607452],
-                        [-0.762617051601,-0.340069264174,-0.550243675709],
-                        [-0.733673810959,-0.298754066229,-0.610302150249],
-                        [-0.782811582088,-0.269586592913,-0.560828924179],
-                        [-0.65135627985,-0.398910075426,-0.645450055599],
-                        [-0.618283927441,-0.353819847107,-0.701809465885],
-                        [-0.678621411324,-0.327040165663,-0.657660841942],
-                        [-0.700865805149,-0.256401896477,-0.665616393089],
-                        [-0.665048420429,-0.213841319084,-0.715529501438],
-                        [-0.718357801437,-0.188148602843,-0.669747889042],
-                        [-0.678621411324,-0.327040165663,-0.657660841942],
-                        [-0.700865805149,-0.256401896477,-0.665616393089],
-                        [-0.733673810959,-0.298754066229,-0.610302150249],
-                        [-0.520354926586,-0.44894811511,-0.726413309574],
-                        [-0.485873311758,-0.400663375854,-0.776785671711],
-                        [-0.553625464439,-0.378517180681,-0.74177056551],
-                        [-0.379529476166,-0.486395716667,-0.787004828453],
-                        [-0.346611320972,-0.436200261116,-0.830415487289],
-                        [-0.416404157877,-0.419940322638,-0.806385576725],
-                        [-0.450116455555,-0.352179646492,-0.820587992668],
-                        [-0.413926929235,-0.3044308424,-0.857896447182],
-                        [-0.480284929276,-0.284414708614,-0.829719662666],
-                        [-0.416404157877,-0.419940322638,-0.806385576725],
-                        [-0.450116455555,-0.352179646492,-0.820587992668],
-                        [-0.485873311758,-0.400663375854,-0.776785671711],
-                        [-0.627150595188,-0.171839639544,-0.759706020355],
-                        [-0.588087081909,-0.131048902869,-0.798110127449],
-                        [-0.643326640129,-0.108097285032,-0.757922053337],
-                        [-0.506734728813,-0.217834427953,-0.834127128124],
-                        [-0.468421578407,-0.174905076623,-0.866019308567],
-                        [-0.529480218887,-0.153434738517,-0.834331154823],
-                        [-0.548688352108,-0.091976031661,-0.830952167511],
-                        [-0.509656965733,-0.0549761541188,-0.858619451523],
-                        [-0.564633131027,-0.0339771322906,-0.82464236021],
-                        [-0.529480218887,-0.153434738517,-0.834331154823],
-                        [-0.548688352108,-0.091976031661,-0.830952167511],
-                        [-0.588087081909,-0.131048902869,-0.798110127449],
-                        [-0.553625464439,-0.378517180681,-0.74177056551],
-                        [-0.582528710365,-0.308011889458,-0.752189457417],
-                        [-0.618283927441,-0.353819847107,-0.701809465885],
-                        [-0.480284929276,-0.284414708614,-0.829719662666],
-                        [-0.506734728813,-0.217834427953,-0.834127128124],
-                        [-0.545040607452,-0.26241543889,-0.796284377575],
-                        [-0.606988489628,-0.238753452897,-0.757998526096],
-                        [-0.627150595188,-0.171839639544,-0.759706020355],
-                        [-0.665048420429,-0.213841319084,-0.715529501438],
-                        [-0.545040607452,-0.26241543889,-0.796284377575],
-                        [-0.606988489628,-0.238753452897,-0.757998526096],
-                        [-0.582528710365,-0.308011889458,-0.752189457417],
-                        [-0.486395716667,-0.787004828453,-0.379529476166],
-                        [-0.535965919495,-0.737060189247,-0.411682873964],
-                        [-0.550243675709,-0.762617051601,-0.340069264174],
-                        [-0.44894811511,-0.726413309574,-0.520354926586],
-                        [-0.495975226164,-0.669751524925,-0.552667617798],
-                        [-0.517854511738,-0.706037700176,-0.483050197363],
-                        [-0.58378881216,-0.680853009224,-0.44230055809],
-                        [-0.628728508949,-0.619044244289,-0.470621615648],
-                        [-0.645450055599,-0.65135627985,-0.398910075426],
-                        [-0.517854511738,-0.706037700176,-0.483050197363],
-                        [-0.58378881216,-0.680853009224,-0.44230055809],
-                        [-0.535965919495,-0.737060189247,-0.411682873964],
-                        [-0.398910075426,-0.645450055599,-0.65135627985],
-                        [-0.44230055809,-0.58378881216,-0.680853009224],
-                        [-0.470621615648,-0.628728508949,-0.619044244289],
-                        [-0.340069264174,-0.550243675709,-0.762617051601],
-                        [-0.379529476166,-0.486395716667,-0.787004828453],
-                        [-0.411682873964,-0.535965919495,-0.737060189247],
-                        [-0.483050197363,-0.517854511738,-0.706037700176],
-                        [-0.520354926586,-0.44894811511,-0.726413309574],
-                        [-0.552667617798,-0.495975226164,-0.669751524925],
-                        [-0.411682873964,-0.535965919495,-0.737060189247],
-                        [-0.483050197363,-0.517854511738,-0.706037700176],
-                        [-0.44230055809,-0.58378881216,-0.680853009224],
-                        [-0.669751524925,-0.552667617798,-0.495975226164],
-                        [-0.706037700176,-0.483050197363,-0.517854511738],
-                        [-0.726413309574,-0.520354926586,-0.44894811511],
-                        [-0.619044244289,-0.470621615648,-0.628728508949],
-                        [-0.65135627985,-0.398910075426,-0.645450055599],
-                        [-0.680853009224,-0.44230055809,-0.58378881216],
-                        [-0.737060189247,-0.411682873964,-0.535965919495],
-                        [-0.762617051601,-0.340069264174,-0.550243675709],
-                        [-0.787004828453,-0.379529476166,-0.486395716667],
-                        [-0.680853009224,-0.44230055809,-0.58378881216],
-                        [-0.737060189247,-0.411682873964,-0.535965919495],
-                        [-0.706037700176,-0.483050197363,-0.517854511738],
-                        [-0.470621615648,-0.628728508949,-0.619044244289],
-                        [-0.540649950504,-0.607478022575,-0.581951975822],
-                        [-0.495975226164,-0.669751524925,-0.552667617798],
-                        [-0.552667617798,-0.495975226164,-0.669751524925],
-                        [-0.619044244289,-0.470621615648,-0.628728508949],
-                        [-0.581951975822,-0.540649950504,-0.607478022575],
-                        [-0.607478022575,-0.581951975822,-0.540649950504],
-                        [-0.669751524925,-0.552667617798,-0.495975226164],
-                        [-0.628728508949,-0.619044244289,-0.470621615648],
-                        [-0.581951975822,-0.540649950504,-0.607478022575],
-                        [-0.607478022575,-0.581951975822,-0.540649950504],
-                        [-0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.0549761541188,-0.858619451523,-0.509656965733],
-                        [0.091976031661,-0.830952167511,-0.548688352108],
-                        [0.0339771322906,-0.82464236021,-0.564633131027],
-                        [0.174905076623,-0.866019308567,-0.468421578407],
-                        [0.217834427953,-0.834127128124,-0.506734728813],
-                        [0.153434738517,-0.834331154823,-0.529480218887],
-                        [0.131048902869,-0.798110127449,-0.588087081909],
-                        [0.171839639544,-0.759706020355,-0.627150595188],
-                        [0.108097285032,-0.757922053337,-0.643326640129],
-                        [0.153434738517,-0.834331154823,-0.529480218887],
-                        [0.131048902869,-0.798110127449,-0.588087081909],
-                        [0.091976031661,-0.830952167511,-0.548688352108],
-                        [0.3044308424,-0.857896447182,-0.413926929235],
-                        [0.352179646492,-0.820587992668,-0.450116455555],
-                        [0.284414708614,-0.829719662666,-0.480284929276],
-                        [0.436200261116,-0.830415487289,-0.346611320972],
-                        [0.486395716667,-0.787004828453,-0.379529476166],
-                        [0.419940322638,-0.806385576725,-0.416404157877],
-                        [0.400663375854,-0.776785671711,-0.485873311758],
-                        [0.44894811511,-0.726413309574,-0.520354926586],
-                        [0.378517180681,-0.74177056551,-0.553625464439],
-                        [0.419940322638,-0.806385576725,-0.416404157877],
-                        [0.400663375854,-0.776785671711,-0.485873311758],
-                        [0.352179646492,-0.820587992668,-0.450116455555],
-                        [0.213841319084,-0.715529501438,-0.665048420429],
-                        [0.256401896477,-0.665616393089,-0.700865805149],
-                        [0.188148602843,-0.669747889042,-0.718357801437],
-                        [0.353819847107,-0.701809465885,-0.618283927441],
-                        [0.398910075426,-0.645450055599,-0.65135627985],
-                        [0.327040165663,-0.657660841942,-0.678621411324],
-                        [0.298754066229,-0.610302150249,-0.733673810959],
-                        [0.340069264174,-0.550243675709,-0.762617051601],
-                        [0.269586592913,-0.560828924179,-0.782811582088],
-                        [0.327040165663,-0.657660841942,-0.678621411324],
-                        [0.298754066229,-0.610302150249,-0.733673810959],
-                        [0.256401896477,-0.665616393089,-0.700865805149],
-                        [0.284414708614,-0.829719662666,-0.480284929276],
-                        [0.26241543889,-0.796284377575,-0.545040607452],
-                        [0.217834427953,-0.834127128124,-0.506734728813],
-                        [0.378517180681,-0.74177056551,-0.553625464439],
-                        [0.353819847107,-0.701809465885,-0.618283927441],
-                        [0.308011889458,-0.752189457417,-0.582528710365],
-                        [0.238753452897,-0.757998526096,-0.606988489628],
-                        [0.213841319084,-0.715529501438,-0.665048420429],
-                        [0.171839639544,-0.759706020355,-0.627150595188],
-                        [0.308011889458,-0.752189457417,-0.582528710365],
-                        [0.238753452897,-0.757998526096,-0.606988489628],
-                        [0.26241543889,-0.796284377575,-0.545040607452],
-                        [0.560828924179,-0.782811582088,-0.269586592913],
-                        [0.610302150249,-0.733673810959,-0.298754066229],
-                        [0.550243675709,-0.762617051601,-0.340069264174],
-                        [0.669747889042,-0.718357801437,-0.188148602843],
-                        [0.715529501438,-0.665048420429,-0.213841319084],
-                        [0.665616393089,-0.700865805149,-0.256401896477],
-                        [0.657660841942,-0.678621411324,-0.327040165663],
-                        [0.701809465885,-0.618283927441,-0.353819847107],
-                        [0.645450055599,-0.65135627985,-0.398910075426],
-                        [0.665616393089,-0.700865805149,-0.256401896477],
-                        [0.657660841942,-0.678621411324,-0.327040165663],
-                        [0.610302150249,-0.733673810959,-0.298754066229],
-                        [0.757922053337,-0.643326640129,-0.108097285032],
-                        [0.798110127449,-0.588087081909,-0.131048902869],
-                        [0.759706020355,-0.627150595188,-0.171839639544],
-                        [0.82464236021,-0.564633131027,-0.0339771322906],
-                        [0.858619451523,-0.509656965733,-0.0549761541188],
-                        [0.830952167511,-0.548688352108,-0.091976031661],
-                        [0.834331154823,-0.529480218887,-0.153434738517],
-                        [0.866019308567,-0.468421578407,-0.174905076623],
-                        [0.834127128124,-0.506734728813,-0.217834427953],
-                        [0.830952167511,-0.548688352108,-0.091976031661],
-                        [0.834331154823,-0.529480218887,-0.153434738517],
-                        [0.798110127449,-0.588087081909,-0.131048902869],
-                        [0.74177056551,-0.553625464439,-0.378517180681],
-                        [0.776785671711,-0.485873311758,-0.400663375854],
-                        [0.726413309574,-0.520354926586,-0.44894811511],
-                        [0.829719662666,-0.480284929276,-0.284414708614],
-                        [0.857896447182,-0.413926929235,-0.3044308424],
-                        [0.820587992668,-0.450116455555,-0.352179646492],
-                        [0.806385576725,-0.416404157877,-0.419940322638],
-                        [0.830415487289,-0.346611320972,-0.436200261116],
-                        [0.787004828453,-0.379529476166,-0.486395716667],
-                        [0.820587992668,-0.450116455555,-0.352179646492],
-                        [0.806385576725,-0.416404157877,-0.419940322638],
-                        [0.776785671711,-0.485873311758,-0.400663375854],
-                        [0.759706020355,-0.627150595188,-0.171839639544],
-                        [0.757998526096,-0.606988489628,-0.238753452897],
-                        [0.715529501438,-0.665048420429,-0.213841319084],
-                        [0.834127128124,-0.506734728813,-0.217834427953],
-                        [0.829719662666,-0.480284929276,-0.284414708614],
-                        [0.796284377575,-0.545040607452,-0.26241543889],
-                        [0.752189457417,-0.582528710365,-0.308011889458],
-                        [0.74177056551,-0.553625464439,-0.378517180681],
-                        [0.701809465885,-0.618283927441,-0.353819847107],
-                        [0.796284377575,-0.545040607452,-0.26241543889],
-                        [0.752189457417,-0.582528710365,-0.308011889458],
-                        [0.757998526096,-0.606988489628,-0.238753452897],
-                        [0.379529476166,-0.486395716667,-0.787004828453],
-                        [0.416404157877,-0.419940322638,-0.806385576725],
-                        [0.346611320972,-0.436200261116,-0.830415487289],
-                        [0.520354926586,-0.44894811511,-0.726413309574],
-                        [0.553625464439,-0.378517180681,-0.74177056551],
-                        [0.485873311758,-0.400663375854,-0.776785671711],
-                        [0.450116455555,-0.352179646492,-0.820587992668],
-                        [0.480284929276,-0.284414708614,-0.829719662666],
-                        [0.413926929235,-0.3044308424,-0.857896447182],
-                        [0.485873311758,-0.400663375854,-0.776785671711],
-                        [0.450116455555,-0.352179646492,-0.820587992668],
-                        [0.416404157877,-0.419940322638,-0.806385576725],
-                        [0.65135627985,-0.398910075426,-0.645450055599],
-                        [0.678621411324,-0.327040165663,-0.657660841942],
-                        [0.618283927441,-0.353819847107,-0.701809465885],
-                        [0.762617051601,-0.340069264174,-0.550243675709],
-                        [0.782811582088,-0.269586592913,-0.560828924179],
-                        [0.733673810959,-0.298754066229,-0.610302150249],
-                        [0.700865805149,-0.256401896477,-0.665616393089],
-                        [0.718357801437,-0.188148602843,-0.669747889042],
-                        [0.665048420429,-0.213841319084,-0.715529501438],
-                        [0.733673810959,-0.298754066229,-0.610302150249],
-                        [0.700865805149,-0.256401896477,-0.665616393089],
-                        [0.678621411324,-0.327040165663,-0.657660841942],
-                        [0.506734728813,-0.217834427953,-0.834127128124],
-                        [0.529480218887,-0.153434738517,-0.834331154823],
-                        [0.468421578407,-0.174905076623,-0.866019308567],
-                        [0.627150595188,-0.171839639544,-0.759706020355],
-                        [0.643326640129,-0.108097285032,-0.757922053337],
-                        [0.588087081909,-0.131048902869,-0.798110127449],
-                        [0.548688352108,-0.091976031661,-0.830952167511],
-                        [0.564633131027,-0.0339771322906,-0.82464236021],
-                        [0.509656965733,-0.0549761541188,-0.858619451523],
-                        [0.588087081909,-0.131048902869,-0.798110127449],
-                        [0.548688352108,-0.091976031661,-0.830952167511],
-                        [0.529480218887,-0.153434738517,-0.834331154823],
-                        [0.618283927441,-0.353819847107,-0.701809465885],
-                        [0.582528710365,-0.308011889458,-0.752189457417],
-                        [0.553625464439,-0.378517180681,-0.74177056551],
-                        [0.665048420429,-0.213841319084,-0.715529501438],
-                        [0.627150595188,-0.171839639544,-0.759706020355],
-                        [0.606988489628,-0.238753452897,-0.757998526096],
-                        [0.545040607452,-0.26241543889,-0.796284377575],
-                        [0.506734728813,-0.217834427953,-0.834127128124],
-                        [0.480284929276,-0.284414708614,-0.829719662666],
-                        [0.606988489628,-0.238753452897,-0.757998526096],
-                        [0.545040607452,-0.26241543889,-0.796284377575],
-                        [0.582528710365,-0.308011889458,-0.752189457417],
-                        [0.550243675709,-0.762617051601,-0.340069264174],
-                        [0.535965919495,-0.737060189247,-0.411682873964],
-                        [0.486395716667,-0.787004828453,-0.379529476166],
-                        [0.645450055599,-0.65135627985,-0.398910075426],
-                        [0.628728508949,-0.619044244289,-0.470621615648],
-                        [0.58378881216,-0.680853009224,-0.44230055809],
-                        [0.517854511738,-0.706037700176,-0.483050197363],
-                        [0.495975226164,-0.669751524925,-0.552667617798],
-                        [0.44894811511,-0.726413309574,-0.520354926586],
-                        [0.58378881216,-0.680853009224,-0.44230055809],
-                        [0.517854511738,-0.706037700176,-0.483050197363],
-                        [0.535965919495,-0.737060189247,-0.411682873964],
-                        [0.726413309574,-0.520354926586,-0.44894811511],
-                        [0.706037700176,-0.483050197363,-0.517854511738],
-                        [0.669751524925,-0.552667617798,-0.495975226164],
-                        [0.787004828453,-0.379529476166,-0.486395716667],
-                        [0.762617051601,-0.340069264174,-0.550243675709],
-                        [0.737060189247,-0.411682873964,-0.535965919495],
-                        [0.680853009224,-0.44230055809,-0.58378881216],
-                        [0.65135627985,-0.398910075426,-0.645450055599],
-                        [0.619044244289,-0.470621615648,-0.628728508949],
-                        [0.737060189247,-0.411682873964,-0.535965919495],
-                        [0.680853009224,-0.44230055809,-0.58378881216],
-                        [0.706037700176,-0.483050197363,-0.517854511738],
-                        [0.470621615648,-0.628728508949,-0.619044244289],
-                        [0.44230055809,-0.58378881216,-0.680853009224],
-                        [0.398910075426,-0.645450055599,-0.65135627985],
-                        [0.552667617798,-0.495975226164,-0.669751524925],
-                        [0.520354926586,-0.44894811511,-0.726413309574],
-                        [0.483050197363,-0.517854511738,-0.706037700176],
-                        [0.411682873964,-0.535965919495,-0.737060189247],
-                        [0.379529476166,-0.486395716667,-0.787004828453],
-                        [0.340069264174,-0.550243675709,-0.762617051601],
-                        [0.483050197363,-0.517854511738,-0.706037700176],
-                        [0.411682873964,-0.535965919495,-0.737060189247],
-                        [0.44230055809,-0.58378881216,-0.680853009224],
-                        [0.669751524925,-0.552667617798,-0.495975226164],
-                        [0.607478022575,-0.581951975822,-0.540649950504],
-                        [0.628728508949,-0.619044244289,-0.470621615648],
-                        [0.619044244289,-0.470621615648,-0.628728508949],
-                        [0.552667617798,-0.495975226164,-0.669751524925],
-                        [0.581951975822,-0.540649950504,-0.607478022575],
-                        [0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.470621615648,-0.628728508949,-0.619044244289],
-                        [0.495975226164,-0.669751524925,-0.552667617798],
-                        [0.581951975822,-0.540649950504,-0.607478022575],
-                        [0.540649950504,-0.607478022575,-0.581951975822],
-                        [0.607478022575,-0.581951975822,-0.540649950504],
-                        [0.475679844618,0.0,-0.8796184659],
-                        [0.456712335348,-0.0568443164229,-0.887796461582],
-                        [0.509656965733,-0.0549761541188,-0.858619451523],
-                        [0.360324263573,0.0,-0.932827115059],
-                        [0.334895044565,-0.0602079555392,-0.940329909325],
-                        [0.398431301117,-0.0586068555713,-0.915323853493],
-                        [0.434652328491,-0.117213711143,-0.892938017845],
-                        [0.409316182137,-0.180623859167,-0.894335091114],
-                        [0.468421578407,-0.174905076623,-0.866019308567],
-                        [0.398431301117,-0.0586068555713,-0.915323853493],
-                        [0.434652328491,-0.117213711143,-0.892938017845],
-                        [0.456712335348,-0.0568443164229,-0.887796461582],
-                        [0.225778326392,0.0,-0.974178731441],
-                        [0.193714544177,-0.0626873448491,-0.979053080082],
-                        [0.266443610191,-0.0615878328681,-0.961880862713],
-                        [0.0770247355103,0.0,-0.997029185295],
-                        [0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [0.117650069296,-0.0634539350867,-0.991025745869],
-                        [0.158833146095,-0.128498718143,-0.978907585144],
-                        [0.121444880962,-0.196501940489,-0.97295331955],
-                        [0.199805602431,-0.193975359201,-0.960443258286],
-                        [0.117650069296,-0.0634539350867,-0.991025745869],
-                        [0.158833146095,-0.128498718143,-0.978907585144],
-                        [0.193714544177,-0.0626873448491,-0.979053080082],
-                        [0.380633711815,-0.246351331472,-0.891307473183],
-                        [0.348686188459,-0.313436716795,-0.883275330067],
-                        [0.413926929235,-0.3044308424,-0.857896447182],
-                        [0.239766731858,-0.258633822203,-0.935745954514],
-                        [0.202408134937,-0.327503234148,-0.922915279865],
-                        [0.277958005667,-0.321246802807,-0.905284404755],
-                        [0.313733518124,-0.380723625422,-0.869839549065],
-                        [0.276221334934,-0.446935534477,-0.85085272789],
-                        [0.346611320972,-0.436200261116,-0.830415487289],
-                        [0.277958005667,-0.321246802807,-0.905284404755],
-                        [0.313733518124,-0.380723625422,-0.869839549065],
-                        [0.348686188459,-0.313436716795,-0.883275330067],
-                        [0.266443610191,-0.0615878328681,-0.961880862713],
-                        [0.306287169456,-0.123895764351,-0.943842172623],
-                        [0.334895044565,-0.0602079555392,-0.940329909325],
-                        [0.199805602431,-0.193975359201,-0.960443258286],
-                        [0.239766731858,-0.258633822203,-0.935745954514],
-                        [0.274516820908,-0.190361812711,-0.942551255226],
-                        [0.34457308054,-0.185843646526,-0.920180141926],
-                        [0.380633711815,-0.246351331472,-0.891307473183],
-                        [0.409316182137,-0.180623859167,-0.894335091114],
-                        [0.274516820908,-0.190361812711,-0.942551255226],
-                        [0.34457308054,-0.185843646526,-0.920180141926],
-                        [0.306287169456,-0.123895764351,-0.943842172623],
-                        [-0.0770247355103,0.0,-0.997029185295],
-                        [-0.117650069296,-0.0634539350867,-0.991025745869],
-                        [-0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [-0.225778326392,0.0,-0.974178731441],
-                        [-0.266443610191,-0.0615878328681,-0.961880862713],
-                        [-0.193714544177,-0.0626873448491,-0.979053080082],
-                        [-0.158833146095,-0.128498718143,-0.978907585144],
-                        [-0.199805602431,-0.193975359201,-0.960443258286],
-                        [-0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.193714544177,-0.0626873448491,-0.979053080082],
-                        [-0.158833146095,-0.128498718143,-0.978907585144],
-                        [-0.117650069296,-0.0634539350867,-0.991025745869],
-                        [-0.360324263573,0.0,-0.932827115059],
-                        [-0.398431301117,-0.0586068555713,-0.915323853493],
-                        [-0.334895044565,-0.0602079555392,-0.940329909325],
-                        [-0.475679844618,0.0,-0.8796184659],
-                        [-0.509656965733,-0.0549761541188,-0.858619451523],
-                        [-0.456712335348,-0.0568443164229,-0.887796461582],
-                        [-0.434652328491,-0.117213711143,-0.892938017845],
-                        [-0.468421578407,-0.174905076623,-0.866019308567],
-                        [-0.409316182137,-0.180623859167,-0.894335091114],
-                        [-0.456712335348,-0.0568443164229,-0.887796461582],
-                        [-0.434652328491,-0.117213711143,-0.892938017845],
-                        [-0.398431301117,-0.0586068555713,-0.915323853493],
-                        [-0.239766731858,-0.258633822203,-0.935745954514],
-                        [-0.277958005667,-0.321246802807,-0.905284404755],
-                        [-0.202408134937,-0.327503234148,-0.922915279865],
-                        [-0.380633711815,-0.246351331472,-0.891307473183],
-                        [-0.413926929235,-0.3044308424,-0.857896447182],
-                        [-0.348686188459,-0.313436716795,-0.883275330067],
-                        [-0.313733518124,-0.380723625422,-0.869839549065],
-                        [-0.346611320972,-0.436200261116,-0.830415487289],
-                        [-0.276221334934,-0.446935534477,-0.85085272789],
-                        [-0.348686188459,-0.313436716795,-0.883275330067],
-                        [-0.313733518124,-0.380723625422,-0.869839549065],
-                        [-0.277958005667,-0.321246802807,-0.905284404755],
-                        [-0.334895044565,-0.0602079555392,-0.940329909325],
-                        [-0.306287169456,-0.123895764351,-0.943842172623],
-                        [-0.266443610191,-0.0615878328681,-0.961880862713],
-                        [-0.409316182137,-0.180623859167,-0.894335091114],
-                        [-0.380633711815,-0.246351331472,-0.891307473183],
-                        [-0.34457308054,-0.185843646526,-0.920180141926],
-                        [-0.274516820908,-0.190361812711,-0.942551255226],
-                        [-0.239766731858,-0.258633822203,-0.935745954514],
-                        [-0.199805602431,-0.193975359201,-0.960443258286],
-                        [-0.34457308054,-0.185843646526,-0.920180141926],
-                        [-0.274516820908,-0.190361812711,-0.942551255226],
-                        [-0.306287169456,-0.123895764351,-0.943842172623],
-                        [0.236761152744,-0.510783493519,-0.826465010643],
-                        [0.196083456278,-0.571085453033,-0.797127783298],
-                        [0.269586592913,-0.560828924179,-0.782811582088],
-                        [0.0809632539749,-0.524005174637,-0.847858190536],
-                        [0.0399611219764,-0.581926107407,-0.81225925684],
-                        [0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.154971644282,-0.62687343359,-0.763553202152],
-                        [0.114190116525,-0.677466154099,-0.726636230946],
-                        [0.188148602843,-0.669747889042,-0.718357801437],
-                        [0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.154971644282,-0.62687343359,-0.763553202152],
-                        [0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.0809632539749,-0.524005174637,-0.847858190536],
-                        [-0.119124859571,-0.578244268894,-0.807120084763],
-                        [-0.0399611219764,-0.581926107407,-0.81225925684],
-                        [-0.236761152744,-0.510783493519,-0.826465010643],
-                        [-0.269586592913,-0.560828924179,-0.782811582088],
-                        [-0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.154971644282,-0.62687343359,-0.763553202152],
-                        [-0.188148602843,-0.669747889042,-0.718357801437],
-                        [-0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.196083456278,-0.571085453033,-0.797127783298],
-                        [-0.154971644282,-0.62687343359,-0.763553202152],
-                        [-0.119124859571,-0.578244268894,-0.807120084763],
-                        [0.0744211226702,-0.722495436668,-0.687358558178],
-                        [0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.0744211226702,-0.722495436668,-0.687358558178],
-                        [-0.108097285032,-0.757922053337,-0.643326640129],
-                        [-0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.0,-0.79582041502,-0.605532705784],
-                        [-0.0339771322906,-0.82464236021,-0.564633131027],
-                        [0.0339771322906,-0.82464236021,-0.564633131027],
-                        [-0.0362210273743,-0.761889100075,-0.646693944931],
-                        [0.0,-0.79582041502,-0.605532705784],
-                        [0.0362210273743,-0.761889100075,-0.646693944931],
-                        [-0.0399611219764,-0.581926107407,-0.81225925684],
-                        [0.0,-0.634539365768,-0.772890508175],
-                        [0.0399611219764,-0.581926107407,-0.81225925684],
-                        [-0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.0744211226702,-0.722495436668,-0.687358558178],
-                        [-0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0744211226702,-0.722495436668,-0.687358558178],
-                        [0.114190116525,-0.677466154099,-0.726636230946],
-                        [-0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0382858961821,-0.68142670393,-0.730884253979],
-                        [0.0,-0.634539365768,-0.772890508175],
-                        [-0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [0.0,-0.130150929093,-0.991494178772],
-                        [0.0394601933658,-0.0638479366899,-0.997179210186],
-                        [-0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.0820460245013,-0.265506535769,-0.960611641407],
-                        [-0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0820460245013,-0.265506535769,-0.960611641407],
-                        [0.121444880962,-0.196501940489,-0.97295331955],
-                        [-0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0407496243715,-0.197802826762,-0.979394435883],
-                        [0.0,-0.130150929093,-0.991494178772],
-                        [-0.202408134937,-0.327503234148,-0.922915279865],
-                        [-0.162998497486,-0.395605653524,-0.903840482235],
-                        [-0.123069040477,-0.33188316226,-0.935258030891],
-                        [-0.276221334934,-0.446935534477,-0.85085272789],
-                        [-0.236761152744,-0.510783493519,-0.826465010643],
-                        [-0.20109423995,-0.455528259277,-0.867211103439],
-                        [-0.122248865664,-0.461539924145,-0.878655850887],
-                        [-0.0809632539749,-0.524005174637,-0.847858190536],
-                        [-0.0410230122507,-0.464636415243,-0.88455080986],
-                        [-0.20109423995,-0.455528259277,-0.867211103439],
-                        [-0.122248865664,-0.461539924145,-0.878655850887],
-                        [-0.162998497486,-0.395605653524,-0.903840482235],
-                        [0.123069040477,-0.33188316226,-0.935258030891],
-                        [0.162998497486,-0.395605653524,-0.903840482235],
-                        [0.202408134937,-0.327503234148,-0.922915279865],
-                        [0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0809632539749,-0.524005174637,-0.847858190536],
-                        [0.122248865664,-0.461539924145,-0.878655850887],
-                        [0.20109423995,-0.455528259277,-0.867211103439],
-                        [0.236761152744,-0.510783493519,-0.826465010643],
-                        [0.276221334934,-0.446935534477,-0.85085272789],
-                        [0.122248865664,-0.461539924145,-0.878655850887],
-                        [0.20109423995,-0.455528259277,-0.867211103439],
-                        [0.162998497486,-0.395605653524,-0.903840482235],
-                        [-0.123069040477,-0.33188316226,-0.935258030891],
-                        [-0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.0820460245013,-0.265506535769,-0.960611641407],
-                        [-0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0410230122507,-0.464636415243,-0.88455080986],
-                        [0.0,-0.400968074799,-0.916092038155],
-                        [0.04130198434,-0.334140062332,-0.941618084908],
-                        [0.123069040477,-0.33188316226,-0.935258030891],
-                        [0.0820460245013,-0.265506535769,-0.960611641407],
-                        [0.0,-0.400968074799,-0.916092038155],
-                        [0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.04130198434,-0.334140062332,-0.941618084908],
-                        [-0.8796184659,-0.475679844618,0.0],
-                        [-0.887796461582,-0.456712335348,-0.0568443164229],
-                        [-0.858619451523,-0.509656965733,-0.0549761541188],
-                        [-0.932827115059,-0.360324263573,0.0],
-                        [-0.940329909325,-0.334895044565,-0.0602079555392],
-                        [-0.915323853493,-0.398431301117,-0.0586068555713],
-                        [-0.892938017845,-0.434652328491,-0.117213711143],
-                        [-0.894335091114,-0.409316182137,-0.180623859167],
-                        [-0.866019308567,-0.468421578407,-0.174905076623],
-                        [-0.915323853493,-0.398431301117,-0.0586068555713],
-                        [-0.892938017845,-0.434652328491,-0.117213711143],
-                        [-0.887796461582,-0.456712335348,-0.0568443164229],
-                        [-0.974178731441,-0.225778326392,0.0],
-                        [-0.979053080082,-0.193714544177,-0.0626873448491],
-                        [-0.961880862713,-0.266443610191,-0.0615878328681],
-                        [-0.997029185295,-0.0770247355103,0.0],
-                        [-0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [-0.991025745869,-0.117650069296,-0.0634539350867],
-                        [-0.978907585144,-0.158833146095,-0.128498718143],
-                        [-0.97295331955,-0.121444880962,-0.196501940489],
-                        [-0.960443258286,-0.199805602431,-0.193975359201],
-                        [-0.991025745869,-0.117650069296,-0.0634539350867],
-                        [-0.978907585144,-0.158833146095,-0.128498718143],
-                        [-0.979053080082,-0.193714544177,-0.0626873448491],
-                        [-0.891307473183,-0.380633711815,-0.246351331472],
-                        [-0.883275330067,-0.348686188459,-0.313436716795],
-                        [-0.857896447182,-0.413926929235,-0.3044308424],
-                        [-0.935745954514,-0.239766731858,-0.258633822203],
-                        [-0.922915279865,-0.202408134937,-0.327503234148],
-                        [-0.905284404755,-0.277958005667,-0.321246802807],
-                        [-0.869839549065,-0.313733518124,-0.380723625422],
-                        [-0.85085272789,-0.276221334934,-0.446935534477],
-                        [-0.830415487289,-0.346611320972,-0.436200261116],
-                        [-0.905284404755,-0.277958005667,-0.321246802807],
-                        [-0.869839549065,-0.313733518124,-0.380723625422],
-                        [-0.883275330067,-0.348686188459,-0.313436716795],
-                        [-0.961880862713,-0.266443610191,-0.0615878328681],
-                        [-0.943842172623,-0.306287169456,-0.123895764351],
-                        [-0.940329909325,-0.334895044565,-0.0602079555392],
-                        [-0.960443258286,-0.199805602431,-0.193975359201],
-                        [-0.935745954514,-0.239766731858,-0.258633822203],
-                        [-0.942551255226,-0.274516820908,-0.190361812711],
-                        [-0.920180141926,-0.34457308054,-0.185843646526],
-                        [-0.891307473183,-0.380633711815,-0.246351331472],
-                        [-0.894335091114,-0.409316182137,-0.180623859167],
-                        [-0.942551255226,-0.274516820908,-0.190361812711],
-                        [-0.920180141926,-0.34457308054,-0.185843646526],
-                        [-0.943842172623,-0.306287169456,-0.123895764351],
-                        [-0.997029185295,0.0770247355103,0.0],
-                        [-0.991025745869,0.117650069296,-0.0634539350867],
-                        [-0.997179210186,0.0394601933658,-0.0638479366899],
-                        [-0.974178731441,0.225778326392,0.0],
-                        [-0.961880862713,0.266443610191,-0.0615878328681],
-                        [-0.979053080082,0.193714544177,-0.0626873448491],
-                        [-0.978907585144,0.158833146095,-0.128498718143],
-                        [-0.960443258286,0.199805602431,-0.193975359201],
-                        [-0.97295331955,0.121444880962,-0.196501940489],
-                        [-0.979053080082,0.193714544177,-0.0626873448491],
-                        [-0.978907585144,0.158833146095,-0.128498718143],
-                        [-0.991025745869,0.117650069296,-0.0634539350867],
-                        [-0.932827115059,0.360324263573,0.0],
-                        [-0.915323853493,0.398431301117,-0.0586068555713],
-                        [-0.940329909325,0.334895044565,-0.0602079555392],
-                        [-0.8796184659,0.475679844618,0.0],
-                        [-0.858619451523,0.509656965733,-0.0549761541188],
-                        [-0.887796461582,0.456712335348,-0.0568443164229],
-                        [-0.892938017845,0.434652328491,-0.117213711143],
-                        [-0.866019308567,0.468421578407,-0.174905076623],
-                        [-0.894335091114,0.409316182137,-0.180623859167],
-                        [-0.887796461582,0.456712335348,-0.0568443164229],
-                        [-0.892938017845,0.434652328491,-0.117213711143],
-                        [-0.915323853493,0.398431301117,-0.0586068555713],
-                        [-0.935745954514,0.239766731858,-0.258633822203],
-                        [-0.905284404755,0.277958005667,-0.321246802807],
-                        [-0.922915279865,0.202408134937,-0.327503234148],
-                        [-0.891307473183,0.380633711815,-0.246351331472],
-                        [-0.857896447182,0.413926929235,-0.3044308424],
-                        [-0.883275330067,0.348686188459,-0.313436716795],
-                        [-0.869839549065,0.313733518124,-0.380723625422],
-                        [-0.830415487289,0.346611320972,-0.436200261116],
-                        [-0.85085272789,0.276221334934,-0.446935534477],
-                        [-0.883275330067,0.348686188459,-0.313436716795],
-                        [-0.869839549065,0.313733518124,-0.380723625422],
-                        [-0.905284404755,0.277958005667,-0.321246802807],
-                        [-0.940329909325,0.334895044565,-0.0602079555392],
-                        [-0.943842172623,0.306287169456,-0.123895764351],
-                        [-0.961880862713,0.266443610191,-0.0615878328681],
-                        [-0.894335091114,0.409316182137,-0.180623859167],
-                        [-0.891307473183,0.380633711815,-0.246351331472],
-                        [-0.920180141926,0.34457308054,-0.185843646526],
-                        [-0.942551255226,0.274516820908,-0.190361812711],
-                        [-0.935745954514,0.239766731858,-0.258633822203],
-                        [-0.960443258286,0.199805602431,-0.193975359201],
-                        [-0.920180141926,0.34457308054,-0.185843646526],
-                        [-0.942551255226,0.274516820908,-0.190361812711],
-                        [-0.943842172623,0.306287169456,-0.123895764351],
-                        [-0.826465010643,-0.236761152744,-0.510783493519],
-                        [-0.797127783298,-0.196083456278,-0.571085453033],
-                        [-0.782811582088,-0.269586592913,-0.560828924179],
-                        [-0.847858190536,-0.0809632539749,-0.524005174637],
-                        [-0.81225925684,-0.0399611219764,-0.581926107407],
-                        [-0.807120084763,-0.119124859571,-0.578244268894],
-                        [-0.763553202152,-0.154971644282,-0.62687343359],
-                        [-0.726636230946,-0.114190116525,-0.677466154099],
-                        [-0.718357801437,-0.188148602843,-0.669747889042],
-                        [-0.807120084763,-0.119124859571,-0.578244268894],
-                        [-0.763553202152,-0.154971644282,-0.62687343359],
-                        [-0.797127783298,-0.196083456278,-0.571085453033],
-                        [-0.847858190536,0.0809632539749,-0.524005174637],
-                        [-0.807120084763,0.119124859571,-0.578244268894],
-                        [-0.81225925684,0.0399611219764,-0.581926107407],
-                        [-0.826465010643,0.236761152744,-0.510783493519],
-                        [-0.782811582088,0.269586592913,-0.560828924179],
-                        [-0.797127783298,0.196083456278,-0.571085453033],
-                        [-0.763553202152,0.154971644282,-0.62687343359],
-                        [-0.718357801437,0.188148602843,-0.669747889042],
-                        [-0.726636230946,0.114190116525,-0.677466154099],
-                        [-0.797127783298,0.196083456278,-0.571085453033],
-                        [-0.763553202152,0.154971644282,-0.62687343359],
-                        [-0.807120084763,0.119124859571,-0.578244268894],
-                        [-0.687358558178,-0.0744211226702,-0.722495436668],
-                        [-0.646693944931,-0.0362210273743,-0.761889100075],
-                        [-0.643326640129,-0.108097285032,-0.757922053337],
-                        [-0.687358558178,0.0744211226702,-0.722495436668],
-                        [-0.643326640129,0.108097285032,-0.757922053337],
-                        [-0.646693944931,0.0362210273743,-0.761889100075],
-                        [-0.605532705784,0.0,-0.79582041502],
-                        [-0.564633131027,0.0339771322906,-0.82464236021],
-                        [-0.564633131027,-0.0339771322906,-0.82464236021],
-                        [-0.646693944931,0.0362210273743,-0.761889100075],
-                        [-0.605532705784,0.0,-0.79582041502],
-                        [-0.646693944931,-0.0362210273743,-0.761889100075],
-                        [-0.81225925684,0.0399611219764,-0.581926107407],
-                        [-0.772890508175,0.0,-0.634539365768],
-                        [-0.81225925684,-0.0399611219764,-0.581926107407],
-                        [-0.726636230946,0.114190116525,-0.677466154099],
-                        [-0.687358558178,0.0744211226702,-0.722495436668],
-                        [-0.730884253979,0.0382858961821,-0.68142670393],
-                        [-0.730884253979,-0.0382858961821,-0.68142670393],
-                        [-0.687358558178,-0.0744211226702,-0.722495436668],
-                        [-0.726636230946,-0.114190116525,-0.677466154099],
-                        [-0.730884253979,0.0382858961821,-0.68142670393],
-                        [-0.730884253979,-0.0382858961821,-0.68142670393],
-                        [-0.772890508175,0.0,-0.634539365768],
-                        [-0.997179210186,0.0394601933658,-0.0638479366899],
-                        [-0.991494178772,0.0,-0.130150929093],
-                        [-0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [-0.97295331955,0.121444880962,-0.196501940489],
-                        [-0.960611641407,0.0820460245013,-0.265506535769],
-                        [-0.979394435883,0.0407496243715,-0.197802826762],
-                        [-0.979394435883,-0.0407496243715,-0.197802826762],
-                        [-0.960611641407,-0.0820460245013,-0.265506535769],
-                        [-0.97295331955,-0.121444880962,-0.196501940489],
-                        [-0.979394435883,0.0407496243715,-0.197802826762],
-                        [-0.979394435883,-0.0407496243715,-0.197802826762],
-                        [-0.991494178772,0.0,-0.130150929093],
-                        [-0.922915279865,0.202408134937,-0.327503234148],
-                        [-0.903840482235,0.162998497486,-0.395605653524],
-                        [-0.935258030891,0.123069040477,-0.33188316226],
-                        [-0.85085272789,0.276221334934,-0.446935534477],
-                        [-0.826465010643,0.236761152744,-0.510783493519],
-                        [-0.867211103439,0.20109423995,-0.455528259277],
-                        [-0.878655850887,0.122248865664,-0.461539924145],
-                        [-0.847858190536,0.0809632539749,-0.524005174637],
-                        [-0.88455080986,0.0410230122507,-0.464636415243],
-                        [-0.867211103439,0.20109423995,-0.455528259277],
-                        [-0.878655850887,0.122248865664,-0.461539924145],
-                        [-0.903840482235,0.162998497486,-0.395605653524],
-                        [-0.935258030891,-0.123069040477,-0.33188316226],
-                        [-0.903840482235,-0.162998497486,-0.395605653524],
-                        [-0.922915279865,-0.202408134937,-0.327503234148],
-                        [-0.88455080986,-0.0410230122507,-0.464636415243],
-                        [-0.847858190536,-0.0809632539749,-0.524005174637],
-                        [-0.878655850887,-0.122248865664,-0.461539924145],
-                        [-0.867211103439,-0.20109423995,-0.455528259277],
-                        [-0.826465010643,-0.236761152744,-0.510783493519],
-                        [-0.85085272789,-0.276221334934,-0.446935534477],
-                        [-0.878655850887,-0.122248865664,-0.461539924145],
-                        [-0.867211103439,-0.20109423995,-0.455528259277],
-                        [-0.903840482235,-0.162998497486,-0.395605653524],
-                        [-0.935258030891,0.123069040477,-0.33188316226],
-                        [-0.941618084908,0.04130198434,-0.334140062332],
-                        [-0.960611641407,0.0820460245013,-0.265506535769],
-                        [-0.88455080986,0.0410230122507,-0.464636415243],
-                        [-0.88455080986,-0.0410230122507,-0.464636415243],
-                        [-0.916092038155,0.0,-0.400968074799],
-                        [-0.941618084908,-0.04130198434,-0.334140062332],
-                        [-0.935258030891,-0.123069040477,-0.33188316226],
-                        [-0.960611641407,-0.0820460245013,-0.265506535769],
-                        [-0.916092038155,0.0,-0.400968074799],
-                        [-0.941618084908,-0.04130198434,-0.334140062332],
-                        [-0.941618084908,0.04130198434,-0.334140062332],
-                        [-0.82464236021,0.564633131027,-0.0339771322906],
-                        [-0.830952167511,0.548688352108,-0.091976031661],
-                        [-0.858619451523,0.509656965733,-0.0549761541188],
-                        [-0.757922053337,0.643326640129,-0.108097285032],
-                        [-0.759706020355,0.627150595188,-0.171839639544],
-                        [-0.798110127449,0.588087081909,-0.131048902869],
-                        [-0.834331154823,0.529480218887,-0.153434738517],
-                        [-0.834127128124,0.506734728813,-0.217834427953],
-                        [-0.866019308567,0.468421578407,-0.174905076623],
-                        [-0.798110127449,0.588087081909,-0.131048902869],
-                        [-0.834331154823,0.529480218887,-0.153434738517],
-                        [-0.830952167511,0.548688352108,-0.091976031661],
-                        [-0.669747889042,0.718357801437,-0.188148602843],
-                        [-0.665616393089,0.700865805149,-0.256401896477],
-                        [-0.715529501438,0.665048420429,-0.213841319084],
-                        [-0.560828924179,0.782811582088,-0.269586592913],
-                        [-0.550243675709,0.762617051601,-0.340069264174],
-                        [-0.610302150249,0.733673810959,-0.298754066229],
-                        [-0.657660841942,0.678621411324,-0.327040165663],
-                        [-0.645450055599,0.65135627985,-0.398910075426],
-                        [-0.701809465885,0.618283927441,-0.353819847107],
-                        [-0.610302150249,0.733673810959,-0.298754066229],
-                        [-0.657660841942,0.678621411324,-0.327040165663],
-                        [-0.665616393089,0.700865805149,-0.256401896477],
-                        [-0.829719662666,0.480284929276,-0.284414708614],
-                        [-0.820587992668,0.450116455555,-0.352179646492],
-                        [-0.857896447182,0.413926929235,-0.3044308424],
-                        [-0.74177056551,0.553625464439,-0.378517180681],
-                        [-0.726413309574,0.520354926586,-0.44894811511],
-                        [-0.776785671711,0.485873311758,-0.400663375854],
-                        [-0.806385576725,0.416404157877,-0.419940322638],
-                        [-0.787004828453,0.379529476166,-0.486395716667],
-                        [-0.830415487289,0.346611320972,-0.436200261116],
-                        [-0.776785671711,0.485873311758,-0.400663375854],
-                        [-0.806385576725,0.416404157877,-0.419940322638],
-                        [-0.820587992668,0.450116455555,-0.352179646492],
-                        [-0.715529501438,0.665048420429,-0.213841319084],
-                        [-0.757998526096,0.606988489628,-0.238753452897],
-                        [-0.759706020355,0.627150595188,-0.171839639544],
-                        [-0.701809465885,0.618283927441,-0.353819847107],
-                        [-0.74177056551,0.553625464439,-0.378517180681],
-                        [-0.752189457417,0.582528710365,-0.308011889458],
-                        [-0.796284377575,0.545040607452,-0.26241543889],
-                        [-0.829719662666,0.480284929276,-0.284414708614],
-                        [-0.834127128124,0.506734728813,-0.217834427953],
-                        [-0.752189457417,0.582528710365,-0.308011889458],
-                        [-0.796284377575,0.545040607452,-0.26241543889],
-                        [-0.757998526096,0.606988489628,-0.238753452897],
-                        [-0.436200261116,0.830415487289,-0.346611320972],
-                        [-0.419940322638,0.806385576725,-0.416404157877],
-                        [-0.486395716667,0.787004828453,-0.379529476166],
-                        [-0.3044308424,0.857896447182,-0.413926929235],
-                        [-0.284414708614,0.829719662666,-0.480284929276],
-                        [-0.352179646492,0.820587992668,-0.450116455555],
-                        [-0.400663375854,0.776785671711,-0.485873311758],
-                        [-0.378517180681,0.74177056551,-0.553625464439],
-                        [-0.44894811511,0.726413309574,-0.520354926586],
-                        [-0.352179646492,0.820587992668,-0.450116455555],
-                        [-0.400663375854,0.776785671711,-0.485873311758],
-                        [-0.419940322638,0.806385576725,-0.416404157877],
-                        [-0.174905076623,0.866019308567,-0.468421578407],
-                        [-0.153434738517,0.834331154823,-0.529480218887],
-                        [-0.217834427953,0.834127128124,-0.506734728813],
-                        [-0.0549761541188,0.858619451523,-0.509656965733],
-                        [-0.0339771322906,0.82464236021,-0.564633131027],
-                        [-0.091976031661,0.830952167511,-0.548688352108],
-                        [-0.131048902869,0.798110127449,-0.588087081909],
-                        [-0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.171839639544,0.759706020355,-0.627150595188],
-                        [-0.091976031661,0.830952167511,-0.548688352108],
-                        [-0.131048902869,0.798110127449,-0.588087081909],
-                        [-0.153434738517,0.834331154823,-0.529480218887],
-                        [-0.353819847107,0.701809465885,-0.618283927441],
-                        [-0.327040165663,0.657660841942,-0.678621411324],
-                        [-0.398910075426,0.645450055599,-0.65135627985],
-                        [-0.213841319084,0.715529501438,-0.665048420429],
-                        [-0.188148602843,0.669747889042,-0.718357801437],
-                        [-0.256401896477,0.665616393089,-0.700865805149],
-                        [-0.298754066229,0.610302150249,-0.733673810959],
-                        [-0.269586592913,0.560828924179,-0.782811582088],
-                        [-0.340069264174,0.550243675709,-0.762617051601],
-                        [-0.256401896477,0.665616393089,-0.700865805149],
-                        [-0.298754066229,0.610302150249,-0.733673810959],
-                        [-0.327040165663,0.657660841942,-0.678621411324],
-                        [-0.217834427953,0.834127128124,-0.506734728813],
-                        [-0.26241543889,0.796284377575,-0.545040607452],
-                        [-0.284414708614,0.829719662666,-0.480284929276],
-                        [-0.171839639544,0.759706020355,-0.627150595188],
-                        [-0.213841319084,0.715529501438,-0.665048420429],
-                        [-0.238753452897,0.757998526096,-0.606988489628],
-                        [-0.308011889458,0.752189457417,-0.582528710365],
-                        [-0.353819847107,0.701809465885,-0.618283927441],
-                        [-0.378517180681,0.74177056551,-0.553625464439],
-                        [-0.238753452897,0.757998526096,-0.606988489628],
-                        [-0.308011889458,0.752189457417,-0.582528710365],
-                        [-0.26241543889,0.796284377575,-0.545040607452],
-                        [-0.762617051601,0.340069264174,-0.550243675709],
-                        [-0.733673810959,0.298754066229,-0.610302150249],
-                        [-0.782811582088,0.269586592913,-0.560828924179],
-                        [-0.65135627985,0.398910075426,-0.645450055599],
-                        [-0.618283927441,0.353819847107,-0.701809465885],
-                        [-0.678621411324,0.327040165663,-0.657660841942],
-                        [-0.700865805149,0.256401896477,-0.665616393089],
-                        [-0.665048420429,0.213841319084,-0.715529501438],
-                        [-0.718357801437,0.188148602843,-0.669747889042],
-                        [-0.678621411324,0.327040165663,-0.657660841942],
-                        [-0.700865805149,0.256401896477,-0.665616393089],
-                        [-0.733673810959,0.298754066229,-0.610302150249],
-                        [-0.520354926586,0.44894811511,-0.726413309574],
-                        [-0.485873311758,0.400663375854,-0.776785671711],
-                        [-0.553625464439,0.378517180681,-0.74177056551],
-                        [-0.379529476166,0.486395716667,-0.787004828453],
-                        [-0.346611320972,0.436200261116,-0.830415487289],
-                        [-0.416404157877,0.419940322638,-0.806385576725],
-                        [-0.450116455555,0.352179646492,-0.820587992668],
-                        [-0.413926929235,0.3044308424,-0.857896447182],
-                        [-0.480284929276,0.284414708614,-0.829719662666],
-                        [-0.416404157877,0.419940322638,-0.806385576725],
-                        [-0.450116455555,0.352179646492,-0.820587992668],
-                        [-0.485873311758,0.400663375854,-0.776785671711],
-                        [-0.627150595188,0.171839639544,-0.759706020355],
-                        [-0.588087081909,0.131048902869,-0.798110127449],
-                        [-0.643326640129,0.108097285032,-0.757922053337],
-                        [-0.506734728813,0.217834427953,-0.834127128124],
-                        [-0.468421578407,0.174905076623,-0.866019308567],
-                        [-0.529480218887,0.153434738517,-0.834331154823],
-                        [-0.548688352108,0.091976031661,-0.830952167511],
-                        [-0.509656965733,0.0549761541188,-0.858619451523],
-                        [-0.564633131027,0.0339771322906,-0.82464236021],
-                        [-0.529480218887,0.153434738517,-0.834331154823],
-                        [-0.548688352108,0.091976031661,-0.830952167511],
-                        [-0.588087081909,0.131048902869,-0.798110127449],
-                        [-0.553625464439,0.378517180681,-0.74177056551],
-                        [-0.582528710365,0.308011889458,-0.752189457417],
-                        [-0.618283927441,0.353819847107,-0.701809465885],
-                        [-0.480284929276,0.284414708614,-0.829719662666],
-                        [-0.506734728813,0.217834427953,-0.834127128124],
-                        [-0.545040607452,0.26241543889,-0.796284377575],
-                        [-0.606988489628,0.238753452897,-0.757998526096],
-                        [-0.627150595188,0.171839639544,-0.759706020355],
-                        [-0.665048420429,0.213841319084,-0.715529501438],
-                        [-0.545040607452,0.26241543889,-0.796284377575],
-                        [-0.606988489628,0.238753452897,-0.757998526096],
-                        [-0.582528710365,0.308011889458,-0.752189457417],
-                        [-0.486395716667,0.787004828453,-0.379529476166],
-                        [-0.535965919495,0.737060189247,-0.411682873964],
-                        [-0.550243675709,0.762617051601,-0.340069264174],
-                        [-0.44894811511,0.726413309574,-0.520354926586],
-                        [-0.495975226164,0.669751524925,-0.552667617798],
-                        [-0.517854511738,0.706037700176,-0.483050197363],
-                        [-0.58378881216,0.680853009224,-0.44230055809],
-                        [-0.628728508949,0.619044244289,-0.470621615648],
-                        [-0.645450055599,0.65135627985,-0.398910075426],
-                        [-0.517854511738,0.706037700176,-0.483050197363],
-                        [-0.58378881216,0.680853009224,-0.44230055809],
-                        [-0.535965919495,0.737060189247,-0.411682873964],
-                        [-0.398910075426,0.645450055599,-0.65135627985],
-                        [-0.44230055809,0.58378881216,-0.680853009224],
-                        [-0.470621615648,0.628728508949,-0.619044244289],
-                        [-0.340069264174,0.550243675709,-0.762617051601],
-                        [-0.379529476166,0.486395716667,-0.787004828453],
-                        [-0.411682873964,0.535965919495,-0.737060189247],
-                        [-0.483050197363,0.517854511738,-0.706037700176],
-                        [-0.520354926586,0.44894811511,-0.726413309574],
-                        [-0.552667617798,0.495975226164,-0.669751524925],
-                        [-0.411682873964,0.535965919495,-0.737060189247],
-                        [-0.483050197363,0.517854511738,-0.706037700176],
-                        [-0.44230055809,0.58378881216,-0.680853009224],
-                        [-0.669751524925,0.552667617798,-0.495975226164],
-                        [-0.706037700176,0.483050197363,-0.517854511738],
-                        [-0.726413309574,0.520354926586,-0.44894811511],
-                        [-0.619044244289,0.470621615648,-0.628728508949],
-                        [-0.65135627985,0.398910075426,-0.645450055599],
-                        [-0.680853009224,0.44230055809,-0.58378881216],
-                        [-0.737060189247,0.411682873964,-0.535965919495],
-                        [-0.762617051601,0.340069264174,-0.550243675709],
-                        [-0.787004828453,0.379529476166,-0.486395716667],
-                        [-0.680853009224,0.44230055809,-0.58378881216],
-                        [-0.737060189247,0.411682873964,-0.535965919495],
-                        [-0.706037700176,0.483050197363,-0.517854511738],
-                        [-0.470621615648,0.628728508949,-0.619044244289],
-                        [-0.540649950504,0.607478022575,-0.581951975822],
-                        [-0.495975226164,0.669751524925,-0.552667617798],
-                        [-0.552667617798,0.495975226164,-0.669751524925],
-                        [-0.619044244289,0.470621615648,-0.628728508949],
-                        [-0.581951975822,0.540649950504,-0.607478022575],
-                        [-0.607478022575,0.581951975822,-0.540649950504],
-                        [-0.669751524925,0.552667617798,-0.495975226164],
-                        [-0.628728508949,0.619044244289,-0.470621615648],
-                        [-0.581951975822,0.540649950504,-0.607478022575],
-                        [-0.607478022575,0.581951975822,-0.540649950504],
-                        [-0.540649950504,0.607478022575,-0.581951975822],
-                        [0.475679844618,0.0,-0.8796184659],
-                        [0.456712335348,0.0568443164229,-0.887796461582],
-                        [0.509656965733,0.0549761541188,-0.858619451523],
-                        [0.360324263573,0.0,-0.932827115059],
-                        [0.334895044565,0.0602079555392,-0.940329909325],
-                        [0.398431301117,0.0586068555713,-0.915323853493],
-                        [0.434652328491,0.117213711143,-0.892938017845],
-                        [0.409316182137,0.180623859167,-0.894335091114],
-                        [0.468421578407,0.174905076623,-0.866019308567],
-                        [0.398431301117,0.0586068555713,-0.915323853493],
-                        [0.434652328491,0.117213711143,-0.892938017845],
-                        [0.456712335348,0.0568443164229,-0.887796461582],
-                        [0.225778326392,0.0,-0.974178731441],
-                        [0.193714544177,0.0626873448491,-0.979053080082],
-                        [0.266443610191,0.0615878328681,-0.961880862713],
-                        [0.0770247355103,0.0,-0.997029185295],
-                        [0.0394601933658,0.0638479366899,-0.997179210186],
-                        [0.117650069296,0.0634539350867,-0.991025745869],
-                        [0.158833146095,0.128498718143,-0.978907585144],
-                        [0.121444880962,0.196501940489,-0.97295331955],
-                        [0.199805602431,0.193975359201,-0.960443258286],
-                        [0.117650069296,0.0634539350867,-0.991025745869],
-                        [0.158833146095,0.128498718143,-0.978907585144],
-                        [0.193714544177,0.0626873448491,-0.979053080082],
-                        [0.380633711815,0.246351331472,-0.891307473183],
-                        [0.348686188459,0.313436716795,-0.883275330067],
-                        [0.413926929235,0.3044308424,-0.857896447182],
-                        [0.239766731858,0.258633822203,-0.935745954514],
-                        [0.202408134937,0.327503234148,-0.922915279865],
-                        [0.277958005667,0.321246802807,-0.905284404755],
-                        [0.313733518124,0.380723625422,-0.869839549065],
-                        [0.276221334934,0.446935534477,-0.85085272789],
-                        [0.346611320972,0.436200261116,-0.830415487289],
-                        [0.277958005667,0.321246802807,-0.905284404755],
-                        [0.313733518124,0.380723625422,-0.869839549065],
-                        [0.348686188459,0.313436716795,-0.883275330067],
-                        [0.266443610191,0.0615878328681,-0.961880862713],
-                        [0.306287169456,0.123895764351,-0.943842172623],
-                        [0.334895044565,0.0602079555392,-0.940329909325],
-                        [0.199805602431,0.193975359201,-0.960443258286],
-                        [0.239766731858,0.258633822203,-0.935745954514],
-                        [0.274516820908,0.190361812711,-0.942551255226],
-                        [0.34457308054,0.185843646526,-0.920180141926],
-                        [0.380633711815,0.246351331472,-0.891307473183],
-                        [0.409316182137,0.180623859167,-0.894335091114],
-                        [0.274516820908,0.190361812711,-0.942551255226],
-                        [0.34457308054,0.185843646526,-0.920180141926],
-                        [0.306287169456,0.123895764351,-0.943842172623],
-                        [-0.0770247355103,0.0,-0.997029185295],
-                        [-0.117650069296,0.0634539350867,-0.991025745869],
-                        [-0.0394601933658,0.0638479366899,-0.997179210186],
-                        [-0.225778326392,0.0,-0.974178731441],
-                        [-0.266443610191,0.0615878328681,-0.961880862713],
-                        [-0.193714544177,0.0626873448491,-0.979053080082],
-                        [-0.158833146095,0.128498718143,-0.978907585144],
-                        [-0.199805602431,0.193975359201,-0.960443258286],
-                        [-0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.193714544177,0.0626873448491,-0.979053080082],
-                        [-0.158833146095,0.128498718143,-0.978907585144],
-                        [-0.117650069296,0.0634539350867,-0.991025745869],
-                        [-0.360324263573,0.0,-0.932827115059],
-                        [-0.398431301117,0.0586068555713,-0.915323853493],
-                        [-0.334895044565,0.0602079555392,-0.940329909325],
-                        [-0.475679844618,0.0,-0.8796184659],
-                        [-0.509656965733,0.0549761541188,-0.858619451523],
-                        [-0.456712335348,0.0568443164229,-0.887796461582],
-                        [-0.434652328491,0.117213711143,-0.892938017845],
-                        [-0.468421578407,0.174905076623,-0.866019308567],
-                        [-0.409316182137,0.180623859167,-0.894335091114],
-                        [-0.456712335348,0.0568443164229,-0.887796461582],
-                        [-0.434652328491,0.117213711143,-0.892938017845],
-                        [-0.398431301117,0.0586068555713,-0.915323853493],
-                        [-0.239766731858,0.258633822203,-0.935745954514],
-                        [-0.277958005667,0.321246802807,-0.905284404755],
-                        [-0.202408134937,0.327503234148,-0.922915279865],
-                        [-0.380633711815,0.246351331472,-0.891307473183],
-                        [-0.413926929235,0.3044308424,-0.857896447182],
-                        [-0.348686188459,0.313436716795,-0.883275330067],
-                        [-0.313733518124,0.380723625422,-0.869839549065],
-                        [-0.346611320972,0.436200261116,-0.830415487289],
-                        [-0.276221334934,0.446935534477,-0.85085272789],
-                        [-0.348686188459,0.313436716795,-0.883275330067],
-                        [-0.313733518124,0.380723625422,-0.869839549065],
-                        [-0.277958005667,0.321246802807,-0.905284404755],
-                        [-0.334895044565,0.0602079555392,-0.940329909325],
-                        [-0.306287169456,0.123895764351,-0.943842172623],
-                        [-0.266443610191,0.0615878328681,-0.961880862713],
-                        [-0.409316182137,0.180623859167,-0.894335091114],
-                        [-0.380633711815,0.246351331472,-0.891307473183],
-                        [-0.34457308054,0.185843646526,-0.920180141926],
-                        [-0.274516820908,0.190361812711,-0.942551255226],
-                        [-0.239766731858,0.258633822203,-0.935745954514],
-                        [-0.199805602431,0.193975359201,-0.960443258286],
-                        [-0.34457308054,0.185843646526,-0.920180141926],
-                        [-0.274516820908,0.190361812711,-0.942551255226],
-                        [-0.306287169456,0.123895764351,-0.943842172623],
-                        [0.236761152744,0.510783493519,-0.826465010643],
-                        [0.196083456278,0.571085453033,-0.797127783298],
-                        [0.269586592913,0.560828924179,-0.782811582088],
-                        [0.0809632539749,0.524005174637,-0.847858190536],
-                        [0.0399611219764,0.581926107407,-0.81225925684],
-                        [0.119124859571,0.578244268894,-0.807120084763],
-                        [0.154971644282,0.62687343359,-0.763553202152],
-                        [0.114190116525,0.677466154099,-0.726636230946],
-                        [0.188148602843,0.669747889042,-0.718357801437],
-                        [0.119124859571,0.578244268894,-0.807120084763],
-                        [0.154971644282,0.62687343359,-0.763553202152],
-                        [0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.0809632539749,0.524005174637,-0.847858190536],
-                        [-0.119124859571,0.578244268894,-0.807120084763],
-                        [-0.0399611219764,0.581926107407,-0.81225925684],
-                        [-0.236761152744,0.510783493519,-0.826465010643],
-                        [-0.269586592913,0.560828924179,-0.782811582088],
-                        [-0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.154971644282,0.62687343359,-0.763553202152],
-                        [-0.188148602843,0.669747889042,-0.718357801437],
-                        [-0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.196083456278,0.571085453033,-0.797127783298],
-                        [-0.154971644282,0.62687343359,-0.763553202152],
-                        [-0.119124859571,0.578244268894,-0.807120084763],
-                        [0.0744211226702,0.722495436668,-0.687358558178],
-                        [0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.0744211226702,0.722495436668,-0.687358558178],
-                        [-0.108097285032,0.757922053337,-0.643326640129],
-                        [-0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.0,0.79582041502,-0.605532705784],
-                        [-0.0339771322906,0.82464236021,-0.564633131027],
-                        [0.0339771322906,0.82464236021,-0.564633131027],
-                        [-0.0362210273743,0.761889100075,-0.646693944931],
-                        [0.0,0.79582041502,-0.605532705784],
-                        [0.0362210273743,0.761889100075,-0.646693944931],
-                        [-0.0399611219764,0.581926107407,-0.81225925684],
-                        [0.0,0.634539365768,-0.772890508175],
-                        [0.0399611219764,0.581926107407,-0.81225925684],
-                        [-0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.0744211226702,0.722495436668,-0.687358558178],
-                        [-0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0744211226702,0.722495436668,-0.687358558178],
-                        [0.114190116525,0.677466154099,-0.726636230946],
-                        [-0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0382858961821,0.68142670393,-0.730884253979],
-                        [0.0,0.634539365768,-0.772890508175],
-                        [-0.0394601933658,0.0638479366899,-0.997179210186],
-                        [0.0,0.130150929093,-0.991494178772],
-                        [0.0394601933658,0.0638479366899,-0.997179210186],
-                        [-0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.0820460245013,0.265506535769,-0.960611641407],
-                        [-0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0820460245013,0.265506535769,-0.960611641407],
-                        [0.121444880962,0.196501940489,-0.97295331955],
-                        [-0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0407496243715,0.197802826762,-0.979394435883],
-                        [0.0,0.130150929093,-0.991494178772],
-                        [-0.202408134937,0.327503234148,-0.922915279865],
-                        [-0.162998497486,0.395605653524,-0.903840482235],
-                        [-0.123069040477,0.33188316226,-0.935258030891],
-                        [-0.276221334934,0.446935534477,-0.85085272789],
-                        [-0.236761152744,0.510783493519,-0.826465010643],
-                        [-0.20109423995,0.455528259277,-0.867211103439],
-                        [-0.122248865664,0.461539924145,-0.878655850887],
-                        [-0.0809632539749,0.524005174637,-0.847858190536],
-                        [-0.0410230122507,0.464636415243,-0.88455080986],
-                        [-0.20109423995,0.455528259277,-0.867211103439],
-                        [-0.122248865664,0.461539924145,-0.878655850887],
-                        [-0.162998497486,0.395605653524,-0.903840482235],
-                        [0.123069040477,0.33188316226,-0.935258030891],
-                        [0.162998497486,0.395605653524,-0.903840482235],
-                        [0.202408134937,0.327503234148,-0.922915279865],
-                        [0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0809632539749,0.524005174637,-0.847858190536],
-                        [0.122248865664,0.461539924145,-0.878655850887],
-                        [0.20109423995,0.455528259277,-0.867211103439],
-                        [0.236761152744,0.510783493519,-0.826465010643],
-                        [0.276221334934,0.446935534477,-0.85085272789],
-                        [0.122248865664,0.461539924145,-0.878655850887],
-                        [0.20109423995,0.455528259277,-0.867211103439],
-                        [0.162998497486,0.395605653524,-0.903840482235],
-                        [-0.123069040477,0.33188316226,-0.935258030891],
-                        [-0.04130198434,0.334140062332,-0.941618084908],
-                        [-0.0820460245013,0.265506535769,-0.960611641407],
-                        [-0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0410230122507,0.464636415243,-0.88455080986],
-                        [0.0,0.400968074799,-0.916092038155],
-                        [0.04130198434,0.334140062332,-0.941618084908],
-                        [0.123069040477,0.33188316226,-0.935258030891],
-                        [0.0820460245013,0.265506535769,-0.960611641407],
-                        [0.0,0.400968074799,-0.916092038155],
-                        [0.04130198434,0.334140062332,-0.941618084908],
-                        [-0.04130198434,0.334140062332,-0.941618084908],
-                        [0.509656965733,0.0549761541188,-0.858619451523],
-                        [0.548688352108,0.091976031661,-0.830952167511],
-                        [0.564633131027,0.0339771322906,-0.82464236021],
-                        [0.468421578407,0.174905076623,-0.866019308567],
-                        [0.506734728813,0.217834427953,-0.834127128124],
-                        [0.529480218887,0.153434738517,-0.834331154823],
-                        [0.588087081909,0.131048902869,-0.798110127449],
-                        [0.627150595188,0.171839639544,-0.759706020355],
-                        [0.643326640129,0.108097285032,-0.757922053337],
-                        [0.529480218887,0.153434738517,-0.834331154823],
-                        [0.588087081909,0.131048902869,-0.798110127449],
-                        [0.548688352108,0.091976031661,-0.830952167511],
-                        [0.413926929235,0.3044308424,-0.857896447182],
-                        [0.450116455555,0.352179646492,-0.820587992668],
-                        [0.480284929276,0.284414708614,-0.829719662666],
-                        [0.346611320972,0.436200261116,-0.830415487289],
-                        [0.379529476166,0.486395716667,-0.787004828453],
-                        [0.416404157877,0.419940322638,-0.806385576725],
-                        [0.485873311758,0.400663375854,-0.776785671711],
-                        [0.520354926586,0.44894811511,-0.726413309574],
-                        [0.553625464439,0.378517180681,-0.74177056551],
-                        [0.416404157877,0.419940322638,-0.806385576725],
-                        [0.485873311758,0.400663375854,-0.776785671711],
-                        [0.450116455555,0.352179646492,-0.820587992668],
-                        [0.665048420429,0.213841319084,-0.715529501438],
-                        [0.700865805149,0.256401896477,-0.665616393089],
-                        [0.718357801437,0.188148602843,-0.669747889042],
-                        [0.618283927441,0.353819847107,-0.701809465885],
-                        [0.65135627985,0.398910075426,-0.645450055599],
-                        [0.678621411324,0.327040165663,-0.657660841942],
-                        [0.733673810959,0.298754066229,-0.610302150249],
-                        [0.762617051601,0.340069264174,-0.550243675709],
-                        [0.782811582088,0.269586592913,-0.560828924179],
-                        [0.678621411324,0.327040165663,-0.657660841942],
-                        [0.733673810959,0.298754066229,-0.610302150249],
-                        [0.700865805149,0.256401896477,-0.665616393089],
-                        [0.480284929276,0.284414708614,-0.829719662666],
-                        [0.545040607452,0.26241543889,-0.796284377575],
-                        [0.506734728813,0.217834427953,-0.834127128124],
-                        [0.553625464439,0.378517180681,-0.74177056551],
-                        [0.618283927441,0.353819847107,-0.701809465885],
-                        [0.582528710365,0.308011889458,-0.752189457417],
-                        [0.606988489628,0.238753452897,-0.757998526096],
-                        [0.665048420429,0.213841319084,-0.715529501438],
-                        [0.627150595188,0.171839639544,-0.759706020355],
-                        [0.582528710365,0.308011889458,-0.752189457417],
-                        [0.606988489628,0.238753452897,-0.757998526096],
-                        [0.545040607452,0.26241543889,-0.796284377575],
-                        [0.269586592913,0.560828924179,-0.782811582088],
-                        [0.298754066229,0.610302150249,-0.733673810959],
-                        [0.340069264174,0.550243675709,-0.762617051601],
-                        [0.188148602843,0.669747889042,-0.718357801437],
-                        [0.213841319084,0.715529501438,-0.665048420429],
-                        [0.256401896477,0.665616393089,-0.700865805149],
-                        [0.327040165663,0.657660841942,-0.678621411324],
-                        [0.353819847107,0.701809465885,-0.618283927441],
-                        [0.398910075426,0.645450055599,-0.65135627985],
-                        [0.256401896477,0.665616393089,-0.700865805149],
-                        [0.327040165663,0.657660841942,-0.678621411324],
-                        [0.298754066229,0.610302150249,-0.733673810959],
-                        [0.108097285032,0.757922053337,-0.643326640129],
-                        [0.131048902869,0.798110127449,-0.588087081909],
-                        [0.171839639544,0.759706020355,-0.627150595188],
-                        [0.0339771322906,0.82464236021,-0.564633131027],
-                        [0.0549761541188,0.858619451523,-0.509656965733],
-                        [0.091976031661,0.830952167511,-0.548688352108],
-                        [0.153434738517,0.834331154823,-0.529480218887],
-                        [0.174905076623,0.866019308567,-0.468421578407],
-                        [0.217834427953,0.834127128124,-0.506734728813],
-                        [0.091976031661,0.830952167511,-0.548688352108],
-                        [0.153434738517,0.834331154823,-0.529480218887],
-                        [0.131048902869,0.798110127449,-0.588087081909],
-                        [0.378517180681,0.74177056551,-0.553625464439],
-                        [0.400663375854,0.776785671711,-0.485873311758],
-                        [0.44894811511,0.726413309574,-0.520354926586],
-                        [0.284414708614,0.829719662666,-0.480284929276],
-                        [0.3044308424,0.857896447182,-0.413926929235],
-                        [0.352179646492,0.820587992668,-0.450116455555],
-                        [0.419940322638,0.806385576725,-0.416404157877],
-                        [0.436200261116,0.830415487289,-0.346611320972],
-                        [0.486395716667,0.787004828453,-0.379529476166],
-                        [0.352179646492,0.820587992668,-0.450116455555],
-                        [0.419940322638,0.806385576725,-0.416404157877],
-                        [0.400663375854,0.776785671711,-0.485873311758],
-                        [0.171839639544,0.759706020355,-0.627150595188],
-                        [0.238753452897,0.757998526096,-0.606988489628],
-                        [0.213841319084,0.715529501438,-0.665048420429],
-                        [0.217834427953,0.834127128124,-0.506734728813],
-                        [0.284414708614,0.829719662666,-0.480284929276],
-                        [0.26241543889,0.796284377575,-0.545040607452],
-                        [0.308011889458,0.752189457417,-0.582528710365],
-                        [0.378517180681,0.74177056551,-0.553625464439],
-                        [0.353819847107,0.701809465885,-0.618283927441],
-                        [0.26241543889,0.796284377575,-0.545040607452],
-                        [0.308011889458,0.752189457417,-0.582528710365],
-                        [0.238753452897,0.757998526096,-0.606988489628],
-                        [0.787004828453,0.379529476166,-0.486395716667],
-                        [0.806385576725,0.416404157877,-0.419940322638],
-                        [0.830415487289,0.346611320972,-0.436200261116],
-                        [0.726413309574,0.520354926586,-0.44894811511],
-                        [0.74177056551,0.553625464439,-0.378517180681],
-                        [0.776785671711,0.485873311758,-0.400663375854],
-                        [0.820587992668,0.450116455555,-0.352179646492],
-                        [0.829719662666,0.480284929276,-0.284414708614],
-                        [0.857896447182,0.413926929235,-0.3044308424],
-                        [0.776785671711,0.485873311758,-0.400663375854],
-                        [0.820587992668,0.450116455555,-0.352179646492],
-                        [0.806385576725,0.416404157877,-0.419940322638],
-                        [0.645450055599,0.65135627985,-0.398910075426],
-                        [0.657660841942,0.678621411324,-0.327040165663],
-                        [0.701809465885,0.618283927441,-0.353819847107],
-                        [0.550243675709,0.762617051601,-0.340069264174],
-                        [0.560828924179,0.782811582088,-0.269586592913],
-                        [0.610302150249,0.733673810959,-0.298754066229],
-                        [0.665616393089,0.700865805149,-0.256401896477],
-                        [0.669747889042,0.718357801437,-0.188148602843],
-                        [0.715529501438,0.665048420429,-0.213841319084],
-                        [0.610302150249,0.733673810959,-0.298754066229],
-                        [0.665616393089,0.700865805149,-0.256401896477],
-                        [0.657660841942,0.678621411324,-0.327040165663],
-                        [0.834127128124,0.506734728813,-0.217834427953],
-                        [0.834331154823,0.529480218887,-0.153434738517],
-                        [0.866019308567,0.468421578407,-0.174905076623],
-                        [0.759706020355,0.627150595188,-0.171839639544],
-                        [0.757922053337,0.643326640129,-0.108097285032],
-                        [0.798110127449,0.588087081909,-0.131048902869],
-                        [0.830952167511,0.548688352108,-0.091976031661],
-                        [0.82464236021,0.564633131027,-0.0339771322906],
-                        [0.858619451523,0.509656965733,-0.0549761541188],
-                        [0.798110127449,0.588087081909,-0.131048902869],
-                        [0.830952167511,0.548688352108,-0.091976031661],
-                        [0.834331154823,0.529480218887,-0.153434738517],
-                        [0.701809465885,0.618283927441,-0.353819847107],
-                        [0.752189457417,0.582528710365,-0.308011889458],
-                        [0.74177056551,0.553625464439,-0.378517180681],
-                        [0.715529501438,0.665048420429,-0.213841319084],
-                        [0.759706020355,0.627150595188,-0.171839639544],
-                        [0.757998526096,0.606988489628,-0.238753452897],
-                        [0.796284377575,0.545040607452,-0.26241543889],
-                        [0.834127128124,0.506734728813,-0.217834427953],
-                        [0.829719662666,0.480284929276,-0.284414708614],
-                        [0.757998526096,0.606988489628,-0.238753452897],
-                        [0.796284377575,0.545040607452,-0.26241543889],
-                        [0.752189457417,0.582528710365,-0.308011889458],
-                        [0.340069264174,0.550243675709,-0.762617051601],
-                        [0.411682873964,0.535965919495,-0.737060189247],
-                        [0.379529476166,0.486395716667,-0.787004828453],
-                        [0.398910075426,0.645450055599,-0.65135627985],
-                        [0.470621615648,0.628728508949,-0.619044244289],
-                        [0.44230055809,0.58378881216,-0.680853009224],
-                        [0.483050197363,0.517854511738,-0.706037700176],
-                        [0.552667617798,0.495975226164,-0.669751524925],
-                        [0.520354926586,0.44894811511,-0.726413309574],
-                        [0.44230055809,0.58378881216,-0.680853009224],
-                        [0.483050197363,0.517854511738,-0.706037700176],
-                        [0.411682873964,0.535965919495,-0.737060189247],
-                        [0.44894811511,0.726413309574,-0.520354926586],
-                        [0.517854511738,0.706037700176,-0.483050197363],
-                        [0.495975226164,0.669751524925,-0.552667617798],
-                        [0.486395716667,0.787004828453,-0.379529476166],
-                        [0.550243675709,0.762617051601,-0.340069264174],
-                        [0.535965919495,0.737060189247,-0.411682873964],
-                        [0.58378881216,0.680853009224,-0.44230055809],
-                        [0.645450055599,0.65135627985,-0.398910075426],
-                        [0.628728508949,0.619044244289,-0.470621615648],
-                        [0.535965919495,0.737060189247,-0.411682873964],
-                        [0.58378881216,0.680853009224,-0.44230055809],
-                        [0.517854511738,0.706037700176,-0.483050197363],
-                        [0.619044244289,0.470621615648,-0.628728508949],
-                        [0.680853009224,0.44230055809,-0.58378881216],
-                        [0.65135627985,0.398910075426,-0.645450055599],
-                        [0.669751524925,0.552667617798,-0.495975226164],
-                        [0.726413309574,0.520354926586,-0.44894811511],
-                        [0.706037700176,0.483050197363,-0.517854511738],
-                        [0.737060189247,0.411682873964,-0.535965919495],
-                        [0.787004828453,0.379529476166,-0.486395716667],
-                        [0.762617051601,0.340069264174,-0.550243675709],
-                        [0.706037700176,0.483050197363,-0.517854511738],
-                        [0.737060189247,0.411682873964,-0.535965919495],
-                        [0.680853009224,0.44230055809,-0.58378881216],
-                        [0.495975226164,0.669751524925,-0.552667617798],
-                        [0.540649950504,0.607478022575,-0.581951975822],
-                        [0.470621615648,0.628728508949,-0.619044244289],
-                        [0.628728508949,0.619044244289,-0.470621615648],
-                        [0.669751524925,0.552667617798,-0.495975226164],
-                        [0.607478022575,0.581951975822,-0.540649950504],
-                        [0.581951975822,0.540649950504,-0.607478022575],
-                        [0.619044244289,0.470621615648,-0.628728508949],
-                        [0.552667617798,0.495975226164,-0.669751524925],
-                        [0.607478022575,0.581951975822,-0.540649950504],
-                        [0.581951975822,0.540649950504,-0.607478022575],
-                        [0.540649950504,0.607478022575,-0.581951975822],
-                        [0.82464236021,0.564633131027,-0.0339771322906],
-                        [0.79582041502,0.605532705784,0.0],
-                        [0.82464236021,0.564633131027,0.0339771322906],
-                        [0.757922053337,0.643326640129,-0.108097285032],
-                        [0.722495436668,0.687358558178,-0.0744211226702],
-                        [0.761889100075,0.646693944931,-0.0362210273743],
-                        [0.761889100075,0.646693944931,0.0362210273743],
-                        [0.722495436668,0.687358558178,0.0744211226702],
-                        [0.757922053337,0.643326640129,0.108097285032],
-                        [0.761889100075,0.646693944931,-0.0362210273743],
-                        [0.761889100075,0.646693944931,0.0362210273743],
-                        [0.79582041502,0.605532705784,0.0],
-                        [0.669747889042,0.718357801437,-0.188148602843],
-                        [0.62687343359,0.763553202152,-0.154971644282],
-                        [0.677466154099,0.726636230946,-0.114190116525],
-                        [0.560828924179,0.782811582088,-0.269586592913],
-                        [0.510783493519,0.826465010643,-0.236761152744],
-                        [0.571085453033,0.797127783298,-0.196083456278],
-                        [0.578244268894,0.807120084763,-0.119124859571],
-                        [0.524005174637,0.847858190536,-0.0809632539749],
-                        [0.581926107407,0.81225925684,-0.0399611219764],
-                        [0.571085453033,0.797127783298,-0.196083456278],
-                        [0.578244268894,0.807120084763,-0.119124859571],
-                        [0.62687343359,0.763553202152,-0.154971644282],
-                        [0.677466154099,0.726636230946,0.114190116525],
-                        [0.62687343359,0.763553202152,0.154971644282],
-                        [0.669747889042,0.718357801437,0.188148602843],
-                        [0.581926107407,0.81225925684,0.0399611219764],
-                        [0.524005174637,0.847858190536,0.0809632539749],
-                        [0.578244268894,0.807120084763,0.119124859571],
-                        [0.571085453033,0.797127783298,0.196083456278],
-                        [0.510783493519,0.826465010643,0.236761152744],
-                        [0.560828924179,0.782811582088,0.269586592913],
-                        [0.578244268894,0.807120084763,0.119124859571],
-                        [0.571085453033,0.797127783298,0.196083456278],
-                        [0.62687343359,0.763553202152,0.154971644282],
-                        [0.677466154099,0.726636230946,-0.114190116525],
-                        [0.68142670393,0.730884253979,-0.0382858961821],
-                        [0.722495436668,0.687358558178,-0.0744211226702],
-                        [0.581926107407,0.81225925684,-0.0399611219764],
-                        [0.581926107407,0.81225925684,0.0399611219764],
-                        [0.634539365768,0.772890508175,0.0],
-                        [0.68142670393,0.730884253979,0.0382858961821],
-                        [0.677466154099,0.726636230946,0.114190116525],
-                        [0.722495436668,0.687358558178,0.0744211226702],
-                        [0.634539365768,0.772890508175,0.0],
-                        [0.68142670393,0.730884253979,0.0382858961821],
-                        [0.68142670393,0.730884253979,-0.0382858961821],
-                        [0.436200261116,0.830415487289,-0.346611320972],
-                        [0.380723625422,0.869839549065,-0.313733518124],
-                        [0.446935534477,0.85085272789,-0.276221334934],
-                        [0.3044308424,0.857896447182,-0.413926929235],
-                        [0.246351331472,0.891307473183,-0.380633711815],
-                        [0.313436716795,0.883275330067,-0.348686188459],
-                        [0.321246802807,0.905284404755,-0.277958005667],
-                        [0.258633822203,0.935745954514,-0.239766731858],
-                        [0.327503234148,0.922915279865,-0.202408134937],
-                        [0.313436716795,0.883275330067,-0.348686188459],
-                        [0.321246802807,0.905284404755,-0.277958005667],
-                        [0.380723625422,0.869839549065,-0.313733518124],
-                        [0.174905076623,0.866019308567,-0.468421578407],
-                        [0.117213711143,0.892938017845,-0.434652328491],
-                        [0.180623859167,0.894335091114,-0.409316182137],
-                        [0.0549761541188,0.858619451523,-0.509656965733],
-                        [0.0,0.8796184659,-0.475679844618],
-                        [0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0586068555713,0.915323853493,-0.398431301117],
-                        [0.0,0.932827115059,-0.360324263573],
-                        [0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0586068555713,0.915323853493,-0.398431301117],
-                        [0.117213711143,0.892938017845,-0.434652328491],
-                        [0.193975359201,0.960443258286,-0.199805602431],
-                        [0.128498718143,0.978907585144,-0.158833146095],
-                        [0.196501940489,0.97295331955,-0.121444880962],
-                        [0.0615878328681,0.961880862713,-0.266443610191],
-                        [0.0,0.974178731441,-0.225778326392],
-                        [0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0634539350867,0.991025745869,-0.117650069296],
-                        [0.0,0.997029185295,-0.0770247355103],
-                        [0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0634539350867,0.991025745869,-0.117650069296],
-                        [0.128498718143,0.978907585144,-0.158833146095],
-                        [0.180623859167,0.894335091114,-0.409316182137],
-                        [0.185843646526,0.920180141926,-0.34457308054],
-                        [0.246351331472,0.891307473183,-0.380633711815],
-                        [0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0615878328681,0.961880862713,-0.266443610191],
-                        [0.123895764351,0.943842172623,-0.306287169456],
-                        [0.190361812711,0.942551255226,-0.274516820908],
-                        [0.193975359201,0.960443258286,-0.199805602431],
-                        [0.258633822203,0.935745954514,-0.239766731858],
-                        [0.123895764351,0.943842172623,-0.306287169456],
-                        [0.190361812711,0.942551255226,-0.274516820908],
-                        [0.185843646526,0.920180141926,-0.34457308054],
-                        [0.446935534477,0.85085272789,0.276221334934],
-                        [0.380723625422,0.869839549065,0.313733518124],
-                        [0.436200261116,0.830415487289,0.346611320972],
-                        [0.327503234148,0.922915279865,0.202408134937],
-                        [0.258633822203,0.935745954514,0.239766731858],
-                        [0.321246802807,0.905284404755,0.277958005667],
-                        [0.313436716795,0.883275330067,0.348686188459],
-                        [0.246351331472,0.891307473183,0.380633711815],
-                        [0.3044308424,0.857896447182,0.413926929235],
-                        [0.321246802807,0.905284404755,0.277958005667],
-                        [0.313436716795,0.883275330067,0.348686188459],
-                        [0.380723625422,0.869839549065,0.313733518124],
-                        [0.196501940489,0.97295331955,0.121444880962],
-                        [0.128498718143,0.978907585144,0.158833146095],
-                        [0.193975359201,0.960443258286,0.199805602431],
-                        [0.0638479366899,0.997179210186,0.0394601933658],
-                        [0.0,0.997029185295,0.0770247355103],
-                        [0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0626873448491,0.979053080082,0.193714544177],
-                        [0.0,0.974178731441,0.225778326392],
-                        [0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0626873448491,0.979053080082,0.193714544177],
-                        [0.128498718143,0.978907585144,0.158833146095],
-                        [0.180623859167,0.894335091114,0.409316182137],
-                        [0.117213711143,0.892938017845,0.434652328491],
-                        [0.174905076623,0.866019308567,0.468421578407],
-                        [0.0602079555392,0.940329909325,0.334895044565],
-                        [0.0,0.932827115059,0.360324263573],
-                        [0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0568443164229,0.887796461582,0.456712335348],
-                        [0.0,0.8796184659,0.475679844618],
-                        [0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0568443164229,0.887796461582,0.456712335348],
-                        [0.117213711143,0.892938017845,0.434652328491],
-                        [0.193975359201,0.960443258286,0.199805602431],
-                        [0.190361812711,0.942551255226,0.274516820908],
-                        [0.258633822203,0.935745954514,0.239766731858],
-                        [0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0602079555392,0.940329909325,0.334895044565],
-                        [0.123895764351,0.943842172623,0.306287169456],
-                        [0.185843646526,0.920180141926,0.34457308054],
-                        [0.180623859167,0.894335091114,0.409316182137],
-                        [0.246351331472,0.891307473183,0.380633711815],
-                        [0.123895764351,0.943842172623,0.306287169456],
-                        [0.185843646526,0.920180141926,0.34457308054],
-                        [0.190361812711,0.942551255226,0.274516820908],
-                        [0.446935534477,0.85085272789,-0.276221334934],
-                        [0.455528259277,0.867211103439,-0.20109423995],
-                        [0.510783493519,0.826465010643,-0.236761152744],
-                        [0.327503234148,0.922915279865,-0.202408134937],
-                        [0.33188316226,0.935258030891,-0.123069040477],
-                        [0.395605653524,0.903840482235,-0.162998497486],
-                        [0.461539924145,0.878655850887,-0.122248865664],
-                        [0.464636415243,0.88455080986,-0.0410230122507],
-                        [0.524005174637,0.847858190536,-0.0809632539749],
-                        [0.395605653524,0.903840482235,-0.162998497486],
-                        [0.461539924145,0.878655850887,-0.122248865664],
-                        [0.455528259277,0.867211103439,-0.20109423995],
-                        [0.196501940489,0.97295331955,-0.121444880962],
-                        [0.197802826762,0.979394435883,-0.0407496243715],
-                        [0.265506535769,0.960611641407,-0.0820460245013],
-                        [0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0638479366899,0.997179210186,0.0394601933658],
-                        [0.130150929093,0.991494178772,0.0],
-                        [0.197802826762,0.979394435883,0.0407496243715],
-                        [0.196501940489,0.97295331955,0.121444880962],
-                        [0.265506535769,0.960611641407,0.0820460245013],
-                        [0.130150929093,0.991494178772,0.0],
-                        [0.197802826762,0.979394435883,0.0407496243715],
-                        [0.197802826762,0.979394435883,-0.0407496243715],
-                        [0.464636415243,0.88455080986,0.0410230122507],
-                        [0.461539924145,0.878655850887,0.122248865664],
-                        [0.524005174637,0.847858190536,0.0809632539749],
-                        [0.33188316226,0.935258030891,0.123069040477],
-                        [0.327503234148,0.922915279865,0.202408134937],
-                        [0.395605653524,0.903840482235,0.162998497486],
-                        [0.455528259277,0.867211103439,0.20109423995],
-                        [0.446935534477,0.85085272789,0.276221334934],
-                        [0.510783493519,0.826465010643,0.236761152744],
-                        [0.395605653524,0.903840482235,0.162998497486],
-                        [0.455528259277,0.867211103439,0.20109423995],
-                        [0.461539924145,0.878655850887,0.122248865664],
-                        [0.265506535769,0.960611641407,-0.0820460245013],
-                        [0.334140062332,0.941618084908,-0.04130198434],
-                        [0.33188316226,0.935258030891,-0.123069040477],
-                        [0.265506535769,0.960611641407,0.0820460245013],
-                        [0.33188316226,0.935258030891,0.123069040477],
-                        [0.334140062332,0.941618084908,0.04130198434],
-                        [0.400968074799,0.916092038155,0.0],
-                        [0.464636415243,0.88455080986,0.0410230122507],
-                        [0.464636415243,0.88455080986,-0.0410230122507],
-                        [0.334140062332,0.941618084908,0.04130198434],
-                        [0.400968074799,0.916092038155,0.0],
-                        [0.334140062332,0.941618084908,-0.04130198434],
-                        [0.82464236021,0.564633131027,0.0339771322906],
-                        [0.830952167511,0.548688352108,0.091976031661],
-                        [0.858619451523,0.509656965733,0.0549761541188],
-                        [0.757922053337,0.643326640129,0.108097285032],
-                        [0.759706020355,0.627150595188,0.171839639544],
-                        [0.798110127449,0.588087081909,0.131048902869],
-                        [0.834331154823,0.529480218887,0.153434738517],
-                        [0.834127128124,0.506734728813,0.217834427953],
-                        [0.866019308567,0.468421578407,0.174905076623],
-                        [0.798110127449,0.588087081909,0.131048902869],
-                        [0.834331154823,0.529480218887,0.153434738517],
-                        [0.830952167511,0.548688352108,0.091976031661],
-                        [0.669747889042,0.718357801437,0.188148602843],
-                        [0.665616393089,0.700865805149,0.256401896477],
-                        [0.715529501438,0.665048420429,0.213841319084],
-                        [0.560828924179,0.782811582088,0.269586592913],
-                        [0.550243675709,0.762617051601,0.340069264174],
-                        [0.610302150249,0.733673810959,0.298754066229],
-                        [0.657660841942,0.678621411324,0.327040165663],
-                        [0.645450055599,0.65135627985,0.398910075426],
-                        [0.701809465885,0.618283927441,0.353819847107],
-                        [0.610302150249,0.733673810959,0.298754066229],
-                        [0.657660841942,0.678621411324,0.327040165663],
-                        [0.665616393089,0.700865805149,0.256401896477],
-                        [0.829719662666,0.480284929276,0.284414708614],
-                        [0.820587992668,0.450116455555,0.352179646492],
-                        [0.857896447182,0.413926929235,0.3044308424],
-                        [0.74177056551,0.553625464439,0.378517180681],
-                        [0.726413309574,0.520354926586,0.44894811511],
-                        [0.776785671711,0.485873311758,0.400663375854],
-                        [0.806385576725,0.416404157877,0.419940322638],
-                        [0.787004828453,0.379529476166,0.486395716667],
-                        [0.830415487289,0.346611320972,0.436200261116],
-                        [0.776785671711,0.485873311758,0.400663375854],
-                        [0.806385576725,0.416404157877,0.419940322638],
-                        [0.820587992668,0.450116455555,0.352179646492],
-                        [0.715529501438,0.665048420429,0.213841319084],
-                        [0.757998526096,0.606988489628,0.238753452897],
-                        [0.759706020355,0.627150595188,0.171839639544],
-                        [0.701809465885,0.618283927441,0.353819847107],
-                        [0.74177056551,0.553625464439,0.378517180681],
-                        [0.752189457417,0.582528710365,0.308011889458],
-                        [0.796284377575,0.545040607452,0.26241543889],
-                        [0.829719662666,0.480284929276,0.284414708614],
-                        [0.834127128124,0.506734728813,0.217834427953],
-                        [0.752189457417,0.582528710365,0.308011889458],
-                        [0.796284377575,0.545040607452,0.26241543889],
-                        [0.757998526096,0.606988489628,0.238753452897],
-                        [0.436200261116,0.830415487289,0.346611320972],
-                        [0.419940322638,0.806385576725,0.416404157877],
-                        [0.486395716667,0.787004828453,0.379529476166],
-                        [0.3044308424,0.857896447182,0.413926929235],
-                        [0.284414708614,0.829719662666,0.480284929276],
-                        [0.352179646492,0.820587992668,0.450116455555],
-                        [0.400663375854,0.776785671711,0.485873311758],
-                        [0.378517180681,0.74177056551,0.553625464439],
-                        [0.44894811511,0.726413309574,0.520354926586],
-                        [0.352179646492,0.820587992668,0.450116455555],
-                        [0.400663375854,0.776785671711,0.485873311758],
-                        [0.419940322638,0.806385576725,0.416404157877],
-                        [0.174905076623,0.866019308567,0.468421578407],
-                        [0.153434738517,0.834331154823,0.529480218887],
-                        [0.217834427953,0.834127128124,0.506734728813],
-                        [0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0339771322906,0.82464236021,0.564633131027],
-                        [0.091976031661,0.830952167511,0.548688352108],
-                        [0.131048902869,0.798110127449,0.588087081909],
-                        [0.108097285032,0.757922053337,0.643326640129],
-                        [0.171839639544,0.759706020355,0.627150595188],
-                        [0.091976031661,0.830952167511,0.548688352108],
-                        [0.131048902869,0.798110127449,0.588087081909],
-                        [0.153434738517,0.834331154823,0.529480218887],
-                        [0.353819847107,0.701809465885,0.618283927441],
-                        [0.327040165663,0.657660841942,0.678621411324],
-                        [0.398910075426,0.645450055599,0.65135627985],
-                        [0.213841319084,0.715529501438,0.665048420429],
-                        [0.188148602843,0.669747889042,0.718357801437],
-                        [0.256401896477,0.665616393089,0.700865805149],
-                        [0.298754066229,0.610302150249,0.733673810959],
-                        [0.269586592913,0.560828924179,0.782811582088],
-                        [0.340069264174,0.550243675709,0.762617051601],
-                        [0.256401896477,0.665616393089,0.700865805149],
-                        [0.298754066229,0.610302150249,0.733673810959],
-                        [0.327040165663,0.657660841942,0.678621411324],
-                        [0.217834427953,0.834127128124,0.506734728813],
-                        [0.26241543889,0.796284377575,0.545040607452],
-                        [0.284414708614,0.829719662666,0.480284929276],
-                        [0.171839639544,0.759706020355,0.627150595188],
-                        [0.213841319084,0.715529501438,0.665048420429],
-                        [0.238753452897,0.757998526096,0.606988489628],
-                        [0.308011889458,0.752189457417,0.582528710365],
-                        [0.353819847107,0.701809465885,0.618283927441],
-                        [0.378517180681,0.74177056551,0.553625464439],
-                        [0.238753452897,0.757998526096,0.606988489628],
-                        [0.308011889458,0.752189457417,0.582528710365],
-                        [0.26241543889,0.796284377575,0.545040607452],
-                        [0.762617051601,0.340069264174,0.550243675709],
-                        [0.733673810959,0.298754066229,0.610302150249],
-                        [0.782811582088,0.269586592913,0.560828924179],
-                        [0.65135627985,0.398910075426,0.645450055599],
-                        [0.618283927441,0.353819847107,0.701809465885],
-                        [0.678621411324,0.327040165663,0.657660841942],
-                        [0.700865805149,0.256401896477,0.665616393089],
-                        [0.665048420429,0.213841319084,0.715529501438],
-                        [0.718357801437,0.188148602843,0.669747889042],
-                        [0.678621411324,0.327040165663,0.657660841942],
-                        [0.700865805149,0.256401896477,0.665616393089],
-                        [0.733673810959,0.298754066229,0.610302150249],
-                        [0.520354926586,0.44894811511,0.726413309574],
-                        [0.485873311758,0.400663375854,0.776785671711],
-                        [0.553625464439,0.378517180681,0.74177056551],
-                        [0.379529476166,0.486395716667,0.787004828453],
-                        [0.346611320972,0.436200261116,0.830415487289],
-                        [0.416404157877,0.419940322638,0.806385576725],
-                        [0.450116455555,0.352179646492,0.820587992668],
-                        [0.413926929235,0.3044308424,0.857896447182],
-                        [0.480284929276,0.284414708614,0.829719662666],
-                        [0.416404157877,0.419940322638,0.806385576725],
-                        [0.450116455555,0.352179646492,0.820587992668],
-                        [0.485873311758,0.400663375854,0.776785671711],
-                        [0.627150595188,0.171839639544,0.759706020355],
-                        [0.588087081909,0.131048902869,0.798110127449],
-                        [0.643326640129,0.108097285032,0.757922053337],
-                        [0.506734728813,0.217834427953,0.834127128124],
-                        [0.468421578407,0.174905076623,0.866019308567],
-                        [0.529480218887,0.153434738517,0.834331154823],
-                        [0.548688352108,0.091976031661,0.830952167511],
-                        [0.509656965733,0.0549761541188,0.858619451523],
-                        [0.564633131027,0.0339771322906,0.82464236021],
-                        [0.529480218887,0.153434738517,0.834331154823],
-                        [0.548688352108,0.091976031661,0.830952167511],
-                        [0.588087081909,0.131048902869,0.798110127449],
-                        [0.553625464439,0.378517180681,0.74177056551],
-                        [0.582528710365,0.308011889458,0.752189457417],
-                        [0.618283927441,0.353819847107,0.701809465885],
-                        [0.480284929276,0.284414708614,0.829719662666],
-                        [0.506734728813,0.217834427953,0.834127128124],
-                        [0.545040607452,0.26241543889,0.796284377575],
-                        [0.606988489628,0.238753452897,0.757998526096],
-                        [0.627150595188,0.171839639544,0.759706020355],
-                        [0.665048420429,0.213841319084,0.715529501438],
-                        [0.545040607452,0.26241543889,0.796284377575],
-                        [0.606988489628,0.238753452897,0.757998526096],
-                        [0.582528710365,0.308011889458,0.752189457417],
-                        [0.486395716667,0.787004828453,0.379529476166],
-                        [0.535965919495,0.737060189247,0.411682873964],
-                        [0.550243675709,0.762617051601,0.340069264174],
-                        [0.44894811511,0.726413309574,0.520354926586],
-                        [0.495975226164,0.669751524925,0.552667617798],
-                        [0.517854511738,0.706037700176,0.483050197363],
-                        [0.58378881216,0.680853009224,0.44230055809],
-                        [0.628728508949,0.619044244289,0.470621615648],
-                        [0.645450055599,0.65135627985,0.398910075426],
-                        [0.517854511738,0.706037700176,0.483050197363],
-                        [0.58378881216,0.680853009224,0.44230055809],
-                        [0.535965919495,0.737060189247,0.411682873964],
-                        [0.398910075426,0.645450055599,0.65135627985],
-                        [0.44230055809,0.58378881216,0.680853009224],
-                        [0.470621615648,0.628728508949,0.619044244289],
-                        [0.340069264174,0.550243675709,0.762617051601],
-                        [0.379529476166,0.486395716667,0.787004828453],
-                        [0.411682873964,0.535965919495,0.737060189247],
-                        [0.483050197363,0.517854511738,0.706037700176],
-                        [0.520354926586,0.44894811511,0.726413309574],
-                        [0.552667617798,0.495975226164,0.669751524925],
-                        [0.411682873964,0.535965919495,0.737060189247],
-                        [0.483050197363,0.517854511738,0.706037700176],
-                        [0.44230055809,0.58378881216,0.680853009224],
-                        [0.669751524925,0.552667617798,0.495975226164],
-                        [0.706037700176,0.483050197363,0.517854511738],
-                        [0.726413309574,0.520354926586,0.44894811511],
-                        [0.619044244289,0.470621615648,0.628728508949],
-                        [0.65135627985,0.398910075426,0.645450055599],
-                        [0.680853009224,0.44230055809,0.58378881216],
-                        [0.737060189247,0.411682873964,0.535965919495],
-                        [0.762617051601,0.340069264174,0.550243675709],
-                        [0.787004828453,0.379529476166,0.486395716667],
-                        [0.680853009224,0.44230055809,0.58378881216],
-                        [0.737060189247,0.411682873964,0.535965919495],
-                        [0.706037700176,0.483050197363,0.517854511738],
-                        [0.470621615648,0.628728508949,0.619044244289],
-                        [0.540649950504,0.607478022575,0.581951975822],
-                        [0.495975226164,0.669751524925,0.552667617798],
-                        [0.552667617798,0.495975226164,0.669751524925],
-                        [0.619044244289,0.470621615648,0.628728508949],
-                        [0.581951975822,0.540649950504,0.607478022575],
-                        [0.607478022575,0.581951975822,0.540649950504],
-                        [0.669751524925,0.552667617798,0.495975226164],
-                        [0.628728508949,0.619044244289,0.470621615648],
-                        [0.581951975822,0.540649950504,0.607478022575],
-                        [0.607478022575,0.581951975822,0.540649950504],
-                        [0.540649950504,0.607478022575,0.581951975822],
-                        [0.8796184659,-0.475679844618,0.0],
-                        [0.887796461582,-0.456712335348,0.0568443164229],
-                        [0.858619451523,-0.509656965733,0.0549761541188],
-                        [0.932827115059,-0.360324263573,0.0],
-                        [0.940329909325,-0.334895044565,0.0602079555392],
-                        [0.915323853493,-0.398431301117,0.0586068555713],
-                        [0.892938017845,-0.434652328491,0.117213711143],
-                        [0.894335091114,-0.409316182137,0.180623859167],
-                        [0.866019308567,-0.468421578407,0.174905076623],
-                        [0.915323853493,-0.398431301117,0.0586068555713],
-                        [0.892938017845,-0.434652328491,0.117213711143],
-                        [0.887796461582,-0.456712335348,0.0568443164229],
-                        [0.974178731441,-0.225778326392,0.0],
-                        [0.979053080082,-0.193714544177,0.0626873448491],
-                        [0.961880862713,-0.266443610191,0.0615878328681],
-                        [0.997029185295,-0.0770247355103,0.0],
-                        [0.997179210186,-0.0394601933658,0.0638479366899],
-                        [0.991025745869,-0.117650069296,0.0634539350867],
-                        [0.978907585144,-0.158833146095,0.128498718143],
-                        [0.97295331955,-0.121444880962,0.196501940489],
-                        [0.960443258286,-0.199805602431,0.193975359201],
-                        [0.991025745869,-0.117650069296,0.0634539350867],
-                        [0.978907585144,-0.158833146095,0.128498718143],
-                        [0.979053080082,-0.193714544177,0.0626873448491],
-                        [0.891307473183,-0.380633711815,0.246351331472],
-                        [0.883275330067,-0.348686188459,0.313436716795],
-                        [0.857896447182,-0.413926929235,0.3044308424],
-                        [0.935745954514,-0.239766731858,0.258633822203],
-                        [0.922915279865,-0.202408134937,0.327503234148],
-                        [0.905284404755,-0.277958005667,0.321246802807],
-                        [0.869839549065,-0.313733518124,0.380723625422],
-                        [0.85085272789,-0.276221334934,0.446935534477],
-                        [0.830415487289,-0.346611320972,0.436200261116],
-                        [0.905284404755,-0.277958005667,0.321246802807],
-                        [0.869839549065,-0.313733518124,0.380723625422],
-                        [0.883275330067,-0.348686188459,0.313436716795],
-                        [0.961880862713,-0.266443610191,0.0615878328681],
-                        [0.943842172623,-0.306287169456,0.123895764351],
-                        [0.940329909325,-0.334895044565,0.0602079555392],
-                        [0.960443258286,-0.199805602431,0.193975359201],
-                        [0.935745954514,-0.239766731858,0.258633822203],
-                        [0.942551255226,-0.274516820908,0.190361812711],
-                        [0.920180141926,-0.34457308054,0.185843646526],
-                        [0.891307473183,-0.380633711815,0.246351331472],
-                        [0.894335091114,-0.409316182137,0.180623859167],
-                        [0.942551255226,-0.274516820908,0.190361812711],
-                        [0.920180141926,-0.34457308054,0.185843646526],
-                        [0.943842172623,-0.306287169456,0.123895764351],
-                        [0.997029185295,0.0770247355103,0.0],
-                        [0.991025745869,0.117650069296,0.0634539350867],
-                        [0.997179210186,0.0394601933658,0.0638479366899],
-                        [0.974178731441,0.225778326392,0.0],
-                        [0.961880862713,0.266443610191,0.0615878328681],
-                        [0.979053080082,0.193714544177,0.0626873448491],
-                        [0.978907585144,0.158833146095,0.128498718143],
-                        [0.960443258286,0.199805602431,0.193975359201],
-                        [0.97295331955,0.121444880962,0.196501940489],
-                        [0.979053080082,0.193714544177,0.0626873448491],
-                        [0.978907585144,0.158833146095,0.128498718143],
-                        [0.991025745869,0.117650069296,0.0634539350867],
-                        [0.932827115059,0.360324263573,0.0],
-                        [0.915323853493,0.398431301117,0.0586068555713],
-                        [0.940329909325,0.334895044565,0.0602079555392],
-                        [0.8796184659,0.475679844618,0.0],
-                        [0.858619451523,0.509656965733,0.0549761541188],
-                        [0.887796461582,0.456712335348,0.0568443164229],
-                        [0.892938017845,0.434652328491,0.117213711143],
-                        [0.866019308567,0.468421578407,0.174905076623],
-                        [0.894335091114,0.409316182137,0.180623859167],
-                        [0.887796461582,0.456712335348,0.0568443164229],
-                        [0.892938017845,0.434652328491,0.117213711143],
-                        [0.915323853493,0.398431301117,0.0586068555713],
-                        [0.935745954514,0.239766731858,0.258633822203],
-                        [0.905284404755,0.277958005667,0.321246802807],
-                        [0.922915279865,0.202408134937,0.327503234148],
-                        [0.891307473183,0.380633711815,0.246351331472],
-                        [0.857896447182,0.413926929235,0.3044308424],
-                        [0.883275330067,0.348686188459,0.313436716795],
-                        [0.869839549065,0.313733518124,0.380723625422],
-                        [0.830415487289,0.346611320972,0.436200261116],
-                        [0.85085272789,0.276221334934,0.446935534477],
-                        [0.883275330067,0.348686188459,0.313436716795],
-                        [0.869839549065,0.313733518124,0.380723625422],
-                        [0.905284404755,0.277958005667,0.321246802807],
-                        [0.940329909325,0.334895044565,0.0602079555392],
-                        [0.943842172623,0.306287169456,0.123895764351],
-                        [0.961880862713,0.266443610191,0.0615878328681],
-                        [0.894335091114,0.409316182137,0.180623859167],
-                        [0.891307473183,0.380633711815,0.246351331472],
-                        [0.920180141926,0.34457308054,0.185843646526],
-                        [0.942551255226,0.274516820908,0.190361812711],
-                        [0.935745954514,0.239766731858,0.258633822203],
-                        [0.960443258286,0.199805602431,0.193975359201],
-                        [0.920180141926,0.34457308054,0.185843646526],
-                        [0.942551255226,0.274516820908,0.190361812711],
-                        [0.943842172623,0.306287169456,0.123895764351],
-                        [0.826465010643,-0.236761152744,0.510783493519],
-                        [0.797127783298,-0.196083456278,0.571085453033],
-                        [0.782811582088,-0.269586592913,0.560828924179],
-                        [0.847858190536,-0.0809632539749,0.524005174637],
-                        [0.81225925684,-0.0399611219764,0.581926107407],
-                        [0.807120084763,-0.119124859571,0.578244268894],
-                        [0.763553202152,-0.154971644282,0.62687343359],
-                        [0.726636230946,-0.114190116525,0.677466154099],
-                        [0.718357801437,-0.188148602843,0.669747889042],
-                        [0.807120084763,-0.119124859571,0.578244268894],
-                        [0.763553202152,-0.154971644282,0.62687343359],
-                        [0.797127783298,-0.196083456278,0.571085453033],
-                        [0.847858190536,0.0809632539749,0.524005174637],
-                        [0.807120084763,0.119124859571,0.578244268894],
-                        [0.81225925684,0.0399611219764,0.581926107407],
-                        [0.826465010643,0.236761152744,0.510783493519],
-                        [0.782811582088,0.269586592913,0.560828924179],
-                        [0.797127783298,0.196083456278,0.571085453033],
-                        [0.763553202152,0.154971644282,0.62687343359],
-                        [0.718357801437,0.188148602843,0.669747889042],
-                        [0.726636230946,0.114190116525,0.677466154099],
-                        [0.797127783298,0.196083456278,0.571085453033],
-                        [0.763553202152,0.154971644282,0.62687343359],
-                        [0.807120084763,0.119124859571,0.578244268894],
-                        [0.687358558178,-0.0744211226702,0.722495436668],
-                        [0.646693944931,-0.0362210273743,0.761889100075],
-                        [0.643326640129,-0.108097285032,0.757922053337],
-                        [0.687358558178,0.0744211226702,0.722495436668],
-                        [0.643326640129,0.108097285032,0.757922053337],
-                        [0.646693944931,0.0362210273743,0.761889100075],
-                        [0.605532705784,0.0,0.79582041502],
-                        [0.564633131027,0.0339771322906,0.82464236021],
-                        [0.564633131027,-0.0339771322906,0.82464236021],
-                        [0.646693944931,0.0362210273743,0.761889100075],
-                        [0.605532705784,0.0,0.79582041502],
-                        [0.646693944931,-0.0362210273743,0.761889100075],
-                        [0.81225925684,0.0399611219764,0.581926107407],
-                        [0.772890508175,0.0,0.634539365768],
-                        [0.81225925684,-0.0399611219764,0.581926107407],
-                        [0.726636230946,0.114190116525,0.677466154099],
-                        [0.687358558178,0.0744211226702,0.722495436668],
-                        [0.730884253979,0.0382858961821,0.68142670393],
-                        [0.730884253979,-0.0382858961821,0.68142670393],
-                        [0.687358558178,-0.0744211226702,0.722495436668],
-                        [0.726636230946,-0.114190116525,0.677466154099],
-                        [0.730884253979,0.0382858961821,0.68142670393],
-                        [0.730884253979,-0.0382858961821,0.68142670393],
-                        [0.772890508175,0.0,0.634539365768],
-                        [0.997179210186,0.0394601933658,0.0638479366899],
-                        [0.991494178772,0.0,0.130150929093],
-                        [0.997179210186,-0.0394601933658,0.0638479366899],
-                        [0.97295331955,0.121444880962,0.196501940489],
-                        [0.960611641407,0.0820460245013,0.265506535769],
-                        [0.979394435883,0.0407496243715,0.197802826762],
-                        [0.979394435883,-0.0407496243715,0.197802826762],
-                        [0.960611641407,-0.0820460245013,0.265506535769],
-                        [0.97295331955,-0.121444880962,0.196501940489],
-                        [0.979394435883,0.0407496243715,0.197802826762],
-                        [0.979394435883,-0.0407496243715,0.197802826762],
-                        [0.991494178772,0.0,0.130150929093],
-                        [0.922915279865,0.202408134937,0.327503234148],
-                        [0.903840482235,0.162998497486,0.395605653524],
-                        [0.935258030891,0.123069040477,0.33188316226],
-                        [0.85085272789,0.276221334934,0.446935534477],
-                        [0.826465010643,0.236761152744,0.510783493519],
-                        [0.867211103439,0.20109423995,0.455528259277],
-                        [0.878655850887,0.122248865664,0.461539924145],
-                        [0.847858190536,0.0809632539749,0.524005174637],
-                        [0.88455080986,0.0410230122507,0.464636415243],
-                        [0.867211103439,0.20109423995,0.455528259277],
-                        [0.878655850887,0.122248865664,0.461539924145],
-                        [0.903840482235,0.162998497486,0.395605653524],
-                        [0.935258030891,-0.123069040477,0.33188316226],
-                        [0.903840482235,-0.162998497486,0.395605653524],
-                        [0.922915279865,-0.202408134937,0.327503234148],
-                        [0.88455080986,-0.0410230122507,0.464636415243],
-                        [0.847858190536,-0.0809632539749,0.524005174637],
-                        [0.878655850887,-0.122248865664,0.461539924145],
-                        [0.867211103439,-0.20109423995,0.455528259277],
-                        [0.826465010643,-0.236761152744,0.510783493519],
-                        [0.85085272789,-0.276221334934,0.446935534477],
-                        [0.878655850887,-0.122248865664,0.461539924145],
-                        [0.867211103439,-0.20109423995,0.455528259277],
-                        [0.903840482235,-0.162998497486,0.395605653524],
-                        [0.935258030891,0.123069040477,0.33188316226],
-                        [0.941618084908,0.04130198434,0.334140062332],
-                        [0.960611641407,0.0820460245013,0.265506535769],
-                        [0.88455080986,0.0410230122507,0.464636415243],
-                        [0.88455080986,-0.0410230122507,0.464636415243],
-                        [0.916092038155,0.0,0.400968074799],
-                        [0.941618084908,-0.04130198434,0.334140062332],
-                        [0.935258030891,-0.123069040477,0.33188316226],
-                        [0.960611641407,-0.0820460245013,0.265506535769],
-                        [0.916092038155,0.0,0.400968074799],
-                        [0.941618084908,-0.04130198434,0.334140062332],
-                        [0.941618084908,0.04130198434,0.334140062332],
-                        [-0.564633131027,0.0339771322906,0.82464236021],
-                        [-0.605532705784,0.0,0.79582041502],
-                        [-0.564633131027,-0.0339771322906,0.82464236021],
-                        [-0.643326640129,0.108097285032,0.757922053337],
-                        [-0.687358558178,0.0744211226702,0.722495436668],
-                        [-0.646693944931,0.0362210273743,0.761889100075],
-                        [-0.646693944931,-0.0362210273743,0.761889100075],
-                        [-0.687358558178,-0.0744211226702,0.722495436668],
-                        [-0.643326640129,-0.108097285032,0.757922053337],
-                        [-0.646693944931,0.0362210273743,0.761889100075],
-                        [-0.646693944931,-0.0362210273743,0.761889100075],
-                        [-0.605532705784,0.0,0.79582041502],
-                        [-0.718357801437,0.188148602843,0.669747889042],
-                        [-0.763553202152,0.154971644282,0.62687343359],
-                        [-0.726636230946,0.114190116525,0.677466154099],
-                        [-0.782811582088,0.269586592913,0.560828924179],
-                        [-0.826465010643,0.236761152744,0.510783493519],
-                        [-0.797127783298,0.196083456278,0.571085453033],
-                        [-0.807120084763,0.119124859571,0.578244268894],
-                        [-0.847858190536,0.0809632539749,0.524005174637],
-                        [-0.81225925684,0.0399611219764,0.581926107407],
-                        [-0.797127783298,0.196083456278,0.571085453033],
-                        [-0.807120084763,0.119124859571,0.578244268894],
-                        [-0.763553202152,0.154971644282,0.62687343359],
-                        [-0.726636230946,-0.114190116525,0.677466154099],
-                        [-0.763553202152,-0.154971644282,0.62687343359],
-                        [-0.718357801437,-0.188148602843,0.669747889042],
-                        [-0.81225925684,-0.0399611219764,0.581926107407],
-                        [-0.847858190536,-0.0809632539749,0.524005174637],
-                        [-0.807120084763,-0.119124859571,0.578244268894],
-                        [-0.797127783298,-0.196083456278,0.571085453033],
-                        [-0.826465010643,-0.236761152744,0.510783493519],
-                        [-0.782811582088,-0.269586592913,0.560828924179],
-                        [-0.807120084763,-0.119124859571,0.578244268894],
-                        [-0.797127783298,-0.196083456278,0.571085453033],
-                        [-0.763553202152,-0.154971644282,0.62687343359],
-                        [-0.726636230946,0.114190116525,0.677466154099],
-                        [-0.730884253979,0.0382858961821,0.68142670393],
-                        [-0.687358558178,0.0744211226702,0.722495436668],
-                        [-0.81225925684,0.0399611219764,0.581926107407],
-                        [-0.81225925684,-0.0399611219764,0.581926107407],
-                        [-0.772890508175,0.0,0.634539365768],
-                        [-0.730884253979,-0.0382858961821,0.68142670393],
-                        [-0.726636230946,-0.114190116525,0.677466154099],
-                        [-0.687358558178,-0.0744211226702,0.722495436668],
-                        [-0.772890508175,0.0,0.634539365768],
-                        [-0.730884253979,-0.0382858961821,0.68142670393],
-                        [-0.730884253979,0.0382858961821,0.68142670393],
-                        [-0.830415487289,0.346611320972,0.436200261116],
-                        [-0.869839549065,0.313733518124,0.380723625422],
-                        [-0.85085272789,0.276221334934,0.446935534477],
-                        [-0.857896447182,0.413926929235,0.3044308424],
-                        [-0.891307473183,0.380633711815,0.246351331472],
-                        [-0.883275330067,0.348686188459,0.313436716795],
-                        [-0.905284404755,0.277958005667,0.321246802807],
-                        [-0.935745954514,0.239766731858,0.258633822203],
-                        [-0.922915279865,0.202408134937,0.327503234148],
-                        [-0.883275330067,0.348686188459,0.313436716795],
-                        [-0.905284404755,0.277958005667,0.321246802807],
-                        [-0.869839549065,0.313733518124,0.380723625422],
-                        [-0.866019308567,0.468421578407,0.174905076623],
-                        [-0.892938017845,0.434652328491,0.117213711143],
-                        [-0.894335091114,0.409316182137,0.180623859167],
-                        [-0.858619451523,0.509656965733,0.0549761541188],
-                        [-0.8796184659,0.475679844618,0.0],
-                        [-0.887796461582,0.456712335348,0.0568443164229],
-                        [-0.915323853493,0.398431301117,0.0586068555713],
-                        [-0.932827115059,0.360324263573,0.0],
-                        [-0.940329909325,0.334895044565,0.0602079555392],
-                        [-0.887796461582,0.456712335348,0.0568443164229],
-                        [-0.915323853493,0.398431301117,0.0586068555713],
-                        [-0.892938017845,0.434652328491,0.117213711143],
-                        [-0.960443258286,0.199805602431,0.193975359201],
-                        [-0.978907585144,0.158833146095,0.128498718143],
-                        [-0.97295331955,0.121444880962,0.196501940489],
-                        [-0.961880862713,0.266443610191,0.0615878328681],
-                        [-0.974178731441,0.225778326392,0.0],
-                        [-0.979053080082,0.193714544177,0.0626873448491],
-                        [-0.991025745869,0.117650069296,0.0634539350867],
-                        [-0.997029185295,0.0770247355103,0.0],
-                        [-0.997179210186,0.0394601933658,0.0638479366899],
-                        [-0.979053080082,0.193714544177,0.0626873448491],
-                        [-0.991025745869,0.117650069296,0.0634539350867],
-                        [-0.978907585144,0.158833146095,0.128498718143],
-                        [-0.894335091114,0.409316182137,0.180623859167],
-                        [-0.920180141926,0.34457308054,0.185843646526],
-                        [-0.891307473183,0.380633711815,0.246351331472],
-                        [-0.940329909325,0.334895044565,0.0602079555392],
-                        [-0.961880862713,0.266443610191,0.0615878328681],
-                        [-0.943842172623,0.306287169456,0.123895764351],
-                        [-0.942551255226,0.274516820908,0.190361812711],
-                        [-0.960443258286,0.199805602431,0.193975359201],
-                        [-0.935745954514,0.239766731858,0.258633822203],
-                        [-0.943842172623,0.306287169456,0.123895764351],
-                        [-0.942551255226,0.274516820908,0.190361812711],
-                        [-0.920180141926,0.34457308054,0.185843646526],
-                        [-0.85085272789,-0.276221334934,0.446935534477],
-                        [-0.869839549065,-0.313733518124,0.380723625422],
-                        [-0.830415487289,-0.346611320972,0.436200261116],
-                        [-0.922915279865,-0.202408134937,0.327503234148],
-                        [-0.935745954514,-0.239766731858,0.258633822203],
-                        [-0.905284404755,-0.277958005667,0.321246802807],
-                        [-0.883275330067,-0.348686188459,0.313436716795],
-                        [-0.891307473183,-0.380633711815,0.246351331472],
-                        [-0.857896447182,-0.413926929235,0.3044308424],
-                        [-0.905284404755,-0.277958005667,0.321246802807],
-                        [-0.883275330067,-0.348686188459,0.313436716795],
-                        [-0.869839549065,-0.313733518124,0.380723625422],
-                        [-0.97295331955,-0.121444880962,0.196501940489],
-                        [-0.978907585144,-0.158833146095,0.128498718143],
-                        [-0.960443258286,-0.199805602431,0.193975359201],
-                        [-0.997179210186,-0.0394601933658,0.0638479366899],
-                        [-0.997029185295,-0.0770247355103,0.0],
-                        [-0.991025745869,-0.117650069296,0.0634539350867],
-                        [-0.979053080082,-0.193714544177,0.0626873448491],
-                        [-0.974178731441,-0.225778326392,0.0],
-                        [-0.961880862713,-0.266443610191,0.0615878328681],
-                        [-0.991025745869,-0.117650069296,0.0634539350867],
-                        [-0.979053080082,-0.193714544177,0.0626873448491],
-                        [-0.978907585144,-0.158833146095,0.128498718143],
-                        [-0.894335091114,-0.409316182137,0.180623859167],
-                        [-0.892938017845,-0.434652328491,0.117213711143],
-                        [-0.866019308567,-0.468421578407,0.174905076623],
-                        [-0.940329909325,-0.334895044565,0.0602079555392],
-                        [-0.932827115059,-0.360324263573,0.0],
-                        [-0.915323853493,-0.398431301117,0.0586068555713],
-                        [-0.887796461582,-0.456712335348,0.0568443164229],
-                        [-0.8796184659,-0.475679844618,0.0],
-                        [-0.858619451523,-0.509656965733,0.0549761541188],
-                        [-0.915323853493,-0.398431301117,0.0586068555713],
-                        [-0.887796461582,-0.456712335348,0.0568443164229],
-                        [-0.892938017845,-0.434652328491,0.117213711143],
-                        [-0.960443258286,-0.199805602431,0.193975359201],
-                        [-0.942551255226,-0.274516820908,0.190361812711],
-                        [-0.935745954514,-0.239766731858,0.258633822203],
-                        [-0.961880862713,-0.266443610191,0.0615878328681],
-                        [-0.940329909325,-0.334895044565,0.0602079555392],
-                        [-0.943842172623,-0.306287169456,0.123895764351],
-                        [-0.920180141926,-0.34457308054,0.185843646526],
-                        [-0.894335091114,-0.409316182137,0.180623859167],
-                        [-0.891307473183,-0.380633711815,0.246351331472],
-                        [-0.943842172623,-0.306287169456,0.123895764351],
-                        [-0.920180141926,-0.34457308054,0.185843646526],
-                        [-0.942551255226,-0.274516820908,0.190361812711],
-                        [-0.85085272789,0.276221334934,0.446935534477],
-                        [-0.867211103439,0.20109423995,0.455528259277],
-                        [-0.826465010643,0.236761152744,0.510783493519],
-                        [-0.922915279865,0.202408134937,0.327503234148],
-                        [-0.935258030891,0.123069040477,0.33188316226],
-                        [-0.903840482235,0.162998497486,0.395605653524],
-                        [-0.878655850887,0.122248865664,0.461539924145],
-                        [-0.88455080986,0.0410230122507,0.464636415243],
-                        [-0.847858190536,0.0809632539749,0.524005174637],
-                        [-0.903840482235,0.162998497486,0.395605653524],
-                        [-0.878655850887,0.122248865664,0.461539924145],
-                        [-0.867211103439,0.20109423995,0.455528259277],
-                        [-0.97295331955,0.121444880962,0.196501940489],
-                        [-0.979394435883,0.0407496243715,0.197802826762],
-                        [-0.960611641407,0.0820460245013,0.265506535769],
-                        [-0.997179210186,0.0394601933658,0.0638479366899],
-                        [-0.997179210186,-0.0394601933658,0.0638479366899],
-                        [-0.991494178772,0.0,0.130150929093],
-                        [-0.979394435883,-0.0407496243715,0.197802826762],
-                        [-0.97295331955,-0.121444880962,0.196501940489],
-                        [-0.960611641407,-0.0820460245013,0.265506535769],
-                        [-0.991494178772,0.0,0.130150929093],
-                        [-0.979394435883,-0.0407496243715,0.197802826762],
-                        [-0.979394435883,0.0407496243715,0.197802826762],
-                        [-0.88455080986,-0.0410230122507,0.464636415243],
-                        [-0.878655850887,-0.122248865664,0.461539924145],
-                        [-0.847858190536,-0.0809632539749,0.524005174637],
-                        [-0.935258030891,-0.123069040477,0.33188316226],
-                        [-0.922915279865,-0.202408134937,0.327503234148],
-                        [-0.903840482235,-0.162998497486,0.395605653524],
-                        [-0.867211103439,-0.20109423995,0.455528259277],
-                        [-0.85085272789,-0.276221334934,0.446935534477],
-                        [-0.826465010643,-0.236761152744,0.510783493519],
-                        [-0.903840482235,-0.162998497486,0.395605653524],
-                        [-0.867211103439,-0.20109423995,0.455528259277],
-                        [-0.878655850887,-0.122248865664,0.461539924145],
-                        [-0.960611641407,0.0820460245013,0.265506535769],
-                        [-0.941618084908,0.04130198434,0.334140062332],
-                        [-0.935258030891,0.123069040477,0.33188316226],
-                        [-0.960611641407,-0.0820460245013,0.265506535769],
-                        [-0.935258030891,-0.123069040477,0.33188316226],
-                        [-0.941618084908,-0.04130198434,0.334140062332],
-                        [-0.916092038155,0.0,0.400968074799],
-                        [-0.88455080986,-0.0410230122507,0.464636415243],
-                        [-0.88455080986,0.0410230122507,0.464636415243],
-                        [-0.941618084908,-0.04130198434,0.334140062332],
-                        [-0.916092038155,0.0,0.400968074799],
-                        [-0.941618084908,0.04130198434,0.334140062332],
-                        [-0.509656965733,0.0549761541188,0.858619451523],
-                        [-0.548688352108,0.091976031661,0.830952167511],
-                        [-0.564633131027,0.0339771322906,0.82464236021],
-                        [-0.468421578407,0.174905076623,0.866019308567],
-                        [-0.506734728813,0.217834427953,0.834127128124],
-                        [-0.529480218887,0.153434738517,0.834331154823],
-                        [-0.588087081909,0.131048902869,0.798110127449],
-                        [-0.627150595188,0.171839639544,0.759706020355],
-                        [-0.643326640129,0.108097285032,0.757922053337],
-                        [-0.529480218887,0.153434738517,0.834331154823],
-                        [-0.588087081909,0.131048902869,0.798110127449],
-                        [-0.548688352108,0.091976031661,0.830952167511],
-                        [-0.413926929235,0.3044308424,0.857896447182],
-                        [-0.450116455555,0.352179646492,0.820587992668],
-                        [-0.480284929276,0.284414708614,0.829719662666],
-                        [-0.346611320972,0.436200261116,0.830415487289],
-                        [-0.379529476166,0.486395716667,0.787004828453],
-                        [-0.416404157877,0.419940322638,0.806385576725],
-                        [-0.485873311758,0.400663375854,0.776785671711],
-                        [-0.520354926586,0.44894811511,0.726413309574],
-                        [-0.553625464439,0.378517180681,0.74177056551],
-                        [-0.416404157877,0.419940322638,0.806385576725],
-                        [-0.485873311758,0.400663375854,0.776785671711],
-                        [-0.450116455555,0.352179646492,0.820587992668],
-                        [-0.665048420429,0.213841319084,0.715529501438],
-                        [-0.700865805149,0.256401896477,0.665616393089],
-                        [-0.718357801437,0.188148602843,0.669747889042],
-                        [-0.618283927441,0.353819847107,0.701809465885],
-                        [-0.65135627985,0.398910075426,0.645450055599],
-                        [-0.678621411324,0.327040165663,0.657660841942],
-                        [-0.733673810959,0.298754066229,0.610302150249],
-                        [-0.762617051601,0.340069264174,0.550243675709],
-                        [-0.782811582088,0.269586592913,0.560828924179],
-                        [-0.678621411324,0.327040165663,0.657660841942],
-                        [-0.733673810959,0.298754066229,0.610302150249],
-                        [-0.700865805149,0.256401896477,0.665616393089],
-                        [-0.480284929276,0.284414708614,0.829719662666],
-                        [-0.545040607452,0.26241543889,0.796284377575],
-                        [-0.506734728813,0.217834427953,0.834127128124],
-                        [-0.553625464439,0.378517180681,0.74177056551],
-                        [-0.618283927441,0.353819847107,0.701809465885],
-                        [-0.582528710365,0.308011889458,0.752189457417],
-                        [-0.606988489628,0.238753452897,0.757998526096],
-                        [-0.665048420429,0.213841319084,0.715529501438],
-                        [-0.627150595188,0.171839639544,0.759706020355],
-                        [-0.582528710365,0.308011889458,0.752189457417],
-                        [-0.606988489628,0.238753452897,0.757998526096],
-                        [-0.545040607452,0.26241543889,0.796284377575],
-                        [-0.269586592913,0.560828924179,0.782811582088],
-                        [-0.298754066229,0.610302150249,0.733673810959],
-                        [-0.340069264174,0.550243675709,0.762617051601],
-                        [-0.188148602843,0.669747889042,0.718357801437],
-                        [-0.213841319084,0.715529501438,0.665048420429],
-                        [-0.256401896477,0.665616393089,0.700865805149],
-                        [-0.327040165663,0.657660841942,0.678621411324],
-                        [-0.353819847107,0.701809465885,0.618283927441],
-                        [-0.398910075426,0.645450055599,0.65135627985],
-                        [-0.256401896477,0.665616393089,0.700865805149],
-                        [-0.327040165663,0.657660841942,0.678621411324],
-                        [-0.298754066229,0.610302150249,0.733673810959],
-                        [-0.108097285032,0.757922053337,0.643326640129],
-                        [-0.131048902869,0.798110127449,0.588087081909],
-                        [-0.171839639544,0.759706020355,0.627150595188],
-                        [-0.0339771322906,0.82464236021,0.564633131027],
-                        [-0.0549761541188,0.858619451523,0.509656965733],
-                        [-0.091976031661,0.830952167511,0.548688352108],
-                        [-0.153434738517,0.834331154823,0.529480218887],
-                        [-0.174905076623,0.866019308567,0.468421578407],
-                        [-0.217834427953,0.834127128124,0.506734728813],
-                        [-0.091976031661,0.830952167511,0.548688352108],
-                        [-0.153434738517,0.834331154823,0.529480218887],
-                        [-0.131048902869,0.798110127449,0.588087081909],
-                        [-0.378517180681,0.74177056551,0.553625464439],
-                        [-0.400663375854,0.776785671711,0.485873311758],
-                        [-0.44894811511,0.726413309574,0.520354926586],
-                        [-0.284414708614,0.829719662666,0.480284929276],
-                        [-0.3044308424,0.857896447182,0.413926929235],
-                        [-0.352179646492,0.820587992668,0.450116455555],
-                        [-0.419940322638,0.806385576725,0.416404157877],
-                        [-0.436200261116,0.830415487289,0.346611320972],
-                        [-0.486395716667,0.787004828453,0.379529476166],
-                        [-0.352179646492,0.820587992668,0.450116455555],
-                        [-0.419940322638,0.806385576725,0.416404157877],
-                        [-0.400663375854,0.776785671711,0.485873311758],
-                        [-0.171839639544,0.759706020355,0.627150595188],
-                        [-0.238753452897,0.757998526096,0.606988489628],
-                        [-0.213841319084,0.715529501438,0.665048420429],
-                        [-0.217834427953,0.834127128124,0.506734728813],
-                        [-0.284414708614,0.829719662666,0.480284929276],
-                        [-0.26241543889,0.796284377575,0.545040607452],
-                        [-0.308011889458,0.752189457417,0.582528710365],
-                        [-0.378517180681,0.74177056551,0.553625464439],
-                        [-0.353819847107,0.701809465885,0.618283927441],
-                        [-0.26241543889,0.796284377575,0.545040607452],
-                        [-0.308011889458,0.752189457417,0.582528710365],
-                        [-0.238753452897,0.757998526096,0.606988489628],
-                        [-0.787004828453,0.379529476166,0.486395716667],
-                        [-0.806385576725,0.416404157877,0.419940322638],
-                        [-0.830415487289,0.346611320972,0.436200261116],
-                        [-0.726413309574,0.520354926586,0.44894811511],
-                        [-0.74177056551,0.553625464439,0.378517180681],
-                        [-0.776785671711,0.485873311758,0.400663375854],
-                        [-0.820587992668,0.450116455555,0.352179646492],
-                        [-0.829719662666,0.480284929276,0.284414708614],
-                        [-0.857896447182,0.413926929235,0.3044308424],
-                        [-0.776785671711,0.485873311758,0.400663375854],
-                        [-0.820587992668,0.450116455555,0.352179646492],
-                        [-0.806385576725,0.416404157877,0.419940322638],
-                        [-0.645450055599,0.65135627985,0.398910075426],
-                        [-0.657660841942,0.678621411324,0.327040165663],
-                        [-0.701809465885,0.618283927441,0.353819847107],
-                        [-0.550243675709,0.762617051601,0.340069264174],
-                        [-0.560828924179,0.782811582088,0.269586592913],
-                        [-0.610302150249,0.733673810959,0.298754066229],
-                        [-0.665616393089,0.700865805149,0.256401896477],
-                        [-0.669747889042,0.718357801437,0.188148602843],
-                        [-0.715529501438,0.665048420429,0.213841319084],
-                        [-0.610302150249,0.733673810959,0.298754066229],
-                        [-0.665616393089,0.700865805149,0.256401896477],
-                        [-0.657660841942,0.678621411324,0.327040165663],
-                        [-0.834127128124,0.506734728813,0.217834427953],
-                        [-0.834331154823,0.529480218887,0.153434738517],
-                        [-0.866019308567,0.468421578407,0.174905076623],
-                        [-0.759706020355,0.627150595188,0.171839639544],
-                        [-0.757922053337,0.643326640129,0.108097285032],
-                        [-0.798110127449,0.588087081909,0.131048902869],
-                        [-0.830952167511,0.548688352108,0.091976031661],
-                        [-0.82464236021,0.564633131027,0.0339771322906],
-                        [-0.858619451523,0.509656965733,0.0549761541188],
-                        [-0.798110127449,0.588087081909,0.131048902869],
-                        [-0.830952167511,0.548688352108,0.091976031661],
-                        [-0.834331154823,0.529480218887,0.153434738517],
-                        [-0.701809465885,0.618283927441,0.353819847107],
-                        [-0.752189457417,0.582528710365,0.308011889458],
-                        [-0.74177056551,0.553625464439,0.378517180681],
-                        [-0.715529501438,0.665048420429,0.213841319084],
-                        [-0.759706020355,0.627150595188,0.171839639544],
-                        [-0.757998526096,0.606988489628,0.238753452897],
-                        [-0.796284377575,0.545040607452,0.26241543889],
-                        [-0.834127128124,0.506734728813,0.217834427953],
-                        [-0.829719662666,0.480284929276,0.284414708614],
-                        [-0.757998526096,0.606988489628,0.238753452897],
-                        [-0.796284377575,0.545040607452,0.26241543889],
-                        [-0.752189457417,0.582528710365,0.308011889458],
-                        [-0.340069264174,0.550243675709,0.762617051601],
-                        [-0.411682873964,0.535965919495,0.737060189247],
-                        [-0.379529476166,0.486395716667,0.787004828453],
-                        [-0.398910075426,0.645450055599,0.65135627985],
-                        [-0.470621615648,0.628728508949,0.619044244289],
-                        [-0.44230055809,0.58378881216,0.680853009224],
-                        [-0.483050197363,0.517854511738,0.706037700176],
-                        [-0.552667617798,0.495975226164,0.669751524925],
-                        [-0.520354926586,0.44894811511,0.726413309574],
-                        [-0.44230055809,0.58378881216,0.680853009224],
-                        [-0.483050197363,0.517854511738,0.706037700176],
-                        [-0.411682873964,0.535965919495,0.737060189247],
-                        [-0.44894811511,0.726413309574,0.520354926586],
-                        [-0.517854511738,0.706037700176,0.483050197363],
-                        [-0.495975226164,0.669751524925,0.552667617798],
-                        [-0.486395716667,0.787004828453,0.379529476166],
-                        [-0.550243675709,0.762617051601,0.340069264174],
-                        [-0.535965919495,0.737060189247,0.411682873964],
-                        [-0.58378881216,0.680853009224,0.44230055809],
-                        [-0.645450055599,0.65135627985,0.398910075426],
-                        [-0.628728508949,0.619044244289,0.470621615648],
-                        [-0.535965919495,0.737060189247,0.411682873964],
-                        [-0.58378881216,0.680853009224,0.44230055809],
-                        [-0.517854511738,0.706037700176,0.483050197363],
-                        [-0.619044244289,0.470621615648,0.628728508949],
-                        [-0.680853009224,0.44230055809,0.58378881216],
-                        [-0.65135627985,0.398910075426,0.645450055599],
-                        [-0.669751524925,0.552667617798,0.495975226164],
-                        [-0.726413309574,0.520354926586,0.44894811511],
-                        [-0.706037700176,0.483050197363,0.517854511738],
-                        [-0.737060189247,0.411682873964,0.535965919495],
-                        [-0.787004828453,0.379529476166,0.486395716667],
-                        [-0.762617051601,0.340069264174,0.550243675709],
-                        [-0.706037700176,0.483050197363,0.517854511738],
-                        [-0.737060189247,0.411682873964,0.535965919495],
-                        [-0.680853009224,0.44230055809,0.58378881216],
-                        [-0.495975226164,0.669751524925,0.552667617798],
-                        [-0.540649950504,0.607478022575,0.581951975822],
-                        [-0.470621615648,0.628728508949,0.619044244289],
-                        [-0.628728508949,0.619044244289,0.470621615648],
-                        [-0.669751524925,0.552667617798,0.495975226164],
-                        [-0.607478022575,0.581951975822,0.540649950504],
-                        [-0.581951975822,0.540649950504,0.607478022575],
-                        [-0.619044244289,0.470621615648,0.628728508949],
-                        [-0.552667617798,0.495975226164,0.669751524925],
-                        [-0.607478022575,0.581951975822,0.540649950504],
-                        [-0.581951975822,0.540649950504,0.607478022575],
-                        [-0.540649950504,0.607478022575,0.581951975822],
-                        [-0.0339771322906,0.82464236021,0.564633131027],
-                        [0.0,0.79582041502,0.605532705784],
-                        [0.0339771322906,0.82464236021,0.564633131027],
-                        [-0.108097285032,0.757922053337,0.643326640129],
-                        [-0.0744211226702,0.722495436668,0.687358558178],
-                        [-0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0744211226702,0.722495436668,0.687358558178],
-                        [0.108097285032,0.757922053337,0.643326640129],
-                        [-0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0362210273743,0.761889100075,0.646693944931],
-                        [0.0,0.79582041502,0.605532705784],
-                        [-0.188148602843,0.669747889042,0.718357801437],
-                        [-0.154971644282,0.62687343359,0.763553202152],
-                        [-0.114190116525,0.677466154099,0.726636230946],
-                        [-0.269586592913,0.560828924179,0.782811582088],
-                        [-0.236761152744,0.510783493519,0.826465010643],
-                        [-0.196083456278,0.571085453033,0.797127783298],
-                        [-0.119124859571,0.578244268894,0.807120084763],
-                        [-0.0809632539749,0.524005174637,0.847858190536],
-                        [-0.0399611219764,0.581926107407,0.81225925684],
-                        [-0.196083456278,0.571085453033,0.797127783298],
-                        [-0.119124859571,0.578244268894,0.807120084763],
-                        [-0.154971644282,0.62687343359,0.763553202152],
-                        [0.114190116525,0.677466154099,0.726636230946],
-                        [0.154971644282,0.62687343359,0.763553202152],
-                        [0.188148602843,0.669747889042,0.718357801437],
-                        [0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0809632539749,0.524005174637,0.847858190536],
-                        [0.119124859571,0.578244268894,0.807120084763],
-                        [0.196083456278,0.571085453033,0.797127783298],
-                        [0.236761152744,0.510783493519,0.826465010643],
-                        [0.269586592913,0.560828924179,0.782811582088],
-                        [0.119124859571,0.578244268894,0.807120084763],
-                        [0.196083456278,0.571085453033,0.797127783298],
-                        [0.154971644282,0.62687343359,0.763553202152],
-                        [-0.114190116525,0.677466154099,0.726636230946],
-                        [-0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.0744211226702,0.722495436668,0.687358558178],
-                        [-0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0399611219764,0.581926107407,0.81225925684],
-                        [0.0,0.634539365768,0.772890508175],
-                        [0.0382858961821,0.68142670393,0.730884253979],
-                        [0.114190116525,0.677466154099,0.726636230946],
-                        [0.0744211226702,0.722495436668,0.687358558178],
-                        [0.0,0.634539365768,0.772890508175],
-                        [0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.0382858961821,0.68142670393,0.730884253979],
-                        [-0.346611320972,0.436200261116,0.830415487289],
-                        [-0.313733518124,0.380723625422,0.869839549065],
-                        [-0.276221334934,0.446935534477,0.85085272789],
-                        [-0.413926929235,0.3044308424,0.857896447182],
-                        [-0.380633711815,0.246351331472,0.891307473183],
-                        [-0.348686188459,0.313436716795,0.883275330067],
-                        [-0.277958005667,0.321246802807,0.905284404755],
-                        [-0.239766731858,0.258633822203,0.935745954514],
-                        [-0.202408134937,0.327503234148,0.922915279865],
-                        [-0.348686188459,0.313436716795,0.883275330067],
-                        [-0.277958005667,0.321246802807,0.905284404755],
-                        [-0.313733518124,0.380723625422,0.869839549065],
-                        [-0.468421578407,0.174905076623,0.866019308567],
-                        [-0.434652328491,0.117213711143,0.892938017845],
-                        [-0.409316182137,0.180623859167,0.894335091114],
-                        [-0.509656965733,0.0549761541188,0.858619451523],
-                        [-0.475679844618,0.0,0.8796184659],
-                        [-0.456712335348,0.0568443164229,0.887796461582],
-                        [-0.398431301117,0.0586068555713,0.915323853493],
-                        [-0.360324263573,0.0,0.932827115059],
-                        [-0.334895044565,0.0602079555392,0.940329909325],
-                        [-0.456712335348,0.0568443164229,0.887796461582],
-                        [-0.398431301117,0.0586068555713,0.915323853493],
-                        [-0.434652328491,0.117213711143,0.892938017845],
-                        [-0.199805602431,0.193975359201,0.960443258286],
-                        [-0.158833146095,0.128498718143,0.978907585144],
-                        [-0.121444880962,0.196501940489,0.97295331955],
-                        [-0.266443610191,0.0615878328681,0.961880862713],
-                        [-0.225778326392,0.0,0.974178731441],
-                        [-0.193714544177,0.0626873448491,0.979053080082],
-                        [-0.117650069296,0.0634539350867,0.991025745869],
-                        [-0.0770247355103,0.0,0.997029185295],
-                        [-0.0394601933658,0.0638479366899,0.997179210186],
-                        [-0.193714544177,0.0626873448491,0.979053080082],
-                        [-0.117650069296,0.0634539350867,0.991025745869],
-                        [-0.158833146095,0.128498718143,0.978907585144],
-                        [-0.409316182137,0.180623859167,0.894335091114],
-                        [-0.34457308054,0.185843646526,0.920180141926],
-                        [-0.380633711815,0.246351331472,0.891307473183],
-                        [-0.334895044565,0.0602079555392,0.940329909325],
-                        [-0.266443610191,0.0615878328681,0.961880862713],
-                        [-0.306287169456,0.123895764351,0.943842172623],
-                        [-0.274516820908,0.190361812711,0.942551255226],
-                        [-0.199805602431,0.193975359201,0.960443258286],
-                        [-0.239766731858,0.258633822203,0.935745954514],
-                        [-0.306287169456,0.123895764351,0.943842172623],
-                        [-0.274516820908,0.190361812711,0.942551255226],
-                        [-0.34457308054,0.185843646526,0.920180141926],
-                        [0.276221334934,0.446935534477,0.85085272789],
-                        [0.313733518124,0.380723625422,0.869839549065],
-                        [0.346611320972,0.436200261116,0.830415487289],
-                        [0.202408134937,0.327503234148,0.922915279865],
-                        [0.239766731858,0.258633822203,0.935745954514],
-                        [0.277958005667,0.321246802807,0.905284404755],
-                        [0.348686188459,0.313436716795,0.883275330067],
-                        [0.380633711815,0.246351331472,0.891307473183],
-                        [0.413926929235,0.3044308424,0.857896447182],
-                        [0.277958005667,0.321246802807,0.905284404755],
-                        [0.348686188459,0.313436716795,0.883275330067],
-                        [0.313733518124,0.380723625422,0.869839549065],
-                        [0.121444880962,0.196501940489,0.97295331955],
-                        [0.158833146095,0.128498718143,0.978907585144],
-                        [0.199805602431,0.193975359201,0.960443258286],
-                        [0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0770247355103,0.0,0.997029185295],
-                        [0.117650069296,0.0634539350867,0.991025745869],
-                        [0.193714544177,0.0626873448491,0.979053080082],
-                        [0.225778326392,0.0,0.974178731441],
-                        [0.266443610191,0.0615878328681,0.961880862713],
-                        [0.117650069296,0.0634539350867,0.991025745869],
-                        [0.193714544177,0.0626873448491,0.979053080082],
-                        [0.158833146095,0.128498718143,0.978907585144],
-                        [0.409316182137,0.180623859167,0.894335091114],
-                        [0.434652328491,0.117213711143,0.892938017845],
-                        [0.468421578407,0.174905076623,0.866019308567],
-                        [0.334895044565,0.0602079555392,0.940329909325],
-                        [0.360324263573,0.0,0.932827115059],
-                        [0.398431301117,0.0586068555713,0.915323853493],
-                        [0.456712335348,0.0568443164229,0.887796461582],
-                        [0.475679844618,0.0,0.8796184659],
-                        [0.509656965733,0.0549761541188,0.858619451523],
-                        [0.398431301117,0.0586068555713,0.915323853493],
-                        [0.456712335348,0.0568443164229,0.887796461582],
-                        [0.434652328491,0.117213711143,0.892938017845],
-                        [0.199805602431,0.193975359201,0.960443258286],
-                        [0.274516820908,0.190361812711,0.942551255226],
-                        [0.239766731858,0.258633822203,0.935745954514],
-                        [0.266443610191,0.0615878328681,0.961880862713],
-                        [0.334895044565,0.0602079555392,0.940329909325],
-                        [0.306287169456,0.123895764351,0.943842172623],
-                        [0.34457308054,0.185843646526,0.920180141926],
-                        [0.409316182137,0.180623859167,0.894335091114],
-                        [0.380633711815,0.246351331472,0.891307473183],
-                        [0.306287169456,0.123895764351,0.943842172623],
-                        [0.34457308054,0.185843646526,0.920180141926],
-                        [0.274516820908,0.190361812711,0.942551255226],
-                        [-0.276221334934,0.446935534477,0.85085272789],
-                        [-0.20109423995,0.455528259277,0.867211103439],
-                        [-0.236761152744,0.510783493519,0.826465010643],
-                        [-0.202408134937,0.327503234148,0.922915279865],
-                        [-0.123069040477,0.33188316226,0.935258030891],
-                        [-0.162998497486,0.395605653524,0.903840482235],
-                        [-0.122248865664,0.461539924145,0.878655850887],
-                        [-0.0410230122507,0.464636415243,0.88455080986],
-                        [-0.0809632539749,0.524005174637,0.847858190536],
-                        [-0.162998497486,0.395605653524,0.903840482235],
-                        [-0.122248865664,0.461539924145,0.878655850887],
-                        [-0.20109423995,0.455528259277,0.867211103439],
-                        [-0.121444880962,0.196501940489,0.97295331955],
-                        [-0.0407496243715,0.197802826762,0.979394435883],
-                        [-0.0820460245013,0.265506535769,0.960611641407],
-                        [-0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0394601933658,0.0638479366899,0.997179210186],
-                        [0.0,0.130150929093,0.991494178772],
-                        [0.0407496243715,0.197802826762,0.979394435883],
-                        [0.121444880962,0.196501940489,0.97295331955],
-                        [0.0820460245013,0.265506535769,0.960611641407],
-                        [0.0,0.130150929093,0.991494178772],
-                        [0.0407496243715,0.197802826762,0.979394435883],
-                        [-0.0407496243715,0.197802826762,0.979394435883],
-                        [0.0410230122507,0.464636415243,0.88455080986],
-                        [0.122248865664,0.461539924145,0.878655850887],
-                        [0.0809632539749,0.524005174637,0.847858190536],
-                        [0.123069040477,0.33188316226,0.935258030891],
-                        [0.202408134937,0.327503234148,0.922915279865],
-                        [0.162998497486,0.395605653524,0.903840482235],
-                        [0.20109423995,0.455528259277,0.867211103439],
-                        [0.276221334934,0.446935534477,0.85085272789],
-                        [0.236761152744,0.510783493519,0.826465010643],
-                        [0.162998497486,0.395605653524,0.903840482235],
-                        [0.20109423995,0.455528259277,0.867211103439],
-                        [0.122248865664,0.461539924145,0.878655850887],
-                        [-0.0820460245013,0.265506535769,0.960611641407],
-                        [-0.04130198434,0.334140062332,0.941618084908],
-                        [-0.123069040477,0.33188316226,0.935258030891],
-                        [0.0820460245013,0.265506535769,0.960611641407],
-                        [0.123069040477,0.33188316226,0.935258030891],
-                        [0.04130198434,0.334140062332,0.941618084908],
-                        [0.0,0.400968074799,0.916092038155],
-                        [0.0410230122507,0.464636415243,0.88455080986],
-                        [-0.0410230122507,0.464636415243,0.88455080986],
-                        [0.04130198434,0.334140062332,0.941618084908],
-                        [0.0,0.400968074799,0.916092038155],
-                        [-0.04130198434,0.334140062332,0.941618084908],
-                        [-0.0549761541188,0.858619451523,-0.509656965733],
-                        [-0.0568443164229,0.887796461582,-0.456712335348],
-                        [0.0,0.8796184659,-0.475679844618],
-                        [-0.174905076623,0.866019308567,-0.468421578407],
-                        [-0.180623859167,0.894335091114,-0.409316182137],
-                        [-0.117213711143,0.892938017845,-0.434652328491],
-                        [-0.0586068555713,0.915323853493,-0.398431301117],
-                        [-0.0602079555392,0.940329909325,-0.334895044565],
-                        [0.0,0.932827115059,-0.360324263573],
-                        [-0.117213711143,0.892938017845,-0.434652328491],
-                        [-0.0586068555713,0.915323853493,-0.398431301117],
-                        [-0.0568443164229,0.887796461582,-0.456712335348],
-                        [-0.3044308424,0.857896447182,-0.413926929235],
-                        [-0.313436716795,0.883275330067,-0.348686188459],
-                        [-0.246351331472,0.891307473183,-0.380633711815],
-                        [-0.436200261116,0.830415487289,-0.346611320972],
-                        [-0.446935534477,0.85085272789,-0.276221334934],
-                        [-0.380723625422,0.869839549065,-0.313733518124],
-                        [-0.321246802807,0.905284404755,-0.277958005667],
-                        [-0.327503234148,0.922915279865,-0.202408134937],
-                        [-0.258633822203,0.935745954514,-0.239766731858],
-                        [-0.380723625422,0.869839549065,-0.313733518124],
-                        [-0.321246802807,0.905284404755,-0.277958005667],
-                        [-0.313436716795,0.883275330067,-0.348686188459],
-                        [-0.0615878328681,0.961880862713,-0.266443610191],
-                        [-0.0626873448491,0.979053080082,-0.193714544177],
-                        [0.0,0.974178731441,-0.225778326392],
-                        [-0.193975359201,0.960443258286,-0.199805602431],
-                        [-0.196501940489,0.97295331955,-0.121444880962],
-                        [-0.128498718143,0.978907585144,-0.158833146095],
-                        [-0.0634539350867,0.991025745869,-0.117650069296],
-                        [-0.0638479366899,0.997179210186,-0.0394601933658],
-                        [0.0,0.997029185295,-0.0770247355103],
-                        [-0.128498718143,0.978907585144,-0.158833146095],
-                        [-0.0634539350867,0.991025745869,-0.117650069296],
-                        [-0.0626873448491,0.979053080082,-0.193714544177],
-                        [-0.246351331472,0.891307473183,-0.380633711815],
-                        [-0.185843646526,0.920180141926,-0.34457308054],
-                        [-0.180623859167,0.894335091114,-0.409316182137],
-                        [-0.258633822203,0.935745954514,-0.239766731858],
-                        [-0.193975359201,0.960443258286,-0.199805602431],
-                        [-0.190361812711,0.942551255226,-0.274516820908],
-                        [-0.123895764351,0.943842172623,-0.306287169456],
-                        [-0.0615878328681,0.961880862713,-0.266443610191],
-                        [-0.0602079555392,0.940329909325,-0.334895044565],
-                        [-0.190361812711,0.942551255226,-0.274516820908],
-                        [-0.123895764351,0.943842172623,-0.306287169456],
-                        [-0.185843646526,0.920180141926,-0.34457308054],
-                        [-0.560828924179,0.782811582088,-0.269586592913],
-                        [-0.571085453033,0.797127783298,-0.196083456278],
-                        [-0.510783493519,0.826465010643,-0.236761152744],
-                        [-0.669747889042,0.718357801437,-0.188148602843],
-                        [-0.677466154099,0.726636230946,-0.114190116525],
-                        [-0.62687343359,0.763553202152,-0.154971644282],
-                        [-0.578244268894,0.807120084763,-0.119124859571],
-                        [-0.581926107407,0.81225925684,-0.0399611219764],
-                        [-0.524005174637,0.847858190536,-0.0809632539749],
-                        [-0.62687343359,0.763553202152,-0.154971644282],
-                        [-0.578244268894,0.807120084763,-0.119124859571],
-                        [-0.571085453033,0.797127783298,-0.196083456278],
-                        [-0.757922053337,0.643326640129,-0.108097285032],
-                        [-0.761889100075,0.646693944931,-0.0362210273743],
-                        [-0.722495436668,0.687358558178,-0.0744211226702],
-                        [-0.82464236021,0.564633131027,-0.0339771322906],
-                        [-0.82464236021,0.564633131027,0.0339771322906],
-                        [-0.79582041502,0.605532705784,0.0],
-                        [-0.761889100075,0.646693944931,0.0362210273743],
-                        [-0.757922053337,0.643326640129,0.108097285032],
-                        [-0.722495436668,0.687358558178,0.0744211226702],
-                        [-0.79582041502,0.605532705784,0.0],
-                        [-0.761889100075,0.646693944931,0.0362210273743],
-                        [-0.761889100075,0.646693944931,-0.0362210273743],
-                        [-0.581926107407,0.81225925684,0.0399611219764],
-                        [-0.578244268894,0.807120084763,0.119124859571],
-                        [-0.524005174637,0.847858190536,0.0809632539749],
-                        [-0.677466154099,0.726636230946,0.114190116525],
-                        [-0.669747889042,0.718357801437,0.188148602843],
-                        [-0.62687343359,0.763553202152,0.154971644282],
-                        [-0.571085453033,0.797127783298,0.196083456278],
-                        [-0.560828924179,0.782811582088,0.269586592913],
-                        [-0.510783493519,0.826465010643,0.236761152744],
-                        [-0.62687343359,0.763553202152,0.154971644282],
-                        [-0.571085453033,0.797127783298,0.196083456278],
-                        [-0.578244268894,0.807120084763,0.119124859571],
-                        [-0.722495436668,0.687358558178,-0.0744211226702],
-                        [-0.68142670393,0.730884253979,-0.0382858961821],
-                        [-0.677466154099,0.726636230946,-0.114190116525],
-                        [-0.722495436668,0.687358558178,0.0744211226702],
-                        [-0.677466154099,0.726636230946,0.114190116525],
-                        [-0.68142670393,0.730884253979,0.0382858961821],
-                        [-0.634539365768,0.772890508175,0.0],
-                        [-0.581926107407,0.81225925684,0.0399611219764],
-                        [-0.581926107407,0.81225925684,-0.0399611219764],
-                        [-0.68142670393,0.730884253979,0.0382858961821],
-                        [-0.634539365768,0.772890508175,0.0],
-                        [-0.68142670393,0.730884253979,-0.0382858961821],
-                        [-0.0638479366899,0.997179210186,0.0394601933658],
-                        [-0.0634539350867,0.991025745869,0.117650069296],
-                        [0.0,0.997029185295,0.0770247355103],
-                        [-0.196501940489,0.97295331955,0.121444880962],
-                        [-0.193975359201,0.960443258286,0.199805602431],
-                        [-0.128498718143,0.978907585144,0.158833146095],
-                        [-0.0626873448491,0.979053080082,0.193714544177],
-                        [-0.0615878328681,0.961880862713,0.266443610191],
-                        [0.0,0.974178731441,0.225778326392],
-                        [-0.128498718143,0.978907585144,0.158833146095],
-                        [-0.0626873448491,0.979053080082,0.193714544177],
-                        [-0.0634539350867,0.991025745869,0.117650069296],
-                        [-0.327503234148,0.922915279865,0.202408134937],
-                        [-0.321246802807,0.905284404755,0.277958005667],
-                        [-0.258633822203,0.935745954514,0.239766731858],
-                        [-0.446935534477,0.85085272789,0.276221334934],
-                        [-0.436200261116,0.830415487289,0.346611320972],
-                        [-0.380723625422,0.869839549065,0.313733518124],
-                        [-0.313436716795,0.883275330067,0.348686188459],
-                        [-0.3044308424,0.857896447182,0.413926929235],
-                        [-0.246351331472,0.891307473183,0.380633711815],
-                        [-0.380723625422,0.869839549065,0.313733518124],
-                        [-0.313436716795,0.883275330067,0.348686188459],
-                        [-0.321246802807,0.905284404755,0.277958005667],
-                        [-0.0602079555392,0.940329909325,0.334895044565],
-                        [-0.0586068555713,0.915323853493,0.398431301117],
-                        [0.0,0.932827115059,0.360324263573],
-                        [-0.180623859167,0.894335091114,0.409316182137],
-                        [-0.174905076623,0.866019308567,0.468421578407],
-                        [-0.117213711143,0.892938017845,0.434652328491],
-                        [-0.0568443164229,0.887796461582,0.456712335348],
-                        [-0.0549761541188,0.858619451523,0.509656965733],
-                        [0.0,0.8796184659,0.475679844618],
-                        [-0.117213711143,0.892938017845,0.434652328491],
-                        [-0.0568443164229,0.887796461582,0.456712335348],
-                        [-0.0586068555713,0.915323853493,0.398431301117],
-                        [-0.258633822203,0.935745954514,0.239766731858],
-                        [-0.190361812711,0.942551255226,0.274516820908],
-                        [-0.193975359201,0.960443258286,0.199805602431],
-                        [-0.246351331472,0.891307473183,0.380633711815],
-                        [-0.180623859167,0.894335091114,0.409316182137],
-                        [-0.185843646526,0.920180141926,0.34457308054],
-                        [-0.123895764351,0.943842172623,0.306287169456],
-                        [-0.0602079555392,0.940329909325,0.334895044565],
-                        [-0.0615878328681,0.961880862713,0.266443610191],
-                        [-0.185843646526,0.920180141926,0.34457308054],
-                        [-0.123895764351,0.943842172623,0.306287169456],
-                        [-0.190361812711,0.942551255226,0.274516820908],
-                        [-0.510783493519,0.826465010643,-0.236761152744],
-                        [-0.455528259277,0.867211103439,-0.20109423995],
-                        [-0.446935534477,0.85085272789,-0.276221334934],
-                        [-0.524005174637,0.847858190536,-0.0809632539749],
-                        [-0.464636415243,0.88455080986,-0.0410230122507],
-                        [-0.461539924145,0.878655850887,-0.122248865664],
-                        [-0.395605653524,0.903840482235,-0.162998497486],
-                        [-0.33188316226,0.935258030891,-0.123069040477],
-                        [-0.327503234148,0.922915279865,-0.202408134937],
-                        [-0.461539924145,0.878655850887,-0.122248865664],
-                        [-0.395605653524,0.903840482235,-0.162998497486],
-                        [-0.455528259277,0.867211103439,-0.20109423995],
-                        [-0.524005174637,0.847858190536,0.0809632539749],
-                        [-0.461539924145,0.878655850887,0.122248865664],
-                        [-0.464636415243,0.88455080986,0.0410230122507],
-                        [-0.510783493519,0.826465010643,0.236761152744],
-                        [-0.446935534477,0.85085272789,0.276221334934],
-                        [-0.455528259277,0.867211103439,0.20109423995],
-                        [-0.395605653524,0.903840482235,0.162998497486],
-                        [-0.327503234148,0.922915279865,0.202408134937],
-                        [-0.33188316226,0.935258030891,0.123069040477],
-                        [-0.455528259277,0.867211103439,0.20109423995],
-                        [-0.395605653524,0.903840482235,0.162998497486],
-                        [-0.461539924145,0.878655850887,0.122248865664],
-                        [-0.265506535769,0.960611641407,-0.0820460245013],
-                        [-0.197802826762,0.979394435883,-0.0407496243715],
-                        [-0.196501940489,0.97295331955,-0.121444880962],
-                        [-0.265506535769,0.960611641407,0.0820460245013],
-                        [-0.196501940489,0.97295331955,0.121444880962],
-                        [-0.197802826762,0.979394435883,0.0407496243715],
-                        [-0.130150929093,0.991494178772,0.0],
-                        [-0.0638479366899,0.997179210186,0.0394601933658],
-                        [-0.0638479366899,0.997179210186,-0.0394601933658],
-                        [-0.197802826762,0.979394435883,0.0407496243715],
-                        [-0.130150929093,0.991494178772,0.0],
-                        [-0.197802826762,0.979394435883,-0.0407496243715],
-                        [-0.464636415243,0.88455080986,0.0410230122507],
-                        [-0.400968074799,0.916092038155,0.0],
-                        [-0.464636415243,0.88455080986,-0.0410230122507],
-                        [-0.33188316226,0.935258030891,0.123069040477],
-                        [-0.265506535769,0.960611641407,0.0820460245013],
-                        [-0.334140062332,0.941618084908,0.04130198434],
-                        [-0.334140062332,0.941618084908,-0.04130198434],
-                        [-0.265506535769,0.960611641407,-0.0820460245013],
-                        [-0.33188316226,0.935258030891,-0.123069040477],
-                        [-0.334140062332,0.941618084908,0.04130198434],
-                        [-0.334140062332,0.941618084908,-0.04130198434],
-                        [-0.400968074799,0.916092038155,0.0],
-                        [0.564633131027,0.0339771322906,-0.82464236021],
-                        [0.605532705784,0.0,-0.79582041502],
-                        [0.564633131027,-0.0339771322906,-0.82464236021],
-                        [0.643326640129,0.108097285032,-0.757922053337],
-                        [0.687358558178,0.0744211226702,-0.722495436668],
-                        [0.646693944931,0.0362210273743,-0.761889100075],
-                        [0.646693944931,-0.0362210273743,-0.761889100075],
-                        [0.687358558178,-0.0744211226702,-0.722495436668],
-                        [0.643326640129,-0.108097285032,-0.757922053337],
-                        [0.646693944931,0.0362210273743,-0.761889100075],
-                        [0.646693944931,-0.0362210273743,-0.761889100075],
-                        [0.605532705784,0.0,-0.79582041502],
-                        [0.718357801437,0.188148602843,-0.669747889042],
-                        [0.763553202152,0.154971644282,-0.62687343359],
-                        [0.726636230946,0.114190116525,-0.677466154099],
-                        [0.782811582088,0.269586592913,-0.560828924179],
-                        [0.826465010643,0.236761152744,-0.510783493519],
-                        [0.797127783298,0.196083456278,-0.571085453033],
-                        [0.807120084763,0.119124859571,-0.578244268894],
-                        [0.847858190536,0.0809632539749,-0.524005174637],
-                        [0.81225925684,0.0399611219764,-0.581926107407],
-                        [0.797127783298,0.196083456278,-0.571085453033],
-                        [0.807120084763,0.119124859571,-0.578244268894],
-                        [0.763553202152,0.154971644282,-0.62687343359],
-                        [0.726636230946,-0.114190116525,-0.677466154099],
-                        [0.763553202152,-0.154971644282,-0.62687343359],
-                        [0.718357801437,-0.188148602843,-0.669747889042],
-                        [0.81225925684,-0.0399611219764,-0.581926107407],
-                        [0.847858190536,-0.0809632539749,-0.524005174637],
-                        [0.807120084763,-0.119124859571,-0.578244268894],
-                        [0.797127783298,-0.196083456278,-0.571085453033],
-                        [0.826465010643,-0.236761152744,-0.510783493519],
-                        [0.782811582088,-0.269586592913,-0.560828924179],
-                        [0.807120084763,-0.119124859571,-0.578244268894],
-                        [0.797127783298,-0.196083456278,-0.571085453033],
-                        [0.763553202152,-0.154971644282,-0.62687343359],
-                        [0.726636230946,0.114190116525,-0.677466154099],
-                        [0.730884253979,0.0382858961821,-0.68142670393],
-                        [0.687358558178,0.0744211226702,-0.722495436668],
-                        [0.81225925684,0.0399611219764,-0.581926107407],
-                        [0.81225925684,-0.0399611219764,-0.581926107407],
-                        [0.772890508175,0.0,-0.634539365768],
-                        [0.730884253979,-0.0382858961821,-0.68142670393],
-                        [0.726636230946,-0.114190116525,-0.677466154099],
-                        [0.687358558178,-0.0744211226702,-0.722495436668],
-                        [0.772890508175,0.0,-0.634539365768],
-                        [0.730884253979,-0.0382858961821,-0.68142670393],
-                        [0.730884253979,0.0382858961821,-0.68142670393],
-                        [0.830415487289,0.346611320972,-0.436200261116],
-                        [0.869839549065,0.313733518124,-0.380723625422],
-                        [0.85085272789,0.276221334934,-0.446935534477],
-                        [0.857896447182,0.413926929235,-0.3044308424],
-                        [0.891307473183,0.380633711815,-0.246351331472],
-                        [0.883275330067,0.348686188459,-0.313436716795],
-                        [0.905284404755,0.277958005667,-0.321246802807],
-                        [0.935745954514,0.239766731858,-0.258633822203],
-                        [0.922915279865,0.202408134937,-0.327503234148],
-                        [0.883275330067,0.348686188459,-0.313436716795],
-                        [0.905284404755,0.277958005667,-0.321246802807],
-                        [0.869839549065,0.313733518124,-0.380723625422],
-                        [0.866019308567,0.468421578407,-0.174905076623],
-                        [0.892938017845,0.434652328491,-0.117213711143],
-                        [0.894335091114,0.409316182137,-0.180623859167],
-                        [0.858619451523,0.509656965733,-0.0549761541188],
-                        [0.8796184659,0.475679844618,0.0],
-                        [0.887796461582,0.456712335348,-0.0568443164229],
-                        [0.915323853493,0.398431301117,-0.0586068555713],
-                        [0.932827115059,0.360324263573,0.0],
-                        [0.940329909325,0.334895044565,-0.0602079555392],
-                        [0.887796461582,0.456712335348,-0.0568443164229],
-                        [0.915323853493,0.398431301117,-0.0586068555713],
-                        [0.892938017845,0.434652328491,-0.117213711143],
-                        [0.960443258286,0.199805602431,-0.193975359201],
-                        [0.978907585144,0.158833146095,-0.128498718143],
-                        [0.97295331955,0.121444880962,-0.196501940489],
-                        [0.961880862713,0.266443610191,-0.0615878328681],
-                        [0.974178731441,0.225778326392,0.0],
-                        [0.979053080082,0.193714544177,-0.0626873448491],
-                        [0.991025745869,0.117650069296,-0.0634539350867],
-                        [0.997029185295,0.0770247355103,0.0],
-                        [0.997179210186,0.0394601933658,-0.0638479366899],
-                        [0.979053080082,0.193714544177,-0.0626873448491],
-                        [0.991025745869,0.117650069296,-0.0634539350867],
-                        [0.978907585144,0.158833146095,-0.128498718143],
-                        [0.894335091114,0.409316182137,-0.180623859167],
-                        [0.920180141926,0.34457308054,-0.185843646526],
-                        [0.891307473183,0.380633711815,-0.246351331472],
-                        [0.940329909325,0.334895044565,-0.0602079555392],
-                        [0.961880862713,0.266443610191,-0.0615878328681],
-                        [0.943842172623,0.306287169456,-0.123895764351],
-                        [0.942551255226,0.274516820908,-0.190361812711],
-                        [0.960443258286,0.199805602431,-0.193975359201],
-                        [0.935745954514,0.239766731858,-0.258633822203],
-                        [0.943842172623,0.306287169456,-0.123895764351],
-                        [0.942551255226,0.274516820908,-0.190361812711],
-                        [0.920180141926,0.34457308054,-0.185843646526],
-                        [0.85085272789,-0.276221334934,-0.446935534477],
-                        [0.869839549065,-0.313733518124,-0.380723625422],
-                        [0.830415487289,-0.346611320972,-0.436200261116],
-                        [0.922915279865,-0.202408134937,-0.327503234148],
-                        [0.935745954514,-0.239766731858,-0.258633822203],
-                        [0.905284404755,-0.277958005667,-0.321246802807],
-                        [0.883275330067,-0.348686188459,-0.313436716795],
-                        [0.891307473183,-0.380633711815,-0.246351331472],
-                        [0.857896447182,-0.413926929235,-0.3044308424],
-                        [0.905284404755,-0.277958005667,-0.321246802807],
-                        [0.883275330067,-0.348686188459,-0.313436716795],
-                        [0.869839549065,-0.313733518124,-0.380723625422],
-                        [0.97295331955,-0.121444880962,-0.196501940489],
-                        [0.978907585144,-0.158833146095,-0.128498718143],
-                        [0.960443258286,-0.199805602431,-0.193975359201],
-                        [0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [0.997029185295,-0.0770247355103,0.0],
-                        [0.991025745869,-0.117650069296,-0.0634539350867],
-                        [0.979053080082,-0.193714544177,-0.0626873448491],
-                        [0.974178731441,-0.225778326392,0.0],
-                        [0.961880862713,-0.266443610191,-0.0615878328681],
-                        [0.991025745869,-0.117650069296,-0.0634539350867],
-                        [0.979053080082,-0.193714544177,-0.0626873448491],
-                        [0.978907585144,-0.158833146095,-0.128498718143],
-                        [0.894335091114,-0.409316182137,-0.180623859167],
-                        [0.892938017845,-0.434652328491,-0.117213711143],
-                        [0.866019308567,-0.468421578407,-0.174905076623],
-                        [0.940329909325,-0.334895044565,-0.0602079555392],
-                        [0.932827115059,-0.360324263573,0.0],
-                        [0.915323853493,-0.398431301117,-0.0586068555713],
-                        [0.887796461582,-0.456712335348,-0.0568443164229],
-                        [0.8796184659,-0.475679844618,0.0],
-                        [0.858619451523,-0.509656965733,-0.0549761541188],
-                        [0.915323853493,-0.398431301117,-0.0586068555713],
-                        [0.887796461582,-0.456712335348,-0.0568443164229],
-                        [0.892938017845,-0.434652328491,-0.117213711143],
-                        [0.960443258286,-0.199805602431,-0.193975359201],
-                        [0.942551255226,-0.274516820908,-0.190361812711],
-                        [0.935745954514,-0.239766731858,-0.258633822203],
-                        [0.961880862713,-0.266443610191,-0.0615878328681],
-                        [0.940329909325,-0.334895044565,-0.0602079555392],
-                        [0.943842172623,-0.306287169456,-0.123895764351],
-                        [0.920180141926,-0.34457308054,-0.185843646526],
-                        [0.894335091114,-0.409316182137,-0.180623859167],
-                        [0.891307473183,-0.380633711815,-0.246351331472],
-                        [0.943842172623,-0.306287169456,-0.123895764351],
-                        [0.920180141926,-0.34457308054,-0.185843646526],
-                        [0.942551255226,-0.274516820908,-0.190361812711],
-                        [0.85085272789,0.276221334934,-0.446935534477],
-                        [0.867211103439,0.20109423995,-0.455528259277],
-                        [0.826465010643,0.236761152744,-0.510783493519],
-                        [0.922915279865,0.202408134937,-0.327503234148],
-                        [0.935258030891,0.123069040477,-0.33188316226],
-                        [0.903840482235,0.162998497486,-0.395605653524],
-                        [0.878655850887,0.122248865664,-0.461539924145],
-                        [0.88455080986,0.0410230122507,-0.464636415243],
-                        [0.847858190536,0.0809632539749,-0.524005174637],
-                        [0.903840482235,0.162998497486,-0.395605653524],
-                        [0.878655850887,0.122248865664,-0.461539924145],
-                        [0.867211103439,0.20109423995,-0.455528259277],
-                        [0.97295331955,0.121444880962,-0.196501940489],
-                        [0.979394435883,0.0407496243715,-0.197802826762],
-                        [0.960611641407,0.0820460245013,-0.265506535769],
-                        [0.997179210186,0.0394601933658,-0.0638479366899],
-                        [0.997179210186,-0.0394601933658,-0.0638479366899],
-                        [0.991494178772,0.0,-0.130150929093],
-                        [0.979394435883,-0.0407496243715,-0.197802826762],
-                        [0.97295331955,-0.121444880962,-0.196501940489],
-                        [0.960611641407,-0.0820460245013,-0.265506535769],
-                        [0.991494178772,0.0,-0.130150929093],
-                        [0.979394435883,-0.0407496243715,-0.197802826762],
-                        [0.979394435883,0.0407496243715,-0.197802826762],
-                        [0.88455080986,-0.0410230122507,-0.464636415243],
-                        [0.878655850887,-0.122248865664,-0.461539924145],
-                        [0.847858190536,-0.0809632539749,-0.524005174637],
-                        [0.935258030891,-0.123069040477,-0.33188316226],
-                        [0.922915279865,-0.202408134937,-0.327503234148],
-                        [0.903840482235,-0.162998497486,-0.395605653524],
-                        [0.867211103439,-0.20109423995,-0.455528259277],
-                        [0.85085272789,-0.276221334934,-0.446935534477],
-                        [0.826465010643,-0.236761152744,-0.510783493519],
-                        [0.903840482235,-0.162998497486,-0.395605653524],
-                        [0.867211103439,-0.20109423995,-0.455528259277],
-                        [0.878655850887,-0.122248865664,-0.461539924145],
-                        [0.960611641407,0.0820460245013,-0.265506535769],
-                        [0.941618084908,0.04130198434,-0.334140062332],
-                        [0.935258030891,0.123069040477,-0.33188316226],
-                        [0.960611641407,-0.0820460245013,-0.265506535769],
-                        [0.935258030891,-0.123069040477,-0.33188316226],
-                        [0.941618084908,-0.04130198434,-0.334140062332],
-                        [0.916092038155,0.0,-0.400968074799],
-                        [0.88455080986,-0.0410230122507,-0.464636415243],
-                        [0.88455080986,0.0410230122507,-0.464636415243],
-                        [0.941618084908,-0.04130198434,-0.334140062332],
-                        [0.916092038155,0.0,-0.400968074799],
-                        [0.941618084908,0.04130198434,-0.334140062332]]
+                def geodesic_sphere_points(level=4):
+                    """vertices of an icosphere of radius 1 as a flat float array (x,y,z,x,y,z...), built once per subdivision level (level 4: 2562 points)"""
+                    if level in Toolbox.Points.GEODESIC: return Toolbox.Points.GEODESIC[level]
+
+                    # icosahedron
+                    t = (1 + math.sqrt(5)) / 2
+                    vertices = []
+                    for a in (-1, 1):
+                        for b in (-1, 1):
+                            vertices += [(a*t, b, 0), (0, a*t, b), (b, 0, a*t)]
+                    faces = []
+                    for i in range(12):
+                        for j in range(i+1, 12):
+                            for k in range(j+1, 12):
+                                if [1 for (p, q) in [(i, j), (j, k), (i, k)] if abs(Toolbox.Vectors.length(Toolbox.Vectors.subtract(vertices[p], vertices[q])) - 2) > 1e-9] == []:
+                                    faces.append((i, j, k))
+
+                    # each face of the icosahedron is divided into a triangular grid of 2^level segments per edge, pushed back on the sphere
+                    frequency = 2 ** level
+                    points = array('d')
+                    found = set()
+                    for (a, b, c) in faces:
+                        for i in range(frequency + 1):
+                            for j in range(frequency + 1 - i):
+                                k = frequency - i - j
+                                p = Toolbox.Vectors.unitize([i*vertices[a][x] + j*vertices[b][x] + k*vertices[c][x] for x in range(3)])
+                                key = (round(p[0], 9), round(p[1], 9), round(p[2], 9))
+                                if key not in found:
+                                    found.add(key)
+                                    points.extend(p)
+                    Toolbox.Points.GEODESIC[level] = points
                     return points
 
 
@@ -8805,6 +6078,387 @@ if yes:
                     """check equality within tolerance"""
                     return abs(a-b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
 
+                @staticmethod
+                def linear_program(c, A_ub=[], b_ub=[], A_eq=[], b_eq=[], tolerance=1e-9, max_iterations=10000):
+                    """maximize c.x subject to A_ub.x <= b_ub, A_eq.x = b_eq and x >= 0 with a two-phase dense simplex (Bland's rule), return (value, x) or None if infeasible"""
+                    n = len(c)
+                    n_slack = len(A_ub)
+                    rows = [] # [coefficients, rhs, needs artificial]
+                    for k in range(len(A_ub)):
+                        slack = [0.0] * n_slack
+                        if b_ub[k] >= 0:
+                            slack[k] = 1.0
+                            rows.append([[float(a) for a in A_ub[k]] + slack, float(b_ub[k]), False])
+                        else:
+                            slack[k] = -1.0
+                            rows.append([[-float(a) for a in A_ub[k]] + slack, -float(b_ub[k]), True])
+                    for k in range(len(A_eq)):
+                        sign = 1.0 if b_eq[k] >= 0 else -1.0
+                        rows.append([[sign * float(a) for a in A_eq[k]] + [0.0] * n_slack, sign * float(b_eq[k]), True])
+                    m = len(rows)
+                    artificials = [k for k in range(m) if rows[k][2]]
+                    width = n + n_slack + len(artificials)
+
+                    # tableau rows are coefficients followed by the right hand side
+                    tableau = []
+                    basis = []
+                    for k in range(m):
+                        row = rows[k][0] + [0.0] * len(artificials) + [rows[k][1]]
+                        if rows[k][2]:
+                            column = n + n_slack + artificials.index(k)
+                            row[column] = 1.0
+                        else: column = n + k
+                        tableau.append(row)
+                        basis.append(column)
+
+                    def pivot(z, r, column):
+                        value = tableau[r][column]
+                        tableau[r] = [a / value for a in tableau[r]]
+                        for other in tableau + [z]:
+                            if other is not tableau[r] and abs(other[column]) > 0:
+                                factor = other[column]
+                                pivot_row = tableau[r]
+                                for col in range(len(other)):
+                                    other[col] -= factor * pivot_row[col]
+                        basis[r] = column
+
+                    def simplex(z, columns):
+                        for iteration in range(max_iterations):
+                            entering = None
+                            for col in columns:
+                                if z[col] < -tolerance:
+                                    entering = col
+                                    break
+                            if entering is None: return True
+                            leaving = None
+                            for r in range(len(tableau)):
+                                if tableau[r][entering] > tolerance:
+                                    ratio = tableau[r][-1] / tableau[r][entering]
+                                    if leaving is None or ratio < best - tolerance or (abs(ratio - best) <= tolerance and basis[r] < basis[leaving]):
+                                        leaving, best = r, ratio
+                            if leaving is None: return False
+                            pivot(z, leaving, entering)
+                        raise Exception(' Linear program did not converge')
+
+                    # phase 1: maximize minus the sum of the artificial variables
+                    if artificials:
+                        z = [0.0] * (width + 1)
+                        for r in range(m):
+                            if basis[r] >= n + n_slack:
+                                for col in range(width + 1):
+                                    if col < n + n_slack or col == width: z[col] -= tableau[r][col]
+                        simplex(z, range(width))
+                        if z[-1] < -tolerance * max(1.0, sum([abs(row[-1]) for row in rows])): return None
+                        # drive remaining artificial variables out of the basis, dropping redundant rows
+                        for r in reversed(range(len(tableau))):
+                            if basis[r] >= n + n_slack:
+                                candidates = [col for col in range(n + n_slack) if abs(tableau[r][col]) > tolerance]
+                                if candidates: pivot(z, r, candidates[0])
+                                else:
+                                    del tableau[r]
+                                    del basis[r]
+                        for row in tableau: del row[n + n_slack:width]
+                        width = n + n_slack
+
+                    # phase 2
+                    costs = [float(a) for a in c] + [0.0] * n_slack
+                    z = [-a for a in costs] + [0.0]
+                    for r in range(len(tableau)):
+                        if costs[basis[r]] != 0:
+                            for col in range(width + 1):
+                                z[col] += costs[basis[r]] * tableau[r][col]
+                    if simplex(z, range(width)) is False: raise Exception(' Linear program is unbounded')
+                    x = [0.0] * width
+                    for r in range(len(tableau)): x[basis[r]] = tableau[r][-1]
+                    return (z[-1], x[:n])
+
+                @staticmethod
+                def sparse_linear_program(c, A_ub, b_ub, upper=None, tolerance=1e-9, max_iterations=100000, state=None):
+                    """
+                    maximize c.x subject to A_ub.x <= b_ub and 0 <= x <= upper with b_ub >= 0, c, upper and the rows of A_ub being sparse {column: coefficient}
+                    dictionaries on integer columns >= 0 (no upper bound by default), with a bounded revised simplex. The inverse of the basis is a product
+                    of sparse eta columns, rebuilt from a sparse LU factorization of the basic columns when they pile up, so that the constraint matrix is never filled in.
+                    The state dictionary keeps the basis and its etas from one call to the next to warm start programs that only grow by new rows and new columns.
+                    Return (value, x) with the nonzero columns of x as a dictionary.
+                    """
+                    if upper is None: upper = {}
+                    if state is None: state = {}
+                    m = len(A_ub)
+                    columns = {} # column: {row: coefficient}, slack of row k is column -1-k
+                    for k in range(m):
+                        if b_ub[k] < 0: raise Exception(' Sparse linear program needs nonnegative upper bounds')
+                        for (col, a) in A_ub[k].items():
+                            if a != 0: columns.setdefault(col, {})[k] = float(a)
+                    for col in c: columns.setdefault(col, {})
+                    for k in range(m): columns[-1 - k] = {k: 1.0}
+                    b = [float(v) for v in b_ub]
+                    pivot_tolerance = max(tolerance, 1e-7)
+                    def bound(j):
+                        if j < 0: return None
+                        return upper.get(j)
+
+                    def eta(r, alpha):
+                        # pivot row, pivot and the other entries of a basis change
+                        return (r, alpha[r], [(i, a) for (i, a) in alpha.items() if i != r])
+
+                    def ftran(v, etas):
+                        # B^-1 v
+                        get = v.get
+                        for (r, pivot, others) in etas:
+                            t = get(r)
+                            if not t: continue
+                            t /= pivot
+                            for (i, a) in others: v[i] = get(i, 0.0) - a * t
+                            v[r] = t
+                        return dict([(i, a) for (i, a) in v.items() if a > tolerance or a < -tolerance])
+
+                    def btran(y, etas):
+                        # y B^-1
+                        get = y.get
+                        for (r, pivot, others) in reversed(etas):
+                            t = get(r, 0.0)
+                            for (i, a) in others:
+                                w = get(i)
+                                if w: t -= w * a
+                            if t > tolerance or t < -tolerance: y[r] = t / pivot
+                            elif r in y: del y[r]
+                        return y
+
+                    def refactor(head):
+                        # etas of a sparse LU factorization of the basis, the basic columns pivoting among the rows of the nonbasic slacks in the
+                        # order of the fewest entries left in their row and column (markowitz): lower etas in the order of the pivots, then unit upper
+                        # etas for the entries of the columns in the rows pivoted before and in the rows of the basic slacks, in reverse order
+                        basis = [-1 - k for k in range(m)]
+                        free = set(range(m)) - set([-1 - j for j in head if j < 0])
+                        active, rows, uppers = {}, dict([(i, {}) for i in free]), {}
+                        for j in head:
+                            if j < 0: continue
+                            active[j] = dict([(i, a) for (i, a) in columns[j].items() if i in free])
+                            uppers[j] = [(i, a) for (i, a) in columns[j].items() if i not in free]
+                            for (i, a) in active[j].items(): rows[i][j] = a
+                        etas, order = [], []
+                        while active:
+                            j = min(active, key=lambda j: (len(active[j]), j))
+                            entries = active.pop(j)
+                            largest = max([abs(a) for a in entries.values()] + [0.0])
+                            for i in entries: del rows[i][j]
+                            if largest <= pivot_tolerance: continue # dependent column, left at zero
+                            r = min([i for (i, a) in entries.items() if abs(a) >= 0.1 * largest], key=lambda i: (len(rows[i]), i))
+                            pivot = entries.pop(r)
+                            etas.append((r, pivot, list(entries.items())))
+                            for (k, a) in rows.pop(r).items():
+                                # the row of the pivot gives the upper entries of the remaining columns, the other rows of the column are eliminated
+                                uppers[k].append((r, a / pivot))
+                                column = active[k]
+                                del column[r]
+                                for (i, e) in entries.items():
+                                    v = column.get(i, 0.0) - e * a / pivot
+                                    if v > tolerance or v < -tolerance: column[i], rows[i][k] = v, v
+                                    elif i in column: del column[i], rows[i][k]
+                            basis[r] = j
+                            order.append((r, j))
+                        return (basis, etas + [(r, 1.0, uppers[j]) for (r, j) in reversed(order) if uppers[j]])
+
+                    def solution(head, etas, at_upper):
+                        v = dict([(k, b[k]) for k in range(m) if b[k] != 0])
+                        for j in at_upper:
+                            for (i, a) in columns[j].items(): v[i] = v.get(i, 0.0) - upper[j] * a
+                        v = ftran(v, etas)
+                        return [v.get(p, 0.0) for p in range(m)]
+
+                    def feasible(head, x):
+                        for p in range(m):
+                            u = bound(head[p])
+                            if x[p] < -1e-6 or (u is not None and x[p] > u + 1e-6): return False
+                        return True
+
+                    # warm start from the previous basis, new rows with their slack in the basis, the previous etas
+                    # still giving its inverse when the previous basic columns have no entry in the new rows
+                    previous = state.get('head', [])
+                    head = [j for j in previous if j in columns][:m]
+                    reuse = len(head) == len(previous) and [j for j in head if j >= 0 and [k for k in columns[j] if k >= len(head)]] == []
+                    head += [-1 - k for k in range(len(head), m)]
+                    at_upper = set([j for j in state.get('upper', ()) if j in columns and j not in head and upper.get(j) is not None])
+                    if reuse: etas, factored = list(state.get('etas', [])), state.get('factored', 0)
+                    else:
+                        head, etas = refactor(head)
+                        factored = len(etas)
+                    x = solution(head, etas, at_upper)
+                    if not feasible(head, x):
+                        head, etas, at_upper, factored = [-1 - k for k in range(m)], [], set(), 0
+                        x = solution(head, etas, at_upper)
+
+                    variables = sorted(columns.keys())
+                    chunk = max(100, m)
+
+                    def simplex(head, etas, factored, x):
+                        # refactored after 50 basis changes
+                        cursor = 0
+                        degenerate = 0
+                        for iteration in range(max_iterations):
+                            if len(etas) > factored + 50:
+                                head, etas = refactor(head)
+                                factored = len(etas)
+                                x = solution(head, etas, at_upper)
+
+                            # duals, then partial pricing: the best reduced cost of the first chunk of columns having candidates
+                            y = btran(dict([(p, c.get(head[p], 0.0)) for p in range(m) if head[p] >= 0 and c.get(head[p], 0.0) != 0]), etas)
+                            basic = set(head)
+                            bland = degenerate > 50
+                            entering, best = None, 0.0
+                            for count in range(len(variables)):
+                                j = variables[(cursor + count) % len(variables)]
+                                if j in basic: continue
+                                d = c.get(j, 0.0)
+                                for (i, a) in columns[j].items():
+                                    w = y.get(i)
+                                    if w: d -= w * a
+                                if j in at_upper: d = -d
+                                if d > pivot_tolerance and (entering is None or (j < entering if bland else d > best)): entering, best = j, d
+                                if entering is not None and not bland and count >= chunk and count % chunk == 0:
+                                    cursor = (cursor + count) % len(variables)
+                                    break
+                            if entering is None: return (head, etas, factored, x)
+                            direction = -1.0 if entering in at_upper else 1.0
+
+                            # ratio test, the entering column may also go to its other bound
+                            alpha = ftran(dict(columns[entering]), etas)
+                            theta, leaving, size = bound(entering), None, 0.0
+                            for (p, a) in alpha.items():
+                                if abs(a) <= pivot_tolerance: continue
+                                rate = -direction * a
+                                if rate < 0: limit = max(x[p], 0.0) / -rate
+                                else:
+                                    u = bound(head[p])
+                                    if u is None: continue
+                                    limit = max(u - x[p], 0.0) / rate
+                                if theta is None or limit < theta - tolerance: theta, leaving, size = limit, p, abs(a)
+                                elif abs(limit - theta) <= tolerance and leaving is not None:
+                                    if bland: better = head[p] < head[leaving]
+                                    else: better = abs(a) > size
+                                    if better: theta, leaving, size = limit, p, abs(a)
+                            if theta is None: raise Exception(' Linear program is unbounded')
+                            degenerate = degenerate + 1 if theta <= tolerance else 0
+
+                            for (p, a) in alpha.items(): x[p] -= direction * a * theta
+                            if leaving is None:
+                                # bound flip
+                                if entering in at_upper: at_upper.discard(entering)
+                                else: at_upper.add(entering)
+                                continue
+                            value = (upper[entering] if entering in at_upper else 0.0) + direction * theta
+                            at_upper.discard(entering)
+                            j = head[leaving]
+                            u = bound(j)
+                            if u is not None and -direction * alpha[leaving] > 0: at_upper.add(j)
+                            head[leaving] = entering
+                            x[leaving] = value
+                            etas.append(eta(leaving, alpha))
+                        else: raise Exception(' Linear program did not converge')
+
+                    def restore(head, etas, factored, x):
+                        # dual simplex pivots bringing the basic columns back within their bounds, the reduced costs staying optimal
+                        for iteration in range(m + 50):
+                            worst, leaving = pivot_tolerance, None
+                            for p in range(m):
+                                u = bound(head[p])
+                                excess = -x[p] if x[p] < 0 else (x[p] - u if u is not None else 0.0)
+                                if excess > worst: worst, leaving = excess, p
+                            if leaving is None: break
+                            below = x[leaving] < 0
+                            rho = btran({leaving: 1.0}, etas)
+                            y = btran(dict([(p, c.get(head[p], 0.0)) for p in range(m) if head[p] >= 0 and c.get(head[p], 0.0) != 0]), etas)
+                            basic = set(head)
+                            entering, best, size = None, None, 0.0
+                            for j in variables:
+                                if j in basic: continue
+                                a, d = 0.0, c.get(j, 0.0)
+                                for (i, v) in columns[j].items():
+                                    a += rho.get(i, 0.0) * v
+                                    d -= y.get(i, 0.0) * v
+                                direction = -1.0 if j in at_upper else 1.0
+                                rate = -direction * a # change of the leaving column as j leaves its bound
+                                if (rate if below else -rate) <= pivot_tolerance: continue
+                                ratio = max(-direction * d, 0.0) / abs(a)
+                                if best is None or ratio < best - tolerance or (ratio <= best + tolerance and abs(a) > size): entering, best, size = j, ratio, abs(a)
+                            if entering is None: break
+                            alpha = ftran(dict(columns[entering]), etas)
+                            if abs(alpha.get(leaving, 0.0)) <= pivot_tolerance: break
+                            direction = -1.0 if entering in at_upper else 1.0
+                            theta = worst / abs(alpha[leaving])
+                            for (p, a) in alpha.items(): x[p] -= direction * a * theta
+                            value = (upper[entering] if entering in at_upper else 0.0) + direction * theta
+                            at_upper.discard(entering)
+                            if not below: at_upper.add(head[leaving])
+                            head[leaving] = entering
+                            x[leaving] = value
+                            etas.append(eta(leaving, alpha))
+                        return (head, etas, factored, x)
+
+                    # degenerate pivots are avoided by small shifts of the bounds, removed once the shifted program is solved,
+                    # the basic columns they pushed out of their bounds being brought back by dual simplex pivots
+                    exact = list(b)
+                    shifted = [b[k] + 1e-5 * (1.0 + abs(b[k]) + ((k * 7919) % 1000) / 1000.0) for k in range(m)]
+
+                    def solve(head, etas, factored):
+                        b[:] = shifted
+                        head, etas, factored, x = simplex(head, etas, factored, solution(head, etas, at_upper))
+                        b[:] = exact
+                        x = solution(head, etas, at_upper)
+                        if not feasible(head, x): head, etas, factored, x = simplex(*restore(head, etas, factored, x))
+                        return (head, etas, factored, x)
+
+                    head, etas, factored, x = solve(head, etas, factored)
+                    if not feasible(head, x):
+                        head, etas, at_upper = [-1 - k for k in range(m)], [], set()
+                        head, etas, factored, x = solve(head, etas, 0)
+
+                    state['head'], state['upper'], state['etas'], state['factored'] = list(head), set(at_upper), etas, factored
+                    result = dict([(j, upper[j]) for j in at_upper])
+                    for p in range(m):
+                        if head[p] >= 0 and x[p] > tolerance: result[head[p]] = x[p]
+                    return (sum([c.get(j, 0.0) * v for (j, v) in result.items()]), result)
+
+                @staticmethod
+                def null_space(rows, columns, tolerance=1e-9):
+                    """basis of the vectors x with row.x = 0 for sparse rows given as {column: coefficient} dictionaries, by sparse gauss-jordan elimination, vectors returned as dictionaries"""
+                    pivots = {} # pivot column: reduced row with a unit coefficient on its pivot and free columns only
+                    uses = {} # free column: pivot columns of the reduced rows containing it
+                    for row in rows:
+                        row = dict([(col, float(a)) for (col, a) in row.items() if abs(a) > tolerance])
+                        for col in [col for col in row if col in pivots]:
+                            factor = row.pop(col)
+                            for (other, a) in pivots[col].items():
+                                if other != col: row[other] = row.get(other, 0.0) - factor * a
+                        row = dict([(col, a) for (col, a) in row.items() if abs(a) > tolerance])
+                        if not row: continue
+                        # least used column among the large coefficients keeps the rows sparse
+                        big = max([abs(a) for a in row.values()])
+                        pivot = min([col for col in row if abs(row[col]) >= 0.1 * big], key=lambda col: (len(uses.get(col, ())), col))
+                        value = row[pivot]
+                        row = dict([(col, a / value) for (col, a) in row.items()])
+                        for other in uses.pop(pivot, ()):
+                            reduced = pivots[other]
+                            factor = reduced.pop(pivot)
+                            for (col, a) in row.items():
+                                if col == pivot: continue
+                                a = reduced.get(col, 0.0) - factor * a
+                                if abs(a) > tolerance:
+                                    reduced[col] = a
+                                    uses.setdefault(col, set()).add(other)
+                                elif col in reduced:
+                                    del reduced[col]
+                                    uses[col].discard(other)
+                        pivots[pivot] = row
+                        for col in row:
+                            if col != pivot: uses.setdefault(col, set()).add(pivot)
+                    free = [col for col in columns if col not in pivots]
+                    basis = dict([(col, {col: 1.0}) for col in free])
+                    for (pivot, row) in pivots.items():
+                        for (col, a) in row.items():
+                            if col != pivot and col in basis: basis[col][pivot] = -a
+                    return [basis[col] for col in free]
+
 
             class Data:
 
@@ -8837,17 +6491,18 @@ if yes:
                 def flatten_integer_list(l):
                     """Flatten a nested list of integers"""
                     if type(l) is list:
-                        new_l=[]
-                        num = None
-                        for i in range(len(str(l))):
-                            char = str(l)[i]
-                            if char != '[' and char != ']' and char!= ' ' and char != ',':
-                                if num == None: num = char
-                                else: num += char
-                            elif num != None: 
-                                new_l.append(int(num))
-                                num = None
-                        return(new_l)
+                        new_l = []
+                        stack = [(l, 0)]
+                        while stack != []:
+                            items, k = stack.pop()
+                            while k < len(items):
+                                if type(items[k]) is list:
+                                    stack.append((items, k + 1))
+                                    items, k = items[k], 0
+                                else:
+                                    new_l.append(items[k])
+                                    k += 1
+                        return new_l
                     else: return l
             
                 @staticmethod
@@ -8880,6 +6535,13 @@ if yes:
                         list.append([])
                     return list
 
+                @staticmethod
+                def parse_pairs(pairs):
+                    """return the set of integer pairs (i,j) written in a string '(i,j)', a list of such strings or a list of tuples"""
+                    if pairs is None: return set()
+                    found = re.findall(r'\(\s*(\d+)\s*,\s*(\d+)\s*\)', str(pairs))
+                    return set([(int(a), int(b)) for (a, b) in found])
+
                 @staticmethod
                 def sort_list_sync(list_to_sort, key_list):
                     """Sort list synchroneously using keys"""
@@ -8893,194 +6555,54 @@ if yes:
 
                 @staticmethod
                 def seq_to_steps(seq):
-                    step=[]
-                    steps=[]
-                    for i in range(len(str(seq))):
-                        char = str(seq)[i]
-                        if char == '[':
-                            index = 0
-                            step.append(index)
-                        elif char == ']':
-                            del step[-1]
-                            index = 0
-                        elif char == ' ':
-                            pass
-                        elif char == ',':
-                            step[-1] += 1
-                        if char == ',' or  char == '[':
-                            steps.append(copy.deepcopy(step))
-                    return(steps)
+                    """paths of all items of a sequence, in sequence order"""
+                    tree = SequenceTree(seq)
+                    return [tree.path(n) for n in range(1, len(tree.value))]
             
                 @staticmethod
                 def deepest_steps(seq):
-                    step=[]
-                    steps=[]
-                    for i in range(len(str(seq))):
-                        char = str(seq)[i]
-                        if char == '[':
-                            index = 0
-                            step.append(index)
-                        elif char == ']':
-                            del step[-1]
-                            index = 0
-                        elif char == ' ':
-                            pass
-                        elif char == ',':
-                            step[-1] += 1
-                        else:
-                            steps.append(copy.deepcopy(step))
-                    return(steps)
+                    """paths of the plates of a sequence, in sequence order"""
+                    tree = SequenceTree(seq)
+                    return [tree.path(n) for n in tree.leaves()]
                 
                 @staticmethod
                 def get_item_from_path(l, path):
-                    l = copy.deepcopy(l)
                     if type(path) == list:
                         for i in range(len(path)):
                             l = l[path[i]]
-                        return l
+                        return copy.deepcopy(l)
                                     
                 @staticmethod
                 def order_sequence(steps):
-                    #tree as a list of paths
-                    #path as a list of indices
-                    new_steps = []
-                    for step in copy.deepcopy(steps):
-                        depth = 0
-                        ls = len(steps)
-                        # compute current tree depth
-                        for j in range(ls):
-                            if len(steps[j])-1 > depth : depth = len(steps[j])-1
-                        # append current first deepest item
-                        for j in range(ls):
-                            if len(steps[j])-1 == depth : 
-                                new_steps.append(steps[j])
-                                del(steps[j])
-                                break
-                    return new_steps
+                    """sort paths by decreasing depth, keeping their order for a same depth"""
+                    buckets = {}
+                    for step in steps:
+                        buckets.setdefault(len(step), []).append(step)
+                    return [step for depth in sorted(buckets.keys(), reverse=True) for step in buckets[depth]]
 
                 @staticmethod
                 def seq_to_tree(text):
                     #sequence as text
-                    seq = ast.literal_eval(text)
-                    deep = Toolbox.Data.deepest_steps(seq)
+                    seq = SequenceTree(text)
                     tree = DataTree[object]()
-                    for i in range(len(deep)):
-                        path = deep[i]
-                        item = Toolbox.Data.get_item_from_path(seq, path)
-                        tree.Add(item, GH_Path(*path))
+                    for n in seq.leaves():
+                        tree.Add(seq.value[n], GH_Path(*seq.path(n)))
                     return tree
 
                 @staticmethod
                 def tree_to_seq(tree):
-
-                    # get tree paths as list of int
-                    paths = []
-                    parents = []
-                    all_parents = []
-                    for i in range(tree.BranchCount):
-                        path_string = tree.Path(i).ToString()
-                        path = []
-                        num = None
-                        for char in path_string:
-                            if char == '{' or char == ';' or char == '}':
-                                if num != None :
-                                    path.append(num)
-                                    num = None
-                            else : 
-                                if num == None: num = int(char)
-                                else: num = int(str(num) + char)
-                        paths.append(path)
-                        #parents
-                        all_par=[]
-                        if len(path) == 1 : 
-                            parents.append('M')
-                        else: 
-                            parents.append(path[0:len(path)-1])
-                            for j in range(len(path)-1):
-                                all_par.append(path[0:len(path)-1-j])
-                        all_par.append('M')
-                        all_parents.append(all_par)
-
-                    # create sequence from paths
-                    seq_as_string = ''
-                    for i in range(len(paths)):
-                        path = paths[i]
-                        #add coma
-                        if i != 0 : seq_as_string += ','
-                        #if parent doesn't exists before, add opening parenthesis
-                        if (parents[i] in parents[0:i]) is False:
-                            #add one parenthesis for each zero in path.
-                            last_zeros = 0
-                            for j in range(len(path)):
-                                if path[j] == 0: last_zeros += 1
-                                else: last_zeros = 0
-                            seq_as_string += '[' * last_zeros 
-                        #add number
-                        seq_as_string += str(tree.AllData()[i])
-                        #if parent doesn't exist after, add closing parenthesis
-                        if (parents[i] in parents[i+1:len(parents)]) is False:
-                            #last parenthesis of the sequence
-                            if i+1 == len(paths):
-                                seq_as_string += ']' * len(path)
-                            else:
-                                count = 0
-                                search = True
-                                for j in range(len(all_parents[i])):
-                                    if search == True:
-                                        for k in range(len(all_parents[i+1])):
-                                            if search == True:
-                                                if all_parents[i][j] == all_parents[i+1][k]:
-                                                    count = j
-                                                    search = False
-                                seq_as_string += ']' * count
-                    
-                    return seq_as_string
+                    """sequence string from a datatree with one plate per branch (see seq_to_tree)"""
+                    paths = [list(tree.Path(i).Indices) for i in range(tree.BranchCount)]
+                    data = tree.AllData()
+                    return SequenceTree.from_paths(paths, [data[i] for i in range(len(paths))]).text()
                 
                 @staticmethod
                 def test_seq(seq):
-                    flag = False
-                    if (type(seq) is str):
-                        if len(seq) > 2:
-                            if seq[0] == '[' and seq[-1] == ']':
-                                comas=0
-                                ophook=0
-                                clhook=0
-                                numbers=[]
-                                num = ''
-                                flag = True
-                                for i in range(len(seq)):
-                                    if seq[i] == '[' : ophook += 1
-                                    elif seq[i] == ']' : clhook += 1
-                                    elif seq[i] == ',' : comas += 1
-                                    elif seq[i] == ' ': pass
-                                    elif seq[i] in ['0','1','2','3','4','5','6','7','8','9'] :
-                                        num += seq[i]
-                                        if seq[i+1] not in ['0','1','2','3','4','5','6','7','8','9']: 
-                                            numbers.append(int(num))
-                                            num = ''
-                                    else: raise Exception( 'Invalid character in sequence.')
-                                if ophook != clhook : raise Exception( 'Missing hook(s) in sequence.')
-                                if comas != len(numbers)-1 : raise Exception( 'Missing coma(s) in sequence.')
-                                #if Toolbox.Data.islistsimilar(numbers, range(min(numbers), min(numbers)+len(numbers))) is False: raise Exception( 'Missing number(s) in sequence.')
-                            else: raise Exception( 'Sequence should start and end with hooks.')
-                    else: raise Exception( 'Sequence should be expressed as a string.')
-                    if flag == False: raise Exception( 'Error is sequence input.')
-                    return flag
+                    if type(seq) is not str: raise Exception( 'Sequence should be expressed as a string.')
+                    SequenceTree(seq)
+                    return True
 
                 @staticmethod
                 def reorder_sequence(seq):
-                    seq = str(seq)
-                    new_num = range(len(Toolbox.Data.flatten_integer_list(ast.literal_eval(seq))))
-                    new_seq = ''
-                    temp_num = None
-                    count = 0
-                    for i in range(len(seq)):
-                        if seq[i] != '[' and seq[i] != ',' and seq[i] != ']' and seq[i] != ' ':
-                            if temp_num == None: temp_num = seq[i]
-                            else: temp_num += seq[i]
-                            if seq[i+1] != '[' and seq[i+1] != ',' and seq[i+1] != ']' and seq[i+1] != ' ': pass
-                            else: 
-                                new_seq += str(new_num[count])
-                                count += 1
-                        else: new_seq += seq[i]
-                    return new_seq
+                    """number the plates of a sequence in sequence order"""
+                    return SequenceTree(seq).renumbered().text()